@@ -20,6 +20,7 @@ from openwpm.config import BrowserParams, ManagerParams
 from openwpm.socket_interface import ClientSocket
 from openwpm.storage.storage_controller import DataSocket
 from openwpm.storage.storage_providers import TableName
+from openwpm.types import VisitId
 
 import bannerclick.bannerdetection as bc
 import bannerclick.cmpdetection as cd
@@ -35,7 +36,7 @@ from oba.ad_extraction import (
     extract_ad_url_without_click_and_screenshot,
 )
 
-from typing import List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from selenium.webdriver.remote.webelement import WebElement
 
@@ -88,6 +89,72 @@ def _start_extension(browser_profile_path, browser_params) -> ClientSocket:
     return extension_socket
 
 
+class StorageClient:
+    """
+    Reusable connection to the StorageController.
+
+    There is one client per browser process and storage controller address, so
+    all the commands run by a browser share the same socket instead of opening
+    one per record. Rows can be buffered with `add_record` and sent together as a
+    single batched message with `flush`.
+    """
+
+    _clients: Dict[Tuple[str, int], "StorageClient"] = {}
+
+    def __init__(self, address: Tuple[str, int]) -> None:
+        self.address = address
+        self.socket: Optional[DataSocket] = None
+        self.buffer: List[Tuple[TableName, VisitId, Dict[str, Any]]] = []
+        self.connections_opened = 0
+        self.records_sent = 0
+
+    @classmethod
+    def get(cls, address: Tuple[str, int]) -> "StorageClient":
+        # A list once the params went through JSON, the key must be hashable
+        address = (address[0], address[1])
+        if address not in cls._clients:
+            cls._clients[address] = cls(address)
+        return cls._clients[address]
+
+    def _send(self, send: Callable[[DataSocket], None]) -> None:
+        """Sends through the pooled socket, reconnecting once if it broke"""
+        for attempt in range(2):
+            if self.socket is None:
+                self.socket = DataSocket(self.address)
+                self.connections_opened += 1
+            try:
+                send(self.socket)
+                return
+            except OSError:
+                self.socket.close()
+                self.socket = None
+                if attempt:
+                    raise
+
+    def store_record(self, table_name: TableName, row: Dict[str, Any]) -> None:
+        """Sends a single record right away"""
+        self._send(lambda sock: sock.store_record(table_name, row["visit_id"], row))
+        self.records_sent += 1
+
+    def add_record(self, table_name: TableName, row: Dict[str, Any]) -> None:
+        """Buffers a record until the next `flush`"""
+        self.buffer.append((table_name, row["visit_id"], row))
+
+    def flush(self) -> int:
+        """Sends all buffered records in one message and returns how many were sent"""
+        if not self.buffer:
+            return 0
+        records, self.buffer = self.buffer, []
+        self._send(lambda sock: sock.store_records(records))
+        self.records_sent += len(records)
+        return len(records)
+
+    def close(self) -> None:
+        if self.socket is not None:
+            self.socket.close()
+            self.socket = None
+
+
 class Data:
     url = ""
     ttw = 0
@@ -101,8 +168,7 @@ class Data:
 
     @staticmethod
     def save_record_in_sql(table_name, row):
-        sock = DataSocket(Data.sql_addr)
-        sock.store_record(TableName(table_name), row["visit_id"], row)
+        StorageClient.get(Data.sql_addr).store_record(TableName(table_name), row)
 
 
 class ExtractAdsCommand(BaseCommand):
@@ -139,12 +205,16 @@ class ExtractAdsCommand(BaseCommand):
 
             return screenshot_dir
 
+        storage_client = StorageClient.get(manager_params.storage_controller_address)
+        connections_before = storage_client.connections_opened
+        start_time = time.time()
+
         try:
             # SCROLL PAGE TO LOAD ADS
             scroll_page_to_load_ads(webdriver)
 
             # GET ALL ADS ACCORDING TO EASYLIST
-            ads = identify_ads_in_dom(webdriver)
+            ads = identify_ads_in_dom(webdriver, visit_url=self.url)
 
             screenshot_dir = prepare_screenshot_dir()
 
@@ -194,9 +264,8 @@ class ExtractAdsCommand(BaseCommand):
                     #     f"Captured {len(possible_ad_urls)} possible ad {ad_number} URLs"
                     # )
                     # We will save all possible ad urls as separate ads in the database but we can reference from which "unique" ad it comes according to the ad_number_in_visit
-                    Data.sql_addr = manager_params.storage_controller_address
                     for ad_url in possible_ad_urls:
-                        Data.save_record_in_sql(
+                        storage_client.add_record(
                             TableName("visit_advertisements"),
                             {
                                 "visit_id": self.visit_id,
@@ -256,7 +325,7 @@ class ExtractAdsCommand(BaseCommand):
                             screenshot_file_target_path=screenshot_full_path,
                         )
                         for ad_url in possible_ad_urls:
-                            Data.save_record_in_sql(
+                            storage_client.add_record(
                                 TableName("visit_advertisements"),
                                 {
                                     "visit_id": self.visit_id,
@@ -289,6 +358,19 @@ class ExtractAdsCommand(BaseCommand):
                     + e.__str__(),
                     file=f,
                 )
+        finally:
+            # Send all the ads found in this visit in a single message
+            records = storage_client.flush()
+            elapsed = time.time() - start_time
+            self.logger.info(
+                "Saved %d ad records for visit %d in %.2f seconds (%.1f records/s, "
+                "%d new storage connections)",
+                records,
+                self.visit_id,
+                elapsed,
+                records / elapsed if elapsed else 0.0,
+                storage_client.connections_opened - connections_before,
+            )
 
 
 class SubGetCommand(BaseCommand):
@@ -0,0 +1,68 @@
+"""Benchmark of the EasyList ad detection strategies of `identify_ads_in_dom`.
+
+Loads the saved `test/test_pages/oba/ad_slots.html` fixture in a headless
+Firefox and reports, for each detection mode, the number of WebDriver round
+trips and the milliseconds spent per page.
+
+Usage:
+    python -m benchmarks.bench_ad_detection [--pages N]
+"""
+
+import argparse
+import time
+from pathlib import Path
+from typing import Any
+
+from selenium import webdriver
+from selenium.webdriver.firefox.options import Options
+
+from oba.ad_extraction import identify_ads_in_dom
+from openwpm.utilities.platform_utils import get_firefox_binary_path
+
+FIXTURE = Path(__file__).parent.parent / "test" / "test_pages" / "oba" / "ad_slots.html"
+
+
+class RoundTripCounter:
+    """Counts the WebDriver commands sent by a driver"""
+
+    def __init__(self, driver: webdriver.Firefox) -> None:
+        self.count = 0
+        self._execute = driver.execute
+        driver.execute = self._counting_execute
+
+    def _counting_execute(self, *args: Any, **kwargs: Any) -> Any:
+        self.count += 1
+        return self._execute(*args, **kwargs)
+
+
+def run(pages: int) -> None:
+    options = Options()
+    options.add_argument("--headless")
+    options.binary_location = get_firefox_binary_path()
+    driver = webdriver.Firefox(options=options)
+    counter = RoundTripCounter(driver)
+    try:
+        for mode, in_page in (("in_page", True), ("per_selector", False)):
+            elapsed = 0.0
+            round_trips = 0
+            found = 0
+            for _ in range(pages):
+                driver.get(FIXTURE.as_uri())
+                counter.count = 0
+                start = time.perf_counter()
+                found = len(identify_ads_in_dom(driver, in_page=in_page))
+                elapsed += time.perf_counter() - start
+                round_trips += counter.count
+            print(
+                f"{mode:>12}: {found} ads, "
+                f"{round_trips / pages:.0f} round trips/page, "
+                f"{elapsed / pages * 1000:.1f} ms/page"
+            )
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=3)
+    run(parser.parse_args().pages)
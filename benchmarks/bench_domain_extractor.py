@@ -0,0 +1,117 @@
+"""Micro-benchmarks of the registered domain extraction.
+
+Times the per-row `.apply(lambda x: tldextract.extract(x).registered_domain)`
+that the metrics used against `oba.domain_extractor` on synthetic URL columns:
+- `http_requests.url`: `--rows` request URLs on `--hosts` hosts, almost every
+  URL distinct, like the third-party analysis columns.
+- `visit_advertisements.ad_url`: `--rows` ad URLs repeating 1 URL in 20.
+For every column, `registered_domains` is timed with an empty LRU and again
+with the LRU filled by the first run, and the scalar `registered_domain` is
+timed on a loop over the rows. The domains are checked to be identical.
+
+Usage:
+    python -m benchmarks.bench_domain_extractor [--rows 1000000] [--hosts 5000]
+"""
+
+import argparse
+import random
+import tempfile
+import time
+import warnings
+from typing import Callable, List
+
+import pandas as pd
+import tldextract
+
+from oba.domain_extractor import DomainExtractor
+from oba.tracker_domain_index import TRACKING_LISTS_DIR
+
+ADS_PER_URL = 20
+
+
+def generate_hosts(count: int) -> List[str]:
+    """Subdomains of the domains of the easyprivacy tracking list"""
+    rng = random.Random(0)
+    with open(TRACKING_LISTS_DIR / "easyprivacy-justdomains.txt") as f:
+        domains = [line.strip() for line in f if line.strip()]
+    prefixes = ["", "www.", "cdn.", "static.", "ads.", "t.", "pixel.", "s1."]
+    return [rng.choice(prefixes) + rng.choice(domains) for _ in range(count)]
+
+
+def request_urls(hosts: List[str], rows: int) -> pd.Series:
+    rng = random.Random(1)
+    # A few hosts get most of the requests
+    weights = [1 / (rank + 1) for rank in range(len(hosts))]
+    return pd.Series(
+        [
+            f"https://{host}/assets/{rng.randrange(10**6)}/tag.js?cb={rng.randrange(10**9)}"
+            for host in rng.choices(hosts, weights, k=rows)
+        ]
+    )
+
+
+def ad_urls(hosts: List[str], rows: int) -> pd.Series:
+    rng = random.Random(2)
+    ads = [
+        f"https://{rng.choice(hosts)}/click?ad={ad_id}"
+        for ad_id in range(max(rows // ADS_PER_URL, 1))
+    ]
+    return pd.Series(rng.choices(ads, k=rows))
+
+
+def timed(label: str, rows: int, func: Callable[[], pd.Series]) -> pd.Series:
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    print(f"  {label:<34} {seconds:8.2f} s {rows / seconds:12,.0f} rows/s")
+    return result
+
+
+def run(rows: int, num_hosts: int) -> None:
+    hosts = generate_hosts(num_hosts)
+    columns = {
+        "http_requests.url": request_urls(hosts, rows),
+        "visit_advertisements.ad_url": ad_urls(hosts, rows),
+    }
+    with warnings.catch_warnings():
+        # registered_domain is deprecated in the latest tldextract versions
+        warnings.simplefilter("ignore", DeprecationWarning)
+        tldextract.extract("https://warm.up/")
+        for name, urls in columns.items():
+            print(f"{name}: {len(urls):,} rows, {urls.nunique():,} distinct URLs")
+            expected = timed(
+                ".apply(tldextract.extract)",
+                rows,
+                lambda: urls.apply(lambda x: tldextract.extract(x).registered_domain),
+            )
+            with tempfile.TemporaryDirectory() as cache_dir:
+                extractor = DomainExtractor(cache_dir=cache_dir)
+                extractor.registered_domain("https://warm.up/")
+                cold = timed(
+                    "registered_domains, empty LRU",
+                    rows,
+                    lambda: extractor.registered_domains(urls),
+                )
+                warm = timed(
+                    "registered_domains, filled LRU",
+                    rows,
+                    lambda: extractor.registered_domains(urls),
+                )
+                scalar = timed(
+                    "registered_domain per row",
+                    rows,
+                    lambda: urls.map(extractor.registered_domain),
+                )
+            for result in (cold, warm, scalar):
+                pd.testing.assert_series_equal(
+                    result, expected, check_dtype=False, check_names=False
+                )
+    print("The domains are identical")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--hosts", type=int, default=5000)
+    args = parser.parse_args()
+    run(args.rows, args.hosts)
@@ -0,0 +1,185 @@
+"""Benchmark of the DuckDB backend of ExperimentMetrics against the pandas path.
+
+Generates a synthetic experiment with `--ads` ads and `--requests` HTTP
+requests, and times the ads by category table and the ads by domain group
+counts of both backends, from the loading of the ads to the summaries. The
+DuckDB backend is timed on crawl-data.sqlite and on its Parquet export. The
+results of the backends are checked to be identical.
+
+Usage:
+    python -m benchmarks.bench_duckdb_metrics [--ads 1000000] [--requests 2000000]
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+import pandas as pd
+
+from oba.duckdb_metrics import DOMAIN_GROUPS, DuckDBMetrics
+from oba.experiment_metrics import ExperimentMetrics
+from oba.parquet_export import export_experiment
+from openwpm.storage.sql_provider import SCHEMA_FILE
+
+BROWSER_IDS = [1, 2, 3, 4, 5, 6, 7, 8]
+CATEGORIES = [
+    "Style & Fashion",
+    "Shopping",
+    "Travel",
+    "Automotive",
+    "Sports",
+    "Technology & Computing",
+    "Books & Literature",
+]
+VISITS_PER_AD = 20
+
+
+def make_experiment(path: Path, num_ads: int, num_requests: int) -> None:
+    rng = random.Random(0)
+    domains = [domain for group in DOMAIN_GROUPS.values() for domain in group]
+    num_visits = max(num_ads // VISITS_PER_AD, 1)
+    visit_browsers = [rng.choice(BROWSER_IDS) for _ in range(num_visits)]
+    with contextlib.closing(sqlite3.connect(path)) as conn:
+        with open(SCHEMA_FILE, "r") as f:
+            conn.executescript(f.read())
+        conn.executemany(
+            "INSERT INTO site_visits (visit_id, browser_id, site_url, site_rank) VALUES (?, ?, ?, ?)",
+            (
+                (visit_id + 1, browser_id, f"https://site{visit_id % 500}.com/", None)
+                for visit_id, browser_id in enumerate(visit_browsers)
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO landing_page_categories (landing_page_id, landing_page_url, category_code, category_name, parent_category, confident) VALUES (?, ?, '', ?, '', 1)",
+            (
+                (landing_page_id, f"https://shop{landing_page_id}.com/", category)
+                for landing_page_id in range(1, 5001)
+                for category in rng.sample(CATEGORIES, rng.randint(0, 3))
+            ),
+        )
+
+        def ads() -> Iterator[tuple]:
+            for _ in range(num_ads):
+                visit_id = rng.randrange(num_visits)
+                yield (
+                    visit_id + 1,
+                    visit_browsers[visit_id],
+                    f"https://ads.{rng.choice(domains)}/c?id={rng.randrange(num_ads // 10 + 1)}",
+                    rng.random() < 0.1,
+                    rng.randint(1, 5500),
+                    rng.random() < 0.9,
+                    1 if rng.random() < 0.05 else None,
+                )
+
+        conn.executemany(
+            "INSERT INTO visit_advertisements (visit_id, browser_id, ad_url, clean_run, landing_page_id, categorized, non_ad) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            ads(),
+        )
+
+        def requests() -> Iterator[tuple]:
+            for request_id in range(num_requests):
+                visit_id = rng.randrange(num_visits)
+                yield (
+                    visit_browsers[visit_id],
+                    visit_id + 1,
+                    f"https://cdn{request_id % 1000}.{rng.choice(domains)}/r.js?{request_id}",
+                )
+
+        conn.executemany(
+            "INSERT INTO http_requests (browser_id, visit_id, url, method, referrer, headers, request_id, resource_type, time_stamp) VALUES (?, ?, ?, 'GET', '', '', 0, 'script', '')",
+            requests(),
+        )
+        conn.commit()
+
+
+def experiment_metrics(
+    crawl_db: Path,
+    experiment_dir: Path,
+    duckdb_metrics: Optional[DuckDBMetrics] = None,
+) -> ExperimentMetrics:
+    # Skips reading the experiment config of the constructor
+    metrics = ExperimentMetrics.__new__(ExperimentMetrics)
+    metrics.experiment_name = crawl_db.parent.name
+    metrics.experiment_dir = str(experiment_dir)
+    (experiment_dir / "results").mkdir(parents=True)
+    metrics.conn = sqlite3.connect(crawl_db)
+    metrics.oba_browsers = BROWSER_IDS
+    metrics.duckdb_metrics = duckdb_metrics
+    return metrics
+
+
+def time_summaries(metrics: ExperimentMetrics, load_ads: Callable[[], Any]) -> tuple:
+    start = time.perf_counter()
+    # count_ads_by_session_by_group prints the counts
+    with contextlib.redirect_stdout(io.StringIO()):
+        ads = load_ads()
+        loaded = time.perf_counter()
+        categories = metrics.get_categories_total_and_unique_ads(ads)
+        groups = metrics.count_ads_by_session_by_group(ads)
+    end = time.perf_counter()
+    print(
+        f"  load ads: {loaded - start:.2f} s, summaries: {end - loaded:.2f} s, "
+        f"total: {end - start:.2f} s"
+    )
+    return categories, groups
+
+
+def run(num_ads: int, num_requests: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp_name:
+        tmp_dir = Path(tmp_name)
+        crawl_db = tmp_dir / "crawl-data.sqlite"
+        start = time.perf_counter()
+        make_experiment(crawl_db, num_ads, num_requests)
+        print(
+            f"Generated {num_ads:,} ads and {num_requests:,} requests "
+            f"in {time.perf_counter() - start:.2f} s"
+        )
+
+        print("pandas")
+        metrics = experiment_metrics(crawl_db, tmp_dir / "pandas")
+        expected = time_summaries(
+            metrics, metrics.get_ads_by_category_table_all_browsers_old
+        )
+
+        print("duckdb on crawl-data.sqlite")
+        start = time.perf_counter()
+        duckdb_metrics = DuckDBMetrics(data_path=crawl_db)
+        print(f"  copy tables: {time.perf_counter() - start:.2f} s")
+        metrics = experiment_metrics(crawl_db, tmp_dir / "sqlite", duckdb_metrics)
+        results = time_summaries(
+            metrics, lambda: duckdb_metrics.ads_by_category(BROWSER_IDS[:6])
+        )
+        duckdb_metrics.close()
+
+        print("duckdb on the Parquet export")
+        start = time.perf_counter()
+        with contextlib.closing(sqlite3.connect(crawl_db)) as crawl_conn:
+            with contextlib.redirect_stdout(io.StringIO()):
+                export_experiment(crawl_conn, tmp_dir / "parquet")
+        print(f"  export: {time.perf_counter() - start:.2f} s")
+        duckdb_metrics = DuckDBMetrics(parquet_dir=tmp_dir / "parquet")
+        metrics = experiment_metrics(crawl_db, tmp_dir / "parquet_run", duckdb_metrics)
+        parquet_results = time_summaries(
+            metrics, lambda: duckdb_metrics.ads_by_category(BROWSER_IDS[:6])
+        )
+        duckdb_metrics.close()
+
+        for backend_results in (results, parquet_results):
+            pd.testing.assert_frame_equal(backend_results[0], expected[0])
+            for result_df, expected_df in zip(backend_results[1], expected[1]):
+                pd.testing.assert_frame_equal(result_df, expected_df)
+        print("The results of the backends are identical")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ads", type=int, default=1_000_000)
+    parser.add_argument("--requests", type=int, default=2_000_000)
+    args = parser.parse_args()
+    run(args.ads, args.requests)
@@ -0,0 +1,99 @@
+"""Benchmark of the network filter engine against adblockparser.
+
+Builds both matchers from `oba/resources/easylist.txt` and `easyprivacy.txt`
+and reports the build time and the URLs/sec of `should_block` with the
+`third-party` option used by the analysis scripts. The URLs are read from a
+file with one URL per line (`--urls`, e.g. a `http_requests_url.txt` export),
+or generated from the patterns of the lists. adblockparser is only timed on
+the first `--reference-urls` URLs, it takes tens of milliseconds per URL.
+
+Usage:
+    python -m benchmarks.bench_network_filter [--urls urls.txt] [--count 20000]
+        [--reference-urls 100]
+"""
+
+import argparse
+import random
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from adblockparser import AdblockRules
+
+from oba.network_filter import RESOURCES_DIR, NetworkFilterEngine, parse_filter
+
+LISTS = {
+    "easyprivacy": RESOURCES_DIR / "easyprivacy.txt",
+    "easylist": RESOURCES_DIR / "easylist.txt",
+}
+HOSTS = ["www.example.com", "cdn.shop.co.uk", "static.news.org", "api.example.net"]
+
+
+def generate_urls(lists: Dict[str, List[str]], count: int) -> List[str]:
+    """Mix of URLs built from the filter patterns and of unrelated URLs"""
+    rng = random.Random(0)
+    patterns = [
+        network_filter.pattern
+        for lines in lists.values()
+        for network_filter in map(parse_filter, lines)
+        if network_filter is not None and not network_filter.is_regex
+    ]
+    urls = []
+    for i in range(count):
+        if i % 4 == 0:
+            pattern = rng.choice(patterns).lower()
+            body = pattern.strip("|").replace("*", "x").replace("^", "/")
+            if pattern.startswith("|"):
+                urls.append(body if "://" in body else f"https://{body}")
+            else:
+                urls.append(f"https://{rng.choice(HOSTS)}/{body}")
+        else:
+            urls.append(
+                f"https://{rng.choice(HOSTS)}/assets/{rng.randrange(10**6)}/"
+                f"page-{rng.randrange(1000)}.js?v={rng.randrange(100)}"
+            )
+    return urls
+
+
+def run(urls_path: Optional[Path], count: int, reference_urls: int) -> None:
+    lists = {}
+    for name, path in LISTS.items():
+        with open(path, encoding="utf-8") as f:
+            lists[name] = f.read().splitlines()
+    if urls_path is not None:
+        with open(urls_path) as f:
+            urls = f.read().splitlines()[:count]
+    else:
+        urls = generate_urls(lists, count)
+    print(f"Matching {len(urls)} URLs against {', '.join(lists)}")
+
+    start = time.perf_counter()
+    engine = NetworkFilterEngine(lists)
+    print(f"engine build: {time.perf_counter() - start:.2f} s")
+    start = time.perf_counter()
+    for url in urls:
+        engine.should_block(url, third_party=True)
+    elapsed = time.perf_counter() - start
+    print(f"      engine: {len(urls) / elapsed:,.0f} URLs/s ({elapsed:.2f} s)")
+
+    if not reference_urls:
+        return
+    start = time.perf_counter()
+    rules = {name: AdblockRules(lines) for name, lines in lists.items()}
+    print(f"adblockparser build: {time.perf_counter() - start:.2f} s")
+    sample = urls[:reference_urls]
+    start = time.perf_counter()
+    for url in sample:
+        for list_rules in rules.values():
+            list_rules.should_block(url, {"third-party": True})
+    elapsed = time.perf_counter() - start
+    print(f"      adblockparser: {len(sample) / elapsed:,.1f} URLs/s ({elapsed:.2f} s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--urls", type=Path, default=None)
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--reference-urls", type=int, default=100)
+    args = parser.parse_args()
+    run(args.urls, args.count, args.reference_urls)
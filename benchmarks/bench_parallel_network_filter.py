@@ -0,0 +1,70 @@
+"""Scaling benchmark of the parallel network filter classification.
+
+Builds the engine from `oba/resources/easylist.txt` and `easyprivacy.txt` once
+and classifies the same URLs with 1, 2, 4 and 8 worker processes, reporting
+URLs/sec and the speedup over the first worker count. The URLs are read from a file with
+one URL per line (`--urls`) or generated like in `bench_network_filter`.
+The speedup can't exceed the number of cores of the machine.
+
+Usage:
+    python -m benchmarks.bench_parallel_network_filter [--urls urls.txt]
+        [--count 100000] [--workers 1 2 4 8] [--start-method fork]
+"""
+
+import argparse
+import os
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from benchmarks.bench_network_filter import LISTS, generate_urls
+from oba.network_filter import NetworkFilterEngine
+from oba.parallel_network_filter import classify_urls
+
+
+def run(
+    urls_path: Optional[Path],
+    count: int,
+    workers: List[int],
+    start_method: Optional[str],
+) -> None:
+    lists = {}
+    for name, path in LISTS.items():
+        with open(path, encoding="utf-8") as f:
+            lists[name] = f.read().splitlines()
+    if urls_path is not None:
+        with open(urls_path) as f:
+            urls = f.read().splitlines()[:count]
+    else:
+        urls = generate_urls(lists, count)
+    engine = NetworkFilterEngine(lists)
+    print(f"Classifying {len(set(urls))} URLs on {os.cpu_count()} CPUs")
+    # Compiles the regular expressions before forking, so every run reuses them
+    classify_urls(engine, urls, num_workers=1, show_progress=False)
+
+    baseline = None
+    for num_workers in workers:
+        start = time.perf_counter()
+        classify_urls(
+            engine,
+            urls,
+            num_workers=num_workers,
+            start_method=start_method,
+            show_progress=False,
+        )
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(
+            f"{num_workers:>2} workers: {len(urls) / elapsed:,.0f} URLs/s "
+            f"({elapsed:.2f} s, {baseline / elapsed:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--urls", type=Path, default=None)
+    parser.add_argument("--count", type=int, default=100000)
+    parser.add_argument("--workers", nargs="+", type=int, default=[1, 2, 4, 8])
+    parser.add_argument("--start-method", default=None)
+    args = parser.parse_args()
+    run(args.urls, args.count, args.workers, args.start_method)
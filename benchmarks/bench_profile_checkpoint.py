@@ -0,0 +1,140 @@
+"""Benchmark of the incremental profile checkpoints against the profile tars.
+
+Builds a synthetic profile: SQLite databases with `--rows` rows of cookies and
+history, a localStorage database under storage/ and a `--cache-mb` cache2
+directory, which is most of the size of a Firefox profile. Then, for
+`--rounds` rounds, updates a few rows of the databases and saves the profile
+with `dump_profile` (a full tar.gz, like `profile_archive_format="tar"`) and
+with `checkpoint_profile`.
+Reports the time and bytes written by every save, the size of the archives
+and the time to load the latest one.
+
+Usage:
+    python -m benchmarks.bench_profile_checkpoint [--rows 20000]
+        [--cache-mb 64] [--rounds 5]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from openwpm.commands.profile_commands import dump_profile, load_profile
+from openwpm.commands.utils.profile_checkpoint import (
+    checkpoint_profile,
+    restore_checkpoint,
+)
+from openwpm.config import BrowserParamsInternal
+from openwpm.types import BrowserId
+
+
+def directory_size(path: Path) -> int:
+    return sum(
+        (Path(root) / name).stat().st_size
+        for root, _, files in os.walk(path)
+        for name in files
+    )
+
+
+def build_profile(profile_path: Path, rows: int, cache_mb: int) -> None:
+    storage_path = profile_path / "storage" / "default" / "https+++example.com" / "ls"
+    storage_path.mkdir(parents=True)
+    for path, table in [
+        (profile_path / "cookies.sqlite", "moz_cookies"),
+        (profile_path / "places.sqlite", "moz_places"),
+        (profile_path / "webappsstore.sqlite", "webappsstore2"),
+        (storage_path / "data.sqlite", "data"),
+    ]:
+        with sqlite3.connect(path) as db:
+            db.execute(f"CREATE TABLE {table} (id INTEGER PRIMARY KEY, value TEXT)")
+            db.executemany(
+                f"INSERT INTO {table} VALUES (?, ?)",
+                (
+                    (i, f"https://example.com/{i}/{random.random()}")
+                    for i in range(rows)
+                ),
+            )
+    cache_path = profile_path / "cache2" / "entries"
+    cache_path.mkdir(parents=True)
+    for i in range(cache_mb):
+        (cache_path / f"{i:08X}").write_bytes(os.urandom(1024 * 1024))
+
+
+def update_profile(profile_path: Path, rows: int) -> None:
+    """Visits a few pages: updates rows of the databases and adds cache entries"""
+    for path, table in [
+        (profile_path / "cookies.sqlite", "moz_cookies"),
+        (profile_path / "places.sqlite", "moz_places"),
+    ]:
+        with sqlite3.connect(path) as db:
+            db.executemany(
+                f"UPDATE {table} SET value = ? WHERE id = ?",
+                ((str(random.random()), random.randrange(rows)) for _ in range(20)),
+            )
+    (profile_path / "cache2" / "entries" / f"{random.getrandbits(32):08X}").write_bytes(
+        os.urandom(256 * 1024)
+    )
+
+
+def run(rows: int, cache_mb: int, rounds: int) -> None:
+    browser_params = BrowserParamsInternal()
+    browser_params.browser_id = BrowserId(1)
+    work_dir = Path(tempfile.mkdtemp(prefix="bench_profile_checkpoint_"))
+    try:
+        profile_path = work_dir / "profile"
+        build_profile(profile_path, rows, cache_mb)
+        print(
+            f"Profile of {directory_size(profile_path) / 1e6:.1f} MB, "
+            f"{rows} rows per database"
+        )
+        tar_path = work_dir / "tar" / "profile.tar.gz"
+        checkpoint_dir = work_dir / "checkpoints"
+        for number in range(1, rounds + 1):
+            start = time.perf_counter()
+            dump_profile(profile_path, tar_path, True, browser_params)
+            tar_seconds = time.perf_counter() - start
+            tar_bytes = tar_path.stat().st_size
+
+            before = directory_size(checkpoint_dir) if checkpoint_dir.exists() else 0
+            start = time.perf_counter()
+            checkpoint_profile(profile_path, checkpoint_dir)
+            checkpoint_seconds = time.perf_counter() - start
+            checkpoint_bytes = directory_size(checkpoint_dir) - before
+            print(
+                f"Save {number}: tar {tar_seconds * 1000:8.1f} ms, "
+                f"{tar_bytes / 1e6:7.2f} MB written | checkpoint "
+                f"{checkpoint_seconds * 1000:8.1f} ms, "
+                f"{checkpoint_bytes / 1e6:7.2f} MB written"
+            )
+            update_profile(profile_path, rows)
+
+        start = time.perf_counter()
+        load_profile(work_dir / "from_tar", browser_params, tar_path)
+        tar_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        restore_checkpoint(checkpoint_dir, work_dir / "from_checkpoint")
+        checkpoint_seconds = time.perf_counter() - start
+        print(
+            f"Load: tar {tar_seconds * 1000:8.1f} ms | checkpoint "
+            f"{checkpoint_seconds * 1000:8.1f} ms"
+        )
+        print(
+            f"Stored: tar {tar_path.stat().st_size / 1e6:.2f} MB (latest only) | "
+            f"checkpoints {directory_size(checkpoint_dir) / 1e6:.2f} MB "
+            f"({rounds} checkpoints)"
+        )
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--cache-mb", type=int, default=64)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    run(args.rows, args.cache_mb, args.rounds)
@@ -0,0 +1,118 @@
+"""Benchmark of SQLiteStorageProvider write throughput.
+
+Replays a record stream into the batched provider and into the previous
+one-`execute`-per-record implementation and reports rows/sec for both.
+The stream is read from the given tables of a recorded crawl database
+(`--source`), or generated from the storage test values if no source is given.
+
+Usage:
+    python -m benchmarks.bench_sqlite_provider [--source crawl-data.sqlite]
+        [--tables http_requests javascript] [--visits 200] [--records 250]
+"""
+
+import argparse
+import asyncio
+import json
+import sqlite3
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, DefaultDict, Dict, List, Optional, Tuple
+
+from openwpm.storage.sql_provider import SQLiteStorageProvider
+from openwpm.storage.storage_providers import TableName
+from openwpm.types import VisitId
+from test.storage.test_values import generate_test_values
+
+RecordStream = List[Tuple[VisitId, List[Tuple[TableName, Dict[str, Any]]]]]
+
+
+class LegacySQLiteStorageProvider(SQLiteStorageProvider):
+    """The provider before batching: no pragmas, one execute per record"""
+
+    async def init(self) -> None:
+        self.db = sqlite3.connect(str(self.db_path))
+        self.cur = self.db.cursor()
+        self._create_tables()
+
+    async def store_record(
+        self, table: TableName, visit_id: VisitId, record: Dict[str, Any]
+    ) -> None:
+        statement, args = self._generate_insert(table=table, data=record)
+        for i in range(len(args)):
+            if isinstance(args[i], bytes):
+                args[i] = str(args[i], errors="ignore")
+            elif callable(args[i]):
+                args[i] = str(args[i])
+            elif type(args[i]) == dict:
+                args[i] = json.dumps(args[i])
+        self._execute_insert(statement, args)
+
+
+def read_stream(source: Path, tables: List[str]) -> RecordStream:
+    """Reads the records of a crawl database grouped by visit, in id order"""
+    visits: DefaultDict[VisitId, List[Tuple[TableName, Dict[str, Any]]]] = defaultdict(
+        list
+    )
+    with sqlite3.connect(source) as db:
+        db.row_factory = sqlite3.Row
+        for table in tables:
+            for row in db.execute(f"SELECT * FROM {table} ORDER BY id"):
+                record = {k: row[k] for k in row.keys() if k != "id"}
+                visits[VisitId(record["visit_id"])].append((TableName(table), record))
+    return list(visits.items())
+
+
+def generate_stream(tables: List[str], visits: int, records: int) -> RecordStream:
+    templates, _ = generate_test_values()
+    stream: RecordStream = []
+    for visit_id in range(visits):
+        visit_records = []
+        for i in range(records):
+            table = TableName(tables[i % len(tables)])
+            record = dict(templates[table], visit_id=visit_id)
+            record.pop("id", None)
+            visit_records.append((table, record))
+        stream.append((VisitId(visit_id), visit_records))
+    return stream
+
+
+async def replay(provider: SQLiteStorageProvider, stream: RecordStream) -> float:
+    await provider.init()
+    start = time.perf_counter()
+    for visit_id, records in stream:
+        for table, record in records:
+            await provider.store_record(table, visit_id, dict(record))
+        await provider.finalize_visit_id(visit_id)
+    await provider.flush_cache()
+    elapsed = time.perf_counter() - start
+    await provider.shutdown()
+    return elapsed
+
+
+def run(source: Optional[Path], tables: List[str], visits: int, records: int) -> None:
+    if source is not None:
+        stream = read_stream(source, tables)
+    else:
+        stream = generate_stream(tables, visits, records)
+    total = sum(len(records) for _, records in stream)
+    print(f"Replaying {total} records from {len(stream)} visits")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, provider_class in (
+            ("before", LegacySQLiteStorageProvider),
+            ("after", SQLiteStorageProvider),
+        ):
+            provider = provider_class(Path(tmp_dir) / f"{name}.sqlite")
+            elapsed = asyncio.run(replay(provider, stream))
+            print(f"{name:>6}: {total / elapsed:,.0f} rows/s ({elapsed:.2f} s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--source", type=Path, default=None)
+    parser.add_argument("--tables", nargs="+", default=["http_requests", "javascript"])
+    parser.add_argument("--visits", type=int, default=200)
+    parser.add_argument("--records", type=int, default=250)
+    args = parser.parse_args()
+    run(args.source, args.tables, args.visits, args.records)
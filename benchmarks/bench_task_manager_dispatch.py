@@ -0,0 +1,123 @@
+"""Benchmark of the dispatch of CommandSequences to the TaskManager browsers.
+
+Runs trivial CommandSequences, which keep their browser busy for
+`--command-seconds`, on 1, 2, 4 and 8 stand-in browsers. Compares the event
+driven `CommandDispatcher` of the TaskManager with the previous dispatch, which
+polled `browser.ready()` every `SLEEP_CONS` seconds. Reports sequences/sec and
+the scheduling latency: the time between a browser being free and the start of
+its next CommandSequence. The real browsers and the storage controller aren't
+started, so only the dispatch is measured.
+
+Usage:
+    python -m benchmarks.bench_task_manager_dispatch [--sequences 200]
+        [--browsers 1 2 4 8] [--command-seconds 0.001]
+"""
+
+import argparse
+import statistics
+import threading
+import time
+from typing import Callable, List, Optional
+
+from openwpm.command_dispatcher import CommandDispatcher
+from openwpm.command_sequence import CommandSequence
+from openwpm.task_manager import SLEEP_CONS
+
+
+class Browser:
+    """Runs a CommandSequence in a thread, like BrowserManagerHandle"""
+
+    def __init__(self, command_seconds: float) -> None:
+        self.command_seconds = command_seconds
+        self.command_thread: Optional[threading.Thread] = None
+        self.ready_at = time.monotonic()
+
+    def ready(self) -> bool:
+        return self.command_thread is None or not self.command_thread.is_alive()
+
+    def execute_command_sequence(
+        self, on_done: Optional[Callable[[int], None]] = None, visit_id: int = 0
+    ) -> None:
+        time.sleep(self.command_seconds)
+        self.ready_at = time.monotonic()
+        if on_done is not None:
+            on_done(visit_id)
+
+
+def polling_dispatch(browsers: List[Browser], num_sequences: int) -> List[float]:
+    """The dispatch loop of TaskManager.execute_command_sequence before the CommandDispatcher"""
+    latencies = []
+    for _ in range(num_sequences):
+        submitted_at = time.monotonic()
+        while True:
+            browser = next((browser for browser in browsers if browser.ready()), None)
+            if browser is not None:
+                break
+            time.sleep(SLEEP_CONS)
+        latencies.append(time.monotonic() - max(submitted_at, browser.ready_at))
+        browser.command_thread = threading.Thread(
+            target=browser.execute_command_sequence, daemon=True
+        )
+        browser.command_thread.start()
+    for browser in browsers:
+        if browser.command_thread is not None:
+            browser.command_thread.join()
+    return latencies
+
+
+def event_dispatch(browsers: List[Browser], num_sequences: int) -> List[float]:
+    def start(
+        browser: Browser,
+        command_sequence: CommandSequence,
+        on_done: Callable[[int], None],
+    ) -> None:
+        browser.command_thread = threading.Thread(
+            target=browser.execute_command_sequence, args=(on_done,), daemon=True
+        )
+        browser.command_thread.start()
+
+    dispatcher = CommandDispatcher(browsers, start)
+    submissions = [
+        dispatcher.submit(CommandSequence(f"http://example.com/{number}"))
+        for number in range(num_sequences)
+    ]
+    for submission in submissions:
+        submission.future.result()
+    dispatcher.close()
+    return [
+        latency
+        for latency in (submission.scheduling_latency for submission in submissions)
+        if latency is not None
+    ]
+
+
+def run(num_sequences: int, browser_counts: List[int], command_seconds: float) -> None:
+    print(
+        f"{num_sequences} CommandSequences of {command_seconds * 1000:.1f} ms, "
+        f"polling every {SLEEP_CONS * 1000:.0f} ms before"
+    )
+    for num_browsers in browser_counts:
+        for name, dispatch in [
+            ("polling", polling_dispatch),
+            ("events", event_dispatch),
+        ]:
+            browsers = [Browser(command_seconds) for _ in range(num_browsers)]
+            start = time.perf_counter()
+            latencies = dispatch(browsers, num_sequences)
+            elapsed = time.perf_counter() - start
+            latencies_ms = sorted(latency * 1000 for latency in latencies)
+            print(
+                f"{num_browsers:>2} browsers, {name:<7}: "
+                f"{num_sequences / elapsed:8,.0f} sequences/s, scheduling latency "
+                f"median {statistics.median(latencies_ms):6.2f} ms, "
+                f"p95 {latencies_ms[int(0.95 * (len(latencies_ms) - 1))]:6.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sequences", type=int, default=200)
+    parser.add_argument("--browsers", nargs="+", type=int, default=[1, 2, 4, 8])
+    parser.add_argument("--command-seconds", type=float, default=0.001)
+    args = parser.parse_args()
+    run(args.sequences, args.browsers, args.command_seconds)
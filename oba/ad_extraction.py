@@ -2,12 +2,12 @@ from datetime import datetime
 import os
 import random
 import time
-from typing import Dict, List
+from typing import Dict, List, Optional
 import uuid
 from selenium.webdriver.common.by import By
 from selenium.webdriver import Firefox
 from selenium.webdriver.remote.webelement import WebElement
-from .resources.easylist_selectors import EASYLIST_SELECTORS
+from .easylist_index import get_easylist_index
 
 # Import TimeoutException and WebDriverException from selenium.common.exceptions
 from selenium.common.exceptions import (
@@ -41,6 +41,9 @@ CHUMBOX_DEFINITIONS = [
     {"platform": "zergnet", "selector": ".zergentity", "screenshotParentDepth": 0},
 ]
 
+# Number of EasyList selectors joined into one grouped selector by the in-page detection
+SELECTOR_GROUP_SIZE = 500
+
 
 def scroll_page_to_load_ads(driver: Firefox, timeout=30):
     """
@@ -82,12 +85,117 @@ def scroll_page_to_load_ads(driver: Firefox, timeout=30):
             )
 
 
-def identify_ads_in_dom(driver: Firefox) -> list[WebElement]:
+def group_selectors(
+    selectors: List[str], group_size: int = SELECTOR_GROUP_SIZE
+) -> List[List[str]]:
+    """
+    Splits the selector list into chunks that the in-page detection script joins
+    into grouped selectors (`sel1, sel2, ...`).
+
+    :param selectors: The CSS selectors to group.
+    :param group_size: Maximum number of selectors per group.
+    :return: A list of selector chunks.
+    """
+    return [selectors[i : i + group_size] for i in range(0, len(selectors), group_size)]
+
+
+# Evaluated inside the page. Each chunk is queried as a single grouped selector;
+# if the browser rejects the group (one invalid selector invalidates the whole
+# group) the chunk is retried selector by selector so a single bad rule doesn't
+# hide the rest. Matches are deduplicated and returned in document order.
+IN_PAGE_DETECTION_SCRIPT = """
+    var groups = arguments[0];
+    var found = new Set();
+    function collect(selector) {
+        var nodes = document.querySelectorAll(selector);
+        for (var i = 0; i < nodes.length; i++) {
+            found.add(nodes[i]);
+        }
+    }
+    groups.forEach(function(group) {
+        try {
+            collect(group.join(", "));
+        } catch (e) {
+            group.forEach(function(selector) {
+                try {
+                    collect(selector);
+                } catch (e) {}
+            });
+        }
+    });
+    return Array.from(found).sort(function(a, b) {
+        if (a === b) return 0;
+        return a.compareDocumentPosition(b) & Node.DOCUMENT_POSITION_FOLLOWING ? -1 : 1;
+    });
+"""
+
+
+# Collects the ids, classes and tag names present in the page, used to pick the
+# relevant generic selectors out of the EasyList index.
+PAGE_TOKENS_SCRIPT = """
+    var ids = new Set();
+    var classes = new Set();
+    var tags = new Set();
+    document.querySelectorAll("*").forEach(function(element) {
+        if (element.id) ids.add(element.id);
+        element.classList.forEach(function(name) {
+            classes.add(name);
+        });
+        tags.add(element.localName);
+    });
+    return [Array.from(ids), Array.from(classes), Array.from(tags)];
+"""
+
+
+def _identify_ads_in_page(driver: Firefox, visit_url: str) -> list[WebElement]:
+    """Collects the page tokens and evaluates the relevant selectors in the page,
+    two `execute_script` round trips in total."""
+    ids, classes, tags = driver.execute_script(PAGE_TOKENS_SCRIPT)
+    selectors = get_easylist_index().selectors_for(
+        visit_url, ids=ids, classes=classes, tags=tags
+    )
+    if not selectors:
+        return []
+    ads = driver.execute_script(IN_PAGE_DETECTION_SCRIPT, group_selectors(selectors))
+    return ads if ads else []
+
+
+def _identify_ads_per_selector(driver: Firefox, visit_url: str) -> list[WebElement]:
+    """Queries the selectors one by one (one WebDriver round trip per selector)."""
     ads = []
-    # Assuming `easylist` is a list of CSS selectors for ads
-    for selector in EASYLIST_SELECTORS:
-        ads.extend(driver.find_elements(By.CSS_SELECTOR, selector))
-    return ads  # This list contains Selenium WebElement objects representing ads
+    seen_ids = set()
+    for selector in get_easylist_index().selectors_for(visit_url):
+        for element in driver.find_elements(By.CSS_SELECTOR, selector):
+            if element.id not in seen_ids:
+                seen_ids.add(element.id)
+                ads.append(element)
+    return ads
+
+
+def identify_ads_in_dom(
+    driver: Firefox, visit_url: Optional[str] = None, in_page: bool = True
+) -> list[WebElement]:
+    """
+    Finds the elements in the current page that match the EasyList selectors.
+
+    :param driver: The Selenium WebDriver instance.
+    :param visit_url: URL of the visited page, selects the domain specific rules.
+        Defaults to the current URL of the driver.
+    :param in_page: Evaluate only the selectors relevant to the page inside the
+        page itself. If False, or if the scripts fail, fall back to calling
+        `find_elements` once per selector.
+    :return: The matched elements without duplicates.
+    """
+    if visit_url is None:
+        visit_url = driver.current_url
+    if in_page:
+        try:
+            return _identify_ads_in_page(driver, visit_url)
+        except WebDriverException as e:
+            print(
+                f"In-page ad detection failed, falling back to per-selector lookup: {e}"
+            )
+    return _identify_ads_per_selector(driver, visit_url)
 
 
 def is_ad_chumbox(ad_element: WebElement) -> bool:
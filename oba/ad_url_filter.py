@@ -0,0 +1,89 @@
+import hashlib
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from .enums_data_processer import AdFilterQueries
+
+RESOURCES_DIR = Path(__file__).parent / "resources"
+NON_ADS_URLS_FILE = RESOURCES_DIR / "non_ads_urls.txt"
+UNSPECIFIC_ADS_URLS_FILE = RESOURCES_DIR / "unspecific_ads_urls.txt"
+
+
+class AdURLFilter:
+    """
+    Matches ad URLs against a list of substrings in a single pass, with one compiled
+    alternation of all the patterns.
+    Matching is case insensitive, like the `LIKE '%pattern%'` queries it replaces.
+    """
+
+    def __init__(self, patterns: List[str]) -> None:
+        self.patterns = [p for p in dict.fromkeys(patterns) if p]
+        self.digest = hashlib.sha256("\n".join(self.patterns).encode()).hexdigest()
+        self._regex = (
+            re.compile("|".join(map(re.escape, self.patterns)), re.IGNORECASE)
+            if self.patterns
+            else None
+        )
+
+    @classmethod
+    def from_file(cls, path: Path) -> "AdURLFilter":
+        with open(path, "r") as f:
+            return cls([line.strip() for line in f.read().splitlines()])
+
+    def matches(self, url: str) -> bool:
+        return bool(url) and self._regex is not None and bool(self._regex.search(url))
+
+    def mark_ads(self, crawl_conn: sqlite3.Connection, column: str) -> Dict[str, float]:
+        """
+        Sets `column` to 1 for every visit_advertisements row whose ad_url matches.
+
+        Only the rows added since the last run with the same patterns are scanned,
+        the last scanned ad_id is kept in the ad_filter_state table.
+
+        :return: The number of scanned and marked rows and the time it took.
+        """
+        if column not in AdFilterQueries.FILTER_COLUMNS:
+            raise ValueError(f"Unknown filter column: {column}")
+        start_time = time.time()
+        cursor = crawl_conn.cursor()
+        cursor.execute(AdFilterQueries.CreateStateTableQuery)
+        cursor.execute(AdFilterQueries.SelectStateQuery, {"filter_column": column})
+        state = cursor.fetchone()
+        last_ad_id = state[0] if state and state[1] == self.digest else 0
+
+        cursor.execute(
+            AdFilterQueries.select_unfiltered_ads_query(column),
+            {"last_ad_id": last_ad_id},
+        )
+        rows = cursor.fetchall()
+
+        # Each distinct URL is matched only once
+        verdicts: Dict[str, bool] = {}
+        marked_ids = []
+        for ad_id, ad_url in rows:
+            if ad_url not in verdicts:
+                verdicts[ad_url] = self.matches(ad_url)
+            if verdicts[ad_url]:
+                marked_ids.append((ad_id,))
+        cursor.executemany(AdFilterQueries.mark_ad_query(column), marked_ids)
+
+        if rows:
+            last_ad_id = max(last_ad_id, rows[-1][0])
+        cursor.execute(
+            AdFilterQueries.UpsertStateQuery,
+            {
+                "filter_column": column,
+                "last_ad_id": last_ad_id,
+                "patterns_digest": self.digest,
+            },
+        )
+        crawl_conn.commit()
+        return {
+            "scanned": len(rows),
+            "distinct_urls": len(verdicts),
+            "marked": len(marked_ids),
+            "seconds": time.time() - start_time,
+        }
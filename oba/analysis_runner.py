@@ -0,0 +1,260 @@
+"""
+Runner of the analysis of several experiments.
+
+The analysis is a DAG of steps: every step is a function of the experiment
+context and of the results of the steps it depends on (the ads table, the
+summaries, the domain counts, ...). The runner evaluates the steps needed for
+the requested targets, every experiment in its own worker process with a
+single ExperimentMetrics, so the intermediates are computed once per
+experiment and the experiments run in parallel.
+
+The results of the steps are cached on disk, keyed by the modification time
+and size of the crawl databases the experiment reads. Re-running a single plot
+only loads the cached intermediates it needs, and a crawl database that
+changes invalidates the results of its experiment. A change in the code of a
+step isn't detected, run with `refresh=True` after changing one.
+
+Usage:
+    runner = AnalysisRunner(ANALYSIS_STEPS)
+    results = runner.run(experiments, ["summary", "categories"])
+    results["style_and_fashion_experiment_accept"]["summary"]
+"""
+
+import multiprocessing
+import os
+import pickle
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .experiment_metrics import ExperimentMetrics
+from .oba_analysis import OBAAnalysis
+from .result_cache import digest, file_fingerprint
+
+DEFAULT_CACHE_DIR = Path(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "datadir_analysis_cache")
+)
+
+
+@dataclass(frozen=True)
+class Experiment:
+    """
+    :param name: Name of the experiment, see ExperimentMetrics.
+    :param control_runs: If it's a control run.
+    :param sessions_from: Name of the OBA experiment whose control visits give
+        the artificial sessions of a control run.
+    :param category: Category of the experiment, see OBAAnalysis.
+    """
+
+    name: str
+    control_runs: bool = False
+    sessions_from: Optional[str] = None
+    category: str = "Style & Fashion"
+
+
+@dataclass(frozen=True)
+class Step:
+    """
+    :param name: Name of the result of the step.
+    :param func: Function of the ExperimentContext and of the results of the
+        dependencies, passed as keyword arguments named after them.
+    :param depends_on: Names of the steps whose results the step needs.
+    :param cache: If the result is cached on disk, False for the steps that
+        only write files or plots.
+    """
+
+    name: str
+    func: Callable[..., Any]
+    depends_on: Tuple[str, ...] = ()
+    cache: bool = True
+
+
+class ExperimentContext:
+    """The experiment of a run and its ExperimentMetrics, only connected to the database if a step is computed"""
+
+    def __init__(self, experiment: Experiment) -> None:
+        self.experiment = experiment
+        self._metrics: Optional[ExperimentMetrics] = None
+
+    @property
+    def metrics(self) -> ExperimentMetrics:
+        if self._metrics is None:
+            self._metrics = ExperimentMetrics(
+                self.experiment.name, control_runs=self.experiment.control_runs
+            )
+        return self._metrics
+
+    def close(self) -> None:
+        if self._metrics is not None:
+            self._metrics.close()
+            self._metrics = None
+
+
+def data_paths(experiment: Experiment) -> List[str]:
+    """Crawl databases the steps of an experiment can read"""
+    paths = [
+        ExperimentMetrics.experiment_paths(experiment.name, experiment.control_runs)[1],
+        OBAAnalysis.experiment_paths(experiment.name, experiment.control_runs)[1],
+    ]
+    if experiment.sessions_from:
+        paths.append(ExperimentMetrics.experiment_paths(experiment.sessions_from)[1])
+    return list(dict.fromkeys(os.path.abspath(path) for path in paths))
+
+
+def fingerprint(experiment: Experiment) -> str:
+    """Digest of the experiment and of the modification time and size of its crawl databases"""
+    return digest(
+        [
+            asdict(experiment),
+            [file_fingerprint(path) for path in data_paths(experiment)],
+        ]
+    )
+
+
+class AnalysisRunner:
+    """
+    :param steps: Steps of the analysis, the dependencies of every step must be
+        in the list.
+    :param cache_dir: Directory of the cached results, one subdirectory per experiment.
+    """
+
+    def __init__(
+        self, steps: Iterable[Step], cache_dir: Path = DEFAULT_CACHE_DIR
+    ) -> None:
+        self.steps: Dict[str, Step] = {}
+        for step in steps:
+            if step.name in self.steps:
+                raise ValueError(f"Duplicated step: {step.name}")
+            self.steps[step.name] = step
+        for step in self.steps.values():
+            for dependency in step.depends_on:
+                if dependency not in self.steps:
+                    raise ValueError(f"Unknown dependency of {step.name}: {dependency}")
+        self.plan(self.steps)
+        self.cache_dir = Path(cache_dir)
+
+    def plan(self, targets: Iterable[str]) -> List[str]:
+        """Steps needed for the targets, every step after its dependencies"""
+        order: List[str] = []
+        visiting = set()
+
+        def visit(name: str) -> None:
+            if name in order:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle through {name}")
+            if name not in self.steps:
+                raise ValueError(f"Unknown step: {name}")
+            visiting.add(name)
+            for dependency in self.steps[name].depends_on:
+                visit(dependency)
+            visiting.remove(name)
+            order.append(name)
+
+        for target in targets:
+            visit(target)
+        return order
+
+    def cache_path(self, experiment: Experiment, step: str, key: str) -> Path:
+        return self.cache_dir / experiment.name / f"{step}-{key[:16]}.pkl"
+
+    def _evaluate(
+        self,
+        context: ExperimentContext,
+        name: str,
+        key: str,
+        results: Dict[str, Any],
+        refresh: bool,
+    ) -> Any:
+        """Result of a step, from the cache if it's there, computing its dependencies only if needed"""
+        if name in results:
+            return results[name]
+        step = self.steps[name]
+        path = self.cache_path(context.experiment, name, key)
+        if step.cache and not refresh and path.is_file():
+            with open(path, "rb") as f:
+                result = pickle.load(f)
+        else:
+            dependencies = {
+                dependency: self._evaluate(context, dependency, key, results, refresh)
+                for dependency in step.depends_on
+            }
+            result = step.func(context, **dependencies)
+            if step.cache:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                # Results of older versions of the databases aren't used anymore
+                for stale_path in path.parent.glob(f"{name}-*.pkl"):
+                    stale_path.unlink()
+                temp_path = path.with_suffix(".tmp")
+                with open(temp_path, "wb") as f:
+                    pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, path)
+        results[name] = result
+        return result
+
+    def run_experiment(
+        self, experiment: Experiment, targets: Sequence[str], refresh: bool = False
+    ) -> Dict[str, Any]:
+        """Results of the targets for one experiment, in this process"""
+        self.plan(targets)
+        key = fingerprint(experiment)
+        context = ExperimentContext(experiment)
+        results: Dict[str, Any] = {}
+        try:
+            for target in targets:
+                self._evaluate(context, target, key, results, refresh)
+        finally:
+            context.close()
+        return {target: results[target] for target in targets}
+
+    def _run_task(self, task: Tuple[Experiment, Sequence[str], bool]) -> Dict[str, Any]:
+        return self.run_experiment(*task)
+
+    def run(
+        self,
+        experiments: Sequence[Experiment],
+        targets: Union[Sequence[str], Mapping[str, Sequence[str]]],
+        num_workers: Optional[int] = None,
+        refresh: bool = False,
+        start_method: Optional[str] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Results of the targets for every experiment, by experiment name.
+
+        :param targets: Steps whose results are returned, the same for every
+            experiment or by experiment name.
+        :param num_workers: Worker processes, defaults to one per experiment up
+            to the number of CPUs. With 1 the experiments run in this process.
+        :param refresh: Computes all the needed steps again, ignoring the cache.
+        :param start_method: `fork` or `spawn`, defaults to the platform's.
+        """
+        names = [experiment.name for experiment in experiments]
+        if len(set(names)) != len(names):
+            raise ValueError("The experiment names must be unique")
+        if not isinstance(targets, Mapping):
+            targets = {name: targets for name in names}
+        tasks = [
+            (experiment, tuple(targets[experiment.name]), refresh)
+            for experiment in experiments
+        ]
+        for _, experiment_targets, _ in tasks:
+            self.plan(experiment_targets)
+        num_workers = min(num_workers or os.cpu_count() or 1, len(tasks) or 1)
+        if num_workers == 1:
+            results = list(map(self._run_task, tasks))
+        else:
+            context = multiprocessing.get_context(start_method)
+            with context.Pool(num_workers) as pool:
+                results = pool.map(self._run_task, tasks, chunksize=1)
+        return dict(zip(names, results))
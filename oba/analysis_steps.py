@@ -0,0 +1,161 @@
+"""
+Steps of the analysis of an experiment, for oba.analysis_runner.
+
+The intermediates are the steps that `ads_by_category_tables.py` and
+`all_runs_tables.py` used to compute one after the other for every experiment:
+the ads table, the summary, the ads by domain and session, and the ads by
+session of OBAAnalysis. The control runs take their artificial sessions from
+the control visits of the OBA experiment in `Experiment.sessions_from`.
+
+Usage:
+    AnalysisRunner(ANALYSIS_STEPS + [Step("plot", plot, ("categories",), cache=False)])
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from .analysis_runner import ExperimentContext, Step
+from .experiment_metrics import ExperimentMetrics
+from .oba_analysis import OBAAnalysis
+
+SHOPPING = "Shopping"
+NUM_SESSIONS = 6
+
+# Visits of (browser_id, site_url, num_visits), see get_control_visits_by_url_and_browser
+Visits = List[Tuple[int, str, int]]
+# Ads of googleadservices.com and of doubleclick.net by session, see count_ads_by_session
+SessionCounts = Tuple[List[int], List[int]]
+
+
+def numvisits(context: ExperimentContext) -> Optional[Visits]:
+    """Visits to the control sites by browser and URL of the OBA experiment of a control run"""
+    if not context.experiment.control_runs:
+        return None
+    assert context.experiment.sessions_from is not None
+    experiment_metrics = ExperimentMetrics(context.experiment.sessions_from)
+    try:
+        return experiment_metrics.get_control_visits_by_url_and_browser()
+    finally:
+        experiment_metrics.close()
+
+
+def summary(context: ExperimentContext, numvisits: Optional[Visits]) -> pd.DataFrame:
+    return context.metrics.get_experiment_summary(
+        is_control_run=context.experiment.control_runs,
+        numvisits_by_browser_id_and_url=numvisits,
+    )
+
+
+def ads(context: ExperimentContext, numvisits: Optional[Visits]) -> pd.DataFrame:
+    if context.experiment.control_runs:
+        return context.metrics.get_ads_by_category_grouped_by_artificial_sessions_and_site_url(
+            numvisits
+        )
+    return context.metrics.get_ads_by_category_table_all_browsers()
+
+
+# The counts add the domain columns to the ads table, they work on copies so
+# that the other steps get the table as it was loaded
+
+
+def domains_all(context: ExperimentContext, ads: pd.DataFrame) -> pd.DataFrame:
+    return context.metrics.count_ads_by_domain(ads.copy())
+
+
+def domains_style(context: ExperimentContext, ads: pd.DataFrame) -> pd.DataFrame:
+    return context.metrics.count_ads_by_domain(
+        ads.copy(), category_filter=context.experiment.category
+    )
+
+
+def domains_shopping(context: ExperimentContext, ads: pd.DataFrame) -> pd.DataFrame:
+    return context.metrics.count_ads_by_domain(ads.copy(), category_filter=SHOPPING)
+
+
+def sessions_style(context: ExperimentContext, ads: pd.DataFrame) -> SessionCounts:
+    return context.metrics.count_ads_by_session(
+        ads.copy(), category_filter=context.experiment.category
+    )
+
+
+def sessions_shopping(context: ExperimentContext, ads: pd.DataFrame) -> SessionCounts:
+    return context.metrics.count_ads_by_session(ads.copy(), category_filter=SHOPPING)
+
+
+def style_and_shopping(
+    context: ExperimentContext,
+    sessions_style: SessionCounts,
+    sessions_shopping: SessionCounts,
+) -> SessionCounts:
+    """Ads of googleadservices.com and of doubleclick.net of the category and of Shopping, by session"""
+    googleadservices, doubleclick = (
+        [style[i] + shopping[i] for i in range(NUM_SESSIONS)]
+        for style, shopping in zip(sessions_style, sessions_shopping)
+    )
+    return googleadservices, doubleclick
+
+
+def categories(
+    context: ExperimentContext, ads: pd.DataFrame
+) -> Tuple[pd.DataFrame, Dict[str, int]]:
+    return context.metrics.get_categories_total_and_unique_ads(ads.copy())
+
+
+def evolution(context: ExperimentContext, ads: pd.DataFrame) -> pd.DataFrame:
+    return context.metrics.get_ads_evolution_by_session(
+        ads.copy(),
+        context.metrics.oba_browsers,
+        category_filter=context.experiment.category,
+    )
+
+
+def evolution_shopping(context: ExperimentContext, ads: pd.DataFrame) -> pd.DataFrame:
+    return context.metrics.get_ads_evolution_by_session(
+        ads.copy(), context.metrics.oba_browsers, category_filter=SHOPPING
+    )
+
+
+def groups(
+    context: ExperimentContext, ads: pd.DataFrame
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    return context.metrics.count_ads_by_session_by_group(ads.copy())
+
+
+def session_ads(context: ExperimentContext, numvisits: Optional[Visits]) -> List[Dict]:
+    """Ads of the category and of other categories by session, see OBAAnalysis"""
+    analysis = OBAAnalysis(
+        experiment_name=context.experiment.name,
+        experiment_category=context.experiment.category,
+        control_runs=context.experiment.control_runs,
+    )
+    try:
+        if context.experiment.control_runs:
+            return analysis.fetch_all_ads_grouped_by_artificial_sessions_and_site_url(
+                numvisits
+            )
+        return analysis.fetch_all_ads_by_browser_id_as_dict()
+    finally:
+        analysis.disconnect()
+
+
+ANALYSIS_STEPS = [
+    Step("numvisits", numvisits),
+    Step("summary", summary, ("numvisits",)),
+    Step("ads", ads, ("numvisits",)),
+    Step("domains_all", domains_all, ("ads",)),
+    Step("domains_style", domains_style, ("ads",)),
+    Step("domains_shopping", domains_shopping, ("ads",)),
+    Step("sessions_style", sessions_style, ("ads",)),
+    Step("sessions_shopping", sessions_shopping, ("ads",)),
+    Step(
+        "style_and_shopping",
+        style_and_shopping,
+        ("sessions_style", "sessions_shopping"),
+    ),
+    Step("categories", categories, ("ads",)),
+    Step("evolution", evolution, ("ads",)),
+    Step("evolution_shopping", evolution_shopping, ("ads",)),
+    Step("groups", groups, ("ads",)),
+    Step("session_ads", session_ads, ("numvisits",)),
+]
@@ -0,0 +1,159 @@
+"""
+Artificial sessions of the control visits.
+
+The visits to the control sites are shared by the browsers of an experiment:
+`numvisits_by_browser_id_and_url` lists (browser_id, site_url, num_visits) in
+crawl order (see `ExperimentMetrics.get_control_visits_by_url_and_browser`),
+and the visits to every site, ordered by site_rank, are handed out in that
+order. Every new browser_id of the list starts a new artificial session,
+numbered from 1, and only the first `max_sessions` sessions are analyzed.
+
+The visits of all the sessions are assigned at once, from a single query
+numbering the visits of every site, instead of one query per list entry.
+`session_lookup` keeps the assignment in the artificial_sessions table of the
+crawl database, so it's computed once per experiment and list, and the
+session metrics merge it with their ads:
+    sessions = session_lookup(conn, numvisits_by_browser_id_and_url)
+    ads_df.merge(sessions[["visit_id", "session"]], on="visit_id")
+"""
+
+import hashlib
+import json
+import sqlite3
+from typing import Dict, List, Tuple
+
+import pandas as pd
+
+from .enums_data_processer import ArtificialSessionsQueries
+
+LOOKUP_TABLE = "artificial_sessions"
+MAX_SESSIONS = 6
+
+SESSION_COLUMNS = ["visit_id", "site_url", "site_rank", "browser_id", "session"]
+
+
+def session_ranges(
+    numvisits_by_browser_id_and_url: List[Tuple[int, str, int]],
+    max_sessions: int = MAX_SESSIONS,
+) -> pd.DataFrame:
+    """
+    The browser_id and session of every entry of the list, with the range of
+    visit orders of the site it takes, `first_visit` to `last_visit` included.
+    """
+    entries = []
+    seen_browser_ids = set()
+    taken_visits: Dict[str, int] = {}
+    for browser_id, site_url, num_visits in numvisits_by_browser_id_and_url:
+        if browser_id not in seen_browser_ids:
+            seen_browser_ids.add(browser_id)
+            if len(seen_browser_ids) > max_sessions:
+                break
+        already_taken = taken_visits.get(site_url, 0)
+        entries.append(
+            (
+                browser_id,
+                site_url,
+                len(seen_browser_ids),
+                already_taken + 1,
+                already_taken + num_visits,
+            )
+        )
+        taken_visits[site_url] = already_taken + num_visits
+    return pd.DataFrame(
+        entries,
+        columns=["browser_id", "site_url", "session", "first_visit", "last_visit"],
+    )
+
+
+def assign_sessions(
+    conn: sqlite3.Connection,
+    numvisits_by_browser_id_and_url: List[Tuple[int, str, int]],
+    max_sessions: int = MAX_SESSIONS,
+) -> pd.DataFrame:
+    """
+    The visit_id, site_url, site_rank, browser_id and session of the visits
+    taken by the first `max_sessions` sessions.
+    """
+    ranges = session_ranges(numvisits_by_browser_id_and_url, max_sessions)
+    visits = pd.read_sql_query(ArtificialSessionsQueries.SelectVisitOrderQuery, conn)
+    visits = visits[visits["site_url"].isin(ranges["site_url"])]
+    if visits.empty or ranges.empty:
+        return pd.DataFrame(columns=SESSION_COLUMNS)
+    # The ranges of a site don't overlap, so a visit is in the last range
+    # starting before it, if it doesn't end before it
+    sessions = pd.merge_asof(
+        visits.astype({"visit_order": "int64"}).sort_values("visit_order"),
+        ranges.astype({"first_visit": "int64"}).sort_values("first_visit"),
+        left_on="visit_order",
+        right_on="first_visit",
+        by="site_url",
+        direction="backward",
+    )
+    sessions = sessions[sessions["visit_order"] <= sessions["last_visit"]]
+    return (
+        sessions[SESSION_COLUMNS]
+        .astype({"browser_id": "int64", "session": "int64"})
+        .sort_values(["session", "site_url", "site_rank"])
+        .reset_index(drop=True)
+    )
+
+
+def visits_digest(
+    numvisits_by_browser_id_and_url: List[Tuple[int, str, int]],
+    max_sessions: int = MAX_SESSIONS,
+) -> str:
+    """Digest of the list and number of sessions a lookup table was computed for"""
+    return hashlib.sha256(
+        json.dumps(
+            [max_sessions, [list(entry) for entry in numvisits_by_browser_id_and_url]]
+        ).encode()
+    ).hexdigest()
+
+
+def session_lookup(
+    conn: sqlite3.Connection,
+    numvisits_by_browser_id_and_url: List[Tuple[int, str, int]],
+    max_sessions: int = MAX_SESSIONS,
+) -> pd.DataFrame:
+    """
+    Like `assign_sessions`, but reads the sessions from the artificial_sessions
+    table, and only assigns them again if they were assigned for another list,
+    see the artificial_sessions_state table.
+    """
+    digest = visits_digest(numvisits_by_browser_id_and_url, max_sessions)
+    cursor = conn.cursor()
+    cursor.execute(ArtificialSessionsQueries.CreateTableQuery)
+    cursor.execute(ArtificialSessionsQueries.CreateStateTableQuery)
+    cursor.execute(ArtificialSessionsQueries.SelectStateQuery, {"lookup": LOOKUP_TABLE})
+    state = cursor.fetchone()
+    if state and state[0] == digest:
+        cursor.close()
+        sessions = pd.read_sql_query(
+            ArtificialSessionsQueries.SelectSessionsQuery, conn
+        )
+        return sessions.astype({"browser_id": "int64", "session": "int64"})
+
+    sessions = assign_sessions(conn, numvisits_by_browser_id_and_url, max_sessions)
+    cursor.execute(ArtificialSessionsQueries.DeleteSessionsQuery)
+    cursor.executemany(
+        ArtificialSessionsQueries.InsertSessionsQuery,
+        (
+            (
+                int(visit_id),
+                site_url,
+                None if pd.isna(site_rank) else int(site_rank),
+                int(browser_id),
+                int(session),
+            )
+            for visit_id, site_url, site_rank, browser_id, session in sessions.itertuples(
+                index=False
+            )
+        ),
+    )
+    cursor.execute(
+        ArtificialSessionsQueries.UpsertStateQuery,
+        {"lookup": LOOKUP_TABLE, "visits_digest": digest},
+    )
+    conn.commit()
+    cursor.close()
+    return sessions
@@ -0,0 +1,235 @@
+"""
+On-disk cache of the WebShrinker categorizations, shared by all the experiments.
+
+Responses are keyed by normalized URL and taxonomy, so the landing pages that
+the accept/reject/do_nothing variants of an experiment have in common are only
+paid once. With `domain_fallback`, a URL that was never categorized gets the
+categories of the latest categorized URL of the same registered domain.
+
+The cache can be warmed with the landing pages of already processed experiments:
+    python -m oba.categorization_cache datadir/<experiment>/crawl-data.sqlite
+"""
+
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from .domain_extractor import default_extractor
+from .enums_data_processer import CategorizationCacheQueries
+
+DEFAULT_CACHE_PATH = Path(
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "datadir_categorization_cache",
+        "webshrinker_categories.sqlite",
+    )
+)
+DEFAULT_TTL = 90 * 24 * 60 * 60  # 90 days
+
+# Query parameters that only track the click and don't change the page
+TRACKING_PARAMETERS = frozenset(
+    {
+        "gclid",
+        "gclsrc",
+        "dclid",
+        "fbclid",
+        "msclkid",
+        "yclid",
+        "twclid",
+        "mc_cid",
+        "mc_eid",
+        "_ga",
+        "_gl",
+        "ref",
+        "ref_src",
+    }
+)
+
+
+def normalize_url(url: str) -> str:
+    """
+    Lowercases the scheme and host, drops the default port, the fragment, the
+    trailing slash and the tracking parameters, and sorts the query parameters.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = (parts.hostname or "").lower()
+    if parts.port and (scheme, parts.port) not in (("http", 80), ("https", 443)):
+        netloc += f":{parts.port}"
+    path = parts.path.rstrip("/")
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if key.lower() not in TRACKING_PARAMETERS
+            and not key.lower().startswith("utm_")
+        )
+    )
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
+def registered_domain(url: str) -> str:
+    hostname = urlsplit(url.strip()).hostname or ""
+    return default_extractor().host_domain(hostname) or hostname
+
+
+class CategorizationCache:
+    """
+    :param path: SQLite file of the cache, created if it doesn't exist.
+    :param ttl: Seconds after which a cached categorization is fetched again,
+        None to never expire them.
+    :param domain_fallback: Whether to answer URL misses with the categories of
+        another URL of the same registered domain.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = DEFAULT_CACHE_PATH,
+        ttl: Optional[float] = DEFAULT_TTL,
+        domain_fallback: bool = False,
+    ) -> None:
+        self.path = Path(path)
+        self.ttl = ttl
+        self.domain_fallback = domain_fallback
+        self.hits = 0
+        self.domain_hits = 0
+        self.misses = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        # Several experiments may be processed at the same time
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(CategorizationCacheQueries.CreateTableQuery)
+        self.conn.execute(CategorizationCacheQueries.CreateDomainIndexQuery)
+        self.conn.commit()
+
+    def _min_fetched_at(self) -> float:
+        return time.time() - self.ttl if self.ttl is not None else 0
+
+    def get(self, url: str, taxonomy: str) -> Optional[Dict[str, Any]]:
+        """Returns the cached categorize response of the URL, or None"""
+        row = self.conn.execute(
+            CategorizationCacheQueries.SelectURLQuery,
+            {
+                "url_key": normalize_url(url),
+                "taxonomy": taxonomy,
+                "min_fetched_at": self._min_fetched_at(),
+            },
+        ).fetchone()
+        if row is None and self.domain_fallback:
+            row = self.conn.execute(
+                CategorizationCacheQueries.SelectDomainQuery,
+                {
+                    "domain": registered_domain(url),
+                    "taxonomy": taxonomy,
+                    "min_fetched_at": self._min_fetched_at(),
+                },
+            ).fetchone()
+            if row is not None:
+                self.domain_hits += 1
+        elif row is not None:
+            self.hits += 1
+        if row is None:
+            self.misses += 1
+            return None
+        return {"status_code": 200, "categories_response": json.loads(row[0])}
+
+    def put(self, url: str, taxonomy: str, response: Dict[str, Any]) -> bool:
+        """
+        Saves a categorize response. Only successful responses are cached, and
+        not the ones that are only "Uncategorized" so they can be tried again.
+        Returns whether the response was cached.
+        """
+        if response.get("status_code") != 200:
+            return False
+        categories = response["categories_response"]
+        if all(category["category"] == "Uncategorized" for category in categories):
+            return False
+        self.conn.execute(
+            CategorizationCacheQueries.UpsertQuery,
+            {
+                "url_key": normalize_url(url),
+                "taxonomy": taxonomy,
+                "domain": registered_domain(url),
+                "categories": json.dumps(categories),
+                "fetched_at": time.time(),
+            },
+        )
+        self.conn.commit()
+        return True
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.domain_hits + self.misses
+
+    @property
+    def hit_ratio(self) -> float:
+        if not self.lookups:
+            return 0.0
+        return (self.hits + self.domain_hits) / self.lookups
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "hits": self.hits,
+            "domain_hits": self.domain_hits,
+            "misses": self.misses,
+            "hit_ratio": self.hit_ratio,
+        }
+
+    def print_stats(self) -> None:
+        print(
+            f"[CATEGORIZATION CACHE] {self.hits} hits, {self.domain_hits} domain hits, "
+            f"{self.misses} misses ({self.hit_ratio:.1%} hit ratio)"
+        )
+
+    def import_landing_page_categories(
+        self, crawl_db_path: Union[str, Path], taxonomy: str = "iabv1"
+    ) -> int:
+        """
+        Warms the cache with the landing pages already categorized in a crawl
+        database. Returns the number of cached landing pages.
+        """
+        categories: Dict[str, list] = {}
+        with sqlite3.connect(crawl_db_path) as crawl_conn:
+            for url, category, taxonomy_id, confident in crawl_conn.execute(
+                CategorizationCacheQueries.SelectLandingPageCategoriesQuery
+            ):
+                categories.setdefault(url, []).append(
+                    {
+                        "category": category,
+                        "taxonomy": taxonomy,
+                        "taxonomy_tier": 2 if "-" in taxonomy_id else 1,
+                        "taxonomy_id": taxonomy_id,
+                        "confident": bool(confident),
+                    }
+                )
+        return sum(
+            self.put(
+                url,
+                taxonomy,
+                {"status_code": 200, "categories_response": url_categories},
+            )
+            for url, url_categories in categories.items()
+        )
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Import the categorized landing pages of crawl databases into the categorization cache"
+    )
+    parser.add_argument("crawl_db_paths", nargs="+", type=Path)
+    parser.add_argument("--cache", type=Path, default=DEFAULT_CACHE_PATH)
+    args = parser.parse_args()
+    cache = CategorizationCache(args.cache)
+    for crawl_db_path in args.crawl_db_paths:
+        imported = cache.import_landing_page_categories(crawl_db_path)
+        print(f"Imported {imported} landing pages from {crawl_db_path}")
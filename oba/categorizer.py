@@ -1,17 +1,35 @@
 import base64
 import hashlib
+from typing import Optional
 from urllib.parse import urlencode
 
 import aiohttp
 
+from .categorization_cache import CategorizationCache
+
 
 class Categorizer:
 
     BASE_URL = "https://api.webshrinker.com"
 
-    def __init__(self, api_key: str = None, secret_key: str = None):
+    def __init__(
+        self,
+        api_key: str = None,
+        secret_key: str = None,
+        cache: Optional[CategorizationCache] = None,
+        offline: bool = False,
+    ):
+        """
+        Parameters:
+        - cache (CategorizationCache): Cache consulted before calling the API, where the new categorizations are saved.
+        - offline (bool): Only answer from the cache, without ever calling the API.
+        """
         self.api_key = api_key
         self.secret_key = secret_key
+        self.cache = cache
+        self.offline = offline
+        if offline and cache is None:
+            raise ValueError("The offline mode needs a categorization cache")
 
     async def categorize(
         self, session: aiohttp.ClientSession, url: str, taxonomy: str = "iabv1"
@@ -26,6 +44,40 @@ class Categorizer:
         Returns:
         - dict: A dictionary containing category information or an error message.
         """
+        cached_response = self.cached_response(url, taxonomy)
+        if cached_response is not None:
+            return cached_response
+        return await self.fetch_categories(session, url, taxonomy)
+
+    def cached_response(self, url: str, taxonomy: str = "iabv1") -> Optional[dict]:
+        """
+        Returns the cached categories of the URL, or the offline response if it isn't cached in offline mode.
+        Returns None if the API needs to be called.
+        """
+        if self.cache is not None:
+            cached_response = self.cache.get(url, taxonomy)
+            if cached_response is not None:
+                return cached_response
+        if self.offline:
+            return {
+                "status_code": None,
+                "status": "offline",
+                "message": "The URL is not in the categorization cache.",
+            }
+        return None
+
+    async def fetch_categories(
+        self, session: aiohttp.ClientSession, url: str, taxonomy: str = "iabv1"
+    ) -> dict:
+        """Calls the WebShrinker API without looking at the cache, and caches the response"""
+        response = await self._request_categories(session, url, taxonomy)
+        if self.cache is not None:
+            self.cache.put(url, taxonomy, response)
+        return response
+
+    async def _request_categories(
+        self, session: aiohttp.ClientSession, url: str, taxonomy: str
+    ) -> dict:
         if not self.api_key or not self.secret_key:
             raise ValueError("Missing credentials")
 
@@ -45,7 +97,11 @@ class Categorizer:
         # Perform the async request with the provided AIOHTTP session for simultaneos requests
         async with session.get(api_url) as response:
             status_code = response.status
-            data = await response.json()
+            try:
+                data = await response.json(content_type=None)
+            except ValueError:
+                # Error pages of proxies and load balancers aren't JSON
+                data = None
 
             # Handle the possible outcomes
             if status_code == 200:
@@ -21,7 +21,12 @@ import aiohttp
 import tldextract
 
 # from adblockparser import AdblockRules
+from .ad_url_filter import NON_ADS_URLS_FILE, UNSPECIFIC_ADS_URLS_FILE, AdURLFilter
+from .categorization_cache import DEFAULT_CACHE_PATH, CategorizationCache
 from .categorizer import Categorizer
+from .rate_limited_categorizer import RateLimitedCategorizer
+from .landing_page_resolver import DEFAULT_NUM_WORKERS, LandingPageResolverPool
+from .redirect_resolver import HTTPRedirectResolver, RedirectHopStore
 
 from .enums_data_processer import (
     VisitAdvertisementsQueries,
@@ -31,7 +36,6 @@ from .enums_data_processer import (
 )
 
 from .enums import IAB_CATEGORIES
-from selenium.common.exceptions import TimeoutException
 
 # from extract_ad_url import process
 
@@ -46,16 +50,44 @@ class DataProcesser:
     # Create a logger
     logger = logging.getLogger(__name__)
 
-    def __init__(self, experiment_name: str, webshrinker_credentials, random_run=False):
+    def __init__(
+        self,
+        experiment_name: str,
+        webshrinker_credentials,
+        random_run=False,
+        num_resolver_workers: int = DEFAULT_NUM_WORKERS,
+        http_resolver: bool = True,
+        categorization_cache_path: Optional[Path] = DEFAULT_CACHE_PATH,
+        offline_categorization: bool = False,
+    ):
+        """
+        Set `categorization_cache_path` to None to always call the WebShrinker API.
+        With `offline_categorization`, the landing pages are only categorized from the cache and no credentials are needed.
+        """
         self.experiment_name = experiment_name
 
         self.random_run = random_run
 
         self.firefox_binary_path = get_firefox_binary_path()
-        self.driver = self._setup_driver()
-
-        if webshrinker_credentials:
-            self.categorizer = Categorizer(**webshrinker_credentials)
+        # The browsers are only started once there are ads to resolve
+        self.resolver_pool = LandingPageResolverPool(
+            self._setup_driver, num_workers=num_resolver_workers
+        )
+        # Ad urls are first resolved following their redirects over plain HTTP, the browsers are only used when that fails
+        self.redirect_resolver = HTTPRedirectResolver() if http_resolver else None
+
+        if webshrinker_credentials or offline_categorization:
+            self.categorizer: Optional[Categorizer] = Categorizer(
+                **(webshrinker_credentials or {}),
+                cache=(
+                    CategorizationCache(categorization_cache_path)
+                    if categorization_cache_path
+                    else None
+                ),
+                offline=offline_categorization,
+            )
+        else:
+            self.categorizer = None
 
         print("Loading experiment from: ")
         if DATA_FROM_VOLUME:
@@ -83,42 +115,65 @@ class DataProcesser:
         return driver
 
     def get_ad_landing_page_url(self, ad_url):
-        try:
-            self.driver.get(ad_url)
-            final_url = self._wait_for_url_stabilization()
-            return final_url
-        except TimeoutException:
-            print(f"Page load timed out for URL: {ad_url}. Skipping...")
-            return (
-                ad_url  # Or return ad_url to indicate the original URL was not resolved
-            )
-        except Exception as e:
-            print(f"An error occurred while loading the page: {e}")
-            print("---------Default returning same ad_url...---------")
-            return ad_url
-
-    def _wait_for_url_stabilization(
-        self, check_interval=1, stable_period=5, max_duration=30
-    ):
-        start_time = time.time()
-        last_url = self.driver.current_url
-        stable_since = start_time
-
-        while time.time() - start_time < max_duration:
-            time.sleep(check_interval)
-            current_url = self.driver.current_url
-            if current_url != last_url:
-                last_url = current_url
-                stable_since = time.time()
-            elif time.time() - stable_since >= stable_period:
-                # URL has been stable for the specified period; assume it's the final URL
-                return current_url
-
-        # Return the current URL if max_duration is reached without stabilization
-        return self.driver.current_url
+        for _, landing_page_url in self.resolver_pool.resolve([ad_url]):
+            return landing_page_url
 
     def close_browser(self):
-        self.driver.quit()
+        self.resolver_pool.close()
+
+    @staticmethod
+    def _save_resolved_ad(
+        crawled_data_cursor: sqlite3.Cursor, ad_url: str, landing_page_url: str
+    ) -> int:
+        """Sets the landing page of all the unresolved ads with `ad_url`, adding it to the landing_pages table if it's new.
+        Returns the landing_page_id."""
+        crawled_data_cursor.execute(
+            LandingPagesQueries.SelectLandingPageFromURLQuery, (landing_page_url,)
+        )
+        database_landing_page = crawled_data_cursor.fetchone()
+        if not database_landing_page:
+            # Insert the landing page URL with categorized = 0 to retrieve the landing_page_id (needed for the landing_page_categories table)
+            crawled_data_cursor.execute(
+                LandingPagesQueries.InsertLandingPageQuery, (landing_page_url, 0)
+            )
+            crawled_data_cursor.execute(
+                LandingPagesQueries.SelectLandingPageFromURLQuery, (landing_page_url,)
+            )
+            database_landing_page = crawled_data_cursor.fetchone()
+        landing_page_id, _, landing_page_categorized = database_landing_page
+
+        # Update all the unresolved visit_advertisements that have the same ad_url with the resolved landing page URL and landing_page_id
+        crawled_data_cursor.execute(
+            VisitAdvertisementsQueries.UpdateVisitAdvertisementLandingPageQuery,
+            {
+                "ad_url": ad_url,
+                "landing_page_url": landing_page_url,
+                "landing_page_id": landing_page_id,
+                "categorized": landing_page_categorized,
+            },
+        )
+        return landing_page_id
+
+    @staticmethod
+    def _needs_categorization(
+        crawled_data_cursor: sqlite3.Cursor, landing_page_url: str
+    ) -> bool:
+        crawled_data_cursor.execute(
+            LandingPagesQueries.SelectLandingPageFromURLQuery, (landing_page_url,)
+        )
+        _, _, landing_page_categorized = crawled_data_cursor.fetchone()
+        if not landing_page_categorized:
+            return True
+        crawled_data_cursor.execute(
+            LandingPageCategoriesQueries.SelectCategoriesFromLandingPageURLQuery,
+            (landing_page_url,),
+        )
+        landing_page_categories = crawled_data_cursor.fetchall()
+        # Landing pages that have only been categorized as Uncategorized are categorized again
+        return (
+            len(landing_page_categories) == 1
+            and landing_page_categories[0][0] == "Uncategorized"
+        )
 
     def process_browsers_new_ads(
         self,
@@ -129,228 +184,208 @@ class DataProcesser:
         taxonomy="iabv1",
     ):
         """Set dynamic ads, in a dictionary with all the ads by control_site and visit_id ordered by site_rank"""
-        semaphore = asyncio.Semaphore(request_rate)
-
-        async def _async_categorize_landing_page(
-            landing_page_id: int, landing_page_url: str
-        ):
-            """Categorize the ad landing page with the Categorizer and save the categories in the AdvertisementsCategories table."""
-            print(f"[ASYNC CATEGORIZE LANDING PAGE] {landing_page_url}")
-            async with semaphore:
-                async with aiohttp.ClientSession() as session:
+
+        async def _async_categorize_landing_pages(
+            landing_pages: Dict[int, str]
+        ) -> None:
+            """Categorize the ad landing pages with the Categorizer, sharing one rate limited session, and save the categories in the landing_page_categories table."""
+            assert self.categorizer is not None
+            async with RateLimitedCategorizer(
+                self.categorizer, requests_per_second=request_rate
+            ) as client:
+
+                async def _async_categorize_landing_page(
+                    landing_page_id: int, landing_page_url: str
+                ) -> None:
+                    print(f"[ASYNC CATEGORIZE LANDING PAGE] {landing_page_url}")
                     try:
-                        response = await self.categorizer.categorize(
-                            session, landing_page_url, taxonomy=taxonomy
+                        response = await client.categorize(
+                            landing_page_url, taxonomy=taxonomy
                         )
-                        delay = 1  # Initial delay in seconds
-                        while True:
-                            if response["status_code"] == 200:
-                                # TODO: check case where we would need more than one "top_level_category"
-                                print(
-                                    f"[CATEGORIES RESPONSE] {response['categories_response']}"
-                                )
-                                for result in response["categories_response"]:
-                                    # Get the parent category from the IAB_CATEGORIES dictionary
-                                    parent_category_code = result["taxonomy_id"].split(
-                                        "-"
-                                    )[0]
-                                    parent_category_name = IAB_CATEGORIES.get(
-                                        parent_category_code
-                                    ).get(parent_category_code)
-
-                                    crawled_data_cursor.execute(
-                                        LandingPageCategoriesQueries.InsertCategoryQuery,
-                                        {
-                                            "landing_page_id": landing_page_id,
-                                            "landing_page_url": landing_page_url,
-                                            "category_name": result["category"],
-                                            "category_code": result["taxonomy_id"],
-                                            "parent_category": parent_category_name,
-                                            "confident": (
-                                                1 if result["confident"] else 0
-                                            ),
-                                        },
-                                    )
-                                # Update the landing page with categorized = 1
-                                crawled_data_cursor.execute(
-                                    LandingPagesQueries.UpdateLandingPageCategorizedQuery,
-                                    {
-                                        "categorized": 1,
-                                        "landing_page_id": landing_page_id,
-                                    },
-                                )
-
-                                # TODO: Implement progress bar
-                                # progress.update(1)
-                                print(
-                                    f"[SUCCESS] Fetched categories for {landing_page_url}"
-                                )
-                                break
-                            elif response["status_code"] == 429:
-                                print(
-                                    f"[WARNING] Rate limit exceeded for {landing_page_url}. Retrying in {delay} seconds..."
-                                )
-                                await asyncio.sleep(delay)
-                                if delay < 4:
-                                    delay *= 2  # Double the delay for each retry
-                                else:
-                                    delay += (
-                                        1  # Add only one second after for 4 seconds
-                                    )
-
-                            else:
-                                print(f"[ERROR] {response}")
-                                break
                     except Exception as e:
                         print(f"[ERROR while categorizing URL] {e}")
+                        return
+                    if response["status_code"] != 200:
+                        print(f"[ERROR] {response}")
+                        return
+                    # TODO: check case where we would need more than one "top_level_category"
+                    print(f"[CATEGORIES RESPONSE] {response['categories_response']}")
+                    for result in response["categories_response"]:
+                        # Get the parent category from the IAB_CATEGORIES dictionary
+                        parent_category_code = result["taxonomy_id"].split("-")[0]
+                        parent_category_name = IAB_CATEGORIES.get(
+                            parent_category_code
+                        ).get(parent_category_code)
+
+                        crawled_data_cursor.execute(
+                            LandingPageCategoriesQueries.InsertCategoryQuery,
+                            {
+                                "landing_page_id": landing_page_id,
+                                "landing_page_url": landing_page_url,
+                                "category_name": result["category"],
+                                "category_code": result["taxonomy_id"],
+                                "parent_category": parent_category_name,
+                                "confident": (1 if result["confident"] else 0),
+                            },
+                        )
+                    # Update the landing page with categorized = 1
+                    crawled_data_cursor.execute(
+                        LandingPagesQueries.UpdateLandingPageCategorizedQuery,
+                        {
+                            "categorized": 1,
+                            "landing_page_id": landing_page_id,
+                        },
+                    )
+                    crawl_conn.commit()
+                    print(f"[SUCCESS] Fetched categories for {landing_page_url}")
+
+                await asyncio.gather(
+                    *(
+                        _async_categorize_landing_page(
+                            landing_page_id, landing_page_url
+                        )
+                        for landing_page_id, landing_page_url in landing_pages.items()
+                    )
+                )
+                client.print_stats()
 
         # Traverse all the browsers from the experiment
         for index, browser_id in enumerate(oba_browser_ids):
-            visits_number = 0
             print(
                 f"[BROWSER ADS START] Starting crawled data dynamic ads extraction of browser {index + 1}/{len(oba_browser_ids)}..."
             )
             oba_browser_queries = OBABrowserQueries(browser_id=browser_id)
 
-            # First retrieve all unresolved and uncategorized ads from the database
+            # First retrieve all unresolved ads from the database.
+            # Each resolved ad is saved right away, so after an interruption only the remaining ones are retrieved.
             crawled_data_cursor.execute(
                 oba_browser_queries.get_unresolved_advertisements_query(),
                 {"browser_id": browser_id},
             )
-
-            print(oba_browser_queries.get_unresolved_advertisements_query())
             unresolved_visit_ads = crawled_data_cursor.fetchall()
 
             # Get a list of unique ad URLs
             unique_unresolved_ad_urls = list(
-                set([ad_url for _, ad_url in unresolved_visit_ads])
+                dict.fromkeys(ad_url for _, ad_url in unresolved_visit_ads)
+            )
+            print(
+                f"[UNRESOLVED AD URLS] {len(unique_unresolved_ad_urls)} unique ad urls out of {len(unresolved_visit_ads)} ads"
             )
-            print(unique_unresolved_ad_urls)
 
-            # Then resolve all the unique landing page URLs for the unresolved ads
+            resolved_landing_pages: Dict[int, str] = {}
+            ad_urls_to_resolve = []
             for ad_url in unique_unresolved_ad_urls:
-                resolved_landing_page_url = None
-                resolved_landing_page_id = None
-                visits_number += 1
-                print(
-                    f"[UNRESOLVED AD URL START] {visits_number}/{len(unique_unresolved_ad_urls)} for {ad_url}"
-                )
-                start_time = time.time()
                 # First check if the ad URL was already resolved previously in another visit advertisement
                 crawled_data_cursor.execute(
                     VisitAdvertisementsQueries.SelectResolvedLandingPagesFromADURLQuery,
-                    {
-                        "visit_id": browser_id,
-                        "browser_id": browser_id,
-                        "ad_url": ad_url,
-                    },
+                    {"ad_url": ad_url},
                 )
-                resolved_landing_pages_from_ad_url = crawled_data_cursor.fetchall()
-                # If the ad URL was already resolved, use the resolved landing page URL
                 for (
-                    db_landing_page_id,
+                    _,
                     db_landing_page_url,
-                ) in resolved_landing_pages_from_ad_url:
+                ) in crawled_data_cursor.fetchall():
                     if db_landing_page_url != ad_url:
-                        resolved_landing_page_url = db_landing_page_url
-                        resolved_landing_page_id = db_landing_page_id
+                        landing_page_id = self._save_resolved_ad(
+                            crawled_data_cursor, ad_url, db_landing_page_url
+                        )
+                        resolved_landing_pages[landing_page_id] = db_landing_page_url
                         break
+                else:
+                    ad_urls_to_resolve.append(ad_url)
+            crawl_conn.commit()
 
-                if not resolved_landing_page_url:
-                    resolved_landing_page_url = self.get_ad_landing_page_url(ad_url)
-                #     if resolved_landing_page_url == ad_url:
-                #         # If the resolved landing page URL is the same as the ad URL, skip the rest of the loop and continue to the next ad URL to leave it unresolved for later
-                #         # TODO: mark something in the database to indicate that the ad URL is unresolved but has been attempted
-                #         print(
-                #             f"[UNRESOLVED AD URL] {ad_url} was not resolved. Skipping..."
-                #         )
-                #         continue
-
-                finish_time = time.time()
-                if finish_time - start_time > 5:
-                    print(
-                        f"[LONG TIME WARNING] Page load took {finish_time - start_time} seconds for URL: {ad_url}"
-                    )
-                print(
-                    f"[RESOLVED LANDING PAGE URL] {resolved_landing_page_url} in {finish_time - start_time} seconds."
+            # Then follow the redirects of the remaining ad URLs over HTTP
+            if self.redirect_resolver and ad_urls_to_resolve:
+                start_time = time.time()
+                requests_before = self.redirect_resolver.requests
+                cached_hops_before = self.redirect_resolver.cached_hops
+                redirect_chains = self.redirect_resolver.resolve_all(
+                    ad_urls_to_resolve, RedirectHopStore(crawl_conn)
                 )
-                # Look for the resolved landing page URL in the landing_pages table
-                crawled_data_cursor.execute(
-                    LandingPagesQueries.SelectLandingPageFromURLQuery,
-                    (resolved_landing_page_url,),
+                ad_urls_for_browsers = []
+                for ad_url in ad_urls_to_resolve:
+                    # Only set once the chain reached a landing page
+                    landing_page_url = redirect_chains[ad_url].landing_page_url
+                    if landing_page_url is not None:
+                        landing_page_id = self._save_resolved_ad(
+                            crawled_data_cursor, ad_url, landing_page_url
+                        )
+                        resolved_landing_pages[landing_page_id] = landing_page_url
+                    else:
+                        ad_urls_for_browsers.append(ad_url)
+                crawl_conn.commit()
+                print(
+                    f"[HTTP RESOLVER] Resolved {len(ad_urls_to_resolve) - len(ad_urls_for_browsers)}/{len(ad_urls_to_resolve)} ad urls "
+                    f"in {time.time() - start_time:.2f} seconds with {self.redirect_resolver.requests - requests_before} requests "
+                    f"and {self.redirect_resolver.cached_hops - cached_hops_before} cached hops"
                 )
-                database_landing_page = crawled_data_cursor.fetchone()
-                landing_page_categories = []
-
-                # Look for the categories of the resolved landing page URL in the landing_page_categories table if it was already categorized
-                if database_landing_page and database_landing_page[2]:
-                    crawled_data_cursor.execute(
-                        LandingPageCategoriesQueries.SelectCategoriesFromLandingPageURLQuery,
-                        (resolved_landing_page_url,),
-                    )
-                    landing_page_categories = crawled_data_cursor.fetchall()
+                ad_urls_to_resolve = ad_urls_for_browsers
 
-                try_for_second_time_condition = (
-                    len(landing_page_categories) == 1
-                    and landing_page_categories[0][0] == "Uncategorized"
+            # Then resolve the remaining ad URLs with the pool of browsers
+            start_time = time.time()
+            for resolved_number, (ad_url, landing_page_url) in enumerate(
+                self.resolver_pool.resolve(ad_urls_to_resolve), start=1
+            ):
+                print(
+                    f"[RESOLVED LANDING PAGE URL] {resolved_number}/{len(ad_urls_to_resolve)} {ad_url} -> {landing_page_url}"
+                )
+                landing_page_id = self._save_resolved_ad(
+                    crawled_data_cursor, ad_url, landing_page_url
                 )
+                resolved_landing_pages[landing_page_id] = landing_page_url
+                # Save the changes every 10 resolved ad urls
+                if resolved_number % 10 == 0:
+                    crawl_conn.commit()
+            crawl_conn.commit()
+            if ad_urls_to_resolve:
+                elapsed_minutes = (time.time() - start_time) / 60
+                print(
+                    f"[RESOLVER] Resolved {len(ad_urls_to_resolve)} ad urls in {elapsed_minutes:.2f} minutes "
+                    f"({len(ad_urls_to_resolve) / elapsed_minutes:.1f} ads/min)"
+                )
+                self.resolver_pool.print_stats()
 
-                # if the resolved landing page URL is not in the database, try to categorize it
-                if (
-                    not database_landing_page
-                    or database_landing_page[2] == 0
-                    or try_for_second_time_condition
-                    # This condition is to check if the landing page has only been categorized as Uncategorized so we can try to categorize it again
-                ):
-                    if (
-                        not database_landing_page
-                    ):  # Don't add landing_url again if it's already in the database
-                        # Insert the resolved landing page URL into the landing_pages table with categorized = 0 to retrieve the landing_page_id (needed for the landing_page_categories table)
-                        crawled_data_cursor.execute(
-                            LandingPagesQueries.InsertLandingPageQuery,
-                            (resolved_landing_page_url, 0),
-                        )
-                    # Get the landing_page_id of the inserted landing page
-                    crawled_data_cursor.execute(
-                        LandingPagesQueries.SelectLandingPageFromURLQuery,
-                        (resolved_landing_page_url,),
-                    )
-                    landing_page_id, _, _ = crawled_data_cursor.fetchone()
-                    # Categorize the resolved landing page URL
+            # Finally categorize the landing pages that need it, including the ones left from an interrupted run
+            crawled_data_cursor.execute(
+                oba_browser_queries.get_uncategorized_landing_pages_query()
+            )
+            landing_pages = dict(crawled_data_cursor.fetchall())
+            landing_pages.update(resolved_landing_pages)
+            landing_pages_to_categorize = {
+                landing_page_id: landing_page_url
+                for landing_page_id, landing_page_url in landing_pages.items()
+                if self._needs_categorization(crawled_data_cursor, landing_page_url)
+            }
+            print(
+                f"[ALREADY CATEGORIZED] Skipping categorization of {len(landing_pages) - len(landing_pages_to_categorize)}/{len(landing_pages)} landing pages..."
+            )
+            if landing_pages_to_categorize:
+                if self.categorizer:
                     asyncio.run(
-                        _async_categorize_landing_page(
-                            landing_page_id, resolved_landing_page_url
-                        )
+                        _async_categorize_landing_pages(landing_pages_to_categorize)
                     )
                 else:
-                    # If the resolved landing page URL is already in the database, retrieve the landing_page_id
-                    landing_page_id, _, _ = database_landing_page
-                    print("[ALREADY CATEGORIZED] Skipping categorization...")
+                    print(
+                        "[ERROR] No WebShrinker credentials to categorize landing pages"
+                    )
 
-                # Check one more time if the resolved landing page URL was categorized
+            for landing_page_id, landing_page_url in landing_pages.items():
+                # Check one more time if the landing page was categorized
                 crawled_data_cursor.execute(
                     LandingPagesQueries.SelectLandingPageFromURLQuery,
-                    (resolved_landing_page_url,),
+                    (landing_page_url,),
                 )
                 _, _, landing_page_categorized = crawled_data_cursor.fetchone()
-
-                # Update all the unresolved visit_advertisements that have the same ad_url with the resolved landing page URL and landing_page_id
                 crawled_data_cursor.execute(
-                    VisitAdvertisementsQueries.UpdateVisitAdvertisementLandingPageQuery,
+                    VisitAdvertisementsQueries.UpdateVisitAdvertisementsCategorizedQuery,
                     {
-                        "ad_url": ad_url,
-                        "landing_page_url": resolved_landing_page_url,
-                        "landing_page_id": landing_page_id,
                         "categorized": landing_page_categorized,
+                        "landing_page_id": landing_page_id,
                     },
                 )
-
-                print(
-                    f"[UNRESOLVED AD URL END] {visits_number}/{len(unique_unresolved_ad_urls)}\n\n"
-                )
-                # Save the changes every 10 visits
-                if visits_number % 10 == 0:
-                    crawl_conn.commit()
+                crawl_conn.commit()
+            if landing_pages and self.categorizer and self.categorizer.cache:
+                self.categorizer.cache.print_stats()
             print(
                 f"[BROWSER ADS FINISH] Finished crawled data dynamic ads extraction of browser {index + 1}/{len(oba_browser_ids)}..."
             )
@@ -399,42 +434,33 @@ class DataProcesser:
         Non ads are urls of ad provider settings, privacy policies, etc.
         Unspecific ads urls are ads whose ad_url was captured as just the domain of a search engine where the ad was displayed as a result, therefore the specific ad is lost.
 
+        All the patterns are matched in one pass over the distinct ad_urls, and only the rows added since the last run are scanned.
+        Returns the number of scanned and marked rows and the time taken for each filter column.
+
         """
         # Connect to crawling SQLite database
         crawl_conn = sqlite3.connect(self.sqlite_path)
-        crawl_cursor = crawl_conn.cursor()
 
+        filters = []
         if non_ads:
-            # Read the known not ad urls
-            with open("oba/resources/non_ads_urls.txt", "r") as f:
-                not_ad_urls = f.read().splitlines()
-
-            # Mark the known non ad urls as not_ad if the url contains the non ad url
-            for not_ad_url in not_ad_urls:
-                crawl_cursor.execute(
-                    "UPDATE visit_advertisements SET non_ad=1 WHERE ad_url LIKE :ad_url",
-                    {"ad_url": f"%{not_ad_url}%"},
-                )
-
-            # Save the changes
-            crawl_conn.commit()
-
+            # Non ads are marked if the ad url contains any known non ad url
+            filters.append(("non_ad", NON_ADS_URLS_FILE))
         if unspecific_ads:
-            # Read the known not ad urls
-            with open("oba/resources/unspecific_ads_urls.txt", "r") as f:
-                unspecific_ads = f.read().splitlines()
-
-            # Mark the known unspecific ad urls as not_ad
-            for unspecific_ad_url in unspecific_ads:
-                crawl_cursor.execute(
-                    "UPDATE visit_advertisements SET unspecific_ad=1 WHERE ad_url LIKE :ad_url",
-                    {"ad_url": f"%{unspecific_ad_url}%"},
-                )
+            filters.append(("unspecific_ad", UNSPECIFIC_ADS_URLS_FILE))
 
-            # Save the changes
-            crawl_conn.commit()
+        results = {}
+        for column, patterns_file in filters:
+            result = AdURLFilter.from_file(patterns_file).mark_ads(crawl_conn, column)
+            print(
+                f"[FILTER ADS] Marked {result['marked']} rows as {column} out of "
+                f"{result['scanned']} new rows ({result['distinct_urls']} distinct ad urls) "
+                f"in {result['seconds']:.2f} seconds"
+            )
+            results[column] = result
 
+        crawl_conn.close()
         print("Finished marking ads filter columns")
+        return results
 
 
 # style_and_fashion_experiment_accept_data_processer = DataProcesser(
@@ -0,0 +1,136 @@
+"""
+Registered domains of URLs and hosts, shared by the metrics and the analysis scripts.
+
+The public suffix list is loaded offline, from the snapshot bundled with
+`tldextract`, and its parsed copy is kept in an on-disk cache, so building the
+extractor never fetches the list and every machine gets the same domains. The
+host of a URL is parsed once, and the registered domain of every host is kept
+in a bounded LRU, as ad and request URLs have far fewer hosts than URLs.
+
+`registered_domains` works on whole pandas Series: the values are factorized
+first, so every distinct URL is handled once, and the domains are mapped back
+to the rows.
+
+Usage:
+    from oba.domain_extractor import registered_domain, registered_domains
+    registered_domain("https://ads.example.co.uk/click?id=1")  # "example.co.uk"
+    df["domain"] = registered_domains(df["ad_url"])
+"""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Union
+
+import pandas as pd
+import tldextract
+
+DEFAULT_CACHE_DIR = Path(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "datadir_domain_cache")
+)
+DEFAULT_CACHE_SIZE = 200_000
+
+# Characters of a URL scheme, see RFC 3986
+_SCHEME_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789+-."
+)
+# Dots that tldextract also takes as label separators
+_ROOT_LABEL_DOTS = ".。．｡"
+
+
+def url_host(value: str) -> str:
+    """
+    Host of a URL or host, parsed like `tldextract` parses it: without the
+    scheme, user info, port, path, query, fragment and trailing dot.
+    """
+    double_slashes = value.find("//")
+    if double_slashes == 0:
+        value = value[2:]
+    elif (
+        double_slashes >= 2
+        and value[double_slashes - 1] == ":"
+        and _SCHEME_CHARS.issuperset(value[: double_slashes - 1])
+    ):
+        value = value[double_slashes + 2 :]
+    netloc = (
+        value.partition("/")[0].partition("?")[0].partition("#")[0].rpartition("@")[2]
+    )
+    if netloc[:1] == "[":
+        ipv6, bracket, _ = netloc.partition("]")
+        if bracket:
+            return f"{ipv6}]"
+    return netloc.partition(":")[0].strip().rstrip(_ROOT_LABEL_DOTS)
+
+
+def offline_extractor(
+    cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR
+) -> tldextract.TLDExtract:
+    """`tldextract` extractor that never fetches the public suffix list, and uses the snapshot bundled with it"""
+    try:
+        return tldextract.TLDExtract(
+            cache_dir=str(cache_dir), suffix_list_urls=(), fallback_to_snapshot=True
+        )
+    except TypeError:
+        # tldextract < 3 keeps the parsed list in a single file
+        return tldextract.TLDExtract(
+            cache_file=str(Path(cache_dir) / "suffix_list.json"),
+            suffix_list_urls=(),
+            fallback_to_snapshot=True,
+        )
+
+
+class DomainExtractor:
+    """
+    :param cache_dir: Directory of the on-disk cache of the public suffix list.
+    :param cache_size: Number of hosts whose registered domain is kept in memory.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        self.extract = offline_extractor(cache_dir)
+        self.host_domain = lru_cache(maxsize=cache_size)(self._host_domain)
+
+    def _host_domain(self, host: str) -> str:
+        # Same as `registered_domain`, which newer tldextract versions deprecate
+        parts = self.extract(host)
+        if parts.domain and parts.suffix:
+            return f"{parts.domain}.{parts.suffix}"
+        return ""
+
+    def registered_domain(self, value: Optional[str]) -> str:
+        """Registered domain of a URL or host, an empty string if it has none"""
+        if not value:
+            return ""
+        return self.host_domain(url_host(value))
+
+    def registered_domains(self, values: pd.Series) -> pd.Series:
+        """Registered domain of every URL or host of the Series, handling each distinct value once"""
+        codes, uniques = pd.factorize(values.fillna(""), sort=False)
+        domains = pd.Series(
+            [self.registered_domain(value) for value in uniques], dtype=object
+        )
+        return pd.Series(domains.to_numpy()[codes], index=values.index, dtype=object)
+
+
+_default_extractor: Optional[DomainExtractor] = None
+
+
+def default_extractor() -> DomainExtractor:
+    """The DomainExtractor shared by the module functions, built on first use"""
+    global _default_extractor
+    if _default_extractor is None:
+        _default_extractor = DomainExtractor()
+    return _default_extractor
+
+
+def registered_domain(value: Optional[str]) -> str:
+    """Registered domain of a URL or host, an empty string if it has none"""
+    return default_extractor().registered_domain(value)
+
+
+def registered_domains(values: pd.Series) -> pd.Series:
+    """Registered domain of every URL or host of the Series, handling each distinct value once"""
+    return default_extractor().registered_domains(values)
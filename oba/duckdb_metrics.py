@@ -0,0 +1,265 @@
+"""
+DuckDB backend of the ExperimentMetrics ad aggregations.
+
+The ad tables of an experiment are loaded in DuckDB, either from its Parquet
+export (see `oba.parquet_export`) or from crawl-data.sqlite, and the groupby,
+explode and per-row `tldextract` work of the pandas path runs as vectorized
+SQL. The registered domain only depends on the scheme and host of a URL, so
+it's computed once per distinct origin with `tldextract` and kept in the
+origin_domains lookup table. The domain groups of `oba.enums` are the
+domain_groups table.
+
+The methods return the same counts as the pandas path, which ExperimentMetrics
+formats into the same tables:
+    metrics = ExperimentMetrics(experiment_name, backend="duckdb")
+    metrics = ExperimentMetrics(
+        experiment_name, backend="duckdb", parquet_dir=f"{experiment_dir}/parquet"
+    )
+
+The ads can be an ads DataFrame like the one of
+`get_ads_by_category_table_all_browsers_old`, or the relation returned by
+`ads_by_category`, which doesn't leave DuckDB.
+"""
+
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import duckdb
+import pandas as pd
+
+from .domain_extractor import registered_domains
+from .enums import A_GROUP, M_GROUP, M_MINUS_GROUP, NOTHING_GROUP, U_GROUP
+from .parquet_export import read_sqlite_table
+
+AD_TABLES = ("site_visits", "visit_advertisements", "landing_page_categories")
+# In the order ExperimentMetrics looks a domain up
+DOMAIN_GROUPS = {
+    "Nothing": NOTHING_GROUP,
+    "A": A_GROUP,
+    "M": M_GROUP,
+    "M-": M_MINUS_GROUP,
+    "U": U_GROUP,
+}
+EXCLUDED_CATEGORIES = ("Style & Fashion", "Shopping")
+# The URL up to its path, or the whole URL when it has no scheme
+ORIGIN_EXPRESSION = (
+    "COALESCE(NULLIF(regexp_extract(ad_url, '^[^:/?#]*://[^/?#]*'), ''), ad_url)"
+)
+
+Ads = Union[pd.DataFrame, duckdb.DuckDBPyRelation]
+
+
+class DuckDBMetrics:
+    """
+    :param data_path: Path of the crawl database, its ad tables are copied in memory.
+    :param parquet_dir: Directory of the Parquet export, read in place.
+    """
+
+    def __init__(
+        self,
+        data_path: Optional[Union[str, Path]] = None,
+        parquet_dir: Optional[Union[str, Path]] = None,
+    ) -> None:
+        if (data_path is None) == (parquet_dir is None):
+            raise ValueError("Either data_path or parquet_dir is needed")
+        self.conn = duckdb.connect()
+        if parquet_dir is not None:
+            for table in AD_TABLES:
+                files = (Path(parquet_dir) / table / "**" / "*.parquet").as_posix()
+                self.conn.execute(
+                    f"CREATE VIEW {table} AS SELECT * FROM read_parquet('{files}', hive_partitioning = true, union_by_name = true)"
+                )
+        else:
+            assert data_path is not None
+            with closing(sqlite3.connect(data_path)) as crawl_conn:
+                for table in AD_TABLES:
+                    arrow_table = read_sqlite_table(crawl_conn, table)
+                    self.conn.execute(
+                        f"CREATE TABLE {table} AS SELECT * FROM arrow_table"
+                    )
+
+        self.conn.execute(
+            "CREATE TABLE origin_domains (origin VARCHAR PRIMARY KEY, domain VARCHAR)"
+        )
+        domain_groups: Dict[str, str] = {}
+        for group, domains in DOMAIN_GROUPS.items():
+            for domain in domains:
+                domain_groups.setdefault(domain, group)
+        domain_groups_df = pd.DataFrame(
+            list(domain_groups.items()), columns=["domain", "group"]
+        )
+        self.conn.execute(
+            "CREATE TABLE domain_groups AS SELECT * FROM domain_groups_df"
+        )
+
+    def ads_by_category(
+        self, browser_ids: Optional[List[int]] = None
+    ) -> duckdb.DuckDBPyRelation:
+        """
+        Categorized ads of the training browsers with the list of their
+        categories, like `ExperimentMetrics.get_ads_by_category_table_all_browsers_old`.
+        """
+        browser_filter = "AND va.browser_id IN (SELECT UNNEST($browser_ids))"
+        return self.conn.sql(
+            f"""
+            SELECT
+                va.ad_id,
+                any_value(va.ad_url) AS ad_url,
+                any_value(va.landing_page_url) AS landing_page_url,
+                COALESCE(list(DISTINCT lp.category_name) FILTER (WHERE lp.category_name IS NOT NULL), []) AS categories,
+                any_value(sv.site_url) AS site_url,
+                any_value(va.visit_id) AS visit_id,
+                any_value(va.browser_id) AS browser_id
+            FROM visit_advertisements va
+            LEFT JOIN landing_page_categories lp ON va.landing_page_id = lp.landing_page_id
+            LEFT JOIN site_visits sv ON va.visit_id = sv.visit_id
+            WHERE va.categorized AND va.non_ad IS NULL AND va.unspecific_ad IS NULL AND NOT va.clean_run
+            {browser_filter if browser_ids is not None else ""}
+            GROUP BY va.ad_id
+            ORDER BY va.ad_id
+            """,
+            params={"browser_ids": browser_ids} if browser_ids is not None else None,
+        )
+
+    def _register_ads(self, ads: Ads) -> None:
+        """Copies `ads` to the ads table, queried several times, with an empty list for the ads without categories"""
+        if isinstance(ads, pd.DataFrame):
+            ads = ads[["ad_url", "visit_id", "browser_id", "categories"]].assign(
+                categories=[
+                    categories if isinstance(categories, list) else []
+                    for categories in ads["categories"]
+                ]
+            )
+            self.conn.register("ads_input", ads)
+        else:
+            ads.create_view("ads_input", replace=True)
+        self.conn.execute(
+            f"CREATE OR REPLACE TEMP TABLE ads AS SELECT ad_url, {ORIGIN_EXPRESSION} AS origin, visit_id, browser_id, COALESCE(categories, []) AS categories FROM ads_input"
+        )
+
+    def _update_origin_domains(self) -> None:
+        """Adds the registered domain of the ad origins that aren't in origin_domains yet"""
+        new_origins = self.conn.execute(
+            "SELECT DISTINCT origin FROM ads WHERE origin IS NOT NULL AND origin NOT IN (SELECT origin FROM origin_domains)"
+        ).df()["origin"]
+        if new_origins.empty:
+            return
+        new_domains = pd.DataFrame(
+            {"origin": new_origins, "domain": registered_domains(new_origins)}
+        )
+        self.conn.execute("INSERT INTO origin_domains SELECT * FROM new_domains")
+
+    def categories_counts(self, ads: Ads) -> Tuple[pd.DataFrame, Dict[str, int]]:
+        """
+        Ads by category, see `ExperimentMetrics.get_categories_total_and_unique_ads`.
+
+        :return: The Category, NumTotalAds and NumUniqueAds of every category,
+            ordered by category, and the total_ads_all, unique_ads_all,
+            total_ads_not_style_nor_shopping and unique_ads_not_style_nor_shopping
+            counts.
+        """
+        self._register_ads(ads)
+        # An ad is counted once per visit in the totals, and once in the unique counts
+        category_counts = self.conn.execute(
+            """
+            WITH flattened AS (
+                SELECT visit_id, browser_id, ad_url, UNNEST(categories) AS category
+                FROM ads
+            )
+            SELECT
+                category AS Category,
+                CAST(COUNT(DISTINCT (visit_id, browser_id, ad_url)) FILTER (WHERE visit_id IS NOT NULL AND browser_id IS NOT NULL AND ad_url IS NOT NULL) AS BIGINT) AS NumTotalAds,
+                CAST(COUNT(DISTINCT ad_url) AS BIGINT) AS NumUniqueAds
+            FROM flattened
+            WHERE category IS NOT NULL
+            GROUP BY category
+            HAVING COUNT(*) FILTER (WHERE visit_id IS NOT NULL AND browser_id IS NOT NULL) > 0
+            """
+        ).df()
+        category_counts = category_counts.sort_values("Category").reset_index(drop=True)
+
+        totals = self.conn.execute(
+            """
+            SELECT
+                COUNT(DISTINCT (visit_id, browser_id, ad_url)) FILTER (WHERE visit_id IS NOT NULL AND browser_id IS NOT NULL AND ad_url IS NOT NULL),
+                COUNT(DISTINCT ad_url),
+                COUNT(DISTINCT (visit_id, browser_id, ad_url)) FILTER (WHERE visit_id IS NOT NULL AND browser_id IS NOT NULL AND ad_url IS NOT NULL AND excluded = 0),
+                COUNT(DISTINCT ad_url) FILTER (WHERE excluded = 0)
+            FROM (
+                SELECT *, len(list_intersect(categories, $excluded_categories)) AS excluded
+                FROM ads
+            )
+            """,
+            {"excluded_categories": list(EXCLUDED_CATEGORIES)},
+        ).fetchone()
+        return category_counts, dict(
+            zip(
+                (
+                    "total_ads_all",
+                    "unique_ads_all",
+                    "total_ads_not_style_nor_shopping",
+                    "unique_ads_not_style_nor_shopping",
+                ),
+                totals,
+            )
+        )
+
+    def group_counts(
+        self, ads: Ads, category_filter: Optional[str] = None
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Ads by domain group, see `ExperimentMetrics.count_ads_by_session_by_group`.
+
+        :return: The group and NumAds of every group, counting an ad once per
+            visit, and the group and unique ad_url count of every group, both
+            ordered by group.
+        """
+        self._register_ads(ads)
+        self._update_origin_domains()
+        category_condition = (
+            "WHERE list_contains(a.categories, $category_filter)"
+            if category_filter
+            else ""
+        )
+        params = {"category_filter": category_filter} if category_filter else {}
+        grouped_ads = f"""
+            WITH grouped_ads AS (
+                SELECT a.browser_id, a.visit_id, a.ad_url, COALESCE(g."group", 'Nothing') AS "group"
+                FROM ads a
+                LEFT JOIN origin_domains d ON a.origin = d.origin
+                LEFT JOIN domain_groups g ON d.domain = g.domain
+                {category_condition}
+            )
+            """
+        grouped_ads_total = self.conn.execute(
+            grouped_ads
+            + """
+            SELECT "group", CAST(SUM(num_ads) AS BIGINT) AS NumAds
+            FROM (
+                SELECT browser_id, visit_id, "group", COUNT(DISTINCT ad_url) AS num_ads
+                FROM grouped_ads
+                WHERE browser_id IS NOT NULL AND visit_id IS NOT NULL
+                GROUP BY browser_id, visit_id, "group"
+            )
+            GROUP BY "group"
+            """,
+            params,
+        ).df()
+        grouped_ads_unique = self.conn.execute(
+            grouped_ads
+            + """
+            SELECT "group", CAST(COUNT(DISTINCT ad_url) AS BIGINT) AS ad_url
+            FROM grouped_ads
+            GROUP BY "group"
+            """,
+            params,
+        ).df()
+        return (
+            grouped_ads_total.sort_values("group").reset_index(drop=True),
+            grouped_ads_unique.sort_values("group").reset_index(drop=True),
+        )
+
+    def close(self) -> None:
+        self.conn.close()
@@ -0,0 +1,294 @@
+"""
+Precompiled index of the EasyList cosmetic (element hiding) rules.
+
+`oba/resources/easylist.txt` is parsed once into a compact gzipped JSON index:
+- generic rules (`##selector`) bucketed by the id, class or tag of their first
+  compound selector, so only the rules whose key is present in the page need to
+  be evaluated; selectors without such a key go to the `other` bucket,
+- domain rules (`example.com##selector`) keyed by registered domain,
+- exceptions (`#@#selector`) removed from the generic rules and domain
+  exceptions (`example.com#@#selector`) kept to be applied per visit.
+
+`oba/resources/extra_selectors.txt` adds the generic rules of the selector list
+that the index replaced and that easylist.txt doesn't have, in the same format.
+
+Rebuild the index after updating easylist.txt with:
+    python -m oba.easylist_index
+"""
+
+import gzip
+import json
+import re
+from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
+from typing import DefaultDict, Dict, Iterable, List, Optional, Set
+from urllib.parse import urlparse
+
+from .domain_extractor import default_extractor
+
+RESOURCES_DIR = Path(__file__).parent / "resources"
+EASYLIST_FILE = RESOURCES_DIR / "easylist.txt"
+EXTRA_SELECTORS_FILE = RESOURCES_DIR / "extra_selectors.txt"
+INDEX_FILE = RESOURCES_DIR / "easylist_selector_index.json.gz"
+
+ID_BUCKET = "id"
+CLASS_BUCKET = "class"
+TAG_BUCKET = "tag"
+
+# Rule types that are not plain CSS and can't be evaluated with querySelectorAll
+UNSUPPORTED_SEPARATORS = ("#?#", "#$#", "#@$#", "#@?#")
+UNSUPPORTED_PSEUDO_CLASSES = re.compile(
+    r":(-abp-[\w-]+|has-text|xpath|style|remove|upward|matches-css[\w-]*|"
+    r"min-text-length|watch-attr|others|matches-path|matches-attr)\("
+)
+# First compound selector: optional tag followed by ids/classes
+FIRST_COMPOUND = re.compile(r"^([a-zA-Z][\w-]*)?((?:[#.][\w-]+)*)")
+
+DomainSelectors = Dict[str, Dict[str, List[str]]]
+"""registered domain -> rule hostname -> selectors"""
+
+
+def _bucket_of(selector: str) -> Optional[tuple]:
+    """Returns the (bucket, key) under which a generic selector is indexed,
+    or None if the selector has to be evaluated on every page"""
+    if "\\" in selector:
+        return None
+    match = FIRST_COMPOUND.match(selector)
+    if match is None:
+        return None
+    tag, simple_selectors = match.groups()
+    ids = re.findall(r"#([\w-]+)", simple_selectors)
+    if ids:
+        return ID_BUCKET, ids[0]
+    classes = re.findall(r"\.([\w-]+)", simple_selectors)
+    if classes:
+        return CLASS_BUCKET, classes[0]
+    if tag:
+        return TAG_BUCKET, tag.lower()
+    return None
+
+
+def _registered_domain(hostname: str) -> str:
+    return default_extractor().host_domain(hostname) or hostname
+
+
+def _applies_to(hostname: str, rule_hostname: str) -> bool:
+    return hostname == rule_hostname or hostname.endswith("." + rule_hostname)
+
+
+class EasyListIndex:
+    def __init__(
+        self,
+        generic: Dict[str, Dict[str, List[str]]],
+        other: List[str],
+        domains: DomainSelectors,
+        domain_exceptions: DomainSelectors,
+        version: Optional[str] = None,
+    ) -> None:
+        self.generic = generic
+        self.other = other
+        self.domains = domains
+        self.domain_exceptions = domain_exceptions
+        self.version = version
+
+    @classmethod
+    def from_easylist(cls, lines: Iterable[str]) -> "EasyListIndex":
+        """Parses the cosmetic rules of an EasyList formatted filter list"""
+        version = None
+        generic_rules: List[str] = []
+        generic_exceptions: Set[str] = set()
+        domains: DefaultDict[str, DefaultDict[str, List[str]]] = defaultdict(
+            lambda: defaultdict(list)
+        )
+        domain_exceptions: DefaultDict[str, DefaultDict[str, List[str]]] = defaultdict(
+            lambda: defaultdict(list)
+        )
+
+        for line in lines:
+            line = line.strip()
+            if line.startswith("! Version:"):
+                version = line.split(":", 1)[1].strip()
+                continue
+            if not line or line.startswith(("!", "[")):
+                continue
+            if any(separator in line for separator in UNSUPPORTED_SEPARATORS):
+                continue
+
+            if "#@#" in line:
+                domain_list, selector = line.split("#@#", 1)
+                is_exception = True
+            elif "##" in line:
+                domain_list, selector = line.split("##", 1)
+                is_exception = False
+            else:
+                # Network filter, not relevant for element hiding
+                continue
+            if selector.startswith("+js(") or UNSUPPORTED_PSEUDO_CLASSES.search(
+                selector
+            ):
+                continue
+
+            hostnames = [d.strip().lower() for d in domain_list.split(",") if d]
+            included = [h for h in hostnames if not h.startswith("~")]
+            excluded = [h[1:] for h in hostnames if h.startswith("~")]
+
+            if is_exception:
+                if not hostnames:
+                    generic_exceptions.add(selector)
+                for hostname in included:
+                    domain_exceptions[_registered_domain(hostname)][hostname].append(
+                        selector
+                    )
+                continue
+
+            if not included:
+                # Generic rule, possibly disabled on some domains (~example.com##...)
+                generic_rules.append(selector)
+            for hostname in included:
+                domains[_registered_domain(hostname)][hostname].append(selector)
+            for hostname in excluded:
+                domain_exceptions[_registered_domain(hostname)][hostname].append(
+                    selector
+                )
+
+        generic: Dict[str, Dict[str, List[str]]] = {
+            ID_BUCKET: defaultdict(list),
+            CLASS_BUCKET: defaultdict(list),
+            TAG_BUCKET: defaultdict(list),
+        }
+        other = []
+        for selector in dict.fromkeys(generic_rules):
+            if selector in generic_exceptions:
+                continue
+            bucket = _bucket_of(selector)
+            if bucket is None:
+                other.append(selector)
+            else:
+                generic[bucket[0]][bucket[1]].append(selector)
+
+        return cls(
+            generic={name: dict(bucket) for name, bucket in generic.items()},
+            other=other,
+            domains={k: dict(v) for k, v in domains.items()},
+            domain_exceptions={k: dict(v) for k, v in domain_exceptions.items()},
+            version=version,
+        )
+
+    @classmethod
+    def load(cls, path: Path = INDEX_FILE) -> "EasyListIndex":
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(
+            generic=data["generic"],
+            other=data["other"],
+            domains=data["domains"],
+            domain_exceptions=data["domain_exceptions"],
+            version=data["version"],
+        )
+
+    def save(self, path: Path = INDEX_FILE) -> None:
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": self.version,
+                    "generic": self.generic,
+                    "other": self.other,
+                    "domains": self.domains,
+                    "domain_exceptions": self.domain_exceptions,
+                },
+                f,
+                separators=(",", ":"),
+                sort_keys=True,
+            )
+
+    def generic_selectors(self) -> List[str]:
+        """All the generic selectors, regardless of the page content"""
+        selectors = []
+        for bucket in self.generic.values():
+            for bucket_selectors in bucket.values():
+                selectors.extend(bucket_selectors)
+        return selectors + self.other
+
+    @staticmethod
+    def _domain_selectors(index: DomainSelectors, hostname: str) -> List[str]:
+        selectors = []
+        for rule_hostname, rule_selectors in index.get(
+            _registered_domain(hostname), {}
+        ).items():
+            if _applies_to(hostname, rule_hostname):
+                selectors.extend(rule_selectors)
+        return selectors
+
+    def selectors_for(
+        self,
+        visit_url: Optional[str] = None,
+        ids: Optional[Iterable[str]] = None,
+        classes: Optional[Iterable[str]] = None,
+        tags: Optional[Iterable[str]] = None,
+    ) -> List[str]:
+        """
+        Returns the selectors relevant for a page.
+
+        :param visit_url: URL of the page, used to add its domain rules and drop
+            the selectors that are excepted on its domain.
+        :param ids: The ids present in the page. If none of ids, classes and tags
+            is given, all the generic selectors are returned.
+        :param classes: The classes present in the page.
+        :param tags: The tag names present in the page.
+        :return: The deduplicated list of selectors to evaluate.
+        """
+        if ids is None and classes is None and tags is None:
+            selectors = self.generic_selectors()
+        else:
+            selectors = []
+            for bucket_name, keys in (
+                (ID_BUCKET, ids),
+                (CLASS_BUCKET, classes),
+                (TAG_BUCKET, tags),
+            ):
+                bucket = self.generic[bucket_name]
+                for key in set(keys or ()):
+                    selectors.extend(bucket.get(key, ()))
+            selectors.extend(self.other)
+
+        hostname = urlparse(visit_url).hostname if visit_url else None
+        if not hostname:
+            return selectors
+
+        selectors = selectors + self._domain_selectors(self.domains, hostname)
+        exceptions = set(self._domain_selectors(self.domain_exceptions, hostname))
+        return [s for s in dict.fromkeys(selectors) if s not in exceptions]
+
+
+def build_index(
+    easylist_path: Path = EASYLIST_FILE,
+    index_path: Path = INDEX_FILE,
+    extra_path: Optional[Path] = EXTRA_SELECTORS_FILE,
+) -> EasyListIndex:
+    """Parses easylist.txt and the extra rules, and writes the selector index to disk"""
+    with open(easylist_path, "r", encoding="utf-8") as f:
+        lines = f.readlines()
+    if extra_path is not None:
+        with open(extra_path, "r", encoding="utf-8") as f:
+            lines += f.readlines()
+    index = EasyListIndex.from_easylist(lines)
+    index.save(index_path)
+    return index
+
+
+@lru_cache(maxsize=1)
+def get_easylist_index() -> EasyListIndex:
+    """Loads the selector index, building it first if it's missing"""
+    if not INDEX_FILE.exists():
+        return build_index()
+    return EasyListIndex.load()
+
+
+if __name__ == "__main__":
+    index = build_index()
+    print(
+        f"Built EasyList selector index (version {index.version}): "
+        f"{len(index.generic_selectors())} generic selectors, "
+        f"{len(index.domains)} domains with specific rules -> {INDEX_FILE}"
+    )
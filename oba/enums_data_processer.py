@@ -16,6 +16,10 @@ class OBABrowserQueries:
         """Returns a list of tuples with (ad_id, landing_page_url)"""
         return f"SELECT ad_id, ad_url FROM visit_advertisements WHERE browser_id = {self.browser_id} AND landing_page_url IS NULL AND non_ad IS NULL AND unspecific_ad IS NULL"
 
+    def get_uncategorized_landing_pages_query(self) -> str:
+        """Returns a list of tuples with (landing_page_id, landing_page_url) of the resolved ads that aren't categorized yet"""
+        return f"SELECT DISTINCT landing_page_id, landing_page_url FROM visit_advertisements WHERE browser_id = {self.browser_id} AND landing_page_id IS NOT NULL AND categorized = 0 AND non_ad IS NULL AND unspecific_ad IS NULL"
+
 
 class VisitAdvertisementsQueries:
     """Queries for the visit_advertisements tables"""
@@ -32,6 +36,8 @@ class VisitAdvertisementsQueries:
 
     UpdateVisitAdvertisementLandingPageQuery = "UPDATE visit_advertisements SET landing_page_url=:landing_page_url, landing_page_id=:landing_page_id, categorized=:categorized WHERE ad_url=:ad_url AND landing_page_url is NULL"
 
+    UpdateVisitAdvertisementsCategorizedQuery = "UPDATE visit_advertisements SET categorized=:categorized WHERE landing_page_id=:landing_page_id"
+
 
 class LandingPagesQueries:
     """Queries for the landing_pages table"""
@@ -50,3 +56,138 @@ class LandingPageCategoriesQueries:
     InsertCategoryQuery = "INSERT INTO landing_page_categories (landing_page_id, landing_page_url, category_name, category_code, parent_category, confident) VALUES (:landing_page_id, :landing_page_url, :category_name, :category_code, :parent_category, :confident)"
 
     SelectCategoriesFromLandingPageURLQuery = "SELECT category_name, category_code, parent_category, confident FROM landing_page_categories WHERE landing_page_url=:landing_page_url"
+
+
+class AdFilterQueries:
+    """Queries for marking filtered ads in visit_advertisements and keeping track of the filtered rows"""
+
+    FILTER_COLUMNS = ("non_ad", "unspecific_ad")
+
+    CreateStateTableQuery = "CREATE TABLE IF NOT EXISTS ad_filter_state (filter_column TEXT PRIMARY KEY, last_ad_id INTEGER, patterns_digest TEXT)"
+
+    SelectStateQuery = "SELECT last_ad_id, patterns_digest FROM ad_filter_state WHERE filter_column=:filter_column"
+
+    UpsertStateQuery = "INSERT OR REPLACE INTO ad_filter_state (filter_column, last_ad_id, patterns_digest) VALUES (:filter_column, :last_ad_id, :patterns_digest)"
+
+    @staticmethod
+    def select_unfiltered_ads_query(column: str) -> str:
+        """Returns a list of tuples with (ad_id, ad_url) of the rows not marked in `column` yet"""
+        return f"SELECT ad_id, ad_url FROM visit_advertisements WHERE ad_id > :last_ad_id AND {column} IS NULL ORDER BY ad_id"
+
+    @staticmethod
+    def mark_ad_query(column: str) -> str:
+        return f"UPDATE visit_advertisements SET {column}=1 WHERE ad_id=?"
+
+
+class RedirectHopsQueries:
+    """Queries for the redirect_hops table, with every hop followed while resolving ad urls over HTTP"""
+
+    CreateTableQuery = "CREATE TABLE IF NOT EXISTS redirect_hops (url TEXT PRIMARY KEY, hop_type TEXT NOT NULL, next_url TEXT, status_code INTEGER)"
+
+    SelectHopQuery = (
+        "SELECT url, hop_type, next_url, status_code FROM redirect_hops WHERE url=:url"
+    )
+
+    UpsertHopQuery = "INSERT OR REPLACE INTO redirect_hops (url, hop_type, next_url, status_code) VALUES (:url, :hop_type, :next_url, :status_code)"
+
+
+class CategorizationCacheQueries:
+    """Queries for the categorizations table of the shared categorization cache"""
+
+    CreateTableQuery = "CREATE TABLE IF NOT EXISTS categorizations (url_key TEXT NOT NULL, taxonomy TEXT NOT NULL, domain TEXT NOT NULL, categories TEXT NOT NULL, fetched_at REAL NOT NULL, PRIMARY KEY (url_key, taxonomy))"
+
+    CreateDomainIndexQuery = "CREATE INDEX IF NOT EXISTS categorizations_domain ON categorizations (domain, taxonomy, fetched_at)"
+
+    SelectURLQuery = "SELECT categories FROM categorizations WHERE url_key=:url_key AND taxonomy=:taxonomy AND fetched_at >= :min_fetched_at"
+
+    SelectDomainQuery = "SELECT categories FROM categorizations WHERE domain=:domain AND taxonomy=:taxonomy AND fetched_at >= :min_fetched_at ORDER BY fetched_at DESC LIMIT 1"
+
+    UpsertQuery = "INSERT OR REPLACE INTO categorizations (url_key, taxonomy, domain, categories, fetched_at) VALUES (:url_key, :taxonomy, :domain, :categories, :fetched_at)"
+
+    SelectLandingPageCategoriesQuery = "SELECT landing_page_url, category_name, category_code, confident FROM landing_page_categories ORDER BY landing_page_id"
+
+
+class ThirdPartyLabelsQueries:
+    """Queries for the <table>_labels side tables, with the filter list verdicts and third-party status of the http_requests and javascript rows"""
+
+    URL_COLUMNS = {"http_requests": "url", "javascript": "script_url"}
+
+    CreateStateTableQuery = "CREATE TABLE IF NOT EXISTS third_party_labels_state (labels TEXT PRIMARY KEY, last_id INTEGER, lists_digest TEXT)"
+
+    SelectStateQuery = "SELECT last_id, lists_digest FROM third_party_labels_state WHERE labels=:labels"
+
+    UpsertStateQuery = "INSERT OR REPLACE INTO third_party_labels_state (labels, last_id, lists_digest) VALUES (:labels, :last_id, :lists_digest)"
+
+    @staticmethod
+    def create_labels_table_query(table: str) -> str:
+        return f"CREATE TABLE IF NOT EXISTS {table}_labels (id INTEGER PRIMARY KEY, easyprivacy INTEGER NOT NULL, easylist INTEGER NOT NULL, adserverlist INTEGER NOT NULL, third_party INTEGER NOT NULL)"
+
+    @staticmethod
+    def delete_labels_query(table: str) -> str:
+        return f"DELETE FROM {table}_labels"
+
+    @staticmethod
+    def select_unlabeled_rows_query(table: str) -> str:
+        """Returns a list of tuples with (id, url, site_url) of the next `limit` rows after `last_id`"""
+        url_column = ThirdPartyLabelsQueries.URL_COLUMNS[table]
+        return f"SELECT t.id, t.{url_column}, sv.site_url FROM {table} t LEFT JOIN site_visits sv ON t.visit_id = sv.visit_id WHERE t.id > :last_id ORDER BY t.id LIMIT :limit"
+
+    @staticmethod
+    def insert_labels_query(table: str) -> str:
+        return f"INSERT OR REPLACE INTO {table}_labels (id, easyprivacy, easylist, adserverlist, third_party) VALUES (?, ?, ?, ?, ?)"
+
+
+class ParquetExportQueries:
+    """Queries for exporting the crawl tables to Parquet and keeping track of the exported rows"""
+
+    CreateStateTableQuery = "CREATE TABLE IF NOT EXISTS parquet_export_state (export TEXT PRIMARY KEY, last_rowid INTEGER)"
+
+    SelectStateQuery = (
+        "SELECT last_rowid FROM parquet_export_state WHERE export=:export"
+    )
+
+    UpsertStateQuery = "INSERT OR REPLACE INTO parquet_export_state (export, last_rowid) VALUES (:export, :last_rowid)"
+
+    SelectTablesQuery = (
+        "SELECT name FROM sqlite_master WHERE type='table' ORDER BY name"
+    )
+
+    @staticmethod
+    def table_info_query(table: str) -> str:
+        """Returns a list of tuples with (cid, name, type, notnull, dflt_value, pk)"""
+        return f"PRAGMA table_info({table})"
+
+    @staticmethod
+    def select_rows_query(table: str, columns: list) -> str:
+        """Returns a list of tuples with (rowid, *columns) of the next `limit` rows after `last_rowid`"""
+        quoted_columns = ", ".join(f'"{column}"' for column in columns)
+        return f"SELECT rowid, {quoted_columns} FROM {table} WHERE rowid > :last_rowid ORDER BY rowid LIMIT :limit"
+
+    @staticmethod
+    def select_rows_summary_query(table: str) -> str:
+        """Returns a tuple with (rows, max rowid) of the table"""
+        return f"SELECT COUNT(*), COALESCE(MAX(rowid), 0) FROM {table}"
+
+
+class ArtificialSessionsQueries:
+    """Queries for assigning the control visits to artificial sessions"""
+
+    SelectVisitOrderQuery = "SELECT visit_id, site_url, site_rank, ROW_NUMBER() OVER (PARTITION BY site_url ORDER BY site_rank) AS visit_order FROM site_visits"
+
+    SelectCategorizedAdsQuery = "SELECT visit_id, ad_url FROM visit_advertisements WHERE categorized = TRUE AND non_ad IS NULL AND unspecific_ad IS NULL"
+
+    CreateTableQuery = "CREATE TABLE IF NOT EXISTS artificial_sessions (visit_id INTEGER PRIMARY KEY, site_url TEXT NOT NULL, site_rank INTEGER, browser_id INTEGER NOT NULL, session INTEGER NOT NULL)"
+
+    CreateStateTableQuery = "CREATE TABLE IF NOT EXISTS artificial_sessions_state (lookup TEXT PRIMARY KEY, visits_digest TEXT)"
+
+    SelectStateQuery = (
+        "SELECT visits_digest FROM artificial_sessions_state WHERE lookup=:lookup"
+    )
+
+    UpsertStateQuery = "INSERT OR REPLACE INTO artificial_sessions_state (lookup, visits_digest) VALUES (:lookup, :visits_digest)"
+
+    SelectSessionsQuery = "SELECT visit_id, site_url, site_rank, browser_id, session FROM artificial_sessions ORDER BY session, site_url, site_rank"
+
+    DeleteSessionsQuery = "DELETE FROM artificial_sessions"
+
+    InsertSessionsQuery = "INSERT INTO artificial_sessions (visit_id, site_url, site_rank, browser_id, session) VALUES (?, ?, ?, ?, ?)"
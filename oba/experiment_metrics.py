@@ -4,14 +4,19 @@ import sqlite3
 import os
 import sqlite3
 import pandas as pd
-import tldextract
 
 
 import sqlite3
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 import matplotlib.patches as mpatches
 import matplotlib.pyplot as plt
 import numpy as np
+from oba.artificial_sessions import session_lookup
+from oba.domain_extractor import registered_domains
+from oba.duckdb_metrics import AD_TABLES, DuckDBMetrics
+from oba.enums_data_processer import ArtificialSessionsQueries
+from oba.parquet_export import stale_tables
+from oba.result_cache import CACHE_DIR_NAME, ResultCache, cached_result
 from oba.enums import (
     IAB_CATEGORIES,
     NOTHING_GROUP,
@@ -26,29 +31,72 @@ DATA_CONTROL_RUNS = False
 
 
 class ExperimentMetrics:
-    def __init__(self, experiment_name: str, control_runs=DATA_CONTROL_RUNS):
-        """Initialize the analyzer with the path to the SQLite database."""
+    def __init__(
+        self,
+        experiment_name: str,
+        control_runs=DATA_CONTROL_RUNS,
+        backend="pandas",
+        cache_results=True,
+        parquet_dir=None,
+    ):
+        """Initialize the analyzer with the path to the SQLite database.
+
+        With backend="duckdb" the ad aggregations run in DuckDB, on the ad
+        tables of the SQLite database, or on their Parquet export in
+        parquet_dir (see oba.parquet_export). The export has to be a full one
+        made after the last update of the ads, like the categorization of their
+        landing pages; a ValueError is raised when rows were added or deleted
+        since.
+        The results of the queries are cached in the results directory of the
+        experiment (see oba.result_cache), cache_results=False bypasses it.
+        """
         self.control_runs = control_runs
         self.experiment_name = experiment_name
-        if DATA_FROM_VOLUME:
-            self.experiment_dir = (
-                f"/Volumes/LaCie/OpenOBA/oba_runs/{self.experiment_name}"
-            )
-            self.data_path = f"{self.experiment_dir}/crawl-data-copy.sqlite"
-        else:
-            self.experiment_dir = f"./datadir/{experiment_name}"
-            self.data_path = f"{self.experiment_dir}/crawl-data.sqlite"
+        self.experiment_dir, self.data_path = self.experiment_paths(
+            experiment_name, control_runs
+        )
+        if not DATA_FROM_VOLUME:
             print(self.data_path)
-
-        if control_runs:
-            self.experiment_dir = (
-                f"/Volumes/LaCie/OpenOBA/control_runs/{self.experiment_name}"
-            )
-            self.data_path = f"{self.experiment_dir}/crawl-data.sqlite"
         self.experiment_config = self._read_experiment_config_json()
         self.oba_browsers = self.experiment_config["browser_ids"]["oba"]
         self.clean_run_browsers = self.experiment_config["browser_ids"]["clear"]
         self.conn = sqlite3.connect(self.data_path)
+        self.duckdb_metrics = None
+        if backend == "duckdb" and parquet_dir is not None:
+            stale = stale_tables(self.conn, parquet_dir, AD_TABLES)
+            if stale:
+                raise ValueError(
+                    f"The Parquet export in {parquet_dir} is behind the crawl "
+                    f"database for {', '.join(stale)}, export it again with --full"
+                )
+            self.duckdb_metrics = DuckDBMetrics(parquet_dir=parquet_dir)
+        elif backend == "duckdb":
+            self.duckdb_metrics = DuckDBMetrics(data_path=self.data_path)
+        elif backend != "pandas":
+            raise ValueError(f"Unknown backend: {backend}")
+        self.result_cache = ResultCache(
+            f"{self.experiment_dir}/results/{CACHE_DIR_NAME}",
+            [
+                self.data_path,
+                f"{self.experiment_dir}/{self.experiment_name}_config.json",
+            ],
+            settings=[control_runs],
+            enabled=cache_results,
+        )
+
+    @staticmethod
+    def experiment_paths(
+        experiment_name: str, control_runs: bool = DATA_CONTROL_RUNS
+    ) -> Tuple[str, str]:
+        """Returns the experiment directory and the path of the crawl database of an experiment"""
+        if control_runs:
+            experiment_dir = f"/Volumes/LaCie/OpenOBA/control_runs/{experiment_name}"
+            return experiment_dir, f"{experiment_dir}/crawl-data.sqlite"
+        if DATA_FROM_VOLUME:
+            experiment_dir = f"/Volumes/LaCie/OpenOBA/oba_runs/{experiment_name}"
+            return experiment_dir, f"{experiment_dir}/crawl-data-copy.sqlite"
+        experiment_dir = f"./datadir/{experiment_name}"
+        return experiment_dir, f"{experiment_dir}/crawl-data.sqlite"
 
     def write_results_file_with_data(self, data, file_name, index=False):
         """Write data from a Pandas DataFrame to a file in the specified path."""
@@ -78,6 +126,7 @@ class ExperimentMetrics:
         cur.close()
         return results
 
+    @cached_result
     def get_visits_by_url_summary(self):
         """Retrieve a summary of visits."""
         query = """
@@ -89,6 +138,7 @@ class ExperimentMetrics:
         results = self._execute_query(query)
         return pd.DataFrame(results, columns=["URL", "NumVisits"])
 
+    @cached_result
     def get_ads_by_category_table_all_browsers(self) -> List[Dict]:
         # SQL query to join the tables and get the required fields
         query = """
@@ -141,13 +191,11 @@ class ExperimentMetrics:
         # print(df_grouped)
         # Extract the domain from the ad_url domain and landing_page_url domain
 
-        df_grouped["adurl_domain"] = df_grouped["ad_url"].apply(
-            lambda x: tldextract.extract(x).registered_domain
-        )
+        df_grouped["adurl_domain"] = registered_domains(df_grouped["ad_url"])
 
         # Extract the domain from the landing_page_url domain
-        df_grouped["landingpage_domain"] = df_grouped["landing_page_url"].apply(
-            lambda x: tldextract.extract(x).registered_domain
+        df_grouped["landingpage_domain"] = registered_domains(
+            df_grouped["landing_page_url"]
         )
         # return df_grouped
 
@@ -164,6 +212,7 @@ class ExperimentMetrics:
 
         return df_grouped_filtered
 
+    @cached_result
     def get_ads_by_category_table_all_browsers_old(self) -> List[Dict]:
         """Old way of counting ads by category"""
 
@@ -218,6 +267,7 @@ class ExperimentMetrics:
         # print(df_grouped)
         return df_grouped
 
+    @cached_result
     def get_ads_by_category_grouped_by_artificial_sessions_and_site_url(
         self,
         numvisits_by_browser_id_and_url: List[Tuple[int, str, int]],
@@ -225,42 +275,10 @@ class ExperimentMetrics:
         if not self.conn:
             self.connect()
 
-        # Step 1: Extract the visit data
-        site_visits_query = """
-        SELECT visit_id, browser_id, site_url, site_rank
-        FROM site_visits
-        ORDER BY site_rank;
-        """
-        site_visits_df = pd.read_sql(site_visits_query, self.conn)
-
-        # Step 2: Map the browser_id based on the visit counts
-        # Create a dictionary to store the count of visits
-        browser_visit_counts = {}
-        for browser_id, site_url, num_visits in numvisits_by_browser_id_and_url:
-            if browser_id not in browser_visit_counts:
-                browser_visit_counts[browser_id] = []
-            browser_visit_counts[browser_id] += [site_url] * num_visits
-
-        # Flatten the dictionary to a list of tuples (browser_id, site_url)
-        flattened_visits = [
-            (browser_id, site_url)
-            for browser_id, visits in browser_visit_counts.items()
-            for site_url in visits
-        ]
-
-        # Add the browser_id to the site_visits_df based on the site_url and site_rank
-        site_visits_df["browser_id"] = None
+        # Step 1: Get the browser_id of the visits of the first 6 artificial sessions
+        sessions = session_lookup(self.conn, numvisits_by_browser_id_and_url)
 
-        for (browser_id, site_url), site_rank in zip(
-            flattened_visits, site_visits_df["site_rank"]
-        ):
-            site_visits_df.loc[
-                (site_visits_df["site_url"] == site_url)
-                & (site_visits_df["site_rank"] == site_rank),
-                "browser_id",
-            ] = browser_id
-
-        # Step 3: Join the relevant tables to get the final DataFrame
+        # Step 2: Join the relevant tables to get the final DataFrame
 
         ads_query = """
         SELECT 
@@ -284,10 +302,22 @@ class ExperimentMetrics:
             ads_df.groupby("ad_id")["category_name"].apply(list).reset_index()
         )
 
-        # Change the browser_id column from the database to the browser_id from the visit data
-        ads_df["browser_id"] = ads_df["site_rank"].apply(
-            lambda x: site_visits_df.loc[x - 1, "browser_id"]
-        )
+        # Change the browser_id column from the database to the browser_id of the
+        # session, which leaves out the visits of the other sessions
+        ads_df = ads_df.drop(columns=["browser_id"]).merge(
+            sessions[["visit_id", "browser_id"]], on="visit_id"
+        )[
+            [
+                "ad_id",
+                "ad_url",
+                "landing_page_url",
+                "visit_url",
+                "visit_id",
+                "site_rank",
+                "browser_id",
+                "category_name",
+            ]
+        ]
 
         # Merge the categories back into the ads_df
         final_df = pd.merge(
@@ -297,32 +327,17 @@ class ExperimentMetrics:
             how="left",
         )
 
-        # Closing the connection
-        self.conn.close()
-
         # Rename the category_name column to categories
         final_df.rename(columns={"category_name": "categories"}, inplace=True)
 
-        # Get all the browser_ids from numvisits_by_browser_id_and_url
-        browser_ids = []
-        for browser_id, _, _ in numvisits_by_browser_id_and_url:
-            if browser_id not in browser_ids:
-                browser_ids.append(browser_id)
-        first_6_browser_ids = browser_ids[:6]
-
-        # Filter out the last two browser_ids
-        final_df = final_df[final_df["browser_id"].isin(first_6_browser_ids)]
-
         # print(final_df)
 
         return final_df
 
-    def get_categories_total_and_unique_ads(self, ads_df):
-        # Ensure categories column contains lists of categories
-        ads_df["categories"] = ads_df["categories"].apply(
-            lambda x: x if isinstance(x, list) else []
-        )
-
+    def _get_categories_counts(
+        self, ads_df: pd.DataFrame
+    ) -> Tuple[pd.DataFrame, Dict[str, int]]:
+        """Returns the Category, NumTotalAds and NumUniqueAds of every category and the counts of all the ads"""
         # Flatten the dataframe to have one row per category per ad
         flattened_ads = ads_df.explode("categories")
 
@@ -346,6 +361,53 @@ class ExperimentMetrics:
         # Merge the summaries
         summary_df = pd.merge(total_ads_summary, unique_ads_summary, on="Category")
 
+        # Calculate total number of ads for percentage calculation from all ads before grouping by category
+        # For total all ads, we need to count the sum of unique ad_urls per each combination of visit_id and browser_id
+        total_ads_all = (
+            ads_df.groupby(["visit_id", "browser_id"])["ad_url"].nunique().sum()
+        )
+        unique_ads_all = ads_df["ad_url"].nunique()
+
+        # Calculate the total and unique ads that are not "Style & Fashion" nor "Shopping" at the same time
+        total_ads_not_style_nor_shopping = (
+            ads_df[
+                ads_df["categories"].apply(
+                    lambda x: "Style & Fashion" not in x and "Shopping" not in x
+                )
+            ]
+            .groupby(["visit_id", "browser_id"])["ad_url"]
+            .nunique()
+            .sum()
+        )
+        unique_ads_not_style_nor_shopping = ads_df[
+            ads_df["categories"].apply(
+                lambda x: "Style & Fashion" not in x and "Shopping" not in x
+            )
+        ]["ad_url"].nunique()
+
+        return summary_df, {
+            "total_ads_all": total_ads_all,
+            "unique_ads_all": unique_ads_all,
+            "total_ads_not_style_nor_shopping": total_ads_not_style_nor_shopping,
+            "unique_ads_not_style_nor_shopping": unique_ads_not_style_nor_shopping,
+        }
+
+    def get_categories_total_and_unique_ads(self, ads_df):
+        if isinstance(ads_df, pd.DataFrame):
+            # Ensure categories column contains lists of categories
+            ads_df["categories"] = ads_df["categories"].apply(
+                lambda x: x if isinstance(x, list) else []
+            )
+
+        if self.duckdb_metrics is not None:
+            summary_df, totals = self.duckdb_metrics.categories_counts(ads_df)
+        else:
+            summary_df, totals = self._get_categories_counts(ads_df)
+        total_ads_all = totals["total_ads_all"]
+        unique_ads_all = totals["unique_ads_all"]
+        total_ads_not_style_nor_shopping = totals["total_ads_not_style_nor_shopping"]
+        unique_ads_not_style_nor_shopping = totals["unique_ads_not_style_nor_shopping"]
+
         # Filter out Tier 2 categories:
         # Add a new column with a boolean indicating if the category is tier 1 or not
         tier1_categories = []
@@ -357,13 +419,6 @@ class ExperimentMetrics:
         # Update summary_df
         summary_df = summary_df[summary_df["IsTier1"]]
 
-        # Calculate total number of ads for percentage calculation from all ads before grouping by category
-        # For total all ads, we need to count the sum of unique ad_urls per each combination of visit_id and browser_id
-        total_ads_all = (
-            ads_df.groupby(["visit_id", "browser_id"])["ad_url"].nunique().sum()
-        )
-        unique_ads_all = ads_df["ad_url"].nunique()
-
         # Calculate percentages
         summary_df["PercentageFromAllTotalAds"] = (
             summary_df["NumTotalAds"] / total_ads_all
@@ -391,23 +446,6 @@ class ExperimentMetrics:
             index=[len(summary_df) + 1],
         )
 
-        # Calculate the total and unique ads that are not "Style & Fashion" nor "Shopping" at the same time
-        total_ads_not_style_nor_shopping = (
-            ads_df[
-                ads_df["categories"].apply(
-                    lambda x: "Style & Fashion" not in x and "Shopping" not in x
-                )
-            ]
-            .groupby(["visit_id", "browser_id"])["ad_url"]
-            .nunique()
-            .sum()
-        )
-        unique_ads_not_style_nor_shopping = ads_df[
-            ads_df["categories"].apply(
-                lambda x: "Style & Fashion" not in x and "Shopping" not in x
-            )
-        ]["ad_url"].nunique()
-
         # Add a last row with the total number of ads that are not "Style & Fashion" nor "Shopping" at the same time
         total_row_not_style_nor_shopping = pd.DataFrame(
             {
@@ -509,12 +547,8 @@ class ExperimentMetrics:
             ads_df = ads_df[ads_df["categories"].apply(lambda x: category_filter in x)]
 
         # Extract the domain from the ad_url domain and landing_page_url domain
-        ads_df["adurl_domain"] = ads_df["ad_url"].apply(
-            lambda x: tldextract.extract(x).registered_domain
-        )
-        ads_df["landingpage_domain"] = ads_df["landing_page_url"].apply(
-            lambda x: tldextract.extract(x).registered_domain
-        )
+        ads_df["adurl_domain"] = registered_domains(ads_df["ad_url"])
+        ads_df["landingpage_domain"] = registered_domains(ads_df["landing_page_url"])
 
         # ---OLD APPROACH---
         # Create a new column with the group the domain belongs to
@@ -599,14 +633,10 @@ class ExperimentMetrics:
             ads_df = ads_df[ads_df["categories"].apply(lambda x: category_filter in x)]
 
         # Extract the domain from the ad_url domain and landing_page_url domain
-        ads_df["adurl_domain"] = ads_df["ad_url"].apply(
-            lambda x: tldextract.extract(x).registered_domain
-        )
+        ads_df["adurl_domain"] = registered_domains(ads_df["ad_url"])
 
         # Extract the domain from the landing_page_url domain
-        ads_df["landingpage_domain"] = ads_df["landing_page_url"].apply(
-            lambda x: tldextract.extract(x).registered_domain
-        )
+        ads_df["landingpage_domain"] = registered_domains(ads_df["landing_page_url"])
 
         # group by session and visit and count the number of unique ads
         grouped_ads = (
@@ -647,14 +677,10 @@ class ExperimentMetrics:
             ads_df = ads_df[ads_df["categories"].apply(lambda x: category_filter in x)]
 
         # Extract the domain from the ad_url domain and landing_page_url domain
-        ads_df["adurl_domain"] = ads_df["ad_url"].apply(
-            lambda x: tldextract.extract(x).registered_domain
-        )
+        ads_df["adurl_domain"] = registered_domains(ads_df["ad_url"])
 
         # Extract the domain from the landing_page_url domain
-        ads_df["landingpage_domain"] = ads_df["landing_page_url"].apply(
-            lambda x: tldextract.extract(x).registered_domain
-        )
+        ads_df["landingpage_domain"] = registered_domains(ads_df["landing_page_url"])
 
         # group by session, visit and domain and count the number of unique ads
         grouped_ads = (
@@ -716,14 +742,10 @@ class ExperimentMetrics:
             ads_df = ads_df[ads_df["categories"].apply(lambda x: category_filter in x)]
 
         # Extract the domain from the ad_url domain and landing_page_url domain
-        ads_df["adurl_domain"] = ads_df["ad_url"].apply(
-            lambda x: tldextract.extract(x).registered_domain
-        )
+        ads_df["adurl_domain"] = registered_domains(ads_df["ad_url"])
 
         # Extract the domain from the landing_page_url domain
-        ads_df["landingpage_domain"] = ads_df["landing_page_url"].apply(
-            lambda x: tldextract.extract(x).registered_domain
-        )
+        ads_df["landingpage_domain"] = registered_domains(ads_df["landing_page_url"])
 
         # group by session and visit and count the number of unique ads
         grouped_ads = (
@@ -802,15 +824,15 @@ class ExperimentMetrics:
 
         return grouped_ads_filtered
 
-    def count_ads_by_session_by_group(self, ads_df, category_filter=None):
-        """Then we add a new column with the domain of the ad_url, and with that column we create a new one with the group the domain belongs to. Finally we group by the session and count the number of ads per group."""
+    def _count_ads_by_group(
+        self, ads_df: pd.DataFrame, category_filter: Optional[str] = None
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Returns the number of ads of every group counting an ad once per visit, and the number of unique ads of every group"""
         if category_filter:
             ads_df = ads_df[ads_df["categories"].apply(lambda x: category_filter in x)]
 
         # Extract the domain from the ad_url domain and landing_page_url domain
-        ads_df["adurl_domain"] = ads_df["ad_url"].apply(
-            lambda x: tldextract.extract(x).registered_domain
-        )
+        ads_df["adurl_domain"] = registered_domains(ads_df["ad_url"])
 
         # Create a new column with the group the domain belongs to
         domain_groups = {
@@ -843,15 +865,28 @@ class ExperimentMetrics:
             grouped_ads_total.groupby("group")["NumAds"].sum().reset_index()
         )
 
+        # Now do the same but for unique ads among all sessions and visits
+        grouped_ads_unique = ads_df.groupby(["group"])["ad_url"].nunique().reset_index()
+
+        return grouped_ads_total, grouped_ads_unique
+
+    def count_ads_by_session_by_group(self, ads_df, category_filter=None):
+        """Then we add a new column with the domain of the ad_url, and with that column we create a new one with the group the domain belongs to. Finally we group by the session and count the number of ads per group."""
+        if self.duckdb_metrics is not None:
+            grouped_ads_total, grouped_ads_unique = self.duckdb_metrics.group_counts(
+                ads_df, category_filter
+            )
+        else:
+            grouped_ads_total, grouped_ads_unique = self._count_ads_by_group(
+                ads_df, category_filter
+            )
+
         # Now generate an 1x6 DataFrames with the columns being each group
         # And the values being the total number of ads in that group
         result_df_total = grouped_ads_total.set_index("group").T
 
         # print(result_df_total)
 
-        # Now do the same but for unique ads among all sessions and visits
-        grouped_ads_unique = ads_df.groupby(["group"])["ad_url"].nunique().reset_index()
-
         # Now generate an 1x6 DataFrames with the columns being each group
         # And the values being the total number of unique ads in that group
         result_df_unique = grouped_ads_unique.set_index("group").T
@@ -873,93 +908,23 @@ class ExperimentMetrics:
         self,
         numvisits_by_browser_id_and_url: List[Tuple[int, str, int]],
     ) -> List[Dict]:
-
-        def fetch_ads_by_limits_and_site_url(
-            cursor,
-            site_url: str,
-            num_visits: int,
-            already_taken: int,
-        ):
-
-            query = """
-                WITH RankedVisits AS (
-                    SELECT
-                        sv.visit_id,
-                        sv.site_rank,
-                        ROW_NUMBER() OVER (PARTITION BY sv.site_url ORDER BY sv.site_rank) AS visit_order
-                    FROM site_visits sv
-                    WHERE sv.site_url = :site_url
-                ),
-                SelectedVisits AS (
-                    SELECT visit_id
-                    FROM RankedVisits
-                    WHERE visit_order > :already_taken AND visit_order <= :already_taken + :num_visits
-                )
-                SELECT va.ad_url
-                FROM visit_advertisements va
-                JOIN SelectedVisits ON va.visit_id = SelectedVisits.visit_id
-                WHERE va.categorized = TRUE AND va.non_ad IS NULL AND va.unspecific_ad IS NULL
-                """
-            # WHERE va.non_ad IS NULL AND va.unspecific_ad IS NULL;
-
-            data = {
-                "site_url": site_url,
-                "num_visits": num_visits,
-                "already_taken": already_taken,
-            }
-
-            cursor.execute(query, data)
-
-            result = cursor.fetchall()
-            return result
-
+        """Writes the number of ads and unique ads of every ad domain, and of every domain group, in the visits of the first 6 artificial sessions"""
         if not self.conn:
             self.connect()
-        cursor = self.conn.cursor()
-
-        # Initialize the sessions list and the set of seen browser_ids
-        site_visits_count = {
-            site_url: 0 for _, site_url, _ in numvisits_by_browser_id_and_url
-        }
-
-        session_number = 0  # Initialize the session number
-        seen_browser_ids = set()
-
-        df = pd.DataFrame(columns=["AdURL", "Domain", "Session"])
-        for browser_id, site_url, num_visits in numvisits_by_browser_id_and_url:
-            if browser_id not in seen_browser_ids:
-                # Move to the next session
-                session_number += 1
-
-                # Add the session to seen sessions
-                seen_browser_ids.add(browser_id)
-
-            if session_number == 7:
-                # We only want to analyze until session 6
-                break
-
-                # Fetch the ads from num_visits visits to the current site_url, starting from the first visit after the already taken visit
-            query_result = fetch_ads_by_limits_and_site_url(
-                cursor,
-                site_url,
-                num_visits,
-                site_visits_count[site_url],
-            )
 
-            for ad_url_result in query_result:
-                ad_url = ad_url_result[0]
-                domain = tldextract.extract(ad_url).registered_domain
+        # Take the ads of the visits of the first 6 sessions
+        sessions = session_lookup(self.conn, numvisits_by_browser_id_and_url)
+        ads_df = pd.read_sql_query(
+            ArtificialSessionsQueries.SelectCategorizedAdsQuery, self.conn
+        ).merge(sessions[["visit_id", "session"]], on="visit_id")
 
-                # Append the row to the DataFrame
-                row = pd.DataFrame(
-                    [{"AdURL": ad_url, "Domain": domain, "Session": session_number}]
-                )
-                df = pd.concat([df, row])
-
-            # Update the number of visits taken from the site_url
-            site_visits_count[site_url] += num_visits
-
-        cursor.close()
+        df = pd.DataFrame(
+            {
+                "AdURL": ads_df["ad_url"],
+                "Domain": registered_domains(ads_df["ad_url"]),
+                "Session": ads_df["session"],
+            }
+        )
 
         # Group by 'Domain' and aggregate
         domain_summary = (
@@ -995,22 +960,19 @@ class ExperimentMetrics:
         }
 
         # Create a new dataframe with the domain groups
-        df_domain_groups = pd.DataFrame(columns=["Group", "TotalAds", "TotalUniqueAds"])
-
+        group_rows = []
         for group, domains in domain_groups.items():
             df_group = domain_summary[domain_summary["Domain"].isin(domains)]
-            total_ads = df_group["Total_AdURLs"].sum()
-            total_unique_ads = df_group["Unique_AdURLs"].sum()
-            row = pd.DataFrame(
-                [
-                    {
-                        "Group": group,
-                        "TotalAds": total_ads,
-                        "TotalUniqueAds": total_unique_ads,
-                    }
-                ]
+            group_rows.append(
+                {
+                    "Group": group,
+                    "TotalAds": df_group["Total_AdURLs"].sum(),
+                    "TotalUniqueAds": df_group["Unique_AdURLs"].sum(),
+                }
             )
-            df_domain_groups = pd.concat([df_domain_groups, row])
+        df_domain_groups = pd.DataFrame(
+            group_rows, columns=["Group", "TotalAds", "TotalUniqueAds"]
+        )
 
         # Write the results to a markdown table file
         df_domain_groups.to_markdown(
@@ -1062,42 +1024,10 @@ class ExperimentMetrics:
             oba_browsers = self.oba_browsers[:6]
 
         else:
-            # Step 1: Extract the visit data
-            site_visits_query = """
-            SELECT visit_id, browser_id, site_url, site_rank
-            FROM site_visits
-            ORDER BY site_rank;
-            """
-            site_visits_df = pd.read_sql(site_visits_query, self.conn)
-
-            # Step 2: Map the browser_id based on the visit counts
-            # Create a dictionary to store the count of visits
-            browser_visit_counts = {}
-            for browser_id, site_url, num_visits in numvisits_by_browser_id_and_url:
-                if browser_id not in browser_visit_counts:
-                    browser_visit_counts[browser_id] = []
-                browser_visit_counts[browser_id] += [site_url] * num_visits
-
-            # Flatten the dictionary to a list of tuples (browser_id, site_url)
-            flattened_visits = [
-                (browser_id, site_url)
-                for browser_id, visits in browser_visit_counts.items()
-                for site_url in visits
-            ]
+            # Step 1: Get the browser_id of the visits of the first 6 artificial sessions
+            sessions = session_lookup(self.conn, numvisits_by_browser_id_and_url)
 
-            # Add the browser_id to the site_visits_df based on the site_url and site_rank
-            site_visits_df["browser_id"] = None
-
-            for (browser_id, site_url), site_rank in zip(
-                flattened_visits, site_visits_df["site_rank"]
-            ):
-                site_visits_df.loc[
-                    (site_visits_df["site_url"] == site_url)
-                    & (site_visits_df["site_rank"] == site_rank),
-                    "browser_id",
-                ] = browser_id
-
-            # Step 3: Join the relevant tables to get the final DataFrame
+            # Step 2: Join the relevant tables to get the final DataFrame
 
             ads_query = """
             SELECT 
@@ -1119,17 +1049,13 @@ class ExperimentMetrics:
             """
             ads_df = pd.read_sql(ads_query, self.conn)
 
-            # Get the first 6 browser_ids as the OBA browsers from numvisits_by_browser_id_and_url
-            oba_browsers = []
-            for browser_id, _, _ in numvisits_by_browser_id_and_url:
-                if browser_id not in oba_browsers:
-                    oba_browsers.append(browser_id)
-            oba_browsers = oba_browsers[:6]
+            # Change the browser_id column from the database to the browser_id of the session
+            ads_df["browser_id"] = ads_df[["visit_id"]].merge(
+                sessions[["visit_id", "browser_id"]], on="visit_id", how="left"
+            )["browser_id"]
 
-            # Change the browser_id column from the database to the browser_id from the visit data
-            ads_df["browser_id"] = ads_df["site_rank"].apply(
-                lambda x: site_visits_df.loc[x - 1, "browser_id"]
-            )
+            # The OBA browsers are the browsers of the sessions
+            oba_browsers = sessions["browser_id"].unique().tolist()
 
         # Only consider the first 6 browser_ids
         ads_df = ads_df[ads_df["browser_id"].isin(oba_browsers[:6])]
@@ -1230,6 +1156,7 @@ class ExperimentMetrics:
 
     #     return df
 
+    @cached_result
     def get_control_visits_by_url_and_browser(self, as_dict=False):
         """Retrieve a summary of visits."""
         query = """
@@ -1263,6 +1190,7 @@ class ExperimentMetrics:
 
         # return pd.DataFrame(results, columns=["browser_id", "URL", "NumVisits"])
 
+    @cached_result
     def get_control_visits_by_browser(self, as_dict=False):
         """Retrieve a summary of visits."""
         query = """
@@ -1283,6 +1211,7 @@ class ExperimentMetrics:
         else:
             return pd.DataFrame(results, columns=["browser_id", "NumVisits"])
 
+    @cached_result
     def get_ads_summary(self):
         """Retrieve a summary of advertisements."""
         query = """
@@ -1295,6 +1224,7 @@ class ExperimentMetrics:
         results = self._execute_query(query)
         return pd.DataFrame(results, columns=["Visit URL", "NumAds"])
 
+    @cached_result
     def get_landing_pages_summary(self):
         """Retrieve a summary of landing pages and their categorization status."""
         query = """
@@ -1305,6 +1235,7 @@ class ExperimentMetrics:
         results = self._execute_query(query)
         return pd.DataFrame(results, columns=["Categorized", "NumLandingPages"])
 
+    @cached_result
     def get_category_distribution(self):
         """Retrieve the distribution of landing page categories."""
         query = """
@@ -1782,6 +1713,8 @@ class ExperimentMetrics:
     def close(self):
         """Close the database connection."""
         self.conn.close()
+        if self.duckdb_metrics is not None:
+            self.duckdb_metrics.close()
 
     # def get_ads_by_category_table_all_browsers(self) -> List[Dict]:
     #     """Fetch the number of ads per category for all browsers"""
@@ -0,0 +1,213 @@
+"""
+Resolves ad URLs to their landing pages with a pool of browsers.
+
+Each worker thread owns one browser and takes ad URLs from a shared work queue,
+so a slow redirect chain only holds up its own worker. Results are handed back
+to the calling thread as soon as they are resolved, so they can be persisted
+one by one with a single database connection.
+"""
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_NUM_WORKERS = 4
+
+
+def wait_for_url_stabilization(
+    driver: Any,
+    check_interval: float = 1,
+    stable_period: float = 5,
+    max_duration: float = 30,
+) -> str:
+    """Returns the URL of the driver once it hasn't changed for `stable_period` seconds"""
+    start_time = time.time()
+    last_url = driver.current_url
+    stable_since = start_time
+
+    while time.time() - start_time < max_duration:
+        time.sleep(check_interval)
+        current_url = driver.current_url
+        if current_url != last_url:
+            last_url = current_url
+            stable_since = time.time()
+        elif time.time() - stable_since >= stable_period:
+            # URL has been stable for the specified period; assume it's the final URL
+            return current_url
+
+    # Return the current URL if max_duration is reached without stabilization
+    return driver.current_url
+
+
+@dataclass
+class WorkerStats:
+    worker_id: int
+    resolved: int = 0
+    failed: int = 0
+    busy_seconds: float = 0.0
+    restarts: int = 0
+
+    @property
+    def ads_per_minute(self) -> float:
+        if not self.busy_seconds:
+            return 0.0
+        return 60 * (self.resolved + self.failed) / self.busy_seconds
+
+
+class LandingPageResolverPool:
+    """
+    Pool of `num_workers` browsers created with `driver_factory`.
+    The browsers are started lazily on the first `resolve` call and kept
+    until `close` is called.
+    """
+
+    def __init__(
+        self,
+        driver_factory: Callable[[], Any],
+        num_workers: int = DEFAULT_NUM_WORKERS,
+        check_interval: float = 1,
+        stable_period: float = 5,
+        max_duration: float = 30,
+    ) -> None:
+        if num_workers < 1:
+            raise ValueError("num_workers must be at least 1")
+        self.driver_factory = driver_factory
+        self.num_workers = num_workers
+        self.stabilization_kwargs = {
+            "check_interval": check_interval,
+            "stable_period": stable_period,
+            "max_duration": max_duration,
+        }
+        self._drivers: List[Optional[Any]] = [None] * num_workers
+        self.stats = [WorkerStats(worker_id) for worker_id in range(num_workers)]
+
+    def resolve(self, ad_urls: Iterable[str]) -> Iterator[Tuple[str, str]]:
+        """
+        Resolves the distinct `ad_urls` concurrently.
+
+        :return: An iterator of (ad_url, landing_page_url), in completion order.
+            If the iteration is stopped early, the workers finish the URL they
+            are resolving and don't take any new one.
+        """
+        unique_ad_urls = list(dict.fromkeys(ad_urls))
+        if not unique_ad_urls:
+            return
+        work: "queue.Queue[str]" = queue.Queue()
+        for ad_url in unique_ad_urls:
+            work.put(ad_url)
+        results: "queue.Queue[Tuple[str, str]]" = queue.Queue()
+        stop = threading.Event()
+
+        threads = [
+            threading.Thread(
+                target=self._work,
+                args=(worker_id, work, results, stop),
+                name=f"LandingPageResolver-{worker_id}",
+                daemon=True,
+            )
+            for worker_id in range(min(self.num_workers, len(unique_ad_urls)))
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            pending = len(unique_ad_urls)
+            while pending:
+                try:
+                    result = results.get(timeout=1)
+                except queue.Empty:
+                    if not any(thread.is_alive() for thread in threads):
+                        raise RuntimeError(
+                            f"All landing page resolver workers stopped "
+                            f"with {pending} ad urls left to resolve"
+                        )
+                    continue
+                pending -= 1
+                yield result
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+    def _work(
+        self,
+        worker_id: int,
+        work: "queue.Queue[str]",
+        results: "queue.Queue[Tuple[str, str]]",
+        stop: threading.Event,
+    ) -> None:
+        stats = self.stats[worker_id]
+        while not stop.is_set():
+            try:
+                ad_url = work.get_nowait()
+            except queue.Empty:
+                return
+            start_time = time.time()
+            try:
+                driver = self._get_driver(worker_id)
+            except Exception:
+                logger.exception("Worker %d couldn't start its browser", worker_id)
+                # Leave the URL to the other workers
+                work.put(ad_url)
+                return
+            landing_page_url = self._resolve(worker_id, driver, ad_url)
+            stats.busy_seconds += time.time() - start_time
+            if landing_page_url == ad_url:
+                stats.failed += 1
+            else:
+                stats.resolved += 1
+            results.put((ad_url, landing_page_url))
+
+    def _resolve(self, worker_id: int, driver: Any, ad_url: str) -> str:
+        try:
+            driver.get(ad_url)
+            return wait_for_url_stabilization(driver, **self.stabilization_kwargs)
+        except TimeoutException:
+            print(f"Page load timed out for URL: {ad_url}. Skipping...")
+        except WebDriverException as e:
+            # The browser may have crashed, start a new one for the next URL
+            print(f"An error occurred while loading the page: {e}")
+            self._quit_driver(worker_id)
+            self.stats[worker_id].restarts += 1
+        except Exception as e:
+            print(f"An error occurred while loading the page: {e}")
+        print("---------Default returning same ad_url...---------")
+        return ad_url
+
+    def _get_driver(self, worker_id: int) -> Any:
+        if self._drivers[worker_id] is None:
+            self._drivers[worker_id] = self.driver_factory()
+        return self._drivers[worker_id]
+
+    def _quit_driver(self, worker_id: int) -> None:
+        driver, self._drivers[worker_id] = self._drivers[worker_id], None
+        if driver is None:
+            return
+        try:
+            driver.quit()
+        except Exception:
+            logger.exception("Error while closing the browser of worker %d", worker_id)
+
+    def throughput(self) -> Dict[int, float]:
+        """Ads processed per minute of work by each worker"""
+        return {stats.worker_id: stats.ads_per_minute for stats in self.stats}
+
+    def print_stats(self) -> None:
+        for stats in self.stats:
+            if not stats.resolved and not stats.failed:
+                continue
+            print(
+                f"[RESOLVER WORKER {stats.worker_id}] {stats.resolved} resolved, "
+                f"{stats.failed} unresolved, {stats.restarts} browser restarts, "
+                f"{stats.ads_per_minute:.1f} ads/min"
+            )
+
+    def close(self) -> None:
+        for worker_id in range(self.num_workers):
+            self._quit_driver(worker_id)
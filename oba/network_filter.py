@@ -0,0 +1,444 @@
+"""
+Token-indexed network filter engine for the Adblock Plus filter lists.
+
+Replaces `adblockparser.AdblockRules` in the third-party analysis scripts. The
+lists are parsed once and every filter is stored in a single bucket, keyed by
+the rarest token that any URL it matches must contain (a token is a run of
+`[a-z0-9%]` delimited on both sides, as in uBlock Origin and Brave). A URL is
+only evaluated against the filters of the buckets of its own tokens, plus the
+few filters without a usable token (regex filters, `*`-only patterns), so the
+cost per URL doesn't grow with the size of the lists.
+
+Verdicts follow `AdblockRules.should_block` with the same options:
+- exceptions (`@@`) win over blocking filters,
+- a filter with options is only evaluated when all its options are given, so
+  `should_block(url, third_party=True)` evaluates the filters without options
+  and the `$third-party`/`$~third-party` ones, and `domain` enables the
+  `$domain=` filters,
+- filters with options adblockparser doesn't support are dropped.
+Differences with adblockparser:
+- filters with options are case insensitive unless they have `$match-case`,
+  adblockparser only ignores the case of the filters without options,
+- a `|` in the middle of a pattern is a literal `|`,
+- hosts file lines (`0.0.0.0 domain`, `127.0.0.1 domain`) are read as
+  `||domain^`, adblockparser turns them into patterns that never match.
+
+Usage:
+    engine = NetworkFilterEngine({"easylist": easylist_lines, ...})
+    engine.should_block(url, third_party=True)  # {"easylist": True, ...}
+"""
+
+import hashlib
+import re
+from collections import Counter
+from pathlib import Path
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
+
+RESOURCES_DIR = Path(__file__).parent / "resources"
+
+BINARY_OPTIONS = frozenset(
+    {
+        "script",
+        "image",
+        "stylesheet",
+        "object",
+        "xmlhttprequest",
+        "object-subrequest",
+        "subdocument",
+        "document",
+        "elemhide",
+        "other",
+        "background",
+        "xbl",
+        "ping",
+        "dtd",
+        "media",
+        "third-party",
+        "match-case",
+        "collapse",
+        "donottrack",
+        "websocket",
+    }
+)
+SUPPORTED_OPTIONS = BINARY_OPTIONS | {"domain"}
+MATCHED_OPTIONS = frozenset({"third-party", "domain"})
+# Options are split on the commas followed by a known option, like adblockparser
+OPTIONS_SPLIT_RE = re.compile(
+    ",(?=~?(?:%s))"
+    % "|".join(re.escape(option) for option in sorted(SUPPORTED_OPTIONS))
+)
+HOSTS_LINE_RE = re.compile(r"^(?:0\.0\.0\.0|127\.0\.0\.1)\s+([^\s#]+)")
+TOKEN_RE = re.compile(r"[a-z0-9%]+")
+SEPARATOR_REGEX = r"(?:[^\w\d_\-.%]|$)"
+DOMAIN_ANCHOR_REGEX = r"^(?:[^:/?#]+:)?(?://(?:[^/?#]*\.)?)?"
+# Tokens present in most URLs, only used when a filter has no other token
+BAD_TOKENS = frozenset(
+    {"http", "https", "www", "com", "net", "org", "js", "html", "php", "img", "cdn"}
+)
+
+
+def tokenize(url: str) -> Set[str]:
+    """Tokens of a lowercased URL"""
+    return set(TOKEN_RE.findall(url))
+
+
+def _domain_variants(domain: str) -> List[str]:
+    parts = domain.split(".")
+    if len(parts) == 1:
+        return parts
+    return [".".join(parts[-i:]) for i in range(len(parts), 1, -1)]
+
+
+def _pattern_to_regex(pattern: str) -> str:
+    """Regular expression of a filter pattern, as built by adblockparser"""
+    if pattern.startswith("/") and pattern.endswith("/") and len(pattern) > 1:
+        return pattern[1:-1]
+    regex = ""
+    if pattern.startswith("||"):
+        regex = DOMAIN_ANCHOR_REGEX
+        pattern = pattern[2:]
+    elif pattern.startswith("|"):
+        regex = "^"
+        pattern = pattern[1:]
+    end_anchor = pattern.endswith("|")
+    if end_anchor:
+        pattern = pattern[:-1]
+    for char in pattern:
+        if char == "*":
+            regex += ".*"
+        elif char == "^":
+            regex += SEPARATOR_REGEX
+        else:
+            regex += re.escape(char)
+    return regex + ("$" if end_anchor else "")
+
+
+class NetworkFilter:
+    """A parsed URL filter of a filter list"""
+
+    __slots__ = (
+        "raw",
+        "pattern",
+        "is_exception",
+        "options",
+        "option_keys",
+        "match_case",
+        "plain",
+        "_regex",
+    )
+
+    def __init__(
+        self,
+        raw: str,
+        pattern: str,
+        is_exception: bool,
+        options: Dict[str, Union[bool, Dict[str, bool]]],
+    ) -> None:
+        self.raw = raw
+        self.pattern = pattern
+        self.is_exception = is_exception
+        self.options = options
+        self.option_keys = frozenset(options) - {"match-case"}
+        self.match_case = bool(options.get("match-case"))
+        # Patterns without special characters are matched as substrings
+        self.plain: Optional[str] = None
+        if not any(char in pattern for char in "*^|") and not self.is_regex:
+            self.plain = pattern if self.match_case else pattern.lower()
+        self._regex: Optional[re.Pattern] = None
+
+    def __repr__(self) -> str:
+        return f"NetworkFilter({self.raw!r})"
+
+    @property
+    def is_regex(self) -> bool:
+        return len(self.pattern) > 1 and self.pattern[0] == self.pattern[-1] == "/"
+
+    @property
+    def regex(self) -> re.Pattern:
+        if self._regex is None:
+            self._regex = re.compile(
+                _pattern_to_regex(self.pattern),
+                0 if self.match_case else re.IGNORECASE,
+            )
+        return self._regex
+
+    def tokens(self) -> List[str]:
+        """
+        Tokens that every URL matched by the filter contains: the runs of
+        token characters of the pattern that can't be extended by a wildcard
+        or by the unanchored start or end of the pattern.
+        """
+        if self.is_regex:
+            return []
+        pattern = self.pattern.lower()
+        left_anchored = pattern.startswith("|")
+        pattern = pattern.lstrip("|")
+        right_anchored = pattern.endswith("|")
+        pattern = pattern.rstrip("|")
+        tokens = []
+        for match in TOKEN_RE.finditer(pattern):
+            start, end = match.span()
+            before = pattern[start - 1] if start > 0 else ("" if left_anchored else "*")
+            after = (
+                pattern[end] if end < len(pattern) else ("" if right_anchored else "*")
+            )
+            if before != "*" and after != "*":
+                tokens.append(match.group())
+        return tokens
+
+    def options_match(
+        self,
+        given_options: FrozenSet[str],
+        third_party: Optional[bool],
+        domain: Optional[str],
+    ) -> bool:
+        if not self.option_keys <= given_options:
+            return False
+        if "third-party" in self.option_keys and (
+            self.options["third-party"] != third_party
+        ):
+            return False
+        if "domain" in self.option_keys:
+            # The domain is given, as the option is in the given options
+            domains = cast(Dict[str, bool], self.options["domain"])
+            for variant in _domain_variants(cast(str, domain)):
+                if variant in domains:
+                    return domains[variant]
+            return not any(domains.values())
+        return True
+
+    def url_match(self, url: str, url_lower: str) -> bool:
+        if self.plain is not None:
+            return self.plain in (url if self.match_case else url_lower)
+        return self.regex.search(url) is not None
+
+
+def _parse_option(text: str) -> Tuple[str, Union[bool, Dict[str, bool]]]:
+    if text.startswith("domain="):
+        domains = text[len("domain=") :].replace(",", "|").split("|")
+        return "domain", {
+            domain.lstrip("~"): not domain.startswith("~") for domain in domains
+        }
+    return text.lstrip("~"), not text.startswith("~")
+
+
+def parse_filter(line: str) -> Optional[NetworkFilter]:
+    """
+    Parses a line of a filter list or of a hosts file. Returns None for
+    comments, element hiding rules and filters with unsupported options.
+    """
+    line = line.strip()
+    if not line or line.startswith(("!", "[Adblock", "#")):
+        return None
+    if "##" in line or "#@#" in line:
+        return None
+    hosts_match = HOSTS_LINE_RE.match(line)
+    if hosts_match:
+        return NetworkFilter(line, f"||{hosts_match.group(1)}^", False, {})
+
+    text = line
+    is_exception = text.startswith("@@")
+    if is_exception:
+        text = text[2:]
+    options: Dict[str, Union[bool, Dict[str, bool]]] = {}
+    if "$" in text:
+        text, options_text = text.split("$", 1)
+        options = dict(
+            _parse_option(option) for option in OPTIONS_SPLIT_RE.split(options_text)
+        )
+        if not set(options) <= SUPPORTED_OPTIONS:
+            return None
+    if not text and not options:
+        return None
+    return NetworkFilter(line, text, is_exception, options)
+
+
+class _TokenIndex:
+    """Filters bucketed by token, plus the filters without a usable token"""
+
+    def __init__(self) -> None:
+        self.buckets: Dict[str, List[NetworkFilter]] = {}
+        self.untokenized: List[NetworkFilter] = []
+
+    def __len__(self) -> int:
+        return len(self.untokenized) + sum(map(len, self.buckets.values()))
+
+    def add(self, network_filter: NetworkFilter, token: Optional[str]) -> None:
+        if token is None:
+            self.untokenized.append(network_filter)
+        else:
+            self.buckets.setdefault(token, []).append(network_filter)
+
+    def match(
+        self,
+        url: str,
+        url_lower: str,
+        tokens: Set[str],
+        given_options: FrozenSet[str],
+        third_party: Optional[bool],
+        domain: Optional[str],
+    ) -> Optional[NetworkFilter]:
+        """Returns the first filter matching the URL, or None"""
+        for token in tokens:
+            for network_filter in self.buckets.get(token, ()):
+                if network_filter.options_match(
+                    given_options, third_party, domain
+                ) and network_filter.url_match(url, url_lower):
+                    return network_filter
+        for network_filter in self.untokenized:
+            if network_filter.options_match(
+                given_options, third_party, domain
+            ) and network_filter.url_match(url, url_lower):
+                return network_filter
+        return None
+
+
+class FilterList:
+    """
+    :param name: Name of the list, used as key of the verdicts.
+    :param lines: Lines of the filter list or hosts file.
+    """
+
+    def __init__(self, name: str, lines: Iterable[str]) -> None:
+        self.name = name
+        self.blocking = _TokenIndex()
+        self.exceptions = _TokenIndex()
+
+        # The filters with other options can't match through `should_block`
+        filters = [
+            network_filter
+            for network_filter in map(parse_filter, lines)
+            if network_filter is not None
+            and network_filter.option_keys <= MATCHED_OPTIONS
+        ]
+        self.digest = hashlib.sha256(
+            "\n".join(network_filter.raw for network_filter in filters).encode()
+        ).hexdigest()
+        filter_tokens = [network_filter.tokens() for network_filter in filters]
+        token_counts = Counter(token for tokens in filter_tokens for token in tokens)
+        for network_filter, tokens in zip(filters, filter_tokens):
+            index = self.exceptions if network_filter.is_exception else self.blocking
+            index.add(network_filter, self._best_token(tokens, token_counts))
+
+    @staticmethod
+    def _best_token(tokens: List[str], token_counts: Counter) -> Optional[str]:
+        if not tokens:
+            return None
+        return min(
+            tokens,
+            key=lambda token: (token in BAD_TOKENS, token_counts[token], -len(token)),
+        )
+
+    def __len__(self) -> int:
+        return len(self.blocking) + len(self.exceptions)
+
+    def match(
+        self,
+        url: str,
+        url_lower: str,
+        tokens: Set[str],
+        given_options: FrozenSet[str],
+        third_party: Optional[bool] = None,
+        domain: Optional[str] = None,
+    ) -> Tuple[bool, Optional[NetworkFilter]]:
+        """Returns the verdict and the filter that decided it"""
+        args = (url, url_lower, tokens, given_options, third_party, domain)
+        blocking_filter = self.blocking.match(*args)
+        if blocking_filter is None:
+            return False, None
+        exception_filter = self.exceptions.match(*args)
+        if exception_filter is not None:
+            return False, exception_filter
+        return True, blocking_filter
+
+
+class NetworkFilterEngine:
+    """
+    :param lists: Lines of every filter list, by list name.
+    """
+
+    def __init__(self, lists: Mapping[str, Iterable[str]]) -> None:
+        self.lists = [FilterList(name, lines) for name, lines in lists.items()]
+
+    @property
+    def digest(self) -> str:
+        """Digest of the filters of every list, changes when a list is updated"""
+        return hashlib.sha256(
+            "\n".join(
+                f"{filter_list.name}:{filter_list.digest}" for filter_list in self.lists
+            ).encode()
+        ).hexdigest()
+
+    @classmethod
+    def from_files(cls, paths: Mapping[str, Union[str, Path]]) -> "NetworkFilterEngine":
+        lists = {}
+        for name, path in paths.items():
+            with open(path, encoding="utf-8") as f:
+                lists[name] = f.read().splitlines()
+        return cls(lists)
+
+    @property
+    def list_names(self) -> List[str]:
+        return [filter_list.name for filter_list in self.lists]
+
+    def _given_options(
+        self, third_party: Optional[bool], domain: Optional[str]
+    ) -> FrozenSet[str]:
+        given_options = set()
+        if third_party is not None:
+            given_options.add("third-party")
+        if domain is not None:
+            given_options.add("domain")
+        return frozenset(given_options)
+
+    def should_block(
+        self,
+        url: str,
+        third_party: Optional[bool] = None,
+        domain: Optional[str] = None,
+    ) -> Dict[str, bool]:
+        """
+        Verdict of every list for the URL.
+
+        :param third_party: Whether the request is third-party, None to skip
+            the filters with a `$third-party` option.
+        :param domain: Domain of the page that made the request, None to skip
+            the filters with a `$domain` option.
+        """
+        url_lower = url.lower()
+        tokens = tokenize(url_lower)
+        given_options = self._given_options(third_party, domain)
+        return {
+            filter_list.name: filter_list.match(
+                url, url_lower, tokens, given_options, third_party, domain
+            )[0]
+            for filter_list in self.lists
+        }
+
+    def matching_filters(
+        self,
+        url: str,
+        third_party: Optional[bool] = None,
+        domain: Optional[str] = None,
+    ) -> Dict[str, Optional[NetworkFilter]]:
+        """Filter that decided the verdict of every list, to debug verdicts"""
+        url_lower = url.lower()
+        tokens = tokenize(url_lower)
+        given_options = self._given_options(third_party, domain)
+        return {
+            filter_list.name: filter_list.match(
+                url, url_lower, tokens, given_options, third_party, domain
+            )[1]
+            for filter_list in self.lists
+        }
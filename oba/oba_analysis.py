@@ -10,6 +10,9 @@ import sqlite3
 from typing import List, Dict, Literal, Tuple
 import matplotlib.pyplot as plt
 
+from oba.artificial_sessions import MAX_SESSIONS, session_lookup
+from oba.result_cache import CACHE_DIR_NAME, ResultCache, cached_result
+
 DATA_FROM_VOLUME = False
 DATA_CONTROL_RUNS = False
 RESULTS_DIR = "/Volumes/LaCie/OpenOBA/RESULTS"
@@ -21,27 +24,19 @@ class OBAAnalysis:
         experiment_name: str,
         experiment_category: str,
         control_runs=DATA_CONTROL_RUNS,
+        cache_results=True,
     ):
-        """Initialize the analyzer with the path to the SQLite database."""
+        """Initialize the analyzer with the path to the SQLite database.
+
+        The ads by session are cached in the results directory of the
+        experiment (see oba.result_cache), cache_results=False bypasses it.
+        """
         self.experiment_name = experiment_name
         # self.data_path = f"../datadir/{experiment_name}/crawl-data.sqlite"
         self.control_runs = control_runs
-        if DATA_FROM_VOLUME:
-            # self.experiment_data_dir = (
-            #     f"/Volumes/FOBAM_data/8_days/datadir/{self.experiment_name}"
-            # )
-            self.experiment_data_dir = (
-                f"/Volumes/LaCie/OpenOBA/oba_runs/{self.experiment_name}"
-            )
-            self.db_path = f"{self.experiment_data_dir}/crawl-data-copy.sqlite"
-        else:
-            self.experiment_data_dir = f"datadir/{self.experiment_name}"
-            self.db_path = f"{self.experiment_data_dir}/crawl-data.sqlite"
-        if control_runs:
-            self.experiment_data_dir = (
-                f"/Volumes/LaCie/OpenOBA/control_runs/{self.experiment_name}"
-            )
-            self.db_path = f"{self.experiment_data_dir}/crawl-data.sqlite"
+        self.experiment_data_dir, self.db_path = self.experiment_paths(
+            experiment_name, control_runs
+        )
 
         print(f"Using data from {self.db_path}")
 
@@ -58,6 +53,32 @@ class OBAAnalysis:
         )
         self.experiment_category = experiment_category
         self.conn = None
+        self.result_cache = ResultCache(
+            f"{self.results_dir}/{CACHE_DIR_NAME}",
+            [
+                self.db_path,
+                f"{self.experiment_data_dir}/{self.experiment_name}_config.json",
+            ],
+            settings=[control_runs, experiment_category],
+            enabled=cache_results,
+        )
+
+    @staticmethod
+    def experiment_paths(
+        experiment_name: str, control_runs: bool = DATA_CONTROL_RUNS
+    ) -> Tuple[str, str]:
+        """Returns the experiment data directory and the path of the crawl database of an experiment"""
+        if control_runs:
+            experiment_data_dir = (
+                f"/Volumes/LaCie/OpenOBA/control_runs/{experiment_name}"
+            )
+            return experiment_data_dir, f"{experiment_data_dir}/crawl-data.sqlite"
+        if DATA_FROM_VOLUME:
+            # experiment_data_dir = f"/Volumes/FOBAM_data/8_days/datadir/{experiment_name}"
+            experiment_data_dir = f"/Volumes/LaCie/OpenOBA/oba_runs/{experiment_name}"
+            return experiment_data_dir, f"{experiment_data_dir}/crawl-data-copy.sqlite"
+        experiment_data_dir = f"datadir/{experiment_name}"
+        return experiment_data_dir, f"{experiment_data_dir}/crawl-data.sqlite"
 
     def connect(self):
         """Establish a connection to the SQLite database."""
@@ -116,6 +137,7 @@ class OBAAnalysis:
         cursor.close()
         return ads
 
+    @cached_result
     def fetch_all_ads_by_browser_id_as_dict(self, category: str = None) -> List[Dict]:
         """Given a specific brower_id (i.e. session). From all the categorized advertisements, return the number of distinct ad_urls and the number of ad_urls whose landing page was categorized with the given category."""
         if category is None:
@@ -181,6 +203,7 @@ class OBAAnalysis:
         cursor.close()
         return sorted_result
 
+    @cached_result
     def fetch_all_ads_grouped_by_artificial_sessions_and_site_url(
         self,
         numvisits_by_browser_id_and_url: List[Tuple[int, str, int]],
@@ -188,115 +211,57 @@ class OBAAnalysis:
         """Given a list of tuples where the first element is the browser_id, the second is the site_url and the third is the number of visits, return the number of distinct ad_urls and the number of distinct ad_urls whose landing page was categorized with the given category for each session."""
         if not self.conn:
             self.connect()
-        cursor = self.conn.cursor()
-
-        def fetch_ads_by_limits_and_site_url(
-            cursor, site_url: str, num_visits: int, already_taken: int
-        ):
-            # print(
-            #     f"Fetching ads for {site_url} with {num_visits} visits. Already taken: {already_taken} visits from this site."
-            # )
-
-            query = """
-                WITH VisitAdCounts AS (
-                    SELECT
-                        sv.site_rank,
-                        COUNT(DISTINCT CASE WHEN va.categorized = TRUE AND va.non_ad IS NULL AND va.unspecific_ad IS NULL AND lpc.category_name != "Uncategorized" AND lpc.category_name != :category_name THEN va.ad_id ELSE NULL END) AS NumAdsURL,
-                        COUNT(DISTINCT CASE WHEN va.categorized = TRUE AND va.non_ad IS NULL AND va.unspecific_ad IS NULL AND lpc.category_name = :category_name THEN va.ad_id ELSE NULL END) AS NumAdsURLCategory,
-                        COUNT(DISTINCT CASE WHEN va.categorized = TRUE AND va.non_ad IS NULL AND va.unspecific_ad IS NULL AND lpc.category_name != "Uncategorized" AND lpc.category_name != :category_name THEN va.ad_url ELSE NULL END) AS NumUniqueAdsURL,
-                        COUNT(DISTINCT CASE WHEN va.categorized = TRUE AND va.non_ad IS NULL AND va.unspecific_ad IS NULL AND lpc.category_name = :category_name THEN va.ad_url ELSE NULL END) AS NumUniqueAdsURLCategory
-					FROM site_visits sv 
-                    LEFT JOIN visit_advertisements va ON sv.visit_id = va.visit_id
-                    LEFT JOIN landing_pages lp ON va.landing_page_id = lp.landing_page_id
-                    LEFT JOIN landing_page_categories lpc ON lp.landing_page_id = lpc.landing_page_id
-                    WHERE sv.site_url = :site_url
-                    GROUP BY sv.site_rank
-                ),
-                OrderedVisits AS (
-                    SELECT *,
-                        ROW_NUMBER() OVER (ORDER BY site_rank) AS rownum
-                    FROM VisitAdCounts
-                )
-                SELECT SUM(NumAdsURL), SUM(NumAdsURLCategory), SUM(NumUniqueAdsURL), SUM(NumUniqueAdsURLCategory)
-                FROM OrderedVisits
-                WHERE rownum > :already_taken AND rownum <= :already_taken + :num_visits
-                ORDER BY site_rank;
-                """
-
-            data = {
-                "category_name": self.experiment_category,
-                "control_run": 1 if self.control_runs else 0,
-                "site_url": site_url,
-                "num_visits": num_visits,
-                "already_taken": already_taken,
-            }
 
-            cursor.execute(query, data)
-
-            # print(query, data)
+        # The ads of every visit, the sessions of the visits are merged below
+        query = """
+            SELECT
+                sv.visit_id,
+                COUNT(DISTINCT CASE WHEN va.categorized = TRUE AND va.non_ad IS NULL AND va.unspecific_ad IS NULL AND lpc.category_name != "Uncategorized" AND lpc.category_name != :category_name THEN va.ad_id ELSE NULL END) AS NumAdsURL,
+                COUNT(DISTINCT CASE WHEN va.categorized = TRUE AND va.non_ad IS NULL AND va.unspecific_ad IS NULL AND lpc.category_name = :category_name THEN va.ad_id ELSE NULL END) AS NumAdsURLCategory,
+                COUNT(DISTINCT CASE WHEN va.categorized = TRUE AND va.non_ad IS NULL AND va.unspecific_ad IS NULL AND lpc.category_name != "Uncategorized" AND lpc.category_name != :category_name THEN va.ad_url ELSE NULL END) AS NumUniqueAdsURL,
+                COUNT(DISTINCT CASE WHEN va.categorized = TRUE AND va.non_ad IS NULL AND va.unspecific_ad IS NULL AND lpc.category_name = :category_name THEN va.ad_url ELSE NULL END) AS NumUniqueAdsURLCategory
+            FROM site_visits sv
+            LEFT JOIN visit_advertisements va ON sv.visit_id = va.visit_id
+            LEFT JOIN landing_pages lp ON va.landing_page_id = lp.landing_page_id
+            LEFT JOIN landing_page_categories lpc ON lp.landing_page_id = lpc.landing_page_id
+            GROUP BY sv.visit_id
+            """
+        visit_ads_df = pd.read_sql_query(
+            query, self.conn, params={"category_name": self.experiment_category}
+        )
 
-            result = cursor.fetchall()
-            return result
+        counts = [
+            "NumAdsURL",
+            "NumAdsURLCategory",
+            "NumUniqueAdsURL",
+            "NumUniqueAdsURLCategory",
+        ]
+        assert self.conn is not None
+        session_ads_df = (
+            session_lookup(self.conn, numvisits_by_browser_id_and_url)
+            .merge(visit_ads_df, on="visit_id")
+            .groupby(["session", "site_url"])[counts]
+            .sum()
+        )
+        # The visits of a site_url without ads (other than of the category) add nothing to the session
+        session_ads_df.loc[session_ads_df["NumAdsURL"] == 0, counts] = 0
+        session_ads_df = session_ads_df.groupby("session")[counts].sum()
 
-        seen_browser_ids = set()
+        # A session is started by every browser_id of the list, the visits of the 7th are not counted
+        browser_ids = list(
+            dict.fromkeys(row[0] for row in numvisits_by_browser_id_and_url)
+        )
         sessions = []
-        site_visits_count = {
-            site_url: 0 for _, site_url, _ in numvisits_by_browser_id_and_url
-        }
-
-        for browser_id, site_url, num_visits in numvisits_by_browser_id_and_url:
-
-            if browser_id not in seen_browser_ids:
-                # print("\n" * 2)
-                # print((browser_id))
-                # Create a new session
-                session = {
-                    "browser_id": len(sessions) + 1,
-                    "NumAdsURL": 0,
-                    "NumAdsURLCategory": 0,
-                    "NumUniqueAdsURL": 0,
-                    "NumUniqueAdsURLCategory": 0,
-                }
-                sessions.append(session)
-                seen_browser_ids.add(browser_id)
-            else:
-                session = sessions[-1]
-
-            if session["browser_id"] == 7:
-                break
-
-            # print("Session: ", session)
-            # print("Site URL: ", site_url)
-            # print("Visits to check: ", num_visits)
-            # print("Site visits: ", site_visits_count)
-
-            # Fetch the ads from num_visits visits to the current site_url, starting from the first visit after the already taken visit
-            query_result = fetch_ads_by_limits_and_site_url(
-                cursor, site_url, num_visits, site_visits_count[site_url]
-            )
-
-            # Update the number of visits taken from the site_url
-            site_visits_count[site_url] += num_visits
-
-            # If no ads were found, continue to the next session
-            if not query_result or not query_result[0][0]:
-                continue
-
-            # Sum the number of distinct ad_urls and the number of ad_urls in the category
-            (
-                new_NumAdsURL,
-                new_NumAdsURLCategory,
-                new_NumUniqueAdsURL,
-                new_NumUniqueAdsURLCategory,
-            ) = query_result[0]
-
-            # Add the new ads to the actual session
-            session["NumAdsURL"] += new_NumAdsURL
-            session["NumAdsURLCategory"] += new_NumAdsURLCategory
-            session["NumUniqueAdsURL"] += new_NumUniqueAdsURL
-            session["NumUniqueAdsURLCategory"] += new_NumUniqueAdsURLCategory
+        for session_number in range(1, min(len(browser_ids), MAX_SESSIONS + 1) + 1):
+            session = {"browser_id": session_number}
+            for count in counts:
+                session[count] = (
+                    int(session_ads_df.loc[session_number, count])
+                    if session_number in session_ads_df.index
+                    else 0
+                )
+            sessions.append(session)
 
-        cursor.close()
         return sessions
 
     def plot_ads_by_browser_id(
@@ -0,0 +1,119 @@
+"""
+Parallel classification of URLs with the network filter engine.
+
+The engine is built once in the parent process and shared read-only with the
+workers instead of being sent with every task:
+- with the `fork` start method the workers inherit it from a module global,
+  `gc.freeze()` keeps the garbage collector from touching (and so copying)
+  its pages in the workers,
+- with `spawn` (the default on macOS) it is pickled once per worker, as the
+  pool initializer argument.
+The distinct URLs are split into shards fed through `imap_unordered`, and each
+worker answers a shard with one bitmask of verdicts per URL. Progress is
+counted in the parent as the shards come back, without a Manager lock.
+
+Usage:
+    verdicts = classify_urls(engine, urls, num_workers=4)
+    verdicts[url]  # (easyprivacy, easylist, adserverlist) in engine.list_names order
+"""
+
+import gc
+import multiprocessing
+import os
+from contextlib import ExitStack
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from tqdm import tqdm
+
+from .network_filter import NetworkFilterEngine
+
+DEFAULT_SHARD_SIZE = 2000
+
+# Engine of the worker processes
+_engine: Optional[NetworkFilterEngine] = None
+
+
+def _init_worker(engine: Optional[NetworkFilterEngine]) -> None:
+    global _engine
+    if engine is not None:
+        _engine = engine
+
+
+def _classify_shard(shard: Tuple[List[str], Optional[bool]]) -> List[Tuple[str, int]]:
+    urls, third_party = shard
+    assert _engine is not None
+    results = []
+    for url in urls:
+        mask = 0
+        for bit, blocked in enumerate(
+            _engine.should_block(url, third_party=third_party).values()
+        ):
+            mask |= blocked << bit
+        results.append((url, mask))
+    return results
+
+
+def _unpack(mask: int, num_lists: int) -> Tuple[bool, ...]:
+    return tuple(bool(mask >> bit & 1) for bit in range(num_lists))
+
+
+def classify_urls(
+    engine: NetworkFilterEngine,
+    urls: Iterable[str],
+    num_workers: Optional[int] = None,
+    third_party: Optional[bool] = True,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    start_method: Optional[str] = None,
+    show_progress: bool = True,
+) -> Dict[str, Tuple[bool, ...]]:
+    """
+    Verdicts of every distinct URL, in `engine.list_names` order.
+
+    :param num_workers: Worker processes, defaults to the number of CPUs.
+        With 1 the URLs are classified in this process.
+    :param third_party: Option passed to `NetworkFilterEngine.should_block`.
+    :param shard_size: URLs sent to a worker at a time.
+    :param start_method: `fork` or `spawn`, defaults to the platform's.
+    """
+    global _engine
+    unique_urls = list(dict.fromkeys(urls))
+    num_workers = num_workers or os.cpu_count() or 1
+    num_lists = len(engine.list_names)
+    shards = [
+        (unique_urls[i : i + shard_size], third_party)
+        for i in range(0, len(unique_urls), shard_size)
+    ]
+    progress = tqdm(total=len(unique_urls), disable=not show_progress)
+
+    context = multiprocessing.get_context(start_method)
+    inherited = num_workers == 1 or context.get_start_method() == "fork"
+    if inherited:
+        _engine = engine
+        gc.freeze()
+
+    verdicts: Dict[str, Tuple[bool, ...]] = {}
+    try:
+        with ExitStack() as stack:
+            results: Iterable[List[Tuple[str, int]]]
+            if num_workers == 1:
+                results = map(_classify_shard, shards)
+            else:
+                pool = stack.enter_context(
+                    context.Pool(
+                        num_workers,
+                        initializer=_init_worker,
+                        initargs=(None if inherited else engine,),
+                    )
+                )
+                results = pool.imap_unordered(_classify_shard, shards)
+            for shard_results in results:
+                verdicts.update(
+                    (url, _unpack(mask, num_lists)) for url, mask in shard_results
+                )
+                progress.update(len(shard_results))
+    finally:
+        if inherited:
+            _engine = None
+            gc.unfreeze()
+        progress.close()
+    return verdicts
@@ -0,0 +1,348 @@
+"""
+Columnar export of an experiment's crawl database.
+
+Converts the tables of crawl-data.sqlite into a Parquet dataset with one
+directory per table, partitioned by browser_id in hive style for the tables
+that have it:
+    <parquet_dir>/http_requests/browser_id=1/part-000000000001-0.parquet
+    <parquet_dir>/landing_pages/part-000000000001-0.parquet
+The column types come from `openwpm/storage/parquet_schema.py`, extended with
+the OBA tables below, and from the declared SQLite type for the columns that
+only the SQLite schema has (such as the `id` primary keys).
+
+The export is incremental: the last exported rowid of every table is kept in
+the parquet_export_state table, so a second run only appends the rows added
+since. Rows updated in place (the landing pages and categorized flags of
+visit_advertisements are set after the crawl) need a `full` export.
+`stale_tables` finds the tables with rows added or deleted since their export.
+
+The tables are then read with only the needed columns, and the filters are
+pushed down to the Parquet row groups and browser_id partitions:
+    read_table(parquet_dir, "http_requests", columns=["visit_id", "url"],
+               filters=[("browser_id", "in", [1, 2])])
+
+Usage:
+    python -m oba.parquet_export datadir/<experiment>/crawl-data.sqlite
+"""
+
+import shutil
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from openwpm.storage.parquet_schema import PQ_SCHEMAS
+
+from .enums_data_processer import ParquetExportQueries
+
+DEFAULT_CHUNK_SIZE = 100_000
+PARTITION_COLUMN = "browser_id"
+PARTITIONING = ds.partitioning(
+    pa.schema([pa.field(PARTITION_COLUMN, pa.int64())]), flavor="hive"
+)
+
+OBA_PQ_SCHEMAS = dict()
+
+# visit_advertisements
+fields = [
+    pa.field("ad_id", pa.int64(), nullable=False),
+    pa.field("visit_id", pa.int64()),
+    pa.field("browser_id", pa.uint32()),
+    pa.field("ad_url", pa.string()),
+    pa.field("visit_url", pa.string()),
+    pa.field("clean_run", pa.bool_()),
+    pa.field("ad_number_in_visit", pa.int64()),
+    pa.field("sub_ad_number_in_chumbox", pa.int64()),
+    pa.field("chumbox_platform", pa.string()),
+    pa.field("landing_page_id", pa.int64()),
+    pa.field("landing_page_url", pa.string()),
+    pa.field("categorized", pa.bool_()),
+    pa.field("oba_potential", pa.bool_()),
+    pa.field("non_ad", pa.bool_()),
+    pa.field("unspecific_ad", pa.bool_()),
+]
+OBA_PQ_SCHEMAS["visit_advertisements"] = pa.schema(fields)
+
+# landing_pages
+fields = [
+    pa.field("landing_page_id", pa.int64(), nullable=False),
+    pa.field("landing_page_url", pa.string(), nullable=False),
+    pa.field("categorized", pa.bool_()),
+]
+OBA_PQ_SCHEMAS["landing_pages"] = pa.schema(fields)
+
+# landing_page_categories
+fields = [
+    pa.field("category_id", pa.int64(), nullable=False),
+    pa.field("landing_page_id", pa.int64(), nullable=False),
+    pa.field("landing_page_url", pa.string(), nullable=False),
+    pa.field("category_code", pa.string(), nullable=False),
+    pa.field("category_name", pa.string(), nullable=False),
+    pa.field("parent_category", pa.string(), nullable=False),
+    pa.field("confident", pa.bool_(), nullable=False),
+]
+OBA_PQ_SCHEMAS["landing_page_categories"] = pa.schema(fields)
+
+EXPORT_SCHEMAS = {**PQ_SCHEMAS, **OBA_PQ_SCHEMAS}
+
+
+def _sqlite_type_to_arrow(declared_type: str) -> pa.DataType:
+    """Arrow type of a column from its declared SQLite type, following the SQLite affinity rules"""
+    declared_type = declared_type.upper()
+    if "BOOL" in declared_type:
+        return pa.bool_()
+    if "INT" in declared_type:
+        return pa.int64()
+    if any(name in declared_type for name in ("REAL", "FLOA", "DOUB")):
+        return pa.float64()
+    return pa.string()
+
+
+def table_schema(crawl_conn: sqlite3.Connection, table: str) -> pa.Schema:
+    """
+    Schema of the exported `table`: the columns of the SQLite table, typed from
+    the Parquet schemas when they are there. All the fields are nullable, as
+    SQLite doesn't enforce the declared types.
+    """
+    known_schema = EXPORT_SCHEMAS.get(table, pa.schema([]))
+    columns = crawl_conn.execute(ParquetExportQueries.table_info_query(table))
+    fields = []
+    for _, name, declared_type, *_ in columns:
+        index = known_schema.get_field_index(name)
+        if name == PARTITION_COLUMN:
+            # Type of the partition values when they are read back
+            data_type = PARTITIONING.schema.field(name).type
+        elif index != -1:
+            data_type = known_schema.field(index).type
+        else:
+            data_type = _sqlite_type_to_arrow(declared_type or "")
+        fields.append(pa.field(name, data_type))
+    return pa.schema(fields)
+
+
+def _to_arrow(values: Sequence, data_type: pa.DataType) -> pa.Array:
+    if pa.types.is_boolean(data_type):
+        values = [None if value is None else bool(value) for value in values]
+    try:
+        return pa.array(values, type=data_type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        if not pa.types.is_string(data_type):
+            raise
+        # SQLite lets numbers into TEXT columns
+        return pa.array(
+            [None if value is None else str(value) for value in values],
+            type=data_type,
+        )
+
+
+def _rows_to_arrow(rows: List[tuple], schema: pa.Schema) -> pa.Table:
+    """Arrow table of (rowid, *columns) rows"""
+    if not rows:
+        return schema.empty_table()
+    _, *columns = zip(*rows)
+    return pa.table(
+        [_to_arrow(values, field.type) for values, field in zip(columns, schema)],
+        schema=schema,
+    )
+
+
+def read_sqlite_table(crawl_conn: sqlite3.Connection, table: str) -> pa.Table:
+    """Whole `table` as an Arrow table, with the types of its export"""
+    schema = table_schema(crawl_conn, table)
+    rows = crawl_conn.execute(
+        ParquetExportQueries.select_rows_query(table, schema.names),
+        {"last_rowid": 0, "limit": -1},
+    ).fetchall()
+    return _rows_to_arrow(rows, schema)
+
+
+def export_table(
+    crawl_conn: sqlite3.Connection,
+    table: str,
+    parquet_dir: Union[str, Path],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    full: bool = False,
+) -> int:
+    """
+    Appends the rows of `table` added since the last export to its dataset.
+
+    :param full: Export the whole table again, dropping the previous files.
+    :return: The number of exported rows.
+    """
+    cursor = crawl_conn.cursor()
+    table_dir = Path(parquet_dir) / table
+    export_key = str(table_dir.resolve())
+    cursor.execute(ParquetExportQueries.CreateStateTableQuery)
+    cursor.execute(ParquetExportQueries.SelectStateQuery, {"export": export_key})
+    state = cursor.fetchone()
+    last_rowid = state[0] if state and table_dir.is_dir() and not full else 0
+    if last_rowid == 0:
+        shutil.rmtree(table_dir, ignore_errors=True)
+    else:
+        # Parts written after the last committed state are written again
+        for part in table_dir.glob("**/part-*.parquet"):
+            if int(part.stem.split("-")[1]) > last_rowid:
+                part.unlink()
+
+    schema = table_schema(crawl_conn, table)
+    partitioning = PARTITIONING if PARTITION_COLUMN in schema.names else None
+    exported_rows = 0
+    while True:
+        cursor.execute(
+            ParquetExportQueries.select_rows_query(table, schema.names),
+            {"last_rowid": last_rowid, "limit": chunk_size},
+        )
+        rows = cursor.fetchall()
+        if not rows:
+            break
+        rowids = [row[0] for row in rows]
+        chunk = _rows_to_arrow(rows, schema)
+        ds.write_dataset(
+            chunk,
+            table_dir,
+            format="parquet",
+            partitioning=partitioning,
+            basename_template=f"part-{rowids[0]:012d}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore",
+        )
+        last_rowid = rowids[-1]
+        exported_rows += len(rows)
+        cursor.execute(
+            ParquetExportQueries.UpsertStateQuery,
+            {"export": export_key, "last_rowid": last_rowid},
+        )
+        crawl_conn.commit()
+        print(f"[{table.upper()} PARQUET] Exported up to rowid {last_rowid}")
+    return exported_rows
+
+
+def export_experiment(
+    crawl_conn: sqlite3.Connection,
+    parquet_dir: Union[str, Path],
+    tables: Optional[List[str]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    full: bool = False,
+) -> Dict[str, int]:
+    """
+    Exports the tables of the crawl database.
+
+    :param tables: Tables to export, defaults to the ones with a Parquet schema.
+    :return: The number of exported rows of every table.
+    """
+    existing_tables = [
+        name for (name,) in crawl_conn.execute(ParquetExportQueries.SelectTablesQuery)
+    ]
+    if tables is None:
+        tables = [name for name in existing_tables if name in EXPORT_SCHEMAS]
+    missing_tables = set(tables) - set(existing_tables)
+    if missing_tables:
+        raise ValueError(f"Unknown tables: {', '.join(sorted(missing_tables))}")
+    return {
+        table: export_table(crawl_conn, table, parquet_dir, chunk_size, full)
+        for table in tables
+    }
+
+
+def stale_tables(
+    crawl_conn: sqlite3.Connection,
+    parquet_dir: Union[str, Path],
+    tables: Sequence[str],
+) -> List[str]:
+    """
+    Tables whose export is missing rows or has rows that were deleted since.
+
+    Rows updated in place aren't detected, the tables need a `full` export
+    after them.
+    """
+    cursor = crawl_conn.cursor()
+    stale = []
+    for table in tables:
+        table_dir = Path(parquet_dir) / table
+        try:
+            cursor.execute(
+                ParquetExportQueries.SelectStateQuery,
+                {"export": str(table_dir.resolve())},
+            )
+            state = cursor.fetchone()
+        except sqlite3.OperationalError:
+            # Never exported
+            state = None
+        rows, max_rowid = cursor.execute(
+            ParquetExportQueries.select_rows_summary_query(table)
+        ).fetchone()
+        if rows == 0 and not table_dir.is_dir():
+            continue
+        if (
+            state is None
+            or not table_dir.is_dir()
+            or state[0] != max_rowid
+            or ds.dataset(table_dir, format="parquet").count_rows() != rows
+        ):
+            stale.append(table)
+    return stale
+
+
+def read_table(
+    parquet_dir: Union[str, Path],
+    table: str,
+    columns: Optional[List[str]] = None,
+    filters: Optional[Union[ds.Expression, List[Tuple[str, str, Any]]]] = None,
+) -> pd.DataFrame:
+    """
+    Reads an exported table, with only `columns`. The browser_id column of
+    the partitioned tables comes last.
+
+    :param filters: Filters pushed down to the files, as a `pyarrow.dataset`
+        expression or a list of (column, op, value) tuples, see
+        `pyarrow.parquet.read_table`.
+    """
+    table_dir = Path(parquet_dir) / table
+    partitioned = any(table_dir.glob(f"{PARTITION_COLUMN}=*"))
+    return pq.read_table(
+        table_dir,
+        columns=columns,
+        filters=filters,
+        partitioning=PARTITIONING if partitioned else None,
+    ).to_pandas()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Export the tables of crawl databases to Parquet datasets partitioned by browser_id"
+    )
+    parser.add_argument("crawl_db_paths", nargs="+", type=Path)
+    parser.add_argument(
+        "--parquet-dir",
+        type=Path,
+        default=None,
+        help="Defaults to a parquet directory next to every database",
+    )
+    parser.add_argument("--tables", nargs="+", default=None)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument(
+        "--full", action="store_true", help="Export the tables from scratch"
+    )
+    args = parser.parse_args()
+
+    for crawl_db_path in args.crawl_db_paths:
+        parquet_dir = (
+            args.parquet_dir / crawl_db_path.parent.name
+            if args.parquet_dir is not None
+            else crawl_db_path.parent / "parquet"
+        )
+        start_time = time.time()
+        with sqlite3.connect(crawl_db_path) as crawl_conn:
+            exported_rows = export_experiment(
+                crawl_conn, parquet_dir, args.tables, args.chunk_size, args.full
+            )
+        print(
+            f"Exported {sum(exported_rows.values())} rows of {crawl_db_path} "
+            f"to {parquet_dir} in {time.time() - start_time:.2f} seconds"
+        )
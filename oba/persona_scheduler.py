@@ -0,0 +1,218 @@
+"""
+Scheduler of the visits of several OBA personas on one TaskManager.
+
+Every persona is an OBA browser of the TaskManager with its own profile,
+training pages and dice. The personas roll their dice like
+`OBAMeasurementExperiment.experiment_crawling` does: a visit to 1 to 3
+training pages or to a control page, with an exponential wait before every
+command sequence. The wait is a deadline of the persona instead of a blocking
+sleep, so the main thread submits the command sequences of the other personas
+in the meantime, and a persona whose browser is still busy at its deadline
+doesn't hold back the others.
+
+Usage:
+    scheduler = PersonaScheduler(
+        manager,
+        [
+            Persona("persona_1", 1, training_pages, control_pages),
+            Persona("persona_2", 2, training_pages, control_pages),
+        ],
+        training_visits_sequence,
+        control_site_visit_sequence,
+        expovar_mean=180,
+    )
+    next_site_rank = scheduler.run(next_site_rank, seconds=8 * 60 * 60)
+    print(scheduler.summary())
+"""
+
+import heapq
+import random
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from openwpm.command_sequence import CommandSequence
+from openwpm.task_manager import SLEEP_CONS, TaskManager
+
+TRAINING = "training"
+CONTROL = "control"
+
+
+@dataclass
+class Persona:
+    """
+    :param name: Name of the persona in the logs and the summary.
+    :param browser_index: Index of the OBA browser of the persona in the TaskManager.
+    :param training_pages: Pages the persona is trained with.
+    :param control_pages: Pages where the ads of the persona are captured.
+    :param control_visits_rate: Percentage of the visits that go to a control page.
+    :param cookie_banner_action: 0 do nothing, 1 accept, 2 reject.
+    :param seed: Seed of the dice of the persona, drawn from `random` if None.
+    """
+
+    name: str
+    browser_index: int
+    training_pages: List[str]
+    control_pages: List[str]
+    control_visits_rate: int = 20
+    cookie_banner_action: int = 0
+    seed: Optional[int] = None
+
+
+@dataclass
+class PersonaCounters:
+    """Command sequences that a persona submitted, and how long they waited for its browser"""
+
+    training_visits: int = 0
+    control_visits: int = 0
+    # Deadlines at which the browser of the persona was still busy
+    busy_browser: int = 0
+    # Seconds between the deadlines and the submission of the command sequences
+    delay_seconds: float = 0.0
+
+    @property
+    def visits(self) -> int:
+        return self.training_visits + self.control_visits
+
+    def visits_per_hour(self, elapsed_seconds: float) -> float:
+        return self.visits * 3600 / elapsed_seconds if elapsed_seconds > 0 else 0.0
+
+
+class PersonaScheduler:
+    """
+    :param manager: TaskManager with a browser for every persona.
+    :param personas: Personas to crawl with, each on its own browser.
+    :param training_visits_sequence: `oba_commands_sequences.training_visits_sequence`.
+    :param control_site_visit_sequence: `oba_commands_sequences.control_site_visit_sequence`.
+    :param expovar_mean: Mean of the exponential wait before every command sequence, in seconds.
+    :param clock: Monotonic clock, in seconds.
+    :param sleep: Sleeps the main thread until the next deadline.
+    """
+
+    def __init__(
+        self,
+        manager: TaskManager,
+        personas: List[Persona],
+        training_visits_sequence: Callable[..., List[CommandSequence]],
+        control_site_visit_sequence: Callable[..., CommandSequence],
+        expovar_mean: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        indexes = [persona.browser_index for persona in personas]
+        if len(set(indexes)) != len(indexes):
+            raise ValueError("Every persona needs its own browser")
+        self.manager = manager
+        self.personas = personas
+        self.training_visits_sequence = training_visits_sequence
+        self.control_site_visit_sequence = control_site_visit_sequence
+        self.expovar_mean = expovar_mean
+        self.clock = clock
+        self.sleep = sleep
+        self.dice = [
+            random.Random(
+                persona.seed if persona.seed is not None else random.getrandbits(64)
+            )
+            for persona in personas
+        ]
+        self.counters = [PersonaCounters() for _ in personas]
+        self.elapsed_seconds = 0.0
+
+    def _roll_sequences(
+        self, persona_index: int, next_site_rank: int
+    ) -> List[Tuple[str, CommandSequence]]:
+        """Command sequences of the next visit of a persona, to training pages or to a control page"""
+        persona = self.personas[persona_index]
+        dice = self.dice[persona_index]
+        if dice.randint(1, 100) > persona.control_visits_rate:
+            amount_of_pages = dice.randint(1, 3)
+            training_sample = dice.sample(persona.training_pages, amount_of_pages)
+            sequence_list = self.training_visits_sequence(
+                training_sample,
+                next_site_rank,
+                cookie_banner_action=persona.cookie_banner_action,
+            )
+            return [(TRAINING, sequence) for sequence in sequence_list]
+        sequence = self.control_site_visit_sequence(
+            dice.choice(persona.control_pages),
+            next_site_rank,
+            cookie_banner_action=persona.cookie_banner_action,
+        )
+        return [(CONTROL, sequence)]
+
+    def _wait_time(self, persona_index: int) -> int:
+        return int(self.dice[persona_index].expovariate(1 / self.expovar_mean))
+
+    def run(self, next_site_rank: int, seconds: float) -> int:
+        """
+        Crawls with all the personas, rolling new visits during `seconds`. The
+        visits rolled before are finished. Returns the next site_rank, shared
+        by the personas to keep the chronological order of the visits.
+        """
+        start = self.clock()
+        pending: List[Deque[Tuple[str, CommandSequence]]] = [
+            deque() for _ in self.personas
+        ]
+        deadlines: List[float] = [start] * len(self.personas)
+        # (time to check the persona, persona index)
+        queue: List[Tuple[float, int]] = []
+
+        def schedule_next_visit(persona_index: int, now: float) -> None:
+            nonlocal next_site_rank
+            if not pending[persona_index]:
+                if now - start >= seconds:
+                    return
+                sequences = self._roll_sequences(persona_index, next_site_rank)
+                print(
+                    f"{self.personas[persona_index].name} GOT SEQUENCE LIST: ",
+                    [sequence for _, sequence in sequences],
+                )
+                next_site_rank += len(sequences)
+                pending[persona_index].extend(sequences)
+            deadlines[persona_index] = now + self._wait_time(persona_index)
+            heapq.heappush(queue, (deadlines[persona_index], persona_index))
+
+        for persona_index in range(len(self.personas)):
+            schedule_next_visit(persona_index, start)
+
+        while queue:
+            check_time, persona_index = heapq.heappop(queue)
+            now = self.clock()
+            if check_time > now:
+                self.sleep(check_time - now)
+                now = self.clock()
+            persona = self.personas[persona_index]
+            counters = self.counters[persona_index]
+            if not self.manager.browsers[persona.browser_index].ready():
+                # Checked again shortly, without blocking the other personas
+                counters.busy_browser += 1
+                heapq.heappush(queue, (now + SLEEP_CONS, persona_index))
+                continue
+
+            kind, command_sequence = pending[persona_index].popleft()
+            self.manager.execute_command_sequence(
+                command_sequence, index=persona.browser_index
+            )
+            if kind == TRAINING:
+                counters.training_visits += 1
+            else:
+                counters.control_visits += 1
+            counters.delay_seconds += max(now - deadlines[persona_index], 0.0)
+            schedule_next_visit(persona_index, self.clock())
+
+        self.elapsed_seconds = self.clock() - start
+        return next_site_rank
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Counters and visits per hour of every persona in the last run"""
+        return {
+            persona.name: {
+                "training_visits": counters.training_visits,
+                "control_visits": counters.control_visits,
+                "visits_per_hour": counters.visits_per_hour(self.elapsed_seconds),
+                "busy_browser": counters.busy_browser,
+                "delay_seconds": counters.delay_seconds,
+            }
+            for persona, counters in zip(self.personas, self.counters)
+        }
@@ -0,0 +1,201 @@
+"""
+Rate limited client around `Categorizer` for categorizing many URLs at once.
+
+- A token bucket caps the rate of API requests (requests per second).
+- The number of requests in flight is adjusted with AIMD: it grows by one
+  after a window of successful requests and is halved on every 429 or 5xx.
+- Throttled and failed requests are retried a bounded number of times, after
+  an exponential backoff with full jitter so the tasks don't retry in lockstep.
+- All the requests share a single `aiohttp.ClientSession`.
+
+Usage:
+    async with RateLimitedCategorizer(categorizer, requests_per_second=2) as client:
+        responses = await asyncio.gather(*(client.categorize(url) for url in urls))
+"""
+
+import asyncio
+import random
+import time
+from typing import Optional
+
+import aiohttp
+
+from .categorizer import Categorizer
+
+
+class TokenBucket:
+    """Hands out `rate` tokens per second, with bursts of at most `capacity` tokens"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ValueError("The rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        # The lock makes the waiting tasks get their tokens in order
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+class AIMDLimiter:
+    """
+    Concurrency limit that increases by one after `limit` consecutive successes
+    and is multiplied by `decrease_factor` on every throttled request.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 1,
+        min_limit: int = 1,
+        max_limit: int = 8,
+        decrease_factor: float = 0.5,
+    ) -> None:
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.limit = float(max(min_limit, min(initial_limit, max_limit)))
+        self.in_flight = 0
+        self._successes = 0
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self) -> "AIMDLimiter":
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    async def on_success(self) -> None:
+        async with self._condition:
+            self._successes += 1
+            if self._successes >= int(self.limit):
+                self._successes = 0
+                self.limit = min(self.max_limit, self.limit + 1)
+                self._condition.notify_all()
+
+    async def on_throttle(self) -> None:
+        async with self._condition:
+            self._successes = 0
+            self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+
+
+def _is_retryable(response: dict) -> bool:
+    status_code = response["status_code"]
+    return status_code is None or status_code == 429 or status_code >= 500
+
+
+class RateLimitedCategorizer:
+    """
+    :param categorizer: The categorizer used for the requests. Its cache is
+        consulted first, cache hits don't count against the rate limit.
+    :param requests_per_second: Token bucket rate.
+    :param burst: Token bucket capacity, defaults to one second of requests.
+    :param max_concurrency: Upper bound of the AIMD concurrency limit.
+    :param max_retries: Retries of a throttled or failed request before giving
+        up and returning the last response.
+    :param base_delay: Backoff of the first retry, doubled for every retry.
+    :param max_delay: Upper bound of the backoff.
+    """
+
+    def __init__(
+        self,
+        categorizer: Categorizer,
+        requests_per_second: float = 1,
+        burst: Optional[float] = None,
+        max_concurrency: int = 8,
+        max_retries: int = 5,
+        base_delay: float = 1,
+        max_delay: float = 30,
+    ) -> None:
+        self.categorizer = categorizer
+        self.bucket = TokenBucket(requests_per_second, capacity=burst)
+        self.concurrency = AIMDLimiter(
+            initial_limit=max(1, min(max_concurrency, int(requests_per_second))),
+            max_limit=max_concurrency,
+        )
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.session: Optional[aiohttp.ClientSession] = None
+
+        self.requests = 0
+        self.throttled = 0
+        self.retries = 0
+        self.failures = 0
+
+    async def __aenter__(self) -> "RateLimitedCategorizer":
+        self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=60))
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    async def categorize(self, url: str, taxonomy: str = "iabv1") -> dict:
+        """Same responses as `Categorizer.categorize`, a 429 or 5xx is only returned once the retries are exhausted"""
+        if self.session is None:
+            raise RuntimeError(
+                "RateLimitedCategorizer must be used as an async context manager"
+            )
+        cached_response = self.categorizer.cached_response(url, taxonomy)
+        if cached_response is not None:
+            return cached_response
+
+        for attempt in range(self.max_retries + 1):
+            async with self.concurrency:
+                await self.bucket.acquire()
+                self.requests += 1
+                try:
+                    response = await self.categorizer.fetch_categories(
+                        self.session, url, taxonomy
+                    )
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    response = {"status_code": None, "error": repr(e)}
+
+            if not _is_retryable(response):
+                await self.concurrency.on_success()
+                return response
+
+            self.throttled += 1
+            await self.concurrency.on_throttle()
+            if attempt < self.max_retries:
+                self.retries += 1
+                delay = self._backoff(attempt)
+                print(
+                    f"[WARNING] {response['status_code'] or 'Request error'} for {url}. "
+                    f"Retrying in {delay:.1f} seconds..."
+                )
+                await asyncio.sleep(delay)
+
+        self.failures += 1
+        return response
+
+    def print_stats(self) -> None:
+        print(
+            f"[CATEGORIZER REQUESTS] {self.requests} requests, {self.throttled} throttled, "
+            f"{self.retries} retries, {self.failures} failures, "
+            f"concurrency limit {int(self.concurrency.limit)}"
+        )
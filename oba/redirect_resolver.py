@@ -0,0 +1,283 @@
+"""
+Resolves ad URLs to their landing pages over plain HTTP, without a browser.
+
+Most ad click URLs go through chains of tracking redirectors that only use 30x
+responses, meta refreshes or a literal `window.location` assignment. Those are
+followed here with aiohttp; only the chains that end in JavaScript that can't
+be followed statically need to be loaded in a browser.
+
+Every hop is saved in the redirect_hops table of the crawl database, so the
+chains of repeated ad networks are resolved again without any request.
+"""
+
+import asyncio
+import html
+import re
+import sqlite3
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+
+import aiohttp
+
+from .enums_data_processer import RedirectHopsQueries
+
+# Hop types
+LOCATION = "location"
+META_REFRESH = "meta_refresh"
+JAVASCRIPT = "javascript"
+LANDING = "landing"
+# The page navigates with JavaScript that can't be followed without a browser
+NEEDS_BROWSER = "needs_browser"
+
+USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/115.0"
+# Only the beginning of the pages is looked at for redirects
+MAX_BODY_BYTES = 256 * 1024
+
+SCRIPT = re.compile(r"<script[^>]*>(.*?)</script>", re.IGNORECASE | re.DOTALL)
+META_TAG = re.compile(r"<meta\b[^>]*>", re.IGNORECASE)
+REFRESH_URL = re.compile(
+    r"^\s*\d*(?:\.\d*)?\s*[;,]?\s*url\s*=\s*['\"]?([^'\"]+)", re.IGNORECASE
+)
+JS_REDIRECT = re.compile(
+    r"""(?:\b(?:window|document|top|self)\.)?\blocation(?:\.href)?\s*=\s*(["'])(.+?)\1"""
+    r"""|\blocation\.(?:replace|assign)\(\s*(["'])(.+?)\3\s*\)"""
+)
+JS_NAVIGATION = re.compile(
+    r"\blocation(?:\.href)?\s*=[^=]|\blocation\.(?:replace|assign)\s*\("
+    r"|\bwindow\.open\s*\(|\.submit\s*\(\s*\)"
+)
+
+
+@dataclass
+class Hop:
+    url: str
+    hop_type: str
+    next_url: Optional[str] = None
+    status_code: Optional[int] = None
+
+
+@dataclass
+class RedirectChain:
+    ad_url: str
+    hops: List[Hop]
+
+    @property
+    def resolved(self) -> bool:
+        return bool(self.hops) and self.hops[-1].hop_type == LANDING
+
+    @property
+    def landing_page_url(self) -> Optional[str]:
+        return self.hops[-1].url if self.resolved else None
+
+
+def _attribute(tag: str, name: str) -> Optional[str]:
+    match = re.search(
+        rf"""\b{name}\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", tag, re.IGNORECASE
+    )
+    if not match:
+        return None
+    return html.unescape(next(group for group in match.groups() if group is not None))
+
+
+def find_meta_refresh(body: str) -> Optional[str]:
+    for tag in META_TAG.findall(body):
+        if (_attribute(tag, "http-equiv") or "").lower() != "refresh":
+            continue
+        match = REFRESH_URL.match(_attribute(tag, "content") or "")
+        if match:
+            return match.group(1).strip()
+    return None
+
+
+def find_javascript_redirect(body: str) -> Tuple[Optional[str], bool]:
+    """
+    Looks for a navigation in the inline scripts of the page.
+
+    :return: The URL of the first navigation to a literal URL, and whether the
+        scripts navigate at all.
+    """
+    navigates = False
+    for script in SCRIPT.findall(body):
+        match = JS_REDIRECT.search(script)
+        if match:
+            url = match.group(2) or match.group(4)
+            return url.replace("\\/", "/"), True
+        navigates = navigates or bool(JS_NAVIGATION.search(script))
+    return None, navigates
+
+
+def parse_hop(
+    url: str, status_code: int, headers: Mapping[str, str], body: Optional[str]
+) -> Hop:
+    """Finds out where a response leads to"""
+    location = headers.get("Location")
+    if 300 <= status_code < 400 and location:
+        return Hop(url, LOCATION, urljoin(url, location), status_code)
+    if status_code >= 400:
+        # Usually a bot wall, a browser may still get through
+        return Hop(url, NEEDS_BROWSER, status_code=status_code)
+    refresh = headers.get("Refresh")
+    if refresh:
+        match = REFRESH_URL.match(refresh)
+        if match:
+            return Hop(url, META_REFRESH, urljoin(url, match.group(1)), status_code)
+    if body is None:
+        return Hop(url, LANDING, status_code=status_code)
+
+    refresh_url = find_meta_refresh(body)
+    if refresh_url:
+        return Hop(url, META_REFRESH, urljoin(url, refresh_url), status_code)
+    redirect_url, navigates = find_javascript_redirect(body)
+    if redirect_url:
+        return Hop(url, JAVASCRIPT, urljoin(url, redirect_url), status_code)
+    if navigates:
+        return Hop(url, NEEDS_BROWSER, status_code=status_code)
+    return Hop(url, LANDING, status_code=status_code)
+
+
+class RedirectHopStore:
+    """The hops already followed, saved in the crawl database"""
+
+    def __init__(self, crawl_conn: sqlite3.Connection) -> None:
+        self.crawl_conn = crawl_conn
+        self.crawl_conn.execute(RedirectHopsQueries.CreateTableQuery)
+
+    def get(self, url: str) -> Optional[Hop]:
+        row = self.crawl_conn.execute(
+            RedirectHopsQueries.SelectHopQuery, {"url": url}
+        ).fetchone()
+        return Hop(*row) if row else None
+
+    def save(self, hops: Iterable[Hop]) -> None:
+        self.crawl_conn.executemany(
+            RedirectHopsQueries.UpsertHopQuery,
+            [
+                {
+                    "url": hop.url,
+                    "hop_type": hop.hop_type,
+                    "next_url": hop.next_url,
+                    "status_code": hop.status_code,
+                }
+                for hop in hops
+            ],
+        )
+        self.crawl_conn.commit()
+
+
+async def read_body(stream: aiohttp.StreamReader) -> bytes:
+    """The first MAX_BODY_BYTES of a body, which may arrive in several chunks"""
+    content = bytearray()
+    while len(content) < MAX_BODY_BYTES:
+        chunk = await stream.readany()
+        if not chunk:
+            break
+        content += chunk
+    return bytes(content[:MAX_BODY_BYTES])
+
+
+class HTTPRedirectResolver:
+    """
+    Follows the redirect chains of ad URLs with an async HTTP client,
+    sending at most `per_host_concurrency` requests to the same host at a time.
+    """
+
+    def __init__(
+        self,
+        per_host_concurrency: int = 2,
+        max_concurrency: int = 50,
+        max_hops: int = 15,
+        timeout: float = 15,
+    ) -> None:
+        self.per_host_concurrency = per_host_concurrency
+        self.max_concurrency = max_concurrency
+        self.max_hops = max_hops
+        self.timeout = timeout
+        self.requests = 0
+        self.cached_hops = 0
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def resolve_all(
+        self, ad_urls: Iterable[str], store: Optional[RedirectHopStore] = None
+    ) -> Dict[str, RedirectChain]:
+        """Follows the redirect chain of every ad URL, returns them by ad URL"""
+        return asyncio.run(self._resolve_all(list(dict.fromkeys(ad_urls)), store))
+
+    async def _resolve_all(
+        self, ad_urls: List[str], store: Optional[RedirectHopStore]
+    ) -> Dict[str, RedirectChain]:
+        self._host_semaphores = {}
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+        async with aiohttp.ClientSession(
+            connector=connector,
+            headers={"User-Agent": USER_AGENT},
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        ) as session:
+            chains = await asyncio.gather(
+                *(self.resolve(session, ad_url, store) for ad_url in ad_urls)
+            )
+        return {chain.ad_url: chain for chain in chains}
+
+    async def resolve(
+        self,
+        session: aiohttp.ClientSession,
+        ad_url: str,
+        store: Optional[RedirectHopStore] = None,
+    ) -> RedirectChain:
+        hops: List[Hop] = []
+        new_hops: List[Hop] = []
+        visited = set()
+        url: Optional[str] = ad_url
+        while url is not None and len(hops) < self.max_hops:
+            if url in visited:
+                # Redirect loop, usually waiting for a cookie set by JavaScript
+                hops.append(Hop(url, NEEDS_BROWSER))
+                url = None
+                break
+            visited.add(url)
+            hop = store.get(url) if store is not None else None
+            if hop is not None:
+                self.cached_hops += 1
+            else:
+                hop = await self._fetch(session, url)
+                if self._cacheable(hop):
+                    new_hops.append(hop)
+            hops.append(hop)
+            url = hop.next_url
+        if url is not None:
+            # Too many hops
+            hops.append(Hop(url, NEEDS_BROWSER))
+        if store is not None and new_hops:
+            store.save(new_hops)
+        return RedirectChain(ad_url, hops)
+
+    @staticmethod
+    def _cacheable(hop: Hop) -> bool:
+        """Hops that failed because of network errors, rate limits or server errors may succeed later"""
+        return (
+            hop.status_code is not None
+            and hop.status_code != 429
+            and hop.status_code < 500
+        )
+
+    async def _fetch(self, session: aiohttp.ClientSession, url: str) -> Hop:
+        if urlparse(url).scheme not in ("http", "https"):
+            return Hop(url, NEEDS_BROWSER)
+        host = urlparse(url).netloc
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.per_host_concurrency)
+        async with self._host_semaphores[host]:
+            self.requests += 1
+            try:
+                async with session.get(url, allow_redirects=False) as response:
+                    body = None
+                    if "html" in response.headers.get("Content-Type", "html"):
+                        content = await read_body(response.content)
+                        body = content.decode(
+                            response.charset or "utf-8", errors="ignore"
+                        )
+                    return parse_hop(url, response.status, response.headers, body)
+            except (aiohttp.ClientError, asyncio.TimeoutError, UnicodeError) as e:
+                # Not saved, the error may be transient
+                print(f"[HTTP RESOLVER ERROR] {url}: {e!r}")
+                return Hop(url, NEEDS_BROWSER)
@@ -1,15983 +0,0 @@
-EASYLIST_SELECTORS = [
-    "#AC_ad",
-    "#AD_160",
-    "#AD_300",
-    "#AD_468x60",
-    "#AD_G",
-    "#AD_L",
-    "#AD_ROW",
-    "#AD_Top",
-    "#AD_text",
-    "#ADbox",
-    "#Ad-3-Slider",
-    "#Ad-4-Slider",
-    "#Ad-Container",
-    "#Ad-Content",
-    "#Ad-Top",
-    "#AdBanner",
-    "#AdBar",
-    "#AdBigBox",
-    "#AdBillboard",
-    "#AdBlock",
-    "#AdBottomLeader",
-    "#AdBottomRight",
-    "#AdBox2",
-    "#AdColumn",
-    "#AdContainerTop",
-    "#AdContent",
-    "#AdContent_0_0_pnlDiv",
-    "#AdDisclaimer",
-    "#AdHeader",
-    "#AdLayer1",
-    "#AdLayer2",
-    "#AdMiddle",
-    "#AdPanel",
-    "#AdPopUp",
-    "#AdRectangleBanner",
-    "#AdSense1",
-    "#AdSense2",
-    "#AdSense3",
-    "#AdSenseDiv",
-    "#AdServer",
-    "#AdServer_Banner_1",
-    "#AdServer_Banner_2",
-    "#AdServer_Banner_3",
-    "#AdServer_Banner_4",
-    "#AdServer_Banner_5",
-    "#AdServer_Banner_6",
-    "#AdServer_Banner_7",
-    "#AdServer_Banner_8",
-    "#AdServer_Banner_9",
-    "#AdSkyscraper",
-    "#AdSlot_megabanner",
-    "#AdSpaceLeaderboard",
-    "#AdTop",
-    "#AdTopLeader",
-    "#AdWidgetContainer",
-    "#AdWrapperSuperCA",
-    "#AdZone1",
-    "#AdZone2",
-    "#Ad_BelowContent",
-    "#Ad_Block",
-    "#Ad_TopLeaderboard",
-    "#Adbanner",
-    "#Adcode",
-    "#Adlabel",
-    "#AdsBannerTop",
-    "#AdsBillboard",
-    "#AdsBottomContainer",
-    "#AdsContent",
-    "#AdsDiv",
-    "#AdsFrame",
-    "#AdsPubperform",
-    "#AdsRight",
-    "#AdsSky",
-    "#AdsTopContainer",
-    "#AdsWrap",
-    "#Ads_BA_BS",
-    "#Ads_BA_BUT",
-    "#Ads_BA_BUT2",
-    "#Ads_BA_BUT_box",
-    "#Ads_BA_CAD",
-    "#Ads_BA_CAD2",
-    "#Ads_BA_CAD2_Text",
-    "#Ads_BA_FLB",
-    "#Ads_BA_SKY",
-    "#Ads_TFM_BS",
-    "#Ads_google_bottom_wide",
-    "#Adsense300x250",
-    "#AdsenseBottom",
-    "#AdsenseTop",
-    "#Adsterra",
-    "#Adv10",
-    "#Adv11",
-    "#Adv8",
-    "#Adv9",
-    "#AdvArea",
-    "#AdvBody",
-    "#AdvContainer",
-    "#AdvFooter",
-    "#AdvFrame1",
-    "#AdvHead",
-    "#AdvHeader",
-    "#Adv_Footer",
-    "#Advert1",
-    "#AdvertMid1",
-    "#AdvertMid2",
-    "#AdvertPanel",
-    "#AdvertText",
-    "#AdvertiseFrame",
-    "#Advertisement1",
-    "#Advertisement2",
-    "#AdvertisementDiv",
-    "#AdvertisementLeaderboard",
-    "#Advertisements",
-    "#AdvertisingDiv_0",
-    "#Advertorial",
-    "#Advertorials",
-    "#AnchorAd",
-    "#ArticleContentAd",
-    "#BB1-ad",
-    "#Banner728x90",
-    "#BannerAd",
-    "#BannerAds",
-    "#BannerAdvert",
-    "#BannerAdvertisement",
-    "#BigBoxAd",
-    "#BigboxAdUnit",
-    "#BodyAd",
-    "#BodyTopAds",
-    "#Body_Ad8_divAdd",
-    "#BotAd",
-    "#BottomAdContainer",
-    "#BottomRightAdWrapper",
-    "#ButtonAd",
-    "#ContentAd",
-    "#Content_CA_AD_0_BC",
-    "#Content_CA_AD_1_BC",
-    "#DFP_top_leaderboard",
-    "#FooterAd",
-    "#FooterAdBlock",
-    "#FooterAdContainer",
-    "#GoogleAd",
-    "#GoogleAd1",
-    "#GoogleAd2",
-    "#GoogleAd3",
-    "#GoogleAdRight",
-    "#GoogleAdTop",
-    "#GoogleAdsense",
-    "#HP1-ad",
-    "#HP2-ad",
-    "#HeadAd",
-    "#HeaderAD",
-    "#HeaderAd",
-    "#HeaderAdBlock",
-    "#HeaderAdsBlock",
-    "#HeroAd",
-    "#HomeAd1",
-    "#HouseAd",
-    "#IB-ads",
-    "#IC1-ad",
-    "#IC2-ad",
-    "#IC3-ad",
-    "#IC4-ad",
-    "#IFrameAd",
-    "#IFrameAd1",
-    "#IK-ad-area",
-    "#IK-ad-block",
-    "#IM_AD",
-    "#LargeRectangleAd",
-    "#LayoutBottomAdBox",
-    "#LayoutHomeAdBoxBottom",
-    "#LeaderboardAdvertising",
-    "#LeftAd",
-    "#LeftAd1",
-    "#MPUAdSpace",
-    "#MPUadvertising",
-    "#MPUadvertisingDetail",
-    "#MainAd",
-    "#MainAd1",
-    "#MainContent_ucTopRightAdvert",
-    "#MediumRectangleAD",
-    "#MidPageAds",
-    "#MiddleRightRadvertisement",
-    "#Mpu_Bottom",
-    "#Mpu_Top",
-    "#MyAdsId3",
-    "#N-ad-article-rightRail-1",
-    "#NR-Ads",
-    "#NavAD",
-    "#OAS2",
-    "#OASMiddleAd",
-    "#OASRightAd",
-    "#PaneAdvertisingContainer",
-    "#PromotionAdBox",
-    "#PushDownAd",
-    "#RadAdSkyscraper",
-    "#RightAd",
-    "#RightAdBlock",
-    "#RightAdSpace",
-    "#RightAdvertisement",
-    "#SidebarAd",
-    "#SidebarAdContainer",
-    "#SitenavAdslot",
-    "#SkyAd",
-    "#SkyscraperAD",
-    "#SponsoredAd",
-    "#SponsoredAds",
-    "#SponsoredLinks",
-    "#SponsorsAds",
-    "#StickyBannerAd",
-    "#Top-Ad-Container",
-    "#Top-ad",
-    "#Top1AdWrapper",
-    "#TopADs",
-    "#TopAd",
-    "#TopAd0",
-    "#TopAdBox",
-    "#TopAdContainer",
-    "#TopAdDiv",
-    "#TopAdPlacement",
-    "#TopAdPos",
-    "#TopAdTable",
-    "#TopAdvert",
-    "#TopBannerAd",
-    "#TopRightRadvertisement",
-    "#VPNAdvert",
-    "#WelcomeAd",
-    "#WidgetADVMIDDLE",
-    "#aad-header-1",
-    "#aad-header-2",
-    "#aad-header-3",
-    "#ab_adblock",
-    "#above-comments-ad",
-    "#above-fold-ad",
-    "#above-footer-ads",
-    "#above-the-fold-ad",
-    "#aboveAd",
-    "#aboveNodeAds",
-    "#above_button_ad",
-    "#aboveplayerad",
-    "#abovepostads",
-    "#acm-ad-tag-lawrence_dfp_mobile_arkadium",
-    "#ad--article--home-mobile-paramount-wrapper",
-    "#ad--article-bottom-wrapper",
-    "#ad--article-top",
-    "#ad--sidebar",
-    "#ad-0",
-    "#ad-1",
-    "#ad-125x125",
-    "#ad-160",
-    "#ad-160x600",
-    "#ad-2",
-    "#ad-2-160x600",
-    "#ad-250",
-    "#ad-250x300",
-    "#ad-3",
-    "#ad-3-300x250",
-    "#ad-300",
-    "#ad-300-250",
-    "#ad-300-additional",
-    "#ad-300-detail",
-    "#ad-300-sidebar",
-    "#ad-300X250-2",
-    "#ad-300a",
-    "#ad-300b",
-    "#ad-300x250",
-    "#ad-300x250-0",
-    "#ad-300x250-2",
-    "#ad-300x250-b",
-    "#ad-300x250-sidebar",
-    "#ad-300x250-wrapper",
-    "#ad-300x250_mid",
-    "#ad-300x250_mobile",
-    "#ad-300x250_top",
-    "#ad-300x600_top",
-    "#ad-4",
-    "#ad-5",
-    "#ad-6",
-    "#ad-7",
-    "#ad-728",
-    "#ad-728-90",
-    "#ad-728x90",
-    "#ad-8",
-    "#ad-9",
-    "#ad-Content_1",
-    "#ad-Content_2",
-    "#ad-Rectangle_1",
-    "#ad-Rectangle_2",
-    "#ad-Superbanner",
-    "#ad-a",
-    "#ad-ads",
-    "#ad-advertorial",
-    "#ad-affiliate",
-    "#ad-after",
-    "#ad-anchor",
-    "#ad-around-the-web",
-    "#ad-article",
-    "#ad-article-in",
-    "#ad-aside-1",
-    "#ad-background",
-    "#ad-ban",
-    "#ad-banner-1",
-    "#ad-banner-atf",
-    "#ad-banner-bottom",
-    "#ad-banner-btf",
-    "#ad-banner-desktop",
-    "#ad-banner-image",
-    "#ad-banner-placement",
-    "#ad-banner-top",
-    "#ad-banner-wrap",
-    "#ad-banner_atf-label",
-    "#ad-bar",
-    "#ad-base",
-    "#ad-bb-content",
-    "#ad-below-content",
-    "#ad-bg",
-    "#ad-big",
-    "#ad-bigbox",
-    "#ad-bigsize",
-    "#ad-billboard",
-    "#ad-billboard-atf",
-    "#ad-billboard-bottom",
-    "#ad-billboard01",
-    "#ad-blade",
-    "#ad-block",
-    "#ad-block-125",
-    "#ad-block-2",
-    "#ad-block-aa",
-    "#ad-block-bottom",
-    "#ad-block-container",
-    "#ad-border",
-    "#ad-bottom",
-    "#ad-bottom-banner",
-    "#ad-bottom-fixed",
-    "#ad-bottom-right-container",
-    "#ad-bottom-wrapper",
-    "#ad-bottomright",
-    "#ad-box",
-    "#ad-box-1",
-    "#ad-box-2",
-    "#ad-box-bottom",
-    "#ad-box-halfpage",
-    "#ad-box-leaderboard",
-    "#ad-box-left",
-    "#ad-box-rectangle",
-    "#ad-box-rectangle-2",
-    "#ad-box-right",
-    "#ad-box1",
-    "#ad-box2",
-    "#ad-boxes",
-    "#ad-break",
-    "#ad-bs",
-    "#ad-btm",
-    "#ad-buttons",
-    "#ad-campaign",
-    "#ad-carousel",
-    "#ad-case",
-    "#ad-center",
-    "#ad-chips",
-    "#ad-circfooter",
-    "#ad-code",
-    "#ad-col",
-    "#ad-container-banner",
-    "#ad-container-fullpage",
-    "#ad-container-inner",
-    "#ad-container-leaderboard",
-    "#ad-container-mpu",
-    "#ad-container-outer",
-    "#ad-container-overlay",
-    "#ad-container-top-placeholder",
-    "#ad-container1",
-    "#ad-contentad",
-    "#ad-desktop-bottom",
-    "#ad-desktop-takeover-home",
-    "#ad-desktop-takeover-int",
-    "#ad-desktop-top",
-    "#ad-desktop-wrap",
-    "#ad-discover",
-    "#ad-display-ad",
-    "#ad-display-ad-placeholder",
-    "#ad-div-leaderboard",
-    "#ad-drawer",
-    "#ad-ear",
-    "#ad-extra-flat",
-    "#ad-featured-right",
-    "#ad-fixed-bottom",
-    "#ad-flex-top",
-    "#ad-flyout",
-    "#ad-footer-728x90",
-    "#ad-framework-top",
-    "#ad-front-btf",
-    "#ad-front-footer",
-    "#ad-full-width",
-    "#ad-fullbanner-btf",
-    "#ad-fullbanner-outer",
-    "#ad-fullbanner2",
-    "#ad-fullwidth",
-    "#ad-googleAdSense",
-    "#ad-gutter-left",
-    "#ad-gutter-right",
-    "#ad-halfpage",
-    "#ad-halfpage1",
-    "#ad-halfpage2",
-    "#ad-head",
-    "#ad-header-1",
-    "#ad-header-2",
-    "#ad-header-3",
-    "#ad-header-left",
-    "#ad-header-mad",
-    "#ad-header-mobile",
-    "#ad-header-right",
-    "#ad-holder",
-    "#ad-horizontal",
-    "#ad-horizontal-header",
-    "#ad-horizontal-top",
-    "#ad-incontent",
-    "#ad-index",
-    "#ad-inline-block",
-    "#ad-inside1",
-    "#ad-inside2",
-    "#ad-label2",
-    "#ad-large-banner-top",
-    "#ad-large-header",
-    "#ad-lb-secondary",
-    "#ad-lead",
-    "#ad-leadboard1",
-    "#ad-leadboard2",
-    "#ad-leader",
-    "#ad-leader-atf",
-    "#ad-leader-container",
-    "#ad-leader-wrapper",
-    "#ad-leaderboard",
-    "#ad-leaderboard-atf",
-    "#ad-leaderboard-bottom",
-    "#ad-leaderboard-container",
-    "#ad-leaderboard-footer",
-    "#ad-leaderboard-header",
-    "#ad-leaderboard-spot",
-    "#ad-leaderboard-top",
-    "#ad-leaderboard970x90home",
-    "#ad-leaderboard970x90int",
-    "#ad-leaderboard_bottom",
-    "#ad-leadertop",
-    "#ad-lrec",
-    "#ad-m-rec-content",
-    "#ad-main",
-    "#ad-main-bottom",
-    "#ad-main-top",
-    "#ad-makeup",
-    "#ad-manager",
-    "#ad-masthead",
-    "#ad-medium",
-    "#ad-medium-lower",
-    "#ad-medium-rectangle",
-    "#ad-medrec",
-    "#ad-medrec-article-container",
-    "#ad-medrec__first",
-    "#ad-mid",
-    "#ad-mid-rect",
-    "#ad-middle",
-    "#ad-midpage",
-    "#ad-minibar",
-    "#ad-module",
-    "#ad-mpu",
-    "#ad-mrec",
-    "#ad-mrec2",
-    "#ad-new",
-    "#ad-north",
-    "#ad-one",
-    "#ad-other",
-    "#ad-output",
-    "#ad-overlay",
-    "#ad-p3",
-    "#ad-page-1",
-    "#ad-pan3l",
-    "#ad-panel",
-    "#ad-pencil",
-    "#ad-performance",
-    "#ad-performanceFullbanner1",
-    "#ad-performanceRectangle1",
-    "#ad-placeholder",
-    "#ad-placeholder-horizontal",
-    "#ad-placeholder-vertical",
-    "#ad-placement",
-    "#ad-plate",
-    "#ad-player",
-    "#ad-popup",
-    "#ad-popup-home",
-    "#ad-popup-int",
-    "#ad-post",
-    "#ad-promo",
-    "#ad-push",
-    "#ad-pushdown",
-    "#ad-r",
-    "#ad-rec-atf",
-    "#ad-rec-btf",
-    "#ad-rec-btf-top",
-    "#ad-rect",
-    "#ad-rectangle",
-    "#ad-rectangle1",
-    "#ad-rectangle2",
-    "#ad-rectangle3",
-    "#ad-results",
-    "#ad-right",
-    "#ad-right-bar-tall",
-    "#ad-right-container",
-    "#ad-right-sidebar",
-    "#ad-right-top",
-    "#ad-right2",
-    "#ad-right3",
-    "#ad-rotator",
-    "#ad-row",
-    "#ad-section",
-    "#ad-separator",
-    "#ad-shop",
-    "#ad-side",
-    "#ad-side-text",
-    "#ad-sidebar",
-    "#ad-sidebar-btf",
-    "#ad-sidebar-container",
-    "#ad-sidebar-mad",
-    "#ad-sidebar-mad-wrapper",
-    "#ad-sidebar1",
-    "#ad-sidebar2",
-    "#ad-site-header",
-    "#ad-skin",
-    "#ad-skm-below-content",
-    "#ad-sky",
-    "#ad-skyscraper",
-    "#ad-slideshow",
-    "#ad-slideshow2",
-    "#ad-slot",
-    "#ad-slot-1",
-    "#ad-slot-2",
-    "#ad-slot-3",
-    "#ad-slot-4",
-    "#ad-slot-5",
-    "#ad-slot-502",
-    "#ad-slot-lb",
-    "#ad-slot-right",
-    "#ad-slot-top",
-    "#ad-slot1",
-    "#ad-slot2",
-    "#ad-slot4",
-    "#ad-slug-wrapper",
-    "#ad-small-banner",
-    "#ad-space",
-    "#ad-space-1",
-    "#ad-space-2",
-    "#ad-space-big",
-    "#ad-special",
-    "#ad-splash",
-    "#ad-sponsors",
-    "#ad-spot",
-    "#ad-spot-bottom",
-    "#ad-spot-one",
-    "#ad-squares",
-    "#ad-standard",
-    "#ad-standard-wrap",
-    "#ad-startProMaps",
-    "#ad-stickers",
-    "#ad-sticky-footer-container",
-    "#ad-story-right",
-    "#ad-story-top",
-    "#ad-stripe",
-    "#ad-tab",
-    "#ad-tape",
-    "#ad-target",
-    "#ad-target-Leaderbord",
-    "#ad-teaser",
-    "#ad-text",
-    "#ad-three",
-    "#ad-top",
-    "#ad-top-250",
-    "#ad-top-300x250",
-    "#ad-top-728",
-    "#ad-top-banner",
-    "#ad-top-leaderboard",
-    "#ad-top-left",
-    "#ad-top-lock",
-    "#ad-top-low",
-    "#ad-top-right",
-    "#ad-top-right-container",
-    "#ad-top-text-low",
-    "#ad-top-wrap",
-    "#ad-top-wrapper",
-    "#ad-tower",
-    "#ad-two",
-    "#ad-undefined",
-    "#ad-unit-right-bottom-160-600",
-    "#ad-unit-right-middle-300-250",
-    "#ad-unit-top-banner",
-    "#ad-vip-article",
-    "#ad-west",
-    "#ad-wide-leaderboard",
-    "#ad-wrap",
-    "#ad-wrap2",
-    "#ad-wrapper",
-    "#ad-wrapper-728x90",
-    "#ad-wrapper-footer-1",
-    "#ad-wrapper-main-1",
-    "#ad-wrapper-sidebar-1",
-    "#ad-wrapper-top-1",
-    "#ad-wrapper1",
-    "#ad1-placeholder",
-    "#ad11",
-    "#ad125B",
-    "#ad125x125",
-    "#ad160",
-    "#ad160-2",
-    "#ad160600",
-    "#ad160a",
-    "#ad160x600",
-    "#ad2-home",
-    "#ad2-label",
-    "#ad250",
-    "#ad2_footer",
-    "#ad2_iframe",
-    "#ad2_inline",
-    "#ad300",
-    "#ad300-250",
-    "#ad300-title",
-    "#ad300X250",
-    "#ad300_250",
-    "#ad300x250Module",
-    "#ad31",
-    "#ad32",
-    "#ad336",
-    "#ad336x280",
-    "#ad468",
-    "#ad468_hidden",
-    "#ad468x60",
-    "#ad468x60-story",
-    "#ad468x60_top",
-    "#ad480x60",
-    "#ad6",
-    "#ad600",
-    "#ad600x90",
-    "#ad650",
-    "#ad728",
-    "#ad72890",
-    "#ad728Bottom",
-    "#ad728Box",
-    "#ad728Header",
-    "#ad728Mid",
-    "#ad728Top",
-    "#ad728Wrapper",
-    "#ad728X90",
-    "#ad728foot",
-    "#ad728h",
-    "#ad728top",
-    "#ad728x90",
-    "#ad728x90_1",
-    "#ad90",
-    "#ad900",
-    "#ad970",
-    "#ad970x90_exp",
-    "#adATF300x250",
-    "#adATF728x90",
-    "#adATFLeaderboard",
-    "#adAside",
-    "#adBTF300x250",
-    "#adBadges",
-    "#adBanner1",
-    "#adBanner336x280",
-    "#adBannerBottom",
-    "#adBannerHeader",
-    "#adBannerSpacer",
-    "#adBannerTable",
-    "#adBannerTop",
-    "#adBar",
-    "#adBelt",
-    "#adBillboard",
-    "#adBlock01",
-    "#adBlockBanner",
-    "#adBlockContainer",
-    "#adBlockContent",
-    "#adBlockOverlay",
-    "#adBlocks",
-    "#adBottom",
-    "#adBox",
-    "#adBrandDev",
-    "#adBrandingStation",
-    "#adBreak",
-    "#adCarousel",
-    "#adChannel",
-    "#adChoiceFooter",
-    "#adChoices",
-    "#adChoicesIcon",
-    "#adChoicesLogo",
-    "#adCol",
-    "#adColumn",
-    "#adColumn3",
-    "#adComponentWrapper",
-    "#adContainer",
-    "#adContainerMobile",
-    "#adContainer_1",
-    "#adContainer_2",
-    "#adContainer_3",
-    "#adContent",
-    "#adContentHolder",
-    "#adContext",
-    "#adDiv",
-    "#adDiv0",
-    "#adDiv1",
-    "#adDiv300",
-    "#adDiv4",
-    "#adDiv728",
-    "#adDivContainer",
-    "#adFiller",
-    "#adFlashDiv",
-    "#adFooter",
-    "#adFot",
-    "#adFrame",
-    "#adGallery",
-    "#adGoogleText",
-    "#adHeader",
-    "#adHeaderTop",
-    "#adHeaderWrapper",
-    "#adHeading",
-    "#adHeightstory",
-    "#adHolder",
-    "#adHolder1",
-    "#adHolder2",
-    "#adHolder3",
-    "#adHolder4",
-    "#adHolder5",
-    "#adHolder6",
-    "#adHome",
-    "#adHomeTop",
-    "#adIframe",
-    "#adInhouse",
-    "#adIsland",
-    "#adLB",
-    "#adLabel",
-    "#adLarge",
-    "#adLayer",
-    "#adLayerTop",
-    "#adLayout",
-    "#adLeader",
-    "#adLeaderTop",
-    "#adLeaderboard",
-    "#adLeaderboard-middle",
-    "#adLeft",
-    "#adLink",
-    "#adLink1",
-    "#adLounge",
-    "#adLrec",
-    "#adMOBILETOP",
-    "#adMPU",
-    "#adMPUHolder",
-    "#adMain",
-    "#adMarketplace",
-    "#adMed",
-    "#adMedRect",
-    "#adMediumRectangle",
-    "#adMeld",
-    "#adMessage",
-    "#adMid2",
-    "#adMpu",
-    "#adMpuBottom",
-    "#adOuter",
-    "#adPartnerLinks",
-    "#adPlaceHolder1",
-    "#adPlaceHolder2",
-    "#adPlacement_1",
-    "#adPlacement_2",
-    "#adPlacement_3",
-    "#adPlacement_4",
-    "#adPlacement_7",
-    "#adPlacement_8",
-    "#adPlacement_9",
-    "#adPlacer",
-    "#adPopover",
-    "#adPopup",
-    "#adPosition0",
-    "#adPosition14",
-    "#adPosition5",
-    "#adPosition6",
-    "#adPosition7",
-    "#adPosition9",
-    "#adPush",
-    "#adPushdown1",
-    "#adReady",
-    "#adRight",
-    "#adRight1",
-    "#adRight2",
-    "#adRight3",
-    "#adRight4",
-    "#adRight5",
-    "#adScraper",
-    "#adSection",
-    "#adSenseBox",
-    "#adSenseModule",
-    "#adSenseWrapper",
-    "#adSet",
-    "#adSide",
-    "#adSide1-container",
-    "#adSideButton",
-    "#adSidebar",
-    "#adSite",
-    "#adSkin",
-    "#adSkinBackdrop",
-    "#adSkinLeft",
-    "#adSkinRight",
-    "#adSky",
-    "#adSkyPosition",
-    "#adSkyscraper",
-    "#adSlider",
-    "#adSlot-dmpu",
-    "#adSlot-dontMissLarge",
-    "#adSlot-leader",
-    "#adSlot-leaderBottom",
-    "#adSlot1",
-    "#adSlot2",
-    "#adSlot3",
-    "#adSlot4",
-    "#adSlug",
-    "#adSpace",
-    "#adSpaceBottom",
-    "#adSpaceHeight",
-    "#adSpacer",
-    "#adSpecial",
-    "#adSqb",
-    "#adSquare",
-    "#adStrip",
-    "#adSuperBannerContainer",
-    "#adSuperbanner",
-    "#adTag",
-    "#adText",
-    "#adTextLink",
-    "#adTile",
-    "#adTop",
-    "#adTopContent",
-    "#adTopLREC",
-    "#adTopLarge",
-    "#adTopModule",
-    "#adTower",
-    "#adUnderArticle",
-    "#adUnit",
-    "#adWideSkyscraper",
-    "#adWrap",
-    "#adWrapper",
-    "#adWrapperSky",
-    "#ad_1",
-    "#ad_160",
-    "#ad_160_600",
-    "#ad_160_600_2",
-    "#ad_160x160",
-    "#ad_160x600",
-    "#ad_2",
-    "#ad_250",
-    "#ad_250x250",
-    "#ad_3",
-    "#ad_300",
-    "#ad_300_250",
-    "#ad_300_250_1",
-    "#ad_300x250",
-    "#ad_336",
-    "#ad_4",
-    "#ad_468_60",
-    "#ad_468x60",
-    "#ad_5",
-    "#ad_728",
-    "#ad_728_90",
-    "#ad_728x90",
-    "#ad_8",
-    "#ad_9",
-    "#ad_B1",
-    "#ad_Banner",
-    "#ad_Bottom",
-    "#ad_LargeRec01",
-    "#ad_Middle",
-    "#ad_Middle1",
-    "#ad_Pushdown",
-    "#ad_R1",
-    "#ad_Right",
-    "#ad_Top",
-    "#ad_Wrap",
-    "#ad__billboard",
-    "#ad_ad",
-    "#ad_adsense",
-    "#ad_after_header_1",
-    "#ad_anchor",
-    "#ad_area",
-    "#ad_article1_1",
-    "#ad_article1_2",
-    "#ad_article2_1",
-    "#ad_article2_2",
-    "#ad_article3_1",
-    "#ad_article3_2",
-    "#ad_banner",
-    "#ad_banner_1",
-    "#ad_banner_468x60",
-    "#ad_banner_728x90",
-    "#ad_banner_bot",
-    "#ad_banner_top",
-    "#ad_banners",
-    "#ad_bar",
-    "#ad_bar_rect",
-    "#ad_before_header",
-    "#ad_bg",
-    "#ad_bg_image",
-    "#ad_big",
-    "#ad_bigbox",
-    "#ad_bigbox_companion",
-    "#ad_bigrectangle",
-    "#ad_billboard",
-    "#ad_block",
-    "#ad_block_0",
-    "#ad_block_1",
-    "#ad_block_2",
-    "#ad_block_mpu",
-    "#ad_bnr_atf_01",
-    "#ad_bnr_atf_02",
-    "#ad_bnr_atf_03",
-    "#ad_bnr_btf_07",
-    "#ad_bnr_btf_08",
-    "#ad_body",
-    "#ad_bottom",
-    "#ad_box",
-    "#ad_box_top",
-    "#ad_branding",
-    "#ad_bsb",
-    "#ad_bsb_cont",
-    "#ad_btmslot",
-    "#ad_button",
-    "#ad_buttons",
-    "#ad_cell",
-    "#ad_center",
-    "#ad_choices",
-    "#ad_close",
-    "#ad_closebtn",
-    "#ad_comments",
-    "#ad_cont",
-    "#ad_cont_superbanner",
-    "#ad_container",
-    "#ad_container_0",
-    "#ad_container_300x250",
-    "#ad_container_side",
-    "#ad_container_sidebar",
-    "#ad_container_top",
-    "#ad_content",
-    "#ad_content_1",
-    "#ad_content_2",
-    "#ad_content_3",
-    "#ad_content_fullsize",
-    "#ad_content_primary",
-    "#ad_content_right",
-    "#ad_content_top",
-    "#ad_content_wrap",
-    "#ad_contentslot_1",
-    "#ad_contentslot_2",
-    "#ad_creative_2",
-    "#ad_creative_3",
-    "#ad_creative_5",
-    "#ad_dfp_rec1",
-    "#ad_display_300_250",
-    "#ad_display_728_90",
-    "#ad_div",
-    "#ad_div_bottom",
-    "#ad_div_top",
-    "#ad_feedback",
-    "#ad_foot",
-    "#ad_footer",
-    "#ad_footer1",
-    "#ad_footerAd",
-    "#ad_frame",
-    "#ad_frame1",
-    "#ad_from_bottom",
-    "#ad_fullbanner",
-    "#ad_gallery",
-    "#ad_gallery_bot",
-    "#ad_global_300x250",
-    "#ad_global_above_footer",
-    "#ad_global_header",
-    "#ad_global_header1",
-    "#ad_global_header2",
-    "#ad_h3",
-    "#ad_halfpage",
-    "#ad_head",
-    "#ad_header",
-    "#ad_header_1",
-    "#ad_header_container",
-    "#ad_holder",
-    "#ad_home",
-    "#ad_home_middle",
-    "#ad_horizontal",
-    "#ad_houseslot_a",
-    "#ad_houseslot_b",
-    "#ad_hp",
-    "#ad_img",
-    "#ad_interthread",
-    "#ad_island",
-    "#ad_island2",
-    "#ad_label",
-    "#ad_large",
-    "#ad_large_rectangular",
-    "#ad_lateral",
-    "#ad_layer",
-    "#ad_ldb",
-    "#ad_lead1",
-    "#ad_leader",
-    "#ad_leaderBoard",
-    "#ad_leaderboard",
-    "#ad_leaderboard_top",
-    "#ad_left",
-    "#ad_left_1",
-    "#ad_left_2",
-    "#ad_left_3",
-    "#ad_left_skyscraper",
-    "#ad_left_top",
-    "#ad_leftslot",
-    "#ad_link",
-    "#ad_links",
-    "#ad_links_footer",
-    "#ad_lnk",
-    "#ad_lrec",
-    "#ad_lwr_square",
-    "#ad_main",
-    "#ad_main_leader",
-    "#ad_main_top",
-    "#ad_marginal",
-    "#ad_marker",
-    "#ad_mast",
-    "#ad_med_rect",
-    "#ad_medium",
-    "#ad_medium_rectangle",
-    "#ad_medium_rectangular",
-    "#ad_mediumrectangle",
-    "#ad_message",
-    "#ad_middle",
-    "#ad_middle_bottom",
-    "#ad_midstrip",
-    "#ad_mobile",
-    "#ad_module",
-    "#ad_mpu",
-    "#ad_mpu2",
-    "#ad_mpu300x250",
-    "#ad_mrec",
-    "#ad_mrec1",
-    "#ad_mrec2",
-    "#ad_mrec_intext",
-    "#ad_mrec_intext2",
-    "#ad_new",
-    "#ad_news_article",
-    "#ad_newsletter",
-    "#ad_one",
-    "#ad_overlay",
-    "#ad_overlayer",
-    "#ad_panel",
-    "#ad_panorama_top",
-    "#ad_pencil",
-    "#ad_place",
-    "#ad_placeholder",
-    "#ad_play_300",
-    "#ad_player",
-    "#ad_plugs",
-    "#ad_popup_background",
-    "#ad_popup_wrapper",
-    "#ad_post",
-    "#ad_post_300",
-    "#ad_poster",
-    "#ad_primary",
-    "#ad_primaryAd",
-    "#ad_promoAd",
-    "#ad_publicidad",
-    "#ad_rail",
-    "#ad_rec_01",
-    "#ad_rect",
-    "#ad_rect1",
-    "#ad_rect2",
-    "#ad_rect3",
-    "#ad_rect_body",
-    "#ad_rect_bottom",
-    "#ad_rect_btf_01",
-    "#ad_rect_btf_02",
-    "#ad_rect_btf_03",
-    "#ad_rect_btf_04",
-    "#ad_rect_btf_05",
-    "#ad_rectangle",
-    "#ad_region1",
-    "#ad_region2",
-    "#ad_region3",
-    "#ad_region5",
-    "#ad_results",
-    "#ad_right",
-    "#ad_right_box",
-    "#ad_right_top",
-    "#ad_rightslot",
-    "#ad_rotator-2",
-    "#ad_rotator-3",
-    "#ad_row",
-    "#ad_row_home",
-    "#ad_rr_1",
-    "#ad_sec",
-    "#ad_sec_div",
-    "#ad_secondary",
-    "#ad_sgd",
-    "#ad_short",
-    "#ad_sidebar",
-    "#ad_sidebar1",
-    "#ad_sidebar2",
-    "#ad_sidebar3",
-    "#ad_sidebar_1",
-    "#ad_sidebar_left_container",
-    "#ad_sidebar_news",
-    "#ad_sidebar_top",
-    "#ad_sidebody",
-    "#ad_site_header",
-    "#ad_sitebar",
-    "#ad_skin",
-    "#ad_slot",
-    "#ad_slot_bottom",
-    "#ad_slot_leaderboard",
-    "#ad_small",
-    "#ad_space_top",
-    "#ad_sponsored",
-    "#ad_spot_a",
-    "#ad_spot_b",
-    "#ad_spotlight",
-    "#ad_square",
-    "#ad_squares",
-    "#ad_ss",
-    "#ad_stck",
-    "#ad_sticky_wrap",
-    "#ad_strip",
-    "#ad_superbanner",
-    "#ad_table",
-    "#ad_takeover",
-    "#ad_tall",
-    "#ad_tbl",
-    "#ad_top",
-    "#ad_topBanner",
-    "#ad_topScroller",
-    "#ad_top_728x90",
-    "#ad_top_banner",
-    "#ad_top_bar",
-    "#ad_top_holder",
-    "#ad_topbanner",
-    "#ad_topmob",
-    "#ad_topnav",
-    "#ad_topslot",
-    "#ad_two",
-    "#ad_txt",
-    "#ad_under_game",
-    "#ad_unit",
-    "#ad_unit1",
-    "#ad_unit2",
-    "#ad_vertical",
-    "#ad_video_abovePlayer",
-    "#ad_video_belowPlayer",
-    "#ad_video_large",
-    "#ad_video_root",
-    "#ad_wallpaper",
-    "#ad_wide",
-    "#ad_wide_box",
-    "#ad_wideboard",
-    "#ad_widget",
-    "#ad_widget_1",
-    "#ad_window",
-    "#ad_wp",
-    "#ad_wp_base",
-    "#ad_wrap",
-    "#ad_wrapper",
-    "#ad_wrapper1",
-    "#ad_wrapper2",
-    "#ad_xrail_top",
-    "#ad_zone",
-    "#adaptvcompanion",
-    "#adb-top",
-    "#adbForum",
-    "#adb_bottom",
-    "#adbackground",
-    "#adbanner-container",
-    "#adbanner1",
-    "#adbannerbox",
-    "#adbannerdiv",
-    "#adbannerleft",
-    "#adbannerright",
-    "#adbannerwidget",
-    "#adbar",
-    "#adbig",
-    "#adbineScroll",
-    "#adblade",
-    "#adblade_ad",
-    "#adblkad",
-    "#adblock-300x250",
-    "#adblock-big",
-    "#adblock-leaderboard",
-    "#adblock-small",
-    "#adblock1",
-    "#adblock2",
-    "#adblock4",
-    "#adblockbottom",
-    "#adbn",
-    "#adbnr",
-    "#adboard",
-    "#adbody",
-    "#adbottom",
-    "#adbottomleft",
-    "#adbottomright",
-    "#adbox",
-    "#adbox--hot_news_ad",
-    "#adbox--page_bottom_ad",
-    "#adbox--page_top_ad",
-    "#adbox-inarticle",
-    "#adbox-topbanner",
-    "#adbox1",
-    "#adbox2",
-    "#adbox_content",
-    "#adbox_right",
-    "#adbutton",
-    "#adbuttons",
-    "#adcell",
-    "#adcenter",
-    "#adcenter2",
-    "#adcenter4",
-    "#adchoices-icon",
-    "#adchoicesBtn",
-    "#adclear",
-    "#adclose",
-    "#adcode",
-    "#adcolContent",
-    "#adcolumn",
-    "#adcontainer",
-    "#adcontainer1",
-    "#adcontainer2",
-    "#adcontainer3",
-    "#adcontainer5",
-    "#adcontainerRight",
-    "#adcontainer_ad_content_top",
-    "#adcontent",
-    "#adcontent1",
-    "#adcontent2",
-    "#adcontextlinks",
-    "#addbottomleft",
-    "#addvert",
-    "#adfactor-label",
-    "#adfloat",
-    "#adfooter",
-    "#adfooter_728x90",
-    "#adform_leaderboard",
-    "#adform_leaderboard_cover",
-    "#adframe:not(frameset)",
-    "#adframetop",
-    "#adfreeDeskSpace",
-    "#adhalfpage",
-    "#adhead",
-    "#adheader",
-    "#adhesion",
-    "#adhesionAdSlot",
-    "#adhesionUnit",
-    "#adhide",
-    "#adholder",
-    "#adholderContainerHeader",
-    "#adhome",
-    "#adhomepage",
-    "#adjacency",
-    "#adlabel",
-    "#adlabelFooter",
-    "#adlabelfooter",
-    "#adlabelheader",
-    "#adlanding",
-    "#adlayer",
-    "#adlayerContainer",
-    "#adlayerad",
-    "#adleaderboard",
-    "#adleaderboard_flex",
-    "#adleft",
-    "#adlinks",
-    "#adlrec",
-    "#adm-inline-article-ad-1",
-    "#adm-inline-article-ad-2",
-    "#admain",
-    "#admaintop",
-    "#admasthead",
-    "#admid",
-    "#admiddleCenter",
-    "#admobilefoot",
-    "#admobilefootinside",
-    "#admobilemiddle",
-    "#admobiletop",
-    "#admobiletopinside",
-    "#admod2",
-    "#admpubottom",
-    "#admpubottom2",
-    "#admpufoot",
-    "#admpumiddle",
-    "#admpumiddle2",
-    "#admputop",
-    "#admputop2",
-    "#admsg",
-    "#adnet",
-    "#adnorth",
-    "#ados1",
-    "#ados2",
-    "#ados3",
-    "#ados4",
-    "#adplace",
-    "#adplacement",
-    "#adpos-top",
-    "#adpos2",
-    "#adposition",
-    "#adposition1",
-    "#adposition10",
-    "#adposition1_container",
-    "#adposition2",
-    "#adposition3",
-    "#adposition4",
-    "#adpositionbottom",
-    "#adpostloader",
-    "#adpromo",
-    "#adrect",
-    "#adrig",
-    "#adright",
-    "#adright2",
-    "#adrightbottom",
-    "#adrightgame",
-    "#adrightrail",
-    "#adriver_middle",
-    "#adriver_top",
-    "#adrotator",
-    "#adrow",
-    "#adrow1",
-    "#adrow3",
-    "#ads-1",
-    "#ads-125",
-    "#ads-160x600",
-    "#ads-200",
-    "#ads-250",
-    "#ads-300",
-    "#ads-300-250",
-    "#ads-336x280",
-    "#ads-468",
-    "#ads-5",
-    "#ads-728x90",
-    "#ads-728x90-I3",
-    "#ads-728x90-I4",
-    "#ads-area",
-    "#ads-article-left",
-    "#ads-banner",
-    "#ads-banner-top",
-    "#ads-bar",
-    "#ads-before-content",
-    "#ads-bg",
-    "#ads-bg-mobile",
-    "#ads-billboard",
-    "#ads-block",
-    "#ads-blog",
-    "#ads-bot",
-    "#ads-bottom",
-    "#ads-by-google",
-    "#ads-col",
-    "#ads-container",
-    "#ads-container-2",
-    "#ads-container-anchor",
-    "#ads-container-single",
-    "#ads-container-top",
-    "#ads-content",
-    "#ads-content-double",
-    "#ads-div2",
-    "#ads-footer",
-    "#ads-footer-inner",
-    "#ads-footer-wrap",
-    "#ads-google",
-    "#ads-header",
-    "#ads-header-728",
-    "#ads-home-468",
-    "#ads-horizontal",
-    "#ads-inread",
-    "#ads-inside-content",
-    "#ads-leader",
-    "#ads-leaderboard",
-    "#ads-leaderboard1",
-    "#ads-left",
-    "#ads-left-top",
-    "#ads-lrec",
-    "#ads-main",
-    "#ads-menu",
-    "#ads-middle",
-    "#ads-mpu",
-    "#ads-outer",
-    "#ads-pagetop",
-    "#ads-panel",
-    "#ads-pop",
-    "#ads-position-header-desktop",
-    "#ads-right",
-    "#ads-right-bottom",
-    "#ads-right-skyscraper",
-    "#ads-right-top",
-    "#ads-slot",
-    "#ads-superBanner",
-    "#ads-text",
-    "#ads-top",
-    "#ads-top-728",
-    "#ads-top-wrap",
-    "#ads-under-rotator",
-    "#ads-vertical",
-    "#ads-vertical-wrapper",
-    "#ads-wrap",
-    "#ads-wrapper",
-    "#ads1",
-    "#ads120",
-    "#ads125",
-    "#ads1_box",
-    "#ads2",
-    "#ads2_block",
-    "#ads2_box",
-    "#ads2_container",
-    "#ads3",
-    "#ads300",
-    "#ads300-250",
-    "#ads300x200",
-    "#ads300x250",
-    "#ads300x250_2",
-    "#ads336x280",
-    "#ads4",
-    "#ads468x60",
-    "#ads50",
-    "#ads7",
-    "#ads728",
-    "#ads72890top",
-    "#ads728bottom",
-    "#ads728top",
-    "#ads728x90",
-    "#ads728x90_2",
-    "#ads728x90top",
-    "#adsBar",
-    "#adsBottom",
-    "#adsContainer",
-    "#adsContent",
-    "#adsDisplay",
-    "#adsHeadLine",
-    "#adsHeader",
-    "#adsHeading",
-    "#adsLREC",
-    "#adsLeft",
-    "#adsLinkFooter",
-    "#adsMobileFixed",
-    "#adsMpu",
-    "#adsPanel",
-    "#adsRight",
-    "#adsRightDiv",
-    "#adsSectionLeft",
-    "#adsSectionRight",
-    "#adsSquare",
-    "#adsTG",
-    "#adsTN",
-    "#adsTop",
-    "#adsTopLeft",
-    "#adsTopMobileFixed",
-    "#adsZone",
-    "#adsZone1",
-    "#adsZone2",
-    "#ads_01",
-    "#ads_0_container",
-    "#ads_160",
-    "#ads_3",
-    "#ads_300",
-    "#ads_300x250",
-    "#ads_4",
-    "#ads_728",
-    "#ads_728x90",
-    "#ads_728x90_top",
-    "#ads_back",
-    "#ads_banner",
-    "#ads_banner1",
-    "#ads_banner_header",
-    "#ads_belownav",
-    "#ads_big",
-    "#ads_block",
-    "#ads_body_1",
-    "#ads_body_2",
-    "#ads_body_3",
-    "#ads_body_4",
-    "#ads_body_5",
-    "#ads_body_6",
-    "#ads_bottom",
-    "#ads_box",
-    "#ads_box1",
-    "#ads_box2",
-    "#ads_box_bottom",
-    "#ads_box_right",
-    "#ads_box_top",
-    "#ads_button",
-    "#ads_campaign",
-    "#ads_catDiv",
-    "#ads_center",
-    "#ads_center_banner",
-    "#ads_central",
-    "#ads_combo2",
-    "#ads_container",
-    "#ads_content",
-    "#ads_desktop_r1",
-    "#ads_desktop_r2",
-    "#ads_expand",
-    "#ads_footer",
-    "#ads_fullsize",
-    "#ads_h",
-    "#ads_h1",
-    "#ads_h2",
-    "#ads_halfsize",
-    "#ads_header",
-    "#ads_horiz",
-    "#ads_horizontal",
-    "#ads_horz",
-    "#ads_in_modal",
-    "#ads_in_video",
-    "#ads_inline_z",
-    "#ads_inner",
-    "#ads_insert_container",
-    "#ads_layout_bottom",
-    "#ads_lb",
-    "#ads_lb_frame",
-    "#ads_leaderbottom",
-    "#ads_left",
-    "#ads_left_top",
-    "#ads_line",
-    "#ads_medrect",
-    "#ads_notice",
-    "#ads_overlay",
-    "#ads_page_top",
-    "#ads_place",
-    "#ads_placeholder",
-    "#ads_player",
-    "#ads_popup",
-    "#ads_right",
-    "#ads_right_sidebar",
-    "#ads_right_top",
-    "#ads_slide_div",
-    "#ads_space",
-    "#ads_space_header",
-    "#ads_superbanner1",
-    "#ads_superbanner2",
-    "#ads_superior",
-    "#ads_td",
-    "#ads_text",
-    "#ads_textlinks",
-    "#ads_title",
-    "#ads_top",
-    "#ads_top2",
-    "#ads_top_banner",
-    "#ads_top_container",
-    "#ads_top_content",
-    "#ads_top_right",
-    "#ads_top_sec",
-    "#ads_topbanner",
-    "#ads_tower1",
-    "#ads_tower_top",
-    "#ads_vert",
-    "#ads_video",
-    "#ads_wide",
-    "#ads_wrapper",
-    "#adsbot",
-    "#adsbottom",
-    "#adsbox",
-    "#adsbox-left",
-    "#adsbox-right",
-    "#adscenter",
-    "#adscolumn",
-    "#adscontainer",
-    "#adscontent",
-    "#adsdiv",
-    "#adsection",
-    "#adsense-2",
-    "#adsense-468x60",
-    "#adsense-area",
-    "#adsense-bottom",
-    "#adsense-header",
-    "#adsense-link",
-    "#adsense-links",
-    "#adsense-middle",
-    "#adsense-post",
-    "#adsense-right",
-    "#adsense-sidebar",
-    "#adsense-tag",
-    "#adsense-text",
-    "#adsense-top",
-    "#adsense-wrap",
-    "#adsense1",
-    "#adsense2",
-    "#adsense2pos",
-    "#adsense468",
-    "#adsense6",
-    "#adsense728",
-    "#adsenseArea",
-    "#adsenseContainer",
-    "#adsenseHeader",
-    "#adsenseLeft",
-    "#adsenseWrap",
-    "#adsense_300x250",
-    "#adsense_banner_top",
-    "#adsense_block",
-    "#adsense_bottom_ad",
-    "#adsense_box",
-    "#adsense_box2",
-    "#adsense_center",
-    "#adsense_image",
-    "#adsense_inline",
-    "#adsense_leaderboard",
-    "#adsense_overlay",
-    "#adsense_r_side_sticky_container",
-    "#adsense_sidebar",
-    "#adsense_top",
-    "#adsenseheader",
-    "#adsensehorizontal",
-    "#adsensempu",
-    "#adsenseskyscraper",
-    "#adsensetext",
-    "#adsensetop",
-    "#adsensewide",
-    "#adserv",
-    "#adsframe_2",
-    "#adsfundo",
-    "#adside",
-    "#adsimage",
-    "#adsitem",
-    "#adskeeper",
-    "#adskinleft",
-    "#adskinlink",
-    "#adskinright",
-    "#adskintop",
-    "#adsky",
-    "#adskyscraper",
-    "#adskyscraper_flex",
-    "#adsleft1",
-    "#adslider",
-    "#adslist",
-    "#adslistbox",
-    "#adslot-below-updated",
-    "#adslot-download-abovefiles",
-    "#adslot-half-page",
-    "#adslot-homepage-middle",
-    "#adslot-infobox",
-    "#adslot-left-skyscraper",
-    "#adslot-side-mrec",
-    "#adslot-site-footer",
-    "#adslot-site-header",
-    "#adslot-sticky-headerbar",
-    "#adslot-top-rectangle",
-    "#adslot1",
-    "#adslot2",
-    "#adslot3",
-    "#adslot300x250ATF",
-    "#adslot300x250BTF",
-    "#adslot4",
-    "#adslot5",
-    "#adslot6",
-    "#adslot7",
-    "#adslot_left",
-    "#adslot_rect",
-    "#adslot_top",
-    "#adsmgid",
-    "#adsmiddle",
-    "#adsonar",
-    "#adspace",
-    "#adspace-1",
-    "#adspace-2",
-    "#adspace-300x250",
-    "#adspace-728",
-    "#adspace-728x90",
-    "#adspace-bottom",
-    "#adspace-leaderboard-top",
-    "#adspace-one",
-    "#adspace-top",
-    "#adspace300x250",
-    "#adspaceBox",
-    "#adspaceRow",
-    "#adspace_header",
-    "#adspace_leaderboard",
-    "#adspace_top",
-    "#adspacer",
-    "#adspan",
-    "#adsplace1",
-    "#adsplace2",
-    "#adsplace4",
-    "#adsplash",
-    "#adspot",
-    "#adspot-bottom",
-    "#adspot-top",
-    "#adspotlight1",
-    "#adsquare",
-    "#adsquare2",
-    "#adsright",
-    "#adsright_header",
-    "#adss",
-    "#adsside",
-    "#adssidebar2",
-    "#adssidebar3",
-    "#adsspace",
-    "#adstext2",
-    "#adstop",
-    "#adstory",
-    "#adstrip",
-    "#adtab",
-    "#adtable_top",
-    "#adtag_banner",
-    "#adtagheader",
-    "#adtagrightcol",
-    "#adtags_left",
-    "#adtaily",
-    "#adtext",
-    "#adtop",
-    "#adtopHeader",
-    "#adtop_dfp",
-    "#adtopbanner",
-    "#adtopbox",
-    "#adtopcenter",
-    "#adtophp",
-    "#adtrafficright",
-    "#adtxt",
-    "#adunit",
-    "#adunit-article-bottom",
-    "#adunit_video",
-    "#adunitl",
-    "#adup-sidebar",
-    "#adv-01",
-    "#adv-300",
-    "#adv-Bottom",
-    "#adv-BoxP",
-    "#adv-Middle",
-    "#adv-Middle1",
-    "#adv-Middle2",
-    "#adv-Scrollable",
-    "#adv-Top",
-    "#adv-TopLeft",
-    "#adv-banner",
-    "#adv-banner-r",
-    "#adv-box",
-    "#adv-companion-iframe",
-    "#adv-container",
-    "#adv-gpt-box-container1",
-    "#adv-gpt-masthead-skin-container1",
-    "#adv-halfpage",
-    "#adv-header",
-    "#adv-leaderblock",
-    "#adv-leaderboard",
-    "#adv-left",
-    "#adv-masthead",
-    "#adv-middle",
-    "#adv-middle1",
-    "#adv-midroll",
-    "#adv-native",
-    "#adv-preroll",
-    "#adv-right",
-    "#adv-right1",
-    "#adv-scrollable",
-    "#adv-sticky-1",
-    "#adv-sticky-2",
-    "#adv-text",
-    "#adv-title",
-    "#adv-top",
-    "#adv-top-skin",
-    "#adv300x250",
-    "#adv300x250container",
-    "#adv468x90",
-    "#adv728",
-    "#adv728x90",
-    "#adv768x90",
-    "#advBoxBottom",
-    "#advCarrousel",
-    "#advHome",
-    "#advHook-Middle1",
-    "#advRectangle",
-    "#advRectangle1",
-    "#advSkin",
-    "#advTop",
-    "#advWrapper",
-    "#adv_300",
-    "#adv_728",
-    "#adv_728x90",
-    "#adv_BoxBottom",
-    "#adv_Inread",
-    "#adv_IntropageOvl",
-    "#adv_LdbMastheadPush",
-    "#adv_Reload",
-    "#adv_Skin",
-    "#adv_bootom",
-    "#adv_border",
-    "#adv_center",
-    "#adv_config",
-    "#adv_contents",
-    "#adv_footer",
-    "#adv_holder",
-    "#adv_leaderboard",
-    "#adv_mob",
-    "#adv_mpu1",
-    "#adv_mpu2",
-    "#adv_network",
-    "#adv_overlay",
-    "#adv_overlay_content",
-    "#adv_r",
-    "#adv_right",
-    "#adv_skin",
-    "#adv_sky",
-    "#adv_textlink",
-    "#adv_top",
-    "#adv_wallpaper",
-    "#adv_wallpaper2",
-    "#adver",
-    "#adver-top",
-    "#adverFrame",
-    "#advert-1",
-    "#advert-120",
-    "#advert-2",
-    "#advert-ahead",
-    "#advert-article",
-    "#advert-article-1",
-    "#advert-article-2",
-    "#advert-article-3",
-    "#advert-banner",
-    "#advert-banner-container",
-    "#advert-banner-wrap",
-    "#advert-banner2",
-    "#advert-block",
-    "#advert-boomer",
-    "#advert-box",
-    "#advert-column",
-    "#advert-container-top",
-    "#advert-display",
-    "#advert-fireplace",
-    "#advert-footer",
-    "#advert-footer-hidden",
-    "#advert-header",
-    "#advert-island",
-    "#advert-leaderboard",
-    "#advert-left",
-    "#advert-mpu",
-    "#advert-posterad",
-    "#advert-rectangle",
-    "#advert-right",
-    "#advert-sky",
-    "#advert-skyscaper",
-    "#advert-skyscraper",
-    "#advert-slider-top",
-    "#advert-stickysky",
-    "#advert-text",
-    "#advert-top",
-    "#advert-top-banner",
-    "#advert-wrapper",
-    "#advert1",
-    "#advert2",
-    "#advert300x260",
-    "#advert50",
-    "#advertBanner",
-    "#advertBox",
-    "#advertBoxRight",
-    "#advertBoxSquare",
-    "#advertColumn",
-    "#advertContainer",
-    "#advertDB",
-    "#advertMPUContainer",
-    "#advertOverlay",
-    "#advertRight",
-    "#advertSection",
-    "#advertTop",
-    "#advertTopLarge",
-    "#advertTopSmall",
-    "#advertTower",
-    "#advertWrapper",
-    "#advert_1",
-    "#advert_banner",
-    "#advert_belowmenu",
-    "#advert_box",
-    "#advert_container",
-    "#advert_container_300",
-    "#advert_header",
-    "#advert_leaderboard",
-    "#advert_media",
-    "#advert_mid",
-    "#advert_mpu",
-    "#advert_mpu_1",
-    "#advert_mpu_2",
-    "#advert_right1",
-    "#advert_sky",
-    "#advert_top",
-    "#advertblock",
-    "#advertborder",
-    "#advertbox2",
-    "#advertbox3",
-    "#advertbox4",
-    "#adverthome",
-    "#adverti",
-    "#adverticum_r_above",
-    "#adverticum_r_above_container",
-    "#adverticum_r_side_container",
-    "#advertise",
-    "#advertise-block",
-    "#advertise-here",
-    "#advertise-sidebar",
-    "#advertise1",
-    "#advertise2",
-    "#advertiseBanner",
-    "#advertiseLink",
-    "#advertisePlacement",
-    "#advertise_top",
-    "#advertisediv",
-    "#advertisement-300x250",
-    "#advertisement-bottom",
-    "#advertisement-content",
-    "#advertisement-detail1",
-    "#advertisement-detail2",
-    "#advertisement-large",
-    "#advertisement-placement",
-    "#advertisement-text",
-    "#advertisement1",
-    "#advertisement2",
-    "#advertisement3",
-    "#advertisement728x90",
-    "#advertisementArea",
-    "#advertisementBox",
-    "#advertisementHorizontal",
-    "#advertisementRight",
-    "#advertisementTop",
-    "#advertisement_banner",
-    "#advertisement_belowscreenshots",
-    "#advertisement_block",
-    "#advertisement_box",
-    "#advertisement_container",
-    "#advertisement_label",
-    "#advertisement_notice",
-    "#advertisement_title",
-    "#advertisements_bottom",
-    "#advertisements_sidebar",
-    "#advertisements_top",
-    "#advertisementsarticle",
-    "#advertiser-container",
-    "#advertiserLinks",
-    "#advertisetop",
-    "#advertising-160x600",
-    "#advertising-300x250",
-    "#advertising-728x90",
-    "#advertising-banner",
-    "#advertising-caption",
-    "#advertising-container",
-    "#advertising-right",
-    "#advertising-skyscraper",
-    "#advertising-top",
-    "#advertisingHrefTop",
-    "#advertisingLeftLeft",
-    "#advertisingLink",
-    "#advertisingRightColumn",
-    "#advertisingRightRight",
-    "#advertisingTop",
-    "#advertisingTopWrapper",
-    "#advertising_1",
-    "#advertising_2",
-    "#advertising_300",
-    "#advertising_300_under",
-    "#advertising_300x105",
-    "#advertising_320",
-    "#advertising_728",
-    "#advertising_728_under",
-    "#advertising__banner__content",
-    "#advertising_anglerect",
-    "#advertising_billboard",
-    "#advertising_column",
-    "#advertising_container",
-    "#advertising_contentad",
-    "#advertising_div",
-    "#advertising_header",
-    "#advertising_holder",
-    "#advertising_leaderboard",
-    "#advertising_top_container",
-    "#advertising_wrapper",
-    "#advertisment-horizontal",
-    "#advertisment-text",
-    "#advertisment1",
-    "#advertisment_content",
-    "#advertisment_panel",
-    "#advertleft",
-    "#advertorial",
-    "#advertorial-box",
-    "#advertorial-wrap",
-    "#advertorial1",
-    "#advertorial_links",
-    "#adverts",
-    "#adverts--footer",
-    "#adverts-top-container",
-    "#adverts-top-left",
-    "#adverts-top-middle",
-    "#adverts-top-right",
-    "#adverts_base",
-    "#adverts_post_content",
-    "#adverts_right",
-    "#advertscroll",
-    "#advertsingle",
-    "#advertspace",
-    "#advertssection",
-    "#adverttop",
-    "#advframe",
-    "#advr_mobile",
-    "#advsingle",
-    "#advt",
-    "#advt_bottom",
-    "#advtbar",
-    "#advtcell",
-    "#advtext",
-    "#advtop",
-    "#advtopright",
-    "#adwallpaper",
-    "#adwidget",
-    "#adwidget-5",
-    "#adwidget-6",
-    "#adwidget1",
-    "#adwidget2",
-    "#adwin",
-    "#adwin_rec",
-    "#adwith",
-    "#adwords-box",
-    "#adwrapper",
-    "#adxBigAd",
-    "#adxBigAd2",
-    "#adxLeaderboard",
-    "#adxMiddle",
-    "#adxMiddleRight",
-    "#adxToolSponsor",
-    "#adx_ad",
-    "#adxtop2",
-    "#adzbanner",
-    "#adzone",
-    "#adzone-middle1",
-    "#adzone-middle2",
-    "#adzone-right",
-    "#adzone-top",
-    "#adzone_content",
-    "#adzone_wall",
-    "#adzonebanner",
-    "#adzoneheader",
-    "#afc-container",
-    "#affiliate_2",
-    "#affiliate_ad",
-    "#after-dfp-ad-mid1",
-    "#after-dfp-ad-mid2",
-    "#after-dfp-ad-mid3",
-    "#after-dfp-ad-mid4",
-    "#after-dfp-ad-top",
-    "#after-header-ads",
-    "#after-top-menu-ads",
-    "#after_ad",
-    "#after_bottom_ad",
-    "#after_heading_ad",
-    "#after_title_ad",
-    "#amazon-ads",
-    "#amazon_ad",
-    "#anAdScGame300x250",
-    "#analytics_ad",
-    "#analytics_banner",
-    "#anchor-ad",
-    "#anchorAd",
-    "#aniview-ads",
-    "#aom-ad-right_side_1",
-    "#aom-ad-right_side_2",
-    "#aom-ad-top",
-    "#apiBackgroundAd",
-    "#article-ad",
-    "#article-ad-container",
-    "#article-ad-content",
-    "#article-ads",
-    "#article-advert",
-    "#article-advert-dfp",
-    "#article-aside-top-ad",
-    "#article-billboard-ad-1",
-    "#article-bottom-ad",
-    "#article-box-ad",
-    "#article-content-ad",
-    "#article-footer-ad",
-    "#article-footer-sponsors",
-    "#article-island-ad",
-    "#article-sidebar-ad",
-    "#articleAd",
-    "#articleAdReplacement",
-    "#articleBoard-ad",
-    "#articleBottom-ads",
-    "#articleLeftAdColumn",
-    "#articleSideAd",
-    "#articleTop-ads",
-    "#article_ad",
-    "#article_ad_1",
-    "#article_ad_3",
-    "#article_ad_bottom",
-    "#article_ad_container",
-    "#article_ad_top",
-    "#article_ad_w",
-    "#article_adholder",
-    "#article_ads",
-    "#article_advert",
-    "#article_banner_ad",
-    "#article_body_ad1",
-    "#article_box_ad",
-    "#articlead1",
-    "#articlead2",
-    "#articlead300x250r",
-    "#articleadblock",
-    "#articlefootad",
-    "#articletop_ad",
-    "#aside-ad-container",
-    "#asideAd",
-    "#aside_ad",
-    "#asideads",
-    "#asinglead",
-    "#ax-billboard",
-    "#ax-billboard-bottom",
-    "#ax-billboard-sub",
-    "#ax-billboard-top",
-    "#backad",
-    "#background-ad-cover",
-    "#background-adv",
-    "#background_ad_left",
-    "#background_ad_right",
-    "#background_ads",
-    "#backgroundadvert",
-    "#banADbanner",
-    "#banner-300x250",
-    "#banner-468x60",
-    "#banner-728",
-    "#banner-728x90",
-    "#banner-ad",
-    "#banner-ad-container",
-    "#banner-ad-large",
-    "#banner-ads",
-    "#banner-advert",
-    "#banner-lg-ad",
-    "#banner-native-ad",
-    "#banner-skyscraper",
-    "#banner300x250",
-    "#banner468",
-    "#banner468x60",
-    "#banner728",
-    "#banner728x90",
-    "#bannerAd",
-    "#bannerAdFrame",
-    "#bannerAdTop",
-    "#bannerAdWrap",
-    "#bannerAdWrapper",
-    "#bannerAds",
-    "#bannerAdsense",
-    "#bannerAdvert",
-    "#bannerGoogle",
-    "#banner_ad_bottom",
-    "#banner_ad_footer",
-    "#banner_ad_module",
-    "#banner_ad_placeholder",
-    "#banner_ad_top",
-    "#banner_ads",
-    "#banner_adsense",
-    "#banner_adv",
-    "#banner_advertisement",
-    "#banner_adverts",
-    "#banner_atf__container",
-    "#banner_content_ad",
-    "#banner_sedo",
-    "#banner_slot",
-    "#banner_spacer",
-    "#banner_topad",
-    "#banner_videoad",
-    "#banner_wrapper_top",
-    "#bannerad-bottom",
-    "#bannerad-top",
-    "#bannerad2",
-    "#banneradrow",
-    "#bannerads",
-    "#banneradspace",
-    "#banneradvert3",
-    "#banneradvertise",
-    "#bannerplayer-wrap",
-    "#baseboard-ad",
-    "#baseboard-ad-wrapper",
-    "#bbContentAds",
-    "#bb_ad_container",
-    "#bb_top_ad",
-    "#bbadwrap",
-    "#before-footer-ad",
-    "#below-listings-ad",
-    "#below-menu-ad-header",
-    "#below-post-ad",
-    "#below-title-ad",
-    "#belowAd",
-    "#belowContactBoxAd",
-    "#belowNodeAds",
-    "#below_content_ad_container",
-    "#belowad",
-    "#belowheaderad",
-    "#bg-custom-ad",
-    "#bg-footer-ads",
-    "#bg-footer-ads2",
-    "#bg_banner_120x600",
-    "#bg_banner_468x60",
-    "#bg_banner_728x90",
-    "#bg_googlebanner_160x600LH",
-    "#bgad",
-    "#big-box-ad",
-    "#bigAd",
-    "#bigAd1",
-    "#bigAd2",
-    "#bigAdDiv",
-    "#bigBannerAd",
-    "#bigBoxAd",
-    "#bigBoxAdCont",
-    "#big_ad",
-    "#big_ad_label",
-    "#big_ads",
-    "#bigad",
-    "#bigadbox",
-    "#bigads",
-    "#bigadspace",
-    "#bigadspot",
-    "#bigboard_ad",
-    "#bigbox-ad",
-    "#bigsidead",
-    "#billboard-ad",
-    "#billboard-atf",
-    "#billboard_ad",
-    "#bingadcontainer2",
-    "#blkAds1",
-    "#blkAds2",
-    "#blkAds3",
-    "#blkAds4",
-    "#blkAds5",
-    "#block-ad-articles",
-    "#block-adsense-0",
-    "#block-adsense-2",
-    "#block-adsense-banner-article-bottom",
-    "#block-adsense-banner-channel-bottom",
-    "#block-advertisement",
-    "#block-advertorial",
-    "#block-articlebelowtextad",
-    "#block-articlefrontpagead",
-    "#block-articletopadvert",
-    "#block-dfp-top",
-    "#block-frontpageabovepartnersad",
-    "#block-frontpagead",
-    "#block-frontpagesideadvert1",
-    "#block-google-ads",
-    "#block-googleads3",
-    "#block-googleads3-2",
-    "#block-ltadvertising-ltadvertising",
-    "#block-openads-0",
-    "#block-openads-1",
-    "#block-openads-13",
-    "#block-openads-14",
-    "#block-openads-2",
-    "#block-openads-3",
-    "#block-openads-4",
-    "#block-openads-5",
-    "#block-sponsors",
-    "#blockAd",
-    "#blockAds",
-    "#block_ad",
-    "#block_ad2",
-    "#block_ad_container",
-    "#block_advert",
-    "#block_advert1",
-    "#block_advert2",
-    "#block_advertisement",
-    "#blog-ad",
-    "#blog-advert",
-    "#blog-header-ad",
-    "#blog_ad_area",
-    "#blogad",
-    "#blogad-wrapper",
-    "#blogads",
-    "#bm-HeaderAd",
-    "#bn_ad",
-    "#bnr-300x250",
-    "#bnr-468x60",
-    "#bnr-728x90",
-    "#bnrAd",
-    "#body-ads",
-    "#bodyAd1",
-    "#bodyAd2",
-    "#bodyAd3",
-    "#bodyAd4",
-    "#body_728_ad",
-    "#body_ad",
-    "#body_centered_ad",
-    "#bodymainAd",
-    "#book-ad",
-    "#bordeaux-preemptive-ad-0",
-    "#bottom-ad",
-    "#bottom-ad-1",
-    "#bottom-ad-area",
-    "#bottom-ad-banner",
-    "#bottom-ad-container",
-    "#bottom-ad-leaderboard",
-    "#bottom-ad-slot",
-    "#bottom-ad-tray",
-    "#bottom-ad-wrapper",
-    "#bottom-add",
-    "#bottom-adhesion-container",
-    "#bottom-ads",
-    "#bottom-ads-bar",
-    "#bottom-ads-container",
-    "#bottom-adspot",
-    "#bottom-advertising",
-    "#bottom-boxad",
-    "#bottom-not-ads",
-    "#bottom-side-ad",
-    "#bottom-sponsor-add",
-    "#bottom-story-ad-0",
-    "#bottomAd",
-    "#bottomAd300",
-    "#bottomAdBlcok",
-    "#bottomAdContainer",
-    "#bottomAdSection",
-    "#bottomAdSense",
-    "#bottomAdSenseDiv",
-    "#bottomAdWrapper",
-    "#bottomAds",
-    "#bottomAdvBox",
-    "#bottomBannerAd",
-    "#bottomContentAd",
-    "#bottomDDAd",
-    "#bottomLeftAd",
-    "#bottomMPU",
-    "#bottomRightAd",
-    "#bottom_ad",
-    "#bottom_ad_728",
-    "#bottom_ad_area",
-    "#bottom_ad_box",
-    "#bottom_ad_region",
-    "#bottom_ad_unit",
-    "#bottom_ad_wrapper",
-    "#bottom_adbox",
-    "#bottom_ads",
-    "#bottom_adwrapper",
-    "#bottom_banner_ad",
-    "#bottom_fixed_ad_overlay",
-    "#bottom_leader_ad",
-    "#bottom_player_adv",
-    "#bottom_sponsor_ads",
-    "#bottom_sponsored_links",
-    "#bottom_text_ad",
-    "#bottomad",
-    "#bottomad300",
-    "#bottomad_table",
-    "#bottomadbanner",
-    "#bottomadbar",
-    "#bottomadholder",
-    "#bottomads",
-    "#bottomadsdiv",
-    "#bottomadsense",
-    "#bottomadvert",
-    "#bottomadwrapper",
-    "#bottomcontentads",
-    "#bottomleaderboardad",
-    "#bottommpuAdvert",
-    "#bottommpuSlot",
-    "#bottomsponad",
-    "#bottomsponsoredresults",
-    "#box-ad",
-    "#box-ad-section",
-    "#box-ad-sidebar",
-    "#box-content-ad",
-    "#box1ad",
-    "#box2ad",
-    "#boxAD",
-    "#boxAd",
-    "#boxAd300",
-    "#boxAdContainer",
-    "#boxAdvert",
-    "#boxLREC",
-    "#box_ad",
-    "#box_ad_container",
-    "#box_ad_middle",
-    "#box_ads",
-    "#box_advertisement",
-    "#box_advertising_info",
-    "#box_advertisment",
-    "#box_articlead",
-    "#box_text_ads",
-    "#boxad",
-    "#boxads",
-    "#bpAd",
-    "#br-ad-header",
-    "#branding_click",
-    "#breadcrumb_ad",
-    "#breakbarad",
-    "#bsa_add_holder_g",
-    "#bt-ad",
-    "#bt-ad-header",
-    "#btfAdNew",
-    "#btm_ad",
-    "#btm_ads",
-    "#btmad",
-    "#btnAdDP",
-    "#btnAds",
-    "#btnads",
-    "#btopads",
-    "#button-ads",
-    "#button_ad_container",
-    "#button_ads",
-    "#buy-sell-ads",
-    "#buySellAds",
-    "#buysellads",
-    "#captcha-adspace",
-    "#carbon-ads-container-bg",
-    "#carbonadcontainer",
-    "#carbonads",
-    "#carbonads-container",
-    "#card-ads-top",
-    "#category-ad",
-    "#category-sponsor",
-    "#cellAd",
-    "#center-ad",
-    "#center-ad-group",
-    "#centerads",
-    "#ch-ad-outer-right",
-    "#ch-ads",
-    "#channel_ad",
-    "#channel_ads",
-    "#circ_ad",
-    "#circ_ad_holder",
-    "#circad_wrapper",
-    "#classifiedsads",
-    "#clickforad",
-    "#clientAds",
-    "#close-footer-ad",
-    "#closeAdsDiv",
-    "#closeable-ad",
-    "#cloudAdTag",
-    "#cls_ad",
-    "#cltAd",
-    "#coAd",
-    "#cokeAd",
-    "#col-right-ad",
-    "#colAd",
-    "#colombiaAdBox",
-    "#columnAd",
-    "#commentAdWrapper",
-    "#commentTopAd",
-    "#comment_ad_zone",
-    "#comments-ad-container",
-    "#comments-ads",
-    "#comments-standalone-mpu",
-    "#compAdvertisement",
-    "#companion-ad",
-    "#companionAd",
-    "#companionAdDiv",
-    "#companion_Ad",
-    "#companionad",
-    "#connatix",
-    "#connatix-moveable",
-    "#connatix_placeholder_desktop",
-    "#container-ad",
-    "#container_ad",
-    "#content-ad",
-    "#content-ad-side",
-    "#content-ads",
-    "#content-adver",
-    "#content-contentad",
-    "#content-header-ad",
-    "#content-left-ad",
-    "#content-right-ad",
-    "#contentAd",
-    "#contentAdSense",
-    "#contentAdTwo",
-    "#contentAds",
-    "#contentBoxad",
-    "#content_Ad",
-    "#content_ad",
-    "#content_ad_1",
-    "#content_ad_2",
-    "#content_ad_block",
-    "#content_ad_container",
-    "#content_ad_placeholder",
-    "#content_ads",
-    "#content_ads_top",
-    "#content_adv",
-    "#content_bottom_ad",
-    "#content_bottom_ads",
-    "#content_mpu",
-    "#contentad",
-    "#contentad-adsense-homepage-1",
-    "#contentad-commercial-1",
-    "#contentad-content-box-1",
-    "#contentad-footer-tfm-1",
-    "#contentad-lower-medium-rectangle-1",
-    "#contentad-story-middle-1",
-    "#contentad-superbanner-1",
-    "#contentad-top-adsense-1",
-    "#contentad-topbanner-1",
-    "#contentadcontainer",
-    "#contentads",
-    "#contextad",
-    "#contextual-ads",
-    "#contextual-ads-block",
-    "#contextualad",
-    "#corner_ad",
-    "#cornerad",
-    "#coverads",
-    "#cpmstar_anchor_divad",
-    "#criteoAd",
-    "#crt-adblock-a",
-    "#crt-adblock-b",
-    "#ctl00_ContentPlaceHolder1_ucAdHomeRightFO_divAdvertisement",
-    "#ctl00_ContentPlaceHolder1_ucAdHomeRight_divAdvertisement",
-    "#ctl00_adCar",
-    "#ctl00_adFooter",
-    "#ctl00_leaderboardAdvertContainer",
-    "#ctl00_skyscraperAdvertContainer",
-    "#ctl00_topAd",
-    "#ctl00_ucFooter_ucFooterBanner_divAdvertisement",
-    "#ctr-ad",
-    "#cubeAd",
-    "#cube_ad",
-    "#cube_ads",
-    "#customAd",
-    "#customAds",
-    "#customad",
-    "#darazAd",
-    "#dashboardFeaturedEventAd",
-    "#dashboardRectangleAd",
-    "#daumAd",
-    "#dcomHomeTop-728x90",
-    "#ddAdZone2",
-    "#desktop-sidebar-ad",
-    "#desktop_middle_ad_fixed",
-    "#desktop_top_ad_fixed",
-    "#dfp-ad-bottom-wrapper",
-    "#dfp-ad-container",
-    "#dfp-ad-floating",
-    "#dfp-ad-leaderboard",
-    "#dfp-ad-leaderboard-wrapper",
-    "#dfp-ad-medium_rectangle",
-    "#dfp-ad-mediumrect-wrapper",
-    "#dfp-ad-mpu1",
-    "#dfp-ad-mpu2",
-    "#dfp-ad-right1",
-    "#dfp-ad-right1-wrapper",
-    "#dfp-ad-right2",
-    "#dfp-ad-right2-wrapper",
-    "#dfp-ad-right3",
-    "#dfp-ad-right4-wrapper",
-    "#dfp-ad-slot2",
-    "#dfp-ad-slot3",
-    "#dfp-ad-slot3-wrapper",
-    "#dfp-ad-slot4-wrapper",
-    "#dfp-ad-slot5",
-    "#dfp-ad-slot5-wrapper",
-    "#dfp-ad-slot6",
-    "#dfp-ad-slot6-wrapper",
-    "#dfp-ad-slot7",
-    "#dfp-ad-slot7-wrapper",
-    "#dfp-ad-top-wrapper",
-    "#dfp-ap-2016-interstitial",
-    "#dfp-article-mpu",
-    "#dfp-article-related0-mpu",
-    "#dfp-atf",
-    "#dfp-atf-desktop",
-    "#dfp-banner",
-    "#dfp-banner-popup",
-    "#dfp-billboard1",
-    "#dfp-billboard2",
-    "#dfp-btf",
-    "#dfp-btf-desktop",
-    "#dfp-footer-desktop",
-    "#dfp-header",
-    "#dfp-header-container",
-    "#dfp-ia01",
-    "#dfp-ia02",
-    "#dfp-interstitial",
-    "#dfp-leaderboard",
-    "#dfp-leaderboard-desktop",
-    "#dfp-masthead",
-    "#dfp-middle",
-    "#dfp-middle1",
-    "#dfp-mtf",
-    "#dfp-mtf-desktop",
-    "#dfp-rectangle",
-    "#dfp-rectangle1",
-    "#dfp-ros-res-header_container",
-    "#dfp-tlb",
-    "#dfp-top-banner",
-    "#dfp-wallpaper-wrapper",
-    "#dfpAd",
-    "#dfp_ad_mpu",
-    "#dfp_ads_4",
-    "#dfp_ads_5",
-    "#dfp_bigbox_2",
-    "#dfp_bigbox_recipe_top",
-    "#dfp_container",
-    "#dfp_leaderboard",
-    "#dfpad-0",
-    "#dfpslot_tow_2-0",
-    "#dfpslot_tow_2-1",
-    "#dfrads-widget-3",
-    "#dfrads-widget-6",
-    "#dfrads-widget-7",
-    "#dianomiNewsBlock",
-    "#dict-adv",
-    "#direct-ad",
-    "#disable-ads-container",
-    "#display-ads",
-    "#displayAd",
-    "#displayAdSet",
-    "#display_ad",
-    "#displayad_carousel",
-    "#displayad_rectangle",
-    "#div-ad-1x1",
-    "#div-ad-bottom",
-    "#div-ad-flex",
-    "#div-ad-inread",
-    "#div-ad-leaderboard",
-    "#div-ad-r",
-    "#div-ad-r1",
-    "#div-ad-top",
-    "#div-ad-top_banner",
-    "#div-adcenter1",
-    "#div-adcenter2",
-    "#div-advert",
-    "#div-contentad_1",
-    "#div-footer-ad",
-    "#div-gpt-FloorAd",
-    "#div-gpt-LDB1",
-    "#div-gpt-MPU1",
-    "#div-gpt-MPU2",
-    "#div-gpt-MPU3",
-    "#div-gpt-Skin",
-    "#div-gpt-inline-main",
-    "#div-gpt-mini-leaderboard1",
-    "#div-gpt-mrec",
-    "#div-insticator-ad-1",
-    "#div-insticator-ad-2",
-    "#div-insticator-ad-3",
-    "#div-insticator-ad-4",
-    "#div-insticator-ad-5",
-    "#div-insticator-ad-6",
-    "#div-insticator-ad-9",
-    "#div-leader-ad",
-    "#div-social-ads",
-    "#divAd",
-    "#divAdDetail",
-    "#divAdHere",
-    "#divAdHorizontal",
-    "#divAdLeft",
-    "#divAdMain",
-    "#divAdRight",
-    "#divAdSpecial",
-    "#divAdWrapper",
-    "#divAdd728x90",
-    "#divAdd_Right",
-    "#divAdd_Top",
-    "#divAds",
-    "#divAdsTop",
-    "#divAdv300x250",
-    "#divAdvertisement",
-    "#divDoubleAd",
-    "#divFoldersAd",
-    "#divFooterAd",
-    "#divFooterAds",
-    "#divSponsoredLinks",
-    "#divStoryBigAd1",
-    "#divThreadAdBox",
-    "#divTopAd",
-    "#divTopAds",
-    "#divWrapper_Ad",
-    "#div_ad_TopRight",
-    "#div_ad_float",
-    "#div_ad_holder",
-    "#div_ad_leaderboard",
-    "#div_advt_right",
-    "#div_belowAd",
-    "#div_bottomad",
-    "#div_bottomad_container",
-    "#div_googlead",
-    "#div_header_sponsors",
-    "#div_the_mgid",
-    "#div_video_ads",
-    "#divadfloat",
-    "#dnn_AdBannerPane",
-    "#dnn_Advertisement",
-    "#dnn_adSky",
-    "#dnn_adTop",
-    "#dnn_ad_banner",
-    "#dnn_ad_island1",
-    "#dnn_ad_skyscraper",
-    "#dnn_sponsoredLinks",
-    "#downloadAd",
-    "#download_ad",
-    "#download_ads",
-    "#dragads",
-    "#ds-mpu",
-    "#dsStoryAd",
-    "#dsk-banner-ad-a",
-    "#dsk-banner-ad-b",
-    "#dsk-banner-ad-c",
-    "#dsk-banner-ad-d",
-    "#dsk-box-ad-c",
-    "#dsk-box-ad-d",
-    "#dsk-box-ad-f",
-    "#dsk-box-ad-g",
-    "#dv-gpt-ad-bigbox-wrap",
-    "#dvAd1Data",
-    "#dvAd1main",
-    "#dvAd5Data",
-    "#dvAd5Main",
-    "#dvAdHead",
-    "#dvCenterAd",
-    "#dvad2",
-    "#dvad2main",
-    "#dvad5",
-    "#dvad6cntnr",
-    "#dvad6main",
-    "#dvadfirst",
-    "#dvadfirstmain",
-    "#dvadscnd",
-    "#dvadsecondmain",
-    "#dvsmladlft",
-    "#dvsmladrgt",
-    "#dynamicAdDiv",
-    "#dynamicAdSlot1",
-    "#dynamicAdWinDiv",
-    "#elgoogybsda",
-    "#em_ad_superbanner",
-    "#embedAD",
-    "#embedADS",
-    "#event_ads",
-    "#events-adv-side1",
-    "#events-adv-side2",
-    "#events-adv-side3",
-    "#events-adv-side4",
-    "#events-adv-side5",
-    "#events-adv-side6",
-    "#exoAd",
-    "#externalAd",
-    "#ezmobfooter",
-    "#fd-ad-mr1",
-    "#fd-ad-mr2",
-    "#fd-ad-mr3",
-    "#fd-ad-sb1",
-    "#fd-ad-sb2",
-    "#featureAd",
-    "#featureAdSpace",
-    "#featureAds",
-    "#feature_ad",
-    "#featuread",
-    "#featured-ads",
-    "#featuredAds",
-    "#first-ads",
-    "#first_ad",
-    "#firstad",
-    "#fixed-ad",
-    "#fixedAd",
-    "#fixedban",
-    "#floatAd",
-    "#floatads",
-    "#floating-ad-wrapper",
-    "#floating-ads",
-    "#floating-advert",
-    "#floatingAd",
-    "#floatingAdContainer",
-    "#floatingAds",
-    "#floating_ad",
-    "#floating_ad_container",
-    "#floating_ads_bottom_textcss_container",
-    "#floorAdWrapper",
-    "#foot-ad-wrap",
-    "#foot-ad2-wrap",
-    "#footAd",
-    "#footAdArea",
-    "#footAds",
-    "#footad",
-    "#footer-ad",
-    "#footer-ad-728",
-    "#footer-ad-block",
-    "#footer-ad-box",
-    "#footer-ad-col",
-    "#footer-ad-google",
-    "#footer-ad-large",
-    "#footer-ad-slot",
-    "#footer-ad-unit",
-    "#footer-ad-wrapper",
-    "#footer-ads",
-    "#footer-adspace",
-    "#footer-adv",
-    "#footer-advert",
-    "#footer-advert-area",
-    "#footer-advertisement",
-    "#footer-adverts",
-    "#footer-adwrapper",
-    "#footer-affl",
-    "#footer-banner-ad",
-    "#footer-leaderboard-ad",
-    "#footer-sponsored",
-    "#footer-sponsors",
-    "#footerAd",
-    "#footerAdBottom",
-    "#footerAdBox",
-    "#footerAdDiv",
-    "#footerAdWrap",
-    "#footerAdd",
-    "#footerAds",
-    "#footerAdsPlacement",
-    "#footerAdvert",
-    "#footerAdvertisement",
-    "#footerAdverts",
-    "#footerGoogleAd",
-    "#footer_AdArea",
-    "#footer_ad",
-    "#footer_ad_block",
-    "#footer_ad_container",
-    "#footer_ad_frame",
-    "#footer_ad_holder",
-    "#footer_ad_modules",
-    "#footer_adcode",
-    "#footer_add",
-    "#footer_addvertise",
-    "#footer_ads",
-    "#footer_ads_holder",
-    "#footer_adsense_ad",
-    "#footer_adspace",
-    "#footer_adv",
-    "#footer_advertising",
-    "#footer_leaderboard_ad",
-    "#footer_text_ad",
-    "#footerad",
-    "#footerad728",
-    "#footerads",
-    "#footeradsbox",
-    "#footeradvert",
-    "#forum-top-ad-bar",
-    "#frameAd",
-    "#frameTextAd2",
-    "#front-ad-cont",
-    "#front-page-advert",
-    "#front-page-middle-advertisement",
-    "#frontPageAd",
-    "#front_adtop_content",
-    "#front_advert",
-    "#front_mpu",
-    "#front_mpu_content",
-    "#frontlowerad",
-    "#ft-ad",
-    "#ft-ads",
-    "#ft_mpu",
-    "#full_banner_ad",
-    "#fusionad",
-    "#fw-advertisement",
-    "#fwAdBox",
-    "#fwdevpDiv0",
-    "#fwdevpDiv1",
-    "#fwdevpDiv2",
-    "#gAds",
-    "#gStickyAd",
-    "#g_ad",
-    "#g_adsense",
-    "#gad300x250",
-    "#gad728x90",
-    "#gads300x250",
-    "#gadsOverlayUnit",
-    "#gads_middle",
-    "#gallery-ad",
-    "#gallery-ad-container",
-    "#gallery-advert",
-    "#gallery-below-line-advert",
-    "#gallery-sidebar-advert",
-    "#gallery_ad",
-    "#gallery_ads",
-    "#gallery_header_ad",
-    "#galleryad1",
-    "#gam-ad-ban1",
-    "#game-ad",
-    "#gamead",
-    "#gameads",
-    "#gasense",
-    "#geoAd",
-    "#gg_ad",
-    "#ggl-ad",
-    "#glamads",
-    "#global-banner-ad",
-    "#globalLeftNavAd",
-    "#globalTopNavAd",
-    "#global_header_ad",
-    "#global_header_ad_area",
-    "#gm-ad-lrec",
-    "#goad1",
-    "#goads",
-    "#gog_ad",
-    "#gooadtop",
-    "#google-ad",
-    "#google-ads",
-    "#google-ads-bottom",
-    "#google-ads-bottom-container",
-    "#google-ads-container",
-    "#google-ads-detailsRight",
-    "#google-ads-directoryViewRight",
-    "#google-ads-header",
-    "#google-adsense",
-    "#google-adwords",
-    "#google-afc",
-    "#google-dfp-bottom",
-    "#google-dfp-top",
-    "#google-post-ad",
-    "#google-post-adbottom",
-    "#google-top-ads",
-    "#googleAd",
-    "#googleAdArea",
-    "#googleAdBottom",
-    "#googleAdBox",
-    "#googleAdMid",
-    "#googleAdTop",
-    "#googleAdView",
-    "#googleAds",
-    "#googleAdsFrame",
-    "#googleAdsense",
-    "#googleAdsenseAdverts",
-    "#googleAdwordsModule",
-    "#googleAfcContainer",
-    "#googleSearchAds",
-    "#google_ad_1",
-    "#google_ad_2",
-    "#google_ad_3",
-    "#google_ad_container",
-    "#google_ad_inline",
-    "#google_ad_slot",
-    "#google_ads",
-    "#google_ads_1",
-    "#google_ads_box",
-    "#google_ads_div_header1",
-    "#google_ads_div_header2",
-    "#google_ads_frame",
-    "#google_ads_frame1_anchor",
-    "#google_ads_frame2_anchor",
-    "#google_ads_frame3_anchor",
-    "#google_ads_frame4_anchor",
-    "#google_ads_frame5_anchor",
-    "#google_ads_frame6_anchor",
-    "#google_ads_test",
-    "#google_ads_top",
-    "#google_ads_wide",
-    "#google_adsense",
-    "#google_adsense_ad",
-    "#google_textlinks",
-    "#googlead",
-    "#googlead-leaderboard",
-    "#googlead-left",
-    "#googlead-post-mpu",
-    "#googlead-sidebar-middle",
-    "#googlead-sidebar-top",
-    "#googlead01",
-    "#googlead1",
-    "#googlead2",
-    "#googleadbig",
-    "#googleadleft",
-    "#googleads",
-    "#googleads1",
-    "#googleadsense",
-    "#googleadsense300x250",
-    "#googleadsrc",
-    "#googleadstop",
-    "#googlebanner",
-    "#googlesponsor",
-    "#googletextads",
-    "#googtxtad",
-    "#gpt-ad-1",
-    "#gpt-ad-banner",
-    "#gpt-ad-halfpage",
-    "#gpt-ad-outofpage-wp",
-    "#gpt-ad-rectangle1",
-    "#gpt-ad-rectangle2",
-    "#gpt-ad-side-bottom",
-    "#gpt-ad-skyscraper",
-    "#gpt-instory-ad",
-    "#gpt-leaderboard-ad",
-    "#gpt-mpu",
-    "#gpt-sticky",
-    "#grdAds",
-    "#gridAdSidebar",
-    "#grid_ad",
-    "#gtm_dfp_leaderboard_top",
-    "#h-ad",
-    "#half-page-ad",
-    "#halfPageAd",
-    "#half_page_ad_300x600",
-    "#halfpagead",
-    "#hawkMagWidget",
-    "#hd_ad",
-    "#head-ad",
-    "#head-ad-space",
-    "#head-ad-timer",
-    "#head-ads",
-    "#head-advertisement",
-    "#headAd",
-    "#headAds",
-    "#headAdv",
-    "#head_ad",
-    "#head_ads",
-    "#head_advert",
-    "#headad",
-    "#headadvert",
-    "#header-ad",
-    "#header-ad-background",
-    "#header-ad-block",
-    "#header-ad-bottom",
-    "#header-ad-container",
-    "#header-ad-holder",
-    "#header-ad-label",
-    "#header-ad-left",
-    "#header-ad-placeholder",
-    "#header-ad-right",
-    "#header-ad-slot",
-    "#header-ad-wrap",
-    "#header-ad-wrapper",
-    "#header-ad2",
-    "#header-ads",
-    "#header-ads-container",
-    "#header-ads-holder",
-    "#header-ads-wrapper",
-    "#header-adsense",
-    "#header-adserve",
-    "#header-adspace",
-    "#header-adv",
-    "#header-advert",
-    "#header-advert-panel",
-    "#header-advertisement",
-    "#header-advertising",
-    "#header-adverts",
-    "#header-advrt",
-    "#header-banner-728-90",
-    "#header-banner-ad",
-    "#header-banner-ad-wrapper",
-    "#header-block-ads",
-    "#header-box-ads",
-    "#header-google",
-    "#headerAd",
-    "#headerAdBackground",
-    "#headerAdButton",
-    "#headerAdContainer",
-    "#headerAdSpace",
-    "#headerAdUnit",
-    "#headerAdWrap",
-    "#headerAds",
-    "#headerAdsWrapper",
-    "#headerAdv",
-    "#headerAdvert",
-    "#header_ad",
-    "#header_ad_728",
-    "#header_ad_728_90",
-    "#header_ad_banner",
-    "#header_ad_block",
-    "#header_ad_container",
-    "#header_ad_leaderboard",
-    "#header_ad_units",
-    "#header_ad_widget",
-    "#header_ad_wrap",
-    "#header_adbox",
-    "#header_adcode",
-    "#header_ads",
-    "#header_ads2",
-    "#header_adsense",
-    "#header_adv",
-    "#header_advert",
-    "#header_advertisement",
-    "#header_advertisement_top",
-    "#header_advertising",
-    "#header_adverts",
-    "#header_bottom_ad",
-    "#header_mainad",
-    "#header_publicidad",
-    "#header_right_ad",
-    "#header_sponsors",
-    "#header_top_ad",
-    "#headerad",
-    "#headerad_large",
-    "#headeradbox",
-    "#headeradcontainer",
-    "#headerads",
-    "#headeradsbox",
-    "#headeradsense",
-    "#headeradspace",
-    "#headeradvertholder",
-    "#headeradwrap",
-    "#headergooglead",
-    "#headersponsors",
-    "#headingAd",
-    "#headline-sponsor",
-    "#headline_ad",
-    "#hearst-autos-ad-wrapper",
-    "#hf-top-ad",
-    "#home-ad",
-    "#home-ad-block",
-    "#home-ad-slot",
-    "#home-advert-module",
-    "#home-advertise",
-    "#home-banner-ad",
-    "#home-left-ad",
-    "#home-rectangle-ad",
-    "#home-side-ad",
-    "#home-top-ads",
-    "#homeAd",
-    "#homeAdLeft",
-    "#homeAds",
-    "#homeArticlesAd",
-    "#homeMPU",
-    "#homePageBotAd",
-    "#homeSideAd",
-    "#homeTopRightAd",
-    "#home_ad",
-    "#home_ad_b_1",
-    "#home_ads_vert",
-    "#home_advertising_block",
-    "#home_bottom_ad",
-    "#home_contentad",
-    "#home_feature_ad",
-    "#home_lower_center_right_ad",
-    "#home_mpu",
-    "#home_sidebar_ad",
-    "#home_spensoredlinks",
-    "#home_top_right_ad",
-    "#homead",
-    "#homegoogletextad",
-    "#homeheaderad",
-    "#homepage-ad",
-    "#homepage-adbar",
-    "#homepage-footer-ad",
-    "#homepage-header-ad",
-    "#homepage-right-rail-ad",
-    "#homepage-sidebar-ad",
-    "#homepage-sidebar-ads",
-    "#homepage-sponsored",
-    "#homepageAd",
-    "#homepageAdsTop",
-    "#homepageFooterAd",
-    "#homepageGoogleAds",
-    "#homepage_ad",
-    "#homepage_ad_listing",
-    "#homepage_rectangle_ad",
-    "#homepage_right_ad",
-    "#homepage_right_ad_container",
-    "#homepage_top_ad",
-    "#homepage_top_ads",
-    "#homepagead_300x250",
-    "#homepageadvert",
-    "#hometopads",
-    "#horAd",
-    "#hor_ad",
-    "#horadslot",
-    "#horizad",
-    "#horizads728",
-    "#horizontal-ad",
-    "#horizontal-adspace",
-    "#horizontal-banner-ad",
-    "#horizontalAd",
-    "#horizontalAdvertisement",
-    "#horizontal_ad",
-    "#horizontal_ad2",
-    "#horizontal_ad_top",
-    "#horizontalad",
-    "#horizontalads",
-    "#hottopics-advert",
-    "#hours_ad",
-    "#houseAd",
-    "#hovered_sponsored",
-    "#hp-desk-after-header-ad",
-    "#hp-header-ad",
-    "#hp-right-ad",
-    "#hp-store-ad",
-    "#hpAdVideo",
-    "#idDivAd",
-    "#id_SearchAds",
-    "#iframe-ad",
-    "#iframeAd_2",
-    "#iframe_ad_2",
-    "#imPopup",
-    "#im_popupDiv",
-    "#ima_ads-2",
-    "#ima_ads-3",
-    "#ima_ads-4",
-    "#imgad1",
-    "#imu_ad_module",
-    "#in-article-ad",
-    "#in-article-mpu",
-    "#in-content-ad",
-    "#inArticleAdv",
-    "#inarticlead",
-    "#inc-ads-bigbox",
-    "#incontent-ad-2",
-    "#incontent-ad-3",
-    "#incontentAd1",
-    "#incontentAd2",
-    "#incontentAd3",
-    "#index-ad",
-    "#index-bottom-advert",
-    "#indexSquareAd",
-    "#index_ad",
-    "#indexad",
-    "#indexad300x250l",
-    "#indexsmallads",
-    "#indiv_adsense",
-    "#infoBottomAd",
-    "#infoboxadwrapper",
-    "#inhousead",
-    "#initializeAd",
-    "#inline-ad",
-    "#inline-ad-label",
-    "#inline-advert",
-    "#inline-story-ad",
-    "#inline-story-ad2",
-    "#inlineAd",
-    "#inlineAdCont",
-    "#inlineAdtop",
-    "#inlineAdvertisement",
-    "#inlineBottomAd",
-    "#inline_ad",
-    "#inline_ad_section",
-    "#inlinead",
-    "#inlineads",
-    "#inner-ad",
-    "#inner-ad-container",
-    "#inner-advert-row",
-    "#inner-top-ads",
-    "#innerad",
-    "#innerpage-ad",
-    "#inside-page-ad",
-    "#insideCubeAd",
-    "#instant_ad",
-    "#insticator-container",
-    "#instoryad",
-    "#int-ad",
-    "#int_ad",
-    "#interads",
-    "#intermediate-ad",
-    "#internalAdvert",
-    "#internalads",
-    "#interstitial-shade",
-    "#interstitialAd",
-    "#interstitialAdContainer",
-    "#interstitialAdUnit",
-    "#interstitial_ad",
-    "#interstitial_ad_container",
-    "#interstitial_ads",
-    "#intext_ad",
-    "#introAds",
-    "#intro_ad_1",
-    "#invid_ad",
-    "#ipadv",
-    "#iq-AdSkin",
-    "#iqadcontainer",
-    "#iqadoverlay",
-    "#iqadtile1",
-    "#iqadtile11",
-    "#iqadtile14",
-    "#iqadtile15",
-    "#iqadtile16",
-    "#iqadtile2",
-    "#iqadtile3",
-    "#iqadtile4",
-    "#iqadtile41",
-    "#iqadtile6",
-    "#iqadtile8",
-    "#iqadtile9",
-    "#iqadtile99",
-    "#islandAd",
-    "#islandAdPan",
-    "#islandAdPane",
-    "#islandAdPane2",
-    "#island_ad_top",
-    "#islandad",
-    "#iv160ad",
-    "#iv728ad",
-    "#jobs-ad",
-    "#js-ad-billboard",
-    "#js-ad-leaderboard",
-    "#js-image-ad-mpu",
-    "#js-page-ad-top",
-    "#js-wide-ad",
-    "#js_commerceInsetModule",
-    "#jsid-ad-container-post_above_comment",
-    "#jsid-ad-container-post_below_comment",
-    "#large-ads",
-    "#large-bottom-leaderboard-ad",
-    "#large-leaderboard-ad",
-    "#large-middle-leaderboard-ad",
-    "#large-rectange-ad",
-    "#large-rectange-ad-2",
-    "#large-screen-ads",
-    "#large-skyscraper-ad",
-    "#largeAd",
-    "#largeAds",
-    "#large_rec_ad1",
-    "#largead",
-    "#layer_ad",
-    "#layer_ad_content",
-    "#layerad",
-    "#layeradsense",
-    "#layout-header-ad-wrapper",
-    "#layout_topad",
-    "#lb-ad",
-    "#lb-sponsor-left",
-    "#lb-sponsor-right",
-    "#lbAdBar",
-    "#lbAdBarBtm",
-    "#lblAds",
-    "#lead-ads",
-    "#lead_ad",
-    "#leadad_1",
-    "#leadad_2",
-    "#leader-ad",
-    "#leader-board-ad",
-    "#leader-companion > a[href]",
-    "#leaderAd",
-    "#leaderAdContainer",
-    "#leaderAdContainerOuter",
-    "#leaderBoardAd",
-    "#leader_ad",
-    "#leader_board_ad",
-    "#leaderad",
-    "#leaderad_section",
-    "#leaderadvert",
-    "#leaderboard-ad",
-    "#leaderboard-advert",
-    "#leaderboard-advertisement",
-    "#leaderboard-atf",
-    "#leaderboard-bottom-ad",
-    "#leaderboard.ad",
-    "#leaderboardAd",
-    "#leaderboardAdArea",
-    "#leaderboardAdArea2",
-    "#leaderboardAdSibling",
-    "#leaderboardAdTop",
-    "#leaderboardAds",
-    "#leaderboardAdvert",
-    "#leaderboard_728x90",
-    "#leaderboard_Ad",
-    "#leaderboard_ad",
-    "#leaderboard_ad_gam",
-    "#leaderboard_ad_main",
-    "#leaderboard_ad_unit",
-    "#leaderboard_ads",
-    "#leaderboard_bottom_ad",
-    "#leaderboard_top_ad",
-    "#leaderboardad",
-    "#leatherboardad",
-    "#left-ad",
-    "#left-ad-1",
-    "#left-ad-2",
-    "#left-ad-col",
-    "#left-ad-iframe",
-    "#left-ad-skin",
-    "#left-bottom-ad",
-    "#left-col-ads-1",
-    "#left-content-ad",
-    "#leftAD",
-    "#leftAdAboveSideBar",
-    "#leftAdCol",
-    "#leftAdContainer",
-    "#leftAdMessage",
-    "#leftAdSpace",
-    "#leftAd_fmt",
-    "#leftAd_rdr",
-    "#leftAds",
-    "#leftAdsSmall",
-    "#leftAdvert",
-    "#leftBanner-ad",
-    "#leftColumnAdContainer",
-    "#leftGoogleAds",
-    "#leftTopAdWrapper",
-    "#left_ad",
-    "#left_ads",
-    "#left_adsense",
-    "#left_adspace",
-    "#left_adv",
-    "#left_advertisement",
-    "#left_bg_ad",
-    "#left_block_ads",
-    "#left_float_ad",
-    "#left_global_adspace",
-    "#left_side_ads",
-    "#left_sidebar_ads",
-    "#left_top_ad",
-    "#leftad",
-    "#leftadg",
-    "#leftads",
-    "#leftcolAd",
-    "#leftcolumnad",
-    "#leftforumad",
-    "#leftrail_dynamic_ad_wrapper",
-    "#lg-banner-ad",
-    "#ligatus",
-    "#ligatus_adv",
-    "#ligatusdiv",
-    "#lightboxAd",
-    "#linkAdSingle",
-    "#linkAds",
-    "#link_ads",
-    "#linkads",
-    "#listadholder",
-    "#liste_top_ads_wrapper",
-    "#listing-ad",
-    "#live-ad",
-    "#localAds",
-    "#locked-footer-ad-wrapper",
-    "#logoAd",
-    "#logoAd2",
-    "#logo_ad",
-    "#long-ad",
-    "#long-ad-box",
-    "#long-ad-space",
-    "#long-bottom-ad-wrapper",
-    "#longAdSpace",
-    "#longAdWrap",
-    "#long_advert_header",
-    "#long_advertisement",
-    "#lower-ad-banner",
-    "#lower-ads",
-    "#lower-advertising",
-    "#lower-home-ads",
-    "#lowerAdvertisement",
-    "#lowerAdvertisementImg",
-    "#lower_ad",
-    "#lower_content_ad_box",
-    "#lowerads",
-    "#lowerthirdad",
-    "#lpAdPanel",
-    "#lrec_ad",
-    "#lrecad",
-    "#main-ad",
-    "#main-advert",
-    "#mainAd",
-    "#mainAd1",
-    "#mainAdUnit",
-    "#mainAdvert",
-    "#mainPageAds",
-    "#mainPlaceHolder_coreContentPlaceHolder_rightColumnAdvert_divControl",
-    "#main_AD",
-    "#main_ad",
-    "#main_ads",
-    "#main_content_ad",
-    "#main_rec_ad",
-    "#main_top_ad",
-    "#mainui-ads",
-    "#mapAdsSwiper",
-    "#mapAdvert",
-    "#marcoad",
-    "#marketingRotator",
-    "#marketplaceAds",
-    "#marquee-ad",
-    "#marquee_ad",
-    "#masSearchAd",
-    "#mastAd",
-    "#mastAdvert",
-    "#mastad",
-    "#masterad",
-    "#mastercardAd",
-    "#masthead_ad",
-    "#masthead_ads_container",
-    "#masthead_topad",
-    "#med-rect-ad",
-    "#med-rectangle-ad",
-    "#medRecAd",
-    "#medReqAd",
-    "#media-ad",
-    "#medium-ad",
-    "#mediumAd1",
-    "#mediumAdContainer",
-    "#mediumAdvertisement",
-    "#mediumRectangleAd",
-    "#medrec_bottom_ad",
-    "#medrec_middle_ad",
-    "#medrec_top_ad",
-    "#medrectad",
-    "#medrectangle_banner",
-    "#menuad",
-    "#menubarad",
-    "#mgid-container",
-    "#mgid_iframe",
-    "#mid-ad-slot-1",
-    "#mid-ad-slot-3",
-    "#mid-ad-slot-5",
-    "#mid-ads",
-    "#mid-table-ad",
-    "#midAD",
-    "#midRightAds",
-    "#midRightTextAds",
-    "#mid_ad",
-    "#mid_ad_div",
-    "#mid_ad_title",
-    "#mid_left_ads",
-    "#mid_mpu",
-    "#mid_roll_ad_holder",
-    "#midadd",
-    "#midadspace",
-    "#midadvert",
-    "#midbarad",
-    "#midbnrad",
-    "#midcolumn_ad",
-    "#middle-ad",
-    "#middle-ad-destin",
-    "#middleAd",
-    "#middle_ad",
-    "#middle_ads",
-    "#middle_mpu",
-    "#middlead",
-    "#middleads",
-    "#middleads2",
-    "#midpost_ad",
-    "#midrect_ad",
-    "#midstrip_ad",
-    "#mini-ad",
-    "#mobile-adhesion",
-    "#mobile-ads-ad",
-    "#mobile-footer-ad-wrapper",
-    "#mobileAdContainer",
-    "#mobile_ad_main",
-    "#mobile_ads_100_pc",
-    "#mobile_ads_block",
-    "#mod-tafad",
-    "#mod_ad",
-    "#mod_ad_top",
-    "#modal-ad",
-    "#module-ads-01",
-    "#module-ads-02",
-    "#module_ad",
-    "#module_box_ad",
-    "#module_sky_scraper",
-    "#monsterAd",
-    "#mpu-ad",
-    "#mpu-advert",
-    "#mpu-cont",
-    "#mpu-content",
-    "#mpu-sidebar",
-    "#mpu1_parent",
-    "#mpu2",
-    "#mpu2_container",
-    "#mpuAd",
-    "#mpuAdvert",
-    "#mpuAdvertDesk3",
-    "#mpuContainer",
-    "#mpuDiv",
-    "#mpuInContent",
-    "#mpuSecondary",
-    "#mpuSlot",
-    "#mpuWrapper",
-    "#mpuWrapper600",
-    "#mpuWrapperAd",
-    "#mpuWrapperAd2",
-    "#mpu_300x250",
-    "#mpu_ad",
-    "#mpu_ad2",
-    "#mpu_adv",
-    "#mpu_banner",
-    "#mpu_bottom_sb_1_parent",
-    "#mpu_box",
-    "#mpu_container",
-    "#mpu_div",
-    "#mpu_holder",
-    "#mpu_text_ad",
-    "#mpu_top",
-    "#mpuad",
-    "#mpubox",
-    "#mpuholder",
-    "#mvp-foot-ad-wrap",
-    "#mvp-post-bot-ad",
-    "#my-ads",
-    "#narrow-ad",
-    "#narrow_ad_unit",
-    "#native-ads-placeholder",
-    "#native_ad2",
-    "#native_ads",
-    "#nav-ad-container",
-    "#navAdBanner",
-    "#nav_ad",
-    "#nav_ad_728_mid",
-    "#navads-container",
-    "#navbar_ads",
-    "#navigation-ad",
-    "#navlinkad",
-    "#newAd",
-    "#ng-ad",
-    "#ng-ad-lbl",
-    "#ni-ad-row",
-    "#nk_ad_top",
-    "#northad",
-    "#notify_ad",
-    "#ntvads",
-    "#omnibar_ad",
-    "#online_ad",
-    "#openx-text-ad",
-    "#openx-widget",
-    "#ovadsense",
-    "#overlay-ad-bg",
-    "#overlay_ad",
-    "#overlayad",
-    "#overlayadd",
-    "#p-Ad",
-    "#p-advert",
-    "#p-googlead",
-    "#p-googleadsense",
-    "#p2HeaderAd",
-    "#p2squaread",
-    "#page-ad-top",
-    "#page-advertising",
-    "#page-header-ad",
-    "#page-top-ad",
-    "#pageAdDiv",
-    "#pageAdds",
-    "#pageAds",
-    "#pageAdsDiv",
-    "#pageAdvert",
-    "#pageBannerAd",
-    "#pageLeftAd",
-    "#pageMiddleAdWrapper",
-    "#pageRightAd",
-    "#page__outside-advertsing",
-    "#page_ad",
-    "#page_ad_top",
-    "#page_top_ad",
-    "#pageads_top",
-    "#pagebottomAd",
-    "#pagination-advert",
-    "#panel-ad",
-    "#panelAd",
-    "#panel_ad1",
-    "#panoAdBlock",
-    "#partner-ad",
-    "#partnerAd",
-    "#partnerMedRec",
-    "#partner_ads",
-    "#pause-ad",
-    "#pause-ads",
-    "#pauseAd",
-    "#pc-div-gpt-ad_728-3",
-    "#pencil-ad",
-    "#pencil-ad-container",
-    "#pencil-alt-banner-ad-wrapper",
-    "#perm_ad",
-    "#permads",
-    "#persistentAd",
-    "#personal-ads-sticky-wrapper",
-    "#personalization_ads",
-    "#pgAdWrapper",
-    "#ph_ad",
-    "#player-ads",
-    "#player-advert",
-    "#player-advertising",
-    "#player-below-advert",
-    "#player-midrollAd",
-    "#playerAd",
-    "#playerAdsRight",
-    "#player_ad",
-    "#player_ads",
-    "#player_middle_ad",
-    "#player_top_ad",
-    "#playerad",
-    "#playerads",
-    "#pnAd2",
-    "#pnlLhsNativeAd",
-    "#pnlRhsNativeAd",
-    "#pop_ad",
-    "#popadwrap",
-    "#popback-ad",
-    "#popoverAd",
-    "#popupAd",
-    "#popupBottomAd",
-    "#popup_ad_wrapper",
-    "#popupadunit",
-    "#post-ad",
-    "#post-ads",
-    "#post-bottom-ads",
-    "#post-content-ad",
-    "#post-main-banner-ad",
-    "#post-page-ad",
-    "#post-promo-ad",
-    "#postAd",
-    "#postNavigationAd",
-    "#post_ad",
-    "#post_addsense",
-    "#post_adsense",
-    "#post_adspace",
-    "#post_advert",
-    "#postads0",
-    "#ppcAdverts",
-    "#ppvideoadvertisement",
-    "#pr_ad",
-    "#pr_advertising",
-    "#pre-adv",
-    "#pre-footer-ad",
-    "#pre-main-banner-ad",
-    "#preAds_ad_mrec_intext",
-    "#preAds_ad_mrec_intext2",
-    "#preminumAD",
-    "#premiumAdTop",
-    "#premium_ad",
-    "#premiumad",
-    "#premiumads",
-    "#prerollAd",
-    "#preroll_ads",
-    "#preroll_compainion_ad",
-    "#primis-container",
-    "#primis_player",
-    "#print_ads",
-    "#printads",
-    "#privateads",
-    "#productads",
-    "#promo-ad",
-    "#promoAds",
-    "#promoFloatAd",
-    "#promo_ads",
-    "#ps-ad-iframe",
-    "#ps-top-ads-sponsored",
-    "#ps-vertical-ads",
-    "#pub-right-bottom-ads",
-    "#pub-right-top-ads",
-    "#pub468x60",
-    "#pub728x90",
-    "#publicGoogleAd",
-    "#publicidad",
-    "#publicidadeLREC",
-    "#pushAd",
-    "#pushDownAd",
-    "#pushdownAd",
-    "#pushdownAdWrapper",
-    "#pushdown_ad",
-    "#pusher-ad",
-    "#pvadscontainer",
-    "#quads-ad1_widget",
-    "#quads-ad2_widget",
-    "#quads-admin-ads-js",
-    "#quidgetad",
-    "#quigo",
-    "#quigo-ad",
-    "#quigo_ad",
-    "#quinAdLeaderboard",
-    "#r89-desktop-top-ad",
-    "#r_adver",
-    "#radio-ad-container",
-    "#rail-ad-wrap",
-    "#rail-bottom-ad",
-    "#railAd",
-    "#rail_ad",
-    "#rail_ad1",
-    "#rail_ad2",
-    "#rec_spot_ad_1",
-    "#recommendAdBox",
-    "#rect-ad",
-    "#rectAd",
-    "#rect_ad",
-    "#rectad",
-    "#rectangle-ad",
-    "#rectangleAd",
-    "#rectangleAdTeaser1",
-    "#rectangle_ad",
-    "#redirect-ad",
-    "#redirect-ad-modal",
-    "#reference-ad",
-    "#region-node-advert",
-    "#reklam_buton",
-    "#reklam_center",
-    "#reklama",
-    "#reklama_big",
-    "#reklama_left_body",
-    "#reklama_left_up",
-    "#reklama_right_up",
-    "#related-ads",
-    "#related-news-1-bottom-ad",
-    "#related-news-1-top-ad",
-    "#related_ad",
-    "#related_ads",
-    "#related_ads_box",
-    "#removeAdsSidebar",
-    "#removeadlink",
-    "#responsive-ad",
-    "#responsive-ad-sidebar-container",
-    "#responsive_ad",
-    "#responsivead",
-    "#result-list-aside-topadsense",
-    "#resultSponLinks",
-    "#resultsAdsBottom",
-    "#resultsAdsSB",
-    "#resultsAdsTop",
-    "#rh-ad",
-    "#rh-ad-container",
-    "#rh_tower_ad",
-    "#rhc_ads",
-    "#rhs_ads",
-    "#rhs_adverts",
-    "#rhsads",
-    "#rhsadvert",
-    "#richad",
-    "#right-ad",
-    "#right-ad-block",
-    "#right-ad-col",
-    "#right-ad-iframe",
-    "#right-ad-skin",
-    "#right-ad1",
-    "#right-ads",
-    "#right-ads-rail",
-    "#right-advert",
-    "#right-bar-ad",
-    "#right-box-ad",
-    "#right-content-ad",
-    "#right-featured-ad",
-    "#right-rail-ad-slot-content-top",
-    "#right-widget-b-ads_widget-9",
-    "#right-widget-c-ads_widget-7",
-    "#right-widget-d-ads_widget-36",
-    "#right-widget-top-ads_widget-23",
-    "#right1-ad",
-    "#right1ad",
-    "#rightAD",
-    "#rightAd",
-    "#rightAd1",
-    "#rightAdBar",
-    "#rightAdBlock",
-    "#rightAdColumn",
-    "#rightAdContainer",
-    "#rightAdHolder",
-    "#rightAdUnit",
-    "#rightAd_rdr",
-    "#rightAds",
-    "#rightAdsDiv",
-    "#rightBlockAd",
-    "#rightBottomAd",
-    "#rightColAd",
-    "#rightColumnAds",
-    "#rightRailAds",
-    "#rightSideAd",
-    "#rightSideAdvert",
-    "#right_Ads2",
-    "#right_ad",
-    "#right_ad_1",
-    "#right_ad_2",
-    "#right_ad_box",
-    "#right_ad_container",
-    "#right_ad_top",
-    "#right_ad_wrapper",
-    "#right_ads",
-    "#right_ads_box",
-    "#right_adsense",
-    "#right_advert",
-    "#right_advertisement",
-    "#right_advertising",
-    "#right_adverts",
-    "#right_bg_ad",
-    "#right_block_ads",
-    "#right_bottom_ad",
-    "#right_column_ad",
-    "#right_column_ad_container",
-    "#right_column_ads",
-    "#right_column_adverts",
-    "#right_player_ad",
-    "#right_side_ad",
-    "#right_sidebar_ads",
-    "#right_top_ad",
-    "#right_top_gad",
-    "#rightad",
-    "#rightad1",
-    "#rightad2",
-    "#rightadBorder",
-    "#rightadBorder1",
-    "#rightadBorder2",
-    "#rightadContainer",
-    "#rightadcell",
-    "#rightadd300",
-    "#rightadg",
-    "#rightadhome",
-    "#rightadpat",
-    "#rightads",
-    "#rightads300x250",
-    "#rightadsarea",
-    "#rightbar-ad",
-    "#rightbar_ad",
-    "#rightcol_sponsorad",
-    "#rightgoogleads",
-    "#rightrail-ad",
-    "#rightside-ads",
-    "#rightside_ad",
-    "#rightsideadstop",
-    "#rightskyad",
-    "#rladvt",
-    "#rm-adslot-bigsizebanner_1",
-    "#rm-adslot-contentad_1",
-    "#rotating_ad",
-    "#rotatingads",
-    "#row-ad",
-    "#rowAdv",
-    "#rtAdvertisement",
-    "#rtMod_ad",
-    "#scroll-ad",
-    "#scroll_ad",
-    "#scrollover-ad-wrap",
-    "#search-ad",
-    "#search-ads1",
-    "#search-google-ads",
-    "#search-sponsor",
-    "#search-sponsored-links",
-    "#searchAd",
-    "#searchAds",
-    "#search_ad",
-    "#search_ads",
-    "#second_ad_div",
-    "#secondad",
-    "#section-ad",
-    "#section-ad-bottom",
-    "#section_ad",
-    "#section_advertisements",
-    "#self-ad",
-    "#sev1mposterad",
-    "#show-ad",
-    "#show-sticky-ad",
-    "#showAd",
-    "#show_ads",
-    "#showads",
-    "#showcaseAd",
-    "#sic_superBannerAdTop",
-    "#side-ad",
-    "#side-ad-container",
-    "#side-ads",
-    "#side-ads-box",
-    "#side-banner-ad",
-    "#side-boxad",
-    "#sideABlock",
-    "#sideAD",
-    "#sideAd",
-    "#sideAd1",
-    "#sideAd2",
-    "#sideAd3",
-    "#sideAd4",
-    "#sideAdArea",
-    "#sideAdLarge",
-    "#sideAdSmall",
-    "#sideAdSub",
-    "#sideAds",
-    "#sideBannerAd",
-    "#sideBar-ads",
-    "#sideBarAd",
-    "#sideSponsors",
-    "#side_ad",
-    "#side_ad_module",
-    "#side_ad_wrapper",
-    "#side_adkit",
-    "#side_ads",
-    "#side_adverts",
-    "#side_longads",
-    "#side_sky_ad",
-    "#side_skyscraper_ad",
-    "#side_sponsors",
-    "#sidead",
-    "#sidead1",
-    "#sideads",
-    "#sideads_container",
-    "#sideadscol",
-    "#sideadvert",
-    "#sideadzone",
-    "#sidebar-ad",
-    "#sidebar-ad-1",
-    "#sidebar-ad-2",
-    "#sidebar-ad-block",
-    "#sidebar-ad-boxes",
-    "#sidebar-ad-middle",
-    "#sidebar-ad-wrap",
-    "#sidebar-ad1",
-    "#sidebar-ad2",
-    "#sidebar-ad3",
-    "#sidebar-ads",
-    "#sidebar-ads-content",
-    "#sidebar-ads-narrow",
-    "#sidebar-ads-wide",
-    "#sidebar-ads-wrapper",
-    "#sidebar-adspace",
-    "#sidebar-adv",
-    "#sidebar-advertise-text",
-    "#sidebar-advertisement",
-    "#sidebar-left-ad",
-    "#sidebar-main-ad",
-    "#sidebar-sponsors",
-    "#sidebar-top-ad",
-    "#sidebar-top-ads",
-    "#sidebar2-ads",
-    "#sidebar2ads",
-    "#sidebarAd",
-    "#sidebarAd1",
-    "#sidebarAd2",
-    "#sidebarAdSense",
-    "#sidebarAdSpace",
-    "#sidebarAdUnitWidget",
-    "#sidebarAds",
-    "#sidebarAdvTop",
-    "#sidebarAdvert",
-    "#sidebarSponsors",
-    "#sidebarTextAds",
-    "#sidebarTowerAds",
-    "#sidebar_ad",
-    "#sidebar_ad_1",
-    "#sidebar_ad_2",
-    "#sidebar_ad_3",
-    "#sidebar_ad_big",
-    "#sidebar_ad_container",
-    "#sidebar_ad_top",
-    "#sidebar_ad_widget",
-    "#sidebar_ad_wrapper",
-    "#sidebar_adblock",
-    "#sidebar_ads",
-    "#sidebar_box_add",
-    "#sidebar_topad",
-    "#sidebarad",
-    "#sidebarad0",
-    "#sidebaradpane",
-    "#sidebarads",
-    "#sidebaradsense",
-    "#sidebaradverts",
-    "#sidebard-ads-wrapper",
-    "#sidebargooglead",
-    "#sidebargoogleads",
-    "#sidebarrectad",
-    "#sideline-ad",
-    "#sidepad-ad",
-    "#single-ad",
-    "#single-ad-2",
-    "#single-adblade",
-    "#single-mpu",
-    "#singleADS",
-    "#singleADS3",
-    "#singleAd",
-    "#singleAdsContainer",
-    "#single_ad_above_content",
-    "#singlead",
-    "#singleads",
-    "#site-ad-container",
-    "#site-ads",
-    "#site-header__ads",
-    "#site-leaderboard-ads",
-    "#site-sponsor-ad",
-    "#site-sponsors",
-    "#siteAdHeader",
-    "#site_bottom_ad_div",
-    "#site_content_ad_div",
-    "#site_top_ad",
-    "#site_wrap_ad",
-    "#sitead",
-    "#skcolAdSky",
-    "#skin-ad",
-    "#skin-ad-left-rail-container",
-    "#skin-ad-right-rail-container",
-    "#skinTopAd",
-    "#skin_adv",
-    "#skinad-left",
-    "#skinad-right",
-    "#skinningads",
-    "#sky-ad",
-    "#sky-ads",
-    "#sky-left",
-    "#sky-right",
-    "#skyAd",
-    "#skyAdContainer",
-    "#skyScraperAd",
-    "#skyScrapperAd",
-    "#skyWrapperAds",
-    "#sky_ad",
-    "#sky_advert",
-    "#skyads",
-    "#skyadwrap",
-    "#skybox-ad",
-    "#skyline_ad",
-    "#skyscrapeAd",
-    "#skyscraper-ad",
-    "#skyscraperAd",
-    "#skyscraperAdContainer",
-    "#skyscraperAdWrap",
-    "#skyscraperAds",
-    "#skyscraperWrapperAd",
-    "#skyscraper_ad",
-    "#skyscraper_advert",
-    "#skyscraperadblock",
-    "#skyscrapper-ad",
-    "#slideAd",
-    "#slide_ad",
-    "#slidead",
-    "#slideboxad",
-    "#slider-ad",
-    "#sliderAdHolder",
-    "#slider_ad",
-    "#slideshowAd",
-    "#slideshow_ad_300x250",
-    "#sm-banner-ad",
-    "#smallAd",
-    "#small_ad",
-    "#small_ads",
-    "#smallad",
-    "#smallads",
-    "#smallerAd",
-    "#some-ads",
-    "#some-ads-holder",
-    "#sp-adv-banner-top",
-    "#sp-top-ad-wrapper",
-    "#specialAd",
-    "#special_ads",
-    "#specialadfeatures",
-    "#specials_ads",
-    "#speed_ads",
-    "#speeds_ads",
-    "#sphereAd",
-    "#sphereAd-wrap",
-    "#splashy-ad-container-top",
-    "#spnAds",
-    "#spnslink",
-    "#sponBox",
-    "#sponLinkDiv_1",
-    "#sponLinkDiv_2",
-    "#spon_links",
-    "#sponlink",
-    "#sponlinks",
-    "#sponsAds",
-    "#sponsLinks",
-    "#spons_links",
-    "#sponseredlinks",
-    "#sponsor-box-widget",
-    "#sponsor-flyout",
-    "#sponsor-flyout-wrap",
-    "#sponsor-links",
-    "#sponsor-partners",
-    "#sponsor-sidebar-container",
-    "#sponsorAd",
-    "#sponsorAd1",
-    "#sponsorAd2",
-    "#sponsorAdDiv",
-    "#sponsorBar",
-    "#sponsorBorder",
-    "#sponsorContainer0",
-    "#sponsorFooter",
-    "#sponsorLinkDiv",
-    "#sponsorLinks",
-    "#sponsorResults",
-    "#sponsorSpot",
-    "#sponsorTab",
-    "#sponsorText",
-    "#sponsorTextLink",
-    "#sponsor_300x250",
-    "#sponsor_ad",
-    "#sponsor_ads",
-    "#sponsor_bar",
-    "#sponsor_bottom",
-    "#sponsor_box",
-    "#sponsor_deals",
-    "#sponsor_div",
-    "#sponsor_footer",
-    "#sponsor_header",
-    "#sponsor_link",
-    "#sponsor_no",
-    "#sponsor_posts",
-    "#sponsor_right",
-    "#sponsored-ads",
-    "#sponsored-carousel-nucleus",
-    "#sponsored-footer",
-    "#sponsored-inline",
-    "#sponsored-links",
-    "#sponsored-links-alt",
-    "#sponsored-links-container",
-    "#sponsored-listings",
-    "#sponsored-message",
-    "#sponsored-products",
-    "#sponsored-recommendations",
-    "#sponsored-resources",
-    "#sponsored-search",
-    "#sponsored-text-links",
-    "#sponsored-widget",
-    "#sponsored1",
-    "#sponsoredAd",
-    "#sponsoredAdvertisement",
-    "#sponsoredBottom",
-    "#sponsoredBox1",
-    "#sponsoredBox2",
-    "#sponsoredFeaturedHoz",
-    "#sponsoredHoz",
-    "#sponsoredLinks",
-    "#sponsoredLinksBox",
-    "#sponsoredList",
-    "#sponsoredResults",
-    "#sponsoredResultsWide",
-    "#sponsoredTop",
-    "#sponsored_ads",
-    "#sponsored_container",
-    "#sponsored_content",
-    "#sponsored_head",
-    "#sponsored_label",
-    "#sponsored_link_bottom",
-    "#sponsored_links",
-    "#sponsored_native_ad",
-    "#sponsoredad",
-    "#sponsoredads",
-    "#sponsoredlinks",
-    "#sponsorfeature",
-    "#sponsorlink",
-    "#sponsors-article",
-    "#sponsors-block",
-    "#sponsors-home",
-    "#sponsorsBox",
-    "#sponsorsContainer",
-    "#sponsors_right_container",
-    "#sponsors_top_container",
-    "#sponsorsads1",
-    "#sponsorsads2",
-    "#sponsorship-area-wrapper",
-    "#sponsorship-box",
-    "#sporsored-results",
-    "#spotlight-ads",
-    "#spotlightAds",
-    "#spotlight_ad",
-    "#spotlightad",
-    "#sprint_ad",
-    "#sqAd",
-    "#sq_ads",
-    "#square-ad",
-    "#square-ad-box",
-    "#square-ad-space",
-    "#square-ads",
-    "#square-sponsors",
-    "#squareAd",
-    "#squareAdBottom",
-    "#squareAdSpace",
-    "#squareAdTop",
-    "#squareAdWrap",
-    "#squareAds",
-    "#squareGoogleAd",
-    "#square_ad",
-    "#squaread",
-    "#squareadevertise",
-    "#squareadvert",
-    "#squared_ad",
-    "#ss-ad-overlay",
-    "#ss-ads-container",
-    "#staticad",
-    "#stationad",
-    "#sticky-ad",
-    "#sticky-ad-bottom",
-    "#sticky-ad-container",
-    "#sticky-ad-header",
-    "#sticky-add-side-block",
-    "#sticky-ads",
-    "#sticky-ads-top",
-    "#sticky-custom-ads",
-    "#sticky-footer-ad",
-    "#sticky-footer-ads",
-    "#sticky-left-ad",
-    "#sticky-rail-ad",
-    "#sticky-top-ad-spacer",
-    "#sticky-top-ad-wrap",
-    "#stickyAd",
-    "#stickyAdBlock",
-    "#stickyBottomAd",
-    "#stickySidebarAd",
-    "#stickySkyAd",
-    "#sticky_sidebar_ads",
-    "#stickyad",
-    "#stickyads",
-    "#stickyleftad",
-    "#stickyrightad",
-    "#stopAdv",
-    "#stop_ad3",
-    "#story-ad",
-    "#story-bottom-ad",
-    "#storyAd",
-    "#story_ad",
-    "#story_ads",
-    "#storyad2",
-    "#stripadv",
-    "#subAdsFooter",
-    "#subbgad",
-    "#subheaderAd",
-    "#takeover-ad",
-    "#takeover_ad",
-    "#takeoverad",
-    "#td-ad-placeholder",
-    "#tdAds",
-    "#td_adunit1",
-    "#td_adunit1_wrapper",
-    "#td_adunit2",
-    "#td_sponsorAd",
-    "#team_ad",
-    "#teaser3",
-    "#template_affiliates",
-    "#text-ad",
-    "#text-ads",
-    "#text-intext-ads",
-    "#text-link-ads",
-    "#text-linkAD",
-    "#textAd",
-    "#textAd1",
-    "#textAds",
-    "#textAdsTop",
-    "#text_ad",
-    "#text_ads",
-    "#text_advert",
-    "#textad",
-    "#textad3",
-    "#textlink-advertisement",
-    "#textsponsor",
-    "#tfm_admanagerTeaser",
-    "#thistad",
-    "#tile-ad",
-    "#tileAds",
-    "#tmInfiniteAd",
-    "#toaster_ad",
-    "#top-ad",
-    "#top-ad-area",
-    "#top-ad-banner",
-    "#top-ad-container",
-    "#top-ad-content",
-    "#top-ad-desktop",
-    "#top-ad-div",
-    "#top-ad-google",
-    "#top-ad-iframe",
-    "#top-ad-rect",
-    "#top-ad-slot",
-    "#top-ad-slot-0",
-    "#top-ad-slot-1",
-    "#top-ad-unit",
-    "#top-ad-wrapper",
-    "#top-adblock",
-    "#top-adds",
-    "#top-ads",
-    "#top-ads-1",
-    "#top-ads-contain",
-    "#top-ads-container",
-    "#top-adspot",
-    "#top-advert",
-    "#top-advertisement",
-    "#top-advertisements",
-    "#top-advertising-content",
-    "#top-banner-ad",
-    "#top-banner-ad-browser",
-    "#top-buy-sell-ads",
-    "#top-dfp",
-    "#top-head-ad",
-    "#top-leaderboard-ad",
-    "#top-left-ad",
-    "#top-middle-add",
-    "#top-not-ads",
-    "#top-right-ad",
-    "#top-right-ad-slot",
-    "#top-skin-ad",
-    "#top-skin-ad-bg",
-    "#top-sponsor-ad",
-    "#top-story-ad",
-    "#top-story-ad-0",
-    "#top300x250ad",
-    "#top728ad",
-    "#topAD",
-    "#topAd",
-    "#topAd728x90",
-    "#topAdArea",
-    "#topAdBanner",
-    "#topAdBar",
-    "#topAdBox",
-    "#topAdContainer",
-    "#topAdDiv",
-    "#topAdDropdown",
-    "#topAdHolder",
-    "#topAdSenseDiv",
-    "#topAdShow",
-    "#topAdSpace",
-    "#topAdSpace_div",
-    "#topAdWrapper",
-    "#topAdcontainer",
-    "#topAds",
-    "#topAds1",
-    "#topAds2",
-    "#topAdsContainer",
-    "#topAdsDiv",
-    "#topAdsG",
-    "#topAdv",
-    "#topAdvBox",
-    "#topAdvert",
-    "#topBanner-ad",
-    "#topBannerAd",
-    "#topBannerAdContainer",
-    "#topBannerAdv",
-    "#topImgAd",
-    "#topLeaderboardAd",
-    "#topMPU",
-    "#topMpuContainer",
-    "#topSponsorBanner",
-    "#topSponsoredLinks",
-    "#top_AD",
-    "#top_ad",
-    "#top_ad-360",
-    "#top_ad_area",
-    "#top_ad_banner",
-    "#top_ad_block",
-    "#top_ad_box",
-    "#top_ad_container",
-    "#top_ad_td",
-    "#top_ad_unit",
-    "#top_ad_wrapper",
-    "#top_ad_zone",
-    "#top_add",
-    "#top_ads",
-    "#top_ads_box",
-    "#top_ads_container",
-    "#top_ads_region",
-    "#top_ads_wrap",
-    "#top_adsense_cont",
-    "#top_adspace",
-    "#top_adv",
-    "#top_advert",
-    "#top_advert_box",
-    "#top_advertise",
-    "#top_advertising",
-    "#top_banner_ads",
-    "#top_container_ad",
-    "#top_google_ads",
-    "#top_mpu",
-    "#top_mpu_ad",
-    "#top_rectangle_ad",
-    "#top_right_ad",
-    "#top_row_ad",
-    "#top_span_ad",
-    "#top_sponsor_ads",
-    "#top_sponsor_text",
-    "#top_wide_ad",
-    "#topad",
-    "#topad-728x90",
-    "#topad-block",
-    "#topad-wrap",
-    "#topad1",
-    "#topad2",
-    "#topad728",
-    "#topad_holder",
-    "#topad_left",
-    "#topad_right",
-    "#topad_table",
-    "#topadbanner",
-    "#topadbanner2",
-    "#topadbar",
-    "#topadblock",
-    "#topadcell",
-    "#topadcontainer",
-    "#topaddwide",
-    "#topadleft",
-    "#topadone",
-    "#topadplaceholder",
-    "#topadright",
-    "#topads-spacer",
-    "#topads-wrapper",
-    "#topadsblock",
-    "#topadsdiv",
-    "#topadsense",
-    "#topadspace",
-    "#topadvert",
-    "#topadwrap",
-    "#topadz",
-    "#topadzone",
-    "#topbanner_ad",
-    "#topbanner_sponsor",
-    "#topbannerad",
-    "#topbanneradtitle",
-    "#topbar-ad",
-    "#topbarAd",
-    "#topbarad",
-    "#topbarads",
-    "#topcustomad",
-    "#topheader_ads",
-    "#topleaderAd",
-    "#topleaderboardad",
-    "#topnavad",
-    "#toppannonse",
-    "#topright-ad",
-    "#toprightAdvert",
-    "#toprightad",
-    "#toprow-ad",
-    "#topsidebar-ad",
-    "#topsponad",
-    "#topsponsorads",
-    "#topsponsored",
-    "#toptextad",
-    "#tor-footer-ad",
-    "#tower1ad",
-    "#towerAdContainer",
-    "#towerad",
-    "#tpl_advertising",
-    "#transparentad",
-    "#trc_google_ad",
-    "#txtAdHeader",
-    "#upper-ads",
-    "#upperMpu",
-    "#upperRightAds",
-    "#upper_adbox",
-    "#upper_advertising",
-    "#upper_small_ad",
-    "#upperad",
-    "#vc-maincontainer-ad",
-    "#vc-maincontainer-midad",
-    "#vert-ads",
-    "#vertAd2",
-    "#vert_ad",
-    "#vert_ad_placeholder",
-    "#vertad1",
-    "#vertical.ad",
-    "#verticalAds",
-    "#vertical_ad",
-    "#vertical_ads",
-    "#verticalads",
-    "#video-ad",
-    "#video-ad-companion-rectangle",
-    "#video-adv",
-    "#video-adv-wrapper",
-    "#video-advert",
-    "#video-embed-ads",
-    "#video-in-player-ad",
-    "#video-side-adv",
-    "#video-sponsor-links",
-    "#video-under-player-ad",
-    "#videoAd",
-    "#videoAdContainer",
-    "#videoAdvert",
-    "#videoCompanionAd",
-    "#videoOverAd",
-    "#videoOverAd300",
-    "#videoPauseAd",
-    "#video_adv",
-    "#video_advert",
-    "#video_advert_top",
-    "#video_embed_ads",
-    "#video_hor_bot_ads",
-    "#video_overlay_ad",
-    "#videoad",
-    "#videoad-script-cnt",
-    "#videoads",
-    "#viewAd1",
-    "#viewabilityAdContainer",
-    "#visual-ad",
-    "#vuukle-quiz-and-ad",
-    "#vuukle_ads_square2",
-    "#wTopAd",
-    "#wallAd",
-    "#wall_advert",
-    "#wd-sponsored",
-    "#weather-ad",
-    "#weather_sponsor",
-    "#weatherad",
-    "#welcome_ad",
-    "#wg_ads",
-    "#wgtAd",
-    "#whitepaper-ad",
-    "#wide-ad",
-    "#wideAdd",
-    "#wide_ad_unit",
-    "#wide_ad_unit2",
-    "#wide_ad_unit3",
-    "#wide_adv",
-    "#wide_right_ad",
-    "#widget-ads-3",
-    "#widget-ads-4",
-    "#widget-adv-12",
-    "#widget-box-ad-1",
-    "#widget-box-ad-2",
-    "#widget-style-ad",
-    "#widget_Adverts",
-    "#widget_ad",
-    "#widget_advertisement",
-    "#widget_thrive_ad_default-2",
-    "#widget_thrive_ad_default-4",
-    "#widgetwidget_adserve",
-    "#widgetwidget_adserve2",
-    "#wl-pencil-ad",
-    "#wow-ads",
-    "#wp-insert-ad-widget-1",
-    "#wp-topAds",
-    "#wp_ad_marker",
-    "#wp_adbn_root",
-    "#wp_ads_gpt_widget-16",
-    "#wp_ads_gpt_widget-17",
-    "#wp_ads_gpt_widget-18",
-    "#wp_ads_gpt_widget-19",
-    "#wp_ads_gpt_widget-21",
-    "#wp_ads_gpt_widget-4",
-    "#wp_ads_gpt_widget-5",
-    "#wpladbox1",
-    "#wpladbox2",
-    "#wrapAd",
-    "#wrapAdRight",
-    "#wrapCommentAd",
-    "#wrapper-AD_G",
-    "#wrapper-AD_L",
-    "#wrapper-AD_L2",
-    "#wrapper-AD_L3",
-    "#wrapper-AD_PUSH",
-    "#wrapper-AD_R",
-    "#wrapper-ad",
-    "#wrapper-ad970",
-    "#wrapperAdsTopLeft",
-    "#wrapperAdsTopRight",
-    "#wrapperRightAds",
-    "#wrapper_ad_Top",
-    "#wrapper_sponsoredlinks",
-    "#wrapper_topad",
-    "#wtopad",
-    "#yahoo-sponsors",
-    "#yahooAdsBottom",
-    "#yahooSponsored",
-    "#yahoo_ads",
-    "#yahoo_text_ad",
-    "#yahooads",
-    "#yandex_ad",
-    "#yatadsky",
-    "#yrail_ads",
-    "#yreSponsoredLinks",
-    "#ysm_ad_iframe",
-    "#zMSplacement1",
-    "#zMSplacement2",
-    "#zMSplacement3",
-    "#zMSplacement4",
-    "#zMSplacement5",
-    "#zMSplacement6",
-    "#zdcFloatingBtn",
-    "#zeus_top-banner",
-    "#zone-adsense",
-    "#zsAdvertisingBanner",
-    "#zztextad",
-    ".-advertsSidebar",
-    ".AD-POST",
-    ".AD300",
-    ".AD300Block",
-    ".AD355125",
-    ".AD728",
-    ".ADBAR",
-    ".ADBnrArea",
-    ".ADBox",
-    ".ADFooter",
-    ".ADInfo",
-    ".ADLeader",
-    ".ADMiddle1",
-    ".ADPod",
-    ".ADServer",
-    ".ADStyle",
-    ".ADTextSingle",
-    ".ADTop",
-    ".ADV-Space",
-    ".ADVBig",
-    ".ADVFLEX_250",
-    ".ADVParallax",
-    ".ADV_Mobile",
-    ".AD_2",
-    ".AD_336_280",
-    ".AD_Leaderboard",
-    ".AD_area",
-    ".AD_textinfo",
-    ".AD_underpost",
-    ".ADbox",
-    ".ADmid",
-    ".ADouter_div",
-    ".ADwidget",
-    ".AL-ad-container",
-    ".ATF_wrapper",
-    ".Ad--970x90",
-    ".Ad--Align",
-    ".Ad--awareness-bp",
-    ".Ad--empty",
-    ".Ad--header",
-    ".Ad--loading",
-    ".Ad--presenter",
-    ".Ad--sidebar",
-    ".Ad-Advert_Container",
-    ".Ad-Container",
-    ".Ad-Header",
-    ".Ad-Inner",
-    ".Ad-adhesive",
-    ".Ad-hor-height",
-    ".Ad-label",
-    ".Ad-leaderboard",
-    ".Ad.Leaderboard",
-    ".Ad300",
-    ".Ad3Tile",
-    ".Ad728x90",
-    ".AdBar",
-    ".AdBody:not(body)",
-    ".AdBorder",
-    ".AdBottomPage",
-    ".AdBox",
-    ".AdBox160",
-    ".AdBox7",
-    ".AdBox728",
-    ".AdCenter",
-    ".AdCommercial",
-    ".AdCompactheader",
-    ".AdContainer",
-    ".AdContainer-Sidebar",
-    ".AdHeader",
-    ".AdHere",
-    ".AdHolder",
-    ".AdInline",
-    ".AdInsLink",
-    ".AdLeft1",
-    ".AdLeft2",
-    ".AdMedium",
-    ".AdMessage",
-    ".AdMod",
-    ".AdModule",
-    ".AdOneColumnContainer",
-    ".AdOuterMostContainer",
-    ".AdPanel",
-    ".AdPlaceHolder",
-    ".AdPlaceholder",
-    ".AdPlacementBannerSponsorship",
-    ".AdPlacementContainer",
-    ".AdPlacementMPU",
-    ".AdProduct",
-    ".AdRight1",
-    ".AdRight2",
-    ".AdSense",
-    ".AdSenseLeft",
-    ".AdSlot",
-    ".AdSpace",
-    ".AdSpeedWP",
-    ".AdTagModule",
-    ".AdTitle",
-    ".AdTop",
-    ".AdUnit",
-    ".AdUnit300",
-    ".AdUnit300x250",
-    ".AdUnitBox",
-    ".AdWidget_ImageWidget",
-    ".AdWrapper--sticky-block",
-    ".Ad_C",
-    ".Ad_D",
-    ".Ad_Label",
-    ".Ad_Right",
-    ".Ad_SmartBrokerBar",
-    ".Ad_container",
-    ".Adgrid_footboard",
-    ".Adgrid_right_rail",
-    ".Ads--center",
-    ".Ads-768x90",
-    ".Ads-background",
-    ".Ads-leaderboard",
-    ".Ads-slot",
-    ".Ads-sticky",
-    ".AdsBottom",
-    ".AdsBox",
-    ".AdsBoxBottom",
-    ".AdsBoxSection",
-    ".AdsBoxTop",
-    ".AdsInnov_responsive_ad",
-    ".AdsLayout__top-container",
-    ".AdsSections",
-    ".AdsSlot",
-    ".Ads_3",
-    ".Ads_4",
-    ".Ads__wrapper",
-    ".Ads_header",
-    ".Adsense",
-    ".AdsenseBox",
-    ".Adsinnov_flex_adcontainer",
-    ".Adsterra",
-    ".Adtext",
-    ".Adv468",
-    ".Advert-label",
-    ".Advert300x250",
-    ".AdvertContainer",
-    ".AdvertWrapper",
-    ".AdvertisementAfterHeader",
-    ".AdvertisementAfterPost",
-    ".AdvertisementAsidePost",
-    ".AdvertisementText",
-    ".AdvertisementTextTag",
-    ".AdvertisementTop",
-    ".Advertisment",
-    ".AdvertorialTeaser",
-    ".AdvtSample",
-    ".AdzerkBanner",
-    ".AffiliateAds",
-    ".AppFooter__BannerAd",
-    ".Arpian-ads",
-    ".Article-advert",
-    ".ArticleAd",
-    ".ArticleAdSide",
-    ".ArticleAdWrapper",
-    ".ArticleInlineAd",
-    ".ArticleInnerAD",
-    ".Article__Ad",
-    ".BOX_Ad",
-    ".BOX_LeadAd",
-    ".Banner300x250",
-    ".Banner468X60",
-    ".BigBoxAd",
-    ".BigBoxAdLabel",
-    ".Billboard-ad",
-    ".Billboard-ad-holder",
-    ".Billboard_2-ad-holder",
-    ".Billboard_3-ad-holder",
-    ".Billboard_4-ad-holder",
-    ".Billboard_5-ad-holder",
-    ".BlockAd",
-    ".BottomAd-container",
-    ".BottomAdContainer",
-    ".BottomAdsPartial",
-    ".BottomAffiliate",
-    ".BoxAd",
-    ".BoxAdWrap",
-    ".BoxRail-ad",
-    ".ButtonAd",
-    ".CommentAd",
-    ".ConnatixAd",
-    ".ContentAd",
-    ".ContentAds",
-    ".ContentBottomAd",
-    ".ContentTextAd",
-    ".ContentTopAd",
-    ".DFPad",
-    ".DartAdvert",
-    ".DisplayAd",
-    ".FirstAd",
-    ".FooterAd",
-    ".FooterAdContainer",
-    ".FooterAds",
-    ".Footer_1-ad-holder",
-    ".GRVAd",
-    ".GRVMpuWrapper",
-    ".Gallery-Content-BottomAd",
-    ".GeminiAdItem",
-    ".GeminiNativeAd",
-    ".GoogleAdInfo",
-    ".GoogleAdsBox",
-    ".GoogleAdsItem",
-    ".GoogleAdv",
-    ".GoogleDfpAd",
-    ".GoogleDfpAd-Content",
-    ".GoogleDfpAd-Float",
-    ".GoogleDfpAd-container",
-    ".GoogleDfpAd-wrap",
-    ".GoogleDfpAd-wrapper",
-    ".GoogleDfpAdModule",
-    ".GoogleDoubleClick-SponsorText",
-    ".GoogleSideAd",
-    ".GroupAdSense",
-    ".HeaderAd",
-    ".HeaderAds",
-    ".HeaderBannerAd",
-    ".HeadingAdSpace",
-    ".Hero-Ad",
-    ".HomeAds",
-    ".HomeListBlack__AdBlock",
-    ".InArticleAd",
-    ".IndexRightAd",
-    ".InsertedAd",
-    ".LastAd",
-    ".LayoutBottomAds",
-    ".LayoutHomeAds",
-    ".LayoutHomeAdsAd",
-    ".LayoutPromotionAdsNew",
-    ".LazyLoadAd",
-    ".LeaderAd",
-    ".LeaderAdvertisement",
-    ".LeaderBoardAd",
-    ".LearderAd_Border",
-    ".ListicleAdRow",
-    ".MPUHolder",
-    ".MPUad",
-    ".MapLayout_BottomAd",
-    ".MapLayout_BottomMobiAd",
-    ".MarketGid_container",
-    ".MbanAd",
-    ".MiddleAd",
-    ".MiddleAdContainer",
-    ".MiddleAdvert",
-    ".MiddleRightRadvertisement",
-    ".NA_ad",
-    ".NR-Ads",
-    ".NativeAdContainerRegion",
-    ".NavBarAd",
-    ".Normal-add",
-    ".OAS_wrap",
-    ".OcelotAdModule",
-    ".OcelotAdModule-ad",
-    ".PPD_ADS_JS",
-    ".Page-ad",
-    ".PageTopAd",
-    ".PcSideBarAd",
-    ".PencilAd",
-    ".PostAdvertisementBeforePost",
-    ".PostSidebarAd",
-    ".Post__ad",
-    ".PrimisResponsiveStyle",
-    ".PrintAd-Slider",
-    ".ProductAd",
-    ".PushdownAd",
-    ".RectangleAd",
-    ".Rectangle_1-ad-holder",
-    ".Rectangle_2-ad-holder",
-    ".Rectangle_3-ad-holder",
-    ".RelatedAds",
-    ".ResponsiveAd",
-    ".RightAd",
-    ".RightAd1",
-    ".RightAd2",
-    ".RightAdvertisement",
-    ".RightGoogleAd",
-    ".RightRailAd",
-    ".RightRailAds",
-    ".RightTowerAd",
-    ".STR_AdBlock",
-    ".SecondaryAd",
-    ".SecondaryAdLink",
-    ".Section-ad",
-    ".SectionSponsor",
-    ".SideAd",
-    ".SideAdCol",
-    ".SideAds",
-    ".SideWidget__ad",
-    ".Sidebar-ad",
-    ".Sidebar-ad--300x600",
-    ".SidebarAd",
-    ".SidebarAdvert",
-    ".SidebarRightAdvertisement",
-    ".SimpleAd",
-    ".SkyAdContainer",
-    ".SkyAdContent",
-    ".SkyScraperAd",
-    ".SovrnAd",
-    ".Sponsor-container",
-    ".SponsorHeader",
-    ".SponsorIsland",
-    ".SponsorLink",
-    ".SponsoredAdTitle",
-    ".SponsoredArticleAd",
-    ".SponsoredContent",
-    ".SponsoredContentWidget",
-    ".SponsoredLinks",
-    ".SponsoredLinksModule",
-    ".SponsoredLinksPadding",
-    ".SponsoredLinksPanel",
-    ".SponsoredResults",
-    ".Sponsored_link",
-    ".SponsorshipText",
-    ".SquareAd",
-    ".Squareadspot",
-    ".StandardAdLeft",
-    ".StandardAdRight",
-    ".Sticky-AdContainer",
-    ".StickyAdRail__Inner",
-    ".SummaryPage-HeaderAd",
-    ".TextAd",
-    ".TextAdds",
-    ".Textads",
-    ".ThreeAds",
-    ".TmnAdsense",
-    ".TopAd",
-    ".TopAdBox",
-    ".TopAdContainer",
-    ".TopAdL",
-    ".TopAdR",
-    ".TopAds",
-    ".TopAdsPartial",
-    ".TopBannerAd",
-    ".TopRightRadvertisement",
-    ".Top_Ad",
-    ".TrackedBannerPromo",
-    ".TrackedSidebarPromo",
-    ".TrafficAd",
-    ".U210-adv-column",
-    ".UnderAd",
-    ".VPCarbonAds",
-    ".VerticalAd",
-    ".Video-Ad",
-    ".VideoAd",
-    ".WPBannerizeWidget",
-    ".WP_Widget_Ad_manager",
-    ".Wdgt.widgetAds",
-    ".WideAdTile",
-    ".WideAdsLeft",
-    ".WidgetAdvertiser",
-    ".WidthAd",
-    ".WikiaTopAds",
-    ".XEad",
-    "._SummaryPageHeaderAdView",
-    "._SummaryPageSidebarStickyAdView",
-    ".__isboostOverContent",
-    "._ads",
-    "._ads-full",
-    "._ap_adrecover_ad",
-    "._ap_apex_ad",
-    "._articleAdvert",
-    "._bannerAds",
-    "._bottom_ad_wrapper",
-    "._ciw-betterAds",
-    "._fullsquaread",
-    "._has-ads",
-    "._popIn_recommend_article_ad",
-    "._popIn_recommend_article_ad_reserved",
-    "._table_ad_div_wide",
-    ".a-ad",
-    ".a-ad--aside",
-    ".a-ad--leaderboard",
-    ".a-ad--skyscraper",
-    ".a-ad--wide",
-    ".a-d-250",
-    ".a-d-container",
-    ".a-d-holder-container",
-    ".a-dserver",
-    ".a-dserver_text",
-    ".a-sponsor",
-    ".a160x600",
-    ".a300x250",
-    ".a468x60",
-    ".a728x90",
-    ".aadsection_b1",
-    ".aadsection_b2",
-    ".aarpe-ad-wrapper",
-    ".ab-ad_placement-article",
-    ".abBoxAd",
-    ".abMessage",
-    ".abPopup",
-    ".ablock300",
-    ".ablock468",
-    ".ablock728",
-    ".above-header-advert",
-    ".aboveCommentAds",
-    ".abovead",
-    ".ac-banner-ad",
-    ".ac_adbox",
-    ".acm-ad-container",
-    ".acm-ad-tag-unit",
-    ".acm_ad_zones",
-    ".ad--300",
-    ".ad--300x250",
-    ".ad--468",
-    ".ad--468-60",
-    ".ad--728x90",
-    ".ad--970-750-336-300",
-    ".ad--970-90",
-    ".ad--article",
-    ".ad--article-top",
-    ".ad--articlemodule",
-    ".ad--b",
-    ".ad--banner",
-    ".ad--banner2",
-    ".ad--banniere_basse",
-    ".ad--banniere_haute",
-    ".ad--billboard",
-    ".ad--bottom",
-    ".ad--bottom-label",
-    ".ad--bottommpu",
-    ".ad--boundries",
-    ".ad--button",
-    ".ad--c",
-    ".ad--center",
-    ".ad--centered",
-    ".ad--container",
-    ".ad--content",
-    ".ad--content-ad",
-    ".ad--dart",
-    ".ad--desktop",
-    ".ad--displayed",
-    ".ad--droite_basse",
-    ".ad--droite_haute",
-    ".ad--droite_middle",
-    ".ad--e",
-    ".ad--fallback",
-    ".ad--footer",
-    ".ad--fullsize",
-    ".ad--google",
-    ".ad--halfpage",
-    ".ad--header",
-    ".ad--homepage-top",
-    ".ad--in-article",
-    ".ad--in-content",
-    ".ad--inArticleBanner",
-    ".ad--inline",
-    ".ad--inner",
-    ".ad--large",
-    ".ad--leaderboard",
-    ".ad--loading",
-    ".ad--marker-inner",
-    ".ad--medium-rectangle",
-    ".ad--medium_rectangle",
-    ".ad--medium_rectangle_outstream",
-    ".ad--mediumrectangle",
-    ".ad--mid",
-    ".ad--mid-content",
-    ".ad--mobile",
-    ".ad--mpu",
-    ".ad--native",
-    ".ad--nativeFlex",
-    ".ad--no-bg",
-    ".ad--noscroll",
-    ".ad--object",
-    ".ad--outstream",
-    ".ad--overlayer",
-    ".ad--p1",
-    ".ad--p2",
-    ".ad--p3",
-    ".ad--p4",
-    ".ad--p6",
-    ".ad--p7",
-    ".ad--placeholder",
-    ".ad--pubperform",
-    ".ad--pushdown",
-    ".ad--rail",
-    ".ad--rectangle",
-    ".ad--rectangle1",
-    ".ad--rectangle2",
-    ".ad--right",
-    ".ad--rightRail",
-    ".ad--scroll",
-    ".ad--section",
-    ".ad--seeding",
-    ".ad--showmob",
-    ".ad--sidebar",
-    ".ad--sky",
-    ".ad--skyscraper",
-    ".ad--slider",
-    ".ad--slot",
-    ".ad--sponsor-content",
-    ".ad--square-rectangle",
-    ".ad--sticky",
-    ".ad--stripe",
-    ".ad--stroeer",
-    ".ad--stroer",
-    ".ad--subcontainer",
-    ".ad--tabletDesktop",
-    ".ad--top",
-    ".ad--top-desktop",
-    ".ad--top-leaderboard",
-    ".ad--top-slot",
-    ".ad--topmobile",
-    ".ad--topmobile2",
-    ".ad--topmobile3",
-    ".ad--wallpaper",
-    ".ad--widget",
-    ".ad--wrapper",
-    ".ad-1",
-    ".ad-1-drzac-links",
-    ".ad-1-sidebar-1",
-    ".ad-1-sidebar-2",
-    ".ad-10",
-    ".ad-101",
-    ".ad-11",
-    ".ad-12",
-    ".ad-120-60",
-    ".ad-120-600-inner",
-    ".ad-120-bottom",
-    ".ad-120-top",
-    ".ad-120x60",
-    ".ad-120x600",
-    ".ad-120x90",
-    ".ad-121",
-    ".ad-125",
-    ".ad-125x125",
-    ".ad-13",
-    ".ad-137",
-    ".ad-14",
-    ".ad-140x45-2",
-    ".ad-150",
-    ".ad-160",
-    ".ad-160-160",
-    ".ad-160-600",
-    ".ad-160-above",
-    ".ad-160x600",
-    ".ad-160x600-gallery",
-    ".ad-160x600-home",
-    ".ad-160x600-wrap",
-    ".ad-160x600x1",
-    ".ad-160x600x2",
-    ".ad-160x600x3",
-    ".ad-194",
-    ".ad-2",
-    ".ad-200",
-    ".ad-200-big",
-    ".ad-200-small",
-    ".ad-200x200",
-    ".ad-228x94",
-    ".ad-230x90",
-    ".ad-234",
-    ".ad-246x90",
-    ".ad-250",
-    ".ad-250x125",
-    ".ad-250x250",
-    ".ad-250x300",
-    ".ad-260x60",
-    ".ad-270x100",
-    ".ad-3",
-    ".ad-300",
-    ".ad-300-2",
-    ".ad-300-250-600",
-    ".ad-300-600",
-    ".ad-300-b",
-    ".ad-300-b-absolute",
-    ".ad-300-block",
-    ".ad-300-blog",
-    ".ad-300-dummy",
-    ".ad-300-flex",
-    ".ad-300-x-250",
-    ".ad-300X250",
-    ".ad-300X250-body",
-    ".ad-300x",
-    ".ad-300x100",
-    ".ad-300x200",
-    ".ad-300x250",
-    ".ad-300x250-first",
-    ".ad-300x250-home",
-    ".ad-300x250-right0",
-    ".ad-300x250-singlepost",
-    ".ad-300x250_600x250",
-    ".ad-300x600",
-    ".ad-300x70",
-    ".ad-300x75",
-    ".ad-319x128",
-    ".ad-336",
-    ".ad-336x280",
-    ".ad-336x280B",
-    ".ad-350",
-    ".ad-355x75",
-    ".ad-3x1",
-    ".ad-4",
-    ".ad-468",
-    ".ad-468-bottom",
-    ".ad-468-top",
-    ".ad-468x120",
-    ".ad-468x60",
-    ".ad-5",
-    ".ad-544x250",
-    ".ad-55",
-    ".ad-560",
-    ".ad-6",
-    ".ad-600",
-    ".ad-600-h",
-    ".ad-635x40",
-    ".ad-7",
-    ".ad-720-affiliate",
-    ".ad-728",
-    ".ad-728-90",
-    ".ad-728-banner",
-    ".ad-728-x-90",
-    ".ad-728x90",
-    ".ad-728x90-1",
-    ".ad-728x90-top",
-    ".ad-728x90-top0",
-    ".ad-728x90-wrapper",
-    ".ad-728x90_forum",
-    ".ad-768",
-    ".ad-8",
-    ".ad-88-60",
-    ".ad-88-text",
-    ".ad-88x31",
-    ".ad-9",
-    ".ad-90",
-    ".ad-90x600",
-    ".ad-970",
-    ".ad-970-250",
-    ".ad-970-90",
-    ".ad-970x250-container",
-    ".ad-970x250-home",
-    ".ad-980-1",
-    ".ad-Advert_Placeholder",
-    ".ad-CUSTOM",
-    ".ad-E",
-    ".ad-LREC",
-    ".ad-LREC2",
-    ".ad-Leaderboard",
-    ".ad-MPU",
-    ".ad-MediumRectangle",
-    ".ad-PENCIL",
-    ".ad-RR",
-    ".ad-S",
-    ".ad-Square",
-    ".ad-SuperBanner",
-    ".ad-TOPPER",
-    ".ad-W",
-    ".ad-a",
-    ".ad-ab",
-    ".ad-abc",
-    ".ad-above-header",
-    ".ad-accordion",
-    ".ad-active",
-    ".ad-adSense",
-    ".ad-adcode",
-    ".ad-adhesion",
-    ".ad-adlink-bottom",
-    ".ad-adlink-side",
-    ".ad-adsense",
-    ".ad-adsense-block-250",
-    ".ad-advertisement-horizontal",
-    ".ad-affiliate",
-    ".ad-after-content",
-    ".ad-after-header",
-    ".ad-align-none",
-    ".ad-aligncenter",
-    ".ad-alignment",
-    ".ad-alsorectangle",
-    ".ad-anchor",
-    ".ad-aps-wide",
-    ".ad-area",
-    ".ad-area--pd",
-    ".ad-area-small",
-    ".ad-article-breaker",
-    ".ad-article-inline",
-    ".ad-article-teaser",
-    ".ad-article-wrapper",
-    ".ad-aside-pc-billboard",
-    ".ad-atf",
-    ".ad-atf-top",
-    ".ad-background",
-    ".ad-background-center",
-    ".ad-background-container",
-    ".ad-ban",
-    ".ad-banner-2",
-    ".ad-banner-250x600",
-    ".ad-banner-300",
-    ".ad-banner-300x250",
-    ".ad-banner-5",
-    ".ad-banner-6",
-    ".ad-banner-728x90",
-    ".ad-banner-bottom-container",
-    ".ad-banner-box",
-    ".ad-banner-btf",
-    ".ad-banner-container",
-    ".ad-banner-content",
-    ".ad-banner-full-wrapper",
-    ".ad-banner-header",
-    ".ad-banner-image",
-    ".ad-banner-inlisting",
-    ".ad-banner-leaderboard",
-    ".ad-banner-placeholder",
-    ".ad-banner-single",
-    ".ad-banner-smaller",
-    ".ad-banner-static",
-    ".ad-banner-top",
-    ".ad-banner-top-wrapper",
-    ".ad-banner-wrapper",
-    ".ad-banners",
-    ".ad-bar",
-    ".ad-bar-header",
-    ".ad-bb",
-    ".ad-before-header",
-    ".ad-below",
-    ".ad-below-images",
-    ".ad-below-player",
-    ".ad-belowarticle",
-    ".ad-bg",
-    ".ad-big",
-    ".ad-big-box",
-    ".ad-bigbanner",
-    ".ad-bigbillboard",
-    ".ad-bigbox",
-    ".ad-bigbox-double-inread",
-    ".ad-bigbox-fixed",
-    ".ad-bigsize",
-    ".ad-billboard",
-    ".ad-bline",
-    ".ad-block",
-    ".ad-block--300",
-    ".ad-block--leader",
-    ".ad-block-300",
-    ".ad-block-banner-container",
-    ".ad-block-big",
-    ".ad-block-bottom",
-    ".ad-block-btf",
-    ".ad-block-container",
-    ".ad-block-header",
-    ".ad-block-holder",
-    ".ad-block-inside",
-    ".ad-block-mod",
-    ".ad-block-section",
-    ".ad-block-square",
-    ".ad-block-sticky-ad",
-    ".ad-block-wide",
-    ".ad-block-wk",
-    ".ad-block-wrapper",
-    ".ad-block-wrapper-dev",
-    ".ad-blogads",
-    ".ad-bnr",
-    ".ad-body",
-    ".ad-boombox",
-    ".ad-border",
-    ".ad-bordered",
-    ".ad-borderless",
-    ".ad-bot",
-    ".ad-bottom",
-    ".ad-bottom-container",
-    ".ad-bottom-right-container",
-    ".ad-bottom728x90",
-    ".ad-bottomLeft",
-    ".ad-bottomleader",
-    ".ad-bottomline",
-    ".ad-box",
-    ".ad-box-2",
-    ".ad-box-300x250",
-    ".ad-box-auto",
-    ".ad-box-caption",
-    ".ad-box-container",
-    ".ad-box-title",
-    ".ad-box-up",
-    ".ad-box-video",
-    ".ad-box-wrapper",
-    ".ad-box1",
-    ".ad-box2",
-    ".ad-box3",
-    ".ad-box_h",
-    ".ad-boxamp-wrapper",
-    ".ad-boxbottom",
-    ".ad-boxes",
-    ".ad-boxrr-wrapper",
-    ".ad-boxsticky",
-    ".ad-boxtop",
-    ".ad-brdr-btm",
-    ".ad-break",
-    ".ad-break-item",
-    ".ad-breaker",
-    ".ad-breakout",
-    ".ad-browse-rectangle",
-    ".ad-bt",
-    ".ad-btn",
-    ".ad-btn-heading",
-    ".ad-bug-300w",
-    ".ad-burnside",
-    ".ad-button",
-    ".ad-buttons",
-    ".ad-c-label",
-    ".ad-cad",
-    ".ad-calendar",
-    ".ad-call-300x250",
-    ".ad-callout",
-    ".ad-callout-wrapper",
-    ".ad-caption",
-    ".ad-card",
-    ".ad-card-container",
-    ".ad-carousel",
-    ".ad-cat",
-    ".ad-catfish",
-    ".ad-cell",
-    ".ad-cen",
-    ".ad-cen2",
-    ".ad-cen3",
-    ".ad-center",
-    ".ad-centered",
-    ".ad-centering",
-    ".ad-chartbeatwidget",
-    ".ad-choices",
-    ".ad-circ",
-    ".ad-click",
-    ".ad-close-button",
-    ".ad-cls",
-    ".ad-cls-fix",
-    ".ad-cnt",
-    ".ad-code",
-    ".ad-codes",
-    ".ad-col",
-    ".ad-col-02",
-    ".ad-colour",
-    ".ad-column",
-    ".ad-comment",
-    ".ad-companion",
-    ".ad-complete",
-    ".ad-component",
-    ".ad-component-fullbanner2",
-    ".ad-component-wrapper",
-    ".ad-contain",
-    ".ad-contain-300x250",
-    ".ad-contain-top",
-    ".ad-container--inline",
-    ".ad-container--leaderboard",
-    ".ad-container--masthead",
-    ".ad-container--mrec",
-    ".ad-container--stripe",
-    ".ad-container--top",
-    ".ad-container-160x600",
-    ".ad-container-300x250",
-    ".ad-container-728",
-    ".ad-container-728x90",
-    ".ad-container-adsense",
-    ".ad-container-banner-top",
-    ".ad-container-bot",
-    ".ad-container-bottom",
-    ".ad-container-box",
-    ".ad-container-embedded",
-    ".ad-container-header",
-    ".ad-container-inner",
-    ".ad-container-inthread",
-    ".ad-container-leaderboard",
-    ".ad-container-left",
-    ".ad-container-m",
-    ".ad-container-medium-rectangle",
-    ".ad-container-middle",
-    ".ad-container-multiple",
-    ".ad-container-pave",
-    ".ad-container-property",
-    ".ad-container-responsive",
-    ".ad-container-right",
-    ".ad-container-side",
-    ".ad-container-single",
-    ".ad-container-tool",
-    ".ad-container-top",
-    ".ad-container-topad",
-    ".ad-container-wrapper",
-    ".ad-container1",
-    ".ad-container3x",
-    ".ad-container__ad-slot",
-    ".ad-container__leaderboard",
-    ".ad-container__sticky-wrapper",
-    ".ad-container_row",
-    ".ad-content",
-    ".ad-content-area",
-    ".ad-content-rectangle",
-    ".ad-content-slot",
-    ".ad-content-wrapper",
-    ".ad-context",
-    ".ad-cover",
-    ".ad-critical",
-    ".ad-cta",
-    ".ad-ctn",
-    ".ad-current",
-    ".ad-curtain",
-    ".ad-custom-size",
-    ".ad-d",
-    ".ad-decoration",
-    ".ad-defer",
-    ".ad-description",
-    ".ad-desktop",
-    ".ad-desktop-in-content",
-    ".ad-desktop-legacy",
-    ".ad-desktop-native-1",
-    ".ad-desktop-native-2",
-    ".ad-desktop-only",
-    ".ad-desktop-right",
-    ".ad-detail",
-    ".ad-dfp-column",
-    ".ad-dfp-row",
-    ".ad-disclaimer",
-    ".ad-disclaimer-container",
-    ".ad-disclaimer-text",
-    ".ad-display",
-    ".ad-displayed",
-    ".ad-div",
-    ".ad-div-a0-wrapper",
-    ".ad-div-t0-wrapper",
-    ".ad-diver",
-    ".ad-divider",
-    ".ad-dog",
-    ".ad-dog__cnx-container",
-    ".ad-dog__ratio-16x9",
-    ".ad-dt",
-    ".ad-dx_wrp",
-    ".ad-e",
-    ".ad-element",
-    ".ad-enabled",
-    ".ad-endcap-wrapper",
-    ".ad-engage",
-    ".ad-entity-container",
-    ".ad-entry-wrapper",
-    ".ad-ex",
-    ".ad-exchange",
-    ".ad-expand",
-    ".ad-external",
-    ".ad-fadein",
-    ".ad-fadeup",
-    ".ad-feature-content",
-    ".ad-feature-sponsor",
-    ".ad-feature-text",
-    ".ad-featured-video-caption",
-    ".ad-feedback",
-    ".ad-fi",
-    ".ad-field",
-    ".ad-filler",
-    ".ad-filmstrip",
-    ".ad-first",
-    ".ad-fix",
-    ".ad-fixed",
-    ".ad-flag",
-    ".ad-flex",
-    ".ad-flex-center",
-    ".ad-float",
-    ".ad-floating",
-    ".ad-floor",
-    ".ad-footer",
-    ".ad-footer-empty",
-    ".ad-footer-leaderboard",
-    ".ad-format-300x250",
-    ".ad-format-300x600",
-    ".ad-forum",
-    ".ad-frame",
-    ".ad-frame-container",
-    ".ad-full",
-    ".ad-full-width",
-    ".ad-fullbanner",
-    ".ad-fullbanner-btf-container",
-    ".ad-fullbannernohieght",
-    ".ad-fullwidth",
-    ".ad-gap-sm",
-    ".ad-giga",
-    ".ad-google",
-    ".ad-google-contextual",
-    ".ad-gpt",
-    ".ad-gpt-breaker",
-    ".ad-gpt-container",
-    ".ad-gpt-main",
-    ".ad-gpt-vertical",
-    ".ad-graphic-large",
-    ".ad-gray",
-    ".ad-grey",
-    ".ad-grid",
-    ".ad-grid-125",
-    ".ad-grid-container",
-    ".ad-group",
-    ".ad-grp",
-    ".ad-h",
-    ".ad-h-250",
-    ".ad-h-60",
-    ".ad-halfpage",
-    ".ad-halfpage-placeholder",
-    ".ad-hdr",
-    ".ad-head",
-    ".ad-header",
-    ".ad-header-below",
-    ".ad-header-container",
-    ".ad-header-creative",
-    ".ad-header-inner-wrap",
-    ".ad-header-pencil",
-    ".ad-header-placeholder",
-    ".ad-header-sidebar",
-    ".ad-header-small-square",
-    ".ad-heading",
-    ".ad-headliner-container",
-    ".ad-heigh-mobile-250",
-    ".ad-height-250",
-    ".ad-height-280",
-    ".ad-height-600",
-    ".ad-here",
-    ".ad-hero",
-    ".ad-hfu",
-    ".ad-hide-mobile",
-    ".ad-hideable",
-    ".ad-hint",
-    ".ad-hldr-tmc",
-    ".ad-ho",
-    ".ad-hold",
-    ".ad-holder",
-    ".ad-holder-center",
-    ".ad-holder-mob-300",
-    ".ad-home-bottom",
-    ".ad-home-leaderboard-placeholder",
-    ".ad-home-right",
-    ".ad-homeleaderboard",
-    ".ad-homepage",
-    ".ad-homepage-1",
-    ".ad-homepage-2",
-    ".ad-homepage-one",
-    ".ad-hor",
-    ".ad-horizontal",
-    ".ad-horizontal-large",
-    ".ad-horizontal-top",
-    ".ad-horizontal-top-wrapper",
-    ".ad-house-btac",
-    ".ad-housepromo-d-wrapper",
-    ".ad-hoverable",
-    ".ad-hpto",
-    ".ad-href1",
-    ".ad-href2",
-    ".ad-iab-txt",
-    ".ad-icon",
-    ".ad-identifier",
-    ".ad-iframe",
-    ".ad-iframe-container",
-    ".ad-imagehold",
-    ".ad-in-300x250",
-    ".ad-in-artilce",
-    ".ad-in-content",
-    ".ad-in-content-300",
-    ".ad-in-post",
-    ".ad-in-read",
-    ".ad-in-results",
-    ".ad-incontent",
-    ".ad-incontent-wrap",
-    ".ad-index-main",
-    ".ad-indicator-horiz",
-    ".ad-info-wrap",
-    ".ad-inline",
-    ".ad-inline-article",
-    ".ad-inline-block",
-    ".ad-inner",
-    ".ad-inner-container",
-    ".ad-inner-container-background",
-    ".ad-innr",
-    ".ad-insert",
-    ".ad-inserter-widget",
-    ".ad-inside",
-    ".ad-integrated-display",
-    ".ad-internal",
-    ".ad-interruptor",
-    ".ad-interstitial",
-    ".ad-island",
-    ".ad-item",
-    ".ad-item-related",
-    ".ad-itself",
-    ".ad-label",
-    ".ad-lable",
-    ".ad-landscape",
-    ".ad-large-1",
-    ".ad-large-game",
-    ".ad-last",
-    ".ad-lat",
-    ".ad-lat2",
-    ".ad-layer",
-    ".ad-lazy",
-    ".ad-lb",
-    ".ad-ldrbrd",
-    ".ad-lead",
-    ".ad-lead-bottom",
-    ".ad-leader",
-    ".ad-leader-board",
-    ".ad-leader-bottom",
-    ".ad-leader-plus-top",
-    ".ad-leader-top",
-    ".ad-leader-wrap",
-    ".ad-leader-wrapper",
-    ".ad-leaderboard",
-    ".ad-leaderboard-base",
-    ".ad-leaderboard-companion",
-    ".ad-leaderboard-container",
-    ".ad-leaderboard-flex",
-    ".ad-leaderboard-footer",
-    ".ad-leaderboard-header",
-    ".ad-leaderboard-middle",
-    ".ad-leaderboard-placeholder",
-    ".ad-leaderboard-slot",
-    ".ad-leaderboard-splitter",
-    ".ad-leaderboard-top",
-    ".ad-leaderboard-wrapper",
-    ".ad-leaderbody",
-    ".ad-leaderheader",
-    ".ad-leadtop",
-    ".ad-left-1",
-    ".ad-left-top",
-    ".ad-leftrail",
-    ".ad-lib-div",
-    ".ad-line",
-    ".ad-link",
-    ".ad-link-block",
-    ".ad-link-label",
-    ".ad-link-left",
-    ".ad-link-right",
-    ".ad-links",
-    ".ad-links-text",
-    ".ad-list-desktop",
-    ".ad-list-item",
-    ".ad-loaded",
-    ".ad-loader",
-    ".ad-location",
-    ".ad-location-container",
-    ".ad-lock",
-    ".ad-lock-content",
-    ".ad-lowerboard",
-    ".ad-lrec",
-    ".ad-m-banner",
-    ".ad-m-mrec",
-    ".ad-m-rec",
-    ".ad-mad",
-    ".ad-main",
-    ".ad-manager-ad",
-    ".ad-manager-placeholder",
-    ".ad-manager-wrapper",
-    ".ad-margin",
-    ".ad-marketplace",
-    ".ad-marketswidget",
-    ".ad-marquee",
-    ".ad-masthead",
-    ".ad-masthead-1",
-    ".ad-masthead-left",
-    ".ad-mb",
-    ".ad-med",
-    ".ad-med-rec",
-    ".ad-med-rect",
-    ".ad-med-rect-tmp",
-    ".ad-medium",
-    ".ad-medium-container",
-    ".ad-medium-content",
-    ".ad-medium-rectangle",
-    ".ad-medium-rectangle-base",
-    ".ad-medium-two",
-    ".ad-medium-widget",
-    ".ad-medrect",
-    ".ad-megaboard",
-    ".ad-message",
-    ".ad-messaging",
-    ".ad-microsites",
-    ".ad-midleader",
-    ".ad-mobile",
-    ".ad-mobile--sticky",
-    ".ad-mobile-300x150",
-    ".ad-mobile-300x250",
-    ".ad-mobile-300x50",
-    ".ad-mobile-banner",
-    ".ad-mobile-dynamic",
-    ".ad-mobile-flex-inc",
-    ".ad-mobile-flex-pos2",
-    ".ad-mobile-incontent-ad-plus",
-    ".ad-mobile-mpu-plus-outstream-inc",
-    ".ad-mobile-nav-ad-plus",
-    ".ad-mod",
-    ".ad-mod-section",
-    ".ad-mod-section-728-90",
-    ".ad-module",
-    ".ad-mount",
-    ".ad-mpl",
-    ".ad-mpu",
-    ".ad-mpu-bottom",
-    ".ad-mpu-container",
-    ".ad-mpu-middle",
-    ".ad-mpu-middle2",
-    ".ad-mpu-placeholder",
-    ".ad-mpu-plus-top",
-    ".ad-mpu-top",
-    ".ad-mpu__aside",
-    ".ad-mpufixed",
-    ".ad-mr-article",
-    ".ad-mrec",
-    ".ad-mrect",
-    ".ad-msg",
-    ".ad-msn",
-    ".ad-native",
-    ".ad-native-top-sidebar",
-    ".ad-nav-ad",
-    ".ad-nav-ad-plus",
-    ".ad-new",
-    ".ad-new-box",
-    ".ad-no-css",
-    ".ad-no-notice",
-    ".ad-no-style",
-    ".ad-noBorderAndMargin",
-    ".ad-noline",
-    ".ad-note",
-    ".ad-notice",
-    ".ad-notice-small",
-    ".ad-observer",
-    ".ad-oms",
-    ".ad-on",
-    ".ad-on-top",
-    ".ad-one",
-    ".ad-other",
-    ".ad-outer",
-    ".ad-outlet",
-    ".ad-outline",
-    ".ad-output-middle",
-    ".ad-output-wrapper",
-    ".ad-outside",
-    ".ad-overlay",
-    ".ad-packs",
-    ".ad-padding",
-    ".ad-page-leader",
-    ".ad-page-medium",
-    ".ad-page-setting",
-    ".ad-pagehead",
-    ".ad-panel",
-    ".ad-panel-wrap",
-    ".ad-panel__container",
-    ".ad-panel__container--styled",
-    ".ad-panel__googlead",
-    ".ad-panorama",
-    ".ad-parallax",
-    ".ad-parent-class",
-    ".ad-pb",
-    ".ad-peg",
-    ".ad-pencil-margin",
-    ".ad-permalink",
-    ".ad-personalise",
-    ".ad-place",
-    ".ad-place-active",
-    ".ad-place-holder",
-    ".ad-placeholder",
-    ".ad-placeholder--mpu",
-    ".ad-placeholder-leaderboard",
-    ".ad-placeholder-wrapper",
-    ".ad-placeholder-wrapper-dynamic",
-    ".ad-placeholder__inner",
-    ".ad-placement-left",
-    ".ad-placement-right",
-    ".ad-placement_desktop-top-sticky",
-    ".ad-places",
-    ".ad-plea",
-    ".ad-poc",
-    ".ad-poc-admin",
-    ".ad-point",
-    ".ad-popup",
-    ".ad-popup-content",
-    ".ad-pos",
-    ".ad-pos-0",
-    ".ad-pos-1",
-    ".ad-pos-2",
-    ".ad-pos-3",
-    ".ad-pos-4",
-    ".ad-pos-5",
-    ".ad-pos-6",
-    ".ad-pos-7",
-    ".ad-pos-8",
-    ".ad-pos-middle",
-    ".ad-pos-top",
-    ".ad-position",
-    ".ad-position-1",
-    ".ad-position-2",
-    ".ad-poss",
-    ".ad-post",
-    ".ad-post-footer",
-    ".ad-post-top",
-    ".ad-postText",
-    ".ad-poster",
-    ".ad-posterad-inlisting",
-    ".ad-preloader-container",
-    ".ad-preparing",
-    ".ad-prevent-jump",
-    ".ad-primary",
-    ".ad-primary-desktop",
-    ".ad-primary-sidebar",
-    ".ad-priority",
-    ".ad-program-list",
-    ".ad-program-top",
-    ".ad-promo",
-    ".ad-pub",
-    ".ad-push",
-    ".ad-pushdown",
-    ".ad-r",
-    ".ad-rac-box",
-    ".ad-rail",
-    ".ad-rail-wrapper",
-    ".ad-ratio",
-    ".ad-rb-hover",
-    ".ad-reader-con-item",
-    ".ad-rect",
-    ".ad-rect-atf-01",
-    ".ad-rect-top-right",
-    ".ad-rectangle",
-    ".ad-rectangle-1",
-    ".ad-rectangle-banner",
-    ".ad-rectangle-container",
-    ".ad-rectangle-long",
-    ".ad-rectangle-long-sky",
-    ".ad-rectangle-text",
-    ".ad-rectangle-wide",
-    ".ad-rectangle-xs",
-    ".ad-rectangle2",
-    ".ad-rectanglemed",
-    ".ad-region",
-    ".ad-region-delay-load",
-    ".ad-region__top",
-    ".ad-related",
-    ".ad-relatedbottom",
-    ".ad-render-space",
-    ".ad-responsive",
-    ".ad-responsive-slot",
-    ".ad-responsive-wide",
-    ".ad-result",
-    ".ad-rev-content",
-    ".ad-rh",
-    ".ad-right",
-    ".ad-right-header",
-    ".ad-right1",
-    ".ad-right2",
-    ".ad-right3",
-    ".ad-risingstar-container",
-    ".ad-roadblock",
-    ".ad-root",
-    ".ad-rotation",
-    ".ad-rotator",
-    ".ad-row",
-    ".ad-row-box",
-    ".ad-row-horizontal",
-    ".ad-row-horizontal-top",
-    ".ad-row-viewport",
-    ".ad-s",
-    ".ad-s-rendered",
-    ".ad-sample",
-    ".ad-script-processed",
-    ".ad-scroll",
-    ".ad-scrollpane",
-    ".ad-search-grid",
-    ".ad-secondary-desktop",
-    ".ad-section",
-    ".ad-section-body",
-    ".ad-section-one",
-    ".ad-section-three",
-    ".ad-section__skyscraper",
-    ".ad-sense",
-    ".ad-sense-ad",
-    ".ad-sep",
-    ".ad-separator",
-    ".ad-shifted",
-    ".ad-show-label",
-    ".ad-showcase",
-    ".ad-side",
-    ".ad-side-one",
-    ".ad-side-top",
-    ".ad-side-wrapper",
-    ".ad-sidebar",
-    ".ad-sidebar-mrec",
-    ".ad-sidebar-skyscraper",
-    ".ad-siderail",
-    ".ad-signup",
-    ".ad-single-bottom",
-    ".ad-sitewide",
-    ".ad-size-300x600",
-    ".ad-size-landscape",
-    ".ad-size-leaderboard",
-    ".ad-size-medium-rectangle",
-    ".ad-size-medium-rectangle-flex",
-    ".ad-size-mpu",
-    ".ad-skeleton",
-    ".ad-skin-link",
-    ".ad-sky",
-    ".ad-sky-left",
-    ".ad-sky-right",
-    ".ad-sky-wrap",
-    ".ad-skyscr",
-    ".ad-skyscraper",
-    ".ad-skyscraper1",
-    ".ad-skyscraper2",
-    ".ad-skyscraper3",
-    ".ad-slider",
-    ".ad-slot",
-    ".ad-slot--inline",
-    ".ad-slot--leaderboard--article--wrapper",
-    ".ad-slot--mostpop",
-    ".ad-slot--mpu-banner-ad",
-    ".ad-slot--rendered",
-    ".ad-slot--right",
-    ".ad-slot--top",
-    ".ad-slot--top-above-nav",
-    ".ad-slot--top-banner-ad",
-    ".ad-slot--wrapper",
-    ".ad-slot-1",
-    ".ad-slot-2",
-    ".ad-slot-234-60",
-    ".ad-slot-300-250",
-    ".ad-slot-728-90",
-    ".ad-slot-a",
-    ".ad-slot-article",
-    ".ad-slot-banner",
-    ".ad-slot-bigbox",
-    ".ad-slot-billboard",
-    ".ad-slot-box",
-    ".ad-slot-container",
-    ".ad-slot-container-1",
-    ".ad-slot-full-width",
-    ".ad-slot-header",
-    ".ad-slot-horizontal",
-    ".ad-slot-inview",
-    ".ad-slot-ph",
-    ".ad-slot-placeholder",
-    ".ad-slot-rail",
-    ".ad-slot-replies",
-    ".ad-slot-replies-header",
-    ".ad-slot-responsive",
-    ".ad-slot-sidebar",
-    ".ad-slot-sidebar-b",
-    ".ad-slot-tall",
-    ".ad-slot-top",
-    ".ad-slot-top-728",
-    ".ad-slot-widget",
-    ".ad-slot-wrapper",
-    ".ad-slotRg",
-    ".ad-slotRgc",
-    ".ad-slot__ad--top",
-    ".ad-slot__content",
-    ".ad-slot__label",
-    ".ad-slot__oas",
-    ".ad-slots-wrapper",
-    ".ad-slug",
-    ".ad-small",
-    ".ad-small-1",
-    ".ad-small-2",
-    ".ad-smallBP",
-    ".ad-source",
-    ".ad-sp",
-    ".ad-space",
-    ".ad-space-mpu-box",
-    ".ad-space-topbanner",
-    ".ad-spacing",
-    ".ad-span",
-    ".ad-speedbump",
-    ".ad-splash",
-    ".ad-sponsor",
-    ".ad-sponsor-large-container",
-    ".ad-sponsor-text",
-    ".ad-sponsored-feed-top",
-    ".ad-sponsored-links",
-    ".ad-sponsored-post",
-    ".ad-sponsors",
-    ".ad-spot",
-    ".ad-spotlight",
-    ".ad-spteaser",
-    ".ad-sq-super",
-    ".ad-square",
-    ".ad-square-placeholder",
-    ".ad-square2-container",
-    ".ad-square300",
-    ".ad-squares",
-    ".ad-stack",
-    ".ad-standard",
-    ".ad-statement",
-    ".ad-static",
-    ".ad-sticky",
-    ".ad-sticky-banner",
-    ".ad-sticky-bottom",
-    ".ad-sticky-container",
-    ".ad-sticky-slot",
-    ".ad-sticky-wrapper",
-    ".ad-stickyhero",
-    ".ad-stickyhero--standard",
-    ".ad-stickyhero-enable-mobile",
-    ".ad-story-inject",
-    ".ad-story-top",
-    ".ad-strategic",
-    ".ad-strip",
-    ".ad-style2",
-    ".ad-subnav-container",
-    ".ad-subtitle",
-    ".ad-summary",
-    ".ad-superbanner",
-    ".ad-superbanner-node",
-    ".ad-t",
-    ".ad-t-text",
-    ".ad-table",
-    ".ad-tabs",
-    ".ad-tag",
-    ".ad-tag-square",
-    ".ad-tag__inner",
-    ".ad-tag__wrapper",
-    ".ad-takeover",
-    ".ad-takeover-homepage",
-    ".ad-tall",
-    ".ad-tech-widget",
-    ".ad-temp",
-    ".ad-text",
-    ".ad-text-centered",
-    ".ad-text-label",
-    ".ad-text-link",
-    ".ad-text-links",
-    ".ad-textads",
-    ".ad-textlink",
-    ".ad-thanks",
-    ".ad-ticker",
-    ".ad-tile",
-    ".ad-title",
-    ".ad-tl1",
-    ".ad-top",
-    ".ad-top-300x250",
-    ".ad-top-728",
-    ".ad-top-728x90",
-    ".ad-top-banner",
-    ".ad-top-billboard",
-    ".ad-top-billboard-init",
-    ".ad-top-box-right",
-    ".ad-top-container",
-    ".ad-top-featured",
-    ".ad-top-in",
-    ".ad-top-lboard",
-    ".ad-top-left",
-    ".ad-top-mpu",
-    ".ad-top-padding",
-    ".ad-top-rectangle",
-    ".ad-top-right-container",
-    ".ad-top-side",
-    ".ad-top-slot",
-    ".ad-top-spacing",
-    ".ad-top-wrap-inner",
-    ".ad-top-wrapper",
-    ".ad-topbanner",
-    ".ad-topper",
-    ".ad-topright",
-    ".ad-topteaser",
-    ".ad-total",
-    ".ad-total1",
-    ".ad-tower",
-    ".ad-tower-container",
-    ".ad-towers",
-    ".ad-transition",
-    ".ad-trck",
-    ".ad-two",
-    ".ad-twos",
-    ".ad-txt",
-    ".ad-txt-red",
-    ".ad-type",
-    ".ad-type-branding",
-    ".ad-type-cube",
-    ".ad-type-flex-leaderboard",
-    ".ad-unit",
-    ".ad-unit--leaderboard",
-    ".ad-unit-2",
-    ".ad-unit-300",
-    ".ad-unit-300-wrapper",
-    ".ad-unit-container",
-    ".ad-unit-horisontal",
-    ".ad-unit-inline-center",
-    ".ad-unit-label",
-    ".ad-unit-mpu",
-    ".ad-unit-panel",
-    ".ad-unit-secondary",
-    ".ad-unit-sponsored-bar",
-    ".ad-unit-t",
-    ".ad-unit-text",
-    ".ad-unit-top",
-    ".ad-unit-wrapper",
-    ".ad-unit__inner",
-    ".ad-units-single-header-wrapper",
-    ".ad-update",
-    ".ad-us",
-    ".ad-v",
-    ".ad-vert",
-    ".ad-vertical",
-    ".ad-vertical-container",
-    ".ad-vertical-stack-ad",
-    ".ad-view-zone",
-    ".ad-w",
-    ".ad-w-300",
-    ".ad-w-468",
-    ".ad-w-728",
-    ".ad-w-970",
-    ".ad-w300",
-    ".ad-wallpaper-panorama-container",
-    ".ad-warning",
-    ".ad-warp",
-    ".ad-watermark",
-    ".ad-wgt",
-    ".ad-wide",
-    ".ad-wide-bottom",
-    ".ad-wide-wrap",
-    ".ad-widget",
-    ".ad-widget-area",
-    ".ad-widget-box",
-    ".ad-widget-list",
-    ".ad-widget-sizes",
-    ".ad-widget-wrapper",
-    ".ad-widgets",
-    ".ad-width-300",
-    ".ad-width-728",
-    ".ad-wireframe",
-    ".ad-wireframe-wrapper",
-    ".ad-with-background",
-    ".ad-with-header-wrapper",
-    ".ad-with-notice",
-    ".ad-wp",
-    ".ad-wp-720",
-    ".ad-wrap",
-    ".ad-wrap-leaderboard",
-    ".ad-wrap-transparent",
-    ".ad-wrap_wallpaper",
-    ".ad-wrapp",
-    ".ad-wrapper",
-    ".ad-wrapper--ad-unit-wrap",
-    ".ad-wrapper--articletop",
-    ".ad-wrapper--lg",
-    ".ad-wrapper--sidebar",
-    ".ad-wrapper-250",
-    ".ad-wrapper-bg",
-    ".ad-wrapper-left",
-    ".ad-wrapper-mobile-atf",
-    ".ad-wrapper-outer",
-    ".ad-wrapper-solid",
-    ".ad-wrapper-sticky",
-    ".ad-wrapper-top",
-    ".ad-wrapper-with-text",
-    ".ad-wrapper__ad-slug",
-    ".ad-xs-title",
-    ".ad-zone",
-    ".ad-zone-ajax",
-    ".ad-zone-container",
-    ".ad.addon",
-    ".ad.bottom_article_leaderboard",
-    ".ad.bottomrect",
-    ".ad.box",
-    ".ad.brandboard",
-    ".ad.card",
-    ".ad.center",
-    ".ad.contentboard",
-    ".ad.desktop-970x250",
-    ".ad.element",
-    ".ad.floater-link",
-    ".ad.gallery",
-    ".ad.halfpage",
-    ".ad.inner",
-    ".ad.item",
-    ".ad.leaderboard",
-    ".ad.maxiboard",
-    ".ad.maxisky",
-    ".ad.middlerect",
-    ".ad.module",
-    ".ad.monsterboard",
-    ".ad.netboard",
-    ".ad.post-area",
-    ".ad.promotion",
-    ".ad.rectangle",
-    ".ad.rectangle_2",
-    ".ad.rectangle_3",
-    ".ad.rectangle_home_1",
-    ".ad.section",
-    ".ad.sidebar-module",
-    ".ad.size-300x250",
-    ".ad.skybridgeleft",
-    ".ad.small-mpu",
-    ".ad.small-teaser",
-    ".ad.super",
-    ".ad.wideboard_tablet",
-    ".ad.widget",
-    ".ad02",
-    ".ad03",
-    ".ad04",
-    ".ad08sky",
-    ".ad1-float",
-    ".ad1-left",
-    ".ad1-right",
-    ".ad10",
-    ".ad100",
-    ".ad1000",
-    ".ad1001",
-    ".ad100x100",
-    ".ad120",
-    ".ad120_600",
-    ".ad120x120",
-    ".ad120x240GrayBorder",
-    ".ad120x60",
-    ".ad120x600",
-    ".ad125",
-    ".ad125x125",
-    ".ad125x125a",
-    ".ad125x125b",
-    ".ad140",
-    ".ad160",
-    ".ad160600",
-    ".ad160_blk",
-    ".ad160_l",
-    ".ad160_r",
-    ".ad160b",
-    ".ad160x160",
-    ".ad160x600",
-    ".ad160x600GrayBorder",
-    ".ad160x600_1",
-    ".ad160x600box",
-    ".ad170x30",
-    ".ad18",
-    ".ad180",
-    ".ad180x80",
-    ".ad185x100",
-    ".ad19",
-    ".ad1Image",
-    ".ad1_bottom",
-    ".ad1_latest",
-    ".ad1_top",
-    ".ad1b",
-    ".ad1left",
-    ".ad1x1",
-    ".ad2-float",
-    ".ad200",
-    ".ad200x60",
-    ".ad220x50",
-    ".ad230",
-    ".ad233x224",
-    ".ad234",
-    ".ad234x60",
-    ".ad236x62",
-    ".ad240",
-    ".ad250",
-    ".ad250wrap",
-    ".ad250x250",
-    ".ad250x300",
-    ".ad260",
-    ".ad260x60",
-    ".ad284x134",
-    ".ad290",
-    ".ad2content_box",
-    ".ad300",
-    ".ad300-hp-top",
-    ".ad3001",
-    ".ad300250",
-    ".ad300Block",
-    ".ad300Wrapper",
-    ".ad300X250",
-    ".ad300_2",
-    ".ad300_250",
-    ".ad300_bg",
-    ".ad300_ver2",
-    ".ad300b",
-    ".ad300banner",
-    ".ad300px",
-    ".ad300shows",
-    ".ad300top",
-    ".ad300w",
-    ".ad300x-placeholder",
-    ".ad300x100",
-    ".ad300x111",
-    ".ad300x120",
-    ".ad300x150",
-    ".ad300x250",
-    ".ad300x250-1",
-    ".ad300x250-2",
-    ".ad300x250-home",
-    ".ad300x250-hp-features",
-    ".ad300x250-inline",
-    ".ad300x250-stacked",
-    ".ad300x2501",
-    ".ad300x250GrayBorder",
-    ".ad300x250Module",
-    ".ad300x250Right",
-    ".ad300x250Top",
-    ".ad300x250_box",
-    ".ad300x250_container",
-    ".ad300x250a",
-    ".ad300x250b",
-    ".ad300x250box",
-    ".ad300x250box2",
-    ".ad300x250flex",
-    ".ad300x250s",
-    ".ad300x250x2",
-    ".ad300x40",
-    ".ad300x50-right",
-    ".ad300x600",
-    ".ad300x600cat",
-    ".ad300x600post",
-    ".ad300x77",
-    ".ad300x90",
-    ".ad310",
-    ".ad315",
-    ".ad320x250",
-    ".ad320x50",
-    ".ad336",
-    ".ad336_b",
-    ".ad336x250",
-    ".ad336x280",
-    ".ad336x362",
-    ".ad343x290",
-    ".ad350",
-    ".ad350r",
-    ".ad360",
-    ".ad366",
-    ".ad3rdParty",
-    ".ad400",
-    ".ad400right",
-    ".ad400x40",
-    ".ad450",
-    ".ad468",
-    ".ad468_60",
-    ".ad468box",
-    ".ad468innerboxadpic",
-    ".ad468x60",
-    ".ad468x60Wrap",
-    ".ad468x60_main",
-    ".ad470x60",
-    ".ad530",
-    ".ad540x90",
-    ".ad590",
-    ".ad590x90",
-    ".ad5_container",
-    ".ad600",
-    ".ad612x80",
-    ".ad620x70",
-    ".ad626X35",
-    ".ad640x480",
-    ".ad644",
-    ".ad650x140",
-    ".ad652",
-    ".ad70",
-    ".ad728",
-    ".ad72890",
-    ".ad728By90",
-    ".ad728_90",
-    ".ad728_blk",
-    ".ad728_cont",
-    ".ad728_wrap",
-    ".ad728b",
-    ".ad728cont",
-    ".ad728h",
-    ".ad728top",
-    ".ad728x90",
-    ".ad728x90-1",
-    ".ad728x90-2",
-    ".ad728x90box",
-    ".ad728x90btf",
-    ".ad970",
-    ".ad970_250",
-    ".adActive",
-    ".adAlert",
-    ".adArea",
-    ".adAreaLC",
-    ".adAreaNative",
-    ".adAreaTopTitle",
-    ".adArticleBanner",
-    ".adArticleBody",
-    ".adArticleSideTop300x250",
-    ".adBan",
-    ".adBanner300x250",
-    ".adBanner728x90",
-    ".adBillboard",
-    ".adBkgd",
-    ".adBlock",
-    ".adBlock728",
-    ".adBlockBottom",
-    ".adBlockSpacer",
-    ".adBlockSpot",
-    ".adBorder",
-    ".adBorders",
-    ".adBox",
-    ".adBox-small",
-    ".adBox1",
-    ".adBox2",
-    ".adBox5",
-    ".adBox6",
-    ".adBox728",
-    ".adBox728X90",
-    ".adBox728X90_header",
-    ".adBoxBody",
-    ".adBoxBorder",
-    ".adBoxContainer",
-    ".adBoxContent",
-    ".adBoxFooter",
-    ".adBoxHeader",
-    ".adBoxSidebar",
-    ".adBoxSingle",
-    ".adBoxTitle",
-    ".adBox_1",
-    ".adBox_3",
-    ".adBtm",
-    ".adCall",
-    ".adCaptionText",
-    ".adCell",
-    ".adCenter",
-    ".adCenterAd",
-    ".adCentertile",
-    ".adChoice",
-    ".adChoiceLogo",
-    ".adChoicesLogo",
-    ".adChrome",
-    ".adClose",
-    ".adCode",
-    ".adColumn",
-    ".adColumnLeft",
-    ".adColumnRight",
-    ".adComponent",
-    ".adCont",
-    ".adContTop",
-    ".adContainer1",
-    ".adContainerSide",
-    ".adContent",
-    ".adContentAd",
-    ".adContour",
-    ".adCopy",
-    ".adCreative",
-    ".adCreator",
-    ".adCube",
-    ".adDefRect",
-    ".adDetails_ad336",
-    ".adDiv",
-    ".adDrawer",
-    ".adDyn",
-    ".adElement",
-    ".adExpanded",
-    ".adFooterLinks",
-    ".adFrame",
-    ".adFrameCnt",
-    ".adFrameContainer",
-    ".adFrames",
-    ".adFuel-label",
-    ".adFull",
-    ".adFullbanner",
-    ".adGlobalHeader",
-    ".adGoogle",
-    ".adGroup",
-    ".adHalfPage",
-    ".adHead",
-    ".adHeader",
-    ".adHeaderAdbanner",
-    ".adHeaderText",
-    ".adHeaderblack",
-    ".adHeading",
-    ".adHeadline",
-    ".adHeadlineSummary",
-    ".adHed",
-    ".adHeight200",
-    ".adHeight270",
-    ".adHeight280",
-    ".adHeight313",
-    ".adHeight600",
-    ".adHolder",
-    ".adHolder2",
-    ".adHolderStory",
-    ".adHoldert",
-    ".adHome300x250",
-    ".adHomeSideTop300x250",
-    ".adHorisontal",
-    ".adHorisontalNoBorder",
-    ".adHorizontalTextAlt",
-    ".adHplaceholder",
-    ".adHz",
-    ".adIDiv",
-    ".adIframe",
-    ".adIframeCount",
-    ".adImg",
-    ".adImgIM",
-    ".adInArticle",
-    ".adInContent",
-    ".adInfo",
-    ".adInitRemove",
-    ".adInner",
-    ".adInnerLeftBottom",
-    ".adInsider",
-    ".adInteractive",
-    ".adIsland",
-    ".adItem",
-    ".adLabel",
-    ".adLabelLine",
-    ".adLabels",
-    ".adLargeRec",
-    ".adLargeRect",
-    ".adLat",
-    ".adLeader",
-    ".adLeaderBoard_container",
-    ".adLeaderForum",
-    ".adLeaderboard",
-    ".adLeaderboardAdContainer",
-    ".adLeft",
-    ".adLine",
-    ".adLink",
-    ".adLinkCnt",
-    ".adListB",
-    ".adLoader",
-    ".adLocal",
-    ".adLocation",
-    ".adMPU",
-    ".adMPUHome",
-    ".adMRECHolder",
-    ".adMarker",
-    ".adMarkerBlock",
-    ".adMastheadLeft",
-    ".adMastheadRight",
-    ".adMed",
-    ".adMedRectBox",
-    ".adMedRectBoxLeft",
-    ".adMediaMiddle",
-    ".adMediumRectangle",
-    ".adMessage",
-    ".adMiddle",
-    ".adMinHeight280",
-    ".adMinHeight313",
-    ".adMiniTower",
-    ".adMod",
-    ".adModule",
-    ".adModule--inner",
-    ".adModule--outer",
-    ".adModule-outer",
-    ".adModule300",
-    ".adModuleAd",
-    ".adMpu",
-    ".adMpuHolder",
-    ".adMrginBottom",
-    ".adNarrow",
-    ".adNoBorder",
-    ".adNoOutline",
-    ".adNone",
-    ".adNote",
-    ".adNotice",
-    ".adNotice90",
-    ".adNoticeOut",
-    ".adNotification",
-    ".adObj",
-    ".adOne",
-    ".adOuterContainer",
-    ".adOverlay",
-    ".adPanel",
-    ".adPanelContent",
-    ".adPanorama",
-    ".adPlaceholder",
-    ".adPlacement",
-    ".adPod",
-    ".adPosition",
-    ".adPremium",
-    ".adRecommend",
-    ".adRecommendRight",
-    ".adRect",
-    ".adRectangle",
-    ".adRectangle-pos-large",
-    ".adRectangle-pos-medium",
-    ".adRectangle-pos-small",
-    ".adRectangleBanner",
-    ".adRectangleUnit",
-    ".adRemove",
-    ".adRenderer",
-    ".adRendererInfinite",
-    ".adResponsive",
-    ".adResult",
-    ".adResults",
-    ".adRight",
-    ".adRightSide",
-    ".adRightSky",
-    ".adRoller",
-    ".adRotator",
-    ".adRow",
-    ".adRowTopWrapper",
-    ".adSKY",
-    ".adSection",
-    ".adSenceImagePush",
-    ".adSense",
-    ".adSense-header",
-    ".adSepDiv",
-    ".adServer",
-    ".adSeven",
-    ".adSide",
-    ".adSideBarMPU",
-    ".adSideBarMPUTop",
-    ".adSidebarButtons",
-    ".adSizer",
-    ".adSkin",
-    ".adSky",
-    ".adSkyscaper",
-    ".adSkyscraper",
-    ".adSlice",
-    ".adSlide",
-    ".adSlot",
-    ".adSlot-container",
-    ".adSlotAdition",
-    ".adSlotCnt",
-    ".adSlotContainer",
-    ".adSlotHeaderContainer",
-    ".adSlug",
-    ".adSpBelow",
-    ".adSpace",
-    ".adSpace300x250",
-    ".adSpace950x90",
-    ".adSpacer",
-    ".adSpec",
-    ".adSplash",
-    ".adSponsor",
-    ".adSponsorText",
-    ".adSponsorhipInfo",
-    ".adSpot",
-    ".adSpot-mrec",
-    ".adSpot-textBox",
-    ".adSpotBlock",
-    ".adSpotFullWidth",
-    ".adSpotIsland",
-    ".adSquare",
-    ".adStatementText",
-    ".adStyle",
-    ".adStyle1",
-    ".adSub",
-    ".adSubColPod",
-    ".adSummary",
-    ".adSuperboard",
-    ".adSupertower",
-    ".adTD",
-    ".adTXTnew",
-    ".adTab",
-    ".adTag",
-    ".adTag-top",
-    ".adTag-wrap",
-    ".adTagThree",
-    ".adTagTwo",
-    ".adText",
-    ".adTextDownload",
-    ".adTextPmpt",
-    ".adTextStreaming",
-    ".adTextWrap",
-    ".adTicker",
-    ".adTile",
-    ".adTileWrap",
-    ".adTiler",
-    ".adTip",
-    ".adTitle",
-    ".adTitleR",
-    ".adTop",
-    ".adTopBk",
-    ".adTopFloat",
-    ".adTopHome",
-    ".adTopLB",
-    ".adTopLeft",
-    ".adTopRight",
-    ".adTopWrapper",
-    ".adTopboxright",
-    ".adTwo",
-    ".adTxt",
-    ".adType2",
-    ".adUnderArticle",
-    ".adUnit",
-    ".adUnitHorz",
-    ".adUnitVert",
-    ".adVar",
-    ".adVertical",
-    ".adVideo",
-    ".adVideo2",
-    ".adVl",
-    ".adVplaceholder",
-    ".adWarning",
-    ".adWebBoard",
-    ".adWideSkyscraper",
-    ".adWideSkyscraperRight",
-    ".adWidget",
-    ".adWidgetBlock",
-    ".adWithTab",
-    ".adWizard-ad",
-    ".adWord",
-    ".adWords-bg",
-    ".adWrap",
-    ".adWrapLg",
-    ".adWrapper",
-    ".adWrapper1",
-    ".adZone",
-    ".adZoneRight",
-    ".ad_0",
-    ".ad_1",
-    ".ad_1000_125",
-    ".ad_120x60",
-    ".ad_120x600",
-    ".ad_120x90",
-    ".ad_125",
-    ".ad_130x90",
-    ".ad_150x150",
-    ".ad_160",
-    ".ad_160_600",
-    ".ad_160x600",
-    ".ad_16m7rle",
-    ".ad_180x150",
-    ".ad_188_inner",
-    ".ad_1day9",
-    ".ad_2",
-    ".ad_200",
-    ".ad_200x200",
-    ".ad_234x60",
-    ".ad_240",
-    ".ad_250",
-    ".ad_250250",
-    ".ad_250x200",
-    ".ad_250x250",
-    ".ad_250x250_w",
-    ".ad_290_290",
-    ".ad_3",
-    ".ad_300",
-    ".ad_300250",
-    ".ad_300Home",
-    ".ad_300Side",
-    ".ad_300_120",
-    ".ad_300_250",
-    ".ad_300_250_1",
-    ".ad_300_250_2",
-    ".ad_300_250_wrapper",
-    ".ad_300_600",
-    ".ad_300by250",
-    ".ad_300s",
-    ".ad_300x100",
-    ".ad_300x240",
-    ".ad_300x250",
-    ".ad_300x250_box_right",
-    ".ad_300x250_container",
-    ".ad_300x50",
-    ".ad_300x500",
-    ".ad_300x60",
-    ".ad_300x600",
-    ".ad_320x250_async",
-    ".ad_320x360",
-    ".ad_320x50",
-    ".ad_330x110",
-    ".ad_336",
-    ".ad_336_gr_white",
-    ".ad_336x280",
-    ".ad_336x90",
-    ".ad_338_282",
-    ".ad_350x100",
-    ".ad_350x250",
-    ".ad_4",
-    ".ad_400x200",
-    ".ad_468",
-    ".ad_468x60",
-    ".ad_4_row",
-    ".ad_5",
-    ".ad_600",
-    ".ad_630x130",
-    ".ad_640",
-    ".ad_640x480",
-    ".ad_640x90",
-    ".ad_680x15",
-    ".ad_728",
-    ".ad_72890",
-    ".ad_72890_box",
-    ".ad_728Home",
-    ".ad_728_90",
-    ".ad_728_90_1",
-    ".ad_728_90_top",
-    ".ad_728_90b",
-    ".ad_728_in",
-    ".ad_728_top",
-    ".ad_728_v2",
-    ".ad_728x90",
-    ".ad_728x90-1",
-    ".ad_728x90-2",
-    ".ad_728x90_container",
-    ".ad_728x90_top",
-    ".ad_728x90b",
-    ".ad_88x31",
-    ".ad_90",
-    ".ad_925x90",
-    ".ad_940_0",
-    ".ad_954-60",
-    ".ad_960",
-    ".ad_970_2",
-    ".ad_970x250_300x250",
-    ".ad_970x250_container",
-    ".ad_970x90_prog",
-    ".ad_Bumper",
-    ".ad_CustomAd",
-    ".ad_Flex",
-    ".ad_Flexi_LowerRight",
-    ".ad_Flexi_MiddleRight",
-    ".ad_Left",
-    ".ad_Right",
-    ".ad__300x250",
-    ".ad__300x600",
-    ".ad__970x250",
-    ".ad__align",
-    ".ad__centered",
-    ".ad__container",
-    ".ad__content",
-    ".ad__create",
-    ".ad__desk",
-    ".ad__full--width",
-    ".ad__gapfix",
-    ".ad__header",
-    ".ad__holder",
-    ".ad__image",
-    ".ad__in_article",
-    ".ad__inline",
-    ".ad__item",
-    ".ad__label",
-    ".ad__leaderboard",
-    ".ad__mobi",
-    ".ad__mobile-footer",
-    ".ad__mpu",
-    ".ad__placeholder",
-    ".ad__rectangle",
-    ".ad__section-border",
-    ".ad__sidebar",
-    ".ad__single_body_bottom",
-    ".ad__single_body_top",
-    ".ad__space",
-    ".ad__sticky",
-    ".ad__superbanner",
-    ".ad__template",
-    ".ad__window",
-    ".ad__wrapper",
-    ".ad__wrapper-element",
-    ".ad_adInfo",
-    ".ad_ad_160",
-    ".ad_ad_300",
-    ".ad_adblade",
-    ".ad_adc",
-    ".ad_adsense_spacer",
-    ".ad_adv",
-    ".ad_after_section",
-    ".ad_amazon",
-    ".ad_area",
-    ".ad_area_two",
-    ".ad_article_head",
-    ".ad_article_island_nopad",
-    ".ad_article_top_left",
-    ".ad_avu_300x250",
-    ".ad_back",
-    ".ad_background",
-    ".ad_background_1",
-    ".ad_background_true",
-    ".ad_bank_wrapper",
-    ".ad_banner",
-    ".ad_banner2",
-    ".ad_banner_2",
-    ".ad_banner_234",
-    ".ad_banner_250x250",
-    ".ad_banner_468",
-    ".ad_banner_728",
-    ".ad_banner_728x90_inner",
-    ".ad_banner_border",
-    ".ad_banner_div",
-    ".ad_bar",
-    ".ad_below_content",
-    ".ad_belowfirstpost_frame",
-    ".ad_bg",
-    ".ad_bgskin",
-    ".ad_big_banner",
-    ".ad_bigbox",
-    ".ad_billboard",
-    ".ad_blk",
-    ".ad_block",
-    ".ad_block_1",
-    ".ad_block_2",
-    ".ad_block_widget",
-    ".ad_body",
-    ".ad_border",
-    ".ad_botbanner",
-    ".ad_bottom",
-    ".ad_bottom_728",
-    ".ad_bottom_leaderboard",
-    ".ad_bottom_left",
-    ".ad_bottom_mpu",
-    ".ad_bottom_space",
-    ".ad_box",
-    ".ad_box1",
-    ".ad_box2",
-    ".ad_box_2",
-    ".ad_box_6",
-    ".ad_box_9",
-    ".ad_box_ad",
-    ".ad_box_div",
-    ".ad_box_header",
-    ".ad_box_spacer",
-    ".ad_box_top",
-    ".ad_break",
-    ".ad_break2_container",
-    ".ad_break_container",
-    ".ad_btf",
-    ".ad_btn",
-    ".ad_btn-white",
-    ".ad_btn1",
-    ".ad_btn2",
-    ".ad_by",
-    ".ad_callout",
-    ".ad_caption",
-    ".ad_center",
-    ".ad_center_bottom",
-    ".ad_centered",
-    ".ad_choice",
-    ".ad_choices",
-    ".ad_cl",
-    ".ad_claim",
-    ".ad_click",
-    ".ad_cls_fix",
-    ".ad_code",
-    ".ad_col",
-    ".ad_column",
-    ".ad_column_box",
-    ".ad_common",
-    ".ad_con",
-    ".ad_cont",
-    ".ad_cont_footer",
-    ".ad_contain",
-    ".ad_container",
-    ".ad_container__sidebar",
-    ".ad_container__top",
-    ".ad_container_body",
-    ".ad_container_bottom",
-    ".ad_content",
-    ".ad_content_below",
-    ".ad_content_bottom",
-    ".ad_content_img",
-    ".ad_content_wide",
-    ".ad_content_wrapper",
-    ".ad_contents",
-    ".ad_crown",
-    ".ad_custombanner",
-    ".ad_db",
-    ".ad_default",
-    ".ad_deferrable",
-    ".ad_description",
-    ".ad_descriptor",
-    ".ad_desk_w970_h250",
-    ".ad_desktop",
-    ".ad_disclaimer",
-    ".ad_div",
-    ".ad_div_banner",
-    ".ad_div_box",
-    ".ad_div_box2",
-    ".ad_element",
-    ".ad_embed",
-    ".ad_eniro",
-    ".ad_external",
-    ".ad_eyebrow",
-    ".ad_fadein",
-    ".ad_feature",
-    ".ad_filler",
-    ".ad_flash",
-    ".ad_float",
-    ".ad_floating_box",
-    ".ad_fluid",
-    ".ad_font",
-    ".ad_footer",
-    ".ad_footer_super_banner",
-    ".ad_frame",
-    ".ad_frame_around",
-    ".ad_fullwidth",
-    ".ad_gal",
-    ".ad_gam",
-    ".ad_global_header",
-    ".ad_google",
-    ".ad_google_shhide",
-    ".ad_gpt",
-    ".ad_grein_botn",
-    ".ad_grid",
-    ".ad_group",
-    ".ad_gutter_top",
-    ".ad_half_page",
-    ".ad_halfpage",
-    ".ad_hd",
-    ".ad_head",
-    ".ad_head_rectangle",
-    ".ad_head_wide",
-    ".ad_header",
-    ".ad_header_top",
-    ".ad_heading",
-    ".ad_headline",
-    ".ad_holder",
-    ".ad_horizontal",
-    ".ad_hover_href",
-    ".ad_iframe2",
-    ".ad_image",
-    ".ad_img",
-    ".ad_imgae_150",
-    ".ad_in_article",
-    ".ad_in_text",
-    ".ad_incontent",
-    ".ad_index02",
-    ".ad_indicator",
-    ".ad_inline",
-    ".ad_inline_wrapper",
-    ".ad_inner",
-    ".ad_inset",
-    ".ad_island",
-    ".ad_item",
-    ".ad_label",
-    ".ad_large",
-    ".ad_leader",
-    ".ad_leader_bottom",
-    ".ad_leader_plus_top",
-    ".ad_leaderboard",
-    ".ad_leaderboard_atf",
-    ".ad_leaderboard_master",
-    ".ad_leaderboard_top",
-    ".ad_leaderboard_wrap",
-    ".ad_left",
-    ".ad_left_cell",
-    ".ad_left_column",
-    ".ad_lft",
-    ".ad_line2",
-    ".ad_link",
-    ".ad_link1",
-    ".ad_link_468",
-    ".ad_link_area",
-    ".ad_link_label",
-    ".ad_link_label_vert",
-    ".ad_links",
-    ".ad_linkunit",
-    ".ad_lnks",
-    ".ad_loc",
-    ".ad_long",
-    ".ad_lrec",
-    ".ad_lrgsky",
-    ".ad_lt",
-    ".ad_main",
-    ".ad_maintopad",
-    ".ad_margin",
-    ".ad_marker",
-    ".ad_masthead",
-    ".ad_med",
-    ".ad_medium_rectangle",
-    ".ad_medrec",
-    ".ad_medrect",
-    ".ad_megabanner",
-    ".ad_message",
-    ".ad_microlen",
-    ".ad_mid_post_body",
-    ".ad_middle",
-    ".ad_middle_banner",
-    ".ad_mobile",
-    ".ad_mod",
-    ".ad_module",
-    ".ad_movFocus",
-    ".ad_mp",
-    ".ad_mpu",
-    ".ad_mpu_top",
-    ".ad_mr",
-    ".ad_mrec",
-    ".ad_native",
-    ".ad_native_xrail",
-    ".ad_news",
-    ".ad_news_text",
-    ".ad_no_border",
-    ".ad_note",
-    ".ad_notice",
-    ".ad_oms",
-    ".ad_on_article",
-    ".ad_one",
-    ".ad_one_one",
-    ".ad_one_third",
-    ".ad_outer",
-    ".ad_overlays",
-    ".ad_p360",
-    ".ad_pagebody",
-    ".ad_panel",
-    ".ad_paragraphs_desktop_container",
-    ".ad_partner",
-    ".ad_partners",
-    ".ad_pause",
-    ".ad_pic",
-    ".ad_place",
-    ".ad_placeholder",
-    ".ad_placeholder_d_b",
-    ".ad_placeholder_d_s",
-    ".ad_placeholder_d_sticky",
-    ".ad_placement",
-    ".ad_placement_300x250",
-    ".ad_placement_small",
-    ".ad_plus",
-    ".ad_position",
-    ".ad_post",
-    ".ad_primary",
-    ".ad_promo",
-    ".ad_promo1",
-    ".ad_promo_spacer",
-    ".ad_push",
-    ".ad_r",
-    ".ad_rakuten",
-    ".ad_rakuten_wrapper",
-    ".ad_rec",
-    ".ad_rect",
-    ".ad_rect_contr",
-    ".ad_rectangle",
-    ".ad_rectangle_300_250",
-    ".ad_rectangle_medium",
-    ".ad_rectangular",
-    ".ad_regular1",
-    ".ad_regular2",
-    ".ad_regular3",
-    ".ad_reminder",
-    ".ad_response",
-    ".ad_rhs",
-    ".ad_right",
-    ".ad_rightSky",
-    ".ad_right_300_250",
-    ".ad_right_cell",
-    ".ad_right_col",
-    ".ad_rightside",
-    ".ad_row",
-    ".ad_row_bottom_item",
-    ".ad_rtg300",
-    ".ad_scroll",
-    ".ad_secondary",
-    ".ad_section_300x250",
-    ".ad_section_728x90",
-    ".ad_segment",
-    ".ad_sense_01",
-    ".ad_sense_footer_container",
-    ".ad_share_box",
-    ".ad_shopingmall",
-    ".ad_shuffling_text",
-    ".ad_side",
-    ".ad_side_box",
-    ".ad_side_rectangle_banner",
-    ".ad_sidebar",
-    ".ad_sidebar_bigbox",
-    ".ad_sidebar_inner",
-    ".ad_sidebar_left",
-    ".ad_sidebar_right",
-    ".ad_size_160x600",
-    ".ad_skin",
-    ".ad_sky",
-    ".ad_sky2",
-    ".ad_sky2_2",
-    ".ad_skyscpr",
-    ".ad_skyscraper",
-    ".ad_skyscrapper",
-    ".ad_slider_out",
-    ".ad_slot",
-    ".ad_slot_inread",
-    ".ad_slot_right",
-    ".ad_slug",
-    ".ad_small",
-    ".ad_space",
-    ".ad_space_300_250",
-    ".ad_spacer",
-    ".ad_sponsor",
-    ".ad_sponsor_fp",
-    ".ad_sponsoredlinks",
-    ".ad_sponsoredsection",
-    ".ad_spot",
-    ".ad_spot_b",
-    ".ad_spot_c",
-    ".ad_spotlight",
-    ".ad_square",
-    ".ad_square_r",
-    ".ad_square_r_top",
-    ".ad_square_top",
-    ".ad_start",
-    ".ad_static",
-    ".ad_station",
-    ".ad_story_island",
-    ".ad_stream",
-    ".ad_stream_hd",
-    ".ad_sub",
-    ".ad_supersize",
-    ".ad_table",
-    ".ad_tag",
-    ".ad_tag_middle",
-    ".ad_text",
-    ".ad_text_link",
-    ".ad_text_links",
-    ".ad_text_vertical",
-    ".ad_text_w",
-    ".ad_textlink1",
-    ".ad_textlink_box",
-    ".ad_thumbnail_header",
-    ".ad_title",
-    ".ad_title_small",
-    ".ad_tlb",
-    ".ad_to_list",
-    ".ad_top",
-    ".ad_top1",
-    ".ad_top_1",
-    ".ad_top_2",
-    ".ad_top_3",
-    ".ad_top_banner",
-    ".ad_top_leaderboard",
-    ".ad_top_left",
-    ".ad_top_mpu",
-    ".ad_top_right",
-    ".ad_topic_content",
-    ".ad_topmain",
-    ".ad_topright",
-    ".ad_topshop",
-    ".ad_tower",
-    ".ad_trailer_header",
-    ".ad_trick_header",
-    ".ad_trick_left",
-    ".ad_ttl",
-    ".ad_two",
-    ".ad_two_third",
-    ".ad_txt2",
-    ".ad_type_1",
-    ".ad_type_adsense",
-    ".ad_type_dfp",
-    ".ad_under",
-    ".ad_under_royal_slider",
-    ".ad_unit",
-    ".ad_unit_300",
-    ".ad_unit_300_x_250",
-    ".ad_unit_600",
-    ".ad_unit_rail",
-    ".ad_unit_wrapper",
-    ".ad_unit_wrapper_main",
-    ".ad_url",
-    ".ad_v2",
-    ".ad_v3",
-    ".ad_vertisement",
-    ".ad_viewtop",
-    ".ad_w",
-    ".ad_w300h450",
-    ".ad_w300i",
-    ".ad_w_us_a300",
-    ".ad_warn",
-    ".ad_warning",
-    ".ad_watch_now",
-    ".ad_watermark",
-    ".ad_wid300",
-    ".ad_wide",
-    ".ad_wide_vertical",
-    ".ad_widget",
-    ".ad_widget_200_100",
-    ".ad_widget_200_200",
-    ".ad_widget_image",
-    ".ad_widget_title",
-    ".ad_word",
-    ".ad_wrap",
-    ".ad_wrapper",
-    ".ad_wrapper_300",
-    ".ad_wrapper_970x90",
-    ".ad_wrapper_box",
-    ".ad_wrapper_false",
-    ".ad_wrapper_fixed",
-    ".ad_wrapper_top",
-    ".ad_wrp",
-    ".ad_xrail",
-    ".ad_xrail_top",
-    ".ad_zone",
-    ".adace-adi-popup-wrapper",
-    ".adace-slideup-slot-wrap",
-    ".adace-slot",
-    ".adace-slot-wrapper",
-    ".adace-sponsors-box",
-    ".adace-vignette",
-    ".adadded",
-    ".adageunicorns",
-    ".adalert-overlayer",
-    ".adalert-toplayer",
-    ".adamazon",
-    ".adarea",
-    ".adarea-long",
-    ".adarticle",
-    ".adb-728x90",
-    ".adb-bottom-outer",
-    ".adbTrkWt",
-    ".adback",
-    ".adban",
-    ".adban-hold-narrow",
-    ".adband",
-    ".adbanner-300-250",
-    ".adbanner-bottom",
-    ".adbanner1",
-    ".adbanner2nd",
-    ".adbannerbox",
-    ".adbanneriframe",
-    ".adbannerright",
-    ".adbannertop",
-    ".adbase",
-    ".adbbox",
-    ".adbckgrnd",
-    ".adbelowfirstpost",
-    ".adbetween",
-    ".adbetweenarticles",
-    ".adbkgnd",
-    ".adblade",
-    ".adblade-container",
-    ".adbladeimg",
-    ".adblk",
-    ".adblock-240-400",
-    ".adblock-300-300",
-    ".adblock-600-120",
-    ".adblock-bottom",
-    ".adblock-header",
-    ".adblock-header1",
-    ".adblock-main",
-    ".adblock-popup",
-    ".adblock-top",
-    ".adblock-top-left",
-    ".adblock-wide",
-    ".adblock300",
-    ".adblock300250",
-    ".adblock300x250Spot1",
-    ".adblock728x90",
-    ".adblock__banner",
-    ".adblock_noborder",
-    ".adblock_primary",
-    ".adblockdiv",
-    ".adblocks-topright",
-    ".adboard",
-    ".adborder",
-    ".adborderbottom",
-    ".adbordertop",
-    ".adbot",
-    ".adbot_postbit",
-    ".adbot_showthread",
-    ".adbottom",
-    ".adbottomright",
-    ".adbox-300x250",
-    ".adbox-468x60",
-    ".adbox-border-desk",
-    ".adbox-box",
-    ".adbox-header",
-    ".adbox-outer",
-    ".adbox-rectangle",
-    ".adbox-sidebar",
-    ".adbox-slider",
-    ".adbox-style",
-    ".adbox-title",
-    ".adbox-topbanner",
-    ".adbox-wrapper",
-    ".adbox1",
-    ".adbox160",
-    ".adbox2",
-    ".adbox300",
-    ".adbox300x250",
-    ".adbox336",
-    ".adbox600",
-    ".adbox728",
-    ".adboxRightSide",
-    ".adboxTopBanner",
-    ".adboxVert",
-    ".adbox_300x600",
-    ".adbox_310x400",
-    ".adbox_366x280",
-    ".adbox_468X60",
-    ".adbox_border",
-    ".adbox_bottom",
-    ".adbox_br",
-    ".adbox_cont",
-    ".adbox_largerect",
-    ".adbox_left",
-    ".adbox_top",
-    ".adboxbg",
-    ".adboxbot",
-    ".adboxclass",
-    ".adboxcm",
-    ".adboxcontent",
-    ".adboxcontentsum",
-    ".adboxes",
-    ".adboxesrow",
-    ".adboxid",
-    ".adboxlarge",
-    ".adboxlong",
-    ".adboxo",
-    ".adboxtop",
-    ".adbreak",
-    ".adbrite2",
-    ".adbtn",
-    ".adbtns",
-    ".adbttm_right_300",
-    ".adbttm_right_label",
-    ".adbucks",
-    ".adbug",
-    ".adbutler-inline-ad",
-    ".adbutler-top-banner",
-    ".adbutler_top_banner",
-    ".adbutton",
-    ".adbutton-block",
-    ".adbuttons",
-    ".adcard",
-    ".adcasing",
-    ".adcenter",
-    ".adchange",
-    ".adchoices",
-    ".adchoices-link",
-    ".adclass",
-    ".adcode",
-    ".adcode-widget",
-    ".adcode2",
-    ".adcode300x250",
-    ".adcode728x90",
-    ".adcode_container",
-    ".adcodetextwrap300x250",
-    ".adcodetop",
-    ".adcol1",
-    ".adcol2",
-    ".adcolumn",
-    ".adcolumn_wrapper",
-    ".adcomment",
-    ".adcon",
-    ".adcont",
-    ".adcontainer-Leaderboard",
-    ".adcontainer-Rectangle",
-    ".adcontainer2",
-    ".adcontainer300x250l",
-    ".adcontainer300x250r",
-    ".adcontainer_footer",
-    ".adcopy",
-    ".add-position-right",
-    ".add-sidebar",
-    ".add300",
-    ".add300top",
-    ".add300x250",
-    ".addAdvertContainer",
-    ".add_topbanner",
-    ".addarea",
-    ".addarearight",
-    ".addbanner",
-    ".addboxRight",
-    ".addisclaimer",
-    ".addiv",
-    ".adds2",
-    ".adds300x250",
-    ".adds620x90",
-    ".addtitle",
-    ".addvert",
-    ".addwide",
-    ".adengageadzone",
-    ".adenquire",
-    ".adex-ad-text",
-    ".adfbox",
-    ".adfeedback",
-    ".adfeeds",
-    ".adfix",
-    ".adflag",
-    ".adflexi",
-    ".adfliction",
-    ".adfoot",
-    ".adfootbox",
-    ".adfooter",
-    ".adform__topbanner",
-    ".adfoxly-overlay",
-    ".adfoxly-place-delay",
-    ".adfoxly-wrapper",
-    ".adframe",
-    ".adframe2",
-    ".adframe_banner",
-    ".adframe_rectangle",
-    ".adfree",
-    ".adfront",
-    ".adfront-head",
-    ".adfrp",
-    ".adfull",
-    ".adgear",
-    ".adgmleaderboard",
-    ".adhalfhome",
-    ".adhalfpage",
-    ".adhalfpageright",
-    ".adhead",
-    ".adheader",
-    ".adheightpromo",
-    ".adheighttall",
-    ".adherebox",
-    ".adhesion-block",
-    ".adhesion-header",
-    ".adhesiveAdWrapper",
-    ".adhesiveWrapper",
-    ".adhesive_holder",
-    ".adhi",
-    ".adhide",
-    ".adhint",
-    ".adholder",
-    ".adholder-300",
-    ".adholder2",
-    ".adholderban",
-    ".adhoriz",
-    ".adiframe",
-    ".adindex",
-    ".adindicator",
-    ".adinfo",
-    ".adinjwidget",
-    ".adinner",
-    ".adinpost",
-    ".adinsert",
-    ".adinsert160",
-    ".adinside",
-    ".adintext",
-    ".adintro",
-    ".adisclaimer",
-    ".adisland",
-    ".adits",
-    ".adjlink",
-    ".adk-slot",
-    ".adkicker",
-    ".adkit",
-    ".adlabel-horz",
-    ".adlabel-vert",
-    ".adlabel1",
-    ".adlabel2",
-    ".adlabel3",
-    ".adlabelleft",
-    ".adlarge",
-    ".adlarger",
-    ".adlateral",
-    ".adlayer",
-    ".adleader",
-    ".adleft1",
-    ".adleftph",
-    ".adlgbox",
-    ".adline",
-    ".adlink",
-    ".adlinkdiv",
-    ".adlinks",
-    ".adlinks-class",
-    ".adlist",
-    ".adlist1",
-    ".adlist2",
-    ".adloaded",
-    ".adlsot",
-    ".admain",
-    ".adman",
-    ".admarker",
-    ".admaster",
-    ".admediumred",
-    ".admedrec",
-    ".admeldBoxAd",
-    ".admessage",
-    ".admiddle",
-    ".admiddlesidebar",
-    ".admods",
-    ".admodule",
-    ".admoduleB",
-    ".admpu",
-    ".admpu-small",
-    ".admputop",
-    ".admz",
-    ".adnSpot",
-    ".adname",
-    ".adnet_area",
-    ".adnotecenter",
-    ".adnotice",
-    ".adnotification",
-    ".adnz-ad-placeholder",
-    ".adocean",
-    ".adocean728x90",
-    ".adocean_desktop_section",
-    ".adops",
-    ".adpacks",
-    ".adpacks_content",
-    ".adpadding",
-    ".adpane",
-    ".adparent",
-    ".adpic",
-    ".adplace",
-    ".adplace_center",
-    ".adplaceholder",
-    ".adplaceholder-top",
-    ".adplacement",
-    ".adplate-background",
-    ".adpod",
-    ".adpopup",
-    ".adpos-300-mobile",
-    ".adpost",
-    ".adposter_pos",
-    ".adproxy",
-    ".adrec",
-    ".adrechts",
-    ".adrect",
-    ".adrectangle",
-    ".adrectwrapper",
-    ".adrevtising-buttom",
-    ".adright",
-    ".adright300",
-    ".adrightlg",
-    ".adrightsm",
-    ".adrighttop",
-    ".adriverBanner",
-    ".adroot",
-    ".adrotate-sponsor",
-    ".adrotate_top_banner",
-    ".adrotate_widget",
-    ".adrotate_widgets",
-    ".adrotatediv",
-    ".adrow",
-    ".adrule",
-    ".ads--bottom-spacing",
-    ".ads--desktop",
-    ".ads--full",
-    ".ads--insertor-casper",
-    ".ads--no-preload",
-    ".ads--sidebar",
-    ".ads--single",
-    ".ads--square",
-    ".ads--super",
-    ".ads--top",
-    ".ads-1",
-    ".ads-120x600",
-    ".ads-125",
-    ".ads-160x600",
-    ".ads-160x600-outer",
-    ".ads-2",
-    ".ads-3",
-    ".ads-300",
-    ".ads-300-250",
-    ".ads-300-box",
-    ".ads-300x250",
-    ".ads-300x250-sidebar",
-    ".ads-300x300",
-    ".ads-300x600",
-    ".ads-300x600-wrapper",
-    ".ads-320-50",
-    ".ads-320x250",
-    ".ads-336x280",
-    ".ads-468",
-    ".ads-720x90",
-    ".ads-728",
-    ".ads-728-90",
-    ".ads-728by90",
-    ".ads-728x90",
-    ".ads-970-250-show",
-    ".ads-980x90",
-    ".ads-above-comments",
-    ".ads-ad",
-    ".ads-ads-top",
-    ".ads-advertorial",
-    ".ads-article-right",
-    ".ads-articlebottom",
-    ".ads-aside",
-    ".ads-banner",
-    ".ads-banner-bottom",
-    ".ads-banner-friends",
-    ".ads-banner-js",
-    ".ads-banner-middle",
-    ".ads-banner-spacing",
-    ".ads-banner-top",
-    ".ads-banner-top-right",
-    ".ads-base",
-    ".ads-beforecontent",
-    ".ads-below-content",
-    ".ads-below-home",
-    ".ads-below-view-content",
-    ".ads-between-comments",
-    ".ads-bg",
-    ".ads-bigbox",
-    ".ads-bilboards",
-    ".ads-bing-belly",
-    ".ads-bing-bottom",
-    ".ads-bing-top",
-    ".ads-block",
-    ".ads-block-bottom-wrap",
-    ".ads-block-link-text",
-    ".ads-block-panel-tipo-1",
-    ".ads-block-rightside",
-    ".ads-block-top",
-    ".ads-block-top-right",
-    ".ads-border",
-    ".ads-bottom",
-    ".ads-bottom-block",
-    ".ads-bottom-center",
-    ".ads-bottom-content",
-    ".ads-bottom-left",
-    ".ads-bottom-right",
-    ".ads-box",
-    ".ads-box-border",
-    ".ads-box-cont",
-    ".ads-bt",
-    ".ads-btm",
-    ".ads-by",
-    ".ads-by-google",
-    ".ads-callback",
-    ".ads-card",
-    ".ads-carousel",
-    ".ads-center",
-    ".ads-centered",
-    ".ads-cnt",
-    ".ads-code",
-    ".ads-col",
-    ".ads-col-1",
-    ".ads-col-2",
-    ".ads-cols",
-    ".ads-cont",
-    ".ads-container-250",
-    ".ads-container__inner",
-    ".ads-content",
-    ".ads-core-placer",
-    ".ads-custom",
-    ".ads-decorator",
-    ".ads-desktop",
-    ".ads-div",
-    ".ads-end-content",
-    ".ads-express",
-    ".ads-favicon",
-    ".ads-feed",
-    ".ads-fieldset",
-    ".ads-fif",
-    ".ads-flow",
-    ".ads-footer",
-    ".ads-fr",
-    ".ads-global-header",
-    ".ads-global-top",
-    ".ads-google",
-    ".ads-google-bottom",
-    ".ads-google-top",
-    ".ads-grp",
-    ".ads-half",
-    ".ads-header",
-    ".ads-header-desktop",
-    ".ads-header-left",
-    ".ads-header-right",
-    ".ads-here",
-    ".ads-hints",
-    ".ads-holder",
-    ".ads-home",
-    ".ads-homepage-2",
-    ".ads-horizontal",
-    ".ads-horizontal-banner",
-    ".ads-image",
-    ".ads-in-content",
-    ".ads-in-previews",
-    ".ads-inarticle",
-    ".ads-inline",
-    ".ads-inner",
-    ".ads-instance",
-    ".ads-interlinks",
-    ".ads-internal",
-    ".ads-item",
-    ".ads-label",
-    ".ads-label-inverse",
-    ".ads-large",
-    ".ads-leaderboard",
-    ".ads-leaderboard-border",
-    ".ads-leaderboard-panel",
-    ".ads-leaderbord",
-    ".ads-left",
-    ".ads-line",
-    ".ads-link",
-    ".ads-link1",
-    ".ads-link2",
-    ".ads-link3",
-    ".ads-link4",
-    ".ads-links-general",
-    ".ads-list",
-    ".ads-loaded",
-    ".ads-long",
-    ".ads-main",
-    ".ads-margin",
-    ".ads-margin-top-20",
-    ".ads-margin-top-bottom",
-    ".ads-marker",
-    ".ads-medium-rect",
-    ".ads-middle",
-    ".ads-middle-top",
-    ".ads-minheight",
-    ".ads-mini",
-    ".ads-mini-3rows",
-    ".ads-mobile",
-    ".ads-module",
-    ".ads-module-alignment",
-    ".ads-movie",
-    ".ads-mpu",
-    ".ads-narrow",
-    ".ads-native-wrapper",
-    ".ads-note",
-    ".ads-one",
-    ".ads-outer",
-    ".ads-panel",
-    ".ads-parent",
-    ".ads-placeholder",
-    ".ads-placeholder-inside",
-    ".ads-placeholder-wrapper",
-    ".ads-placment",
-    ".ads-post",
-    ".ads-post-closing",
-    ".ads-post-footer",
-    ".ads-post-full",
-    ".ads-posting",
-    ".ads-profile",
-    ".ads-rail",
-    ".ads-rect",
-    ".ads-rectangle",
-    ".ads-relatedbottom",
-    ".ads-rendering-fix",
-    ".ads-right",
-    ".ads-right-min",
-    ".ads-rotate",
-    ".ads-row",
-    ".ads-rpline-com",
-    ".ads-scroller-box",
-    ".ads-section",
-    ".ads-side",
-    ".ads-sidebar",
-    ".ads-sidebar-300-600",
-    ".ads-sidebar-boxad",
-    ".ads-sidebar-widget",
-    ".ads-sign",
-    ".ads-single",
-    ".ads-site",
-    ".ads-size-small",
-    ".ads-skin",
-    ".ads-skin-mobile",
-    ".ads-sky",
-    ".ads-skyscraper",
-    ".ads-skyscraper-container-left",
-    ".ads-skyscraper-container-right",
-    ".ads-skyscraper-left",
-    ".ads-skyscraper-right",
-    ".ads-slot-mb-container",
-    ".ads-small",
-    ".ads-small-horizontal",
-    ".ads-small-squares",
-    ".ads-smartphone",
-    ".ads-social-box",
-    ".ads-sponsored-title",
-    ".ads-sponsors",
-    ".ads-square",
-    ".ads-square-large",
-    ".ads-square-small",
-    ".ads-squares",
-    ".ads-ss",
-    ".ads-star",
-    ".ads-static-video-overlay",
-    ".ads-stick-footer",
-    ".ads-sticky",
-    ".ads-sticky-300-600",
-    ".ads-story",
-    ".ads-story-leaderboard-atf",
-    ".ads-stripe",
-    ".ads-styled",
-    ".ads-superbanner",
-    ".ads-system",
-    ".ads-text",
-    ".ads-title",
-    ".ads-tittle",
-    ".ads-to-hide",
-    ".ads-top",
-    ".ads-top-728",
-    ".ads-top-center",
-    ".ads-top-content",
-    ".ads-top-fixed",
-    ".ads-top-home",
-    ".ads-top-left",
-    ".ads-top-main",
-    ".ads-top-right",
-    ".ads-top-spacer",
-    ".ads-topbar",
-    ".ads-two",
-    ".ads-txt",
-    ".ads-ul",
-    ".ads-verticle",
-    ".ads-wall-container",
-    ".ads-wide",
-    ".ads-widget",
-    ".ads-widget-content",
-    ".ads-widget-content-wrap",
-    ".ads-widget-link",
-    ".ads-wrap",
-    ".ads-wrapper",
-    ".ads-wrapper-top",
-    ".ads-x1",
-    ".ads-zone",
-    ".ads.bottom",
-    ".ads.box",
-    ".ads.cell",
-    ".ads.cta",
-    ".ads.grid-layout",
-    ".ads.square",
-    ".ads.top",
-    ".ads.widget",
-    ".ads01",
-    ".ads1",
-    ".ads10",
-    ".ads11",
-    ".ads120",
-    ".ads120_600",
-    ".ads120_600-widget",
-    ".ads120_80",
-    ".ads120x",
-    ".ads123",
-    ".ads125",
-    ".ads125-widget",
-    ".ads160",
-    ".ads160-600",
-    ".ads2",
-    ".ads250",
-    ".ads250-250",
-    ".ads2Block",
-    ".ads3",
-    ".ads300",
-    ".ads300-200",
-    ".ads300-250",
-    ".ads300250",
-    ".ads300_250",
-    ".ads300_250-widget",
-    ".ads300_600-widget",
-    ".ads300box",
-    ".ads300n",
-    ".ads300nb",
-    ".ads300x",
-    ".ads300x100",
-    ".ads300x600",
-    ".ads315",
-    ".ads320x100",
-    ".ads336_280",
-    ".ads336x280",
-    ".ads4",
-    ".ads460",
-    ".ads460_home",
-    ".ads468",
-    ".ads468x60",
-    ".ads600",
-    ".ads720x90",
-    ".ads728",
-    ".ads728_90",
-    ".ads728b",
-    ".ads728x90",
-    ".ads728x90-1",
-    ".ads970",
-    ".adsAdvert",
-    ".adsArea",
-    ".adsBanner",
-    ".adsBannerLink",
-    ".adsBlock",
-    ".adsBlockContainerHorizontal",
-    ".adsBot",
-    ".adsBottom",
-    ".adsBoxTop",
-    ".adsCap",
-    ".adsCell",
-    ".adsColumn",
-    ".adsConfig",
-    ".adsCont",
-    ".adsDef",
-    ".adsDesktop",
-    ".adsDetailsPage",
-    ".adsDisclaimer",
-    ".adsDiv",
-    ".adsFirst",
-    ".adsFixed",
-    ".adsFull",
-    ".adsHeader",
-    ".adsHeading",
-    ".adsHeight300x250",
-    ".adsHeight720x90",
-    ".adsHome-full",
-    ".adsImages",
-    ".adsInner",
-    ".adsLabel",
-    ".adsLibrary",
-    ".adsLine",
-    ".adsList",
-    ".adsMPU",
-    ".adsMag",
-    ".adsMarker",
-    ".adsMiddle",
-    ".adsMvCarousel",
-    ".adsNetwork",
-    ".adsOuter",
-    ".adsOverPrimary",
-    ".adsPlaceHolder",
-    ".adsPostquare",
-    ".adsPushdown",
-    ".adsRectangleMedium",
-    ".adsRight",
-    ".adsRow",
-    ".adsSecond",
-    ".adsSectionRL",
-    ".adsSpacing",
-    ".adsSticky",
-    ".adsTag",
-    ".adsText",
-    ".adsTop",
-    ".adsTopBanner",
-    ".adsTopCont",
-    ".adsTower2",
-    ".adsTowerWrap",
-    ".adsTxt",
-    ".adsWidget",
-    ".adsWithUs",
-    ".adsWrap",
-    ".ads_160",
-    ".ads_180",
-    ".ads_2",
-    ".ads_3",
-    ".ads_300",
-    ".ads_300_250",
-    ".ads_300x250",
-    ".ads_300x600",
-    ".ads_4",
-    ".ads_468",
-    ".ads_468x60",
-    ".ads_720x90",
-    ".ads_728",
-    ".ads_728x90",
-    ".ads_Header",
-    ".ads__article__header",
-    ".ads__aside",
-    ".ads__claim-item",
-    ".ads__container",
-    ".ads__header",
-    ".ads__horizontal",
-    ".ads__hyperleaderboard--hyperleaderboard",
-    ".ads__inline",
-    ".ads__interstitial",
-    ".ads__link",
-    ".ads__listing",
-    ".ads__mid",
-    ".ads__middle",
-    ".ads__midpage-fullwidth",
-    ".ads__native",
-    ".ads__right-rail-ad",
-    ".ads__sidebar",
-    ".ads__top",
-    ".ads_ad_box",
-    ".ads_admeld",
-    ".ads_adsense1",
-    ".ads_after",
-    ".ads_after_more",
-    ".ads_amazon",
-    ".ads_amazon_outer",
-    ".ads_area",
-    ".ads_article",
-    ".ads_banner",
-    ".ads_bar",
-    ".ads_before",
-    ".ads_between_content",
-    ".ads_bg",
-    ".ads_big",
-    ".ads_big-half",
-    ".ads_bigrec",
-    ".ads_block",
-    ".ads_border",
-    ".ads_box",
-    ".ads_box_headline",
-    ".ads_box_type1",
-    ".ads_center",
-    ".ads_code",
-    ".ads_column",
-    ".ads_container",
-    ".ads_container_top",
-    ".ads_content",
-    ".ads_css",
-    ".ads_der",
-    ".ads_desktop_r1",
-    ".ads_desktop_r2",
-    ".ads_div",
-    ".ads_div1",
-    ".ads_foot",
-    ".ads_footer",
-    ".ads_footerad",
-    ".ads_full_1",
-    ".ads_google",
-    ".ads_h",
-    ".ads_h1",
-    ".ads_h2",
-    ".ads_header",
-    ".ads_header_bottom",
-    ".ads_holder",
-    ".ads_home",
-    ".ads_horizontal",
-    ".ads_in_list_autosize",
-    ".ads_infoBtns",
-    ".ads_inline_640",
-    ".ads_inside2",
-    ".ads_inview",
-    ".ads_item",
-    ".ads_label",
-    ".ads_large_ads",
-    ".ads_lb",
-    ".ads_leader",
-    ".ads_leaderboard",
-    ".ads_left",
-    ".ads_main",
-    ".ads_main_hp",
-    ".ads_media",
-    ".ads_medium",
-    ".ads_medium_rectangle",
-    ".ads_medrect",
-    ".ads_middle",
-    ".ads_middle-container",
-    ".ads_middle_container",
-    ".ads_mpu",
-    ".ads_outer",
-    ".ads_outline",
-    ".ads_place",
-    ".ads_place_160",
-    ".ads_place_top",
-    ".ads_placeholder",
-    ".ads_player",
-    ".ads_post",
-    ".ads_prtext",
-    ".ads_qc1",
-    ".ads_qc2",
-    ".ads_rectangle",
-    ".ads_remove",
-    ".ads_right",
-    ".ads_rightbar_top",
-    ".ads_side",
-    ".ads_sideba",
-    ".ads_sidebar",
-    ".ads_single_center",
-    ".ads_single_side",
-    ".ads_single_top",
-    ".ads_singlepost",
-    ".ads_slice",
-    ".ads_slot",
-    ".ads_small",
-    ".ads_small_rectangle",
-    ".ads_space_long",
-    ".ads_spacer",
-    ".ads_square",
-    ".ads_takeover",
-    ".ads_tb-c",
-    ".ads_text",
-    ".ads_ticker_main",
-    ".ads_tit",
-    ".ads_title",
-    ".ads_top",
-    ".ads_top_1",
-    ".ads_top_banner",
-    ".ads_top_both",
-    ".ads_top_middle",
-    ".ads_top_nav",
-    ".ads_topbanner",
-    ".ads_topleft",
-    ".ads_topright",
-    ".ads_tower",
-    ".ads_tr",
-    ".ads_under_data",
-    ".ads_unit",
-    ".ads_up",
-    ".ads_video",
-    ".ads_wide",
-    ".ads_widesky",
-    ".ads_widget",
-    ".ads_wrap",
-    ".ads_wrap-para",
-    ".ads_wrapper",
-    ".adsafp",
-    ".adsanity-alignnone",
-    ".adsanity-group",
-    ".adsanity-single",
-    ".adsarea",
-    ".adsartical",
-    ".adsbanner1",
-    ".adsbanner2",
-    ".adsbantop",
-    ".adsbar",
-    ".adsbg300",
-    ".adsbillboard",
-    ".adsblock",
-    ".adsblockvert",
-    ".adsbnr",
-    ".adsbody",
-    ".adsborder",
-    ".adsboth",
-    ".adsbottom",
-    ".adsbottombox",
-    ".adsbox--masthead",
-    ".adsbox-square",
-    ".adsbox970x90",
-    ".adsbox990x90",
-    ".adsboxBtn",
-    ".adsbox_300x250",
-    ".adsboxitem",
-    ".adsbx728x90",
-    ".adsbyadop",
-    ".adsbyexoclick",
-    ".adsbyexoclick-wrapper",
-    ".adsbygalaksion",
-    ".adsbygoogle-box",
-    ".adsbygoogle-noablate",
-    ".adsbygoogle-wrapper",
-    ".adsbygoogle2",
-    ".adsbypublift",
-    ".adsbypubmax",
-    ".adsbytrafficjunky",
-    ".adsbyvli",
-    ".adsbyxa",
-    ".adscaleTop",
-    ".adscenter",
-    ".adscentertext",
-    ".adsclick",
-    ".adscontainer",
-    ".adscontent250",
-    ".adscontentcenter",
-    ".adscontntad",
-    ".adscreen",
-    ".adsdelivery",
-    ".adsdesktop",
-    ".adsdiv",
-    ".adsection_a2",
-    ".adsection_c2",
-    ".adsection_c3",
-    ".adsenbox",
-    ".adsens",
-    ".adsense-250",
-    ".adsense-300-600",
-    ".adsense-336",
-    ".adsense-336-280",
-    ".adsense-468",
-    ".adsense-728-90",
-    ".adsense-ad-results",
-    ".adsense-ads",
-    ".adsense-afterpost",
-    ".adsense-area",
-    ".adsense-article",
-    ".adsense-block",
-    ".adsense-box",
-    ".adsense-center",
-    ".adsense-code",
-    ".adsense-container",
-    ".adsense-content",
-    ".adsense-div",
-    ".adsense-float",
-    ".adsense-googleAds",
-    ".adsense-header",
-    ".adsense-heading",
-    ".adsense-iframe-container",
-    ".adsense-inline",
-    ".adsense-left",
-    ".adsense-links",
-    ".adsense-loading",
-    ".adsense-module",
-    ".adsense-overlay",
-    ".adsense-post",
-    ".adsense-resposivo-meio",
-    ".adsense-right",
-    ".adsense-slot",
-    ".adsense-square",
-    ".adsense-sticky-slide",
-    ".adsense-title",
-    ".adsense-top",
-    ".adsense-unit",
-    ".adsense-widget",
-    ".adsense-wrapper",
-    ".adsense1",
-    ".adsense160x600",
-    ".adsense250",
-    ".adsense3",
-    ".adsense300",
-    ".adsense300x250",
-    ".adsense728",
-    ".adsense728x90",
-    ".adsenseAds",
-    ".adsenseBannerArea",
-    ".adsenseBlock",
-    ".adsenseContainer",
-    ".adsenseList",
-    ".adsenseRow",
-    ".adsenseSky",
-    ".adsenseWrapper",
-    ".adsense_200",
-    ".adsense_336_280",
-    ".adsense_728x90_container",
-    ".adsense_ad",
-    ".adsense_block",
-    ".adsense_bottom",
-    ".adsense_container",
-    ".adsense_content_300x250",
-    ".adsense_div_wrapper",
-    ".adsense_inner",
-    ".adsense_label",
-    ".adsense_leader",
-    ".adsense_media",
-    ".adsense_menu",
-    ".adsense_mpu",
-    ".adsense_rectangle",
-    ".adsense_results",
-    ".adsense_right",
-    ".adsense_sidebar",
-    ".adsense_sidebar_top",
-    ".adsense_single",
-    ".adsense_top",
-    ".adsense_top_ad",
-    ".adsense_unit",
-    ".adsense_wrapper",
-    ".adsensebig",
-    ".adsensefloat",
-    ".adsenseformat",
-    ".adsenseframe",
-    ".adsenseleaderboard",
-    ".adsensemobile",
-    ".adsenvelope",
-    ".adsep",
-    ".adserve_728",
-    ".adserverBox",
-    ".adserver_zone",
-    ".adserverad",
-    ".adserving",
-    ".adset",
-    ".adsfloat",
-    ".adsfloatpanel",
-    ".adsforums",
-    ".adsghori",
-    ".adsgrd",
-    ".adsgvert",
-    ".adsheight-250",
-    ".adshome",
-    ".adshowbig",
-    ".adshowcase",
-    ".adshp",
-    ".adside",
-    ".adside-box-index",
-    ".adside-box-single",
-    ".adside_box",
-    ".adsidebar",
-    ".adsidebox",
-    ".adsider",
-    ".adsincs2",
-    ".adsinfo",
-    ".adsingle",
-    ".adsingle-r",
-    ".adsingleph",
-    ".adsitem",
-    ".adsize728",
-    ".adsizer",
-    ".adsizewrapper",
-    ".adskeeperWrap",
-    ".adsky",
-    ".adsleaderboard",
-    ".adsleaderboardbox",
-    ".adsleff",
-    ".adsleft",
-    ".adsleftblock",
-    ".adslibraryArticle",
-    ".adslider",
-    ".adslink",
-    ".adslist",
-    ".adslisting",
-    ".adslisting2",
-    ".adslistingz",
-    ".adsload",
-    ".adsloading",
-    ".adslogan",
-    ".adslot",
-    ".adslot--leaderboard",
-    ".adslot-area",
-    ".adslot-banner",
-    ".adslot-billboard",
-    ".adslot-feature",
-    ".adslot-inline-wide",
-    ".adslot-mpu",
-    ".adslot-rectangle",
-    ".adslot-widget",
-    ".adslot970",
-    ".adslotMid",
-    ".adslot_1",
-    ".adslot_1m",
-    ".adslot_2",
-    ".adslot_2m",
-    ".adslot_3",
-    ".adslot_300",
-    ".adslot_3d",
-    ".adslot_3m",
-    ".adslot_4",
-    ".adslot_728",
-    ".adslot__ad-container",
-    ".adslot__ad-wrapper",
-    ".adslot_blurred",
-    ".adslot_bot_300x250",
-    ".adslot_collapse",
-    ".adslot_popup",
-    ".adslot_side1",
-    ".adslothead",
-    ".adslotleft",
-    ".adslotright",
-    ".adslotright_1",
-    ".adslotright_2",
-    ".adslug",
-    ".adslx-bottom2015",
-    ".adslx2015",
-    ".adsmaintop",
-    ".adsmall",
-    ".adsmaller",
-    ".adsmalltext",
-    ".adsmanag",
-    ".adsmbody",
-    ".adsmedrect",
-    ".adsmedrectright",
-    ".adsmessage",
-    ".adsmobile",
-    ".adsninja-ad-zone",
-    ".adsninja-rail-zone",
-    ".adsnippet_widget",
-    ".adsns",
-    ".adsntl",
-    ".adsonar-after",
-    ".adsonofftrigger",
-    ".adsoptimal-slot",
-    ".adsother",
-    ".adspace",
-    ".adspace-300x600",
-    ".adspace-336x280",
-    ".adspace-728x90",
-    ".adspace-MR",
-    ".adspace-lb",
-    ".adspace-leaderboard",
-    ".adspace-lr",
-    ".adspace-mpu",
-    ".adspace-mtb",
-    ".adspace-top",
-    ".adspace-widget",
-    ".adspace1",
-    ".adspace180",
-    ".adspace2",
-    ".adspace728x90",
-    ".adspace_2",
-    ".adspace_bottom",
-    ".adspace_buysell",
-    ".adspace_right",
-    ".adspace_rotate",
-    ".adspace_skyscraper",
-    ".adspace_top",
-    ".adspacer",
-    ".adspacer2",
-    ".adspan",
-    ".adspanel",
-    ".adspecial390",
-    ".adspeed",
-    ".adsplash-160x600",
-    ".adsplat",
-    ".adsponsor",
-    ".adspop",
-    ".adspost",
-    ".adspot",
-    ".adspot-desk",
-    ".adspot-title",
-    ".adspot1",
-    ".adspot200x90",
-    ".adspot468x60",
-    ".adspot728x90",
-    ".adspotGrey",
-    ".adspot_468x60",
-    ".adspot_728x90",
-    ".adsprefooter",
-    ".adspreview",
-    ".adsrecnode",
-    ".adsresponsive",
-    ".adsright",
-    ".adss",
-    ".adss-rel",
-    ".adssidebar2",
-    ".adsskyscraper",
-    ".adsslotcustom2",
-    ".adsslotcustom4",
-    ".adssmall",
-    ".adssquare",
-    ".adssquare2",
-    ".adsterra",
-    ".adstext",
-    ".adstextpad",
-    ".adstipt",
-    ".adstitle",
-    ".adstop",
-    ".adstory",
-    ".adstrip",
-    ".adstyle",
-    ".adsverting",
-    ".adsvideo",
-    ".adswallpapr",
-    ".adswidget",
-    ".adswiper",
-    ".adswitch",
-    ".adsystem_ad",
-    ".adszone",
-    ".adt-300x250",
-    ".adt-300x600",
-    ".adt-728x90",
-    ".adtab",
-    ".adtable",
-    ".adtag",
-    ".adtc",
-    ".adtech",
-    ".adtech-ad-widget",
-    ".adtech-banner",
-    ".adtech-boxad",
-    ".adtech-copy",
-    ".adtech-video-2",
-    ".adtech-wrapper",
-    ".adtechMobile",
-    ".adtech_wrapper",
-    ".adtester-container",
-    ".adtext-bg",
-    ".adtext_gray",
-    ".adtext_horizontal",
-    ".adtext_onwhite",
-    ".adtext_vertical",
-    ".adtext_white",
-    ".adtextleft",
-    ".adtextright",
-    ".adthrive",
-    ".adthrive-ad",
-    ".adthrive-content",
-    ".adthrive-header",
-    ".adthrive-header-container",
-    ".adthrive-placeholder-content",
-    ".adthrive-placeholder-header",
-    ".adthrive-placeholder-static-sidebar",
-    ".adthrive-video-player",
-    ".adthrive_custom_ad",
-    ".adtile",
-    ".adtips",
-    ".adtips1",
-    ".adtitle",
-    ".adtoggle",
-    ".adtop",
-    ".adtop-border",
-    ".adtops",
-    ".adtower",
-    ".adtravel",
-    ".adttl",
-    ".adtxt",
-    ".adtxtlinks",
-    ".adult-adv",
-    ".adun",
-    ".adunit",
-    ".adunit-300-250",
-    ".adunit-active",
-    ".adunit-adbridg",
-    ".adunit-container",
-    ".adunit-container-bb",
-    ".adunit-container-incontent-280px",
-    ".adunit-container-incontent-400px",
-    ".adunit-container-sitebar-600px",
-    ".adunit-container_sitebar_1",
-    ".adunit-googleadmanager",
-    ".adunit-lazy",
-    ".adunit-middle",
-    ".adunit-parent",
-    ".adunit-purch",
-    ".adunit-search-midstream",
-    ".adunit-side",
-    ".adunit-skyscraper-1",
-    ".adunit-skyscraper-2",
-    ".adunit-title",
-    ".adunit-top",
-    ".adunit-wrap",
-    ".adunit-wrapper",
-    ".adunit125",
-    ".adunit160",
-    ".adunit300x250",
-    ".adunit468",
-    ".adunitContainer",
-    ".adunit_300x250",
-    ".adunit_728x90",
-    ".adunit_content",
-    ".adunit_footer",
-    ".adunit_leaderboard",
-    ".adunit_rectangle",
-    ".adv--h600",
-    ".adv--square",
-    ".adv-120x600",
-    ".adv-160",
-    ".adv-160x600",
-    ".adv-200-200",
-    ".adv-250-250",
-    ".adv-300",
-    ".adv-300-1",
-    ".adv-300-250",
-    ".adv-300-600",
-    ".adv-300x250",
-    ".adv-300x250-generic",
-    ".adv-336-280",
-    ".adv-4",
-    ".adv-468-60",
-    ".adv-468x60",
-    ".adv-700",
-    ".adv-728",
-    ".adv-728-90",
-    ".adv-970",
-    ".adv-970-250",
-    ".adv-970-250-2",
-    ".adv-980x60",
-    ".adv-ad",
-    ".adv-ads-selfstyle",
-    ".adv-aside",
-    ".adv-background",
-    ".adv-banner",
-    ".adv-bar",
-    ".adv-block",
-    ".adv-block-container",
-    ".adv-border",
-    ".adv-bottom",
-    ".adv-box",
-    ".adv-box-holder",
-    ".adv-box-wrapper",
-    ".adv-carousel",
-    ".adv-center",
-    ".adv-click",
-    ".adv-cont",
-    ".adv-cont1",
-    ".adv-container",
-    ".adv-conteiner",
-    ".adv-dvb",
-    ".adv-format-1",
-    ".adv-full-width",
-    ".adv-google",
-    ".adv-gpt-desktop-wrapper",
-    ".adv-gpt-wrapper-desktop",
-    ".adv-halfpage",
-    ".adv-header",
-    ".adv-holder",
-    ".adv-in-body",
-    ".adv-inset",
-    ".adv-intext",
-    ".adv-intext-label",
-    ".adv-key",
-    ".adv-label",
-    ".adv-leaderboard",
-    ".adv-leaderboard-banner",
-    ".adv-link--left",
-    ".adv-link--right",
-    ".adv-mobile-wrapper",
-    ".adv-mpu",
-    ".adv-mpu-shoulder",
-    ".adv-outer",
-    ".adv-p",
-    ".adv-phone",
-    ".adv-right",
-    ".adv-right-300",
-    ".adv-rotator",
-    ".adv-script-container",
-    ".adv-search-ad",
-    ".adv-sidebar",
-    ".adv-sidelabel",
-    ".adv-skin-spacer",
-    ".adv-slot-container",
-    ".adv-text",
-    ".adv-top",
-    ".adv-top-banner",
-    ".adv-top-container",
-    ".adv-top-page",
-    ".adv-top-skin",
-    ".adv-under-video",
-    ".adv-unit",
-    ".adv-videoad",
-    ".adv-x61",
-    ".adv1",
-    ".adv120",
-    ".adv200",
-    ".adv250",
-    ".adv300",
-    ".adv300-250",
-    ".adv300-250-2",
-    ".adv300-70",
-    ".adv300left",
-    ".adv300x100",
-    ".adv300x250",
-    ".adv300x60",
-    ".adv300x70",
-    ".adv336",
-    ".adv350",
-    ".adv460x60",
-    ".adv468",
-    ".adv468x90",
-    ".adv728",
-    ".adv728x90",
-    ".advBottom",
-    ".advBottomHome",
-    ".advBox",
-    ".advImagesbox",
-    ".advInt",
-    ".advLB_PageMiddle",
-    ".advLeaderboard",
-    ".advRightBig",
-    ".advSquare",
-    ".advText",
-    ".advTicker",
-    ".advTop",
-    ".advVideobox",
-    ".adv_1",
-    ".adv_120",
-    ".adv_120_600",
-    ".adv_120x240",
-    ".adv_120x600",
-    ".adv_160_600",
-    ".adv_160x600",
-    ".adv_2",
-    ".adv_250",
-    ".adv_250_250",
-    ".adv_300",
-    ".adv_300_300",
-    ".adv_300_top",
-    ".adv_300x250",
-    ".adv_336_280",
-    ".adv_468_60",
-    ".adv_600",
-    ".adv_630",
-    ".adv_728_90",
-    ".adv_728x90",
-    ".adv_90",
-    ".adv_PageTop",
-    ".adv__box",
-    ".adv__leaderboard",
-    ".adv__wrapper",
-    ".adv_aff",
-    ".adv_amazon_single",
-    ".adv_banner",
-    ".adv_banner_hor",
-    ".adv_bg",
-    ".adv_box",
-    ".adv_box_narrow",
-    ".adv_code",
-    ".adv_flash",
-    ".adv_hed",
-    ".adv_here",
-    ".adv_img",
-    ".adv_leaderboard",
-    ".adv_left",
-    ".adv_link",
-    ".adv_main_middle",
-    ".adv_main_middle_wrapper",
-    ".adv_main_right_down",
-    ".adv_main_right_down_wrapper",
-    ".adv_medium_rectangle",
-    ".adv_message",
-    ".adv_msg",
-    ".adv_panel",
-    ".adv_placeholder_300_250",
-    ".adv_placeholder_300_300",
-    ".adv_right",
-    ".adv_side1",
-    ".adv_side2",
-    ".adv_sidebar",
-    ".adv_title",
-    ".adv_top",
-    ".adv_txt",
-    ".adv_under_menu",
-    ".advads-background",
-    ".advads-close-button",
-    ".advads-sticky",
-    ".advads-widget",
-    ".advads_ad_widget-11",
-    ".advads_ad_widget-18",
-    ".advads_ad_widget-2",
-    ".advads_ad_widget-21",
-    ".advads_ad_widget-3",
-    ".advads_ad_widget-4",
-    ".advads_ad_widget-5",
-    ".advads_ad_widget-8",
-    ".advads_ad_widget-9",
-    ".advads_widget",
-    ".advance-ads",
-    ".advart",
-    ".advbig",
-    ".adver",
-    ".adver-block",
-    ".adver-header",
-    ".adver-left",
-    ".adver-text",
-    ".adver-wrapper--250",
-    ".adverTag",
-    ".adverTxt",
-    ".adver_bot",
-    ".adver_cont_below",
-    ".adver_home",
-    ".advert--background",
-    ".advert--banner-wrap",
-    ".advert--fallback",
-    ".advert--header",
-    ".advert--in-sidebar",
-    ".advert--inline",
-    ".advert--leaderboard",
-    ".advert--loading",
-    ".advert--outer",
-    ".advert--placeholder",
-    ".advert--right-rail",
-    ".advert--square",
-    ".advert--transition",
-    ".advert--vc",
-    ".advert--vc__wrapper",
-    ".advert-100",
-    ".advert-120x90",
-    ".advert-160x600",
-    ".advert-300",
-    ".advert-300-side",
-    ".advert-300x100-side",
-    ".advert-728",
-    ".advert-728-90",
-    ".advert-728x90",
-    ".advert-760",
-    ".advert-arch-top",
-    ".advert-article-bottom",
-    ".advert-autosize",
-    ".advert-background",
-    ".advert-banner",
-    ".advert-banner-container",
-    ".advert-banner-holder",
-    ".advert-bannerad",
-    ".advert-bar",
-    ".advert-bg-250",
-    ".advert-block",
-    ".advert-border",
-    ".advert-bot-box",
-    ".advert-bottom",
-    ".advert-box",
-    ".advert-bronze",
-    ".advert-bronze-btm",
-    ".advert-btm",
-    ".advert-card",
-    ".advert-center",
-    ".advert-center_468x60",
-    ".advert-col",
-    ".advert-col-center",
-    ".advert-competitions",
-    ".advert-container",
-    ".advert-content",
-    ".advert-content-item",
-    ".advert-detail",
-    ".advert-dfp",
-    ".advert-double-mpu",
-    ".advert-featured",
-    ".advert-footer",
-    ".advert-full-home-sec",
-    ".advert-full-raw",
-    ".advert-gold",
-    ".advert-group",
-    ".advert-head",
-    ".advert-header-728",
-    ".advert-horizontal",
-    ".advert-image",
-    ".advert-info",
-    ".advert-inner",
-    ".advert-label",
-    ".advert-leaderboard",
-    ".advert-leaderboard-top",
-    ".advert-leaderboard2",
-    ".advert-loader",
-    ".advert-mini",
-    ".advert-mpu",
-    ".advert-mrec",
-    ".advert-note",
-    ".advert-overlay",
-    ".advert-pane",
-    ".advert-panel",
-    ".advert-placeholder",
-    ".advert-placeholder-wrapper",
-    ".advert-preview-wrapper",
-    ".advert-right",
-    ".advert-row",
-    ".advert-section",
-    ".advert-sidebar",
-    ".advert-silver",
-    ".advert-sky",
-    ".advert-skyright",
-    ".advert-skyscraper",
-    ".advert-slider",
-    ".advert-spot-container",
-    ".advert-sticky-wrapper",
-    ".advert-stub",
-    ".advert-text",
-    ".advert-three",
-    ".advert-title",
-    ".advert-top",
-    ".advert-top-footer",
-    ".advert-txt",
-    ".advert-unit",
-    ".advert-wide",
-    ".advert-wingbanner-left",
-    ".advert-wingbanner-right",
-    ".advert-wrap",
-    ".advert-wrap1",
-    ".advert-wrap2",
-    ".advert-wrapper",
-    ".advert.box",
-    ".advert.desktop",
-    ".advert.mobile",
-    ".advert.mpu",
-    ".advert.skyscraper",
-    ".advert1",
-    ".advert120",
-    ".advert1Banner",
-    ".advert2",
-    ".advert300",
-    ".advert4",
-    ".advert5",
-    ".advert728_90",
-    ".advert728x90",
-    ".advert8",
-    ".advertBanner",
-    ".advertBar",
-    ".advertBlock",
-    ".advertBottom",
-    ".advertBox",
-    ".advertCaption",
-    ".advertColumn",
-    ".advertCont",
-    ".advertContainer",
-    ".advertDownload",
-    ".advertFullBanner",
-    ".advertHeader",
-    ".advertHeadline",
-    ".advertLink",
-    ".advertLink1",
-    ".advertMPU",
-    ".advertMiddle",
-    ".advertMpu",
-    ".advertRight",
-    ".advertSideBar",
-    ".advertSign",
-    ".advertSlider",
-    ".advertSlot",
-    ".advertSuperBanner",
-    ".advertText",
-    ".advertTitleSky",
-    ".advertWrapper",
-    ".advert_300x250",
-    ".advert_336",
-    ".advert_468x60",
-    ".advert__container",
-    ".advert__fullbanner",
-    ".advert__leaderboard",
-    ".advert__mpu",
-    ".advert__sidebar",
-    ".advert__tagline",
-    ".advert_area",
-    ".advert_banner",
-    ".advert_banners",
-    ".advert_block",
-    ".advert_box",
-    ".advert_caption",
-    ".advert_cont",
-    ".advert_container",
-    ".advert_div",
-    ".advert_foot",
-    ".advert_header",
-    ".advert_home_300",
-    ".advert_img",
-    ".advert_label",
-    ".advert_leaderboard",
-    ".advert_line",
-    ".advert_list",
-    ".advert_main",
-    ".advert_main_bottom",
-    ".advert_mpu",
-    ".advert_nav",
-    ".advert_note",
-    ".advert_pos",
-    ".advert_small",
-    ".advert_source",
-    ".advert_span",
-    ".advert_text",
-    ".advert_title",
-    ".advert_top",
-    ".advert_txt",
-    ".advert_wrapper",
-    ".advertbar",
-    ".advertbox",
-    ".adverteaser",
-    ".advertembed",
-    ".adverthome",
-    ".adverticum_container",
-    ".adverticum_content",
-    ".adverticum_gate_banner",
-    ".advertis",
-    ".advertis-left",
-    ".advertis-right",
-    ".advertise-1",
-    ".advertise-2",
-    ".advertise-band",
-    ".advertise-box",
-    ".advertise-here",
-    ".advertise-horz",
-    ".advertise-info",
-    ".advertise-leaderboard",
-    ".advertise-link",
-    ".advertise-list",
-    ".advertise-pic",
-    ".advertise-small",
-    ".advertise-square",
-    ".advertise-top",
-    ".advertise-vert",
-    ".advertiseBlack",
-    ".advertiseContainer",
-    ".advertiseHere",
-    ".advertiseText",
-    ".advertise_ads",
-    ".advertise_box",
-    ".advertise_brand",
-    ".advertise_carousel",
-    ".advertise_here",
-    ".advertise_link",
-    ".advertise_link_sidebar",
-    ".advertise_links",
-    ".advertise_sec",
-    ".advertise_text",
-    ".advertise_txt",
-    ".advertise_verRight",
-    ".advertisebtn",
-    ".advertisedBy",
-    ".advertisement-1",
-    ".advertisement-2",
-    ".advertisement-250",
-    ".advertisement-300",
-    ".advertisement-300x250",
-    ".advertisement-background",
-    ".advertisement-banner",
-    ".advertisement-block",
-    ".advertisement-bottom",
-    ".advertisement-box",
-    ".advertisement-card",
-    ".advertisement-cell",
-    ".advertisement-comment",
-    ".advertisement-container",
-    ".advertisement-content",
-    ".advertisement-copy",
-    ".advertisement-footer",
-    ".advertisement-google",
-    ".advertisement-header",
-    ".advertisement-holder",
-    ".advertisement-image",
-    ".advertisement-label",
-    ".advertisement-layout",
-    ".advertisement-leaderboard",
-    ".advertisement-leaderboard-lg",
-    ".advertisement-left",
-    ".advertisement-link",
-    ".advertisement-nav",
-    ".advertisement-new",
-    ".advertisement-other",
-    ".advertisement-placeholder",
-    ".advertisement-position1",
-    ".advertisement-right",
-    ".advertisement-showup-banner",
-    ".advertisement-sidebar",
-    ".advertisement-space",
-    ".advertisement-sponsor",
-    ".advertisement-tag",
-    ".advertisement-text",
-    ".advertisement-title",
-    ".advertisement-top",
-    ".advertisement-txt",
-    ".advertisement-wrapper",
-    ".advertisement.leaderboard",
-    ".advertisement.rectangle",
-    ".advertisement.under-article",
-    ".advertisement1",
-    ".advertisement300x250",
-    ".advertisement468",
-    ".advertisementBackground",
-    ".advertisementBanner",
-    ".advertisementBar",
-    ".advertisementBlock",
-    ".advertisementBox",
-    ".advertisementBoxBan",
-    ".advertisementContainer",
-    ".advertisementFull",
-    ".advertisementHeader",
-    ".advertisementImg",
-    ".advertisementLabel",
-    ".advertisementOutsider",
-    ".advertisementPanel",
-    ".advertisementRotate",
-    ".advertisementSection",
-    ".advertisementSmall",
-    ".advertisementText",
-    ".advertisementTop",
-    ".advertisement_160x600",
-    ".advertisement_300x250",
-    ".advertisement_728x90",
-    ".advertisement__728x90",
-    ".advertisement__full",
-    ".advertisement__header",
-    ".advertisement__label",
-    ".advertisement__leaderboard",
-    ".advertisement__line",
-    ".advertisement__title",
-    ".advertisement__wrapper",
-    ".advertisement_box",
-    ".advertisement_btm",
-    ".advertisement_caption",
-    ".advertisement_container",
-    ".advertisement_footer",
-    ".advertisement_g",
-    ".advertisement_header",
-    ".advertisement_horizontal",
-    ".advertisement_mobile",
-    ".advertisement_part",
-    ".advertisement_post",
-    ".advertisement_section_top",
-    ".advertisement_text",
-    ".advertisement_top",
-    ".advertisement_wrapper",
-    ".advertisements-link",
-    ".advertisements-right",
-    ".advertisements-sidebar",
-    ".advertisements_heading",
-    ".advertisementwrap",
-    ".advertiser",
-    ".advertiser-links",
-    ".advertising--desktop",
-    ".advertising--mobile",
-    ".advertising--row",
-    ".advertising--tablet",
-    ".advertising--top",
-    ".advertising-banner",
-    ".advertising-block",
-    ".advertising-container",
-    ".advertising-container-top",
-    ".advertising-content",
-    ".advertising-disclaimer",
-    ".advertising-fixed",
-    ".advertising-header",
-    ".advertising-iframe",
-    ".advertising-in-content",
-    ".advertising-inner",
-    ".advertising-leaderboard",
-    ".advertising-lrec",
-    ".advertising-mediumrectangle",
-    ".advertising-mention",
-    ".advertising-middle",
-    ".advertising-middle-i",
-    ".advertising-notice",
-    ".advertising-right",
-    ".advertising-right-d",
-    ".advertising-right-i",
-    ".advertising-section",
-    ".advertising-side",
-    ".advertising-side-hp",
-    ".advertising-srec",
-    ".advertising-top",
-    ".advertising-top-banner",
-    ".advertising-top-box",
-    ".advertising-top-category",
-    ".advertising-top-desktop",
-    ".advertising-vert",
-    ".advertising-wrapper",
-    ".advertising1",
-    ".advertising160",
-    ".advertising2",
-    ".advertising300_home",
-    ".advertising300x250",
-    ".advertising728",
-    ".advertising728_3",
-    ".advertisingBanner",
-    ".advertisingBlock",
-    ".advertisingLabel",
-    ".advertisingLegend",
-    ".advertisingLrec",
-    ".advertisingMob",
-    ".advertisingRight",
-    ".advertisingSlide",
-    ".advertisingTable",
-    ".advertisingTop",
-    ".advertising_300x250",
-    ".advertising_banner",
-    ".advertising_block",
-    ".advertising_bottom_box",
-    ".advertising_box_bg",
-    ".advertising_header_1",
-    ".advertising_hibu_lef",
-    ".advertising_hibu_mid",
-    ".advertising_hibu_rig",
-    ".advertising_horizontal_title",
-    ".advertising_images",
-    ".advertising_square",
-    ".advertising_top",
-    ".advertising_vertical_title",
-    ".advertising_widget",
-    ".advertising_wrapper",
-    ".advertisingarea",
-    ".advertisingarea-homepage",
-    ".advertisingimage",
-    ".advertisingimage-extended",
-    ".advertisingimageextended",
-    ".advertisment",
-    ".advertisment-banner",
-    ".advertisment-label",
-    ".advertisment-left-panal",
-    ".advertisment-module",
-    ".advertisment-rth",
-    ".advertisment-top",
-    ".advertismentBox",
-    ".advertismentContainer",
-    ".advertismentContent",
-    ".advertismentText",
-    ".advertisment_bar",
-    ".advertisment_caption",
-    ".advertisment_full",
-    ".advertisment_notice",
-    ".advertisment_two",
-    ".advertize",
-    ".advertize_here",
-    ".advertizing-banner",
-    ".advertlabel",
-    ".advertleft",
-    ".advertlink",
-    ".advertnotice",
-    ".advertop",
-    ".advertorial",
-    ".advertorial-2",
-    ".advertorial-block",
-    ".advertorial-image",
-    ".advertorial-promo-box",
-    ".advertorial-teaser",
-    ".advertorial-wrapper",
-    ".advertorial2",
-    ".advertorial_728x90",
-    ".advertorial_red",
-    ".advertorialitem",
-    ".advertorialtitle",
-    ".advertorialview",
-    ".advertorialwidget",
-    ".advertouter",
-    ".advertplay",
-    ".adverts",
-    ".adverts--banner",
-    ".adverts-125",
-    ".adverts-inline",
-    ".adverts2",
-    ".advertsLeaderboard",
-    ".adverts_RHS",
-    ".adverts_footer_advert",
-    ".adverts_footer_scrolling_advert",
-    ".adverts_header_advert",
-    ".adverts_side_advert",
-    ".advertspace",
-    ".adverttext",
-    ".adverttop",
-    ".advfrm",
-    ".advg468",
-    ".advhere",
-    ".adviewDFPBanner",
-    ".advimg160600",
-    ".advimg300250",
-    ".advn_zone",
-    ".advoice",
-    ".advr",
-    ".advr-wrapper",
-    ".advr_top",
-    ".advrectangle",
-    ".advrst",
-    ".advslideshow",
-    ".advspot",
-    ".advt",
-    ".advt-banner-3",
-    ".advt-block",
-    ".advt-box",
-    ".advt-right",
-    ".advt-sec",
-    ".advt-text",
-    ".advt300",
-    ".advt720",
-    ".advtBlock",
-    ".advtMsg",
-    ".advt_160x600",
-    ".advt_468by60px",
-    ".advt_indieclick",
-    ".advt_single",
-    ".advt_widget",
-    ".advtbox",
-    ".advtcell",
-    ".advtext",
-    ".advtimg",
-    ".advtitle",
-    ".advtop",
-    ".advtop-leaderbord",
-    ".advttopleft",
-    ".advv_box",
-    ".adwblue",
-    ".adwert",
-    ".adwhitespace",
-    ".adwide",
-    ".adwideskyright",
-    ".adwidget",
-    ".adwithspace",
-    ".adwobs",
-    ".adwolf-holder",
-    ".adword-box",
-    ".adword-structure",
-    ".adword-text",
-    ".adword-title",
-    ".adword1",
-    ".adwordListings",
-    ".adwords",
-    ".adwords-container",
-    ".adwordsHeader",
-    ".adwords_in_content",
-    ".adworks",
-    ".adwrap",
-    ".adwrap-mrec",
-    ".adwrap-widget",
-    ".adwrap_MPU",
-    ".adwrapper--desktop",
-    ".adwrapper-lrec",
-    ".adwrapper1",
-    ".adwrapper948",
-    ".adwrappercls",
-    ".adwrappercls1",
-    ".adx-300x250-container",
-    ".adx-300x600-container",
-    ".adx-ads",
-    ".adx-wrapper",
-    ".adx-wrapper-middle",
-    ".adx_center",
-    ".adxli",
-    ".adxs-vertisements",
-    ".adz-horiz",
-    ".adz-horiz-ext",
-    ".adz2",
-    ".adz728x90",
-    ".adzbanner",
-    ".adzone",
-    ".adzone-footer",
-    ".adzone-preview",
-    ".adzone-sidebar",
-    ".adzone_skyscraper",
-    ".af-block-ad-wrapper",
-    ".af-label-ads",
-    ".afc-box",
-    ".aff-big-unit",
-    ".aff-iframe",
-    ".afffix-custom-ad",
-    ".affiliate-ad",
-    ".affiliate-footer",
-    ".affiliate-link",
-    ".affiliate-mrec-iframe",
-    ".affiliate-sidebar",
-    ".affiliate-strip",
-    ".affiliate-unit__link",
-    ".affiliate-unit__wrapper",
-    ".affiliateAdvertText",
-    ".affiliate_ad",
-    ".affiliate_header_ads",
-    ".affiliates-sidebar",
-    ".affiliation728x90",
-    ".affinityAdHeader",
-    ".afns-ad-sponsor-logo",
-    ".afsAdvertising",
-    ".afsAdvertisingBottom",
-    ".aft-top-728x90",
-    ".aftContentAdLeft",
-    ".aftContentAdRight",
-    ".after-content-ad",
-    ".after-first-post-ad-1",
-    ".after-intro-ad",
-    ".after-post-ad",
-    ".after-post-ads",
-    ".after-story-ad-wrapper",
-    ".after_ad",
-    ".after_comments_ads",
-    ".after_content_banner_advert",
-    ".after_post_ad",
-    ".afterpostadbox",
-    ".afw_ad",
-    ".aggads-ad",
-    ".ahe-ad",
-    ".ahe-adsticky",
-    ".ai-top-ad-outer",
-    ".aisle-ad",
-    ".aisoad",
-    ".ajax_ad",
-    ".ajaxads",
-    ".ajdg_bnnrwidgets",
-    ".ajdg_grpwidgets",
-    ".align.Ad",
-    ".alignads",
-    ".alt_ad",
-    ".alt_ad_block",
-    ".altad",
-    ".alternatives_ad",
-    ".am-adContainer",
-    ".am-adslot",
-    ".am-bazaar-ad",
-    ".amAdvert",
-    ".am_ads",
-    ".amazon-auto-links",
-    ".amazon_ad",
-    ".amazonads",
-    ".amis-advert",
-    ".amp-unresolved",
-    ".ampFlyAdd",
-    ".ampforwp-sticky-custom-ad",
-    ".anchor-ad",
-    ".anchor-ad-wrapper",
-    ".anchorAd",
-    ".anchored-ad-widget",
-    ".annonstext",
-    ".another-ad",
-    ".anyad",
-    ".anzeige_banner",
-    ".aoa_overlay",
-    ".ap-ad-block",
-    ".apadam-ads",
-    ".ape-ads-container",
-    ".apexAd",
-    ".apiAdMarkerAbove",
-    ".apiAds",
-    ".apiButtonAd",
-    ".app-ad",
-    ".app-leaderboard-ad-container",
-    ".app_ad_unit",
-    ".app_advertising_skyscraper",
-    ".app_nexus_banners_common",
-    ".appnexus.ad",
-    ".ar-header-m-ad",
-    ".arc-ad-wrapper",
-    ".arcAdsBox",
-    ".arcAdsContainer",
-    ".arcad-block-container",
-    ".archive-ad",
-    ".archive-ads",
-    ".archive-radio-ad-container",
-    ".areaAd",
-    ".area_ad",
-    ".area_ad03",
-    ".area_ad07",
-    ".area_ad09",
-    ".area_ad2",
-    ".arena-ad-col",
-    ".art-text-ad",
-    ".artAd",
-    ".artAdInner",
-    ".art_ads",
-    ".artcl_ad_dsk",
-    ".article--ad",
-    ".article--content-ad",
-    ".article-ad",
-    ".article-ad-970x90",
-    ".article-ad-align-left",
-    ".article-ad-blk",
-    ".article-ad-bottom",
-    ".article-ad-box",
-    ".article-ad-cont",
-    ".article-ad-container",
-    ".article-ad-holder",
-    ".article-ad-horizontal",
-    ".article-ad-left",
-    ".article-ad-legend",
-    ".article-ad-main",
-    ".article-ad-placeholder",
-    ".article-ad-placement",
-    ".article-ad-primary",
-    ".article-ad-row",
-    ".article-ad-row-inner",
-    ".article-ad-section",
-    ".article-ads",
-    ".article-advert",
-    ".article-advert--text",
-    ".article-advert-container",
-    ".article-advert-dfp",
-    ".article-aside-ad",
-    ".article-aside-top-ad",
-    ".article-content-ad",
-    ".article-content-adwrap",
-    ".article-first-ad",
-    ".article-footer-ad",
-    ".article-footer-ad-container",
-    ".article-footer__ad",
-    ".article-footer__ads",
-    ".article-google-adsense",
-    ".article-header-ad",
-    ".article-header__railAd",
-    ".article-inline-ad",
-    ".article-list__list-item--ad",
-    ".article-mid-ad",
-    ".article-small-ads",
-    ".article-sponsor",
-    ".article-sponsorship-header",
-    ".article-top-ad",
-    ".articleADbox",
-    ".articleAd",
-    ".articleAd300x250",
-    ".articleAdHeader",
-    ".articleAdSlot2",
-    ".articleAdTop",
-    ".articleAdTopRight",
-    ".articleAds",
-    ".articleAdsL",
-    ".articleAdvert",
-    ".articleBottom-ads",
-    ".articleEmbeddedAdBox",
-    ".articleFooterAd",
-    ".articleHeadAdRow",
-    ".articleHeaderAd",
-    ".articleTop-ads",
-    ".articleTopAd",
-    ".article__ad-holder",
-    ".article__adblock",
-    ".article__adv",
-    ".article__header-ad-slot",
-    ".article__inset--margin-ad",
-    ".article__leaderboard-ad",
-    ".article_ad",
-    ".article_ad_1",
-    ".article_ad_2",
-    ".article_ad_container2",
-    ".article_ad_text",
-    ".article_ad_top",
-    ".article_adbox",
-    ".article_ads_banner",
-    ".article_body_ad1",
-    ".article_bottom-ads",
-    ".article_bottom_ad",
-    ".article_google-ad",
-    ".article_google_ads",
-    ".article_inline_ad",
-    ".article_inner_ad",
-    ".article_list_in_ad",
-    ".article_mpu",
-    ".article_mpu_box",
-    ".article_tower_ad",
-    ".articlead",
-    ".articleads",
-    ".articlebodyad",
-    ".articlepage_ads_1",
-    ".articlepage_ads_top",
-    ".articles-ad-block",
-    ".artist-ad-wrapper",
-    ".artnet-ads-ad",
-    ".artstyle__advertisement",
-    ".as-admedia",
-    ".aside-ad",
-    ".aside-ad-space",
-    ".aside-ad-wrapper",
-    ".aside-ads",
-    ".aside-ads-top",
-    ".aside-collection-ad-slot",
-    ".asideAd",
-    ".aside_ad",
-    ".aside_ad_large",
-    ".aside_banner_ads",
-    ".aside_google_ads",
-    ".assis-adlabel",
-    ".async-ad-container",
-    ".at-header-ad",
-    ".at-sidebar-ad",
-    ".atf-ad",
-    ".atfAds",
-    ".atf_adWrapper",
-    ".atf_placeholder",
-    ".atomsAdsCellModel",
-    ".attachment-advert_home",
-    ".attachment-dm-advert-bronze",
-    ".attachment-dm-advert-gold",
-    ".attachment-dm-advert-silver",
-    ".attachment-sidebar-ad",
-    ".attachment-squareAd",
-    ".avadvslot",
-    ".avap-ads-container",
-    ".avert--leaderboard",
-    ".avert--sidebar",
-    ".avert-text",
-    ".azk-adsense",
-    ".b-ad",
-    ".b-ad-main",
-    ".b-adhesion",
-    ".b-adv",
-    ".b-advert",
-    ".b-advertising__down-menu",
-    ".b-aside-ads",
-    ".b-header-ad",
-    ".b-right-rail--ads",
-    ".bAdvertisement",
-    ".b_adLastChild",
-    ".b_ads",
-    ".b_ads_cont",
-    ".b_ads_r",
-    ".b_ads_top",
-    ".b_adsen_wrapper",
-    ".back300ad",
-    ".background-ad",
-    ".background-ads",
-    ".background-adv",
-    ".backgroundAd",
-    ".bam-ad-slot",
-    ".bank-rate-ad",
-    ".banmanad",
-    ".banner--ad",
-    ".banner-125",
-    ".banner-300",
-    ".banner-300-100",
-    ".banner-300-250",
-    ".banner-300x250",
-    ".banner-300x600",
-    ".banner-320-100",
-    ".banner-468",
-    ".banner-468-60",
-    ".banner-468x60",
-    ".banner-728",
-    ".banner-728x90",
-    ".banner-ad",
-    ".banner-ad-b",
-    ".banner-ad-below",
-    ".banner-ad-block",
-    ".banner-ad-bottom-fixed",
-    ".banner-ad-container",
-    ".banner-ad-contianer",
-    ".banner-ad-footer",
-    ".banner-ad-image",
-    ".banner-ad-inner",
-    ".banner-ad-label",
-    ".banner-ad-large",
-    ".banner-ad-pos",
-    ".banner-ad-row",
-    ".banner-ad-skeleton-box",
-    ".banner-ad-space",
-    ".banner-ad-wrap",
-    ".banner-ad-wrapper",
-    ".banner-ad2",
-    ".banner-ads",
-    ".banner-ads-right",
-    ".banner-ads-sidebar",
-    ".banner-adsense",
-    ".banner-adv",
-    ".banner-advert",
-    ".banner-advert-wrapper",
-    ".banner-advertisement",
-    ".banner-advertising",
-    ".banner-adverts",
-    ".banner-buysellads",
-    ".banner-sponsorship",
-    ".banner-top-ads",
-    ".banner120x600",
-    ".banner160",
-    ".banner160x600",
-    ".banner200x200",
-    ".banner300",
-    ".banner300x250",
-    ".banner336",
-    ".banner336x280",
-    ".banner350",
-    ".banner468",
-    ".banner728",
-    ".banner728-ad",
-    ".banner728-container",
-    ".banner728x90",
-    ".bannerADS",
-    ".bannerADV",
-    ".bannerAd",
-    ".bannerAd-module",
-    ".bannerAd3",
-    ".bannerAdContainer",
-    ".bannerAdLeaderboard",
-    ".bannerAdRectangle",
-    ".bannerAdSearch",
-    ".bannerAdSidebar",
-    ".bannerAdTower",
-    ".bannerAdWrap",
-    ".bannerAds",
-    ".bannerAdvert",
-    ".bannerAside",
-    ".bannerGoogle",
-    ".bannerRightAd",
-    ".banner_160x600",
-    ".banner_240x400",
-    ".banner_250x250",
-    ".banner_300_250",
-    ".banner_300x250",
-    ".banner_300x600",
-    ".banner_468_60",
-    ".banner_468x60",
-    ".banner_728_90",
-    ".banner_728x90",
-    ".banner_ad-728x90",
-    ".banner_ad_300x250",
-    ".banner_ad_728x90",
-    ".banner_ad_container",
-    ".banner_ad_footer",
-    ".banner_ad_full",
-    ".banner_ad_leaderboard",
-    ".banner_ad_link",
-    ".banner_ad_wrapper",
-    ".banner_ads",
-    ".banner_ads1",
-    ".banner_ads_300x250",
-    ".banner_ads_home",
-    ".banner_ads_home_inner",
-    ".banner_reklam",
-    ".banner_reklam2",
-    ".banner_slot",
-    ".bannerad",
-    ".bannerad3",
-    ".banneradbottomholder",
-    ".banneradd",
-    ".bannerads",
-    ".banneradv",
-    ".bannerandads",
-    ".bannergoogle",
-    ".bannergroup-ads",
-    ".banneritem-ads",
-    ".banneritem_ad",
-    ".bannermpu",
-    ".banners-weekad",
-    ".banners_ad",
-    ".banners_ad_inside",
-    ".bannervcms",
-    ".bar_ad",
-    ".barkerAd",
-    ".barta-ad",
-    ".base-ad-mpu",
-    ".base-ad-slot",
-    ".base-ad-top",
-    ".base__header-ad",
-    ".base_ad",
-    ".baseboard-ad",
-    ".bb-ad",
-    ".bb-ad-mrec",
-    ".bb-adv-160x600",
-    ".bb-adv-300x250",
-    ".bb-article-sponsor",
-    ".bbccom-advert",
-    ".bbccom_advert",
-    ".bbsTopAd",
-    ".bc-ad__appnexus",
-    ".bcom_ad",
-    ".bd-header-ad",
-    ".before-header-ad",
-    ".before-injected-ad",
-    ".below-ad-border",
-    ".below-article-ad-sidebar",
-    ".below-nav-ad",
-    ".belowMastheadWrapper",
-    ".belowNavAds",
-    ".below_game_ad",
-    ".below_nav_ad_wrap",
-    ".below_player_ad",
-    ".belt-ad",
-    ".belt_ad",
-    ".best_project_ad",
-    ".bg-ad-gray",
-    ".bg-ads",
-    ".bg-ads-space",
-    ".bgAdBlue",
-    ".bg_ad",
-    ".bg_ads",
-    ".bgcolor_ad",
-    ".bgnavad",
-    ".bgr-ad-leaderboard",
-    ".bh-ads",
-    ".bh_ad_container",
-    ".bi-ads-300x250",
-    ".bi-ads-desktop",
-    ".bi-advertorial",
-    ".bidbarrel-ad",
-    ".big-ad",
-    ".big-ads",
-    ".big-advertisement",
-    ".big-box-ad",
-    ".big-right-ad",
-    ".bigAd",
-    ".bigAdContainer",
-    ".bigAds",
-    ".bigAdvBanner",
-    ".bigAdvMiddle",
-    ".bigAdvMiddlea",
-    ".bigBoxAdArea",
-    ".bigCubeAd",
-    ".big_ad",
-    ".big_ad2",
-    ".big_ads",
-    ".big_center_ad",
-    ".bigad",
-    ".bigad1",
-    ".bigad2",
-    ".bigadleft",
-    ".bigadright",
-    ".bigads",
-    ".bigadtxt1",
-    ".bigbox-ad",
-    ".bigbox.ad",
-    ".bigbox_ad",
-    ".bigboxad",
-    ".bigsponsor",
-    ".billboard-ad",
-    ".billboard-ad-one",
-    ".billboard-ad-slot-container",
-    ".billboard-ad-space",
-    ".billboard-ads",
-    ".billboard.ad",
-    ".billboard300x250",
-    ".billboardAd",
-    ".billboard__ad__full",
-    ".billboard__advert",
-    ".billboard_ad",
-    ".billboard_ad_desktop",
-    ".billboard_ad_wrap",
-    ".billboard_adwrap",
-    ".bin-ads",
-    ".bing-ads-wrapper",
-    ".bing-native-ad",
-    ".biz-ad",
-    ".biz-ads",
-    ".biz-list-ad",
-    ".bizDetailAds",
-    ".bl300_ad",
-    ".blk_advert",
-    ".block--ad",
-    ".block--ads",
-    ".block--advertising",
-    ".block--advertising-header",
-    ".block--dfp",
-    ".block--doubleclick",
-    ".block--simpleads",
-    ".block--vh-dfp",
-    ".block--vh-dfp-dfp-ad-r1",
-    ".block--vh-footer-ads",
-    ".block-ad",
-    ".block-ad-blocktop",
-    ".block-ad-entity",
-    ".block-ad-header",
-    ".block-ad-leaderboard",
-    ".block-ad-masthead",
-    ".block-ad-middle",
-    ".block-ad-mpu",
-    ".block-ad-wrapper",
-    ".block-ad300",
-    ".block-ad_tag",
-    ".block-admanager",
-    ".block-ads",
-    ".block-ads-bottom",
-    ".block-ads-home",
-    ".block-ads-system",
-    ".block-ads-top",
-    ".block-ads-yahoo",
-    ".block-ads1",
-    ".block-ads2",
-    ".block-ads3",
-    ".block-ads_top",
-    ".block-adsense",
-    ".block-adstop-otherpage-728x90",
-    ".block-adtech",
-    ".block-adv",
-    ".block-advert",
-    ".block-advertisement",
-    ".block-advertisement-banner-block",
-    ".block-advertising",
-    ".block-adzerk",
-    ".block-bg-advertisement",
-    ".block-boxes-ad",
-    ".block-cdw-google-ads",
-    ".block-dfp",
-    ".block-dfp-ad",
-    ".block-dfp-blocks",
-    ".block-doubleclick_ads",
-    ".block-fusion-ads",
-    ".block-google-admanager",
-    ".block-heremedia-ads",
-    ".block-inner-adds",
-    ".block-itg-ads",
-    ".block-ltadvertising",
-    ".block-maniad",
-    ".block-nyx-ads-ninja",
-    ".block-nyx-ads-ninja-ad-block",
-    ".block-openads",
-    ".block-openx",
-    ".block-pm_doubleclick",
-    ".block-pt-ads",
-    ".block-quartz-ads",
-    ".block-reklama",
-    ".block-simple-blockad-320-250-front-2",
-    ".block-simpleads",
-    ".block-skyscraper-ad",
-    ".block-sponsor",
-    ".block-sponsored-links",
-    ".block-the-dfp",
-    ".block-yt-ads",
-    ".blockAd",
-    ".blockAds",
-    ".blockAdvertise",
-    ".block__ads__ad",
-    ".block_ad",
-    ".block_ad1",
-    ".block_ad303x1000_left",
-    ".block_ad303x1000_right",
-    ".block_ad_middle",
-    ".block_ad_top",
-    ".block_ads",
-    ".block_adslot",
-    ".block_adv",
-    ".block_advert",
-    ".block_article_ad",
-    ".blockad",
-    ".blockads_big",
-    ".blockads_vg",
-    ".blocked-ads",
-    ".blog-ad",
-    ".blog-ad-image",
-    ".blog-ads",
-    ".blog-ads-container",
-    ".blog-ads-top",
-    ".blog-advertisement",
-    ".blog-view-ads",
-    ".blogAd",
-    ".blogAdvertisement",
-    ".blogArtAd",
-    ".blogBigAd",
-    ".blog_ad",
-    ".blogads",
-    ".blue-ad",
-    ".bmd_advert",
-    ".bn_ads",
-    ".bn_advert",
-    ".bn_textads",
-    ".bnr-adbutler",
-    ".bnr_ad",
-    ".board-layout-ad",
-    ".body-ad",
-    ".body-ads",
-    ".body-adzone",
-    ".body-top-ads",
-    ".bodyAd",
-    ".body_ad",
-    ".body_width_ad",
-    ".bodyads",
-    ".bodyads2",
-    ".bodybannerad",
-    ".bodyrectanglead",
-    ".bomAd",
-    ".bonnier-ad",
-    ".bonnier-ads-middle",
-    ".bookad",
-    ".bordered-ad",
-    ".bostad",
-    ".botAd",
-    ".botRectAd",
-    ".bot_ad",
-    ".bot_ads",
-    ".bottom-ad",
-    ".bottom-ad--bigbox",
-    ".bottom-ad-banner",
-    ".bottom-ad-box",
-    ".bottom-ad-container",
-    ".bottom-ad-desktop",
-    ".bottom-ad-fr",
-    ".bottom-ad-large",
-    ".bottom-ad-placeholder",
-    ".bottom-ad-tagline",
-    ".bottom-ad-wrapper",
-    ".bottom-ad-zone",
-    ".bottom-ad2",
-    ".bottom-ads",
-    ".bottom-ads-container",
-    ".bottom-ads-sticky",
-    ".bottom-ads-wrapper",
-    ".bottom-ads728",
-    ".bottom-adv",
-    ".bottom-adv-container",
-    ".bottom-adv1",
-    ".bottom-banner-ad",
-    ".bottom-fixed-ad",
-    ".bottom-left-ad",
-    ".bottom-main-adsense",
-    ".bottom-mobile-ad",
-    ".bottom-mpu-ad",
-    ".bottom-post-ad-space",
-    ".bottom-post-ads",
-    ".bottom-right-advert",
-    ".bottom-side-advertisement",
-    ".bottom-slider-ads",
-    ".bottom-sponsor-img-border",
-    ".bottom-sponsored-header",
-    ".bottom2-adv",
-    ".bottomAd",
-    ".bottomAdBlock",
-    ".bottomAdContainer",
-    ".bottomAds",
-    ".bottomAdsTitle",
-    ".bottomAdvTxt",
-    ".bottomAdvert",
-    ".bottomAdvertisement",
-    ".bottomAdvt",
-    ".bottomArticleAds",
-    ".bottomBannerAd",
-    ".bottomELAd",
-    ".bottomFriendsAds",
-    ".bottomReviewAd",
-    ".bottom_ad",
-    ".bottom_ad_block",
-    ".bottom_ad_placeholder",
-    ".bottom_ad_responsive",
-    ".bottom_adbreak",
-    ".bottom_ads",
-    ".bottom_ads_wrapper_inner",
-    ".bottom_adsense",
-    ".bottom_adspace",
-    ".bottom_advertise",
-    ".bottom_banner_ad",
-    ".bottom_banner_advert_text",
-    ".bottom_bar_ads",
-    ".bottom_left_advert",
-    ".bottom_right_ad",
-    ".bottom_rightad",
-    ".bottom_side_ad",
-    ".bottom_sponsor",
-    ".bottom_sticky_ad",
-    ".bottomad",
-    ".bottomad-bg",
-    ".bottomadarea",
-    ".bottomads",
-    ".bottomadtag",
-    ".bottomadtop",
-    ".bottomadvert",
-    ".bottomadwords",
-    ".bottombarad",
-    ".bottomgooglead",
-    ".bottomleader",
-    ".botton_advertisement",
-    ".box-ad",
-    ".box-ad-a",
-    ".box-ad-grey",
-    ".box-ad-middle",
-    ".box-ad-right-column",
-    ".box-ads",
-    ".box-ads-header-home",
-    ".box-ads-small",
-    ".box-adsense",
-    ".box-adsense-top",
-    ".box-advert",
-    ".box-advert-sponsored",
-    ".box-advertisement",
-    ".box-advertising",
-    ".box-advertising1",
-    ".box-adverts",
-    ".box-entry-ad",
-    ".box-entry-detail--ad",
-    ".box-fixed-ads",
-    ".box-footer-ad",
-    ".box-radvert",
-    ".box-recommend-ad",
-    ".boxAd",
-    ".boxAdContainer",
-    ".boxAdFields",
-    ".boxAdMrec",
-    ".boxAds",
-    ".boxAds2",
-    ".boxAdsInclude",
-    ".boxAdvertisement",
-    ".boxOuterAD",
-    ".boxSponsor",
-    ".box_ad",
-    ".box_ad_container",
-    ".box_ad_content",
-    ".box_ad_horizontal",
-    ".box_ad_spacer",
-    ".box_ad_wrap",
-    ".box_ads",
-    ".box_ads728x90_holder",
-    ".box_adv",
-    ".box_adv1",
-    ".box_adv2",
-    ".box_adv_728",
-    ".box_adv_new",
-    ".box_advert",
-    ".box_advertising",
-    ".box_content_ad",
-    ".box_content_ads",
-    ".box_layout_ad",
-    ".box_publicidad",
-    ".box_sidebar-ads",
-    ".box_textads",
-    ".box_title_ad",
-    ".boxad",
-    ".boxad1",
-    ".boxad120",
-    ".boxad2",
-    ".boxadcont",
-    ".boxads",
-    ".boxadv",
-    ".boxcontentad",
-    ".boxsponsor2",
-    ".boxyads",
-    ".bps-ad-wrapper",
-    ".bps-advertisement",
-    ".bps-search-chitika-ad",
-    ".bq_ad_320x250",
-    ".bq_adleaderboard",
-    ".bq_rightAd",
-    ".br-ad",
-    ".br-ad-text",
-    ".br-ad-wrapper",
-    ".br-banner-ad",
-    ".br-right-rail-ad",
-    ".branded-sponsored-result",
-    ".branding-ad-gallery",
-    ".branding-ad-wrapper",
-    ".breadads",
-    ".breadcumbad",
-    ".break-ads",
-    ".breaker-ad",
-    ".breakerAd",
-    ".breakingNewsModuleSponsor",
-    ".breakthrough-ad",
-    ".briefNewsAd",
-    ".brn-ads-box",
-    ".brn-ads-mobile-container",
-    ".brn-ads-sticky-wrapper",
-    ".broker-ad",
-    ".broker-ads",
-    ".broker-ads-center",
-    ".broker_box_ad",
-    ".browse-ad-container",
-    ".browse-banner_ad",
-    ".browse-by-make-ad",
-    ".browse-inline-ad",
-    ".browser_boot_ad",
-    ".browsi-ad",
-    ".bs-ad",
-    ".bsAdvert",
-    ".bsa-in-post-ad-125-125",
-    ".bsaProCarousel",
-    ".bsaProContainer",
-    ".bsaProContainerNew",
-    ".bsa_ads",
-    ".bsa_it_ad",
-    ".bt_ad",
-    ".btf-ad-medRect",
-    ".btfAds",
-    ".btm_ad",
-    ".btn-ad",
-    ".btn-newad",
-    ".btn_ad",
-    ".budget_ads_1",
-    ".budget_ads_2",
-    ".budget_ads_3",
-    ".budget_ads_bg",
-    ".bulk-img-ads",
-    ".bullet-sponsored-links",
-    ".bullet-sponsored-links-gray",
-    ".bump-ad",
-    ".bunyad-ad",
-    ".burstContentAdIndex",
-    ".businessads",
-    ".buttom_ad",
-    ".buttom_ad_size",
-    ".button-ad",
-    ".button-ads",
-    ".buttonAd",
-    ".buttonAdSpot",
-    ".buttonAds",
-    ".button_ad",
-    ".button_ads",
-    ".button_advert",
-    ".button_left_ad",
-    ".button_right_ad",
-    ".buttonad",
-    ".buttonad_v2",
-    ".buttonadbox",
-    ".buttonads",
-    ".buySellAdsContainer",
-    ".buysellAds",
-    ".buysellAdsSmall",
-    ".buzzAd",
-    ".buzz_ad_block",
-    ".buzz_ad_wrap",
-    ".bvi-ads",
-    ".bvp-ad",
-    ".bwm_widget_ad_callout",
-    ".bww-advertising-ad-container",
-    ".bx-ads",
-    ".bx-ads--banner",
-    ".bx_ad",
-    ".bx_ad_right",
-    ".bxad",
-    ".bz-ad",
-    ".bzads-ic-ad-300-250-600",
-    ".c-Ad",
-    ".c-Ad--ezoic",
-    ".c-Ad--inArticle",
-    ".c-Ad--rectangle",
-    ".c-Ad__label",
-    ".c-Adhesion",
-    ".c-ArticleAds",
-    ".c-ad",
-    ".c-ad--adStickyContainer",
-    ".c-ad--bigbox",
-    ".c-ad--header",
-    ".c-ad--mobile-bigbanner",
-    ".c-ad--mpu-in-article",
-    ".c-ad--rectangle",
-    ".c-ad--text-only",
-    ".c-ad--unlabeled",
-    ".c-ad-banner",
-    ".c-ad-flex",
-    ".c-ad-fluid",
-    ".c-ad-mpu-primary",
-    ".c-ad-mpu-secondary",
-    ".c-ad-placeholder",
-    ".c-ad-size2",
-    ".c-ad-size3",
-    ".c-adDisplay",
-    ".c-adDisplay_container",
-    ".c-adOmnibar",
-    ".c-adSense",
-    ".c-adSkyBox",
-    ".c-adbutler-ad",
-    ".c-adbutler-ad__wrapper",
-    ".c-adcontainer",
-    ".c-ads",
-    ".c-adunit",
-    ".c-adunit--billboard",
-    ".c-adunit--first",
-    ".c-adunit__container",
-    ".c-adv3__inner",
-    ".c-advert",
-    ".c-advert-app",
-    ".c-advert-superbanner",
-    ".c-advertisement",
-    ".c-advertisement--billboard",
-    ".c-advertisement--rectangle",
-    ".c-advertising",
-    ".c-advertising__banner-area",
-    ".c-advscrollingzone",
-    ".c-box--advert",
-    ".c-button--adchoices",
-    ".c-gallery-vertical__advert",
-    ".c-googleadslot",
-    ".c-gpt-ad",
-    ".c-header__advert-container",
-    ".c-inblog_ad",
-    ".c-main-header__ad",
-    ".c-news-feed-ads",
-    ".c-partner-articles",
-    ".c-posts__ad",
-    ".c-prebid",
-    ".c-res-ad",
-    ".c-sitenav-adslot",
-    ".c-sitenavPlaceholder__ad",
-    ".c_nt_ad",
-    ".cableads",
-    ".cactus-ads",
-    ".cactus-header-ads",
-    ".caja_ad",
-    ".california-ad",
-    ".california-sidebar-ad",
-    ".calloutAd",
-    ".carbon-ad",
-    ".carbon_ads",
-    ".carbonad",
-    ".carbonad-tag",
-    ".card--ad",
-    ".card--article-ad",
-    ".card-ad",
-    ".card-ads",
-    ".card-article-ads",
-    ".card-productads",
-    ".cardAd",
-    ".catalog_ads",
-    ".category-ad:not(html):not(body):not(.post)",
-    ".category-ads:not(html):not(body):not(.post)",
-    ".category-advertorial",
-    ".categoryMosaic-advertising",
-    ".categoryMosaic-advertisingText",
-    ".cazAd",
-    ".cb-ad-banner",
-    ".cb-ad-container",
-    ".cb-sidebar__sticky-ad",
-    ".cbd_ad_manager",
-    ".cbs-ad",
-    ".cc-advert",
-    ".center-ad",
-    ".center-ad-long",
-    ".center-tag-rightad",
-    ".centerAD",
-    ".centerAd",
-    ".centerAds",
-    ".center_ad",
-    ".center_add",
-    ".center_ads",
-    ".center_inline_ad",
-    ".centerad",
-    ".centerads",
-    ".centeradv",
-    ".centered-ad",
-    ".ch-ad-item",
-    ".channel--ad",
-    ".channel-ad",
-    ".channel-adv",
-    ".channel-icon--ad",
-    ".channel-icon__ad-buffer",
-    ".channel-sidebar-big-box-ad",
-    ".channelBoxAds",
-    ".channel_ad_2016",
-    ".chapter-bottom-ads",
-    ".chapter-top-ads",
-    ".chart_ads",
-    ".chartad",
-    ".chitika-ad",
-    ".ck_adv-box",
-    ".cl-ad-billboard",
-    ".clAdPlacementAnchorWrapper",
-    ".clever-core-ads",
-    ".clickforceads",
-    ".clickio-side-ad",
-    ".client-ad",
-    ".cls_placeholder_adimg",
-    ".clsy-c-advsection",
-    ".cms-ad",
-    ".cn-advertising",
-    ".cnbcHeaderAd",
-    ".cnc-ads",
-    ".coinzilla-ad",
-    ".coinzilla-ad--mobile",
-    ".col-ad",
-    ".col-ad-hidden",
-    ".col-has-ad",
-    ".col-line-ad",
-    ".col2-ads",
-    ".colAd",
-    ".colBoxAdframe",
-    ".colBoxDisplayAd",
-    ".col_ad",
-    ".colads",
-    ".collapsed-ad",
-    ".colombiaAd",
-    ".column-ad",
-    ".columnAd",
-    ".columnAdvert",
-    ".columnBoxAd",
-    ".columnRightAdvert",
-    ".combinationAd",
-    ".comment-ad",
-    ".comment-ad-wrap",
-    ".comment-advertisement",
-    ".comment_ad",
-    ".comment_ad_box",
-    ".commercialAd",
-    ".companion-ad",
-    ".companion-ads",
-    ".companionAd",
-    ".companion_ad",
-    ".complex-ad",
-    ".component-ads-by-google",
-    ".component-ar-horizontal-bar-ad",
-    ".component-header-sticky-ad",
-    ".component-sponsored-links",
-    ".components-Ad-___Ad__ad",
-    ".con_ads",
-    ".connatix",
-    ".connatix-container",
-    ".connatix-hodler",
-    ".connatix-holder",
-    ".connatix-main-container",
-    ".connatix-wrapper",
-    ".connatix-wysiwyg-container",
-    ".consoleAd",
-    ".cont-ad",
-    ".contads_middle",
-    ".contained-ad-container",
-    ".contained-ad-shaft",
-    ".contained-ad-wrapper",
-    ".container--ad",
-    ".container--ads",
-    ".container--ads-leaderboard-atf",
-    ".container--advert",
-    ".container--bannerAd",
-    ".container-ad-600",
-    ".container-ad-left",
-    ".container-adds",
-    ".container-adrotate",
-    ".container-ads",
-    ".container-adwords",
-    ".container-banner-ads",
-    ".container-bottom-ad",
-    ".container-first-ads",
-    ".container-lower-ad",
-    ".container-rectangle-ad",
-    ".container-top-adv",
-    ".container-with-ad",
-    ".containerAdsense",
-    ".containerSqAd",
-    ".container__ad",
-    ".container__box--ads",
-    ".container_ad",
-    ".container_ad_v",
-    ".container_publicidad",
-    ".containerads",
-    ".contains-ad",
-    ".contains-advertisment",
-    ".content--right-ads",
-    ".content-ad",
-    ".content-ad-article",
-    ".content-ad-box",
-    ".content-ad-container",
-    ".content-ad-left",
-    ".content-ad-right",
-    ".content-ad-side",
-    ".content-ad-widget",
-    ".content-ad-wrapper",
-    ".content-ads",
-    ".content-ads-bottom",
-    ".content-advert",
-    ".content-advertisment",
-    ".content-bottom-ad",
-    ".content-bottom-mpu",
-    ".content-cliff__ad",
-    ".content-cliff__ad-container",
-    ".content-contentad",
-    ".content-footer-ad",
-    ".content-footer-ad-block",
-    ".content-header-ad",
-    ".content-item-ad-top",
-    ".content-kuss-ads",
-    ".content-leaderboard-ad",
-    ".content-leaderboard-ads",
-    ".content-page-ad_wrap",
-    ".content-result-ads",
-    ".content-top-ad-item",
-    ".content-top-mpu",
-    ".content-unit-ad",
-    ".content1-ad",
-    ".content2-ad",
-    ".contentAd",
-    ".contentAd--sb1",
-    ".contentAdBox",
-    ".contentAdContainer",
-    ".contentAdFoot",
-    ".contentAdIndex",
-    ".contentAds",
-    ".contentAdsCommon",
-    ".contentAdsWrapper",
-    ".contentAdvertisement",
-    ".contentTopAd",
-    ".contentTopAdSmall",
-    ".contentTopAds",
-    ".content__ad",
-    ".content__ad__content",
-    ".content_ad",
-    ".content_ad_728",
-    ".content_ad_head",
-    ".content_ad_side",
-    ".content_ads",
-    ".content_adsense",
-    ".content_adsq",
-    ".content_advert",
-    ".content_advertising",
-    ".content_advt",
-    ".content_bottom_adsense",
-    ".content_gpt_top_ads",
-    ".content_inner_ad",
-    ".content_left_advert",
-    ".contentad",
-    ".contentad-end",
-    ".contentad-home",
-    ".contentad-storyad-1",
-    ".contentad-superbanner-2",
-    ".contentad-top",
-    ".contentad2",
-    ".contentad300x250",
-    ".contentad_right_col",
-    ".contentadarticle",
-    ".contentadfloatl",
-    ".contentadleft",
-    ".contentads1",
-    ".contentads2",
-    ".contentbox_ad",
-    ".contentleftad",
-    ".contents-ads-bottom-left",
-    ".contest_ad",
-    ".context-ads",
-    ".contextualAds",
-    ".contextual_ad_unit",
-    ".coreAdsPlacer",
-    ".cornerad",
-    ".cpmstarHeadline",
-    ".cpmstarText",
-    ".crain-advertisement",
-    ".criteo-ad",
-    ".crm-adcontain",
-    ".crumb-ad",
-    ".cs-adv-wrapper",
-    ".cspAd",
-    ".css--ad",
-    ".ct-ads",
-    ".ct-advert",
-    ".ct-advertising-footer",
-    ".ct-bottom-ads",
-    ".ct_ad",
-    ".cta-ad",
-    ".cube-ad",
-    ".cubeAd",
-    ".cube_ad",
-    ".cube_ads",
-    ".custom-ad",
-    ".custom-ad-1",
-    ".custom-ad-area",
-    ".custom-ad-container",
-    ".custom-ad-one",
-    ".custom-ads",
-    ".custom-advert-banner",
-    ".custom-sticky-ad-container",
-    ".customAd",
-    ".custom_ad",
-    ".custom_ad_responsive",
-    ".custom_ads",
-    ".custom_ads_positions",
-    ".custom_banner_ad",
-    ".custom_footer_ad",
-    ".customadvert",
-    ".customized_ad_module",
-    ".cwAdvert",
-    ".cwv2Ads",
-    ".cxAdvertisement",
-    ".cyads650x100",
-    ".cz-sponsorposts",
-    ".d1-top-ad",
-    ".d3-c-adblock",
-    ".d3-o-adv-block",
-    ".da-custom-ad-box",
-    ".dac__banner__wrapper",
-    ".dac__mpu-card",
-    ".dac__stream-mpu-card",
-    ".daily-adlabel",
-    ".dart-ad",
-    ".dart-ad-content",
-    ".dart-ad-grid",
-    ".dart-ad-title",
-    ".dart-advertisement",
-    ".dart-leaderboard",
-    ".dart-leaderboard-top",
-    ".dart-medsquare",
-    ".dartAd300",
-    ".dartAd491",
-    ".dartAdImage",
-    ".dart_ad",
-    ".dart_tag",
-    ".dartad",
-    ".dartadbanner",
-    ".dartadvert",
-    ".dartiframe",
-    ".datafile-ad",
-    ".datasphere-ad-front",
-    ".dc-ad",
-    ".dc-banner",
-    ".dc-half-banner",
-    ".dc-widget-adv-125",
-    ".dcAdvertHeader",
-    ".dcm-advert",
-    ".dcmads",
-    ".dd-ad",
-    ".dd-ad-container",
-    ".dda-ad",
-    ".ddc-table-ad",
-    ".deckAd",
-    ".deckads",
-    ".default-teaser__adv",
-    ".demand-supply",
-    ".demo-advert",
-    ".desktop-ad",
-    ".desktop-ad-banner",
-    ".desktop-ad-inpage",
-    ".desktop-ad-slider",
-    ".desktop-ads",
-    ".desktop-adunit",
-    ".desktop-advert",
-    ".desktop-article-top-ad",
-    ".desktop-aside-ad-hide",
-    ".desktop-lazy-ads",
-    ".desktop-sidebar-ad-wrapper",
-    ".desktop-top-ad-wrapper",
-    ".desktop.ad",
-    ".desktopAd",
-    ".desktop_ad",
-    ".desktop_mpu",
-    ".desktop_only_ad",
-    ".desktopads",
-    ".detail-ad",
-    ".detail-ads",
-    ".detail__ad--small",
-    ".detail_ad",
-    ".detail_article_ad",
-    ".detail_top_advert",
-    ".details-advert",
-    ".dfm-featured-bottom-flex-container",
-    ".dfp-ad",
-    ".dfp-ad-bigbox2-wrap",
-    ".dfp-ad-container",
-    ".dfp-ad-container-box",
-    ".dfp-ad-container-wide",
-    ".dfp-ad-full",
-    ".dfp-ad-hideempty",
-    ".dfp-ad-lead2-wrap",
-    ".dfp-ad-lead3-wrap",
-    ".dfp-ad-midbreaker-wrap",
-    ".dfp-ad-midbreaker2-wrap",
-    ".dfp-ad-placeholder",
-    ".dfp-ad-rect",
-    ".dfp-ad-region-1",
-    ".dfp-ad-region-2",
-    ".dfp-ad-tags",
-    ".dfp-ad-top-wrapper",
-    ".dfp-ad-unit",
-    ".dfp-ad-widget",
-    ".dfp-ads-ad-article-middle",
-    ".dfp-ads-embedded",
-    ".dfp-adspot",
-    ".dfp-article-ad",
-    ".dfp-banner",
-    ".dfp-banner-slot",
-    ".dfp-billboard-wrapper",
-    ".dfp-block",
-    ".dfp-bottom",
-    ".dfp-button",
-    ".dfp-close-ad",
-    ".dfp-double-mpu",
-    ".dfp-dynamic-tag",
-    ".dfp-fixedbar",
-    ".dfp-here-bottom",
-    ".dfp-here-top",
-    ".dfp-interstitial",
-    ".dfp-leaderboard",
-    ".dfp-leaderboard-container",
-    ".dfp-mrec",
-    ".dfp-panel",
-    ".dfp-plugin-advert",
-    ".dfp-position",
-    ".dfp-slot",
-    ".dfp-slot-wallpaper",
-    ".dfp-space",
-    ".dfp-super-leaderboard",
-    ".dfp-tag-wrapper",
-    ".dfp-top",
-    ".dfp-top1",
-    ".dfp-top1-container",
-    ".dfp-top_leaderboard",
-    ".dfp-wrap",
-    ".dfp-wrapper",
-    ".dfpAd",
-    ".dfpAdUnitContainer",
-    ".dfpAds",
-    ".dfpAdspot",
-    ".dfpAdvert",
-    ".dfp_ATF_wrapper",
-    ".dfp_ad--outbrain",
-    ".dfp_ad_block",
-    ".dfp_ad_caption",
-    ".dfp_ad_content_bottom",
-    ".dfp_ad_content_top",
-    ".dfp_ad_footer",
-    ".dfp_ad_header",
-    ".dfp_ad_pos",
-    ".dfp_ad_unit",
-    ".dfp_ads_block",
-    ".dfp_frame",
-    ".dfp_slot",
-    ".dfp_strip",
-    ".dfp_top-ad",
-    ".dfp_txt",
-    ".dfp_unit",
-    ".dfp_unit--interscroller",
-    ".dfp_unit-ad_container",
-    ".dfpad",
-    ".dfrads",
-    ".dfx-ad",
-    ".dfx-adBlock1Wrapper",
-    ".dg-gpt-ad-container",
-    ".dianomi-ad",
-    ".dianomi-container",
-    ".dianomi-embed",
-    ".dianomiScriptContainer",
-    ".dianomi_context",
-    ".dikr-responsive-ads-slot",
-    ".discourse-adplugin",
-    ".discourse-google-dfp",
-    ".display-ad",
-    ".display-ad-block",
-    ".display-adhorizontal",
-    ".display-ads-block",
-    ".display-advertisement",
-    ".displayAd",
-    ".displayAdCode",
-    ".displayAdSlot",
-    ".displayAdUnit",
-    ".displayAds",
-    ".display_ad",
-    ".display_ads_right",
-    ".div-gpt-ad-adhesion-leaderboard-wrap",
-    ".div-insticator-ad",
-    ".divAd",
-    ".divAdright",
-    ".divAds",
-    ".divAdsBanner",
-    ".divAdsLeft",
-    ".divAdsRight",
-    ".divReklama",
-    ".divRepAd",
-    ".divSponsoredBox",
-    ".divSponsoredLinks",
-    ".divTopADBanner",
-    ".divTopADBannerWapper",
-    ".divTopArticleAd",
-    ".div_advertisement",
-    ".div_advertorial",
-    ".div_advstrip",
-    ".div_banner468",
-    ".divad1",
-    ".divad2",
-    ".divad3",
-    ".divads",
-    ".divider-ad",
-    ".divider-advert",
-    ".divider-full-width-ad",
-    ".divider_ad",
-    ".dlSponsoredLinks",
-    ".dm-adSlotBillboard",
-    ".dm-adSlotNative1",
-    ".dm-adSlotNative2",
-    ".dm-adSlotNative3",
-    ".dm-adSlotRectangle1",
-    ".dm-adSlotRectangle2",
-    ".dm-adSlotSkyscraper",
-    ".dm-adSlot__sticky",
-    ".dm_ad",
-    ".dm_ad-billboard",
-    ".dm_ad-container",
-    ".dm_ad-halfpage",
-    ".dm_ad-leaderboard",
-    ".dm_ad-link",
-    ".dm_ad-skyscraper",
-    ".dm_ad300x620",
-    ".dmpu-ad",
-    ".dn-ad-wide",
-    ".dotcom-ad",
-    ".double-ad",
-    ".double-ads",
-    ".double-click-ad",
-    ".double-mpu-unit",
-    ".double-square-ad",
-    ".doubleClickAd",
-    ".double_adsense",
-    ".doubleclickAds",
-    ".download-ad",
-    ".downloadAds",
-    ".download_ad",
-    ".drop-ad",
-    ".dropdownAds",
-    ".dsk-box-ad-d",
-    ".dsp-under-video-ad",
-    ".dsq_ad",
-    ".dt-ad-top-content",
-    ".dt-sponsor",
-    ".dtads-desktop",
-    ".dtads-slot",
-    ".dual-ads",
-    ".dualAds",
-    ".dva_ad",
-    ".dvad1",
-    ".dvad2",
-    ".dvad3",
-    ".dvad3mov",
-    ".dvad4",
-    ".dvad4cont",
-    ".dvad5",
-    ".dvad5cont",
-    ".dvadevent",
-    ".dvadvhw",
-    ".dvcvmidads",
-    ".dvcvrgtad",
-    ".dyn-sidebar-ad",
-    ".dynamic-ads",
-    ".dynamicAdvertContainer",
-    ".dynamicLeadAd",
-    ".dynamic_adslot",
-    ".dynamicad1",
-    ".dynamicad2",
-    ".e-ad",
-    ".e-advertise",
-    ".eaa-ad",
-    ".eads",
-    ".easy-ads",
-    ".easyAdsBox",
-    ".easyAdsSinglePosition",
-    ".ebayads",
-    ".ebm-ad-target__outer",
-    ".ecommerce-ad",
-    ".ecosia-ads",
-    ".eddy-adunit",
-    ".editor_ad",
-    ".eg-ad",
-    ".eg-custom-ad",
-    ".element--ad",
-    ".element-ad",
-    ".element-adplace",
-    ".element_contentad1",
-    ".element_contentad2",
-    ".element_contentad3",
-    ".element_contentad4",
-    ".element_contentad5",
-    ".elementor-widget-wp-widget-advads_ad_widget",
-    ".em-ad",
-    ".em-adv-container",
-    ".em_ad_300x250",
-    ".em_ads_box_dynamic_remove",
-    ".embAD",
-    ".embed-ad",
-    ".embedded-article-ad",
-    ".embeddedAd",
-    ".embeddedAds",
-    ".embedded_ad_wrapper",
-    ".emm-ad",
-    ".empire-unit-prefill-container",
-    ".empty-ad",
-    ".endAHolder",
-    ".endti-adlabel",
-    ".entry-ad",
-    ".entry-ads",
-    ".entry-bottom-ad",
-    ".entry-bottom-ads",
-    ".entry-top-ad",
-    ".entryAd",
-    ".entry_ad",
-    ".entryad",
-    ".esv-ads",
-    ".etn-ad-text",
-    ".eu-advertisment1",
-    ".evo-ads-widget",
-    ".evolve-ad",
-    ".ex_pu_iframe",
-    ".exo-ad-ins-container",
-    ".exo_wrapper",
-    ".external-ad",
-    ".external-add",
-    ".ezAdsWidget",
-    ".ezmob-footer",
-    ".ezmob-footer-desktop",
-    ".ezo_ad",
-    ".ezoic-ad",
-    ".ezoic-ad-adaptive",
-    ".ezoic-adpicker-ad",
-    ".ezoic-floating-bottom",
-    ".f-ad",
-    ".f-item-ad",
-    ".f-item-ad-inhouse",
-    ".fallbackMidArticleAd",
-    ".fbs-ad--ntv-home-wrapper",
-    ".fbs-ad--top-wrapper",
-    ".fbs-ad--topx-wrapper",
-    ".fc_clmb_ad",
-    ".fce_ads",
-    ".fd-ad",
-    ".featureAd",
-    ".feature_ad",
-    ".featured-ad",
-    ".featured-ads",
-    ".featured-sponsors",
-    ".featured-story-ad",
-    ".featuredAdBox",
-    ".featuredAds",
-    ".featuredBoxAD",
-    ".featured_ad",
-    ".featuredadvertising",
-    ".feed-ad",
-    ".fh_ad_microbuttons",
-    ".field-59-companion-ad",
-    ".fig-ad-content",
-    ".firefly-sidebar-ad",
-    ".first-article-ad-block",
-    ".first-banner-ad",
-    ".first-leaderbord-adv",
-    ".first-leaderbord-adv-mobile",
-    ".firstAd-container",
-    ".first_ad",
-    ".first_party_ad_wrapper",
-    ".first_post_ad",
-    ".firstad",
-    ".firstpost_advert",
-    ".firstpost_advert_container",
-    ".fix_ad",
-    ".fixadheight",
-    ".fixadheightbottom",
-    ".fixed-ad-aside",
-    ".fixed-ad-bottom",
-    ".fixed-ads",
-    ".fixed-bottom-ad",
-    ".fixed-sidebar-ad",
-    ".fixedAds",
-    ".fixedLeftAd",
-    ".fixedRightAd",
-    ".fixed_ad",
-    ".fixed_adslot",
-    ".fixed_advert_banner",
-    ".fjs-ad-hide-empty",
-    ".fla-ad",
-    ".flashAd",
-    ".flash_ad",
-    ".flash_advert",
-    ".flashad",
-    ".flashadd",
-    ".flex-ad",
-    ".flex-posts-ads",
-    ".flexAd",
-    ".flexAds",
-    ".flexContentAd",
-    ".flexad",
-    ".flexadvert",
-    ".flexiad",
-    ".flm-ad",
-    ".floatad",
-    ".floatads",
-    ".floated-ad",
-    ".floated_right_ad",
-    ".floating-ads",
-    ".floating-advert",
-    ".floatingAds",
-    ".fly-ad",
-    ".fm-badge-ad",
-    ".fnadvert",
-    ".fns_td_wrap",
-    ".fold-ads",
-    ".follower-ad-bottom",
-    ".following-ad",
-    ".following-ad-container",
-    ".foot-ad",
-    ".foot-ads",
-    ".foot-advertisement",
-    ".foot_adsense",
-    ".footad",
-    ".footer-300-ad",
-    ".footer-ad",
-    ".footer-ad-full-wrapper",
-    ".footer-ad-labeling",
-    ".footer-ad-row",
-    ".footer-ad-section",
-    ".footer-ad-squares",
-    ".footer-ad-unit",
-    ".footer-ad-wrap",
-    ".footer-adrow",
-    ".footer-ads",
-    ".footer-ads-slide",
-    ".footer-ads-wrapper",
-    ".footer-ads_unlocked",
-    ".footer-adsbar",
-    ".footer-adsense",
-    ".footer-advert",
-    ".footer-advert-large",
-    ".footer-advertisement",
-    ".footer-advertisements",
-    ".footer-advertising",
-    ".footer-advertising-area",
-    ".footer-banner-ad",
-    ".footer-banner-ads",
-    ".footer-floating-ad",
-    ".footer-im-ad",
-    ".footer-leaderboard-ad",
-    ".footer-post-ad-blk",
-    ".footer-prebid",
-    ".footer-text-ads",
-    ".footerAd",
-    ".footerAdModule",
-    ".footerAdUnit",
-    ".footerAdWrapper",
-    ".footerAds",
-    ".footerAdsWrap",
-    ".footerAdslot",
-    ".footerAdverts",
-    ".footerBottomAdSec",
-    ".footerFullAd",
-    ".footerGoogleAdMainWarp",
-    ".footerPageAds",
-    ".footerSponsorStrip",
-    ".footerTextAd",
-    ".footer__ads--content",
-    ".footer__advert",
-    ".footer_ad",
-    ".footer_ad336",
-    ".footer_ad_container",
-    ".footer_ads",
-    ".footer_adv",
-    ".footer_advertisement",
-    ".footer_banner_ad_container",
-    ".footer_block_ad",
-    ".footer_bottom_ad",
-    ".footer_bottomad",
-    ".footer_line_ad",
-    ".footer_text_ad",
-    ".footer_text_adblog",
-    ".footerad",
-    ".footeradspace",
-    ".footertextadbox",
-    ".forbes-ad-container",
-    ".forex_ad_links",
-    ".fortune-ad-unit",
-    ".forum-ad",
-    ".forum-ad-2",
-    ".forum-teaser-ad",
-    ".forum-topic--adsense",
-    ".forumAd",
-    ".forum_ad_beneath",
-    ".forum_top_ads",
-    ".four-ads",
-    ".four-six-eight-ad",
-    ".four_button_threeone_ad",
-    ".four_percent_ad",
-    ".fp-ad-nativendo-one-third",
-    ".fp-ad-rectangle",
-    ".fp-ad300",
-    ".fp-adinsert",
-    ".fp-ads",
-    ".fp-right-ad",
-    ".fp-right-ad-list",
-    ".fp-right-ad-zone",
-    ".fp_ad_text",
-    ".fp_adv-box",
-    ".fp_article-card--adv-injected",
-    ".fr_ad_loading",
-    ".frame_adv",
-    ".framead",
-    ".free-start-ads-block",
-    ".freedownload_ads",
-    ".freestar-ad-container",
-    ".freestar-ad-sidebar-container",
-    ".freestar-ad-wide-container",
-    ".freestar-incontent-ad",
-    ".frn_adbox",
-    ".frn_contAdHead",
-    ".frn_cont_adbox",
-    ".fromoursponsor",
-    ".front-ad",
-    ".front-video-ads",
-    ".front_ad",
-    ".frontads",
-    ".frontendAd",
-    ".frontone_ad",
-    ".frontpage-google-ad",
-    ".frontpage-right-ad",
-    ".frontpage-right-ad-hide",
-    ".frontpage__article--ad",
-    ".frontpage_ads",
-    ".fs-ad-block",
-    ".fsAdContainer",
-    ".fs_ad",
-    ".fs_ads",
-    ".fsrads",
-    ".ft-ad",
-    ".full-ad",
-    ".full-ad-wrapper",
-    ".full-ads",
-    ".full-adv",
-    ".full-bleed-ad",
-    ".full-bleed-ad-container",
-    ".full-page-ad",
-    ".full-top-ad-area",
-    ".full-width-ad",
-    ".full-width-ad-container",
-    ".full-width-ads",
-    ".fullAdBar",
-    ".fullBleedAd",
-    ".fullSizeAd",
-    ".fullWidthAd",
-    ".full_AD",
-    ".full_ad_box",
-    ".full_ad_row",
-    ".full_width_ad",
-    ".fulladblock",
-    ".fullbanner_ad",
-    ".fullbannerad",
-    ".fullpage-ad",
-    ".fullsize-ad-square",
-    ".fullwidth-advertisement",
-    ".fusion-ads",
-    ".fusion-advert",
-    ".future_inline_clone_target",
-    ".fuv_sidebar_ad_widget",
-    ".fwAdTags",
-    ".fw_ad",
-    ".g-ad",
-    ".g-ad-fix",
-    ".g-ad-leaderboard",
-    ".g-ad-slot",
-    ".g-ad-slot-toptop",
-    ".g-adblock3",
-    ".g-adver",
-    ".g-advertisement-block",
-    ".g1-ads",
-    ".g1-advertisement",
-    ".g2-adsense",
-    ".g3-adsense",
-    ".g3rtn-ad-site",
-    ".gAdFour",
-    ".gAdMTable",
-    ".gAdMainParent",
-    ".gAdMobileTable",
-    ".gAdOne",
-    ".gAdOneMobile",
-    ".gAdRows",
-    ".gAdSky",
-    ".gAdThreeDesktop",
-    ".gAdThreeMobile",
-    ".gAdTwo",
-    ".gAds",
-    ".gAds1",
-    ".gAdsBlock",
-    ".gAdsContainer",
-    ".gAdvertising",
-    ".g_ad",
-    ".g_ad336",
-    ".g_ads_200",
-    ".g_ads_728",
-    ".g_adv",
-    ".g_flbrd_ad",
-    ".g_ggl_ad",
-    ".g_lbrd_ad",
-    ".ga-ad-split",
-    ".ga-ads",
-    ".ga-textads-bottom",
-    ".ga-textads-top",
-    ".gaTeaserAds",
-    ".gaTeaserAdsBox",
-    ".gabfire_ad",
-    ".gabfire_simplead_widget",
-    ".gad-container",
-    ".gad-right1",
-    ".gad-right2",
-    ".gad300x600",
-    ".gad336x280",
-    ".gadContainer",
-    ".gad_container",
-    ".gads300x250",
-    ".gads_cb",
-    ".gads_container",
-    ".gadsense",
-    ".gadsense-ad",
-    ".gall_ad",
-    ".galleria-AdOverlay",
-    ".galleria-ad-2",
-    ".galleria-adsense",
-    ".gallery--wrapped-ad",
-    ".gallery-ad",
-    ".gallery-ad-container",
-    ".gallery-ad-counter",
-    ".gallery-ad-holder",
-    ".gallery-ad-lazyload-placeholder",
-    ".gallery-ad-overlay",
-    ".gallery-adslot-top",
-    ".gallery-injectedAd",
-    ".gallery-sidebar-ad",
-    ".gallery-slide-ad",
-    ".galleryAds",
-    ".galleryAdvertPanel",
-    ".galleryLeftAd",
-    ".galleryRightAd",
-    ".gallery_300x100_ad",
-    ".gallery__bottom-ad",
-    ".gallery_ad",
-    ".gallery_ad_wrapper",
-    ".gallery_ads_box",
-    ".galleryad",
-    ".galleryads",
-    ".gam-ad",
-    ".gam-ad-hz-bg",
-    ".gam_ad_slot",
-    ".game-ads",
-    ".game-category-ads",
-    ".gameAd",
-    ".gameBottomAd",
-    ".game_right_ad",
-    ".game_under_ad",
-    ".gamepage_boxad",
-    ".gamepageadBox",
-    ".gameplayads",
-    ".games-ad-wrapper",
-    ".games-ad300",
-    ".gb-ad-top",
-    ".gbl_adstruct",
-    ".gbl_advertisement",
-    ".gc-deck--is-ad",
-    ".gd_ad_label",
-    ".gdm-ad",
-    ".gels-inlinead",
-    ".gen_side_ad",
-    ".general-ad",
-    ".general-adv-container",
-    ".general_banner_ad",
-    ".generic-ad-module",
-    ".generic-ad-title",
-    ".genericAds",
-    ".generic_300x250_ad",
-    ".geoAd",
-    ".gfp-banner",
-    ".ggads",
-    ".ggadwrp",
-    ".gglAds",
-    ".ggl_ads_row",
-    ".ggl_txt_ads",
-    ".gglads300",
-    ".giant_pushbar_ads_l",
-    ".gl_ad",
-    ".glacier-ad",
-    ".glamsquaread",
-    ".glance_banner_ad",
-    ".global-adsense",
-    ".global-body-ad",
-    ".globalAd",
-    ".globalAdLargeRect",
-    ".globalAdLeaderBoard",
-    ".global_banner_ad",
-    ".gm-ad-lrec",
-    ".gmgAd",
-    ".gms-ad-centre",
-    ".gms-advert",
-    ".gn_ads",
-    ".gnm-ad-unit",
-    ".gnm-ad-unit-container",
-    ".gnm-ad-zones",
-    ".gnm-adhesion-ad",
-    ".gnm-banner-ad",
-    ".gnm-bg-ad",
-    ".go-ad",
-    ".go-ads-widget-ads-wrap",
-    ".goAdMan",
-    ".goAdverticum",
-    ".goads",
-    ".goafrica-ad",
-    ".goglad",
-    ".goog_ad",
-    ".googads",
-    ".google-2ad",
-    ".google-ad",
-    ".google-ad-160-600",
-    ".google-ad-468-60",
-    ".google-ad-728-90",
-    ".google-ad-afc-header",
-    ".google-ad-block",
-    ".google-ad-bottom-outer",
-    ".google-ad-center",
-    ".google-ad-center-below-posts",
-    ".google-ad-center-footer",
-    ".google-ad-container",
-    ".google-ad-content",
-    ".google-ad-fix",
-    ".google-ad-header2",
-    ".google-ad-iframe",
-    ".google-ad-image",
-    ".google-ad-manager",
-    ".google-ad-manager__slot",
-    ".google-ad-pad",
-    ".google-ad-placeholder",
-    ".google-ad-side_ad",
-    ".google-ad-sidebar",
-    ".google-ad-space",
-    ".google-ad-space-vertical",
-    ".google-ad-top-outer",
-    ".google-ad-widget",
-    ".google-ads",
-    ".google-ads-billboard",
-    ".google-ads-bottom",
-    ".google-ads-boxout",
-    ".google-ads-container",
-    ".google-ads-footer-01",
-    ".google-ads-footer-02",
-    ".google-ads-in_article",
-    ".google-ads-leaderboard",
-    ".google-ads-long",
-    ".google-ads-responsive",
-    ".google-ads-right",
-    ".google-ads-sidebar",
-    ".google-ads-slim",
-    ".google-ads-widget",
-    ".google-ads-wrapper",
-    ".google-ads2",
-    ".google-adsbygoogle",
-    ".google-adsense",
-    ".google-advert-sidebar",
-    ".google-afc-wrapper",
-    ".google-bottom-ads",
-    ".google-dfp-ad-caption",
-    ".google-dfp-ad-label",
-    ".google-dfp-ad-wrapper",
-    ".google-entrepreneurs-ad",
-    ".google-mid-ad",
-    ".google-right-ad",
-    ".google-right-sidebar-ad",
-    ".google-side-ad",
-    ".google-sponsored",
-    ".google-sponsored-ads",
-    ".google-sponsored-link",
-    ".google-sponsored-links",
-    ".google-text-ads",
-    ".google-user-ad",
-    ".google300x250",
-    ".google468",
-    ".google468_60",
-    ".google728x90",
-    ".googleAd",
-    ".googleAd-content",
-    ".googleAd-list",
-    ".googleAdBox",
-    ".googleAdContainer",
-    ".googleAdFoot",
-    ".googleAdSearch",
-    ".googleAdSense",
-    ".googleAdWrapper",
-    ".googleAdd",
-    ".googleAds",
-    ".googleAds336",
-    ".googleAds728",
-    ".googleAdsContainer",
-    ".googleAdsSquare",
-    ".googleAdsense",
-    ".googleAdsenseMiddle",
-    ".googleAdv",
-    ".googleBannerWrapper",
-    ".googleContentAds",
-    ".googleInsideAd",
-    ".googleLgRect",
-    ".googleSideAd",
-    ".googleSkyWrapper",
-    ".googleSubjectAd",
-    ".google_728x90",
-    ".google_ad",
-    ".google_ad3",
-    ".google_ad336",
-    ".google_ad_bg",
-    ".google_ad_btn",
-    ".google_ad_container",
-    ".google_ad_first",
-    ".google_ad_label",
-    ".google_ad_mrec",
-    ".google_ad_right",
-    ".google_ad_wide",
-    ".google_add",
-    ".google_add_container",
-    ".google_admanager",
-    ".google_ads",
-    ".google_ads_468x60",
-    ".google_ads_content",
-    ".google_ads_sidebar",
-    ".google_adsense",
-    ".google_adsense1",
-    ".google_adsense1_footer",
-    ".google_adsense_footer",
-    ".google_adsense_sidebar_left",
-    ".google_afc",
-    ".google_afc_ad",
-    ".google_top_adsense",
-    ".googlead",
-    ".googlead-sidebar",
-    ".googleadArea",
-    ".googlead_iframe",
-    ".googlead_outside",
-    ".googleadbottom",
-    ".googleadcontainer",
-    ".googleaddiv",
-    ".googleaddiv2",
-    ".googleadiframe",
-    ".googleads",
-    ".googleads-bottommiddle",
-    ".googleads-container",
-    ".googleads-height",
-    ".googleads-topmiddle",
-    ".googleads_300x250",
-    ".googleads_title",
-    ".googleadsense",
-    ".googleadsrectangle",
-    ".googleadv",
-    ".googleadvertisement",
-    ".googleadwrap",
-    ".googleafc",
-    ".googlebanwide",
-    ".googleimagead1",
-    ".googleimagead2",
-    ".googlepostads",
-    ".googley_ads",
-    ".gpAdBox",
-    ".gpAdFooter",
-    ".gpAds",
-    ".gpt-ad",
-    ".gpt-ad-container",
-    ".gpt-ad-sidebar-wrap",
-    ".gpt-ad-wrapper",
-    ".gpt-ads",
-    ".gpt-billboard",
-    ".gpt-breaker-container",
-    ".gpt-container",
-    ".gpt-leaderboard-banner",
-    ".gpt-mpu-banner",
-    ".gpt-sticky-sidebar",
-    ".gpt.top-slot",
-    ".gptSlot",
-    ".gptSlot-outerContainer",
-    ".gptSlot__sticky-footer",
-    ".gptslot",
-    ".gradientAd",
-    ".graphic_ad",
-    ".grev-ad",
-    ".grey-ad",
-    ".grey-ad-line",
-    ".grey-ad-notice",
-    ".greyAd",
-    ".greyad",
-    ".grid-ad",
-    ".grid-ad-col__big",
-    ".grid-advertisement",
-    ".grid-block-ad",
-    ".grid-item-ad",
-    ".gridAd",
-    ".gridAdRow",
-    ".gridSideAd",
-    ".grid_ad_container",
-    ".gridad",
-    ".gridlove-ad",
-    ".gridstream_ad",
-    ".groei-ad",
-    ".ground-ads-shared",
-    ".group-ad-leaderboard",
-    ".group-google-ads",
-    ".group-item-ad",
-    ".group_ad",
-    ".gsAd",
-    ".gtm-ad-slot",
-    ".guide__row--fixed-ad",
-    ".guj-ad--placeholder",
-    ".gujAd",
-    ".gutterads",
-    ".gw-ad",
-    ".h-adholder",
-    ".h-ads",
-    ".h-adver",
-    ".h-large-ad-box",
-    ".h-top-ad",
-    ".h11-ad-top",
-    ".h_Ads",
-    ".h_ad",
-    ".half-ad",
-    ".half-page-ad",
-    ".half-page-ad-1",
-    ".half-page-ad-2",
-    ".half-page-advert-outer-wrapper",
-    ".halfPageAd",
-    ".half_ad_box",
-    ".halfpage_ad",
-    ".halfpage_ad_1",
-    ".halfpage_ad_container",
-    ".happy-inline-ad",
-    ".has-ad",
-    ".has-adslot",
-    ".has-fixed-bottom-ad",
-    ".hasAD",
-    ".hasads",
-    ".hbPostAd",
-    ".hb__ad",
-    ".hbi-ad-advertiser",
-    ".hbox_top_sponsor",
-    ".hcf-ad",
-    ".hcf-ad-rectangle",
-    ".hcf-cms-ad",
-    ".hd-adv",
-    ".hdTopAdContainer",
-    ".hd_advert",
-    ".hd_below_player_ad",
-    ".hdr-ad",
-    ".hdr-ad-text",
-    ".hdr-ads",
-    ".hdrAd",
-    ".hdr_ad",
-    ".head-ad",
-    ".head-ads",
-    ".head-banner468",
-    ".head-top-ads",
-    ".headAd",
-    ".head_ad",
-    ".head_ad_wrapper",
-    ".head_ads",
-    ".head_ads_900",
-    ".head_adv",
-    ".head_advert",
-    ".headad",
-    ".headadcontainer",
-    ".header--ad-space",
-    ".header-ad",
-    ".header-ad-area",
-    ".header-ad-banner",
-    ".header-ad-box",
-    ".header-ad-container",
-    ".header-ad-desktop",
-    ".header-ad-frame",
-    ".header-ad-holder",
-    ".header-ad-new-wrap",
-    ".header-ad-region",
-    ".header-ad-row",
-    ".header-ad-space",
-    ".header-ad-top",
-    ".header-ad-widget",
-    ".header-ad-wrap",
-    ".header-ad-wrapper",
-    ".header-ad-zone",
-    ".header-adbanner",
-    ".header-adbox",
-    ".header-adcode",
-    ".header-adplace",
-    ".header-ads",
-    ".header-ads-area",
-    ".header-ads-container",
-    ".header-ads-holder",
-    ".header-ads-wrap",
-    ".header-ads-wrapper",
-    ".header-adsense",
-    ".header-adslot-container",
-    ".header-adspace",
-    ".header-adv",
-    ".header-advert",
-    ".header-advert-wrapper",
-    ".header-advertise",
-    ".header-advertisement",
-    ".header-advertising",
-    ".header-ama-ad",
-    ".header-and-footer--banner-ad",
-    ".header-article-ads",
-    ".header-banner-ad",
-    ".header-banner-ads",
-    ".header-banner-advertising",
-    ".header-bannerad",
-    ".header-bottom-adboard-area",
-    ".header-content-ad-container",
-    ".header-google-ads",
-    ".header-pencil-ad",
-    ".header-sponsor",
-    ".header-top-ad",
-    ".header-top_ads",
-    ".header728-ad",
-    ".headerAd",
-    ".headerAd1",
-    ".headerAdBanner",
-    ".headerAdCode",
-    ".headerAdContainer",
-    ".headerAdPosition",
-    ".headerAdSpacing",
-    ".headerAdWrapper",
-    ".headerAds",
-    ".headerAds250",
-    ".headerAdspace",
-    ".headerAdvert",
-    ".headerAdvertisement",
-    ".headerMain-ad",
-    ".headerTextAd",
-    ".headerTopAd",
-    ".headerTopAds",
-    ".header__ad",
-    ".header__ads",
-    ".header__advertisement",
-    ".header__leaderboard-ad",
-    ".header_ad",
-    ".header_ad1",
-    ".header_ad_2",
-    ".header_ad_center",
-    ".header_ad_div",
-    ".header_ad_space",
-    ".header_ads",
-    ".header_ads-container",
-    ".header_ads_box",
-    ".header_adsense_banner",
-    ".header_adspace",
-    ".header_advert",
-    ".header_advertisement",
-    ".header_advertisement_text",
-    ".header_advertisment",
-    ".header_leaderboard_ad",
-    ".header_link_ad",
-    ".header_right_ad",
-    ".header_top_ad",
-    ".headerad",
-    ".headerad-720",
-    ".headerad-placeholder",
-    ".headeradarea",
-    ".headeradblock",
-    ".headeradhome",
-    ".headeradinfo",
-    ".headeradright",
-    ".headerads",
-    ".heading-ad-space",
-    ".headline-adblock",
-    ".headline-ads",
-    ".headline_advert",
-    ".heavy_ad",
-    ".hederAd",
-    ".height_250_ad",
-    ".height_90_ad",
-    ".herald-ad",
-    ".hero-ad",
-    ".hero-ad-slot",
-    ".hero-advert",
-    ".heroAd",
-    ".hf-top-ad",
-    ".hidden-ad",
-    ".hide-ad",
-    ".hideAdMessage",
-    ".hide_ad",
-    ".hide_internal_ad",
-    ".hidead",
-    ".highlight-news-ad",
-    ".highlights-ad",
-    ".highlightsAd",
-    ".hioxInternalAd",
-    ".hm-ad",
-    ".hm-sec-ads",
-    ".hm-vertical-ad",
-    ".hm_adlist",
-    ".hm_advertisment",
-    ".hmad",
-    ".hn-ads",
-    ".holder-ad",
-    ".holder-ads",
-    ".home-2020-ad-text",
-    ".home-2020-ad-wide",
-    ".home-ad",
-    ".home-ad--promo",
-    ".home-ad--top",
-    ".home-ad-bigbox",
-    ".home-ad-container",
-    ".home-ad-inline",
-    ".home-ad-links",
-    ".home-ad-region-1",
-    ".home-ad-section",
-    ".home-ad728",
-    ".home-ads",
-    ".home-ads-container",
-    ".home-ads-container1",
-    ".home-ads1",
-    ".home-adv-box",
-    ".home-advert",
-    ".home-area3-adv-text",
-    ".home-body-ads",
-    ".home-features-ad",
-    ".home-module--advertisement",
-    ".home-module_ad",
-    ".home-page-ad",
-    ".home-sidebar-ad",
-    ".home-sidebar-ad-300",
-    ".home-slider-ads",
-    ".home-sponsored-links",
-    ".home-sticky-ad",
-    ".home-top-ad",
-    ".homeAd",
-    ".homeAd1",
-    ".homeAd2",
-    ".homeAdBox",
-    ".homeAdBoxA",
-    ".homeAdSection",
-    ".homeAddTopText",
-    ".homeBoxMediumAd",
-    ".homeCentreAd",
-    ".homeMainAd",
-    ".homeMediumAdGroup",
-    ".homePageAdSquare",
-    ".homePageAds",
-    ".homeSubAd",
-    ".homeTextAds",
-    ".homeTopAdContainer",
-    ".home__ad",
-    ".home__ad-small",
-    ".home_ad",
-    ".home_ad720_inner",
-    ".home_ad_300x100",
-    ".home_ad_300x250",
-    ".home_ad_bottom",
-    ".home_ad_large",
-    ".home_ad_title",
-    ".home_adblock",
-    ".home_advert",
-    ".home_advertisement",
-    ".home_advertorial",
-    ".home_box_latest_ads",
-    ".home_mrec_ad",
-    ".home_offer_adv",
-    ".home_sidebar_ads",
-    ".home_strip_ad",
-    ".home_sway_adv",
-    ".home_top_ad_slider",
-    ".home_top_ad_slides",
-    ".home_top_right_ad",
-    ".home_top_right_ad_label",
-    ".homead",
-    ".homeadnews",
-    ".homeadwrapper",
-    ".homefront468Ad",
-    ".homepage--sponsor-content",
-    ".homepage-300-250-ad",
-    ".homepage-ad",
-    ".homepage-ad-block",
-    ".homepage-ad-block-padding",
-    ".homepage-ad-buzz-col",
-    ".homepage-ad-module",
-    ".homepage-advertisement",
-    ".homepage-banner-ad",
-    ".homepage-footer-ad",
-    ".homepage-footer-ads",
-    ".homepage-page__all-ad-container",
-    ".homepage-page__ff-ad-container",
-    ".homepage-page__tag-ad-container",
-    ".homepage-page__video-ad-container",
-    ".homepage-right-rail-ad",
-    ".homepage-square-ad",
-    ".homepage300ad",
-    ".homepageAd",
-    ".homepageFlexAdOuter",
-    ".homepageMPU",
-    ".homepage_ad_half",
-    ".homepage_ads",
-    ".homepage_ads_topspot",
-    ".homepage_block_ad",
-    ".homesmallad",
-    ".hor-ad",
-    ".hor_ad",
-    ".hori-play-page-adver",
-    ".horiAd",
-    ".horiz_adspace",
-    ".horizontal-ad",
-    ".horizontal-ad-container",
-    ".horizontal-ad-holder",
-    ".horizontal-ad-wrapper",
-    ".horizontal-ad2",
-    ".horizontal-ads",
-    ".horizontal-advert-container",
-    ".horizontal-advert-inner-wrapper",
-    ".horizontal-full-ad",
-    ".horizontal.ad",
-    ".horizontalAd",
-    ".horizontalAdText",
-    ".horizontalAdvert",
-    ".horizontal_Fullad",
-    ".horizontal_ad",
-    ".horizontal_adblock",
-    ".horizontal_ads",
-    ".horizontaltextadbox",
-    ".horizsponsoredlinks",
-    ".hortad",
-    ".hotad_bottom",
-    ".hotel-ad",
-    ".house-ad",
-    ".house-ad-small",
-    ".house-ad-unit",
-    ".house-ads",
-    ".houseAd",
-    ".houseAd1",
-    ".houseAdsStyle",
-    ".housead",
-    ".hover_ads",
-    ".hoverad",
-    ".hp-ad-container",
-    ".hp-ad-grp",
-    ".hp-adsection",
-    ".hp-col4-ads",
-    ".hp-sectionad",
-    ".hpRightAdvt",
-    ".hp_320-250-ad",
-    ".hp_ad_300",
-    ".hp_ad_box",
-    ".hp_ad_cont",
-    ".hp_ad_text",
-    ".hp_adv300x250",
-    ".hp_advP1",
-    ".hp_horizontal_ad",
-    ".hp_t_ad",
-    ".hp_textlink_ad",
-    ".hp_w_ad",
-    ".hr-ads",
-    ".hr_ad",
-    ".hss-ad",
-    ".htl-ad",
-    ".htl-ad-placeholder",
-    ".html-advertisement",
-    ".html5-ad-progress-list",
-    ".hw-ad--frTop",
-    ".hyad",
-    ".i-amphtml-element.live-updates.render-embed",
-    ".i-amphtml-unresolved",
-    ".iAdserver",
-    ".iab300x250",
-    ".iab728x90",
-    ".ib-adv",
-    ".ico-adv",
-    ".icon-advertise",
-    ".iconAdChoices",
-    ".icon_ad_choices",
-    ".iconads",
-    ".idgGoogleAdTag",
-    ".ie-adtext",
-    ".iframe-ad",
-    ".iframe-ads",
-    ".iframeAd",
-    ".iframeAds",
-    ".im_adv",
-    ".ima-ad-container",
-    ".image-advertisement",
-    ".image-viewer-ad",
-    ".image-viewer-mpu",
-    ".imageAd",
-    ".imageAds",
-    ".imagead",
-    ".imageads",
-    ".img-advert",
-    ".img_ad",
-    ".img_ads",
-    ".imgad",
-    ".imgur-ad",
-    ".imuBox",
-    ".in-ad",
-    ".in-article-ad",
-    ".in-article-ad-placeholder",
-    ".in-article-ad-wrapper",
-    ".in-article-adx",
-    ".in-article-mpu",
-    ".in-between-ad",
-    ".in-body-ad-row",
-    ".in-body-banner-ad",
-    ".in-content-ad",
-    ".in-content-ad--container",
-    ".in-content-ad-container",
-    ".in-content-ad-wrapper",
-    ".in-page-ad",
-    ".in-post-banner-ad",
-    ".in-slider-ad",
-    ".in-story-ads",
-    ".in-text-ad",
-    ".in-text__advertising",
-    ".inPageAd",
-    ".in_ad",
-    ".in_article_ad",
-    ".in_article_ad_wrapper",
-    ".in_content_ad_container",
-    ".in_content_advert",
-    ".inarticlead",
-    ".inc-ad",
-    ".incontent-ad1",
-    ".incontentAd",
-    ".incontent_ads",
-    ".index-adv",
-    ".index-content-ad-wrapper",
-    ".index-content-ad-wrapper-top",
-    ".index_728_ad",
-    ".index_ad",
-    ".index_ad_a2",
-    ".index_ad_a4",
-    ".index_ad_a5",
-    ".index_ad_a6",
-    ".index_ad_column2",
-    ".index_right_ad",
-    ".indexad",
-    ".infinity-ad",
-    ".info-ads",
-    ".ingridAd",
-    ".inhouseAdUnit",
-    ".inhousead",
-    ".injected-ad",
-    ".injectedAd",
-    ".inline-ad",
-    ".inline-ad-card",
-    ".inline-ad-container",
-    ".inline-ad-desktop",
-    ".inline-ad-placeholder",
-    ".inline-ad-text",
-    ".inline-ad-wrap",
-    ".inline-ad-wrapper",
-    ".inline-adblock",
-    ".inline-advert",
-    ".inline-banner-ad",
-    ".inline-display-ad",
-    ".inline-google-ad-slot",
-    ".inline-mpu",
-    ".inline-mpu-left",
-    ".inline-panorama-ad",
-    ".inline-story-add",
-    ".inlineAd",
-    ".inlineAdContainer",
-    ".inlineAdImage",
-    ".inlineAdInner",
-    ".inlineAdNotice",
-    ".inlineAdText",
-    ".inlineAdTour",
-    ".inlineAd_content",
-    ".inlineAdvert",
-    ".inlineAdvertisement",
-    ".inlinePageAds",
-    ".inlineSideAd",
-    ".inline_ad",
-    ".inline_ad_container",
-    ".inline_ad_title",
-    ".inline_ads",
-    ".inlinead",
-    ".inlinead-tagtop",
-    ".inlinead_lazyload",
-    ".inlineadsense",
-    ".inlineadtitle",
-    ".inlist-ad",
-    ".inlistAd",
-    ".inner-ad",
-    ".inner-ad-disclaimer",
-    ".inner-ad-section",
-    ".inner-adv",
-    ".inner-advert",
-    ".inner-post-ad",
-    ".innerAd300",
-    ".innerAdWrapper",
-    ".innerAds",
-    ".innerContentAd",
-    ".innerWidecontentAd",
-    ".inner_ad",
-    ".inner_ad_advertise",
-    ".inner_adv",
-    ".inner_big_ad",
-    ".innerad",
-    ".inpostad",
-    ".inr_top_ads",
-    ".ins_adwrap",
-    ".insert-post-ads",
-    ".insert_ad",
-    ".insert_ad_column",
-    ".insert_advertisement",
-    ".insertad",
-    ".inside-post-ad",
-    ".insideStoryAd",
-    ".inside_ad",
-    ".inside_ad_box",
-    ".insideads",
-    ".inslide-ad",
-    ".insticator-ads",
-    ".instoryAdBlock",
-    ".instoryAdNoBlock",
-    ".instream_ad",
-    ".insurance-ad",
-    ".intAdRow",
-    ".intad",
-    ".interAd",
-    ".internal-ad",
-    ".internalAd",
-    ".internal_ad",
-    ".interstitial-ad",
-    ".intext-ads",
-    ".intra-article-ad",
-    ".intro-ad",
-    ".ion-ad",
-    ".ione-widget-dart-ad",
-    ".ipc-advert",
-    ".ipc-advert-class",
-    ".ipsAd",
-    ".ipsAdvertisement",
-    ".iqadlinebottom",
-    ".iqadmarker",
-    ".iqadtile_wrapper",
-    ".is-ad",
-    ".is-carbon-ad",
-    ".is-desktop-ads",
-    ".is-mpu",
-    ".is-preload-ad",
-    ".is-script-ad",
-    ".is-sponsored",
-    ".is-sticky-ad",
-    ".isAd",
-    ".isAdPage",
-    ".isad_box",
-    ".ise-ad",
-    ".island-ad",
-    ".islandAd",
-    ".islandAdvert",
-    ".island_ad",
-    ".island_ad_right_top",
-    ".islandad",
-    ".isocket_ad_row",
-    ".item--ad",
-    ".item-ad",
-    ".item-ad-leaderboard",
-    ".item-ads",
-    ".item-advertising",
-    ".item-container-ad",
-    ".item-housead",
-    ".item-housead-last",
-    ".item-inline-ad",
-    ".itemAdvertise",
-    ".item_ads",
-    ".itinerary-index-advertising",
-    ".its_all_for_ads",
-    ".its_for_ads",
-    ".itsanad",
-    ".j-ad",
-    ".jLinkSponsored",
-    ".jannah_ad",
-    ".jg-ad-5",
-    ".jg-ad-970",
-    ".jl-ads-leaderboard",
-    ".jobbioapp",
-    ".jobs-ad-box",
-    ".jobs-ad-marker",
-    ".joead728",
-    ".jquery-adi",
-    ".jquery-script-ads",
-    ".js-ad",
-    ".js-ad-banner-container",
-    ".js-ad-buttons",
-    ".js-ad-container",
-    ".js-ad-dynamic",
-    ".js-ad-frame",
-    ".js-ad-home",
-    ".js-ad-hover",
-    ".js-ad-loader-bottom",
-    ".js-ad-slot",
-    ".js-ad-static",
-    ".js-ad-unit",
-    ".js-ad-unit-bottom",
-    ".js-ad-wrapper",
-    ".js-adExternalPage",
-    ".js-ad_iframe",
-    ".js-ad_iframe_wrap",
-    ".js-adfliction-iframe",
-    ".js-adfliction-standard",
-    ".js-ads",
-    ".js-ads-carousel",
-    ".js-ads-header-content",
-    ".js-adv-rotator-image",
-    ".js-advert",
-    ".js-advert--responsive",
-    ".js-advert--vc",
-    ".js-advert-container",
-    ".js-advert-upsell-popup",
-    ".js-advertising__placeholder1",
-    ".js-adzone",
-    ".js-anchor-ad",
-    ".js-article-advert-injected",
-    ".js-billboard-advert",
-    ".js-cardview_ad-320x180",
-    ".js-cardview_ad-320x50",
-    ".js-dfp-ad",
-    ".js-dfp-ad-bottom",
-    ".js-dfp-ad-top",
-    ".js-googleAdSuperHeader-wrapper",
-    ".js-gpt-ad",
-    ".js-gptAd",
-    ".js-header-ad",
-    ".js-header-ad-wrapper",
-    ".js-lazy-ad",
-    ".js-mapped-ad",
-    ".js-mpu",
-    ".js-native-ad",
-    ".js-no-sticky-ad",
-    ".js-overlay_ad",
-    ".js-product-ad-slider",
-    ".js-react-simple-ad",
-    ".js-results-ads",
-    ".js-right-ad-block",
-    ".js-sidebar-ads",
-    ".js-site-header-advert",
-    ".js-skyscraper-ad",
-    ".js-slide-right-ad",
-    ".js-slide-top-ad",
-    ".js-slim-nav-ad",
-    ".js-sticky-ad",
-    ".js-sticky-advert-details-mpu",
-    ".js-stream-ad",
-    ".js-stream-featured-ad",
-    ".js-toggle-ad",
-    ".js-underplayerAd",
-    ".jsAdSlot",
-    ".jsMPUSponsor",
-    ".jsOneAd",
-    ".js_ad-sticky-footer",
-    ".js_adContainer",
-    ".js_ad_wrapper",
-    ".js_contained-ad-container",
-    ".js_deferred-ad",
-    ".js_desktop-horizontal-ad",
-    ".js_midbanner_ad_slot",
-    ".js_movable_ad_slot",
-    ".js_preheader-ad-container",
-    ".js_slideshow-full-width-ad",
-    ".js_slideshow-sidebar-ad",
-    ".js_sticky-top-ad",
-    ".jsx-adcontainer",
-    ".juicyads_300x250",
-    ".jumboAd",
-    ".jw-ad",
-    ".jw-ad-block",
-    ".jw-ad-label",
-    ".jw-ad-media-container",
-    ".jw-ad-visible",
-    ".kakao_ad_area",
-    ".keen_ad",
-    ".klicked-ads",
-    ".kumpulads-post",
-    ".kumpulads-side",
-    ".l-ad",
-    ".l-ad-top",
-    ".l-ads",
-    ".l-adsense",
-    ".l-article__ad",
-    ".l-bottom-ads",
-    ".l-grid--ad-card",
-    ".l-header-advertising",
-    ".l-section--ad",
-    ".l1-ads-wrapper",
-    ".l_ad_sub",
-    ".label-ad",
-    ".label_advertising_text",
-    ".labelads",
-    ".labeled_ad",
-    ".landing-page-ads",
-    ".landingAdRail",
-    ".landing_adbanner",
-    ".large-ad-center",
-    ".large-advert",
-    ".large-btn-ad",
-    ".large-right-ad",
-    ".largeAd",
-    ".largeRectangleAd",
-    ".largeUnitAd",
-    ".large_ad",
-    ".large_add_container",
-    ".largesideadpane",
-    ".last-left-ad",
-    ".last-right-ad",
-    ".last-sidebar-ad",
-    ".lastAdHolder",
-    ".lastAdvertorial",
-    ".lastLiAdv",
-    ".lastRowAd",
-    ".lastads",
-    ".lastpost_advert",
-    ".lates-adlabel",
-    ".latest-ad",
-    ".latest-articles-ad",
-    ".latest-news__ad--desktop",
-    ".latestStoriesAd",
-    ".law_center_ad",
-    ".layer-ad-bottom",
-    ".layer-ad-top",
-    ".layer-xad",
-    ".layer_text_ad",
-    ".layeradinfo",
-    ".layout-ad",
-    ".layout__content-ad",
-    ".layout__top-ad",
-    ".layout_h-ad",
-    ".lazy-ad",
-    ".lazy-ad-unit",
-    ".lazy-adv",
-    ".lazyad",
-    ".lazyadsense",
-    ".lazyadslot",
-    ".lazyload-ad",
-    ".lazyload_ad",
-    ".lazyload_ad_article",
-    ".lb-ad",
-    ".lb-adhesion-unit",
-    ".lb-advert-container",
-    ".lb-item-ad",
-    ".lbc-ad",
-    ".lblAdvert",
-    ".ld-ad",
-    ".ld-ad-inner",
-    ".lead-ad",
-    ".lead-ads",
-    ".lead-advert",
-    ".leader-ad",
-    ".leader-ad-728",
-    ".leaderAd",
-    ".leaderAdTop",
-    ".leaderAdvert",
-    ".leaderBoardAdWrapper",
-    ".leaderBoardAdvert",
-    ".leader_ad",
-    ".leader_aol",
-    ".leaderad",
-    ".leaderboard-ad",
-    ".leaderboard-ad-belt",
-    ".leaderboard-ad-component",
-    ".leaderboard-ad-container",
-    ".leaderboard-ad-dummy",
-    ".leaderboard-ad-fixed",
-    ".leaderboard-ad-grid",
-    ".leaderboard-ad-main",
-    ".leaderboard-ad-module",
-    ".leaderboard-ad-pane",
-    ".leaderboard-ad-placeholder",
-    ".leaderboard-ad-section",
-    ".leaderboard-ad-unit",
-    ".leaderboard-ad-wrapper",
-    ".leaderboard-adblock",
-    ".leaderboard-ads",
-    ".leaderboard-ads-text",
-    ".leaderboard-advert",
-    ".leaderboard-advertisement",
-    ".leaderboard-main-ad",
-    ".leaderboard-top-ad",
-    ".leaderboard-top-ad-wrapper",
-    ".leaderboard.advert",
-    ".leaderboard1AdWrapper",
-    ".leaderboardAd",
-    ".leaderboardAdWrapper",
-    ".leaderboardFooter_ad",
-    ".leaderboardRectAdWrapper",
-    ".leaderboard_ad_container",
-    ".leaderboard_ad_unit",
-    ".leaderboard_ads",
-    ".leaderboard_adsense",
-    ".leaderboard_adv",
-    ".leaderboard_banner_ad",
-    ".leaderboardad",
-    ".leaderboardadmiddle",
-    ".leaderboardadtop",
-    ".leaderboardadwrap",
-    ".lee-track-ilad",
-    ".left-ad",
-    ".left-ads",
-    ".left-advert",
-    ".left-rail-ad",
-    ".left-sponser-ad",
-    ".leftAd",
-    ".leftAdColumn",
-    ".leftAdContainer",
-    ".leftAds",
-    ".leftAdsEnabled",
-    ".leftAdsFix",
-    ".leftAdvDiv",
-    ".leftAdvert",
-    ".leftCol_advert",
-    ".leftColumnAd",
-    ".leftPaneAd",
-    ".left_300_ad",
-    ".left_ad",
-    ".left_ad_160",
-    ".left_ad_areas",
-    ".left_ad_box",
-    ".left_ad_container",
-    ".left_add_block",
-    ".left_adlink",
-    ".left_ads",
-    ".left_adsense",
-    ".left_advertisement_block",
-    ".left_col_ad",
-    ".left_google_add",
-    ".left_sidebar_wide_ad",
-    ".leftad",
-    ".leftadd",
-    ".leftadtag",
-    ".leftbar_ad2",
-    ".leftbarads",
-    ".leftbottomads",
-    ".leftnavad",
-    ".leftrighttopad",
-    ".leftsidebar_ad",
-    ".lefttopad1",
-    ".legacy-ads",
-    ".lft_advt_container",
-    ".lg-ads-160x90",
-    ".lg-ads-311x500",
-    ".lg-ads-635x100",
-    ".lg-ads-skin-container",
-    ".lg-infeed-wrapper",
-    ".liberty-ad-renderer-iframe",
-    ".liboxads",
-    ".ligatus",
-    ".lightad",
-    ".lijit-ad",
-    ".linead",
-    ".linkAD",
-    ".linkAds",
-    ".link_ad",
-    ".link_adslider",
-    ".link_advertise",
-    ".linkads",
-    ".list-ad",
-    ".list-adbox",
-    ".list-ads",
-    ".list-feature-ad",
-    ".list-footer-ad",
-    ".listad",
-    ".listicle-instream-ad-holder",
-    ".listing-card-ad",
-    ".listing-item-ad",
-    ".listingAd",
-    ".listings_ad",
-    ".lite-page-ad",
-    ".literatumAd",
-    ".live-ad",
-    ".ljad",
-    ".ln-home-feed-ad",
-    ".ln-sidebar-ads",
-    ".lnad",
-    ".lng-ad",
-    ".loadadlater",
-    ".local-ads",
-    ".local-ads-out-container",
-    ".localad",
-    ".location-ad",
-    ".log_ads",
-    ".logged_out_ad",
-    ".logo-ad",
-    ".logoAds",
-    ".logo_AdChoices",
-    ".logoad",
-    ".logoutAd",
-    ".logoutAdContainer",
-    ".long-ads",
-    ".longAd",
-    ".longAdBox",
-    ".longAds",
-    ".long_ad",
-    ".longform-ad",
-    ".loop-ad",
-    ".lower-ad",
-    ".lower-ads",
-    ".lowerAd",
-    ".lowerAds",
-    ".lower_ad",
-    ".lqm-ads",
-    ".lqm_ad",
-    ".lr-ad",
-    ".lr-pack-ad",
-    ".lr_skyad",
-    ".lrec-container",
-    ".lst_ads",
-    ".luxeAd",
-    ".lv-Adunit",
-    ".lyrics-inner-ad-wrap",
-    ".m-ContentAd",
-    ".m-ad",
-    ".m-ad-brick",
-    ".m-ad-region",
-    ".m-ad-unit",
-    ".m-ad__wrapper",
-    ".m-advert",
-    ".m-advertisement",
-    ".m-advertisement--container",
-    ".m-balloon-header--ad",
-    ".m-block-ad",
-    ".m-content-advert",
-    ".m-content-advert-wrap",
-    ".m-dfp-ad-text",
-    ".m-header-ad",
-    ".m-in-content-ad",
-    ".m-in-content-ad-row",
-    ".m-jac-ad",
-    ".m-sponsored",
-    ".m1-header-ad",
-    ".m2n-ads-slot",
-    ".m_ad",
-    ".m_ad1",
-    ".m_ad300",
-    ".m_banner_ads",
-    ".macAd",
-    ".macad",
-    ".mad_adcontainer",
-    ".madison_ad",
-    ".magAd",
-    ".magad",
-    ".mailAdElem",
-    ".main-ad",
-    ".main-ad-728x90-container",
-    ".main-ad-bg",
-    ".main-ad-container",
-    ".main-ad-gallery",
-    ".main-add-sec",
-    ".main-ads",
-    ".main-ads-line-2",
-    ".main-advert",
-    ".main-advertising",
-    ".main-column-ad",
-    ".main-footer-ad",
-    ".main-header-ad",
-    ".main-header__ad-wrapper",
-    ".main-right-ads",
-    ".mainAd",
-    ".mainAdContainer",
-    ".mainAds",
-    ".mainEcoAd",
-    ".mainLeftAd",
-    ".mainLinkAd",
-    ".mainRightAd",
-    ".main__top-ad",
-    ".main_ad",
-    ".main_ad_bg",
-    ".main_ad_bg_div",
-    ".main_adbox",
-    ".main_ads",
-    ".main_adv",
-    ".main_advert_section",
-    ".main_intro_ad",
-    ".main_right_ad",
-    ".main_wrapper_upper_ad_area",
-    ".mainadWrapper",
-    ".makeFooterAdSticky",
-    ".mal-ad-unit",
-    ".mal-koukoku-unit",
-    ".mango_ads",
-    ".mantis-ad",
-    ".mantisadd",
-    ".manual-ad",
-    ".map-ad",
-    ".mapAdvertising",
-    ".map_google_ad",
-    ".map_media_banner_ad",
-    ".mapped-ad",
-    ".mar-block-ad",
-    ".margin-advertisement",
-    ".margin0-ads",
-    ".marginadsthin",
-    ".marginalContentAdvertAddition",
-    ".market-ad",
-    ".market-ad-small",
-    ".marketing-ad",
-    ".marketplace-ad",
-    ".marketplaceAd",
-    ".markplace-ads",
-    ".marquee-ad",
-    ".masonry-tile-ad",
-    ".masonry__ad",
-    ".master_post_advert",
-    ".masthead-ad",
-    ".masthead-ad-control",
-    ".masthead-ads",
-    ".mastheadAds",
-    ".masthead__ad",
-    ".masthead_ad_banner",
-    ".masthead_ads_new",
-    ".masthead_topad",
-    ".match-ad",
-    ".mb-advert",
-    ".mb-advert__incontent",
-    ".mb-advert__leaderboard--large",
-    ".mb-advert__mpu",
-    ".mb-advert__tweeny",
-    ".mb-block--advert-side",
-    ".mb-list-ad",
-    ".mc_floating_ad",
-    ".mc_text_ads_box",
-    ".md-advertisement",
-    ".mdl-ad",
-    ".medRect",
-    ".med_ad_box",
-    ".media--ad",
-    ".media-ad-rect",
-    ".media-advert",
-    ".media-network-ad",
-    ".media-viewer__ads-container",
-    ".mediaAd",
-    ".mediaAdContainer",
-    ".media_impact_ads_ad_superbanner",
-    ".medium-rectangle-ad",
-    ".medium-top-ad",
-    ".mediumRectAdWrapper",
-    ".mediumRectagleAd",
-    ".mediumRectangleAd",
-    ".mediumRectangleAdvert",
-    ".medium_ad",
-    ".mediumad",
-    ".medrec-ad",
-    ".medrect-ad",
-    ".medrect-ad2",
-    ".medrectAd",
-    ".medrect_ad",
-    ".mega-ad",
-    ".member-ads",
-    ".menu-ad",
-    ".menuAd",
-    ".menuAds-cage",
-    ".menuItemBannerAd",
-    ".menuad",
-    ".menueadimg",
-    ".messageBoardAd",
-    ".message_ads",
-    ".meta-ad",
-    ".meta_ad",
-    ".metabet-adtile",
-    ".metaboxType-sponsor",
-    ".mf-adsense-leaderboard",
-    ".mf-adsense-rightrail",
-    ".mg_box_ads",
-    ".mgid-wrapper",
-    ".mgid_3x2",
-    ".mh-advert",
-    ".micro_ad",
-    ".mid-ad-wrapper",
-    ".mid-ads",
-    ".mid-advert",
-    ".mid-article-banner-ad",
-    ".mid-page-2-advert",
-    ".mid-post-ad",
-    ".mid-section-ad",
-    ".midAd",
-    ".midAdv-cont",
-    ".midAdv-cont2",
-    ".midAdvert",
-    ".mid_4_ads",
-    ".mid_ad",
-    ".mid_article_ad_label",
-    ".mid_banner_ad",
-    ".mid_page_ad",
-    ".mid_page_ad_big",
-    ".mid_right_ads",
-    ".mid_right_inner_id_ad",
-    ".midad",
-    ".midarticlead",
-    ".middle-ad",
-    ".middle-ads",
-    ".middle-ads728",
-    ".middle-footer-ad",
-    ".middleAd",
-    ".middleAdLeft",
-    ".middleAdMid",
-    ".middleAdRight",
-    ".middleAdWrapper",
-    ".middleAds",
-    ".middleBannerAd",
-    ".middle_AD",
-    ".middle_ad",
-    ".middle_ad_responsive",
-    ".middle_ads",
-    ".middlead",
-    ".middleadouter",
-    ".midpost-ad",
-    ".min-height-ad",
-    ".min_navi_ad",
-    ".mini-ad",
-    ".mini-ads",
-    ".miniHeaderAd",
-    ".mini_ads",
-    ".mini_ads_bottom",
-    ".mini_ads_right",
-    ".miniad",
-    ".miniads",
-    ".misc-ad",
-    ".misc-ad-label",
-    ".miscAd",
-    ".mj-floating-ad-wrapper",
-    ".mk_ads",
-    ".mks_ads_widget",
-    ".ml-advert",
-    ".mlaAd",
-    ".mm-ad-sponsored",
-    ".mm-banner970-ad",
-    ".mmads",
-    ".mmc-ad",
-    ".mmc-ad-wrap-2",
-    ".mmcAd_Iframe",
-    ".mmy-ads",
-    ".mnopolarisAd",
-    ".mntl-gpt-adunit",
-    ".mo-advert",
-    ".mo_googlead",
-    ".moads-top-banner",
-    ".moads-widget",
-    ".mob-ad-break-text",
-    ".mob-adspace",
-    ".mob-hero-banner-ad-wrap",
-    ".mob_ads",
-    ".mobads",
-    ".mobile-ad",
-    ".mobile-ad-container",
-    ".mobile-ad-nav",
-    ".mobile-ad-negative-space",
-    ".mobile-ad-placeholder",
-    ".mobile-ad-slider",
-    ".mobile-ads",
-    ".mobile-fixed-ad",
-    ".mobile-footer__ad",
-    ".mobile-instream-ad-holder",
-    ".mobile-instream-ad-holder-single",
-    ".mobile-leaderboard-fader",
-    ".mobile-nav-ad-plus-banner",
-    ".mobile-related-ad",
-    ".mobileAd",
-    ".mobileAdPos2And3",
-    ".mobileAdWrap",
-    ".mobileAppAd",
-    ".mobile_ad_banner",
-    ".mobile_ad_container",
-    ".mobile_article_ad2",
-    ".mobile_featuredad",
-    ".mobile_featuredad_article",
-    ".mobile_index_ad",
-    ".mobile_leaderboard_ad",
-    ".mobile_vertisement",
-    ".mobileadbig",
-    ".mobileadunit",
-    ".mobilesideadverts",
-    ".mobileweb_top_ad_container",
-    ".mod-ad",
-    ".mod-ad-1",
-    ".mod-ad-2",
-    ".mod-ad-300x250",
-    ".mod-ad-600",
-    ".mod-ad-lrec",
-    ".mod-ad-n",
-    ".mod-ad-risingstar",
-    ".mod-adblock",
-    ".mod-adcpc",
-    ".mod-adopenx",
-    ".mod-ads",
-    ".mod-amazon-btn",
-    ".mod-big-banner-ad",
-    ".mod-google-ads",
-    ".mod-horizontal-ad",
-    ".mod-sponsored-links",
-    ".mod-trbad",
-    ".mod-tss-ads-wrapper",
-    ".mod-vertical-ad",
-    ".mod_ad",
-    ".mod_ad_container",
-    ".mod_ad_imu",
-    ".mod_ad_t25",
-    ".mod_ad_text",
-    ".mod_ad_top",
-    ".mod_admodule",
-    ".mod_ads",
-    ".mod_advert",
-    ".mod_index_ad",
-    ".mod_js_ad",
-    ".mod_openads",
-    ".mod_r_ad",
-    ".mod_r_ad1",
-    ".modal-ad",
-    ".module--ad",
-    ".module-ad",
-    ".module-ad-small",
-    ".module-ads",
-    ".module-advert",
-    ".module-advertisement",
-    ".module-box-ads",
-    ".module-image-ad",
-    ".module-rectangleads",
-    ".module-sponsored-ads",
-    ".module1colAds",
-    ".moduleAd",
-    ".moduleAdSpot",
-    ".moduleAdvert",
-    ".moduleAdvertContent",
-    ".moduleBannerAd",
-    ".module__ad-wide",
-    ".module_ad",
-    ".module_ad_disclaimer",
-    ".module_box_ad",
-    ".module_header_sponsored",
-    ".module_home_ads",
-    ".module_single_ads",
-    ".modulegad",
-    ".moduletable-adsponsor",
-    ".moduletable-advert",
-    ".moduletable-bannerAd6",
-    ".moduletable-centerad",
-    ".moduletable-googleads",
-    ".moduletable-rectangleads",
-    ".moduletable_ad-right",
-    ".moduletable_ad300x250",
-    ".moduletable_adtop",
-    ".moduletable_advertisement",
-    ".moduletable_top_ad",
-    ".moduletableadvert",
-    ".moduletableexclusive-ads",
-    ".moduletablesquaread",
-    ".moduletabletowerad",
-    ".mom-ad",
-    ".momizat-ads",
-    ".moneyball-ad",
-    ".monitor-g-ad-300",
-    ".monitor-g-ad-468",
-    ".monsterad",
-    ".moreAdBlock",
-    ".mos-ad",
-    ".mosaicAd",
-    ".motherboard-ad",
-    ".movable-ad",
-    ".movv-ad",
-    ".mp-ad",
-    ".mpsponsor",
-    ".mpu-ad",
-    ".mpu-ad-con",
-    ".mpu-ad-river",
-    ".mpu-ad-top",
-    ".mpu-advert",
-    ".mpu-c",
-    ".mpu-container-blank",
-    ".mpu-footer",
-    ".mpu-fp",
-    ".mpu-holder",
-    ".mpu-leaderboard",
-    ".mpu-left",
-    ".mpu-left-bk",
-    ".mpu-mediatv",
-    ".mpu-right",
-    ".mpu-title",
-    ".mpu-top-left",
-    ".mpu-top-left-banner",
-    ".mpu-top-right",
-    ".mpu-unit",
-    ".mpu-wrap",
-    ".mpu-wrapper",
-    ".mpu01",
-    ".mpu250",
-    ".mpu600",
-    ".mpuAd",
-    ".mpuAdArea",
-    ".mpuAdSlot",
-    ".mpuAdvert",
-    ".mpuArea",
-    ".mpuBlock",
-    ".mpuBox",
-    ".mpuContainer",
-    ".mpuTextAd",
-    ".mpu_Ad",
-    ".mpu_ad",
-    ".mpu_advert",
-    ".mpu_container",
-    ".mpu_gold",
-    ".mpu_holder",
-    ".mpu_placeholder",
-    ".mpu_platinum",
-    ".mpu_side",
-    ".mpu_text_ad",
-    ".mpu_wrapper",
-    ".mpuad",
-    ".mpuads",
-    ".mr1_adwrap",
-    ".mr2_adwrap",
-    ".mr3_adwrap",
-    ".mr4_adwrap",
-    ".mrec-ads",
-    ".mrec-banners",
-    ".mrec-scrollable-cont",
-    ".mrecAds",
-    ".mrec_advert",
-    ".mrf-adv",
-    ".mrf-adv__wrapper",
-    ".mrf-directad",
-    ".ms-ad-superbanner",
-    ".ms-ads-link",
-    ".ms-slide-ads",
-    ".ms_header_ad",
-    ".msat-adspace",
-    ".msg-ad",
-    ".msgad",
-    ".msw-js-advert",
-    ".mt-ad-container",
-    ".mt-t-ad",
-    ".mt_ad",
-    ".mt_ads",
-    ".mtop_adfit",
-    ".mu-ad-container",
-    ".multiad2",
-    ".multiadwrapper",
-    ".multiple-ads-container",
-    ".mvAd",
-    ".mvAdHdr",
-    ".mv_atf_ad_holder",
-    ".mvp-ad-label",
-    ".mvp-feat1-list-ad",
-    ".mvp-flex-ad",
-    ".mvp-widget-ad",
-    ".mvp-widget-feat2-side-ad",
-    ".mvp_ad_widget",
-    ".mvp_block_type_ad_module",
-    ".mw-ad",
-    ".my-ads",
-    ".myAds",
-    ".myAdsGroup",
-    ".myTestAd",
-    ".my__container__ad",
-    ".myadmid",
-    ".myinarticlead",
-    ".narrow_ad_unit",
-    ".narrow_ads",
-    ".national_ad",
-    ".nationalad",
-    ".native-ad",
-    ".native-ad-article",
-    ".native-ad-container",
-    ".native-ad-item",
-    ".native-ad-link",
-    ".native-ad-mode",
-    ".native-ad-placeholder",
-    ".native-ad-promoted-provider",
-    ".native-ad-slot",
-    ".native-ad__first",
-    ".native-adv",
-    ".native-advts",
-    ".native-leaderboard-ad",
-    ".native-sidebar-ad",
-    ".native.ad",
-    ".nativeAd",
-    ".nativeAd-sponsor-position",
-    ".nativeMessageAd",
-    ".native_ad",
-    ".native_ad_inline",
-    ".native_ad_wrap",
-    ".native_ads",
-    ".nativead",
-    ".nativeadasideplaceholder",
-    ".nativeads-unt",
-    ".nativiadsense",
-    ".nature-ad",
-    ".nav-ad",
-    ".nav-ad-gpt-container",
-    ".nav-ad-plus-leader",
-    ".nav-adWrapper",
-    ".navAdsBanner",
-    ".navBads",
-    ".nav__adbanner",
-    ".nav_ad",
-    ".nav_textads",
-    ".navadbox",
-    ".navbar-ad-container",
-    ".navbar-ad-section",
-    ".navbar-ads",
-    ".navbar-header-ad",
-    ".navcommercial",
-    ".navi_ad300",
-    ".naviad",
-    ".nbc_Adv",
-    ".nc-exp-ad",
-    ".nchadcont",
-    ".nda-ad",
-    ".ndmadkit",
-    ".nemo-ad",
-    ".neo-advert",
-    ".nested-ad",
-    ".netPost_ad1",
-    ".netPost_ad3",
-    ".netads",
-    ".netshelter-ad",
-    ".network-ad-two",
-    ".new-ad-box",
-    ".new-ads-scroller",
-    ".newHeaderAd",
-    ".newPageAd",
-    ".newPex_forumads",
-    ".newTopAdContainer",
-    ".new_ad1",
-    ".new_ad_left",
-    ".new_ad_normal",
-    ".new_ad_wrapper_all",
-    ".new_ads_unit",
-    ".newad",
-    ".newad1",
-    ".newadsky-wrapper",
-    ".news-ad",
-    ".news-ad-block-a",
-    ".news-ad-square-a",
-    ".news-ad-square-box",
-    ".news-ads-top",
-    ".news-advert__column",
-    ".news-advertisement",
-    ".news-home-block-ad",
-    ".news-item--ad",
-    ".news-place-ad-info",
-    ".news_ad_box",
-    ".news_article_ad_google",
-    ".news_footer_ad_container",
-    ".news_imgad",
-    ".news_vibrant_ads_banner",
-    ".newsad",
-    ".newsblock-ads",
-    ".newsfeed_adunit",
-    ".newsletter_ad",
-    ".newspack_global_ad",
-    ".nexusad",
-    ".nf-adbox",
-    ".nfy-ad",
-    ".nfy-ad-teaser",
-    ".nfy-ad-tile",
-    ".nfy-ad-wrapper",
-    ".nfy-cobo-ad",
-    ".nfy-col-ad",
-    ".ng-ad-banner",
-    ".ng-ad-insert",
-    ".ngart__ad-col",
-    ".ngart__side-ad",
-    ".ngs-adv-async",
-    ".nm-ad",
-    ".nmAd_BB-wr",
-    ".nmAd_FB",
-    ".nn_mobile_mpu_wrapper",
-    ".node-ad",
-    ".node-content-ad",
-    ".node_ad_wrapper",
-    ".nomobilead",
-    ".non-empty-ad",
-    ".normalAds",
-    ".normal_ads",
-    ".normalad",
-    ".northad",
-    ".noskim.ad",
-    ".not-an-ad-header",
-    ".note-advertisement",
-    ".np-ad",
-    ".np-ad-background",
-    ".np-ad-border",
-    ".np-ads-wrapper",
-    ".np-adv-container",
-    ".np-advert_apu",
-    ".np-advert_apu-double",
-    ".np-advert_info",
-    ".np-header-ad",
-    ".np-header-ads-area",
-    ".np-right-ad",
-    ".npAdGoogle",
-    ".npSponsorTextAd",
-    ".nrAds",
-    ".nsAdRow",
-    ".nts-ad",
-    ".ntv-ad",
-    ".ntv-rail-ad",
-    ".nu2ad",
-    ".nuffnangad",
-    ".nui-ad-layout",
-    ".nuk-ad-placeholder",
-    ".nv-ads-wrapper",
-    ".nw-ad",
-    ".nw-ad-468x60",
-    ".nw-ad-label",
-    ".nw-c-leaderboard-ad",
-    ".nw-top-ad",
-    ".nx-billboard-ad",
-    ".nx-placeholder-ad",
-    ".nzs-ads",
-    ".o-ad",
-    ".o-ad-banner-top",
-    ".o-ad-container",
-    ".o-ads",
-    ".o-ads--center",
-    ".o-ads-content",
-    ".o-ads__outer",
-    ".o-advert",
-    ".o-listing__ad",
-    ".o-site-header__advert",
-    ".o-story-content__ad",
-    ".o-teaser--native-ad",
-    ".oad-ad",
-    ".oas-ad",
-    ".oas-bottom-ads",
-    ".oas-container",
-    ".oas-leaderboard-ads",
-    ".oasInAds",
-    ".oas_ad",
-    ".oas_add",
-    ".oas_advertisement",
-    ".oasad",
-    ".oasads",
-    ".ob_ads_header",
-    ".ob_container .item-container-obpd",
-    ".ob_dual_right > .ob_ads_header ~ .odb_div",
-    ".ob_nm_paid",
-    ".offads",
-    ".oi-add-block",
-    ".oi-header-ad",
-    ".oi_horz_ad_container",
-    ".oio-banner-zone",
-    ".oio-link-sidebar",
-    ".oio-openslots",
-    ".oio-zone-position",
-    ".oko-adhesion",
-    ".on-demand-ad",
-    ".on_player_ads",
-    ".oneColumnAd",
-    ".onet-ad",
-    ".onethirdadholder",
-    ".onf-ad",
-    ".online-ad",
-    ".opaAd",
-    ".opd_adsticky",
-    ".os-header-ad",
-    ".otd-ad-top",
-    ".outer-ad-container",
-    ".outer-ad-unit-wrapper",
-    ".outerAdWrapper",
-    ".outerAds",
-    ".outer_ad_container",
-    ".outside_ad",
-    ".outsider-ad",
-    ".ov-ad-slot",
-    ".overflow-ad",
-    ".overlay-ad",
-    ".overlay-ad-container",
-    ".overlay-ads",
-    ".overlay-box-ad",
-    ".overlay_ad",
-    ".ox-holder",
-    ".p-ad",
-    ".p-ad-block",
-    ".p-ad-dfp-banner",
-    ".p-ad-dfp-middle-rec",
-    ".p-ad-feature-pr",
-    ".p-ad-outbreak",
-    ".p-ad-rectangle",
-    ".p-ad-thumbnail-txt",
-    ".p-ads-billboard",
-    ".p-ads-rec",
-    ".p-post-ad",
-    ".p2_right_ad",
-    ".p75_sidebar_ads",
-    ".pAdsBlock2",
-    ".p_adv",
-    ".p_topad",
-    ".pa_ads_label",
-    ".package_adBox",
-    ".padAdvx",
-    ".padded-ad",
-    ".paddingBotAd",
-    ".pads2",
-    ".pads_bulk_widget",
-    ".padvertlabel",
-    ".page-ad",
-    ".page-ads",
-    ".page-advert",
-    ".page-advertisement",
-    ".page-bottom-fixed-ads",
-    ".page-box-ad",
-    ".page-break-ad",
-    ".page-content--ad-block",
-    ".page-content__advert",
-    ".page-footer-ad",
-    ".page-header-ad",
-    ".page-header_ad",
-    ".page-top-ads",
-    ".pageAd",
-    ".pageAdSkin",
-    ".pageAdSkinMobile",
-    ".pageAdSkinUrl",
-    ".pageAds",
-    ".pageFooterAd",
-    ".pageGoogleAd",
-    ".pageGoogleAds",
-    ".pageHeaderAd",
-    ".pageHeaderAds",
-    ".pageTopAd",
-    ".page__top-ad-wrapper",
-    ".page_ad",
-    ".pagead",
-    ".pageclwideadv",
-    ".pagefair-acceptable",
-    ".pagepusheradATF",
-    ".pages__ad",
-    ".pane-ad-pane",
-    ".pane-ads",
-    ".pane-sasia-ad",
-    ".pane-site-ads",
-    ".pane-sponsored-links",
-    ".pane_ad_wide",
-    ".panel-ad",
-    ".panel-ad-mr",
-    ".panel-adsense",
-    ".panel-advert",
-    ".panel-body-adsense",
-    ".panel.ad",
-    ".panel_ad",
-    ".paneladvert",
-    ".panoramic_ad_placeholder",
-    ".par-ad",
-    ".par-adv-slot",
-    ".parade-ad-container",
-    ".paragraphAdinsert",
-    ".parent-ad-desktop",
-    ".partial-ad",
-    ".partner-ad",
-    ".partner-ad-module-wrapper",
-    ".partner-ads-list",
-    ".partner-adsonar",
-    ".partnerAd",
-    ".partner_ads",
-    ".partnerad_container",
-    ".partnersTextLinks",
-    ".patronad",
-    ".pauseAdPlacement",
-    ".pb-ad",
-    ".pb-ad-curated",
-    ".pb-ads",
-    ".pb-f-ad-flex",
-    ".pb-f-ad-leaderboard",
-    ".pb-f-ads-ad",
-    ".pb-mod-ad-flex",
-    ".pb-slot-container",
-    ".pc-ad",
-    ".pcads_widget",
-    ".pd-ads-mpu",
-    ".pdpads_desktop",
-    ".penci-ad-box",
-    ".penci-ad-image",
-    ".penci-ad_box",
-    ".penci-adsense-below-slider",
-    ".penci-google-adsense",
-    ".penci-google-adsense-1",
-    ".penci-promo-link",
-    ".penci_list_bannner_widget",
-    ".pencil-ad",
-    ".pencil-ad-container",
-    ".pencil-ad-section",
-    ".pencil_ad",
-    ".perm_ad",
-    ".pf_content_ad",
-    ".pf_sky_ad",
-    ".pf_top_ad",
-    ".pfimgAds",
-    ".pg-ad-block",
-    ".pg-adnotice",
-    ".pg-adtarget",
-    ".pgevoke-fp-bodyad2",
-    ".pgevoke-story-rightrail-ad1",
-    ".pgevoke-story-topads",
-    ".pgevoke-topads",
-    ".ph-ad",
-    ".ph-ad-desktop",
-    ".ph-ad-mediumrectangle",
-    ".photo-ad",
-    ".photo-ad-pad",
-    ".photoAd",
-    ".photoad",
-    ".photobox-adbox",
-    ".phpads_container",
-    ".pics_detail_ad",
-    ".pics_footer_ad",
-    ".picto_ad",
-    ".picture_ad",
-    ".pin-ad",
-    ".pix_adzone",
-    ".pj-ad",
-    ".pkad",
-    ".placeholder-ad",
-    ".placeholder-dfp",
-    ".placeholderAd",
-    ".plain-ad",
-    ".plainAd",
-    ".player-ad",
-    ".player-ad-overlay",
-    ".player-ads",
-    ".player-ads2",
-    ".player-section__ad-b",
-    ".player-under-ad",
-    ".playerAd",
-    ".playerAdv",
-    ".player__inline-ad",
-    ".player_ad",
-    ".player_ad2",
-    ".player_ad_box",
-    ".player_hide_ad",
-    ".player_hover_ad",
-    ".player_ima-ad-container",
-    ".playerad",
-    ".playerdads",
-    ".plistaList > .itemLinkPET",
-    '.plistaList > .plista_widget_underArticle_item[data-type="pet"]',
-    ".plista_inimg_box",
-    ".plugin-ad",
-    ".plugin-ad-container",
-    ".pm-ad",
-    ".pm-ad-unit",
-    ".pm-ad-zone",
-    ".pm-ads-banner",
-    ".pm-banner-ad",
-    ".pmc-adm-boomerang-pub-div",
-    ".pmg-sponsoredlinks",
-    ".polar-ad",
-    ".polaris-ad--wrapper-desktop",
-    ".polarisMarketing",
-    ".polaris__ad",
-    ".polaris__teads",
-    ".position-ads",
-    ".post--native-ad",
-    ".post-ad",
-    ".post-ad-title",
-    ".post-ad-top",
-    ".post-ad-type",
-    ".post-ads",
-    ".post-ads-top",
-    ".post-adsense-bottom",
-    ".post-advert",
-    ".post-advert-row",
-    ".post-advertisement",
-    ".post-load-ad",
-    ".post-news-ad",
-    ".post-sidebar-ad",
-    ".post-sponsored",
-    ".postAd",
-    ".postWideAd",
-    ".post__ad",
-    ".post__article-top-ad-wrapper",
-    ".post_ad",
-    ".post_ads",
-    ".post_advert",
-    ".post_detail_right_advert",
-    ".post_sponsored",
-    ".postad",
-    ".postads",
-    ".postads3",
-    ".postbit-ad",
-    ".postend-advert",
-    ".poster_ad",
-    ".postfooterad",
-    ".posts-ad",
-    ".pp-ad-container",
-    ".pp_ad_code_adtxt",
-    ".ppb_ads",
-    ".ppr_priv_footer_banner_ad_billboard",
-    ".ppr_priv_header_banner_ad",
-    ".ppr_priv_horizon_ad",
-    ".pr_adslot_0",
-    ".pr_adslot_1",
-    ".prebid-wrapper",
-    ".preheader_advert",
-    ".premium-ad",
-    ".premium-ads",
-    ".premium-adv",
-    ".premium-mpu-container",
-    ".premiumad",
-    ".priad",
-    ".priad-1",
-    ".primary-ad",
-    ".primary-ad-widget",
-    ".primary-advertisment",
-    ".primis-video",
-    ".primis-wrapper",
-    ".print-ad-wrapper",
-    ".print-adslot",
-    ".printAds",
-    ".product-ad",
-    ".product-ads",
-    ".product-ads-carousel",
-    ".product-bar-ads",
-    ".product-inlist-ad",
-    ".profile-ad-container",
-    ".profile-ads-container",
-    ".profile__ad-wrapper",
-    ".profile_ad_bottom",
-    ".profile_ad_top",
-    ".programtic-ads",
-    ".promo-ad",
-    ".promo-mpu",
-    ".promoAd",
-    ".promoAds",
-    ".promoAdvertising",
-    ".promo_ad",
-    ".promo_ads",
-    ".promo_border",
-    ".promoad",
-    ".promoboxAd",
-    ".promoted_content_ad",
-    ".promotionAdContainer",
-    ".promotionTextAd",
-    ".proof_ad",
-    ".propel-ad",
-    ".proper-ad-insert",
-    ".proper-ad-unit",
-    ".ps-ad",
-    ".ps-ligatus_placeholder",
-    ".pt-ad--container",
-    ".pt-ad--scroll",
-    ".pt_ad03",
-    ".pt_col_ad02",
-    ".pub_ads",
-    ".publication-ad",
-    ".publication-instream-ad-container",
-    ".publicidad_horizontal",
-    ".publicidade",
-    ".publicidade-vertical-layout",
-    ".publisher_ad",
-    ".puff-ad",
-    ".puff-advertorials",
-    ".pull-ad",
-    ".pull_top_ad",
-    ".pullad",
-    ".pulsir-ad",
-    ".puppyAd",
-    ".purchad",
-    ".push--ad",
-    ".push-ad",
-    ".push-adv",
-    ".pushDownAd",
-    ".pushdown-ad",
-    ".pushdownAd",
-    ".pw-in-article-ad-container",
-    ".pw-in-article-relevant-container",
-    ".pz-ad-box",
-    ".quads-ad-label",
-    ".quads-bg-ad",
-    ".quads-location",
-    ".queue_ad",
-    ".queued-ad",
-    ".quickadsense",
-    ".quicklinks-ad",
-    ".quigo",
-    ".quigo-ad",
-    ".quigoads",
-    ".r-ad",
-    ".r-pause-ad-container",
-    ".r7ad",
-    ".r_ad",
-    ".r_ads",
-    ".rail-ad",
-    ".rail-ads-1",
-    ".rail-article-sponsored",
-    ".rail__ad",
-    ".rail_ad",
-    ".railad",
-    ".railadspace",
-    ".ray-floating-ads-container",
-    ".rc-sponsored",
-    ".rcom-freestar-ads-widget",
-    ".re-AdTop1Container",
-    ".ready-ad",
-    ".rec_ad",
-    ".recent-ad",
-    ".recentAds",
-    ".recent_ad_holder",
-    ".recipeFeatureAd",
-    ".recommend-ad-one",
-    ".recommend-ad-two",
-    ".rect-ad",
-    ".rect-ad-1",
-    ".rectAd300",
-    ".rect_ad",
-    ".rect_ad_module",
-    ".rect_advert",
-    ".rectad",
-    ".rectadv",
-    ".rectangle-ad",
-    ".rectangle-ad-container",
-    ".rectangle-ad-slot-container",
-    ".rectangle-ad-slot-wrapper",
-    ".rectangle-embed-ad",
-    ".rectangle-widget-td-ad",
-    ".rectangleAd",
-    ".rectangleAdContainer",
-    ".rectangle_ad",
-    ".rectanglead",
-    ".rectangleads",
-    ".red-adv",
-    ".redads_cont",
-    ".reedwan_adds300x250_widget",
-    ".referrerDetailAd",
-    ".refreshAds",
-    ".refreshInarticleAd",
-    ".refreshable_ad",
-    ".region-ad-bottom-leaderboard",
-    ".region-ad-pan",
-    ".region-ad-right",
-    ".region-ad-top",
-    ".region-ads",
-    ".region-ads-content-top",
-    ".region-banner-ad",
-    ".region-dfp-ad-footer",
-    ".region-dfp-ad-header",
-    ".region-footer-ad-full",
-    ".region-header-ad",
-    ".region-header-ads",
-    ".region-middle-ad",
-    ".region-top-ad",
-    ".region-top-ad-block",
-    ".region-widget-ad-top-0",
-    ".regular-ads",
-    ".regular-advert-outer-wrapper",
-    ".regular_728_ad",
-    ".regularad",
-    ".rekl-left",
-    ".rekl-right",
-    ".rekl-top",
-    ".rekl_left",
-    ".rekl_right",
-    ".rekl_top",
-    ".rekl_top_wrapper",
-    ".reklam",
-    ".reklam-block",
-    ".reklam-kare",
-    ".reklam-masthead",
-    ".reklam2",
-    ".reklam728",
-    ".reklama",
-    ".reklama-c",
-    ".reklama-vert",
-    ".reklama1",
-    ".reklame-right-col",
-    ".reklame-wrapper",
-    ".reklamka",
-    ".rel_ad_box",
-    ".related-ad",
-    ".related-ads",
-    ".related-guide-adsense",
-    ".relatedAds",
-    ".relatedContentAd",
-    ".related_ad",
-    ".related_post_google_ad",
-    ".relatesearchad",
-    ".remads",
-    ".remnant_ad",
-    ".remove-ads",
-    ".remove-ads-link",
-    ".removeAdsLink",
-    ".reportAdLink",
-    ".res_ad",
-    ".resads-adspot",
-    ".reserved_box_ads",
-    ".reserved_box_ads_2",
-    ".residentialads",
-    ".resourceImagetAd",
-    ".respAds",
-    ".responsive-ad",
-    ".responsive-ad-header-container",
-    ".responsive-ad-wrapper",
-    ".responsive-ads",
-    ".responsive-vertial-ad-wrapper",
-    ".responsiveAdHiding",
-    ".responsiveAdsense",
-    ".responsive_ad_top",
-    ".responsive_ads_120x600",
-    ".responsive_ads_468x60",
-    ".result-ad",
-    ".result-sponsored",
-    ".result-top-ad",
-    ".result-words-ad-new",
-    ".resultAd",
-    ".result__advertising",
-    ".result_ad",
-    ".resultad",
-    ".results-ads",
-    ".rev_square_side_door",
-    ".revcontent-main-ad",
-    ".revcontent-slot",
-    ".revcontent-wrap",
-    ".review-ad",
-    ".review_ad1",
-    ".reviews-display-ad",
-    ".revive-ad",
-    ".rg-ad",
-    ".rgt-ad",
-    ".rgt_ad",
-    ".rh-ad",
-    ".rhads",
-    ".rhc-ad-bottom",
-    ".rhs-ad",
-    ".rhs-ads-panel",
-    ".rhs-advert-container",
-    ".rhs-advert-link",
-    ".rhs-advert-title",
-    ".rhs-mrec-wrapper",
-    ".rhs_ad",
-    ".rhs_ad_title",
-    ".rhs_ads",
-    ".rhsad",
-    ".rhsadvert",
-    ".right-ad",
-    ".right-ad-1",
-    ".right-ad-2",
-    ".right-ad-3",
-    ".right-ad-300x250",
-    ".right-ad-4",
-    ".right-ad-5",
-    ".right-ad-block",
-    ".right-ad-container",
-    ".right-ad-holder",
-    ".right-ad-tagline",
-    ".right-ad-wrapper",
-    ".right-ad2",
-    ".right-ad350px250px",
-    ".right-ads",
-    ".right-ads2",
-    ".right-adsense",
-    ".right-adv",
-    ".right-advert",
-    ".right-advertisement",
-    ".right-col-ad",
-    ".right-column-ad",
-    ".right-column-ads",
-    ".right-navAdBox",
-    ".right-rail-ad",
-    ".right-rail-ad-banner",
-    ".right-rail-ad-container",
-    ".right-rail-box-ad-container",
-    ".right-rail__ad",
-    ".right-side-ad",
-    ".right-side-ads",
-    ".right-sidebar-ads-container",
-    ".right-sidebar-box-ad",
-    ".right-sidebar-box-ads",
-    ".right-sponser-ad",
-    ".right-top-ad",
-    ".right-video-dvertisement",
-    ".rightAD",
-    ".rightAd",
-    ".rightAd1",
-    ".rightAd2",
-    ".rightAdBlock",
-    ".rightAdBox",
-    ".rightAdColumn",
-    ".rightAdContainer",
-    ".rightAds",
-    ".rightAdsFix",
-    ".rightAdvert",
-    ".rightAdverts",
-    ".rightBoxAd",
-    ".rightBoxMidAds",
-    ".rightColAd",
-    ".rightColAdBox",
-    ".rightColumnAd",
-    ".rightColumnAdd",
-    ".rightColumnAdsTop",
-    ".rightColumnRectAd",
-    ".rightHeaderAd",
-    ".rightRailAd",
-    ".rightRailMiddleAd",
-    ".rightSecAds",
-    ".rightSideBarAd",
-    ".rightSideSponsor",
-    ".rightTopAdWrapper",
-    ".right_ad",
-    ".right_ad_1",
-    ".right_ad_2",
-    ".right_ad_box",
-    ".right_ad_box1",
-    ".right_ad_innercont",
-    ".right_ad_text",
-    ".right_ad_top",
-    ".right_ad_unit",
-    ".right_ad_wrap",
-    ".right_adlist",
-    ".right_ads",
-    ".right_ads_column",
-    ".right_adsense_box_2",
-    ".right_adskin",
-    ".right_adv",
-    ".right_advert",
-    ".right_advertise_cnt",
-    ".right_advertisement",
-    ".right_block_advert",
-    ".right_box_ad",
-    ".right_col_ad",
-    ".right_column_ads",
-    ".right_content_ad",
-    ".right_image_ad",
-    ".right_long_ad",
-    ".right_outside_ads",
-    ".right_side_ads",
-    ".right_side_box_ad",
-    ".right_sponsor_main",
-    ".rightad",
-    ".rightad250",
-    ".rightad300",
-    ".rightad600",
-    ".rightadHeightBottom",
-    ".rightad_1",
-    ".rightad_2",
-    ".rightadbig",
-    ".rightadblock",
-    ".rightadbox1",
-    ".rightadd",
-    ".rightads",
-    ".rightadunit",
-    ".rightadv",
-    ".rightbox_content_ads",
-    ".rightboxads",
-    ".rightcol-adbox",
-    ".rightcol-block-ads",
-    ".rightcol_boxad",
-    ".rightcol_div_openx2",
-    ".rightcolads",
-    ".rightcoladvert",
-    ".rightcoltowerad",
-    ".rightnav_adsense",
-    ".rightpanelad",
-    ".rightrail-ad-atf",
-    ".rightrail-ad-block",
-    ".rightrail-ad-placed",
-    ".rightrail-display-ad",
-    ".rightrail_ads",
-    ".rightsideAd",
-    ".righttop-advt",
-    ".ringtone-ad",
-    ".river-item-sponsored",
-    ".river-standard-ad-container",
-    ".riverAdLoaded",
-    ".riverAdsLoaded",
-    ".riverSponsor",
-    ".rj-ads-wrap-sq",
-    ".rj-ads-wrapper",
-    ".rm-adslot",
-    ".rngtAd",
-    ".roadblocker-ad-content-wrap",
-    ".rockmeltAdWrapper",
-    ".rolloverad",
-    ".roof-ad",
-    ".root-ad-anchor",
-    ".rot_ads",
-    ".rotatead-container",
-    ".rotating-ad",
-    ".rotating-ads",
-    ".rotatingAdvertisement",
-    ".rotatingBannerWidget",
-    ".rotatingadsection",
-    ".rotator_ad_overlay",
-    ".round_box_advert",
-    ".roundedCornersAd",
-    ".row--gh-ad",
-    ".row-ad",
-    ".row-ad-leaderboard",
-    ".rowAd",
-    ".rowAds",
-    ".row_header_ads",
-    ".rowad",
-    ".rowgoogleads",
-    ".rpd_ads",
-    ".rr-300x250-ad",
-    ".rr-300x600-ad",
-    ".rr-ad",
-    ".rr_ads",
-    ".rr_skyad",
-    ".rs-ad",
-    ".rs-advert",
-    ".rs-advert__container",
-    ".rs_ad_block",
-    ".rs_ad_top",
-    ".rside_adbox",
-    ".rt_ad",
-    ".rt_ad_call",
-    ".rtmad",
-    ".rw-advert",
-    ".rwSideAd",
-    ".rw_ad",
-    ".s-ad",
-    ".s-ads",
-    ".s-ads-metrics",
-    ".s-body-ad",
-    ".s-hidden-sponsored-item",
-    ".s_ads",
-    ".s_ads_label",
-    ".s_sponsored_ads",
-    ".sa-mainad",
-    ".sabavision-ads",
-    ".sad_posterad",
-    ".sadvert",
-    ".sagreklam",
-    ".sal-adv-gpt",
-    ".sam_ad",
-    ".sb-ad",
-    ".sb-ad-margin",
-    ".sb-ads",
-    ".sb-top-sec-ad",
-    ".sbAd",
-    ".sbAdUnitContainer",
-    ".sbTopadWrapper",
-    ".sb_ad",
-    ".sb_ad_holder",
-    ".sc-ad",
-    ".scad",
-    ".scanAd",
-    ".scb-ad",
-    ".scoopads",
-    ".script-ad",
-    ".scroll-ad-item-container",
-    ".scroll-ads",
-    ".scrolling-ads",
-    ".sda_adbox",
-    ".sdc-advert__top-1",
-    ".se-ligatus",
-    ".search-ad",
-    ".search-advertisement",
-    ".search-result-list-item--sidebar-ad",
-    ".search-result-list-item--topad",
-    ".search-result-sponsored",
-    ".search-results-ad",
-    ".search-results-banner-ad",
-    ".search-sponsor",
-    ".search-sponsored",
-    ".searchAd",
-    ".searchAdTop",
-    ".searchAds",
-    ".searchad",
-    ".searchads",
-    ".secondary-ad-widget",
-    ".secondary-advertisment",
-    ".secondaryAdModule",
-    ".secondary_ad",
-    ".section-ad",
-    ".section-ad-related",
-    ".section-ad-unit",
-    ".section-ad-wrapper",
-    ".section-ad2",
-    ".section-ads",
-    ".section-adtag",
-    ".section-adv",
-    ".section-advert-banner",
-    ".section-advertisement",
-    ".section-sponsor",
-    ".section_ad",
-    ".section_ad_left",
-    ".section_adarea",
-    ".section_ads",
-    ".selfServeAds",
-    ".sense-adhesion",
-    ".seoAdWrapper",
-    ".seoTopAds",
-    ".sepContentAd",
-    ".series-ad",
-    ".servedAdlabel",
-    ".serversidenativead",
-    ".serviceAd",
-    ".set_ad",
-    ".sexunder_ads",
-    ".sf-advert",
-    ".sf_ad_box",
-    ".sg-adblock",
-    ".sgAd",
-    ".sh-ad-box",
-    ".sh-ad-section",
-    ".sh-section-ad",
-    ".shadvertisment",
-    ".sheknows-infuse-ad",
-    ".shift-ad",
-    ".shortads",
-    ".shortadvertisement",
-    ".show-desk-ad",
-    ".show-sticky-ad",
-    ".showAd",
-    ".showAdContainer",
-    ".showads",
-    ".showcaseAd",
-    ".showcasead",
-    ".sics-component__sticky-ad-placeholder",
-    ".sidbaread",
-    ".side-ad",
-    ".side-ad-300",
-    ".side-ad-big",
-    ".side-ad-blocks",
-    ".side-ad-container",
-    ".side-ad-inner",
-    ".side-ad-top",
-    ".side-ads",
-    ".side-ads-block",
-    ".side-ads-container",
-    ".side-ads-wide",
-    ".side-ads300",
-    ".side-ads_sticky-group",
-    ".side-adv-block",
-    ".side-adv-text",
-    ".side-advert",
-    ".side-advertising",
-    ".side-adverts",
-    ".side-bar-ad",
-    ".side-panel_v-ad-container",
-    ".sideAd",
-    ".sideAdLeft",
-    ".sideAdTall",
-    ".sideAdWide",
-    ".sideAdv",
-    ".sideAdv-wrapper",
-    ".sideBarAd",
-    ".sideBarCubeAd",
-    ".sideBlockAd",
-    ".sideBoxAd",
-    ".sideBoxM1ad",
-    ".sideBoxMiddleAd",
-    ".side__ad",
-    ".side__ad-box",
-    ".side_ad",
-    ".side_ad2",
-    ".side_ad300",
-    ".side_ad_1",
-    ".side_ad_2",
-    ".side_ad_3",
-    ".side_ad_box_mid",
-    ".side_ad_box_top",
-    ".side_ad_top",
-    ".side_add_wrap",
-    ".side_ads",
-    ".side_adsense",
-    ".side_adv",
-    ".side_col_ad_wrap",
-    ".side_float_ad",
-    ".sidead",
-    ".sidead_150",
-    ".sidead_300",
-    ".sideadmid",
-    ".sideads",
-    ".sideads_l",
-    ".sideadsbox",
-    ".sideadtable",
-    ".sideadvert",
-    ".sideadverts",
-    ".sidebar--mps_ad",
-    ".sidebar-320__box_adv",
-    ".sidebar-350ad",
-    ".sidebar-ad",
-    ".sidebar-ad-300",
-    ".sidebar-ad-300x250-cont",
-    ".sidebar-ad-a",
-    ".sidebar-ad-area",
-    ".sidebar-ad-b",
-    ".sidebar-ad-box",
-    ".sidebar-ad-c",
-    ".sidebar-ad-component",
-    ".sidebar-ad-cont",
-    ".sidebar-ad-container",
-    ".sidebar-ad-div",
-    ".sidebar-ad-label",
-    ".sidebar-ad-rect",
-    ".sidebar-ad-slot",
-    ".sidebar-ad-wrapper",
-    ".sidebar-adbox",
-    ".sidebar-add-1",
-    ".sidebar-ads",
-    ".sidebar-ads-block",
-    ".sidebar-ads-no-padding",
-    ".sidebar-ads-wrap",
-    ".sidebar-adsdiv",
-    ".sidebar-adv-container",
-    ".sidebar-advert",
-    ".sidebar-advertisement",
-    ".sidebar-advertisment",
-    ".sidebar-adverts",
-    ".sidebar-adverts-header",
-    ".sidebar-atf-ad-wrapper",
-    ".sidebar-banner-ad",
-    ".sidebar-below-ad-unit",
-    ".sidebar-big-ad",
-    ".sidebar-big-box-ad",
-    ".sidebar-block-adsense",
-    ".sidebar-bottom-ad",
-    ".sidebar-box-ad",
-    ".sidebar-box-ads",
-    ".sidebar-col-ad-left",
-    ".sidebar-col-ad-right",
-    ".sidebar-content-ad",
-    ".sidebar-digiads",
-    ".sidebar-header-ads",
-    ".sidebar-paid-ad-label",
-    ".sidebar-product-ad",
-    ".sidebar-skyscraper-ad",
-    ".sidebar-sponsored",
-    ".sidebar-sponsors",
-    ".sidebar-square-ad",
-    ".sidebar-sticky--ad",
-    ".sidebar-text-ad",
-    ".sidebar-top-ad",
-    ".sidebar-tower-ad",
-    ".sidebar300adblock",
-    ".sidebarAD",
-    ".sidebarAd",
-    ".sidebarAdBlock",
-    ".sidebarAdLink",
-    ".sidebarAdNotice",
-    ".sidebarAdUnit",
-    ".sidebarAds300px",
-    ".sidebarAdvert",
-    ".sidebarCloseAd",
-    ".sidebarNewsletterAd",
-    ".sidebar__ad",
-    ".sidebar__block--ad",
-    ".sidebar__block-advertisement",
-    ".sidebar__item-spacer--advert-top",
-    ".sidebar__module--ad",
-    ".sidebar_ad",
-    ".sidebar_ad_300",
-    ".sidebar_ad_300_250",
-    ".sidebar_ad_container",
-    ".sidebar_ad_container_div",
-    ".sidebar_ad_holder",
-    ".sidebar_ad_leaderboard",
-    ".sidebar_ad_module",
-    ".sidebar_ads",
-    ".sidebar_ads_left",
-    ".sidebar_ads_right",
-    ".sidebar_ads_title",
-    ".sidebar_adsense",
-    ".sidebar_advert",
-    ".sidebar_advertising",
-    ".sidebar_box_ad",
-    ".sidebar_right_ad",
-    ".sidebar_skyscraper_ad",
-    ".sidebar_small_ad",
-    ".sidebar_sponsors",
-    ".sidebarad",
-    ".sidebarad160",
-    ".sidebarad_bottom",
-    ".sidebaradbox",
-    ".sidebaradcontent",
-    ".sidebarads",
-    ".sidebaradsense",
-    ".sidebarbox__advertising",
-    ".sidebarboxad",
-    ".sidebox-ad",
-    ".sidebox_ad",
-    ".sideright_ads",
-    ".sideskyad",
-    ".signad",
-    ".simple-ad-placeholder",
-    ".simple_ads_manager_widget",
-    ".simple_adsense_widget",
-    ".simplead-container",
-    ".simpleads-item",
-    ".single-ad",
-    ".single-ad-anchor",
-    ".single-ad-wrap",
-    ".single-ads",
-    ".single-ads-section",
-    ".single-article-ad",
-    ".single-bottom-ads",
-    ".single-component__ad",
-    ".single-google-ad",
-    ".single-mpu",
-    ".single-post-ad",
-    ".single-post-ads",
-    ".single-post-ads-750x90",
-    ".single-post-bottom-ads",
-    ".single-top-ad",
-    ".singleAd",
-    ".singleAdBox",
-    ".singleAdsContainer",
-    ".singlePostAd",
-    ".single_ad",
-    ".single_ad_300x250",
-    ".single_advert",
-    ".single_bottom_ad",
-    ".single_page_ads_header",
-    ".single_top_ad",
-    ".singlead",
-    ".singleads",
-    ".singleadstopcstm2",
-    ".singlepageleftad",
-    ".singlepostad",
-    ".singlepostadsense",
-    ".singpagead",
-    ".sister-ads",
-    ".site-ad-block",
-    ".site-ads",
-    ".site-bottom-ad-slot",
-    ".site-footer__ad-area",
-    ".site-head-ads",
-    ".site-header--sponsored",
-    ".site-header-ad",
-    ".site-header__ads",
-    ".site-top-ad",
-    ".siteWideAd",
-    ".site_ad",
-    ".site_ad--gray",
-    ".site_ad--label",
-    ".site_ads",
-    ".site_ads_home",
-    ".site_sponsers",
-    ".sitesponsor",
-    ".skinAd",
-    ".sky-ad",
-    ".sky-ad1",
-    ".skyAd",
-    ".skyAdd",
-    ".skyAdvert",
-    ".skyAdvert2",
-    ".sky_ad",
-    ".sky_ad_top",
-    ".sky_scraper_ad",
-    ".skyad",
-    ".skyjobsadtext",
-    ".skyscraper-ad",
-    ".skyscraper-ad-1",
-    ".skyscraper-ad-container",
-    ".skyscraper.ad",
-    ".skyscraperAd",
-    ".skyscraper_ad",
-    ".skyscrapper-ads-container",
-    ".sl-header-ad",
-    ".slate-ad",
-    ".slide-ad",
-    ".slideAd",
-    ".slide_ad",
-    ".slidead",
-    ".slider-ads",
-    ".slider-item-ad",
-    ".slider-right-advertisement-banner",
-    ".sliderad",
-    ".slideshow-ad",
-    ".slideshow-ad-container",
-    ".slideshow-ad-wrapper",
-    ".slideshow-ads",
-    ".slideshowAd",
-    ".slideshow_ad_300",
-    ".slideshow_ad_note",
-    ".slideshowadvert",
-    ".slot-box-marker-ad",
-    ".slot-customcontentad",
-    ".slot__ad",
-    ".sm-ad",
-    ".sm-admgnr-unit",
-    ".sm-ads",
-    ".sm-ads__billboard",
-    ".sm-advertisement",
-    ".sm-widget-ad-holder",
-    ".sm_ad",
-    ".small-ad",
-    ".small-ad-header",
-    ".small-ad-long",
-    ".small-ads",
-    ".smallAd",
-    ".smallAdContainer",
-    ".smallAds",
-    ".smallAdsContainer",
-    ".smallAdvertisments",
-    ".small_ad",
-    ".small_ad_bg",
-    ".small_ads",
-    ".smallad",
-    ".smalladblock",
-    ".smallads",
-    ".smalladscontainer",
-    ".smallsponsorad",
-    ".smart-ad",
-    ".smartAd",
-    ".smartad",
-    ".smn-new-gpt-ad",
-    ".snhb-ads",
-    ".snippet-ad",
-    ".snoadrotatewidgetwrap",
-    ".social-ad",
-    ".sovrn-connect-ad",
-    ".sp-ad",
-    ".sp-ad__leaderboard",
-    ".sp-adblock-2",
-    ".spLinks",
-    ".sp_ad",
-    ".spaceAdds",
-    ".spansored-item",
-    ".speakol-widget",
-    ".special_ad_section",
-    ".special_header_ad",
-    ".specials_ads",
-    ".spinAdvert",
-    ".spl-ads",
-    ".spl_ad",
-    ".spl_ad2",
-    ".splashy-ad-container",
-    ".spmads_medrec",
-    ".spnsr-wrapper",
-    ".spnsrCntnr",
-    ".spnsr_right",
-    ".spon-links",
-    ".spon_link",
-    ".sponadbox",
-    ".sponlinkbox",
-    ".spons-link",
-    ".spons-wrap",
-    ".sponsBox",
-    ".sponsLinks",
-    ".sponsWrap",
-    ".spons_link_header",
-    ".spons_links",
-    ".sponsbox",
-    ".sponser-link",
-    ".sponserIABAdBottom",
-    ".sponserLink",
-    ".sponsersads",
-    ".sponsertop",
-    ".sponsforums-middle",
-    ".sponslink",
-    ".sponsor-300",
-    ".sponsor-728",
-    ".sponsor-ad-1",
-    ".sponsor-ad-title",
-    ".sponsor-ad-wrapper",
-    ".sponsor-ads",
-    ".sponsor-area",
-    ".sponsor-area-top",
-    ".sponsor-bar-ea",
-    ".sponsor-block",
-    ".sponsor-bottom",
-    ".sponsor-box",
-    ".sponsor-btns",
-    ".sponsor-grid__sponsor",
-    ".sponsor-inner",
-    ".sponsor-left",
-    ".sponsor-link",
-    ".sponsor-links",
-    ".sponsor-popup",
-    ".sponsor-post",
-    ".sponsor-right",
-    ".sponsor-spot",
-    ".sponsor-text",
-    ".sponsor-text-container",
-    ".sponsor-wrap",
-    ".sponsorAd",
-    ".sponsorArea",
-    ".sponsorBlock",
-    ".sponsorBottom",
-    ".sponsorBox",
-    ".sponsorFooter",
-    ".sponsorFooter-container",
-    ".sponsorLabel",
-    ".sponsorLink",
-    ".sponsorLinks",
-    ".sponsorPanel",
-    ".sponsorPost",
-    ".sponsorPostWrap",
-    ".sponsorStrip",
-    ".sponsorText",
-    ".sponsorTitle",
-    ".sponsorTxt",
-    ".sponsor_ad",
-    ".sponsor_ad1",
-    ".sponsor_ad2",
-    ".sponsor_ad_area",
-    ".sponsor_ad_section",
-    ".sponsor_area",
-    ".sponsor_bar",
-    ".sponsor_block",
-    ".sponsor_columns",
-    ".sponsor_div",
-    ".sponsor_footer",
-    ".sponsor_image",
-    ".sponsor_label",
-    ".sponsor_line",
-    ".sponsor_links",
-    ".sponsor_logo",
-    ".sponsor_placement",
-    ".sponsor_popup",
-    ".sponsor_post",
-    ".sponsor_units",
-    ".sponsorad",
-    ".sponsoradlabel",
-    ".sponsorads",
-    ".sponsoradtitle",
-    ".sponsored-ad",
-    ".sponsored-ad-container",
-    ".sponsored-ad-label",
-    ".sponsored-ad-ob",
-    ".sponsored-add",
-    ".sponsored-ads",
-    ".sponsored-article",
-    ".sponsored-article-item",
-    ".sponsored-article-widget",
-    ".sponsored-b",
-    ".sponsored-block",
-    ".sponsored-browse-data-route",
-    ".sponsored-buttons",
-    ".sponsored-container",
-    ".sponsored-container-bottom",
-    ".sponsored-content",
-    ".sponsored-default",
-    ".sponsored-display-ad",
-    ".sponsored-editorial",
-    ".sponsored-features",
-    ".sponsored-header",
-    ".sponsored-headlines",
-    ".sponsored-headlines-wrap",
-    ".sponsored-headshop",
-    ".sponsored-inmail",
-    ".sponsored-inmail-legacy",
-    ".sponsored-link",
-    ".sponsored-links",
-    ".sponsored-links-alt-b",
-    ".sponsored-links-col",
-    ".sponsored-links-holder",
-    ".sponsored-links-red",
-    ".sponsored-links-right",
-    ".sponsored-links-tbl",
-    ".sponsored-media",
-    ".sponsored-post",
-    ".sponsored-post-container",
-    ".sponsored-post_ad",
-    ".sponsored-result",
-    ".sponsored-results",
-    ".sponsored-right",
-    ".sponsored-slot",
-    ".sponsored-tag",
-    ".sponsored-text",
-    ".sponsored-top",
-    ".sponsored-widget",
-    ".sponsoredAd",
-    ".sponsoredAdLine",
-    ".sponsoredAds",
-    ".sponsoredBanners",
-    ".sponsoredBar",
-    ".sponsoredBottom",
-    ".sponsoredBox",
-    ".sponsoredContent",
-    ".sponsoredEntry",
-    ".sponsoredFeature",
-    ".sponsoredInfo",
-    ".sponsoredInner",
-    ".sponsoredItem",
-    ".sponsoredLabel",
-    ".sponsoredLeft",
-    ".sponsoredLink",
-    ".sponsoredLinks",
-    ".sponsoredLinks2",
-    ".sponsoredLinksBox",
-    ".sponsoredLinksGadget",
-    ".sponsoredLinksHead",
-    ".sponsoredLinksHeader",
-    ".sponsoredListing",
-    ".sponsoredName",
-    ".sponsoredProduct",
-    ".sponsoredResults",
-    ".sponsoredSearch",
-    ".sponsoredShowcasePanel",
-    ".sponsoredSideInner",
-    ".sponsoredStats",
-    ".sponsoredTop",
-    ".sponsored_ad",
-    ".sponsored_ads",
-    ".sponsored_bar_text",
-    ".sponsored_box",
-    ".sponsored_box_search",
-    ".sponsored_by",
-    ".sponsored_content",
-    ".sponsored_glinks",
-    ".sponsored_link",
-    ".sponsored_links",
-    ".sponsored_links2",
-    ".sponsored_links_box",
-    ".sponsored_links_container",
-    ".sponsored_links_section",
-    ".sponsored_post",
-    ".sponsored_result",
-    ".sponsored_results",
-    ".sponsored_sidepanel",
-    ".sponsored_ss",
-    ".sponsored_text",
-    ".sponsored_title",
-    ".sponsored_well",
-    ".sponsoredby",
-    ".sponsoredibbox",
-    ".sponsoredlink",
-    ".sponsoredlinkHed",
-    ".sponsoredlinks",
-    ".sponsoredlinks-article",
-    ".sponsoredlinkscontainer",
-    ".sponsoredresults",
-    ".sponsoredtabl",
-    ".sponsorheader",
-    ".sponsoring_link",
-    ".sponsoringbanner",
-    ".sponsorlink",
-    ".sponsorlink2",
-    ".sponsormsg",
-    ".sponsors-advertisment",
-    ".sponsors-box",
-    ".sponsors-footer",
-    ".sponsors-module",
-    ".sponsors-widget",
-    ".sponsorsBanners",
-    ".sponsors_300x250",
-    ".sponsors__container",
-    ".sponsors__wide",
-    ".sponsors_box_container",
-    ".sponsors_fieldset",
-    ".sponsors_links",
-    ".sponsors_spacer",
-    ".sponsorsbanner",
-    ".sponsorsbig",
-    ".sponsorship-banner-bottom",
-    ".sponsorship-box",
-    ".sponsorship-chrome",
-    ".sponsorship-container",
-    ".sponsorship-leaderboard",
-    ".sponsorshipContainer",
-    ".sponsorship_ad",
-    ".sponsorshipbox",
-    ".sponsorwrapper",
-    ".sponstitle",
-    ".sponstop",
-    ".spot-ad",
-    ".spotlight-ad",
-    ".spotlight-ad-left",
-    ".spotlightAd",
-    ".spt-footer-ad",
-    ".sqAd2",
-    ".sq_ad",
-    ".sqrd-ad-manager",
-    ".square-ad",
-    ".square-ad--latest-video",
-    ".square-ad--neg-margin",
-    ".square-ad-1",
-    ".square-ad-container",
-    ".square-ad-pane",
-    ".square-ads",
-    ".square-advt",
-    ".square-adwrap",
-    ".square-sidebar-ad",
-    ".square-sponsorship",
-    ".squareAd",
-    ".squareAdWrap",
-    ".squareAdd",
-    ".squareAddtwo",
-    ".squareAds",
-    ".square_ad",
-    ".squaread",
-    ".squaread-container",
-    ".squareadMain",
-    ".squareads",
-    ".squared_ad",
-    ".squirrel_widget",
-    ".sr-adsense",
-    ".sr-advert",
-    ".sraAdvert",
-    ".srp-sidebar-ads",
-    ".ssp-advert",
-    ".standalonead",
-    ".standard-ad-container",
-    ".standard_ad_slot",
-    ".static-ad",
-    ".staticAd",
-    ".static_mpu_wrap",
-    ".staticad",
-    ".sterra-ad",
-    ".stick-ad-container",
-    ".stickad",
-    ".sticky-ad",
-    ".sticky-ad-bottom",
-    ".sticky-ad-container",
-    ".sticky-ad-footer",
-    ".sticky-ad-header",
-    ".sticky-ad-slot--homepage--wrapper",
-    ".sticky-ad-unit-default",
-    ".sticky-ad-wrapper",
-    ".sticky-ads",
-    ".sticky-ads-container",
-    ".sticky-ads-content",
-    ".sticky-adsense",
-    ".sticky-advert-widget",
-    ".sticky-bottom-ad",
-    ".sticky-footer-ad",
-    ".sticky-footer-ad-container",
-    ".sticky-navbar-ad-container",
-    ".sticky-rail-ad-container",
-    ".sticky-side-ad",
-    ".sticky-sidebar-ad",
-    ".sticky-top-ad-wrap",
-    ".stickyAd",
-    ".stickyAdWrapper",
-    ".stickyAdsGroup",
-    ".stickyContainerMpu",
-    ".stickyMultiAd-processed",
-    ".stickyRailAd",
-    ".sticky_ad_sidebar",
-    ".sticky_ad_wrapper",
-    ".sticky_ads",
-    ".stickyad",
-    ".stickyads",
-    ".stickyadv",
-    ".stky-ad-footer",
-    ".stm-ad-player",
-    ".stmAdHeightWidget",
-    ".stock_ad",
-    ".stocks-ad-tag",
-    ".store-ads",
-    ".story-ad",
-    ".story-ad-container",
-    ".story-ad-right",
-    ".story-header-ad",
-    ".story-inline-advert",
-    ".storyAd",
-    ".storyAdvert",
-    ".story__top__ad",
-    ".story_ad_div",
-    ".story_body_advert",
-    ".storyad",
-    ".storyad300",
-    ".storyadHolderAfterLoad",
-    ".stpro_ads",
-    ".str-top-ad",
-    ".strack_bnr",
-    ".strawberry-ads",
-    ".strawberry-ads__pretty-container",
-    ".stream-ad",
-    ".streamAd",
-    ".strip-ad",
-    ".stripad",
-    ".sub-ad",
-    ".subAdBannerArea",
-    ".subAdBannerHeader",
-    ".subNavAd",
-    ".subad",
-    ".subheader_adsense",
-    ".submenu_ad",
-    ".subnav-ad-layout",
-    ".subnav-ad-wrapper",
-    ".subscribeAd",
-    ".subscriber-ad",
-    ".subscribox-ad",
-    ".sudoku-ad",
-    ".sugarad",
-    ".suggAd",
-    ".super-ad",
-    ".super-section__ads-wrapper",
-    ".super-section__header-ad-slot-wrapper",
-    ".superbanner-adcontent",
-    ".support_ad",
-    ".suti-advertising-dfp-banner",
-    ".swiper_advs",
-    ".tabAd",
-    ".tabAds",
-    ".tab_ad",
-    ".tab_ad_area",
-    ".table-ad",
-    ".tableAd1",
-    ".tablet-ad",
-    ".tadm_ad_unit",
-    ".tag-hide_inline_content_ads",
-    ".takeover-ad",
-    ".tallAdvert",
-    ".tallad",
-    ".tbboxad",
-    ".tc-adbanner",
-    ".tc_ad",
-    ".tc_ad_unit",
-    ".tcf-ad",
-    ".td-a-ad",
-    ".td-a-rec-id-custom_ad_1",
-    ".td-a-rec-id-custom_ad_2",
-    ".td-a-rec-id-custom_ad_3",
-    ".td-a-rec-id-custom_ad_4",
-    ".td-a-rec-id-custom_ad_5",
-    ".td-ad",
-    ".td-ad-m",
-    ".td-ad-p",
-    ".td-ad-tp",
-    ".td-adspot-title",
-    ".td-sponsor-title",
-    ".tdAdHeader",
-    ".td_ad",
-    ".td_footer_ads",
-    ".td_left_widget_ad",
-    ".td_leftads",
-    ".td_reklama_bottom",
-    ".td_reklama_top",
-    ".td_spotlight_ads",
-    ".teaser--advertorial",
-    ".teaser-ad",
-    ".teaser-advertisement",
-    ".teaser-sponsor",
-    ".teaserAd",
-    ".teaserAdContainer",
-    ".teaserAdHeadline",
-    ".teaser_ad",
-    ".templates_ad_placement",
-    ".test-adsense",
-    ".testAd-holder",
-    ".text-ad-sitewide",
-    ".text-ad-top",
-    ".text-advertisement",
-    ".text-panel-ad",
-    ".text-sponsor",
-    ".textAd3",
-    ".textAdBlock",
-    ".textAdBox",
-    ".textAds",
-    ".textLinkAd",
-    ".textSponsor",
-    ".text_ad_title",
-    ".text_ad_website",
-    ".text_ads_2",
-    ".text_ads_wrapper",
-    ".text_adv",
-    ".textad",
-    ".textadContainer",
-    ".textadbox",
-    ".textadlink",
-    ".textadscontainer",
-    ".textadsds",
-    ".textadsfoot",
-    ".textadtext",
-    ".textlinkads",
-    ".th-ad",
-    ".thb_ad_before_header",
-    ".thb_ad_header",
-    ".theAdvert",
-    ".theads",
-    ".theleftad",
-    ".themonic-ad1",
-    ".themonic-ad2",
-    ".themonic-ad3",
-    ".third-party-ad",
-    ".thumb-ads",
-    ".thumb_ad",
-    ".thumbnailad",
-    ".thumbs-adv",
-    ".thumbs-adv-holder",
-    ".tile--ad",
-    ".tile-ad",
-    ".tile-ad-container",
-    ".tile-advert",
-    ".tileAdContainer",
-    ".tileAdWrap",
-    ".tileAds",
-    ".tile_AdBanner",
-    ".tile_ad",
-    ".tile_ad_container",
-    ".tips_advertisement",
-    ".title-ad",
-    ".tl-ad-container",
-    ".tmiads",
-    ".tmo-ad",
-    ".tmo-ad-ezoic",
-    ".tncls_ad",
-    ".tncls_ad_250",
-    ".tncls_ad_300",
-    ".tnt-ads",
-    ".tnt-ads-container",
-    ".tnt-dmp-reactive",
-    ".tnw-ad",
-    ".toaster-ad",
-    ".toolkit-ad-shell",
-    ".top-300-ad",
-    ".top-ad",
-    ".top-ad-728",
-    ".top-ad-970x90",
-    ".top-ad-anchor",
-    ".top-ad-area",
-    ".top-ad-banner-wrapper",
-    ".top-ad-bloc",
-    ".top-ad-block",
-    ".top-ad-center",
-    ".top-ad-container",
-    ".top-ad-content",
-    ".top-ad-deck",
-    ".top-ad-desktop",
-    ".top-ad-div",
-    ".top-ad-horizontal",
-    ".top-ad-inside",
-    ".top-ad-module",
-    ".top-ad-recirc",
-    ".top-ad-right",
-    ".top-ad-sidebar",
-    ".top-ad-slot",
-    ".top-ad-space",
-    ".top-ad-sticky",
-    ".top-ad-unit",
-    ".top-ad-wrap",
-    ".top-ad-wrapper",
-    ".top-ad-zone",
-    ".top-ad1",
-    ".top-ad__sticky-wrapper",
-    ".top-adbox",
-    ".top-ads",
-    ".top-ads-amp",
-    ".top-ads-block",
-    ".top-ads-bottom-bar",
-    ".top-ads-container",
-    ".top-ads-mobile",
-    ".top-ads-wrapper",
-    ".top-adsense",
-    ".top-adsense-banner",
-    ".top-adspace",
-    ".top-adv",
-    ".top-adv-container",
-    ".top-adverbox",
-    ".top-advert",
-    ".top-advertisement",
-    ".top-affiliate",
-    ".top-banner-468",
-    ".top-banner-ad",
-    ".top-banner-ad-container",
-    ".top-banner-ad-wrapper",
-    ".top-banner-add",
-    ".top-banner-ads",
-    ".top-banner-advert",
-    ".top-bar-ad-related",
-    ".top-box-right-ad",
-    ".top-content-adplace",
-    ".top-fixed-ad",
-    ".top-half-page-ad",
-    ".top-header-ad",
-    ".top-header-ad1",
-    ".top-horiz-ad",
-    ".top-horizontal-ad",
-    ".top-item-ad",
-    ".top-leaderboard-ad",
-    ".top-left-ad",
-    ".top-menu-ads",
-    ".top-post-ad",
-    ".top-post-ads",
-    ".top-right-ad",
-    ".top-side-advertisement",
-    ".top-sidebar-ad",
-    ".top-sidebar-adbox",
-    ".top-site-ad",
-    ".top-sponsored-header",
-    ".top-story-ad",
-    ".top-topics__ad",
-    ".top-wide-ad-container",
-    ".top.ad",
-    ".top250Ad",
-    ".top300ad",
-    ".topAD",
-    ".topAd",
-    ".topAd728x90",
-    ".topAdBanner",
-    ".topAdBar",
-    ".topAdBlock",
-    ".topAdCenter",
-    ".topAdContainer",
-    ".topAdIn",
-    ".topAdLeft",
-    ".topAdRight",
-    ".topAdSpacer",
-    ".topAdWrap",
-    ".topAdWrapper",
-    ".topAdd",
-    ".topAds",
-    ".topAdsWrappper",
-    ".topAdvBox",
-    ".topAdvert",
-    ".topAdvertisement",
-    ".topAdvertistemt",
-    ".topAdverts",
-    ".topAlertAds",
-    ".topArtAd",
-    ".topArticleAds",
-    ".topBannerAd",
-    ".topBarAd",
-    ".topBoxAdvertisement",
-    ".topGoogleAd",
-    ".topLeaderboardAd",
-    ".topRailAdSlot",
-    ".topRightAd",
-    ".top_Ad",
-    ".top__ad",
-    ".top_ad",
-    ".top_ad1",
-    ".top_ad_728",
-    ".top_ad_728_90",
-    ".top_ad_banner",
-    ".top_ad_big",
-    ".top_ad_disclaimer",
-    ".top_ad_div",
-    ".top_ad_holder",
-    ".top_ad_inner",
-    ".top_ad_label",
-    ".top_ad_list",
-    ".top_ad_long",
-    ".top_ad_post",
-    ".top_ad_responsive",
-    ".top_ad_seperate",
-    ".top_ad_short",
-    ".top_ad_wrap",
-    ".top_ad_wrapper",
-    ".top_adbox1",
-    ".top_adbox2",
-    ".top_adh",
-    ".top_ads",
-    ".top_ads_container",
-    ".top_adsense",
-    ".top_adspace",
-    ".top_adv",
-    ".top_adv_content",
-    ".top_advert",
-    ".top_advertisement",
-    ".top_advertising_lb",
-    ".top_advertizing_cnt",
-    ".top_bar_ad",
-    ".top_big_ads",
-    ".top_container_ad",
-    ".top_corner_ad",
-    ".top_head_ads",
-    ".top_header_ad",
-    ".top_header_ad_inner",
-    ".top_right_ad",
-    ".top_rightad",
-    ".top_side_adv",
-    ".top_sponsor",
-    ".topad-area",
-    ".topad-bar",
-    ".topad-bg",
-    ".topad1",
-    ".topad2",
-    ".topadbar",
-    ".topadblock",
-    ".topadbox",
-    ".topadcont",
-    ".topadrow",
-    ".topads",
-    ".topads-spacer",
-    ".topadsbx",
-    ".topadsection",
-    ".topadspace",
-    ".topadspot",
-    ".topadtara",
-    ".topadtxt",
-    ".topadtxt120",
-    ".topadtxt300",
-    ".topadtxt428",
-    ".topadtxt728",
-    ".topadvert",
-    ".topadvertisementsegment",
-    ".topbannerAd",
-    ".topbar-ad-parent",
-    ".topbar-ad-unit",
-    ".topboardads",
-    ".topcharts_ad_720",
-    ".topfootad",
-    ".topicDetailsAdRight",
-    ".topic_inad",
-    ".topnavSponsor",
-    ".topratedBoxAD",
-    ".topright_ad",
-    ".topside_ad",
-    ".topsidebarad",
-    ".toptenAdBoxA",
-    ".tourFeatureAd",
-    ".tout-ad",
-    ".tout-ad-embed",
-    ".tower-ad",
-    ".tower-ad-abs",
-    ".tower-ad-b",
-    ".tower-ad-wrapper",
-    ".tower-ads-container",
-    ".towerAd",
-    ".towerAdLeft",
-    ".towerAds",
-    ".tower_ad",
-    ".tower_ad_desktop",
-    ".tower_ad_disclaimer",
-    ".towerad",
-    ".tp-ad-label",
-    ".tp_ads",
-    ".tpd-banner-ad-container",
-    ".tpd-banner-desktop",
-    ".tpd-box-ad-d",
-    ".trc-content-sponsored",
-    ".trc-content-sponsoredUB",
-    ".trend-card-advert",
-    ".trend-card-advert__title",
-    ".tsm-ad",
-    ".tt_ads",
-    ".ttb_adv_bg",
-    ".tw-adv-gpt",
-    ".txt_adbyeclick",
-    ".txt_ads",
-    ".txtad_area",
-    ".txtadbox",
-    ".txtadvertise",
-    ".type-ad",
-    ".u-ads",
-    ".u-lazy-ad-wrapper",
-    ".udn-ads",
-    ".ue-c-ad",
-    ".ult_vp_videoPlayerAD",
-    ".under-header-ad",
-    ".under-player-ad",
-    ".under-player-ads",
-    ".under_ads",
-    ".underplayerAd",
-    ".underplayer__ad",
-    ".uniAdBox",
-    ".uniAds",
-    ".unionAd",
-    ".unit-ad",
-    ".unspoken-adplace",
-    ".upper-ad-box",
-    ".upper-ad-space",
-    ".upper_ad",
-    ".upx-ad-placeholder",
-    ".us_ad",
-    ".uvs-ad-full-width",
-    ".v-ad",
-    ".vadvert",
-    ".variable-ad",
-    ".variableHeightAd",
-    ".vce-ad-below-header",
-    ".vce-ad-container",
-    ".vce-header-ads",
-    ".vce_adsense_expand",
-    ".vce_adsense_widget",
-    ".vce_adsense_wrapper",
-    ".vdvwad",
-    ".vert-ad",
-    ".vert-ads",
-    ".vertad",
-    ".vertical-ad",
-    ".vertical-ads",
-    ".vertical-adsense",
-    ".verticalAd",
-    ".verticalAdText",
-    ".vertical_ad",
-    ".vertical_ads",
-    ".verticalad",
-    ".vf-ad-comments",
-    ".vf-promo-gtag",
-    ".vi-sticky-ad",
-    ".video-ad",
-    ".video-ad-bottom",
-    ".video-ad-container",
-    ".video-ad-content",
-    ".video-ads",
-    ".video-ads-container",
-    ".video-ads-grid",
-    ".video-ads-wrapper",
-    ".video-adv",
-    ".video-advert",
-    ".video-archive-ad",
-    ".video-boxad",
-    ".video-page__adv",
-    ".video-right-ad",
-    ".video-right-ads",
-    ".video-side__adv_title",
-    ".videoAd-wrapper",
-    ".videoAd300",
-    ".videoBoxAd",
-    ".videoOverAd300",
-    ".videoOverAdSmall",
-    ".videoPauseAd",
-    ".videoSideAds",
-    ".video_ad",
-    ".video_ads",
-    ".videoad",
-    ".videoad-base",
-    ".videoad2",
-    ".videos-ad",
-    ".videos-ad-wrap",
-    ".view-Advertisment",
-    ".view-ad",
-    ".view-ads",
-    ".view-advertisement",
-    ".view-advertisements",
-    ".view-advertorials",
-    ".view-adverts",
-    ".view-article-inner-ads",
-    ".view-homepage-center-ads",
-    ".view-id-Advertisment",
-    ".view-id-ads",
-    ".view-id-advertisement",
-    ".view-image-ads",
-    ".view-site-ads",
-    ".view-video-advertisements",
-    ".view_ad",
-    ".view_rig_ad",
-    ".views-field-field-ad",
-    ".views-field-field-html-ad",
-    ".visibleAd",
-    ".vjs-ad-iframe",
-    ".vjs-ad-overlay",
-    ".vjs-ima3-ad-container",
-    ".vjs-marker-ad",
-    ".vjs-overlay.size-300x250",
-    ".vl-ad-item",
-    ".vl-advertisment",
-    ".vl-header-ads",
-    ".vlog-ad",
-    ".vm-ad-horizontal",
-    ".vmp-ad",
-    ".vod_ad",
-    ".vodl-ad__bigsizebanner",
-    ".vpnad",
-    ".vs-advert-300x250",
-    ".vsw-ads",
-    ".vswAdContainer",
-    ".vt_h1_ad",
-    ".vuukle-ad-block",
-    ".vuukle-ads",
-    ".vw-header__ads",
-    ".w-ad-box",
-    ".w-content--ad",
-    ".wAdvert",
-    ".w_AdExternal",
-    ".w_ad",
-    ".wa_adsbottom",
-    ".waf-ad",
-    ".wahAd",
-    ".wahAdRight",
-    ".waldo-display-unit",
-    ".waldo-placeholder",
-    ".waldo-placeholder-bottom",
-    ".wall-ads-control",
-    ".wall-ads-right",
-    ".wallAd",
-    ".wall_ad",
-    ".wall_ad_hd",
-    ".wallad",
-    ".wallpaper-ad-top",
-    ".wc-adblock-wrap",
-    ".wcAd",
-    ".wcfAdLocation",
-    ".wd-adunit",
-    ".wdca_ad_item",
-    ".wdca_custom_ad",
-    ".wdp_ad",
-    ".wdp_adDiv",
-    ".wdt_ads",
-    ".weather-ad-wrapper",
-    ".weather_ad",
-    ".weatherad",
-    ".web_ads",
-    ".webad-cnt",
-    ".webad_link",
-    ".webads336x280",
-    ".webadvert-container",
-    ".webpart-wrap-advert",
-    ".website-ad-space",
-    ".well-ad",
-    ".werbungAd",
-    ".wfb-ad",
-    ".wg-ad-square",
-    ".wgAd-loaded",
-    ".wh-advert",
-    ".wh_ad",
-    ".wh_ad_inner",
-    ".when-show-ads",
-    ".white-ad-block",
-    ".wide-ad",
-    ".wide-ad-container",
-    ".wide-ad-new-layout",
-    ".wide-ad-outer",
-    ".wide-ad2015",
-    ".wide-ads-container",
-    ".wide-advert",
-    ".wide-footer-ad",
-    ".wide-header-ad",
-    ".wide-skyscraper-ad",
-    ".wideAd",
-    ".wideAdTable",
-    ".widePageAd",
-    ".wide_ad",
-    ".wide_adBox_footer",
-    ".wide_ad_unit",
-    ".wide_ad_unit_top",
-    ".wide_ads",
-    ".wide_google_ads",
-    ".wide_grey_ad_box",
-    ".wide_sponsors",
-    ".widead",
-    ".wideadbox",
-    ".widget--ad",
-    ".widget--ajdg_bnnrwidgets",
-    ".widget--local-ads",
-    ".widget-300x250ad",
-    ".widget-ad",
-    ".widget-ad-codes",
-    ".widget-ad-image",
-    ".widget-ad-script",
-    ".widget-ad-sky",
-    ".widget-ad-zone",
-    ".widget-ad300x250",
-    ".widget-adcode",
-    ".widget-ads",
-    ".widget-adsense",
-    ".widget-adv",
-    ".widget-advads-ad-widget",
-    ".widget-advert-970",
-    ".widget-advertisement",
-    ".widget-dfp",
-    ".widget-entry-ads-160",
-    ".widget-group-Ads",
-    ".widget-highlight-ads",
-    ".widget-sponsor",
-    ".widget-text-ad",
-    ".widget.carbonads-widget",
-    ".widget1-ad",
-    ".widget10-ad",
-    ".widget4-ad",
-    ".widget6-ad",
-    ".widget7-ad",
-    ".widgetAD",
-    ".widgetContentIfrWrapperAd",
-    ".widgetSponsors",
-    ".widget_300x250_advertisement",
-    ".widget_abn_admanager_sidestealer",
-    ".widget_ad",
-    ".widget_ad-widget",
-    ".widget_ad125",
-    ".widget_ad300",
-    ".widget_ad_300",
-    ".widget_ad_boxes_widget",
-    ".widget_ad_layers_ad_widget",
-    ".widget_ad_rotator",
-    ".widget_ad_widget",
-    ".widget_adace_ads_widget",
-    ".widget_admanagerwidget",
-    ".widget_adrotate_widgets",
-    ".widget_ads",
-    ".widget_ads_entries",
-    ".widget_ads_widget",
-    ".widget_adsblock",
-    ".widget_adsensem",
-    ".widget_adsensewidget",
-    ".widget_adsingle",
-    ".widget_adswidget1-quick-adsense",
-    ".widget_adswidget2-quick-adsense",
-    ".widget_adswidget3-quick-adsense",
-    ".widget_adv_location",
-    ".widget_adv_text",
-    ".widget_advads_ad_widget",
-    ".widget_advert",
-    ".widget_advert_content",
-    ".widget_advert_widget",
-    ".widget_advertisement",
-    ".widget_advertisements",
-    ".widget_advertisment",
-    ".widget_advwidget",
-    ".widget_alaya_ad",
-    ".widget_arvins_ad_randomizer",
-    ".widget_awaken_pro_medium_rectangle_ad",
-    ".widget_better-ads",
-    ".widget_bk_ads",
-    ".widget_com_ad_widget",
-    ".widget_core_ads_desk",
-    ".widget_cpxadvert_widgets",
-    ".widget_customad_widget",
-    ".widget_customadvertising",
-    ".widget_dfp",
-    ".widget_dfp_lb-widget",
-    ".widget_doubleclick_widget",
-    ".widget_ep_rotating_ad_widget",
-    ".widget_epcl_ads_fluid",
-    ".widget_evolve_ad_gpt_widget",
-    ".widget_html_snippet_ad_widget",
-    ".widget_ima_ads",
-    ".widget_ione-dart-ad",
-    ".widget_ipm_sidebar_ad",
-    ".widget_island_ad",
-    ".widget_joblo_complex_ad",
-    ".widget_long_ads_widget",
-    ".widget_newspack-ads-widget",
-    ".widget_openxwpwidget",
-    ".widget_plugrush_widget",
-    ".widget_pmc-ads-widget",
-    ".widget_quads_ads_widget",
-    ".widget_rdc_ad_widget",
-    ".widget_sej_sidebar_ad",
-    ".widget_sidebar_adrotate_tedo_single_widget",
-    ".widget_sidebaradwidget",
-    ".widget_singlead",
-    ".widget_sponsored_content",
-    ".widget_supermag_ad",
-    ".widget_supernews_ad",
-    ".widget_text_adsense",
-    ".widget_themoneytizer_widget",
-    ".widget_thesun_dfp_ad_widget",
-    ".widget_tt_ads_widget",
-    ".widget_viral_advertisement",
-    ".widget_wp-bannerize-widget",
-    ".widget_wp_ads_gpt_widget",
-    ".widget_wp_insert_ad_widget",
-    ".widget_wpex_advertisement",
-    ".widget_wpstealthads_widget",
-    ".widgetads",
-    ".width-ad-slug",
-    ".wikia-ad",
-    ".wio-xbanner",
-    ".with-background-ads",
-    ".withBanners__ad",
-    ".wnad",
-    ".worldplus-ad",
-    ".wotd-widget__ad",
-    ".wp-ads-target",
-    ".wp-block-ad-slot",
-    ".wp-block-tpd-block-tpd-ads",
-    ".wp125ad",
-    ".wp125ad_2",
-    ".wp_bannerize",
-    ".wp_bannerize_container",
-    ".wpadvert",
-    ".wpd-advertisement",
-    ".wpex-ads-widget",
-    ".wppaszone",
-    ".wpvqgr-a-d-s",
-    ".wpx-bannerize",
-    ".wpx_bannerize",
-    ".wpx_bannerize_banner_box",
-    ".wrap-ad",
-    ".wrap-ads",
-    ".wrap_boxad",
-    ".wrapad",
-    ".wrapper-ad",
-    ".wrapper-header-ad-slot",
-    ".wrapper_ad",
-    ".wrapper_advertisement",
-    ".wrapperad",
-    ".ww_ads_banner_wrapper",
-    ".xeiro-ads",
-    ".xmlad",
-    ".y-ads",
-    ".y-ads-wide",
-    ".yaAds",
-    ".yad-sponsored",
-    ".yahooAd",
-    ".yahooAds",
-    ".yahooContentMatch",
-    ".yahoo_ad",
-    ".yahoo_ads",
-    ".yahooad",
-    ".yahooads",
-    ".yan-sponsored",
-    ".zeus-ad",
-    ".zeusAdWrapper",
-    ".zeusAd__container",
-    ".zmgad-full-width",
-    ".zmgad-right-rail",
-    ".zone-advertisement",
-    ".zoneAds",
-    ".zox-post-ad-wrap",
-    ".zox-post-bot-ad",
-    ".zox-widget-side-ad",
-    ".zox_ad_widget",
-    ".zox_adv_widget",
-    "AD-SLOT",
-    "AD-TRIPLE-BOX",
-    "DFP-AD",
-    '[class^="adDisplay-module"]',
-    '[class^="amp-ad-"]',
-    '[class^="div-gpt-ad"]',
-    "[data-ad-cls]",
-    "[data-ad-manager-id]",
-    "[data-ad-module]",
-    "[data-ad-name]",
-    "[data-ad-width]",
-    "[data-adblockkey]",
-    "[data-adbridg-ad-class]",
-    "[data-advadstrackid]",
-    '[data-css-class="dfp-inarticle"]',
-    "[data-d-ad-id]",
-    "[data-desktop-ad-id]",
-    "[data-dynamic-ads]",
-    "[data-ez-name]",
-    "[data-freestar-ad]",
-    '[data-id^="div-gpt-ad"]',
-    "[data-m-ad-id]",
-    "[data-mobile-ad-id]",
-    '[data-name="adaptiveConstructorAd"]',
-    "[data-rc-widget]",
-    "[data-revive-zoneid]",
-    '[data-role="tile-ads-module"]',
-    '[data-template-type="nativead"]',
-    '[data-testid="ad_testID"]',
-    '[data-type="ad-vertical"]',
-    '[href="//jjgirls.com/sex/ChaturbateCams"]',
-    '[href="//sexcams.plus/"]',
-    '[href="https://jdrucker.com/gold"] > img',
-    '[href="https://masstortfinancing.com"] img',
-    '[href="https://ourgoldguy.com/contact/"] img',
-    '[href="https://www.masstortfinancing.com/"] > img',
-    '[href^="http://clicks.totemcash.com/"]',
-    '[href^="http://globsads.com/"]',
-    '[href^="http://go.cm-trk2.com/"]',
-    '[href^="http://homemoviestube.com/"]',
-    '[href^="http://join.michelle-austin.com/"]',
-    '[href^="http://join.rodneymoore.com/"]',
-    '[href^="http://join.shemale.xxx/"]',
-    '[href^="http://join.shemalepornstar.com/"]',
-    '[href^="http://join.shemalesfromhell.com/"]',
-    '[href^="http://join.trannies-fuck.com/"]',
-    '[href^="http://misslinkvocation.com/"]',
-    '[href^="http://mypillow.com/"] > img',
-    '[href^="http://residenceseeingstanding.com/"]',
-    '[href^="http://trafficare.net/"]',
-    '[href^="http://www.fleshlightgirls.com/"]',
-    '[href^="http://www.mypillow.com/"] > img',
-    '[href^="https://ad.admitad.com/"]',
-    '[href^="https://affect3dnetwork.com/track/"]',
-    '[href^="https://affiliate.fastcomet.com/"] > img',
-    '[href^="https://antiagingbed.com/discount/"] > img',
-    '[href^="https://awbbjmp.com/"]',
-    '[href^="https://charmingdatings.life/"]',
-    '[href^="https://cipledecline.buzz/"]',
-    '[href^="https://click2cvs.com/"]',
-    '[href^="https://cpa.10kfreesilver.com/"]',
-    '[href^="https://detachedbates.com/"]',
-    '[href^="https://engine.gettopple.com/"]',
-    '[href^="https://glersakr.com/"]',
-    '[href^="https://gmxvmvptfm.com/"]',
-    '[href^="https://go.4rabettraff.com/"]',
-    '[href^="https://go.affiliatexe.com/"]',
-    '[href^="https://go.astutelinks.com/"]',
-    '[href^="https://go.xlrdr.com"]',
-    '[href^="https://goldcometals.com/clk.trk"]',
-    '[href^="https://goldforyourfuture.com/clk.trk"] img',
-    '[href^="https://ilovemyfreedoms.com/landing-"]',
-    '[href^="https://istlnkcl.com/"]',
-    '[href^="https://join.girlsoutwest.com/"]',
-    '[href^="https://join.playboyplus.com/track/"]',
-    '[href^="https://join3.bannedsextapes.com"]',
-    '[href^="https://kingered-banctours.com/"]',
-    '[href^="https://mylead.global/stl/"] > img',
-    '[href^="https://mypatriotsupply.com/"] > img',
-    '[href^="https://mypillow.com/"] > img',
-    '[href^="https://mystore.com/"] > img',
-    '[href^="https://noqreport.com/"] > img',
-    '[href^="https://optimizedelite.com/"] > img',
-    '[href^="https://r.kraken.com/"]',
-    '[href^="https://rapidgator.net/article/premium/ref/"]',
-    '[href^="https://routewebtk.com/"]',
-    '[href^="https://safer-redirection.com"]',
-    '[href^="https://secure.bmtmicro.com/servlets/"]',
-    '[href^="https://shiftnetwork.infusionsoft.com/go/"] > img',
-    '[href^="https://shrugartisticelder.com"]',
-    '[href^="https://stvkr.com/"]',
-    '[href^="https://totlnkcl.com/"]',
-    '[href^="https://track.aftrk1.com/"]',
-    '[href^="https://track.fiverr.com/visit/"] > img',
-    '[href^="https://trackfin.asia/"]',
-    '[href^="https://traffserve.com/"]',
-    '[href^="https://turtlebids.irauctions.com/"] img',
-    '[href^="https://v.investologic.co.uk/"]',
-    '[href^="https://wct.link/"]',
-    '[href^="https://www.avantlink.com/click.php"] img',
-    '[href^="https://www.brighteonstore.com/products/"] img',
-    '[href^="https://www.cloudways.com/en/?id"]',
-    '[href^="https://www.herbanomic.com/"] > img',
-    '[href^="https://www.hostg.xyz/"] > img',
-    '[href^="https://www.mypatriotsupply.com/"] > img',
-    '[href^="https://www.mypillow.com/"] > img',
-    '[href^="https://www.reimageplus.com/"]',
-    '[href^="https://www.restoro.com/"]',
-    '[href^="https://www.targetingpartner.com/"]',
-    '[href^="https://zone.gotrackier.com/"]',
-    '[href^="https://zstacklife.com/"] img',
-    '[id^="ad-wrap-"]',
-    '[id^="ad_sky"]',
-    '[id^="ad_slider"]',
-    '[id^="div-gpt-ad"]',
-    '[id^="google_ads_iframe"]',
-    '[id^="section-ad-banner"]',
-    '[name^="google_ads_iframe"]',
-    '[onclick^="location.href=\'http://www.reimageplus.com"]',
-    "a-ad",
-    'a[href*=".engine.adglare.net/"]',
-    'a[href*=".g2afse.com/"]',
-    'a[href*="//lkstrck2.com/"]',
-    'a[href^="//a.bestcontentfare.top/"]',
-    'a[href^="//ardslediana.com/"]',
-    'a[href^="//go.eabids.com/"]',
-    'a[href^="//pubads.g.doubleclick.net/"]',
-    'a[href^="//s.st1net.com/splash.php"]',
-    'a[href^="//whulsaux.com/"]',
-    'a[href^="//zunsoach.com/"]',
-    'a[href^="http://ad.doubleclick.net/"]',
-    'a[href^="http://adultfriendfinder.com/go/"]',
-    'a[href^="http://adultgames.xxx/"]',
-    'a[href^="http://affiliate.glbtracker.com/"]',
-    'a[href^="http://affiliates.thrixxx.com/"]',
-    'a[href^="http://bc.vc/?r="]',
-    'a[href^="http://bodelen.com/"]',
-    'a[href^="http://bongacams.com/track?"]',
-    'a[href^="http://cam4com.go2cloud.org/aff_c?"]',
-    'a[href^="http://click.payserve.com/"]',
-    'a[href^="http://com-1.pro/"]',
-    'a[href^="http://d2.zedo.com/"]',
-    'a[href^="http://go.xtbaffiliates.com/"]',
-    'a[href^="http://googleads.g.doubleclick.net/pcs/click"]',
-    'a[href^="http://li.blogtrottr.com/click?"]',
-    'a[href^="http://m.hue2m.com/"]',
-    'a[href^="http://partners.etoro.com/"]',
-    'a[href^="http://static.fleshlight.com/images/banners/"]',
-    'a[href^="http://tc.tradetracker.net/"] > img',
-    'a[href^="http://tour.mrskin.com/"]',
-    'a[href^="http://traffic.tc-clicks.com/"]',
-    'a[href^="http://trk.globwo.online/"]',
-    'a[href^="http://wct.link/"]',
-    'a[href^="http://www.adultdvdempire.com/?partner_id="][href*="&utm_"]',
-    'a[href^="http://www.adultempire.com/unlimited/promo?"][href*="&partner_id="]',
-    'a[href^="http://www.friendlyduck.com/AF_"]',
-    'a[href^="http://www.gfrevenge.com/landing/"]',
-    'a[href^="http://www.h4trck.com/"]',
-    'a[href^="http://www.iyalc.com/"]',
-    'a[href^="http://www.mrskin.com/tour"]',
-    'a[href^="http://www.onclickmega.com/jump/next.php?"]',
-    'a[href^="http://www.onwebcam.com/random?t_link="]',
-    'a[href^="https://1betandgonow.com/"]',
-    'a[href^="https://1startfiledownload1.com/"]',
-    'a[href^="https://STaRTgamINg.net/tienda/"]',
-    'a[href^="https://STaRtgAmInG.net/tienda/"]',
-    'a[href^="https://StarTGAminG.net/tienda/"]',
-    'a[href^="https://a-ads.com/"]',
-    'a[href^="https://a.adtng.com/"]',
-    'a[href^="https://a.bestcontentfood.top/"]',
-    'a[href^="https://a.bestcontentoperation.top/"]',
-    'a[href^="https://a.bestcontentweb.top/"]',
-    'a[href^="https://a.medfoodhome.com/"]',
-    'a[href^="https://a2.adform.net/"]',
-    'a[href^="https://ab.advertiserurl.com/aff/"]',
-    'a[href^="https://ad.doubleclick.net/"]',
-    'a[href^="https://ad.kubiccomps.icu/"]',
-    'a[href^="https://ad.zanox.com/ppc/"] > img',
-    'a[href^="https://adclick.g.doubleclick.net/"]',
-    'a[href^="https://adjoincomprise.com/"]',
-    'a[href^="https://adnetwrk.com/"]',
-    'a[href^="https://ads.ad4game.com/"]',
-    'a[href^="https://ads.betfair.com/redirect.aspx?"]',
-    'a[href^="https://ads.leovegas.com/redirect.aspx?"]',
-    'a[href^="https://ads.planetwin365affiliate.com/redirect.aspx?"]',
-    'a[href^="https://adserver.adreactor.com/"]',
-    'a[href^="https://adsrv4k.com/"]',
-    'a[href^="https://adultfriendfinder.com/go/"]',
-    'a[href^="https://affcpatrk.com/"]',
-    'a[href^="https://affpa.top/"]',
-    'a[href^="https://agacelebir.com/"]',
-    'a[href^="https://ak.hauchiwu.com/"]',
-    'a[href^="https://ak.psaltauw.net/"]',
-    'a[href^="https://albionsoftwares.com/"]',
-    'a[href^="https://aweptjmp.com/"]',
-    'a[href^="https://awptjmp.com/"]',
-    'a[href^="https://azpresearch.club/"]',
-    'a[href^="https://banners.livepartners.com/"]',
-    'a[href^="https://batheunits.com/"]',
-    'a[href^="https://bc.game/"]',
-    'a[href^="https://black77854.com/"]',
-    'a[href^="https://bluedelivery.pro/"]',
-    'a[href^="https://bngprm.com/"]',
-    'a[href^="https://bngpt.com/"]',
-    'a[href^="https://bodelen.com/"]',
-    'a[href^="https://bongacams10.com/track?"]',
-    'a[href^="https://bongacams2.com/track?"]',
-    'a[href^="https://brightadnetwork.com/"]',
-    'a[href^="https://bs.serving-sys.com"]',
-    'a[href^="https://buqkrzbrucz.com/"]',
-    'a[href^="https://cam4com.go2cloud.org/"]',
-    'a[href^="https://camfapr.com/landing/click/"]',
-    'a[href^="https://cams.imagetwist.com/in/?track="]',
-    'a[href^="https://chaturbate.com/in/?tour="]',
-    'a[href^="https://chaturbate.com/in/?track="]',
-    'a[href^="https://chaturbate.jjgirls.com/?track="]',
-    'a[href^="https://claring-loccelkin.com/"]',
-    'a[href^="https://click.candyoffers.com/"]',
-    'a[href^="https://click.dtiserv2.com/"]',
-    'a[href^="https://click.hoolig.app/"]',
-    'a[href^="https://click.linksynergy.com/fs-bin/"] > img',
-    'a[href^="https://clickadilla.com/"]',
-    'a[href^="https://clicks.pipaffiliates.com/"]',
-    'a[href^="https://clixtrac.com/"]',
-    'a[href^="https://clk.wrenchsound.store/"]',
-    'a[href^="https://consali.com/"]',
-    'a[href^="https://convertmb.com/"]',
-    'a[href^="https://cpmspace.com/"]',
-    'a[href^="https://ctosrd.com/"]',
-    'a[href^="https://datingoffers30.info/"]',
-    'a[href^="https://dl-protect.net/"]',
-    'a[href^="https://engine.blueistheneworanges.com/"]',
-    'a[href^="https://engine.phn.doublepimp.com/"]',
-    'a[href^="https://engine.trackingdesks.com/"]',
-    'a[href^="https://fc.lc/ref/"]',
-    'a[href^="https://femglobal.app/"]',
-    'a[href^="https://financeads.net/tc.php?"]',
-    'a[href^="https://fleshlight.sjv.io/"]',
-    'a[href^="https://flirtandsweets.life/"]',
-    'a[href^="https://fourwhenstatistics.com/"]',
-    'a[href^="https://frameworkdeserve.com/"]',
-    'a[href^="https://funkydaters.com/"]',
-    'a[href^="https://geniusdexchange.com/"]',
-    'a[href^="https://ggbetpromo.com/"]',
-    'a[href^="https://go.247traffic.com/"]',
-    'a[href^="https://go.admjmp.com/"]',
-    'a[href^="https://go.cmtaffiliates.com/"]',
-    'a[href^="https://go.currency.com/"]',
-    'a[href^="https://go.dmzjmp.com"]',
-    'a[href^="https://go.etoro.com/"] > img',
-    'a[href^="https://go.gldrdr.com/"]',
-    'a[href^="https://go.goaserv.com/"]',
-    'a[href^="https://go.goasrv.com/"]',
-    'a[href^="https://go.hpyjmp.com"]',
-    'a[href^="https://go.hpyrdr.com/"]',
-    'a[href^="https://go.julrdr.com/"]',
-    'a[href^="https://go.markets.com/visit/?bta="]',
-    'a[href^="https://go.skinstrip.net"][href*="?campaignId="]',
-    'a[href^="https://go.strpjmp.com/"]',
-    'a[href^="https://go.tmrjmp.com"]',
-    'a[href^="https://go.trackitalltheway.com/"]',
-    'a[href^="https://go.xlirdr.com"]',
-    'a[href^="https://go.xlivrdr.com"]',
-    'a[href^="https://go.xlviiirdr.com"]',
-    'a[href^="https://go.xlviirdr.com"]',
-    'a[href^="https://go.xlvirdr.com"]',
-    'a[href^="https://go.xtbaffiliates.com/"]',
-    'a[href^="https://go.xxxiijmp.com"]',
-    'a[href^="https://go.xxxijmp.com"]',
-    'a[href^="https://go.xxxjmp.com"]',
-    'a[href^="https://go.zybrdr.com"]',
-    'a[href^="https://googleads.g.doubleclick.net/pcs/click"]',
-    'a[href^="https://hot-growngames.life/"]',
-    'a[href^="https://hotplaystime.life/"]',
-    'a[href^="https://iactrivago.ampxdirect.com/"]',
-    'a[href^="https://incisivetrk.cvtr.io/click?"]',
-    'a[href^="https://intenseaffiliates.com/redirect/"]',
-    'a[href^="https://iqbroker.com/"][href*="?aff="]',
-    'a[href^="https://ismlks.com/"]',
-    'a[href^="https://italarizege.xyz/"]',
-    'a[href^="https://itubego.com/video-downloader/?affid="]',
-    'a[href^="https://jaxofuna.com/"]',
-    'a[href^="https://join.dreamsexworld.com/"]',
-    'a[href^="https://join.sexworld3d.com/track/"]',
-    'a[href^="https://join.virtuallust3d.com/"]',
-    'a[href^="https://join.virtualtaboo.com/track/"]',
-    'a[href^="https://juicyads.in/"]',
-    'a[href^="https://k2s.cc/pr/"]',
-    'a[href^="https://kiksajex.com/"]',
-    'a[href^="https://l.hyenadata.com/"]',
-    'a[href^="https://land.brazzersnetwork.com/landing/"]',
-    'a[href^="https://landing.brazzersnetwork.com/"]',
-    'a[href^="https://landing1.brazzersnetwork.com"]',
-    'a[href^="https://lead1.pl/"]',
-    'a[href^="https://leg.xyz/?track="]',
-    'a[href^="https://lnkxt.bannerator.com/"]',
-    'a[href^="https://lobimax.com/"]',
-    'a[href^="https://loboclick.com"]',
-    'a[href^="https://losingoldfry.com/"]',
-    'a[href^="https://m.do.co/c/"] > img',
-    'a[href^="https://maymooth-stopic.com/"]',
-    'a[href^="https://mediaserver.entainpartners.com/renderBanner.do?"]',
-    'a[href^="https://mediaserver.gvcaffiliates.com/renderBanner.do?"]',
-    'a[href^="https://mercurybest.com/"]',
-    'a[href^="https://misspkl.com/"]',
-    'a[href^="https://mityneedn.com/"]',
-    'a[href^="https://mmwebhandler.aff-online.com/"]',
-    'a[href^="https://natour.naughtyamerica.com/track/"]',
-    'a[href^="https://ndt5.net/"]',
-    'a[href^="https://newbinotracs.com/"]',
-    'a[href^="https://oackoubs.com/"]',
-    'a[href^="https://ovb.im/"]',
-    'a[href^="https://pb-imc.com/"]',
-    'a[href^="https://pb-track.com/"]',
-    'a[href^="https://porngames.adult/?SID="]',
-    'a[href^="https://porntubemate.com/"]',
-    'a[href^="https://prf.hn/click/"][href*="/adref:"] > img',
-    'a[href^="https://prf.hn/click/"][href*="/camref:"] > img',
-    'a[href^="https://prf.hn/click/"][href*="/creativeref:"] > img',
-    'a[href^="https://promo-bc.com/"]',
-    'a[href^="https://pubads.g.doubleclick.net/"]',
-    'a[href^="https://refpa.top/"]',
-    'a[href^="https://refpa4903566.top/"]',
-    'a[href^="https://refpazkjixes.top/"]',
-    'a[href^="https://reinstandpointdumbest.com/"]',
-    'a[href^="https://s.optzsrv.com/"]',
-    'a[href^="https://s.zlinkb.com/"]',
-    'a[href^="https://s.zlinkc.com/"]',
-    'a[href^="https://s.zlinkd.com/"]',
-    'a[href^="https://sTARtgamIng.net/tienda/"]',
-    'a[href^="https://sTaRTgamInG.net/tienda/"]',
-    'a[href^="https://sTaRtGAMing.net/tienda/"]',
-    'a[href^="https://sTartGAMiNG.net/tienda/"]',
-    'a[href^="https://sTartGAMinG.net/tienda/"]',
-    'a[href^="https://sTartgAminG.net/tienda/"]',
-    'a[href^="https://safesurfingtoday.com/"][href*="?skip="]',
-    'a[href^="https://serve.awmdelivery.com/"]',
-    'a[href^="https://slkmis.com/"]',
-    'a[href^="https://spo-play.live/"]',
-    'a[href^="https://spygasm.com/track?"]',
-    'a[href^="https://staRTgamIng.net/tienda/"]',
-    'a[href^="https://staRTgaming.net/tienda/"]',
-    'a[href^="https://startgAming.net/tienda/"]',
-    'a[href^="https://startgamIng.Net/tienda/"]',
-    'a[href^="https://static.fleshlight.com/images/banners/"]',
-    'a[href^="https://streamate.com/landing/click/"]',
-    'a[href^="https://syndication.dynsrvtbg.com/"]',
-    'a[href^="https://syndication.exoclick.com/"]',
-    'a[href^="https://syndication.optimizesrv.com/"]',
-    'a[href^="https://t.adating.link/"]',
-    'a[href^="https://t.aslnk.link/"]',
-    'a[href^="https://t.grtyi.com/"]',
-    'a[href^="https://t.hrtye.com/"]',
-    'a[href^="https://taghaugh.com/"]',
-    'a[href^="https://tc.tradetracker.net/"] > img',
-    'a[href^="https://thaudray.com/"]',
-    'a[href^="https://thechleads.pro/"]',
-    'a[href^="https://thefacux.com/"]',
-    'a[href^="https://tm-offers.gamingadult.com/"]',
-    'a[href^="https://tour.mrskin.com/"]',
-    'a[href^="https://track.adform.net/"]',
-    'a[href^="https://track.afcpatrk.com/"]',
-    'a[href^="https://track.totalav.com/"]',
-    'a[href^="https://track.wg-aff.com"]',
-    'a[href^="https://tracker.loropartners.com/"]',
-    'a[href^="https://tracking.avapartner.com/"]',
-    'a[href^="https://traffdaq.com/"]',
-    'a[href^="https://trk.nfl-online-streams.club/"]',
-    'a[href^="https://trk.softonixs.xyz/"]',
-    'a[href^="https://trk.sportsflix4k.club/"]',
-    'a[href^="https://tsartech.g2afse.com/"]',
-    'a[href^="https://tweakostensibleinstaller.com/"]',
-    'a[href^="https://twinrdsrv.com/"]',
-    'a[href^="https://twinrdsyn.com/"]',
-    'a[href^="https://u.expresstech.io/"]',
-    'a[href^="https://visit-website.com/"]',
-    'a[href^="https://webroutetrk.com/"]',
-    'a[href^="https://wirewar.website/"]',
-    'a[href^="https://wittered-mainging.com/"]',
-    'a[href^="https://www.5mno3.com/"]',
-    'a[href^="https://www.adskeeper.com"]',
-    'a[href^="https://www.adultempire.com/"][href*="?partner_id="]',
-    'a[href^="https://www.adxsrve.com/"]',
-    'a[href^="https://www.bang.com/?aff="]',
-    'a[href^="https://www.bet365.com/"][href*="affiliate="]',
-    'a[href^="https://www.brazzersnetwork.com/landing/"]',
-    'a[href^="https://www.financeads.net/tc.php?"]',
-    'a[href^="https://www.geekbuying.com/dynamic-ads/"]',
-    'a[href^="https://www.googleadservices.com/pagead/aclk?"]',
-    'a[href^="https://www.highcpmrevenuenetwork.com/"]',
-    'a[href^="https://www.highperformancecpmgate.com/"]',
-    'a[href^="https://www.infowarsstore.com/"] > img',
-    'a[href^="https://www.kingsoffetish.com/tour?partner_id="]',
-    'a[href^="https://www.liquidfire.mobi/"]',
-    'a[href^="https://www.mrskin.com/account/"]',
-    'a[href^="https://www.mrskin.com/tour"]',
-    'a[href^="https://www.mypornstarcams.com/landing/click/"]',
-    'a[href^="https://www.nudeidols.com/cams/"]',
-    'a[href^="https://www.nutaku.net/signup/landing/"]',
-    'a[href^="https://www.onlineusershielder.com/"]',
-    'a[href^="https://www.sheetmusicplus.com/"][href*="?aff_id="]',
-    'a[href^="https://www.sheetmusicplus.com/?aff_id="]',
-    'a[href^="https://www.sugarinstant.com/?partner_id="]',
-    'a[href^="https://yogacomplyfuel.com/"]',
-    'a[href^="https://yourperfectdating.life/"]',
-    'a[style="width:100%;height:100%;z-index:10000000000000000;position:absolute;top:0;left:0;"]',
-    "ad-shield-ads",
-    "app-ad",
-    "app-advertisement",
-    "app-large-ad",
-    "ark-top-ad",
-    "article.ad",
-    'aside[id^="adrotate_widgets-"]',
-    "atf-ad-slot",
-    "bottomadblock",
-    "display-ads",
-    'div[aria-label="Ads"]',
-    'div[class^="Adstyled__AdWrapper-"]',
-    'div[class^="Display_displayAd"]',
-    'div[class^="kiwi-ad-wrapper"]',
-    'div[class^="native-ad-"]',
-    "div[data-ad-placeholder]",
-    "div[data-ad-targeting]",
-    "div[data-ad-wrapper]",
-    "div[data-adname]",
-    "div[data-adunit-path]",
-    "div[data-adunit]",
-    "div[data-adzone]",
-    'div[data-alias="300x250 Ad 1"]',
-    'div[data-alias="300x250 Ad 2"]',
-    'div[data-content="Advertisement"]',
-    "div[data-contentexchange-widget]",
-    "div[data-dfp-id]",
-    "div[data-google-query-id]",
-    "div[data-id-advertdfpconf]",
-    "div[data-insertion]",
-    "div[data-mini-ad-unit]",
-    "div[data-native-ad]",
-    "div[data-native_ad]",
-    "div[data-spotim-slot]",
-    'div[id^="_vdo_ads_player_ai_"]',
-    'div[id^="ad-div-"]',
-    'div[id^="ad-position-"]',
-    'div[id^="ad_position_"]',
-    'div[id^="adngin-"]',
-    'div[id^="adrotate_widgets-"]',
-    'div[id^="ads250_250-widget-"]',
-    'div[id^="ads300_100-widget-"]',
-    'div[id^="ads300_250-widget-"]',
-    'div[id^="adspot-"]',
-    'div[id^="advads_ad_"]',
-    'div[id^="crt-"][style]',
-    'div[id^="dfp-ad-"]',
-    'div[id^="div-ads-"]',
-    'div[id^="div-gpt-"]',
-    'div[id^="ezoic-pub-ad-"]',
-    'div[id^="google_dfp_"]',
-    'div[id^="gpt_ad_"]',
-    'div[id^="lazyad-"]',
-    'div[id^="optidigital-adslot"]',
-    'div[id^="pa_sticky_ad_box_middle_"]',
-    'div[id^="rc-widget-"]',
-    'div[id^="sticky_ad_"]',
-    'div[id^="vuukle-ad-"]',
-    'div[id^="yandex_ad"]',
-    "div[recirculation-ad-container]",
-    "gpt-ad",
-    "guj-ad",
-    "hl-adsense",
-    'img[src^="https://images.purevpnaffiliates.com"]',
-    "ps-connatix-module",
-    "span[data-ez-ph-id]",
-    'span[id^="ezoic-pub-ad-placeholder-"]',
-    "topadblock",
-    "zeus-ad",
-    "#hgiks-middle",
-    "#hgiks-top",
-    ".boxOverContent__banner",
-    ".happy-under-player",
-    ".mntl-leaderboard-header",
-    ".mntl-leaderboard-spacer",
-    ".shopee-search-user-brief",
-    'a[href*=".cfm?fp="][href*="&maxads="]',
-    ".CitrusBannerWrapper--enollj",
-    '[class^="tile-picker__CitrusBannerContainer-sc-"]',
-    "citrus-ad-wrapper",
-    ".RC-AD",
-    ".RC-AD-BOX-BOTTOM",
-    ".RC-AD-BOX-MIDDLE",
-    ".RC-AD-BOX-TOP",
-    ".RC-AD-TOP-BANNER",
-    ".js_related-stories-inset",
-    "ins.adsbygoogle",
-    "#mgb-container > #mgb",
-    '#kt_player > a[target="_blank"]',
-    "#slashboxes > .deals-rail",
-    ".scroll-fixable.rail-right > .deals-rail",
-    ".click-track.partner",
-    '[href^="https://freecourseweb.com/"] > .sitefriend',
-    ".index-module_adBeforeContent__UYZT",
-    ".interstory_first_mobile",
-    ".interstory_second_mobile",
-    "#gnt_atomsnc",
-    ".gnt_flp",
-    ".gnt_rr_xpst",
-    ".gnt_rr_xst",
-    ".gnt_tb.gnt_tbb",
-    ".gnt_tbr.gnt_tb",
-    ".gnt_x",
-    "#Player_Playoncontent",
-    "#aniview--player",
-    "#cmg-video-player-placeholder",
-    "#jwplayer-container-div",
-    "#jwplayer_contextual_player_div",
-    "#mplayer-embed",
-    "#primis-holder",
-    "#primis_intext",
-    "#vidazoo-player",
-    ".GRVPrimisVideo",
-    ".GRVVideo",
-    ".ac-lre-desktop",
-    ".ac-lre-player-ph",
-    ".ac-lre-wrapper",
-    ".ad-container--hot-video",
-    ".ae-player__itv",
-    ".aniview-inline-player",
-    ".aplvideo",
-    ".article-connatix-wrap",
-    ".article-detail-ad",
-    ".avp-p-wrapper",
-    ".card-captioned.crd > .crd--cnt > .s2nPlayer",
-    ".ck-anyclips",
-    ".ck-anyclips-article",
-    ".exco-container",
-    ".ez-sidebar-wall-ad",
-    ".ez-video-wrap",
-    ".inline-iframe.article--content-embed",
-    ".js-widget-distroscale",
-    ".js-widget-send-to-news",
-    ".jwPlayer--floatingContainer",
-    ".legion_primiswrapper",
-    ".mm-embed--sendtonews",
-    ".mm-widget--sendtonews",
-    ".oovvuu-embed-player",
-    ".pbs__player",
-    ".playwire-article-leaderboard-ad",
-    ".pmc-contextual-player",
-    ".pop-out-eplayer-container",
-    ".primis-ad",
-    ".primis-ad-wrap",
-    ".primis-custom",
-    ".primis-player",
-    ".primis-player__container",
-    ".primis-video-player",
-    ".primis_1",
-    ".s2nContainer",
-    ".send-to-news",
-    ".van_vid_carousel",
-    ".vid-present > .van_vid_carousel__padding",
-    ".video--container--aniview",
-    ".vidible-wrapper",
-    ".wps-player-wrap",
-    '[class^="s2nPlayer"]',
-    ".BeOpWidget",
-    'a[href^="http://https://www.get-express-vpn.com/offer/"]',
-    'a[href^="https://affiliate.rusvpn.com/click.php?"]',
-    'a[href^="https://billing.purevpn.com/aff.php"] > img',
-    'a[href^="https://fastestvpn.com/lifetime-special-deal?a_aid="]',
-    'a[href^="https://get.surfshark.net/aff_c?"][href*="&aff_id="] > img',
-    'a[href^="https://go.nordvpn.net/aff"] > img',
-    'a[href^="https://torguard.net/aff.php"] > img',
-    'a[href^="https://track.ultravpn.com/"]',
-    'a[href^="https://www.get-express-vpn.com/offer/"]',
-    'a[href^="https://www.goldenfrog.com/vyprvpn?offer_id="][href*="&aff_id="]',
-    'a[href^="https://www.privateinternetaccess.com/"] > img',
-    'a[href^="https://www.purevpn.com/"][href*="&utm_source=aff-"]',
-    ".grid > .container > #aside-promotion",
-    ".default_rc_theme",
-    ".inf-onclickvideo-adbox",
-    ".inf-onclickvideo-container",
-    ".add-box-side",
-    ".add-box-top",
-    ".partner-loading-shown.partner-label",
-    ".brave-overlay",
-    'div[id*="MarketGid"]',
-    'div[id*="ScriptRoot"]',
-    "#ezmob_footer",
-    ".impo-b-overlay",
-    ".impo-b-stitial",
-    ".rec-sponsored",
-    ".rec_article_footer",
-    ".rec_article_right",
-    ".rec_container__right",
-    ".rec_container_footer",
-    ".rec_container_right",
-    ".rec_title_footer",
-    '[onclick*="content.ad/"]',
-    ".amp-ad",
-    ".amp-ad-container",
-    ".amp-ad__wrapper",
-    ".amp-ads",
-    ".amp-ads-container",
-    ".amp-adv-container",
-    ".amp-adv-wrapper",
-    ".amp-article-ad-element",
-    ".amp-flying-carpet-text-border",
-    ".amp-sticky-ad-custom",
-    ".amp-sticky-ads",
-    ".amp-unresolved",
-    ".amp_ad_1",
-    ".amp_ad_header",
-    ".amp_ad_wrapper",
-    ".ampad",
-    ".ct_ampad",
-    ".spotim-amp-list-ad",
-    "AMP-AD",
-    "amp-ad",
-    "amp-ad-custom",
-    "amp-connatix-player",
-    "amp-fx-flying-carpet",
-    "#mobile-swipe-banner",
-    "#banner_pos1_ddb_0",
-    "#banner_pos2_ddb_0",
-    "#banner_pos3_ddb_0",
-    "#banner_pos4_ddb_0",
-    "#rightrail_bottom_ddb_0",
-    "#rightrail_pos1_ddb_0",
-    "#rightrail_pos2_ddb_0",
-    "#rightrail_pos3_ddb_0",
-    "#rightrail_top_ddb_0",
-    "#story_bottom_ddb_0",
-    "#story_top_ddb_0",
-    ".premium_PremiumPlacement__2dEp0",
-    "#ultimedia_wrapper",
-    ".brandpost_inarticle",
-    ".container-content__container-relatedlinks",
-    "#pubexchange_below_content",
-    ".pubexchange_module",
-    "#adv_outbrain_SB_1_sidebar",
-    "#ao-article-outbrain",
-    "#ao-sidebar-outbrain",
-    "#container-outbrain-sticky",
-    "#js-outbrain-ads-module",
-    "#js-outbrain-rightrail-ads-module",
-    "#outbrain-wrapper",
-    "#outbrainAdWrapper",
-    "#outbrain_dual_ad_fs_0_dual",
-    "#outbrain_vertical",
-    "#sponsored-outbrain-1",
-    ".Cheat__outbrain",
-    '.OUTBRAIN[data-widget-id^="FMS_REELD_"]',
-    ".adv_outbrain",
-    ".ht_outbrain",
-    ".js-outbrain-container",
-    ".ob-ad-carousel-layout",
-    ".ob-hover",
-    ".ob-p.ob-dynamic-rec-container",
-    ".ob-strip-layout",
-    ".outBrainWrapper",
-    ".outbrain-ad-slot",
-    ".outbrain-ad-units",
-    ".outbrain-bg",
-    ".outbrain-widget",
-    ".outbrainAdHeight",
-    ".outbrain_ad_li",
-    ".outbrain_dual_ad_whats_class",
-    ".outbrain_ul_ad_top",
-    ".outbrainad",
-    ".promoted-outbrain",
-    ".responsive-ad-outbrain",
-    ".single__outbrain",
-    'a[data-obtrack^="http://paid.outbrain.com/network/redir?"]',
-    'a[data-oburl^="https://paid.outbrain.com/network/redir?"]',
-    'a[data-redirect^="https://paid.outbrain.com/network/redir?"]',
-    'a[data-url^="http://paid.outbrain.com/network/redir?"] + .author',
-    'a[data-widget-outbrain-redirect^="http://paid.outbrain.com/network/redir?"]',
-    'a[href^="https://paid.outbrain.com/network/redir?"]',
-    'a[onmousedown^="this.href=\'http://paid.outbrain.com/network/redir?"][target="_blank"]',
-    'a[onmousedown^="this.href=\'http://paid.outbrain.com/network/redir?"][target="_blank"] + .ob_source',
-    'a[onmousedown^="this.href=\'https://paid.outbrain.com/network/redir?"][target="_blank"]',
-    'a[onmousedown^="this.href=\'https://paid.outbrain.com/network/redir?"][target="_blank"] + .ob_source',
-    'a[target="_blank"][onmousedown="this.href^=\'http://paid.outbrain.com/network/redir?"]',
-    "#block-boxes-taboola",
-    "#component-taboola-below-article-feed",
-    "#component-taboola-below-article-feed-2",
-    "#component-taboola-below-homepage-feed",
-    "#fake_taboola_fallback",
-    "#ra-taboola-bottom",
-    "#taboola-ad",
-    "#taboola-adverts",
-    "#taboola-below",
-    "#taboola-below-article-1",
-    "#taboola-below-article-thumbnails",
-    "#taboola-below-article-thumbnails-express",
-    "#taboola-below-article-thumbnails-v2",
-    "#taboola-below-forum-thumbnails",
-    "#taboola-content",
-    "#taboola-footer-ad",
-    "#taboola-main-container",
-    "#taboola-mid-article-thumbnails",
-    "#taboola-mid-article-thumbnails-ii",
-    "#taboola-mobile-article-thumbnails",
-    "#taboola-placeholder",
-    "#taboola-right-rail",
-    "#taboola-right-rail-express",
-    "#taboola-top-banner-abp",
-    "#taboola_related",
-    "#taboola_responsive_wrapper",
-    ".ab_taboola",
-    ".ad-container--taboola",
-    ".article-body__suppl_content--taboola-mid-article",
-    ".article-footer--taboola",
-    ".article-taboola",
-    ".box-taboola-content",
-    ".dart-ad-taboola",
-    ".for-taboola",
-    ".grid__module-sizer_name_taboola",
-    ".grv-taboola",
-    ".nw-taboola",
-    ".nya-slot[style]",
-    ".qa-placement-outbrain-under-post-cr",
-    ".tablet_ad_box",
-    ".tablet_ad_head",
-    ".taboola-above-article",
-    ".taboola-above-article-thumbnails",
-    ".taboola-ad",
-    ".taboola-block",
-    ".taboola-general",
-    ".taboola-in-plug-wrap",
-    ".taboola-inbetweener",
-    ".taboola-item",
-    ".taboola-left-rail-wrapper",
-    ".taboola-partnerlinks-ad",
-    ".taboola-placeholder",
-    ".taboola-placement",
-    ".taboola-single-asset-ads",
-    ".taboola-unit",
-    ".taboola-widget",
-    ".taboolaArticle",
-    ".taboolaHeight",
-    ".taboola__container",
-    ".taboola_advertising",
-    ".taboola_blk",
-    ".taboola_block1",
-    ".taboola_container",
-    ".taboola_lhs",
-    ".tbl-floating-unit",
-    ".tncls_taboola",
-    ".trb_taboola",
-    ".trc_excludable.syndicatedItem",
-    ".trc_rbox .syndicatedItem",
-    ".trc_rbox_border_elm .syndicatedItem",
-    ".trc_rbox_div .syndicatedItem",
-    ".trc_rbox_div .syndicatedItemUB",
-    '.trc_related_container div[data-item-syndicated="true"]',
-    ".van_taboola",
-    ".widget_taboola",
-    'amp-embed[type="taboola"]',
-    'div[id^="taboola-stream-"]',
-    "#boxes-box-zergnet_module",
-    "#right_rail-zergnet",
-    "#zergnet",
-    "#zergnet-wrapper",
-    ".ZERGNET",
-    ".adLocation-zerg",
-    ".component-zergnet",
-    ".content-zergnet",
-    ".js-footer-zerg",
-    ".module-zerg",
-    ".o-zergnet",
-    ".post-zergnet-wrap",
-    ".sidebar-zergnet",
-    ".td-zergnet",
-    ".widget-ami-zergnet",
-    ".widget_ok_zergnet_widget",
-    ".zerg-colm",
-    ".zerg-widget",
-    ".zerg-widgets",
-    ".zergmod",
-    ".zergnet",
-    ".zergnet-holder",
-    ".zergnet-row",
-    ".zergnet-unit",
-    ".zergnet-widget",
-    ".zergnet-widget-container",
-    ".zergnet-widget__header",
-    ".zergnet-widget__subtitle",
-    ".zergnetBLock",
-    ".zergnet__container",
-    ".zergnetpower",
-    ".zergpowered",
-    "display-ad-component",
-    'div[id^="zergnet-widget"]',
-    '.resultsList > div > div > div > div.G-5c[role="tab"][tabindex="0"] > .yuAt-pres-rounded',
-    '.resultsList > div > div > div > div[data-resultid$="-sponsored"]',
-]
@@ -0,0 +1,243 @@
+"""
+On-disk cache of the results of the ExperimentMetrics and OBAAnalysis methods.
+
+The methods decorated with `cached_result` read the crawl database. Their
+results are kept in the `results/result_cache` directory of the experiment.
+The key of a result is the method, its arguments, the settings of the instance
+and a fingerprint of the files it reads: the crawl database and the
+experiment config. A database that changes invalidates all the results that
+were computed from it.
+
+DataFrames are stored as Parquet files, and the other results, such as lists
+of tuples, are pickled. The least recently used results are evicted when the
+cache grows over `max_bytes`. A cache hit is logged with the time that the
+method took to compute it.
+
+Usage:
+    class ExperimentMetrics:
+        def __init__(self, ...):
+            self.result_cache = ResultCache(cache_dir, [data_path, config_path])
+
+        @cached_result
+        def get_ads_summary(self):
+            ...
+
+    ExperimentMetrics(experiment_name, cache_results=False)  # Bypasses the cache
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import pickle
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_NAME = "result_cache"
+DEFAULT_MAX_BYTES = 2 * 1024**3
+# Key of the Parquet metadata with the seconds that the result took to compute
+SECONDS_METADATA_KEY = b"oba.result_cache.seconds"
+
+
+def file_fingerprint(path: Union[str, Path]) -> List[Any]:
+    """Path, modification time and size of a file, None for the ones of a missing file"""
+    path = os.path.abspath(path)
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return [path, None, None]
+    return [path, stat.st_mtime_ns, stat.st_size]
+
+
+def digest(value: Any) -> str:
+    """Digest of a JSON serializable value, raises TypeError if it isn't"""
+    return hashlib.sha256(json.dumps(value).encode()).hexdigest()
+
+
+class ResultCache:
+    """
+    :param cache_dir: Directory of the cached results.
+    :param paths: Files that the results are computed from. The write-ahead
+        log of a SQLite database is fingerprinted with it when it has frames
+        that aren't in the database yet.
+    :param settings: Settings of the instance that change the results.
+    :param max_bytes: Size of the cache over which the least recently used
+        results are evicted.
+    :param enabled: If False, the methods are always computed.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        paths: Iterable[Union[str, Path]],
+        settings: Sequence[Any] = (),
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        enabled: bool = True,
+    ) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.paths = list(paths)
+        self.settings = list(settings)
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+
+    def files_digest(self) -> str:
+        fingerprints = []
+        for path in self.paths:
+            fingerprints.append(file_fingerprint(path))
+            # SQLite creates an empty write-ahead log when a database in WAL
+            # mode is opened and deletes it when the database is closed
+            wal_fingerprint = file_fingerprint(f"{path}-wal")
+            if wal_fingerprint[2]:
+                fingerprints.append(wal_fingerprint)
+        return digest(fingerprints)
+
+    def entry_path(self, name: str, files_digest: str, arguments_digest: str) -> Path:
+        # The digest of the files comes before the one of the arguments, so that
+        # the results of a previous version of the database are found by name
+        return (
+            self.cache_dir
+            / f"{name.replace('.', '-')}-{files_digest[:12]}-{arguments_digest[:20]}"
+        )
+
+    def arguments_digest(self, name: str, args: Tuple, kwargs: dict) -> Optional[str]:
+        """Digest of the arguments of a call, None if they can't be serialized"""
+        try:
+            return digest([name, self.settings, list(args), sorted(kwargs.items())])
+        except TypeError:
+            return None
+
+    def load(self, entry: Path) -> Tuple[bool, Any, float]:
+        """If the result is cached, the result and the seconds it took to compute"""
+        parquet_path = entry.with_suffix(".parquet")
+        pickle_path = entry.with_suffix(".pkl")
+        if parquet_path.is_file():
+            table = pq.read_table(parquet_path)
+            seconds = float((table.schema.metadata or {}).get(SECONDS_METADATA_KEY, 0))
+            result = table.to_pandas()
+            # The lists of the list columns are read as arrays, with nulls for
+            # the NaN of the categories that pandas aggregated to lists
+            for field in table.schema:
+                if pa.types.is_list(field.type) and field.name in result.columns:
+                    result[field.name] = result[field.name].map(
+                        lambda values: (
+                            [np.nan if value is None else value for value in values]
+                            if values is not None
+                            else None
+                        )
+                    )
+            path = parquet_path
+        elif pickle_path.is_file():
+            with open(pickle_path, "rb") as f:
+                seconds, result = pickle.load(f)
+            path = pickle_path
+        else:
+            return False, None, 0.0
+        # The modification time orders the results for the eviction
+        os.utime(path)
+        return True, result, seconds
+
+    def store(self, entry: Path, result: Any, seconds: float) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        temp_path = entry.with_suffix(".tmp")
+        path = entry.with_suffix(".pkl")
+        try:
+            if isinstance(result, pd.DataFrame):
+                try:
+                    table = pa.Table.from_pandas(result)
+                except (
+                    pa.ArrowInvalid,
+                    pa.ArrowTypeError,
+                    pa.ArrowNotImplementedError,
+                ):
+                    # Columns of mixed types are pickled
+                    pass
+                else:
+                    table = table.replace_schema_metadata(
+                        {
+                            **(table.schema.metadata or {}),
+                            SECONDS_METADATA_KEY: str(seconds).encode(),
+                        }
+                    )
+                    pq.write_table(table, temp_path)
+                    path = entry.with_suffix(".parquet")
+            if path.suffix == ".pkl":
+                with open(temp_path, "wb") as f:
+                    pickle.dump((seconds, result), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            logger.warning("The result of %s can't be cached", entry.name)
+            temp_path.unlink(missing_ok=True)
+            return
+        os.replace(temp_path, path)
+        self.evict(current_digest=entry.name.split("-")[-2])
+
+    def evict(self, current_digest: Optional[str] = None) -> None:
+        """Removes the results of previous versions of the files, and the least recently used results over max_bytes"""
+        entries = []
+        for path in self.cache_dir.glob("*-*-*.*"):
+            if path.suffix not in (".parquet", ".pkl"):
+                continue
+            if current_digest and path.stem.split("-")[-2] != current_digest:
+                path.unlink()
+                continue
+            stat = path.stat()
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            path.unlink()
+            total_bytes -= size
+
+    def clear(self) -> None:
+        for path in self.cache_dir.glob("*-*-*.*"):
+            path.unlink()
+
+
+def cached_result(method: Callable) -> Callable:
+    """Caches the results of a method in the `result_cache` of its instance, if it has one"""
+
+    @functools.wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        cache: Optional[ResultCache] = getattr(self, "result_cache", None)
+        if cache is None or not cache.enabled:
+            return method(self, *args, **kwargs)
+        name = f"{type(self).__name__}.{method.__name__}"
+        arguments_digest = cache.arguments_digest(name, args, kwargs)
+        if arguments_digest is None:
+            return method(self, *args, **kwargs)
+
+        start = time.perf_counter()
+        hit, result, seconds = cache.load(
+            cache.entry_path(name, cache.files_digest(), arguments_digest)
+        )
+        if hit:
+            load_seconds = time.perf_counter() - start
+            logger.info(
+                "Cached result of %s loaded in %.2f s, %.2f s saved",
+                name,
+                load_seconds,
+                max(seconds - load_seconds, 0.0),
+            )
+            return result
+
+        start = time.perf_counter()
+        result = method(self, *args, **kwargs)
+        seconds = time.perf_counter() - start
+        # Fingerprinted after the call, as some methods persist lookups in the database
+        cache.store(
+            cache.entry_path(name, cache.files_digest(), arguments_digest),
+            result,
+            seconds,
+        )
+        return result
+
+    return wrapper
@@ -1,13 +1,11 @@
 from datetime import datetime
 import json
-import os
 import sqlite3
 import pandas as pd
-from adblockparser import AdblockRules
 import time
-from tqdm import tqdm
-import tldextract
 import csv
+from oba.domain_extractor import registered_domains
+from oba.tracker_domain_index import TrackerDomainIndex
 from oba.experiment_metrics import ExperimentMetrics
 
 # CONTROL_RUN
@@ -115,19 +113,8 @@ def fetch_entries_by_limits_and_site_url(
 # First we need to connect the database
 conn = sqlite3.connect(oba_db_path)
 
-# Open files to get the block lists
-
-# First get the actual absolute path of the script
-script_path = os.path.abspath(__file__)
-script_dir = os.path.dirname(script_path)
-
-
-with open(f"{script_dir}/tracking_lists/easyprivacy-justdomains.txt") as f:
-    easyprivacy_list = f.read().splitlines()
-with open(f"{script_dir}/tracking_lists/easylist-justdomains.txt") as f:
-    easylist_list = f.read().splitlines()
-with open(f"{script_dir}/tracking_lists/adserverlist-justdomains.txt") as f:
-    adserverlist_list = f.read().splitlines()
+# Load the tracking lists into the domain index
+tracker_index = TrackerDomainIndex.from_directory()
 
 # Query all the cookies from the database with host ordered by id
 query = """
@@ -151,50 +138,24 @@ df_cookies = pd.DataFrame(
     columns=["id", "host", "name", "value", "visit_url"],
 )
 
-# Create a set with the unique hosts
-# Add the host_domain and visit_url_domain to the DataFrame
-df_cookies["host_domain"] = df_cookies["host"].apply(
-    lambda x: tldextract.extract(x).registered_domain
-)
-unique_hosts_domain = set(df_cookies["host_domain"])
-block_results = {}
-
-# Evaluate the rules for each host
+# Classify the unique hosts against the tracking lists, a host also matches
+# when one of its parent domains is listed
 start_time = time.time()
-print(
-    f"Starting Tracking Evaluation processing for {len(unique_hosts_domain)} hosts..."
-)
-for host_domain in tqdm(unique_hosts_domain):
-    # easyprivacy_result = easyprivacy_rules.should_block(host, rule_params)
-    # easylist_result = easylist_rules.should_block(host, rule_params)
-    # adserverlist_result = adserverlist_rules.should_block(host, rule_params)
-    # block_results[host] = [easyprivacy_result, easylist_result, adserverlist_result]
-
-    block_results[host_domain] = [
-        host_domain in easyprivacy_list,
-        host_domain in easylist_list,
-        host_domain in adserverlist_list,
-    ]
+print("Starting Tracking Evaluation processing...")
+block_results = tracker_index.classify(df_cookies["host"])
 end_time = time.time()
 
-
 print(
     f"Finished evaluating all unique HOSTS after {end_time - start_time:.2f} seconds."
 )
 
-
-df_cookies["easyprivacy"] = df_cookies["host_domain"].apply(
-    lambda x: block_results[x][0]
-)
-df_cookies["easylist"] = df_cookies["host_domain"].apply(lambda x: block_results[x][1])
-df_cookies["adserverlist"] = df_cookies["host_domain"].apply(
-    lambda x: block_results[x][2]
-)
+df_cookies["host_domain"] = block_results["domain"]
+df_cookies["easyprivacy"] = block_results["easyprivacy"]
+df_cookies["easylist"] = block_results["easylist"]
+df_cookies["adserverlist"] = block_results["adserverlist"]
 
 # Check for third-party cookies
-df_cookies["visit_url_domain"] = df_cookies["visit_url"].apply(
-    lambda x: tldextract.extract(x).registered_domain
-)
+df_cookies["visit_url_domain"] = registered_domains(df_cookies["visit_url"])
 
 df_cookies["third_party"] = df_cookies["host_domain"] != df_cookies["visit_url_domain"]
 
@@ -1,8 +1,8 @@
 import requests
-from adblockparser import AdblockRules
 import csv
 import time
 from tqdm import tqdm
+from oba.network_filter import NetworkFilterEngine
 
 # EXPERIMENT IN VOLUME
 # EXPERIMENT_NAME = "style_and_fashion_experiment_do_nothing"
@@ -28,15 +28,17 @@ easylist_content = requests.get(easylist_url).text
 adserverlist_url = "https://pgl.yoyo.org/adservers/serverlist.php?hostformat=hosts&showintro=1&mimetype=plaintext"
 adserverlist_content = requests.get(adserverlist_url).text
 
-easyprivacy_rules = AdblockRules(easyprivacy_content.splitlines())
-easylist_rules = AdblockRules(easylist_content.splitlines())
-adserverlist_rules = AdblockRules(adserverlist_content.splitlines())
+filter_engine = NetworkFilterEngine(
+    {
+        "easyprivacy": easyprivacy_content.splitlines(),
+        "easylist": easylist_content.splitlines(),
+        "adserverlist": adserverlist_content.splitlines(),
+    }
+)
 
 end_time = time.time()
 print(f"Fetched all rules in {end_time - start_time:.2f} seconds.")
 
-rule_params = {"third-party": True}
-
 http_requests_file = f"{EXPERIMENT_DIR}/results/http_requests_url_2.txt"
 
 # Open the file and read the URLs
@@ -51,10 +53,12 @@ block_results = {}
 start_time = time.time()
 print(f"Starting Third Party Evaluation processing for {len(unique_urls)} URLs...")
 for url in tqdm(unique_urls):
-    easyprivacy_result = easyprivacy_rules.should_block(url, rule_params)
-    easylist_result = easylist_rules.should_block(url, rule_params)
-    adserverlist_result = adserverlist_rules.should_block(url, rule_params)
-    block_results[url] = [easyprivacy_result, easylist_result, adserverlist_result]
+    verdicts = filter_engine.should_block(url, third_party=True)
+    block_results[url] = [
+        verdicts["easyprivacy"],
+        verdicts["easylist"],
+        verdicts["adserverlist"],
+    ]
 end_time = time.time()
 
 print(
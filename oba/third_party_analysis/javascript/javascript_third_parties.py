@@ -2,7 +2,7 @@ import pandas as pd
 import sqlite3
 from datetime import datetime
 from tqdm import tqdm
-import tldextract
+from oba.domain_extractor import registered_domains
 
 
 def print_timestamped_message(message):
@@ -57,13 +57,9 @@ if len(df_js_urls) == len(csv_df):
 
     # Assuming the row order in the CSV and queried DataFrame matches exactly
     # Add new columns to the CSV df with the second level domain of the url and the visit_url, and the third party status according to the library
-    script_url_domains = df_js_urls["script_url"].apply(
-        lambda x: tldextract.extract(x).registered_domain
-    )
+    script_url_domains = registered_domains(df_js_urls["script_url"])
 
-    visit_url_domains = df_js_urls["visit_url"].apply(
-        lambda x: tldextract.extract(x).registered_domain
-    )
+    visit_url_domains = registered_domains(df_js_urls["visit_url"])
 
     # Add the third party status according to the library
     csv_df["third_party"] = script_url_domains != visit_url_domains
@@ -0,0 +1,280 @@
+"""
+Streaming third-party labeling of the http_requests and javascript tables.
+
+Replaces the chain of dumping the URLs to text files (`read_sqlite3.py`),
+classifying them into a CSV (`optimized_*_url.py`) and joining the CSV back to
+the database by row count (`*_third_parties.py`). The rows are read straight
+from the crawl database in chunks ordered by id, every distinct URL is
+classified once with the network filter engine, and the labels
+`(id, easyprivacy, easylist, adserverlist, third_party)` are written to the
+`<table>_labels` side table, or to Parquet files with `parquet_dir`.
+
+The last labeled id of every table is kept in the third_party_labels_state
+table, so an interrupted run resumes where it stopped. The labels are
+computed again from scratch when the filter lists change. The downloaded lists
+are saved in `--lists-dir` and used again by the next runs, so that an update
+of the lists upstream doesn't restart them; `--refresh-lists` downloads them
+again.
+
+The labels are joined to the requests by id:
+    SELECT hr.*, l.* FROM http_requests hr JOIN http_requests_labels l USING (id)
+
+Usage:
+    python -m oba.third_party_labeling datadir/<experiment>/crawl-data.sqlite
+        [--lists-dir DIR] [--refresh-lists]
+"""
+
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import requests
+
+from .domain_extractor import registered_domain
+from .enums_data_processer import ThirdPartyLabelsQueries
+from .network_filter import NetworkFilterEngine
+
+FILTER_LIST_URLS = {
+    "easyprivacy": "https://easylist.to/easylist/easyprivacy.txt",
+    "easylist": "https://easylist.to/easylist/easylist.txt",
+    "adserverlist": "https://pgl.yoyo.org/adservers/serverlist.php?hostformat=hosts&showintro=1&mimetype=plaintext",
+}
+LABEL_LISTS = ("easyprivacy", "easylist", "adserverlist")
+LABEL_COLUMNS = ("id",) + LABEL_LISTS + ("third_party",)
+DEFAULT_LISTS_DIR = Path(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "datadir_filter_lists")
+)
+
+DEFAULT_CHUNK_SIZE = 50_000
+DEFAULT_CACHE_SIZE = 200_000
+
+LabelRow = Tuple[int, bool, bool, bool, bool]
+
+
+def _download(url: str) -> str:
+    response = requests.get(url, timeout=60)
+    response.raise_for_status()
+    return response.text
+
+
+def fetch_filter_engine(
+    list_urls: Dict[str, str] = FILTER_LIST_URLS,
+    lists_dir: Optional[Union[str, Path]] = None,
+    refresh: bool = False,
+) -> NetworkFilterEngine:
+    """
+    Downloads the filter lists and builds the engine.
+
+    :param lists_dir: Directory where the lists are saved as `<name>.txt`. The
+        lists already saved there are used instead of being downloaded again.
+    :param refresh: Download the lists saved in `lists_dir` again.
+    """
+    if lists_dir is None:
+        return NetworkFilterEngine(
+            {name: _download(url).splitlines() for name, url in list_urls.items()}
+        )
+    paths = {}
+    for name, url in list_urls.items():
+        path = Path(lists_dir) / f"{name}.txt"
+        if refresh or not path.is_file():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_name(f".{path.name}.tmp")
+            temp_path.write_text(_download(url), encoding="utf-8")
+            os.replace(temp_path, path)
+        paths[name] = path
+    return NetworkFilterEngine.from_files(paths)
+
+
+class ThirdPartyLabeler:
+    """
+    :param engine: Engine with the easyprivacy, easylist and adserverlist lists.
+    :param chunk_size: Rows read, labeled and written at a time.
+    :param cache_size: Distinct (url, third_party) verdicts kept between chunks.
+    """
+
+    def __init__(
+        self,
+        engine: NetworkFilterEngine,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        missing_lists = set(LABEL_LISTS) - set(engine.list_names)
+        if missing_lists:
+            raise ValueError(f"The engine has no {', '.join(sorted(missing_lists))}")
+        self.engine = engine
+        self.chunk_size = chunk_size
+        self.cache_size = cache_size
+        self._verdicts: "OrderedDict[Tuple[str, bool], Tuple[bool, ...]]" = (
+            OrderedDict()
+        )
+        self.classified_urls = 0
+
+    def _classify(self, url: Optional[str], third_party: bool) -> Tuple[bool, ...]:
+        if not url:
+            return (False,) * len(LABEL_LISTS)
+        key = (url, third_party)
+        verdicts = self._verdicts.get(key)
+        if verdicts is not None:
+            self._verdicts.move_to_end(key)
+            return verdicts
+        block = self.engine.should_block(url, third_party=third_party)
+        verdicts = tuple(block[name] for name in LABEL_LISTS)
+        self.classified_urls += 1
+        self._verdicts[key] = verdicts
+        if len(self._verdicts) > self.cache_size:
+            self._verdicts.popitem(last=False)
+        return verdicts
+
+    def label_rows(
+        self, rows: Sequence[Tuple[int, Optional[str], Optional[str]]]
+    ) -> List[LabelRow]:
+        """Labels (id, url, site_url) rows"""
+        labels: List[LabelRow] = []
+        for row_id, url, site_url in rows:
+            third_party = registered_domain(url) != registered_domain(site_url)
+            easyprivacy, easylist, adserverlist = self._classify(url, third_party)
+            labels.append((row_id, easyprivacy, easylist, adserverlist, third_party))
+        return labels
+
+    def label_table(
+        self,
+        crawl_conn: sqlite3.Connection,
+        table: str,
+        parquet_dir: Optional[Union[str, Path]] = None,
+    ) -> Dict[str, float]:
+        """
+        Labels the rows of `table` added since the last run.
+
+        :param parquet_dir: Directory where the labels are written as
+            `<table>/part-<first id>.parquet` files instead of the side table.
+        :return: The number of labeled rows and classified URLs and the time it took.
+        """
+        if table not in ThirdPartyLabelsQueries.URL_COLUMNS:
+            raise ValueError(f"Unknown table: {table}")
+        start_time = time.time()
+        cursor = crawl_conn.cursor()
+        parts_dir = Path(parquet_dir) / table if parquet_dir is not None else None
+        # The state is kept by destination: the side table or the Parquet directory
+        labels_key = (
+            f"{table}_labels" if parts_dir is None else str(parts_dir.resolve())
+        )
+        cursor.execute(ThirdPartyLabelsQueries.CreateStateTableQuery)
+        cursor.execute(ThirdPartyLabelsQueries.SelectStateQuery, {"labels": labels_key})
+        state = cursor.fetchone()
+        last_id = state[0] if state and state[1] == self.engine.digest else 0
+        if parts_dir is not None:
+            parts_dir.mkdir(parents=True, exist_ok=True)
+            # Parts written after the last committed state are written again
+            for part in parts_dir.glob("part-*.parquet"):
+                if int(part.stem[len("part-") :]) > last_id:
+                    part.unlink()
+        else:
+            cursor.execute(ThirdPartyLabelsQueries.create_labels_table_query(table))
+            if last_id == 0:
+                cursor.execute(ThirdPartyLabelsQueries.delete_labels_query(table))
+
+        labeled_rows = 0
+        classified_urls = self.classified_urls
+        while True:
+            cursor.execute(
+                ThirdPartyLabelsQueries.select_unlabeled_rows_query(table),
+                {"last_id": last_id, "limit": self.chunk_size},
+            )
+            rows = cursor.fetchall()
+            if not rows:
+                break
+            labels = self.label_rows(rows)
+            if parts_dir is not None:
+                self._write_parquet(
+                    parts_dir / f"part-{rows[0][0]:012d}.parquet", labels
+                )
+            else:
+                cursor.executemany(
+                    ThirdPartyLabelsQueries.insert_labels_query(table), labels
+                )
+            last_id = rows[-1][0]
+            labeled_rows += len(rows)
+            # The labels and the state are committed together
+            cursor.execute(
+                ThirdPartyLabelsQueries.UpsertStateQuery,
+                {
+                    "labels": labels_key,
+                    "last_id": last_id,
+                    "lists_digest": self.engine.digest,
+                },
+            )
+            crawl_conn.commit()
+            print(f"[{table.upper()} LABELS] Labeled up to id {last_id}")
+
+        crawl_conn.commit()
+        return {
+            "labeled": labeled_rows,
+            "classified_urls": self.classified_urls - classified_urls,
+            "seconds": time.time() - start_time,
+        }
+
+    @staticmethod
+    def _write_parquet(path: Path, labels: List[LabelRow]) -> None:
+        columns = list(zip(*labels))
+        pq.write_table(
+            pa.table(
+                {
+                    name: pa.array(
+                        values, type=pa.int64() if name == "id" else pa.bool_()
+                    )
+                    for name, values in zip(LABEL_COLUMNS, columns)
+                }
+            ),
+            path,
+        )
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Label the http_requests and javascript rows of crawl databases with the filter list verdicts and their third-party status"
+    )
+    parser.add_argument("crawl_db_paths", nargs="+", type=Path)
+    parser.add_argument(
+        "--tables",
+        nargs="+",
+        default=list(ThirdPartyLabelsQueries.URL_COLUMNS),
+        choices=list(ThirdPartyLabelsQueries.URL_COLUMNS),
+    )
+    parser.add_argument("--parquet-dir", type=Path, default=None)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument(
+        "--lists-dir",
+        type=Path,
+        default=DEFAULT_LISTS_DIR,
+        help="Filter lists used by the previous runs, or pinned lists as <name>.txt",
+    )
+    parser.add_argument(
+        "--refresh-lists",
+        action="store_true",
+        help="Download the filter lists again, which labels all the rows again",
+    )
+    args = parser.parse_args()
+
+    engine = fetch_filter_engine(lists_dir=args.lists_dir, refresh=args.refresh_lists)
+    labeler = ThirdPartyLabeler(engine, chunk_size=args.chunk_size)
+    for crawl_db_path in args.crawl_db_paths:
+        with sqlite3.connect(crawl_db_path) as crawl_conn:
+            for table in args.tables:
+                parquet_dir = (
+                    args.parquet_dir / crawl_db_path.parent.name
+                    if args.parquet_dir is not None
+                    else None
+                )
+                stats = labeler.label_table(crawl_conn, table, parquet_dir)
+                print(
+                    f"Labeled {stats['labeled']} {table} rows of {crawl_db_path}, "
+                    f"{stats['classified_urls']} URLs classified "
+                    f"in {stats['seconds']:.2f} seconds"
+                )
@@ -0,0 +1,129 @@
+"""
+Tracker domain classifier for the third-party analysis scripts.
+
+The `*-justdomains.txt` tracking lists are loaded once into:
+- a hashed set of domains per list, for exact matches in O(1),
+- a suffix trie keyed by the reversed labels of the domains, so the
+  subdomains of a listed domain (`stats.tracker.example` for
+  `tracker.example`) are matched with a single walk over the host labels.
+
+`classify` works on whole pandas Series: the hosts are deduplicated before
+running the domain extractor and the trie, and the results are mapped back to the rows.
+
+Usage:
+    index = TrackerDomainIndex.from_directory()
+    df = df.join(index.classify(df["host"]))
+"""
+
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, Mapping, Sequence, Union
+from urllib.parse import urlsplit
+
+import pandas as pd
+
+from .domain_extractor import registered_domain
+
+TRACKING_LISTS_DIR = (
+    Path(__file__).parent / "third_party_analysis" / "cookies" / "tracking_lists"
+)
+TRACKING_LISTS = ("easyprivacy", "easylist", "adserverlist")
+
+# Key of the lists ending at a trie node, can't clash with a domain label
+_LISTS_KEY = ""
+
+
+def normalize_host(value: str) -> str:
+    """Hostname of a URL or cookie host, lowercased and without leading dots"""
+    value = value.strip()
+    if "://" in value:
+        value = urlsplit(value).hostname or ""
+    return value.lower().lstrip(".").rstrip(".")
+
+
+class TrackerDomainIndex:
+    """
+    :param lists: Domains of every tracking list, by list name.
+    """
+
+    def __init__(self, lists: Mapping[str, Iterable[str]]) -> None:
+        self.list_names = tuple(lists)
+        self.domains: Dict[str, FrozenSet[str]] = {}
+        self.trie: dict = {}
+
+        matches: Dict[str, set] = {}
+        for list_name, domains in lists.items():
+            for domain in domains:
+                domain = normalize_host(domain)
+                if not domain or domain.startswith("#"):
+                    continue
+                matches.setdefault(domain, set()).add(list_name)
+
+        for domain, list_names in matches.items():
+            self.domains[domain] = frozenset(list_names)
+            node = self.trie
+            for label in reversed(domain.split(".")):
+                node = node.setdefault(label, {})
+            node[_LISTS_KEY] = self.domains[domain]
+
+    @classmethod
+    def from_directory(
+        cls,
+        directory: Union[str, Path] = TRACKING_LISTS_DIR,
+        list_names: Sequence[str] = TRACKING_LISTS,
+    ) -> "TrackerDomainIndex":
+        """Loads the `<list_name>-justdomains.txt` files of the directory"""
+        lists = {}
+        for list_name in list_names:
+            with open(Path(directory) / f"{list_name}-justdomains.txt") as f:
+                lists[list_name] = f.read().splitlines()
+        return cls(lists)
+
+    def __len__(self) -> int:
+        return len(self.domains)
+
+    def __contains__(self, host: str) -> bool:
+        return bool(self.match(host))
+
+    def match(self, host: str) -> FrozenSet[str]:
+        """Names of the lists that contain the host or one of its parent domains"""
+        host = normalize_host(host)
+        exact = self.domains.get(host)
+        if exact is not None and len(exact) == len(self.list_names):
+            return exact
+
+        matched: FrozenSet[str] = frozenset()
+        node = self.trie
+        for label in reversed(host.split(".")):
+            child = node.get(label)
+            if child is None:
+                break
+            node = child
+            list_names = node.get(_LISTS_KEY)
+            if list_names:
+                matched = matched | list_names
+        return matched
+
+    def classify(self, hosts: pd.Series) -> pd.DataFrame:
+        """
+        Classifies a Series of hosts or URLs. Returns a DataFrame with the same
+        index, the registered `domain` of every row and one boolean column per
+        tracking list, plus `tracker` when the row is in any of the lists.
+        """
+        codes, uniques = pd.factorize(hosts.fillna(""), sort=False)
+        unique_hosts = [normalize_host(host) for host in uniques]
+        unique_matches = [self.match(host) for host in unique_hosts]
+
+        columns = {
+            "domain": pd.Series(
+                [registered_domain(host) for host in unique_hosts],
+                dtype=object,
+            ).to_numpy()
+        }
+        for list_name in self.list_names:
+            columns[list_name] = pd.array(
+                [list_name in matches for matches in unique_matches], dtype=bool
+            )
+        columns["tracker"] = pd.array(
+            [bool(matches) for matches in unique_matches], dtype=bool
+        )
+        return pd.DataFrame(columns).iloc[codes].set_axis(hosts.index)
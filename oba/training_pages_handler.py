@@ -10,8 +10,10 @@ import aiohttp
 from tqdm import tqdm
 from tranco import Tranco
 
+from .categorization_cache import DEFAULT_CACHE_PATH, CategorizationCache
 from .categorizer import Categorizer
 from .enums import IAB_CATEGORIES, TrainingPagesQueries
+from .rate_limited_categorizer import RateLimitedCategorizer
 
 # sys.path.append("../openwpm")
 # from bannerclick.config import WATCHDOG
@@ -39,18 +41,33 @@ class TrainingPagesHandler:
         updated_tranco: bool = False,
         custom_list: bool = False,
         custom_pages_list: list = [],
+        categorization_cache_path: Optional[Path] = DEFAULT_CACHE_PATH,
+        offline_categorization: bool = False,
     ):
-        if categorize and (
-            not webshrinker_credentials
-            or webshrinker_credentials.keys() != {"api_key", "secret_key"}
+        if (
+            categorize
+            and not offline_categorization
+            and (
+                not webshrinker_credentials
+                or webshrinker_credentials.keys() != {"api_key", "secret_key"}
+            )
         ):
             raise ValueError(
                 "When using the categorization feature, valid credentials for"
                 " Webshrinker need to be provided"
             )
         self.n_pages = n_pages
-        if webshrinker_credentials:
-            self.categorizer = Categorizer(**webshrinker_credentials)
+        if webshrinker_credentials or offline_categorization:
+            # The categorizations are shared with the other lists and the experiments through the cache
+            self.categorizer = Categorizer(
+                **(webshrinker_credentials or {}),
+                cache=(
+                    CategorizationCache(categorization_cache_path)
+                    if categorization_cache_path
+                    else None
+                ),
+                offline=offline_categorization,
+            )
         else:
             self.categorizer = None
         self.custom_list = custom_list
@@ -188,70 +205,50 @@ class TrainingPagesHandler:
             return page_urls_without_categories
 
         async def _async_categorize(db_path, request_rate, urls_to_categorize):
-            """Categorize a list of URLs asyncronously given a request rate"""
+            """Categorize a list of URLs asyncronously given a request rate (requests per second)"""
             conn = sqlite3.connect(db_path)
             cursor = conn.cursor()
 
-            async with aiohttp.ClientSession() as session:
+            async with RateLimitedCategorizer(
+                self.categorizer, requests_per_second=request_rate
+            ) as client:
                 progress = tqdm(total=len(urls_to_categorize), desc="Categorizing")
-                sem = asyncio.Semaphore(request_rate)
 
                 async def fetch_and_store(url):
-                    async with sem:
-                        # TODO: Ask about limiting the number of retries
-                        # retries = 3  # Number of retries
-                        delay = 1  # Initial delay in seconds
-                        while True:
-                            response = await self.categorizer.categorize(
-                                session, url, taxonomy=taxonomy
-                            )
-                            if response["status_code"] == 200:
-                                # TODO: check case where we would need more than one "top_level_category"
-                                # Poblate RetrievedCategories with all the categories received (max 3 per url in case of normal sites url with WebShrinker taxonomy)
-                                for result in response["categories_response"]:
-                                    cursor.execute(
-                                        "SELECT id FROM TrainingPages WHERE page_url=?",
-                                        (url,),
-                                    )
-                                    page_id = cursor.fetchone()[0]
-                                    cursor.execute(
-                                        "INSERT INTO RetrievedCategories"
-                                        " (training_page_id, training_page_url,"
-                                        " category, taxonomy, taxonomy_tier,"
-                                        " taxonomy_id, confident) VALUES (?, ?, ?, ?,"
-                                        " ?, ?, ?)",
-                                        (
-                                            page_id,
-                                            url,
-                                            result["category"],
-                                            result["taxonomy"],
-                                            result["taxonomy_tier"],
-                                            result["taxonomy_id"],
-                                            result["confident"],
-                                        ),
-                                    )
-                                progress.update(1)
-                                print(f"[SUCCESS] Fetched categories for {url}")
-                                break
-                            elif response["status_code"] == 429:
-                                print(
-                                    f"[WARNING] Rate limit exceeded for {url}. Retrying"
-                                    f" in {delay} seconds..."
-                                )
-                                await asyncio.sleep(delay)
-                                if delay < 4:
-                                    delay *= 2  # Double the delay for each retry
-                                else:
-                                    delay += (
-                                        1  # Add only one second after for 4 seconds
-                                    )
-
-                            else:
-                                print(f"[ERROR] {response}")
-                                break
+                    response = await client.categorize(url, taxonomy=taxonomy)
+                    if response["status_code"] != 200:
+                        print(f"[ERROR] {response}")
+                        return
+                    # TODO: check case where we would need more than one "top_level_category"
+                    # Poblate RetrievedCategories with all the categories received (max 3 per url in case of normal sites url with WebShrinker taxonomy)
+                    for result in response["categories_response"]:
+                        cursor.execute(
+                            "SELECT id FROM TrainingPages WHERE page_url=?",
+                            (url,),
+                        )
+                        page_id = cursor.fetchone()[0]
+                        cursor.execute(
+                            "INSERT INTO RetrievedCategories"
+                            " (training_page_id, training_page_url,"
+                            " category, taxonomy, taxonomy_tier,"
+                            " taxonomy_id, confident) VALUES (?, ?, ?, ?,"
+                            " ?, ?, ?)",
+                            (
+                                page_id,
+                                url,
+                                result["category"],
+                                result["taxonomy"],
+                                result["taxonomy_tier"],
+                                result["taxonomy_id"],
+                                result["confident"],
+                            ),
+                        )
+                    progress.update(1)
+                    print(f"[SUCCESS] Fetched categories for {url}")
 
                 tasks = [fetch_and_store(url) for url in urls_to_categorize]
                 await asyncio.gather(*tasks)
+                client.print_stats()
 
                 conn.commit()
                 conn.close()
@@ -269,6 +266,8 @@ class TrainingPagesHandler:
         asyncio.run(
             _async_categorize(self.db_path, request_rate, uncategorized_training_pages)
         )
+        if self.categorizer.cache is not None:
+            self.categorizer.cache.print_stats()
 
     def get_training_pages_grouped_by_category(
         self,
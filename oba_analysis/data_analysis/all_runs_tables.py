@@ -1,60 +1,48 @@
 # The file was run from the fobam directory
 
 import pandas as pd
+from oba.analysis_runner import AnalysisRunner, Experiment, Step
+from oba.analysis_steps import ANALYSIS_STEPS
 from oba.oba_analysis import OBAAnalysis
-from oba.experiment_metrics import ExperimentMetrics
 
 RESULTS_DIR = "/Volumes/LaCie/OpenOBA/RESULTS/"
 
+# Index of the cookie banner option, see OBAAnalysis.generate_tables_by_session
+COOKIE_BANNER_OPTIONS = ["do_nothing", "accept", "reject"]
 
-def get_metrics_tables(experiment_name: str, cookie_banner_option: int, category: str):
-    # OBA RUN
 
-    oba_quantifier = OBAAnalysis(
-        experiment_name=experiment_name,
-        experiment_category=category,
-    )
-    ads_by_session = oba_quantifier.fetch_all_ads_by_browser_id_as_dict()
-    oba_quantifier.generate_tables_by_session(
-        ads_by_session, cookie_banner_option=cookie_banner_option
+def cookie_banner_option(experiment: Experiment) -> int:
+    return COOKIE_BANNER_OPTIONS.index(
+        experiment.name.replace("style_and_fashion_experiment_", "").replace(
+            "control_run_", ""
+        )
     )
-    oba_quantifier.disconnect()
-
-    experiment_metrics = ExperimentMetrics(experiment_name)
 
-    experiment_summary_df = experiment_metrics.get_experiment_summary()
 
-    # CONTROL RUN
-    # This part is for the ordering of amount of visits by URL to be aligned with the experiment_summary_df
-    numvisits_by_browser_id_and_url = (
-        experiment_metrics.get_control_visits_by_url_and_browser()
-    )
-
-    experiment_control_name = (
-        f"control_run_{['do_nothing', 'accept', 'reject'][cookie_banner_option]}"
+def session_tables(context, session_ads):
+    """Tables of the ads by session in the results directory of the experiment"""
+    oba_quantifier = OBAAnalysis(
+        experiment_name=context.experiment.name,
+        experiment_category=context.experiment.category,
+        control_runs=context.experiment.control_runs,
     )
-    control_runs = OBAAnalysis(
-        experiment_name=experiment_control_name,
-        experiment_category=category,
-        control_runs=True,
+    oba_quantifier.generate_tables_by_session(
+        session_ads, cookie_banner_option=cookie_banner_option(context.experiment)
     )
 
-    control_run_ads = (
-        control_runs.fetch_all_ads_grouped_by_artificial_sessions_and_site_url(
-            numvisits_by_browser_id_and_url
-        )
-    )
 
-    control_runs.generate_tables_by_session(
-        control_run_ads, cookie_banner_option=cookie_banner_option
-    )
+STEPS = ANALYSIS_STEPS + [
+    Step("session_tables", session_tables, ("session_ads",), cache=False)
+]
 
-    control_runs.disconnect()
 
-    experiment_control_metrics = ExperimentMetrics(
-        experiment_control_name, control_runs=True
+def get_metrics_tables(results, experiment_name: str, cookie_banner_option: int):
+    """Summaries of the OBA run and of its control run, with the column "instance" with the name of the run"""
+    experiment_control_name = (
+        f"control_run_{COOKIE_BANNER_OPTIONS[cookie_banner_option]}"
     )
-    control_summary_df = experiment_control_metrics.get_experiment_summary()
+    experiment_summary_df = results[experiment_name]["summary"].copy()
+    control_summary_df = results[experiment_control_name]["summary"].copy()
 
     # Now extend experiment_summary_df with the control_summary_df adding the column "instance" with the value "experiment_name" and "experiment_name_control" respectively
     experiment_summary_df["instance"] = experiment_name
@@ -72,34 +60,49 @@ def get_metrics_tables(experiment_name: str, cookie_banner_option: int, category
     return summary_df
 
 
-# # Call the new function with the appropriate arguments
-summary_df_accept = get_metrics_tables(
-    experiment_name="style_and_fashion_experiment_accept",
-    cookie_banner_option=1,
-    category="Style & Fashion",
-)
-
-# # Call the new function with the appropriate arguments
-summary_df_reject = get_metrics_tables(
-    experiment_name="style_and_fashion_experiment_reject",
-    cookie_banner_option=2,
-    category="Style & Fashion",
-)
-
-# Call the new function with the appropriate arguments
-summary_df_do_nothing = get_metrics_tables(
-    experiment_name="style_and_fashion_experiment_do_nothing",
-    cookie_banner_option=0,
-    category="Style & Fashion",
-)
-
-# Concatenate the three dataframes
-summary_df = pd.concat([summary_df_accept, summary_df_reject, summary_df_do_nothing])
+if __name__ == "__main__":
+    # The control runs take the ordering of amount of visits by URL from their
+    # OBA run, so that they are aligned with its summary
+    experiments = []
+    for option in ["accept", "reject", "do_nothing"]:
+        experiment_name = f"style_and_fashion_experiment_{option}"
+        experiments += [
+            Experiment(experiment_name, category="Style & Fashion"),
+            Experiment(
+                f"control_run_{option}",
+                control_runs=True,
+                sessions_from=experiment_name,
+                category="Style & Fashion",
+            ),
+        ]
+    # The OBA runs and the control runs are analyzed in parallel
+    results = AnalysisRunner(STEPS).run(experiments, ["session_tables", "summary"])
+
+    # Concatenate the three dataframes
+    summary_df = pd.concat(
+        [
+            get_metrics_tables(
+                results,
+                experiment_name="style_and_fashion_experiment_accept",
+                cookie_banner_option=1,
+            ),
+            get_metrics_tables(
+                results,
+                experiment_name="style_and_fashion_experiment_reject",
+                cookie_banner_option=2,
+            ),
+            get_metrics_tables(
+                results,
+                experiment_name="style_and_fashion_experiment_do_nothing",
+                cookie_banner_option=0,
+            ),
+        ]
+    )
 
-print(summary_df)
+    print(summary_df)
 
-# Write the summary_df to a markdown file
-summary_df.to_markdown(RESULTS_DIR + "summary_df_new.md")
+    # Write the summary_df to a markdown file
+    summary_df.to_markdown(RESULTS_DIR + "summary_df_new.md")
 
 # # Experiment Accept
 # # OBAAnalysis
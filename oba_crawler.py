@@ -23,7 +23,9 @@ from oba.enums import (
     OBACommandsSequencesFunctions,
 )
 
+from oba.persona_scheduler import Persona, PersonaScheduler
 from oba.training_pages_handler import TrainingPagesHandler
+from openwpm.commands.utils.profile_checkpoint import list_checkpoints
 from openwpm.config import BrowserParams, ManagerParams
 from openwpm.storage.sql_provider import SQLiteStorageProvider
 from openwpm.task_manager import TaskManager
@@ -43,6 +45,7 @@ LATEST_CATEGORIZED_TRANCO_LIST_ID = "V929N"
 DEFAULT_N_PAGES = 10000
 EXPOVAR_MEAN = 180
 TESTING = False
+PROFILE_TEMPLATE_DIR = "./oba/datadir_profile_templates/"
 # LATEST_CATEGORIZED_TRANCO_LIST_ID = "N7WQW" #Previous
 # DEFAULT_N_PAGES = 5000 # Previous
 
@@ -64,10 +67,15 @@ class OBAMeasurementExperiment:
         browser_display_mode: Literal["headless", "native"] = "headless",
         control_visits_urls: list = None,
         expovar_mean: int = EXPOVAR_MEAN,
+        # OBA browsers crawling in parallel, each with its own profile and dice
+        num_personas: int = 1,
     ):
         self.start_time = time.time()
         self.experiment_name = experiment_name
         self.expovar_mean = expovar_mean
+        self.num_personas = num_personas
+        # Training pages of every persona, all of them use the training_pages if None
+        self.personas_training_pages = None
         # Importing 'oba_commands_sequences' dynamically after setting 'experiment_name'.
         # This ensures that any paths or configurations influenced by 'experiment_name' in 'oba_commands_sequences'
         # and its dependent modules (like 'CMPB_commands', which imports 'config.py') are correctly initialized.
@@ -244,9 +252,14 @@ class OBAMeasurementExperiment:
                 else None
             )
             self.custom_pages = experiment_json["custom_pages"]
+            self.num_personas = experiment_json.get("num_personas", 1)
+            self.personas_training_pages = experiment_json.get(
+                "personas_training_pages_lists"
+            )
 
         # Create or connect browser profile
-        self.NUM_BROWSERS = 2
+        # The clear browser and one OBA browser for every persona
+        self.NUM_BROWSERS = 1 + self.num_personas
 
         self.manager_params, self.browser_params = self._task_manager_config(
             save_or_load_profile,
@@ -467,10 +480,12 @@ class OBAMeasurementExperiment:
         # and NUM_BROWSERS copies of the default BrowserParams
         manager_params = ManagerParams(num_browsers=self.NUM_BROWSERS)
 
-        # We only care about the display mode of the OBA browser
+        # We only care about the display mode of the OBA browsers
         clear_browser_params = BrowserParams(display_mode="headless")
-        oba_browser_params = BrowserParams(display_mode=browser_display_mode)
-        browsers_params = [clear_browser_params, oba_browser_params]
+        browsers_params = [clear_browser_params] + [
+            BrowserParams(display_mode=browser_display_mode)
+            for _ in range(self.num_personas)
+        ]
 
         # Update browser configuration (use this for per-browser settings)
         for browser_params in browsers_params:
@@ -499,16 +514,38 @@ class OBAMeasurementExperiment:
         # Allow for many consecutive failures
         # The default is 2 x the number of browsers plus 10 (2x20+10 = 50)
         manager_params.failure_limit = 100000
-
-        # Save or Load the browser profile
-        experiment_profile_dir = manager_params.data_directory
-        if save_or_load_profile == "save":
-            browsers_params[1].profile_archive_dir = experiment_profile_dir
-        elif save_or_load_profile == "load":
-            browsers_params[1].seed_tar = experiment_profile_dir / "profile.tar.gz"
+        # The clean runs reset their browser after every visit, a spare clean
+        # browser is swapped in instead of waiting for a new one to launch
+        manager_params.browser_pool_size = 1
+        # Profiles of the launches without a profile tar start from a template
+        manager_params.profile_template_dir = Path(PROFILE_TEMPLATE_DIR)
+
+        # Save or Load the browser profile of every persona. The profiles are
+        # saved as incremental checkpoints of their state, the loads restore
+        # the latest one and don't save the profile again
+        for persona_index in range(1, self.num_personas + 1):
+            experiment_profile_dir = self._persona_profile_dir(persona_index)
+            persona_browser_params = browsers_params[persona_index]
+            persona_browser_params.profile_archive_format = "checkpoint"
+            if save_or_load_profile == "save":
+                experiment_profile_dir.mkdir(parents=True, exist_ok=True)
+                persona_browser_params.profile_archive_dir = experiment_profile_dir
+            elif save_or_load_profile == "load":
+                # The experiments saved before the checkpoints have a tar
+                persona_browser_params.seed_tar = (
+                    experiment_profile_dir
+                    if list_checkpoints(experiment_profile_dir)
+                    else experiment_profile_dir / "profile.tar.gz"
+                )
 
         return manager_params, browsers_params
 
+    def _persona_profile_dir(self, persona_index: int) -> Path:
+        """Directory of the profile of a persona, the first one keeps the profile of single persona experiments"""
+        if persona_index == 1:
+            return Path(self.data_dir)
+        return Path(self.data_dir) / "personas" / f"persona_{persona_index}"
+
     def _get_and_create_experiment_config_json(self, manager: TaskManager):
         """Manages the file that saves the browser_id's used throughout the experiment for them to be used later in the data analysis (i.e know which browser_ids belong to oba browsers and which belongs to clear browsers)"""
         file_path = self.data_dir + f"{self.experiment_name}_config.json"
@@ -538,6 +575,17 @@ class OBAMeasurementExperiment:
         # Append browser ids to the corresponding lists
         experiment_json["browser_ids"]["clear"].append(manager.browsers[0].browser_id)
         experiment_json["browser_ids"]["oba"].append(manager.browsers[1].browser_id)
+        if self.num_personas > 1:
+            # The browser ids of every persona, "oba" keeps the ones of the first
+            experiment_json.update(
+                num_personas=self.num_personas,
+                personas_training_pages_lists=self.personas_training_pages,
+            )
+            personas_browser_ids = experiment_json["browser_ids"].setdefault(
+                "personas", [[] for _ in range(self.num_personas)]
+            )
+            for persona_index, browser_ids in enumerate(personas_browser_ids, 1):
+                browser_ids.append(manager.browsers[persona_index].browser_id)
 
         # Save the updated JSON
         with open(file_path, "w") as file:
@@ -556,46 +604,36 @@ class OBAMeasurementExperiment:
         training sites (shrinking the lists). Calls command sequences functions returned by the oba_command_sequence.py
         """
 
-        # Start with one second ahead
-        run_start_time = time.time()
-
-        _hours_in_seconds = 60 * 60
-        _minutes_in_seconds = 60
-
-        hours = hours * _hours_in_seconds
-        minutes = minutes * _minutes_in_seconds
-        while time.time() - run_start_time < hours + minutes:
-            print(f"TIME ELAPSED: {time.time() - run_start_time}")
-            training_or_control_dice = random.randint(1, 100)
-            if training_or_control_dice > control_visits_rate:
-                # TESTING
-                # if False:
-                # TRAINING
-                amount_of_pages = random.randint(1, 3)
-                training_sample = random.sample(self.training_pages, amount_of_pages)
-                sequence_list = self._dynamically_imported.training_visits_sequence(
-                    training_sample,
-                    next_site_rank,
-                    cookie_banner_action=self.cookie_banner_action,
-                )
-            else:
-                # CONTROL
-                sequence_list = [
-                    self._dynamically_imported.control_site_visit_sequence(
-                        random.choice(self.control_pages),
-                        next_site_rank,
-                        cookie_banner_action=self.cookie_banner_action,
-                    )
-                ]
-            print("GOT SEQUENCE LIST: ", sequence_list)
-            next_site_rank += len(sequence_list)
-            for command_sequence in sequence_list:
-                # Wait exponential distribution between command sequences
-                # TESTING NO WAIT
-                wait_time = int(random.expovariate(1 / self.expovar_mean))
-                print(f"Waiting {wait_time} seconds before next command sequence")
-                time.sleep(wait_time)
-                manager.execute_command_sequence(command_sequence, index=1)
+        # Every persona rolls its own dice and waits for its own deadlines, so
+        # the browsers of the other personas keep crawling during the waits
+        personas = [
+            Persona(
+                name=f"persona_{persona_index}",
+                browser_index=persona_index,
+                training_pages=(
+                    self.personas_training_pages[persona_index - 1]
+                    if self.personas_training_pages
+                    else self.training_pages
+                ),
+                control_pages=self.control_pages,
+                control_visits_rate=control_visits_rate,
+                cookie_banner_action=self.cookie_banner_action,
+            )
+            for persona_index in range(1, self.num_personas + 1)
+        ]
+        scheduler = PersonaScheduler(
+            manager,
+            personas,
+            self._dynamically_imported.training_visits_sequence,
+            self._dynamically_imported.control_site_visit_sequence,
+            expovar_mean=self.expovar_mean,
+        )
+        next_site_rank = scheduler.run(
+            next_site_rank, seconds=hours * 60 * 60 + minutes * 60
+        )
+        for name, counters in scheduler.summary().items():
+            print(f"{name}: {counters}")
+        return next_site_rank
 
     def _read_experiment_config_json(self):
         """Opens and reads the json file with the configuration for the experiment"""
@@ -12,17 +12,19 @@ import time
 import traceback
 from pathlib import Path
 from queue import Empty as EmptyQueue
-from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Type, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, Union
 
 import psutil
 from multiprocess import Process, Queue
 from selenium.common.exceptions import WebDriverException
 from tblib import Traceback, pickling_support
 
+from .browser_pool import BrowserPool
 from .command_sequence import CommandSequence
 from .commands.browser_commands import FinalizeCommand
 from .commands.profile_commands import dump_profile
 from .commands.types import BaseCommand, ShutdownSignal
+from .commands.utils.profile_checkpoint import checkpoint_profile
 from .commands.utils.webdriver_utils import parse_neterror
 from .config import BrowserParamsInternal, ManagerParamsInternal
 from .deploy_browsers import deploy_firefox
@@ -94,6 +96,15 @@ class BrowserManagerHandle:
         """timeout of the current command"""
         self.browser_manager: Optional[Process] = None
         """process that controls browser"""
+        self.spawn_duration: Optional[float] = None
+        """seconds that the last successful launch of the browser took"""
+        self.pool: Optional[BrowserPool] = None
+        """spare browsers that are swapped in on resets"""
+        self._restart_record: Optional[Dict[str, Any]] = None
+        """restart to record in the crawl_history of the next visit"""
+        self._recovery_checkpoint_dir: Optional[Path] = None
+        """checkpoints of the crashed profiles, kept between the crashes so
+        that the unchanged files aren't written again"""
 
         self.logger = logging.getLogger("openwpm")
 
@@ -113,7 +124,20 @@ class BrowserManagerHandle:
         crash_recovery = False
         # if this is restarting from a crash, update the tar location
         # to be a tar of the crashed browser's history
-        if self.current_profile_path is not None:
+        if (
+            self.current_profile_path is not None
+            and self.browser_params.profile_archive_format == "checkpoint"
+        ):
+            # checkpoint the state of the crashed profile
+            if self._recovery_checkpoint_dir is None:
+                self._recovery_checkpoint_dir = Path(
+                    tempfile.mkdtemp(prefix="openwpm_profile_checkpoints_")
+                )
+            self.browser_params.recovery_tar = checkpoint_profile(
+                self.current_profile_path, self._recovery_checkpoint_dir
+            )
+            crash_recovery = True
+        elif self.current_profile_path is not None:
             # tar contents of crashed profile to a temp dir
             tempdir = tempfile.mkdtemp(prefix="openwpm_profile_archive_")
             tar_path = Path(tempdir) / "profile.tar"
@@ -134,6 +158,7 @@ class BrowserManagerHandle:
         self.is_fresh = not crash_recovery
 
         # Try to spawn the browser within the timelimit
+        spawn_start_time = time.time()
         unsuccessful_spawns = 0
         success = False
 
@@ -220,6 +245,7 @@ class BrowserManagerHandle:
         # and previous profile path.
         if success:
             self.logger.debug("BROWSER %i: Browser spawn successful!" % self.browser_id)
+            self.spawn_duration = time.time() - spawn_start_time
             previous_profile_path = self.current_profile_path
             self.current_profile_path = browser_profile_path
             if previous_profile_path is not None:
@@ -229,6 +255,34 @@ class BrowserManagerHandle:
 
         return success
 
+    def start_pool(self) -> None:
+        """Launches the spare browsers of `ManagerParams.browser_pool_size` in
+        the background. Started by the first reset, so the browsers that are
+        never reset don't have spare browsers"""
+        if self.manager_params.browser_pool_size > 0 and self.pool is None:
+            self.pool = BrowserPool(self, self.manager_params.browser_pool_size)
+            self.pool.start()
+
+    def spare_browsers(self) -> List["BrowserManagerHandle"]:
+        return self.pool.spares() if self.pool is not None else []
+
+    def _swap_in(self, spare: "BrowserManagerHandle") -> None:
+        """Takes over the processes and profile of a launched spare browser,
+        which gets the ones of this browser"""
+        for attribute in (
+            "browser_manager",
+            "command_queue",
+            "status_queue",
+            "geckodriver_pid",
+            "display_pid",
+            "display_port",
+            "current_profile_path",
+            "spawn_duration",
+        ):
+            current = getattr(self, attribute)
+            setattr(self, attribute, getattr(spare, attribute))
+            setattr(spare, attribute, current)
+
     def restart_browser_manager(self, clear_profile=False):
         """
         kill and restart the two worker processes
@@ -245,6 +299,25 @@ class BrowserManagerHandle:
             )
             return True
 
+        start_time = time.time()
+        pool_status = None
+        # A browser with a clean profile can be swapped in from the pool
+        if clear_profile and self.manager_params.browser_pool_size > 0:
+            self.start_pool()
+            assert self.pool is not None
+            spare = self.pool.take()
+            pool_status = "miss" if spare is None else "hit"
+            if spare is not None:
+                self.logger.info(
+                    "BROWSER %i: Swapping in a spare browser" % self.browser_id
+                )
+                self._swap_in(spare)
+                self.pool.recycle(spare)
+                self.browser_params.recovery_tar = None
+                self.is_fresh = True
+                self._record_restart(clear_profile, pool_status, start_time)
+                return True
+
         self.close_browser_manager()
 
         # if crawl should be stateless we can clear profile
@@ -253,7 +326,31 @@ class BrowserManagerHandle:
             self.current_profile_path = None
             self.browser_params.recovery_tar = None
 
-        return self.launch_browser_manager()
+        success = self.launch_browser_manager()
+        if success:
+            self._record_restart(clear_profile, pool_status, start_time)
+        return success
+
+    def _record_restart(
+        self, clear_profile: bool, pool_status: Optional[str], start_time: float
+    ) -> None:
+        """Keeps the restart latencies for the crawl_history of the next visit,
+        as the visit that caused the restart is already finalized"""
+        self._restart_record = {
+            "command": "RestartBrowser",
+            "arguments": json.dumps(
+                {
+                    "clear_profile": clear_profile,
+                    "pool": pool_status,
+                    "spawn_duration": (
+                        int(self.spawn_duration * 1000)
+                        if self.spawn_duration is not None
+                        else None
+                    ),
+                }
+            ).encode("utf-8"),
+            "duration": int((time.time() - start_time) * 1000),
+        }
 
     def close_browser_manager(self, force: bool = False) -> None:
         """Attempt to close the webdriver and browser manager processes
@@ -360,6 +457,22 @@ class BrowserManagerHandle:
                 "site_rank": command_sequence.site_rank,
             },
         )
+        if self._restart_record is not None:
+            # The browser of this visit was restarted after the previous one
+            task_manager.sock.store_record(
+                TableName("crawl_history"),
+                self.curr_visit_id,
+                {
+                    "browser_id": self.browser_id,
+                    "visit_id": self.curr_visit_id,
+                    "retry_number": command_sequence.retry_number,
+                    "command_status": "ok",
+                    "error": None,
+                    "traceback": None,
+                    **self._restart_record,
+                },
+            )
+            self._restart_record = None
         self.is_fresh = False
 
         reset = command_sequence.reset
@@ -496,7 +609,8 @@ class BrowserManagerHandle:
         )
         # Sleep after executing CommandSequence to provide extra time for
         # internal buffers to drain. Stopgap in support of #135
-        time.sleep(2)
+        if self.manager_params.buffer_drain_time > 0:
+            time.sleep(self.manager_params.buffer_drain_time)
 
         if task_manager.closing:
             return
@@ -590,6 +704,10 @@ class BrowserManagerHandle:
 
     def shutdown_browser(self, during_init: bool, force: bool = False) -> None:
         """Runs the closing tasks for this Browser/BrowserManager"""
+        if self.pool is not None:
+            self.logger.debug("BROWSER %i: Closing spare browsers..." % self.browser_id)
+            self.pool.close()
+
         # Close BrowserManager process and children
         self.logger.debug("BROWSER %i: Closing browser manager..." % self.browser_id)
         self.close_browser_manager(force=force)
@@ -608,18 +726,25 @@ class BrowserManagerHandle:
                 "BROWSER %i: Archiving browser profile directory to %s"
                 % (self.browser_id, self.browser_params.profile_archive_dir)
             )
-            tar_path = self.browser_params.profile_archive_dir / "profile.tar.gz"
             assert self.current_profile_path is not None
-            dump_profile(
-                browser_profile_path=self.current_profile_path,
-                tar_path=tar_path,
-                compress=True,
-                browser_params=self.browser_params,
-            )
+            if self.browser_params.profile_archive_format == "checkpoint":
+                checkpoint_profile(
+                    self.current_profile_path, self.browser_params.profile_archive_dir
+                )
+            else:
+                tar_path = self.browser_params.profile_archive_dir / "profile.tar.gz"
+                dump_profile(
+                    browser_profile_path=self.current_profile_path,
+                    tar_path=tar_path,
+                    compress=True,
+                    browser_params=self.browser_params,
+                )
 
         # Clean up temporary files
         if self.current_profile_path is not None:
             shutil.rmtree(self.current_profile_path, ignore_errors=True)
+        if self._recovery_checkpoint_dir is not None:
+            shutil.rmtree(self._recovery_checkpoint_dir, ignore_errors=True)
 
 
 class BrowserManager(Process):
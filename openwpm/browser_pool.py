@@ -0,0 +1,132 @@
+"""Clean browsers that are kept launched in the background for a browser
+
+A reset (`CommandSequence.reset`) clears the profile of a browser by closing
+it and launching a new one, so the next CommandSequence waits for a new
+profile, Xvfb, the extension install and its startup. With a pool, the reset
+swaps in a browser that was launched in the background instead, and the
+previous one is closed in the background too.
+"""
+
+import dataclasses
+import logging
+import shutil
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Deque, List, Optional
+
+if TYPE_CHECKING:
+    from .browser_manager import BrowserManagerHandle
+
+# Seconds before retrying to launch a spare browser after a failed launch
+LAUNCH_RETRY_INTERVAL = 30
+
+
+class BrowserPool:
+    """Spare browsers with a clean profile for the resets of a browser
+
+    :param handle: Browser that the spare browsers are swapped into.
+    :param size: Number of spare browsers kept launched.
+    """
+
+    def __init__(self, handle: "BrowserManagerHandle", size: int) -> None:
+        self.handle = handle
+        self.size = size
+        self.logger = logging.getLogger("openwpm")
+        self._ready: Deque["BrowserManagerHandle"] = deque()
+        self._launching: Optional["BrowserManagerHandle"] = None
+        self._recycling: List[threading.Thread] = []
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.name = "OpenWPM-browser_pool-%i" % handle.browser_id
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def spares(self) -> List["BrowserManagerHandle"]:
+        """The spare browsers, including the one being launched"""
+        with self._condition:
+            spares = list(self._ready)
+            if self._launching is not None:
+                spares.append(self._launching)
+            return spares
+
+    def _new_spare(self) -> "BrowserManagerHandle":
+        # Imported here to break the cyclic import
+        from .browser_manager import BrowserManagerHandle
+
+        browser_params = dataclasses.replace(
+            self.handle.browser_params, recovery_tar=None
+        )
+        return BrowserManagerHandle(self.handle.manager_params, browser_params)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._closed or len(self._ready) < self.size
+                )
+                if self._closed:
+                    return
+                spare = self._launching = self._new_spare()
+
+            start_time = time.time()
+            success = spare.launch_browser_manager()
+            with self._condition:
+                self._launching = None
+                if success and not self._closed:
+                    self._ready.append(spare)
+                    self._condition.notify_all()
+                    self.logger.debug(
+                        "BROWSER %i: Spare browser launched in %.2f seconds"
+                        % (self.handle.browser_id, time.time() - start_time)
+                    )
+                    continue
+            if success:
+                # The pool closed during the launch
+                self._close_spare(spare)
+                return
+            self.logger.error(
+                "BROWSER %i: Failed to launch a spare browser, retrying in %i "
+                "seconds" % (self.handle.browser_id, LAUNCH_RETRY_INTERVAL)
+            )
+            with self._condition:
+                self._condition.wait_for(lambda: self._closed, LAUNCH_RETRY_INTERVAL)
+
+    def take(self) -> Optional["BrowserManagerHandle"]:
+        """A launched spare browser, None if none is ready yet"""
+        with self._condition:
+            if not self._ready:
+                return None
+            spare = self._ready.popleft()
+            self._condition.notify_all()
+            return spare
+
+    @staticmethod
+    def _close_spare(spare: "BrowserManagerHandle") -> None:
+        spare.close_browser_manager()
+        if spare.current_profile_path is not None:
+            shutil.rmtree(spare.current_profile_path, ignore_errors=True)
+
+    def recycle(self, spare: "BrowserManagerHandle") -> None:
+        """Closes a browser that was swapped out, and removes its profile, in the background"""
+        thread = threading.Thread(target=self._close_spare, args=(spare,), daemon=True)
+        thread.name = "OpenWPM-browser_recycling-%i" % self.handle.browser_id
+        thread.start()
+        with self._condition:
+            self._recycling = [t for t in self._recycling if t.is_alive()] + [thread]
+
+    def close(self) -> None:
+        """Closes the spare browsers, waiting for the ones being launched or recycled"""
+        with self._condition:
+            self._closed = True
+            spares, self._ready = list(self._ready), deque()
+            recycling, self._recycling = self._recycling, []
+            self._condition.notify_all()
+        for spare in spares:
+            self._close_spare(spare)
+        if self._thread.is_alive():
+            self._thread.join()
+        for thread in recycling:
+            thread.join()
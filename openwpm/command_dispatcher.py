@@ -0,0 +1,182 @@
+"""Hands the CommandSequences of the TaskManager to its browsers
+
+The browsers signal the dispatcher when they finish a CommandSequence, so a
+submitted CommandSequence starts as soon as a browser is free instead of on
+the next poll. The CommandSequences waiting for a specific browser don't hold
+back the ones for any browser, and the storage backpressure is applied by the
+dispatcher thread before every start.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, List, Optional, Sequence, Set
+
+from .command_sequence import CommandSequence
+
+# Starts a CommandSequence on a browser, its thread calls the given function
+# with the visit id once it's done
+StartFunction = Callable[[Any, CommandSequence, Callable[[int], None]], object]
+
+
+class Submission:
+    """A CommandSequence submitted to the dispatcher
+
+    `future` resolves to the visit id of the CommandSequence once its browser
+    finished it, or to the exception that prevented it from starting.
+    """
+
+    def __init__(self, command_sequence: CommandSequence, index: Optional[int]):
+        self.command_sequence = command_sequence
+        self.index = index
+        self.future: Future = Future()
+        self.dispatched = threading.Event()
+        """set once the CommandSequence is started, or failed to start"""
+        self.submitted_at = time.monotonic()
+        self.dispatched_at: Optional[float] = None
+        self.browser_ready_at: Optional[float] = None
+        """when the browser that got the CommandSequence became free"""
+
+    @property
+    def scheduling_latency(self) -> Optional[float]:
+        """Seconds between a free browser being available and the start"""
+        if self.dispatched_at is None or self.browser_ready_at is None:
+            return None
+        return self.dispatched_at - max(self.submitted_at, self.browser_ready_at)
+
+
+class CommandDispatcher:
+    """Ready-browser queue of the TaskManager
+
+    :param browsers: Browsers of the TaskManager. A browser is busy from the
+        start of a CommandSequence until its thread calls the done function,
+        the dispatcher doesn't poll them.
+    :param start: Starts a CommandSequence on a browser in a new thread. The
+        thread calls the given function with the visit id when it ends.
+    :param wait_for_capacity: Blocks until the storage controller accepts more
+        records.
+    """
+
+    def __init__(
+        self,
+        browsers: Sequence[Any],
+        start: StartFunction,
+        wait_for_capacity: Callable[[], object] = lambda: None,
+    ) -> None:
+        self.browsers = browsers
+        self._start = start
+        self._wait_for_capacity = wait_for_capacity
+        self._condition = threading.Condition()
+        self._pending: Deque[Submission] = deque()
+        self._busy: Set[int] = set()
+        self._dispatching: Optional[Submission] = None
+        self._ready_at: List[float] = [time.monotonic()] * len(browsers)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.name = "OpenWPM-dispatcher"
+        self._thread.start()
+
+    def submit(
+        self, command_sequence: CommandSequence, index: Optional[int] = None
+    ) -> Submission:
+        """Queues a CommandSequence for the browser `index`, or the first free one if None"""
+        submission = Submission(command_sequence, index)
+        with self._condition:
+            if self._closed:
+                self._fail(
+                    submission,
+                    RuntimeError(
+                        "Attempted to execute command on a closed TaskManager"
+                    ),
+                )
+                return submission
+            self._pending.append(submission)
+            self._condition.notify_all()
+        return submission
+
+    def _next(self) -> Optional[Submission]:
+        """Removes the first pending submission that has a free browser, and reserves it"""
+        for submission in self._pending:
+            if submission.index is None:
+                candidates = range(len(self.browsers))
+            else:
+                candidates = range(submission.index, submission.index + 1)
+            for index in candidates:
+                if index not in self._busy:
+                    self._pending.remove(submission)
+                    self._busy.add(index)
+                    submission.index = index
+                    self._dispatching = submission
+                    return submission
+        return None
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while True:
+                    if self._closed and not self._pending:
+                        return
+                    submission = self._next()
+                    if submission is not None:
+                        break
+                    self._condition.wait()
+            self._dispatch(submission)
+            with self._condition:
+                self._dispatching = None
+                self._condition.notify_all()
+
+    def _dispatch(self, submission: Submission) -> None:
+        index = submission.index
+        assert index is not None
+        try:
+            self._wait_for_capacity()
+            submission.browser_ready_at = self._ready_at[index]
+            submission.dispatched_at = time.monotonic()
+            self._start(
+                self.browsers[index],
+                submission.command_sequence,
+                lambda visit_id: self._finished(submission, visit_id),
+            )
+        except BaseException as e:
+            self._release(index)
+            self._fail(submission, e)
+            return
+        submission.dispatched.set()
+
+    def _release(self, index: int) -> None:
+        with self._condition:
+            self._busy.discard(index)
+            self._ready_at[index] = time.monotonic()
+            self._condition.notify_all()
+
+    def _finished(self, submission: Submission, visit_id: int) -> None:
+        assert submission.index is not None
+        self._release(submission.index)
+        submission.future.set_result(visit_id)
+
+    @staticmethod
+    def _fail(submission: Submission, exception: BaseException) -> None:
+        submission.future.set_exception(exception)
+        submission.dispatched.set()
+
+    def wait_for_pending(self) -> None:
+        """Blocks until all the submitted CommandSequences have started"""
+        with self._condition:
+            self._condition.wait_for(
+                lambda: not self._pending and self._dispatching is None
+            )
+
+    def close(self) -> None:
+        """Fails the CommandSequences that haven't started, and stops the dispatcher thread"""
+        with self._condition:
+            self._closed = True
+            pending, self._pending = list(self._pending), deque()
+            self._condition.notify_all()
+        for submission in pending:
+            self._fail(
+                submission,
+                RuntimeError("The TaskManager closed before the command started"),
+            )
+        if threading.current_thread() is not self._thread:
+            self._thread.join()
@@ -94,10 +94,12 @@ class CommandSequence:
         close_webdriver: bool = False,
         compress: bool = True,
         timeout: int = 120,
+        checkpoint: bool = False,
     ) -> None:
-        """dumps from the profile path to a given file (absolute path)"""
+        """dumps from the profile path to a given file (absolute path), or to
+        a new checkpoint in a checkpoint directory if <checkpoint>"""
         self.total_timeout += timeout
-        command = DumpProfileCommand(tar_path, close_webdriver, compress)
+        command = DumpProfileCommand(tar_path, close_webdriver, compress, checkpoint)
         self._commands_with_timeout.append((command, timeout))
 
     def save_screenshot(self, suffix="", timeout=30):
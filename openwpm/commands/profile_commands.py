@@ -10,6 +10,11 @@ from ..errors import ProfileLoadError
 from ..socket_interface import ClientSocket
 from .types import BaseCommand
 from .utils.firefox_profile import sleep_until_sqlite_checkpoint
+from .utils.profile_checkpoint import (
+    checkpoint_profile,
+    is_checkpoint,
+    restore_checkpoint,
+)
 
 logger = logging.getLogger("openwpm")
 
@@ -67,19 +72,25 @@ def dump_profile(
 class DumpProfileCommand(BaseCommand):
     """
     Dumps a browser profile currently stored in <browser_params.profile_path> to
-    <tar_path>.
+    <tar_path>. With <checkpoint>, <tar_path> is a checkpoint directory that
+    gets a new incremental checkpoint of the state of the profile.
     """
 
     def __init__(
-        self, tar_path: Path, close_webdriver: bool, compress: bool = True
+        self,
+        tar_path: Path,
+        close_webdriver: bool,
+        compress: bool = True,
+        checkpoint: bool = False,
     ) -> None:
         self.tar_path = tar_path
         self.close_webdriver = close_webdriver
         self.compress = compress
+        self.checkpoint = checkpoint
 
     def __repr__(self) -> str:
-        return "DumpProfileCommand({},{},{})".format(
-            self.tar_path, self.close_webdriver, self.compress
+        return "DumpProfileCommand({},{},{},{})".format(
+            self.tar_path, self.close_webdriver, self.compress, self.checkpoint
         )
 
     def execute(
@@ -95,6 +106,9 @@ class DumpProfileCommand(BaseCommand):
             sleep_until_sqlite_checkpoint(browser_params.profile_path)
 
         assert browser_params.profile_path is not None
+        if self.checkpoint:
+            checkpoint_profile(browser_params.profile_path, self.tar_path)
+            return
         dump_profile(
             browser_params.profile_path,
             self.tar_path,
@@ -111,9 +125,18 @@ def load_profile(
     """
     Loads a zipped cookie-based profile stored at <tar_path> and unzips
     it to <browser_profile_path>. The tar will remain unmodified.
+    <tar_path> can also be a checkpoint directory, to restore its latest
+    checkpoint, or the manifest of a specific checkpoint.
     """
     assert browser_params.browser_id is not None
     try:
+        if is_checkpoint(tar_path):
+            manifest = restore_checkpoint(tar_path, browser_profile_path)
+            logger.debug(
+                "BROWSER %i: Checkpoint %s restored"
+                % (browser_params.browser_id, manifest.stem)
+            )
+            return
         assert tar_path.is_file()
         # Untar the loaded profile
         if tar_path.name.endswith("tar.gz"):
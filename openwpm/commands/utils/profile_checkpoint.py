@@ -0,0 +1,197 @@
+"""Incremental checkpoints of the state of a Firefox profile
+
+A checkpoint copies only the files that hold the state of a profile: cookies,
+history, localStorage and the storage/ directory, instead of the whole profile
+with its caches. The files are split into chunks of CHUNK_SIZE bytes, a
+multiple of the SQLite page size, and every chunk is stored once under its
+digest. The pages of a database that didn't change since the previous
+checkpoint aren't written again. The chunks are compressed with zstd, with
+lz4 or zlib as fallbacks.
+
+Layout of a checkpoint directory:
+    checkpoints/<name>.json  files of the profile and the digests of their chunks
+    chunks/<ab>/<digest>     compressed chunks
+
+Usage:
+    manifest = checkpoint_profile(profile_path, checkpoint_dir)
+    restore_checkpoint(checkpoint_dir, new_profile_path)  # The latest one
+    restore_checkpoint(manifest, new_profile_path)  # A specific one
+"""
+
+import hashlib
+import json
+import os
+import struct
+import time
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+
+import pyarrow as pa
+
+CHUNK_SIZE = 64 * 1024
+CHECKPOINTS_DIR = "checkpoints"
+CHUNKS_DIR = "chunks"
+# Files of the profile that hold its state, with their write-ahead logs
+STATE_FILES = [
+    "cookies.sqlite",
+    "places.sqlite",
+    "favicons.sqlite",
+    "webappsstore.sqlite",
+    "permissions.sqlite",
+    "content-prefs.sqlite",
+    "formhistory.sqlite",
+    "prefs.js",
+]
+STATE_DIRS = ["storage"]
+# Header of a chunk: codec and size before the compression
+CHUNK_HEADER = struct.Struct(">4sI")
+CODECS = [b"zstd", b"lz4\x00"]
+
+
+def _compress(data: bytes) -> bytes:
+    for tag in CODECS:
+        name = tag.rstrip(b"\x00").decode()
+        if pa.Codec.is_available(name):
+            compressed = pa.Codec(name).compress(data, asbytes=True)
+            break
+    else:
+        tag, compressed = b"zlib", zlib.compress(data, 1)
+    if len(compressed) >= len(data):
+        # Already compressed data, like the blobs of storage/
+        tag, compressed = b"none", data
+    return CHUNK_HEADER.pack(tag, len(data)) + compressed
+
+
+def _decompress(chunk: bytes) -> bytes:
+    tag, size = CHUNK_HEADER.unpack_from(chunk)
+    data = chunk[CHUNK_HEADER.size :]
+    if tag == b"none":
+        return data
+    if tag == b"zlib":
+        return zlib.decompress(data)
+    name = tag.rstrip(b"\x00").decode()
+    return pa.Codec(name).decompress(data, decompressed_size=size, asbytes=True)
+
+
+def state_files(profile_path: Path) -> List[str]:
+    """Paths of the state-bearing files of a profile, relative to it"""
+    paths = []
+    for name in STATE_FILES:
+        for path in [profile_path / name, profile_path / f"{name}-wal"]:
+            if path.is_file():
+                paths.append(path.relative_to(profile_path).as_posix())
+    for name in STATE_DIRS:
+        for root, _, files in os.walk(profile_path / name):
+            for file_name in files:
+                path = Path(root) / file_name
+                paths.append(path.relative_to(profile_path).as_posix())
+    return sorted(paths)
+
+
+def _write_atomically(path: Path, data: bytes) -> None:
+    temp_path = path.with_name(f".{path.name}.tmp")
+    with open(temp_path, "wb") as f:
+        f.write(data)
+    os.replace(temp_path, path)
+
+
+def checkpoint_profile(
+    profile_path: Path, checkpoint_dir: Path, name: Union[str, None] = None
+) -> Path:
+    """Checkpoints the state of a closed profile, returns the path of its manifest
+
+    The profile should be closed, or its databases checkpointed, like for
+    `dump_profile`.
+    """
+    checkpoint_dir = Path(checkpoint_dir)
+    (checkpoint_dir / CHECKPOINTS_DIR).mkdir(parents=True, exist_ok=True)
+    files: Dict[str, Dict[str, object]] = {}
+    written_chunks = 0
+    written_bytes = 0
+    for relative_path in state_files(profile_path):
+        digests = []
+        size = 0
+        with open(profile_path / relative_path, "rb") as f:
+            while data := f.read(CHUNK_SIZE):
+                size += len(data)
+                digest = hashlib.sha256(data).hexdigest()
+                digests.append(digest)
+                chunk_path = checkpoint_dir / CHUNKS_DIR / digest[:2] / digest
+                if chunk_path.exists():
+                    continue
+                chunk_path.parent.mkdir(parents=True, exist_ok=True)
+                chunk = _compress(data)
+                _write_atomically(chunk_path, chunk)
+                written_chunks += 1
+                written_bytes += len(chunk)
+        files[relative_path] = {"size": size, "chunks": digests}
+
+    created = time.time()
+    if name is None:
+        name = datetime.fromtimestamp(created, timezone.utc).strftime(
+            "%Y%m%d-%H%M%S-%f"
+        )
+    manifest = checkpoint_dir / CHECKPOINTS_DIR / f"{name}.json"
+    _write_atomically(
+        manifest,
+        json.dumps(
+            {
+                "created": created,
+                "chunk_size": CHUNK_SIZE,
+                "files": files,
+                "written_chunks": written_chunks,
+                "written_bytes": written_bytes,
+            }
+        ).encode(),
+    )
+    return manifest
+
+
+def list_checkpoints(checkpoint_dir: Path) -> List[Path]:
+    """Manifests of the checkpoints, from the oldest to the latest"""
+    return sorted((Path(checkpoint_dir) / CHECKPOINTS_DIR).glob("*.json"))
+
+
+def is_checkpoint(path: Path) -> bool:
+    """If the path is a checkpoint directory or the manifest of a checkpoint"""
+    path = Path(path)
+    if path.is_dir():
+        return (path / CHECKPOINTS_DIR).is_dir()
+    return path.suffix == ".json" and path.parent.name == CHECKPOINTS_DIR
+
+
+def _resolve(checkpoint: Path) -> Tuple[Path, Path]:
+    """Checkpoint directory and manifest of a directory or a manifest"""
+    checkpoint = Path(checkpoint)
+    if checkpoint.is_dir():
+        manifests = list_checkpoints(checkpoint)
+        if not manifests:
+            raise FileNotFoundError("No checkpoint in %s" % checkpoint)
+        return checkpoint, manifests[-1]
+    return checkpoint.parent.parent, checkpoint
+
+
+def restore_checkpoint(checkpoint: Path, profile_path: Path) -> Path:
+    """Restores a checkpoint into a profile directory, returns its manifest
+
+    `checkpoint` is a checkpoint directory, for its latest checkpoint, or the
+    manifest of a specific checkpoint.
+    """
+    checkpoint_dir, manifest = _resolve(checkpoint)
+    with open(manifest) as f:
+        files = json.load(f)["files"]
+    for relative_path, file in files.items():
+        path = Path(profile_path) / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            for digest in file["chunks"]:
+                with open(checkpoint_dir / CHUNKS_DIR / digest[:2] / digest, "rb") as c:
+                    data = _decompress(c.read())
+                if hashlib.sha256(data).hexdigest() != digest:
+                    raise ValueError("Corrupted chunk %s of %s" % (digest, manifest))
+                f.write(data)
+        if path.stat().st_size != file["size"]:
+            raise ValueError("Incomplete %s in %s" % (relative_path, manifest))
+    return manifest
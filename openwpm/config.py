@@ -16,6 +16,7 @@ SUPPORTED_BROWSER_LIST = [
     "firefox"
 ]  # Using List instead of a str type to future proof the logic as OpenWPM may add support for more browsers in future
 TP_COOKIES_OPTIONALS_LIST = ["always", "never", "from_visited"]
+PROFILE_ARCHIVE_FORMAT_LIST = ["tar", "checkpoint"]
 LOG_EXTENSION_TYPE_LIST = [".log"]
 CONFIG_ERROR_STRING = (
     "Found {value} as value for {parameter_name} in BrowserParams. "
@@ -100,6 +101,7 @@ class BrowserParams(DataClassJsonMixin):
         default=None, metadata=DCJConfig(encoder=path_to_str, decoder=str_to_path)
     )
     recovery_tar: Optional[Path] = None
+    profile_archive_format: str = "tar"
     donottrack: bool = False
     tracking_protection: bool = False
     custom_params: Dict[Any, Any] = field(default_factory=lambda: {})
@@ -136,6 +138,24 @@ class ManagerParams(DataClassJsonMixin):
     """- It is used to create another thread that kills off `GeckoDriver` (or `Xvfb`) instances that haven't been spawned by OpenWPM. (GeckoDriver is used by
          Selenium to control Firefox and Xvfb a "virtual display" so we simulate having graphics when running on a server)."""
     num_browsers: int = 1
+    buffer_drain_time: float = 2
+    """Seconds that a browser waits after every CommandSequence for the internal
+    buffers of its instrumentation to drain into the StorageController, before
+    it accepts the next one. Stopgap in support of #135"""
+    profile_template_dir: Optional[Path] = field(
+        default=None,
+        metadata=DCJConfig(encoder=path_to_str, decoder=str_to_path),
+    )
+    """Directory of the cached profile templates. A browser launched without a
+    profile tar copies its profile from a template, on which Firefox already
+    ran its first start with the same prefs, instead of an empty directory.
+    None disables the templates"""
+    browser_pool_size: int = 0
+    """Number of spare browsers with a clean profile that are kept launched in
+    the background for every browser that is reset. A reset
+    (`CommandSequence.reset`) swaps in a spare browser instead of waiting for a
+    new one to launch. The spares are launched after the first reset of a
+    browser, and every spare is a running Firefox with its memory cost"""
     _failure_limit: Optional[int] = None
     """- The number of command failures the platform will tolerate before raising a
         `CommandExecutionError` exception. Otherwise the default is set to 2 x the
@@ -206,6 +226,15 @@ def validate_browser_params(browser_params: BrowserParams) -> None:
                 )
             )
 
+        if browser_params.profile_archive_format not in PROFILE_ARCHIVE_FORMAT_LIST:
+            raise ConfigError(
+                CONFIG_ERROR_STRING.format(
+                    value=browser_params.profile_archive_format,
+                    value_list=PROFILE_ARCHIVE_FORMAT_LIST,
+                    parameter_name="profile_archive_format",
+                )
+            )
+
         if browser_params.callstack_instrument and not browser_params.js_instrument:
             raise ConfigError(
                 "The callstacks instrument currently doesn't work without "
@@ -2,6 +2,7 @@ import json
 import logging
 import os.path
 import tempfile
+import time
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
@@ -11,9 +12,11 @@ from pyvirtualdisplay import Display
 from selenium import webdriver
 
 from ..commands.profile_commands import load_profile
+from ..commands.utils.profile_checkpoint import is_checkpoint
 from ..config import BrowserParamsInternal, ConfigEncoder, ManagerParamsInternal
 from ..utilities.platform_utils import get_firefox_binary_path
 from . import configure_firefox
+from .profile_template import ProfileTemplateCache, copy_profile, template_key
 from .selenium_firefox import FirefoxBinary, FirefoxLogInterceptor, Options
 
 DEFAULT_SCREEN_RES = (1366, 768)
@@ -29,9 +32,11 @@ def deploy_firefox(
     """
     launches a firefox instance with parameters set by the input dictionary
     """
+    start_time = time.time()
     firefox_binary_path = get_firefox_binary_path()
 
     root_dir = os.path.dirname(__file__)  # directory of this file
+    ext_loc = os.path.normpath(os.path.join(root_dir, "../../Extension/openwpm.xpi"))
 
     browser_profile_path = Path(tempfile.mkdtemp(prefix="firefox_profile_"))
     status_queue.put(("STATUS", "Profile Created", browser_profile_path))
@@ -48,6 +53,56 @@ def deploy_firefox(
     fo.add_argument(str(browser_profile_path))
 
     assert browser_params.browser_id is not None
+
+    # Configure privacy settings
+    configure_firefox.privacy(browser_params, fo)
+
+    # Set various prefs to improve speed and eliminate traffic to Mozilla
+    configure_firefox.optimize_prefs(fo)
+
+    # Set custom prefs. These are set after all of the default prefs to allow
+    # our defaults to be overwritten.
+    for name, value in browser_params.prefs.items():
+        logger.info(
+            "BROWSER %i: Setting custom preference: %s = %s"
+            % (browser_params.browser_id, name, value)
+        )
+        fo.set_preference(name, value)
+
+    # Start from an initialized profile, unless a whole profile is loaded from
+    # a tar. The checkpoints only hold the state, restored over the template.
+    template_status = None
+    profile_tar = (
+        browser_params.seed_tar
+        if browser_params.seed_tar and not crash_recovery
+        else browser_params.recovery_tar
+    )
+    if manager_params.profile_template_dir is not None and (
+        profile_tar is None or is_checkpoint(profile_tar)
+    ):
+        template_cache = ProfileTemplateCache(manager_params.profile_template_dir)
+        key = template_key(
+            fo.preferences,
+            firefox_binary_path,
+            ext_loc if browser_params.extension_enabled else None,
+        )
+        template = template_cache.get(key)
+        template_status = "hit"
+        if template is None:
+            template_status = "miss"
+            logger.info(
+                "BROWSER %i: Building the profile template %s"
+                % (browser_params.browser_id, key[:12])
+            )
+            template = template_cache.build(
+                key,
+                lambda profile_path: initialize_profile(
+                    profile_path, fo.preferences, firefox_binary_path
+                ),
+            )
+        copy_profile(template, browser_profile_path)
+    profile_time = time.time()
+
     if browser_params.seed_tar and not crash_recovery:
         logger.info(
             "BROWSER %i: Loading initial browser profile from: %s"
@@ -114,28 +169,14 @@ def deploy_firefox(
         # TODO restore detailed logging
         # fo.set_preference("extensions.@openwpm.sdk.console.logLevel", "all")
 
-    # Configure privacy settings
-    configure_firefox.privacy(browser_params, fo)
-
-    # Set various prefs to improve speed and eliminate traffic to Mozilla
-    configure_firefox.optimize_prefs(fo)
-
     # Intercept logging at the Selenium level and redirect it to the
     # main logger.
     interceptor = FirefoxLogInterceptor(browser_params.browser_id)
     interceptor.start()
 
-    # Set custom prefs. These are set after all of the default prefs to allow
-    # our defaults to be overwritten.
-    for name, value in browser_params.prefs.items():
-        logger.info(
-            "BROWSER %i: Setting custom preference: %s = %s"
-            % (browser_params.browser_id, name, value)
-        )
-        fo.set_preference(name, value)
-
     # Launch the webdriver
     status_queue.put(("STATUS", "Launch Attempted", None))
+    launch_time = time.time()
     fb = FirefoxBinary(firefox_path=firefox_binary_path)
     driver = webdriver.Firefox(
         firefox_binary=fb,
@@ -147,8 +188,6 @@ def deploy_firefox(
     if browser_params.extension_enabled:
 
         # Install extension
-        ext_loc = os.path.join(root_dir, "../../Extension/openwpm.xpi")
-        ext_loc = os.path.normpath(ext_loc)
         driver.install_addon(ext_loc, temporary=True)
         logger.debug(
             "BROWSER %i: OpenWPM Firefox extension loaded" % browser_params.browser_id
@@ -166,5 +205,35 @@ def deploy_firefox(
         raise RuntimeError("Unable to identify Firefox process ID.")
 
     status_queue.put(("STATUS", "Browser Launched", int(pid)))
+    logger.info(
+        "BROWSER %i: Firefox started in %.2f seconds (profile %.2f s, "
+        "profile template %s, browser %.2f s)"
+        % (
+            browser_params.browser_id,
+            time.time() - start_time,
+            profile_time - start_time,
+            template_status or "disabled",
+            time.time() - launch_time,
+        )
+    )
 
     return driver, browser_profile_path, display
+
+
+def initialize_profile(
+    profile_path: Path, preferences: Dict[str, Any], firefox_binary_path: str
+) -> None:
+    """Starts and quits Firefox on a profile, so that it creates the files of
+    its first run and geckodriver writes the prefs to its user.js"""
+    fo = Options()
+    fo.add_argument("-profile")
+    fo.add_argument(str(profile_path))
+    fo.headless = True
+    for name, value in preferences.items():
+        fo.set_preference(name, value)
+    driver = webdriver.Firefox(
+        firefox_binary=FirefoxBinary(firefox_path=firefox_binary_path),
+        options=fo,
+        log_path=os.devnull,
+    )
+    driver.quit()
@@ -0,0 +1,148 @@
+"""Cache of initialized Firefox profiles that new browser profiles are copied from
+
+The first start of Firefox on an empty profile creates its databases,
+certificate stores and startup cache. A template is a profile on which Firefox
+was started and quit once with the prefs of the browser, so `user.js` holds the
+prefs and the first-run files exist. The templates are keyed by a digest of the
+prefs, the Firefox binary and the extension build, so a change of any of them
+builds a new template. Copies use copy-on-write clones (reflinks) where the
+filesystem supports them, and regular copies otherwise.
+"""
+
+import errno
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+
+# ioctl of Linux that clones a file with copy-on-write (btrfs, XFS, bcachefs)
+FICLONE = 0x40049409
+# Templates kept in the cache, the least recently used ones are removed
+MAX_TEMPLATES = 8
+# Files of a running Firefox, they aren't copied
+LOCK_FILES = ("lock", ".parentlock", "parent.lock")
+
+
+def file_fingerprint(path: Union[str, Path]) -> Any:
+    """Path, size and modification time of a file, None if it doesn't exist"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return [str(path), stat.st_size, stat.st_mtime_ns]
+
+
+def template_key(
+    preferences: Dict[str, Any],
+    firefox_binary_path: Union[str, Path],
+    extension_path: Optional[Union[str, Path]] = None,
+) -> str:
+    """Digest of everything that the initialized profile depends on"""
+    return hashlib.sha256(
+        json.dumps(
+            [
+                sorted(preferences.items()),
+                file_fingerprint(firefox_binary_path),
+                file_fingerprint(extension_path) if extension_path else None,
+            ],
+            default=repr,
+        ).encode()
+    ).hexdigest()
+
+
+def clone_file(src: Union[str, Path], dst: Union[str, Path]) -> None:
+    """Copies a file as a copy-on-write clone if the filesystem supports it
+
+    Hard links aren't used since Firefox writes its SQLite databases in place,
+    which would change the template.
+    """
+    if fcntl is not None:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            try:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            except OSError as e:
+                if e.errno not in (
+                    errno.EOPNOTSUPP,
+                    errno.ENOTTY,
+                    errno.EXDEV,
+                    errno.EINVAL,
+                    errno.ENOSYS,
+                ):
+                    raise
+            else:
+                shutil.copystat(src, dst)
+                return
+    shutil.copy2(src, dst)
+
+
+def copy_profile(src: Path, dst: Path) -> None:
+    """Copies the files of a profile into a (possibly existing) directory"""
+    shutil.copytree(
+        src,
+        dst,
+        copy_function=clone_file,
+        ignore=shutil.ignore_patterns(*LOCK_FILES),
+        dirs_exist_ok=True,
+    )
+
+
+class ProfileTemplateCache:
+    """
+    :param cache_dir: Directory of the templates, one directory per key.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = Path(cache_dir)
+
+    def get(self, key: str) -> Optional[Path]:
+        path = self.cache_dir / key
+        if not path.is_dir():
+            return None
+        # The modification time orders the templates for the eviction
+        os.utime(path)
+        return path
+
+    def build(self, key: str, initialize: Callable[[Path], None]) -> Path:
+        """Builds the template of a key with `initialize(profile_path)`
+
+        Built in a temporary directory that is renamed, so that the browsers
+        that build the same template at the same time don't see a partial one.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        temp_path = Path(tempfile.mkdtemp(prefix=f".{key[:12]}-", dir=self.cache_dir))
+        try:
+            initialize(temp_path)
+            for name in LOCK_FILES:
+                (temp_path / name).unlink(missing_ok=True)
+            os.rename(temp_path, self.cache_dir / key)
+        except OSError as e:
+            shutil.rmtree(temp_path, ignore_errors=True)
+            if e.errno not in (errno.EEXIST, errno.ENOTEMPTY):
+                raise
+            # Built by another browser in the meantime
+        except BaseException:
+            shutil.rmtree(temp_path, ignore_errors=True)
+            raise
+        self.evict()
+        return self.cache_dir / key
+
+    def evict(self) -> None:
+        templates = sorted(
+            (
+                path
+                for path in self.cache_dir.iterdir()
+                if not path.name.startswith(".")
+            ),
+            key=lambda path: path.stat().st_mtime_ns,
+            reverse=True,
+        )
+        for path in templates[MAX_TEMPLATES:]:
+            shutil.rmtree(path, ignore_errors=True)
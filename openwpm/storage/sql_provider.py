@@ -2,6 +2,7 @@ import json
 import logging
 import os
 import sqlite3
+from collections import defaultdict
 from pathlib import Path
 from sqlite3 import (
     Connection,
@@ -11,7 +12,7 @@ from sqlite3 import (
     OperationalError,
     ProgrammingError,
 )
-from typing import Any, Dict, List, Tuple
+from typing import Any, DefaultDict, Dict, List, Tuple
 
 from openwpm.types import VisitId
 
@@ -19,20 +20,50 @@ from .storage_providers import StructuredStorageProvider, TableName
 
 SCHEMA_FILE = os.path.join(os.path.dirname(__file__), "schema.sql")
 
+# Buffered rows are written out once this many have accumulated,
+# even if the visit hasn't been finalized yet
+BATCH_SIZE = 5000
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",  # 64 MiB
+    "PRAGMA temp_store=MEMORY",
+)
+# Types sqlite3 can bind without any conversion
+_NATIVE_TYPES = frozenset({int, float, str, type(None)})
+
+_InsertKey = Tuple[TableName, Tuple[str, ...]]
+
+
+def _coerce(value: Any) -> Any:
+    if isinstance(value, bytes):
+        return str(value, errors="ignore")
+    elif callable(value):
+        return str(value)
+    elif type(value) == dict:
+        return json.dumps(value)
+    return value
+
 
 class SQLiteStorageProvider(StructuredStorageProvider):
     db: Connection
     cur: Cursor
 
-    def __init__(self, db_path: Path) -> None:
+    def __init__(self, db_path: Path, batch_size: int = BATCH_SIZE) -> None:
         super().__init__()
         self.db_path = db_path
+        self.batch_size = batch_size
         self._sql_counter = 0
         self._sql_commit_time = 0
+        self._statements: Dict[_InsertKey, str] = {}
+        self._pending: DefaultDict[_InsertKey, List[List[Any]]] = defaultdict(list)
+        self._pending_count = 0
         self.logger = logging.getLogger("openwpm")
 
     async def init(self) -> None:
         self.db = sqlite3.connect(str(self.db_path))
+        for pragma in PRAGMAS:
+            self.db.execute(pragma)
         self.cur = self.db.cursor()
         self._create_tables()
 
@@ -43,23 +74,54 @@ class SQLiteStorageProvider(StructuredStorageProvider):
         self.db.commit()
 
     async def flush_cache(self) -> None:
+        self._flush_pending()
         self.db.commit()
 
     async def store_record(
         self, table: TableName, visit_id: VisitId, record: Dict[str, Any]
     ) -> None:
         """Submit a record to be stored
-        The storing might not happen immediately
+        The record is buffered with all other records for the same table and
+        columns and written out with a single executemany
         """
         assert self.cur is not None
-        statement, args = self._generate_insert(table=table, data=record)
-        for i in range(len(args)):
-            if isinstance(args[i], bytes):
-                args[i] = str(args[i], errors="ignore")
-            elif callable(args[i]):
-                args[i] = str(args[i])
-            elif type(args[i]) == dict:
-                args[i] = json.dumps(args[i])
+        key = (table, tuple(record))
+        if key not in self._statements:
+            self._statements[key] = self._generate_insert(table, record)[0]
+        self._pending[key].append(
+            [v if type(v) in _NATIVE_TYPES else _coerce(v) for v in record.values()]
+        )
+        self._pending_count += 1
+        if self._pending_count >= self.batch_size:
+            self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        """Write out all buffered rows, one executemany per table and column set"""
+        pending, self._pending = self._pending, defaultdict(list)
+        self._pending_count = 0
+        if pending and not self.db.in_transaction:
+            # Otherwise releasing the savepoint below would commit
+            self.cur.execute("BEGIN")
+        for key, rows in pending.items():
+            statement = self._statements[key]
+            self.cur.execute("SAVEPOINT store_records")
+            try:
+                self.cur.executemany(statement, rows)
+                self._sql_counter += len(rows)
+            except (
+                OperationalError,
+                ProgrammingError,
+                IntegrityError,
+                InterfaceError,
+            ):
+                # Undo the partial batch and insert row by row
+                # so only the offending records get dropped
+                self.cur.execute("ROLLBACK TO store_records")
+                for args in rows:
+                    self._execute_insert(statement, args)
+            self.cur.execute("RELEASE store_records")
+
+    def _execute_insert(self, statement: str, args: List[Any]) -> None:
         try:
             self.cur.execute(statement, args)
             self._sql_counter += 1
@@ -93,17 +155,20 @@ class SQLiteStorageProvider(StructuredStorageProvider):
         return statement, values
 
     def execute_statement(self, statement: str) -> None:
+        self._flush_pending()
         self.cur.execute(statement)
         self.db.commit()
 
     async def finalize_visit_id(
         self, visit_id: VisitId, interrupted: bool = False
     ) -> None:
+        self._flush_pending()
         if interrupted:
             self.logger.warning("Visit with visit_id %d got interrupted", visit_id)
             self.cur.execute("INSERT INTO incomplete_visits VALUES (?)", (visit_id,))
         self.db.commit()
 
     async def shutdown(self) -> None:
+        self._flush_pending()
         self.db.commit()
         self.db.close()
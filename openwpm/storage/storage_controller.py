@@ -4,11 +4,12 @@ import logging
 import queue
 import random
 import socket
+import threading
 import time
 from asyncio import IncompleteReadError, Task
 from asyncio.base_events import Server
 from collections import defaultdict
-from typing import Any, DefaultDict, Dict, List, NoReturn, Optional, Tuple
+from typing import Any, Callable, DefaultDict, Dict, List, NoReturn, Optional, Tuple
 
 from multiprocess import Queue
 
@@ -25,6 +26,7 @@ from .storage_providers import (
 
 RECORD_TYPE_CONTENT = "page_content"
 RECORD_TYPE_META = "meta_information"
+RECORD_TYPE_BATCH = "record_batch"
 ACTION_TYPE_FINALIZE = "Finalize"
 ACTION_TYPE_INITIALIZE = "Initialize"
 
@@ -141,6 +143,21 @@ class StorageController:
                 )
                 continue
 
+            if record_type == RECORD_TYPE_BATCH:
+                for table_name, batch_record in data:
+                    if "visit_id" not in batch_record:
+                        self.logger.error(
+                            "Skipping record: No visit_id contained in record %r",
+                            batch_record,
+                        )
+                        continue
+                    await self.store_record(
+                        TableName(table_name),
+                        VisitId(batch_record["visit_id"]),
+                        batch_record,
+                    )
+                continue
+
             if "visit_id" not in data:
                 self.logger.error(
                     "Skipping record: No visit_id contained in record %r", record
@@ -376,6 +393,16 @@ class DataSocket:
             )
         )
 
+    def store_records(
+        self, records: List[Tuple[TableName, VisitId, Dict[str, Any]]]
+    ) -> None:
+        """Sends many records to the StorageController in a single message"""
+        batch = []
+        for table_name, visit_id, data in records:
+            data["visit_id"] = visit_id
+            batch.append((table_name, data))
+        self.socket.send((RECORD_TYPE_BATCH, batch))
+
     def finalize_visit_id(self, visit_id: VisitId, success: bool) -> None:
         self.socket.send(
             (
@@ -408,8 +435,11 @@ class StorageControllerHandle:
         self.status_queue = Queue()
         self.completion_queue = Queue()
         self.shutdown_queue = Queue()
-        self._last_status = None
+        self._last_status: Optional[int] = None
         self._last_status_received: Optional[float] = None
+        self._status_updates = 0
+        self._status_condition = threading.Condition()
+        self._status_thread: Optional[threading.Thread] = None
         self.logger = logging.getLogger("openwpm")
         self.storage_controller = StorageController(
             structured_storage,
@@ -481,17 +511,68 @@ class StorageControllerHandle:
         self.storage_controller.start()
 
         self.listener_address = self.status_queue.get()
+        self._status_thread = threading.Thread(target=self._receive_status)
+        self._status_thread.daemon = True
+        self._status_thread.name = "OpenWPM-storage_status"
+        self._status_thread.start()
+
+    def _receive_status(self) -> None:
+        """Keeps the most recent queue size sent from the Storage Controller
+        process and wakes up the threads waiting for it"""
+        while True:
+            try:
+                status = self.status_queue.get(block=True, timeout=STATUS_TIMEOUT)
+            except queue.Empty:
+                # The waiting threads check how old the last status is
+                with self._status_condition:
+                    self._status_condition.notify_all()
+                continue
+            if status is None:
+                # Sent by shutdown
+                return
+            with self._status_condition:
+                self._last_status = status
+                self._last_status_received = time.time()
+                self._status_updates += 1
+                self._status_condition.notify_all()
+
+    def _wait_for_status(self, predicate: Callable[[], bool]) -> int:
+        """Blocks until the predicate on the received statuses is true. Raises if
+        the Storage Controller sends no status for STATUS_TIMEOUT seconds"""
+        start = time.time()
+        with self._status_condition:
+            while not predicate():
+                since = max(start, self._last_status_received or start)
+                remaining = since + STATUS_TIMEOUT - time.time()
+                if remaining <= 0:
+                    raise RuntimeError(
+                        "No status update from the storage controller process "
+                        "for %d seconds." % (time.time() - since)
+                    )
+                self._status_condition.wait(remaining)
+            assert isinstance(self._last_status, int)
+            return self._last_status
 
-    def get_new_completed_visits(self) -> List[Tuple[int, bool]]:
+    def get_new_completed_visits(
+        self, timeout: Optional[float] = None
+    ) -> List[Tuple[int, bool]]:
         """
         Returns a list of all visit ids that have been processed since
         the last time the method was called and whether or not they
         ran successfully.
 
         This method will return an empty list in case no visit ids have
-        been processed since the last time this method was called
+        been processed since the last time this method was called, after
+        waiting up to `timeout` seconds for one if given
         """
         finished_visit_ids = list()
+        if timeout is not None:
+            try:
+                finished_visit_ids.append(
+                    self.completion_queue.get(block=True, timeout=timeout)
+                )
+            except queue.Empty:
+                return finished_visit_ids
         while not self.completion_queue.empty():
             finished_visit_ids.append(self.completion_queue.get())
         return finished_visit_ids
@@ -503,6 +584,9 @@ class StorageControllerHandle:
         self.shutdown_queue.put((SHUTDOWN_SIGNAL, relaxed))
         start_time = time.time()
         self.storage_controller.join(300)
+        if self._status_thread is not None:
+            self.status_queue.put(None)
+            self._status_thread.join()
         self.logger.debug(
             "%s took %s seconds to close."
             % (type(self).__name__, str(time.time() - start_time))
@@ -512,35 +596,34 @@ class StorageControllerHandle:
         """Return the most recent queue size sent from the Storage Controller process"""
 
         # Block until we receive the first status update
-        if self._last_status is None:
-            return self.get_status()
-
-        # Drain status queue until we receive most recent update
-        while not self.status_queue.empty():
-            self._last_status = self.status_queue.get()
-            self._last_status_received = time.time()
+        status = self._wait_for_status(lambda: self._last_status is not None)
 
         # Check last status signal
+        assert self._last_status_received is not None
         if (time.time() - self._last_status_received) > STATUS_TIMEOUT:
             raise RuntimeError(
                 "No status update from the storage controller process "
                 "for %d seconds." % (time.time() - self._last_status_received)
             )
 
-        return self._last_status
+        return status
 
     def get_status(self) -> int:
-        """Get listener process status. If the status queue is empty, block."""
-        try:
-            self._last_status = self.status_queue.get(
-                block=True, timeout=STATUS_TIMEOUT
+        """Block until the next status update of the listener process"""
+        updates = self._status_updates
+        return self._wait_for_status(lambda: self._status_updates > updates)
+
+    def wait_for_capacity(self, limit: int) -> int:
+        """Block until the Storage Controller has less than `limit` unfinished
+        records, waking up on its status updates. Returns the queue size"""
+        status = self.get_most_recent_status()
+        if status >= limit:
+            self.logger.info(
+                "Blocking command submission until the storage controller "
+                "is below the max queue size of %d. Current queue "
+                "length %d. " % (limit, status)
             )
-            self._last_status_received = time.time()
-        except queue.Empty:
-            assert self._last_status_received is not None
-            raise RuntimeError(
-                "No status update from the storage controller process "
-                "for %d seconds." % (time.time() - self._last_status_received)
+            status = self._wait_for_status(
+                lambda: self._last_status is not None and self._last_status < limit
             )
-        assert isinstance(self._last_status, int)
-        return self._last_status
+        return status
@@ -3,8 +3,9 @@ import os
 import pickle
 import threading
 import time
+from concurrent.futures import Future
 from types import TracebackType
-from typing import Any, Dict, List, Optional, Set, Type
+from typing import Any, Callable, Dict, List, Optional, Set, Type
 
 import psutil
 import tblib
@@ -18,6 +19,7 @@ from openwpm.config import (
 )
 
 from .browser_manager import BrowserManagerHandle
+from .command_dispatcher import CommandDispatcher, Submission
 from .command_sequence import CommandSequence
 from .errors import CommandExecutionError
 from .js_instrumentation import clean_js_instrumentation_settings
@@ -145,6 +147,15 @@ class TaskManager:
         self.callback_thread.name = "OpenWPM-completion_handler"
         self.callback_thread.start()
 
+        # Starts the submitted CommandSequences as soon as their browser is free
+        self.dispatcher = CommandDispatcher(
+            self.browsers,
+            self._start_thread,
+            lambda: self.storage_controller_handle.wait_for_capacity(
+                STORAGE_CONTROLLER_JOB_LIMIT
+            ),
+        )
+
     def __enter__(self):
         """
         Execute starting procedure for TaskManager
@@ -238,10 +249,11 @@ class TaskManager:
                 display_pids: Set[int] = set()
                 check_time = time.time()
                 for browser in self.browsers:
-                    if browser.geckodriver_pid is not None:
-                        geckodriver_pids.add(browser.geckodriver_pid)
-                    if browser.display_pid is not None:
-                        display_pids.add(browser.display_pid)
+                    for handle in [browser, *browser.spare_browsers()]:
+                        if handle.geckodriver_pid is not None:
+                            geckodriver_pids.add(handle.geckodriver_pid)
+                        if handle.display_pid is not None:
+                            display_pids.add(handle.display_pid)
                 for process in psutil.process_iter():
                     if process.create_time() + 300 < check_time and (
                         (
@@ -295,6 +307,12 @@ class TaskManager:
         """
         if self.closing:
             return
+        if hasattr(self, "dispatcher"):
+            if relaxed:
+                # Start the CommandSequences that were submitted before closing
+                self.dispatcher.wait_for_pending()
+            self.closing = True
+            self.dispatcher.close()
         self.closing = True
 
         for browser in self.browsers:
@@ -346,30 +364,44 @@ class TaskManager:
     # CRAWLER COMMAND CODE
 
     def _start_thread(
-        self, browser: BrowserManagerHandle, command_sequence: CommandSequence
+        self,
+        browser: BrowserManagerHandle,
+        command_sequence: CommandSequence,
+        on_done: Callable[[int], None],
     ) -> threading.Thread:
-        """starts the command execution thread"""
+        """starts the command execution thread, which calls `on_done` with
+        the visit id once the CommandSequence finished"""
 
         # Check status flags before starting thread
         if self.closing:
             self.logger.error("Attempted to execute command on a closed TaskManager")
             raise RuntimeError("Attempted to execute command on a closed TaskManager")
-        self._check_failure_status()
+        if self.failure_status:
+            # Raised by _check_failure_status in the thread of the caller
+            raise CommandExecutionError(
+                "TaskManager failure status set", command_sequence
+            )
         visit_id = self.storage_controller_handle.get_next_visit_id()
         browser.set_visit_id(visit_id)
+        browser.current_timeout = command_sequence.total_timeout
         if command_sequence.callback:
             self.unsaved_command_sequences[visit_id] = command_sequence
 
+        def execute() -> None:
+            try:
+                browser.execute_command_sequence(self, command_sequence)
+            finally:
+                on_done(visit_id)
+
         # Start command execution thread
-        args = (self, command_sequence)
-        thread = threading.Thread(target=browser.execute_command_sequence, args=args)
+        thread = threading.Thread(target=execute)
         browser.command_thread = thread
         thread.daemon = True
         thread.start()
         return thread
 
     def _mark_command_sequences_complete(self) -> None:
-        """Polls the storage controller for saved records
+        """Waits for the storage controller to save records
         and calls their callbacks
         """
         while True:
@@ -377,17 +409,38 @@ class TaskManager:
                 # we're shutting down and have no unprocessed callbacks
                 break
 
-            visit_id_list = self.storage_controller_handle.get_new_completed_visits()
-            if not visit_id_list:
-                time.sleep(1)
-                continue
-
+            visit_id_list = self.storage_controller_handle.get_new_completed_visits(
+                timeout=1
+            )
             for visit_id, successful in visit_id_list:
                 self.logger.debug("Invoking callback of visit_id %d", visit_id)
                 cs = self.unsaved_command_sequences.pop(visit_id, None)
                 if cs:
                     cs.mark_done(successful)
 
+    def submit(
+        self, command_sequence: CommandSequence, index: Optional[int] = None
+    ) -> "Future[int]":
+        """
+        Queues the CommandSequence and returns without waiting for a browser.
+        <index> is the browser to send it to, or None for the first free one.
+
+        The returned future resolves to the visit id once the browser finished
+        the CommandSequence, or raises if it couldn't be started. Failures of
+        the browsers are raised by the next `execute_command_sequence`.
+        """
+        return self._submit(command_sequence, index).future
+
+    def _submit(
+        self, command_sequence: CommandSequence, index: Optional[int]
+    ) -> Submission:
+        if index is not None and not 0 <= index < len(self.browsers):
+            raise IndexError(
+                "Browser index %d out of range of %d browsers"
+                % (index, len(self.browsers))
+            )
+        return self.dispatcher.submit(command_sequence, index)
+
     def execute_command_sequence(
         self, command_sequence: CommandSequence, index: Optional[int] = None
     ) -> None:
@@ -396,49 +449,25 @@ class TaskManager:
         <index> specifies the type of command this is:
         None  -> first come, first serve
         int  -> index of browser to send command to
-        """
-
-        # Block if the storage controller has too many unfinished records
-        agg_queue_size = self.storage_controller_handle.get_most_recent_status()
-        if agg_queue_size >= STORAGE_CONTROLLER_JOB_LIMIT:
-            while agg_queue_size >= STORAGE_CONTROLLER_JOB_LIMIT:
-                self.logger.info(
-                    "Blocking command submission until the storage controller "
-                    "is below the max queue size of %d. Current queue "
-                    "length %d. " % (STORAGE_CONTROLLER_JOB_LIMIT, agg_queue_size)
-                )
-                agg_queue_size = self.storage_controller_handle.get_status()
 
-        # Distribute command
-        if index is None:
-            # send to first browser available
-            command_executed = False
-            while True:
-                for browser in self.browsers:
-                    if browser.ready():
-                        browser.current_timeout = command_sequence.total_timeout
-                        thread = self._start_thread(browser, command_sequence)
-                        command_executed = True
-                        break
-                if command_executed:
-                    break
-                time.sleep(SLEEP_CONS)
-        elif 0 <= index < len(self.browsers):
-            # send the command to this specific browser
-            while True:
-                if self.browsers[index].ready():
-                    self.browsers[index].current_timeout = (
-                        command_sequence.total_timeout
-                    )
-                    thread = self._start_thread(self.browsers[index], command_sequence)
-                    break
-                time.sleep(SLEEP_CONS)
-        else:
+        Blocks until a browser starts the CommandSequence, and until it's
+        finished if the CommandSequence is blocking
+        """
+        if index is not None and not 0 <= index < len(self.browsers):
             self.logger.info("Command index type is not supported or out of range")
             return
+        self._check_failure_status()
+
+        # The dispatcher waits for the storage controller to be below
+        # STORAGE_CONTROLLER_JOB_LIMIT before starting the CommandSequence
+        submission = self._submit(command_sequence, index)
+        submission.dispatched.wait()
+        if submission.future.done() and submission.future.exception() is not None:
+            self._check_failure_status()
+            raise submission.future.exception()  # type: ignore[misc]
 
         if command_sequence.blocking:
-            thread.join()
+            submission.future.result()
             self._check_failure_status()
 
     # DEFINITIONS OF HIGH LEVEL COMMANDS
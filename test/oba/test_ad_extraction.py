@@ -0,0 +1,83 @@
+from typing import Any, List
+
+import pytest
+from selenium.common.exceptions import JavascriptException
+
+from oba import ad_extraction
+from oba.ad_extraction import (
+    IN_PAGE_DETECTION_SCRIPT,
+    PAGE_TOKENS_SCRIPT,
+    group_selectors,
+    identify_ads_in_dom,
+)
+from oba.easylist_index import EasyListIndex
+
+VISIT_URL = "https://www.example.com/"
+
+
+class FakeElement:
+    def __init__(self, id: str) -> None:
+        self.id = id
+
+
+class FakeDriver:
+    """Records the WebDriver calls issued by identify_ads_in_dom"""
+
+    current_url = VISIT_URL
+
+    def __init__(self, fail_script: bool = False) -> None:
+        self.fail_script = fail_script
+        self.scripts: List[Any] = []
+        self.find_elements_calls = 0
+
+    def execute_script(self, script: str, *args: Any) -> Any:
+        self.scripts.append((script, args))
+        if self.fail_script:
+            raise JavascriptException("script failed")
+        if script == PAGE_TOKENS_SCRIPT:
+            return [["ad"], ["banner"], ["div"]]
+        return [FakeElement("a"), FakeElement("b")]
+
+    def find_elements(self, by: str, selector: str) -> List[FakeElement]:
+        self.find_elements_calls += 1
+        # Every selector matches the same element, which must be reported once
+        return [FakeElement("a")] if selector in ("#ad", ".banner") else []
+
+
+@pytest.fixture(autouse=True)
+def easylist_index(monkeypatch: pytest.MonkeyPatch) -> EasyListIndex:
+    index = EasyListIndex.from_easylist(
+        ["###ad", "##.banner", "###other", "example.com##.sponsored"]
+    )
+    monkeypatch.setattr(ad_extraction, "get_easylist_index", lambda: index)
+    return index
+
+
+def test_group_selectors() -> None:
+    selectors = [f"#ad{i}" for i in range(7)]
+    groups = group_selectors(selectors, group_size=3)
+    assert groups == [selectors[0:3], selectors[3:6], selectors[6:7]]
+    assert group_selectors([], group_size=3) == []
+
+
+def test_in_page_detection_evaluates_relevant_selectors() -> None:
+    driver = FakeDriver()
+    ads = identify_ads_in_dom(driver, visit_url=VISIT_URL)
+    assert [ad.id for ad in ads] == ["a", "b"]
+    assert [script for script, _ in driver.scripts] == [
+        PAGE_TOKENS_SCRIPT,
+        IN_PAGE_DETECTION_SCRIPT,
+    ]
+    _, args = driver.scripts[1]
+    # "#other" isn't present in the page
+    assert sorted(args[0][0]) == ["#ad", ".banner", ".sponsored"]
+    assert driver.find_elements_calls == 0
+
+
+@pytest.mark.parametrize("in_page", [True, False])
+def test_per_selector_fallback(in_page: bool) -> None:
+    driver = FakeDriver(fail_script=True)
+    ads = identify_ads_in_dom(driver, in_page=in_page)
+    assert [ad.id for ad in ads] == ["a"]
+    assert driver.find_elements_calls == 4
+    assert len(driver.scripts) == (1 if in_page else 0)
@@ -0,0 +1,81 @@
+import sqlite3
+
+import pytest
+
+from oba.ad_url_filter import NON_ADS_URLS_FILE, AdURLFilter
+from openwpm.storage.sql_provider import SCHEMA_FILE
+
+AD_URLS = [
+    "https://adssettings.google.com/whythisad?source=display",
+    "https://SUPPORT.google.com/adsense",
+    "https://www.shop.example/product?id=1",
+    "https://popup.taboola.com/en/?template=colorbox",
+    "https://www.shop.example/product?id=1",
+    "https://clickserve.example/ad?u=https%3A%2F%2Fadssettings.google.com",
+    None,
+]
+
+
+@pytest.fixture
+def crawl_conn() -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    with open(SCHEMA_FILE, "r") as f:
+        conn.executescript(f.read())
+    insert_ads(conn, AD_URLS)
+    return conn
+
+
+def insert_ads(conn: sqlite3.Connection, ad_urls: list) -> None:
+    conn.executemany(
+        "INSERT INTO visit_advertisements (visit_id, ad_url) VALUES (1, ?)",
+        [(ad_url,) for ad_url in ad_urls],
+    )
+    conn.commit()
+
+
+def marked_ids(conn: sqlite3.Connection) -> list:
+    return [
+        ad_id
+        for ad_id, in conn.execute(
+            "SELECT ad_id FROM visit_advertisements WHERE non_ad=1 ORDER BY ad_id"
+        )
+    ]
+
+
+def test_same_rows_as_like_queries(crawl_conn: sqlite3.Connection) -> None:
+    ad_filter = AdURLFilter.from_file(NON_ADS_URLS_FILE)
+    expected = sqlite3.connect(":memory:")
+    crawl_conn.backup(expected)
+    for pattern in ad_filter.patterns:
+        expected.execute(
+            "UPDATE visit_advertisements SET non_ad=1 WHERE ad_url LIKE :ad_url",
+            {"ad_url": f"%{pattern}%"},
+        )
+
+    result = ad_filter.mark_ads(crawl_conn, "non_ad")
+    assert marked_ids(crawl_conn) == marked_ids(expected) == [1, 2, 4, 6]
+    assert result["scanned"] == len(AD_URLS)
+    assert result["distinct_urls"] == len(AD_URLS) - 1
+    assert result["marked"] == 4
+
+
+def test_incremental_runs(crawl_conn: sqlite3.Connection) -> None:
+    ad_filter = AdURLFilter(["adssettings.google.com"])
+    assert ad_filter.mark_ads(crawl_conn, "non_ad")["marked"] == 2
+    assert ad_filter.mark_ads(crawl_conn, "non_ad")["scanned"] == 0
+
+    insert_ads(crawl_conn, ["https://adssettings.google.com/", "https://a.example/"])
+    result = ad_filter.mark_ads(crawl_conn, "non_ad")
+    assert (result["scanned"], result["marked"]) == (2, 1)
+
+    # New patterns trigger a rescan of the rows that aren't marked yet
+    result = AdURLFilter(["adssettings.google.com", "a.example"]).mark_ads(
+        crawl_conn, "non_ad"
+    )
+    assert (result["scanned"], result["marked"]) == (len(AD_URLS) - 2 + 1, 1)
+    assert marked_ids(crawl_conn) == [1, 6, 8, 9]
+
+
+def test_unknown_column(crawl_conn: sqlite3.Connection) -> None:
+    with pytest.raises(ValueError):
+        AdURLFilter(["x"]).mark_ads(crawl_conn, "ad_url")
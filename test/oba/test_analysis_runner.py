@@ -0,0 +1,166 @@
+import json
+import os
+import sqlite3
+
+import pytest
+
+from oba import experiment_metrics
+from oba.analysis_runner import AnalysisRunner, Experiment, Step
+from oba.analysis_steps import ANALYSIS_STEPS
+from openwpm.storage.sql_provider import SCHEMA_FILE
+
+EXPERIMENTS = [Experiment("experiment_accept"), Experiment("experiment_reject")]
+
+
+def record(context, name):
+    """Logs the computed steps to a file, so that the workers' steps are seen too"""
+    with open("computed.log", "a") as f:
+        f.write(f"{context.experiment.name} {name}\n")
+
+
+def visits(context):
+    record(context, "visits")
+    return context.metrics.conn.execute("SELECT COUNT(*) FROM site_visits").fetchone()[
+        0
+    ]
+
+
+def double(context, visits):
+    record(context, "double")
+    return 2 * visits
+
+
+def report(context, visits, double):
+    record(context, "report")
+    return f"{context.experiment.name}: {visits} {double}"
+
+
+STEPS = [
+    Step("report", report, ("visits", "double"), cache=False),
+    Step("double", double, ("visits",)),
+    Step("visits", visits),
+]
+
+
+def computed():
+    if not os.path.exists("computed.log"):
+        return []
+    with open("computed.log") as f:
+        steps = f.read().splitlines()
+    os.remove("computed.log")
+    return steps
+
+
+@pytest.fixture
+def experiments_dir(tmp_path, monkeypatch):
+    """Crawl databases of the experiments in ./datadir"""
+    monkeypatch.setattr(experiment_metrics, "DATA_FROM_VOLUME", False)
+    monkeypatch.chdir(tmp_path)
+    with open(SCHEMA_FILE, "r") as f:
+        schema = f.read()
+    for number, experiment in enumerate(EXPERIMENTS, 1):
+        experiment_dir = tmp_path / "datadir" / experiment.name
+        experiment_dir.mkdir(parents=True)
+        with open(experiment_dir / f"{experiment.name}_config.json", "w") as f:
+            json.dump({"browser_ids": {"oba": [1], "clear": [2]}}, f)
+        conn = sqlite3.connect(experiment_dir / "crawl-data.sqlite")
+        conn.executescript(schema)
+        conn.executemany(
+            "INSERT INTO site_visits (visit_id, browser_id, site_url, site_rank) VALUES (?, 1, ?, ?)",
+            [(visit_id, "http://weather.com/", visit_id) for visit_id in range(number)],
+        )
+        conn.commit()
+        conn.close()
+    return tmp_path
+
+
+def test_plan():
+    runner = AnalysisRunner(STEPS)
+    assert runner.plan(["report"]) == ["visits", "double", "report"]
+    assert runner.plan(["double", "visits"]) == ["visits", "double"]
+    with pytest.raises(ValueError, match="Unknown step"):
+        runner.plan(["plot"])
+
+
+def test_invalid_steps():
+    with pytest.raises(ValueError, match="Unknown dependency"):
+        AnalysisRunner([Step("double", double, ("visits",))])
+    with pytest.raises(ValueError, match="cycle"):
+        AnalysisRunner(
+            [Step("visits", visits, ("double",)), Step("double", double, ("visits",))]
+        )
+
+
+def test_results_are_cached(experiments_dir):
+    runner = AnalysisRunner(STEPS, cache_dir=experiments_dir / "cache")
+    results = runner.run(EXPERIMENTS, ["report", "double"], num_workers=1)
+    assert results == {
+        "experiment_accept": {"report": "experiment_accept: 1 2", "double": 2},
+        "experiment_reject": {"report": "experiment_reject: 2 4", "double": 4},
+    }
+    assert computed() == [
+        "experiment_accept visits",
+        "experiment_accept double",
+        "experiment_accept report",
+        "experiment_reject visits",
+        "experiment_reject double",
+        "experiment_reject report",
+    ]
+
+    # Only the steps that aren't cached run again, without their dependencies
+    assert runner.run(EXPERIMENTS, ["report"], num_workers=1) == {
+        "experiment_accept": {"report": "experiment_accept: 1 2"},
+        "experiment_reject": {"report": "experiment_reject: 2 4"},
+    }
+    assert computed() == ["experiment_accept report", "experiment_reject report"]
+    runner.run(EXPERIMENTS, ["double"], num_workers=1, refresh=True)
+    assert len(computed()) == 4
+
+
+def test_changed_database_invalidates_its_results(experiments_dir):
+    runner = AnalysisRunner(STEPS, cache_dir=experiments_dir / "cache")
+    runner.run(EXPERIMENTS, ["double"], num_workers=1)
+    computed()
+
+    conn = sqlite3.connect(
+        experiments_dir / "datadir" / "experiment_reject" / "crawl-data.sqlite"
+    )
+    conn.execute(
+        "INSERT INTO site_visits (visit_id, browser_id, site_url) VALUES (9, 1, 'http://training.com/')"
+    )
+    conn.commit()
+    conn.close()
+
+    targets = {"experiment_accept": ["double"], "experiment_reject": ["visits"]}
+    assert runner.run(EXPERIMENTS, targets, num_workers=1) == {
+        "experiment_accept": {"double": 2},
+        "experiment_reject": {"visits": 3},
+    }
+    assert computed() == ["experiment_reject visits"]
+    # The result of the previous database is replaced
+    assert len(list((experiments_dir / "cache" / "experiment_reject").iterdir())) == 2
+
+
+@pytest.mark.skipif(os.name == "nt", reason="fork isn't available on Windows")
+def test_experiments_run_in_parallel(experiments_dir):
+    runner = AnalysisRunner(STEPS, cache_dir=experiments_dir / "cache")
+    expected = runner.run(EXPERIMENTS, ["report"], num_workers=1)
+    computed()
+    assert (
+        runner.run(
+            EXPERIMENTS, ["report"], num_workers=2, refresh=True, start_method="fork"
+        )
+        == expected
+    )
+    assert sorted(computed()) == sorted(
+        f"{experiment.name} {step}"
+        for experiment in EXPERIMENTS
+        for step in ["visits", "double", "report"]
+    )
+
+
+def test_analysis_steps(experiments_dir):
+    runner = AnalysisRunner(ANALYSIS_STEPS, cache_dir=experiments_dir / "cache")
+    results = runner.run(EXPERIMENTS[:1], ["numvisits", "ads"], num_workers=1)
+    assert results["experiment_accept"]["numvisits"] is None
+    assert results["experiment_accept"]["ads"].empty
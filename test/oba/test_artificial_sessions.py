@@ -0,0 +1,166 @@
+import sqlite3
+
+import pytest
+
+from oba.artificial_sessions import assign_sessions, session_lookup, session_ranges
+from oba.experiment_metrics import ExperimentMetrics
+from oba.oba_analysis import OBAAnalysis
+from openwpm.storage.sql_provider import SCHEMA_FILE
+
+WEATHER = "http://weather.com/"
+FORECAST = "http://myforecast.com/"
+# (visit_id, site_url, site_rank)
+VISITS = [
+    (1, "http://training.com/", None),
+    (2, WEATHER, 1),
+    (3, FORECAST, 2),
+    (4, WEATHER, 3),
+    (5, WEATHER, 4),
+    (6, FORECAST, 5),
+    (7, WEATHER, 6),
+]
+NUMVISITS = [(10, WEATHER, 2), (10, FORECAST, 1), (20, WEATHER, 1), (30, WEATHER, 1)]
+
+
+@pytest.fixture
+def crawl_conn() -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    with open(SCHEMA_FILE, "r") as f:
+        conn.executescript(f.read())
+    conn.executemany(
+        "INSERT INTO site_visits (visit_id, browser_id, site_url, site_rank) VALUES (?, 1, ?, ?)",
+        VISITS,
+    )
+    conn.executemany(
+        "INSERT INTO landing_page_categories (landing_page_id, landing_page_url, category_code, category_name, parent_category, confident) VALUES (?, ?, '', ?, '', 1)",
+        [
+            (1, "https://shop.com/", "Style & Fashion"),
+            (2, "https://trip.com/", "Travel"),
+        ],
+    )
+    conn.executemany(
+        "INSERT INTO landing_pages (landing_page_id, landing_page_url) VALUES (?, ?)",
+        [(1, "https://shop.com/"), (2, "https://trip.com/")],
+    )
+    conn.executemany(
+        "INSERT INTO visit_advertisements (visit_id, browser_id, ad_url, landing_page_id, categorized, non_ad) VALUES (?, 1, ?, ?, ?, ?)",
+        [
+            (2, "https://ads.googlesyndication.com/a", 2, 1, None),
+            (2, "https://ads.googlesyndication.com/a", 2, 1, None),
+            (3, "https://ads.googlesyndication.com/b", 1, 1, None),
+            (4, "https://www.anlim.de/x", 2, 1, None),
+            (5, "https://ads.googlesyndication.com/a", 1, 1, None),
+            (5, "https://ads.googlesyndication.com/u", 2, 1, None),
+            # Not counted: not categorized, non ad, training visit and visit outside the sessions
+            (5, "https://www.anlim.de/y", 2, 0, None),
+            (5, "https://www.anlim.de/z", 2, 1, 1),
+            (1, "https://www.anlim.de/w", 2, 1, None),
+            (7, "https://www.anlim.de/v", None, 1, None),
+        ],
+    )
+    conn.commit()
+    return conn
+
+
+def test_session_ranges():
+    ranges = session_ranges(NUMVISITS, max_sessions=2)
+    assert ranges.values.tolist() == [
+        [10, WEATHER, 1, 1, 2],
+        [10, FORECAST, 1, 1, 1],
+        [20, WEATHER, 2, 3, 3],
+    ]
+
+
+def test_assign_sessions(crawl_conn):
+    sessions = assign_sessions(crawl_conn, NUMVISITS, max_sessions=2)
+    assert sessions.values.tolist() == [
+        [3, FORECAST, 2, 10, 1],
+        [2, WEATHER, 1, 10, 1],
+        [4, WEATHER, 3, 10, 1],
+        [5, WEATHER, 4, 20, 2],
+    ]
+    assert len(assign_sessions(crawl_conn, NUMVISITS)) == 5
+
+
+def test_session_lookup_is_persisted(crawl_conn):
+    sessions = session_lookup(crawl_conn, NUMVISITS)
+    assert (
+        sessions.values.tolist()
+        == assign_sessions(crawl_conn, NUMVISITS).values.tolist()
+    )
+
+    # The same list reads the table, another list assigns the sessions again
+    crawl_conn.execute("UPDATE artificial_sessions SET session = 9 WHERE visit_id = 7")
+    assert session_lookup(crawl_conn, NUMVISITS)["session"].tolist()[-1] == 9
+    sessions = session_lookup(crawl_conn, NUMVISITS, max_sessions=2)
+    assert sessions["visit_id"].tolist() == [3, 2, 4, 5]
+    assert session_lookup(crawl_conn, NUMVISITS)["session"].tolist()[-1] == 3
+
+
+def test_get_top_10_domains_of_ads(crawl_conn, tmp_path):
+    metrics = ExperimentMetrics.__new__(ExperimentMetrics)
+    metrics.conn = crawl_conn
+    metrics.experiment_dir = str(tmp_path)
+    (tmp_path / "results").mkdir()
+
+    summary = (
+        metrics.get_top_10_domains_of_ads_grouped_by_artificial_sessions_and_site_url(
+            NUMVISITS[:3]
+        )
+    )
+    assert summary.values.tolist() == [
+        ["googlesyndication.com", 5, 3],
+        ["anlim.de", 1, 1],
+    ]
+    with open(tmp_path / "results" / "domain_groups_ads.md") as f:
+        groups = [line.split("|")[1:4] for line in f.read().splitlines()[2:]]
+    assert [[cell.strip() for cell in row] for row in groups] == [
+        ["Nothing", "0", "0"],
+        ["A", "5", "3"],
+        ["M", "0", "0"],
+        ["M-", "0", "0"],
+        ["U", "1", "1"],
+    ]
+
+
+def test_get_ads_by_category_grouped_by_artificial_sessions(crawl_conn):
+    metrics = ExperimentMetrics.__new__(ExperimentMetrics)
+    metrics.conn = crawl_conn
+    ads_df = metrics.get_ads_by_category_grouped_by_artificial_sessions_and_site_url(
+        NUMVISITS
+    )
+    assert ads_df["visit_id"].tolist() == [2, 2, 3, 4, 5, 5, 7]
+    assert ads_df["browser_id"].tolist() == [10, 10, 10, 10, 20, 20, 30]
+    assert ads_df["categories"].tolist()[3:5] == [["Travel"], ["Style & Fashion"]]
+
+
+def test_fetch_all_ads_grouped_by_artificial_sessions(crawl_conn):
+    analysis = OBAAnalysis.__new__(OBAAnalysis)
+    analysis.conn = crawl_conn
+    analysis.experiment_category = "Style & Fashion"
+    # The visit to myforecast.com of the 1st session only has ads of the category
+    assert analysis.fetch_all_ads_grouped_by_artificial_sessions_and_site_url(
+        NUMVISITS
+    ) == [
+        {
+            "browser_id": 1,
+            "NumAdsURL": 3,
+            "NumAdsURLCategory": 0,
+            "NumUniqueAdsURL": 2,
+            "NumUniqueAdsURLCategory": 0,
+        },
+        {
+            "browser_id": 2,
+            "NumAdsURL": 1,
+            "NumAdsURLCategory": 1,
+            "NumUniqueAdsURL": 1,
+            "NumUniqueAdsURLCategory": 1,
+        },
+        {
+            "browser_id": 3,
+            "NumAdsURL": 0,
+            "NumAdsURLCategory": 0,
+            "NumUniqueAdsURL": 0,
+            "NumUniqueAdsURLCategory": 0,
+        },
+    ]
@@ -0,0 +1,154 @@
+import asyncio
+import sqlite3
+import time
+
+import pytest
+
+from oba.categorization_cache import CategorizationCache, normalize_url
+from oba.categorizer import Categorizer
+from openwpm.storage.sql_provider import SCHEMA_FILE
+
+SHOES = [
+    {
+        "category": "Shopping",
+        "taxonomy": "iabv1",
+        "taxonomy_tier": 1,
+        "taxonomy_id": "IAB22",
+        "confident": True,
+    }
+]
+UNCATEGORIZED = [dict(SHOES[0], category="Uncategorized", taxonomy_id="IAB24")]
+
+
+def response(categories):
+    return {"status_code": 200, "categories_response": categories}
+
+
+@pytest.mark.parametrize(
+    "url,normalized",
+    [
+        ("HTTPS://Shop.Example:443/Shoes/", "https://shop.example/Shoes"),
+        (
+            "https://shop.example/p?b=2&utm_source=x&a=1&gclid=abc#reviews",
+            "https://shop.example/p?a=1&b=2",
+        ),
+        ("http://shop.example:8080", "http://shop.example:8080"),
+    ],
+)
+def test_normalize_url(url, normalized):
+    assert normalize_url(url) == normalized
+
+
+def test_cache_hits_and_misses(tmp_path):
+    cache = CategorizationCache(tmp_path / "cache.sqlite")
+    assert cache.get("https://shop.example/shoes", "iabv1") is None
+
+    cache.put("https://shop.example/shoes?utm_medium=ad", "iabv1", response(SHOES))
+    assert cache.get("https://shop.example/shoes/", "iabv1") == response(SHOES)
+    assert cache.get("https://shop.example/shoes", "webshrinker") is None
+    assert cache.get("https://shop.example/boots", "iabv1") is None
+
+    assert cache.stats() == {
+        "hits": 1,
+        "domain_hits": 0,
+        "misses": 3,
+        "hit_ratio": 0.25,
+    }
+
+
+def test_cache_only_keeps_useful_responses(tmp_path):
+    cache = CategorizationCache(tmp_path / "cache.sqlite")
+    cache.put("https://a.example/", "iabv1", {"status_code": 202, "status": "pending"})
+    cache.put("https://b.example/", "iabv1", response(UNCATEGORIZED))
+    assert cache.get("https://a.example/", "iabv1") is None
+    assert cache.get("https://b.example/", "iabv1") is None
+
+
+def test_cache_ttl(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    CategorizationCache(path).put("https://shop.example/", "iabv1", response(SHOES))
+    with sqlite3.connect(path) as conn:
+        conn.execute("UPDATE categorizations SET fetched_at = ?", (time.time() - 100,))
+
+    assert (
+        CategorizationCache(path, ttl=50).get("https://shop.example/", "iabv1") is None
+    )
+    assert CategorizationCache(path, ttl=None).get("https://shop.example/", "iabv1")
+
+
+def test_cache_domain_fallback(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    CategorizationCache(path).put(
+        "https://www.shoe-shop.co.uk/shoes", "iabv1", response(SHOES)
+    )
+    assert (
+        CategorizationCache(path).get("https://shoe-shop.co.uk/boots", "iabv1") is None
+    )
+
+    cache = CategorizationCache(path, domain_fallback=True)
+    assert cache.get("https://shoe-shop.co.uk/boots", "iabv1") == response(SHOES)
+    assert cache.get("https://co.uk/", "iabv1") is None
+    assert cache.domain_hits == 1
+
+
+class CountingCategorizer(Categorizer):
+    async def _request_categories(self, session, url, taxonomy):
+        self.requests.append(url)
+        return response(SHOES)
+
+
+def categorize(categorizer, urls):
+    async def _categorize():
+        return [await categorizer.categorize(None, url) for url in urls]
+
+    categorizer.requests = []
+    return asyncio.run(_categorize())
+
+
+def test_categorizer_shares_the_cache(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    urls = ["https://shop.example/shoes?gclid=1", "https://shop.example/shoes?gclid=2"]
+
+    accept = CountingCategorizer("key", "secret", cache=CategorizationCache(path))
+    assert categorize(accept, urls) == [response(SHOES)] * 2
+    assert accept.requests == urls[:1]
+
+    reject = CountingCategorizer("key", "secret", cache=CategorizationCache(path))
+    assert categorize(reject, urls) == [response(SHOES)] * 2
+    assert reject.requests == []
+    assert reject.cache.hit_ratio == 1
+
+
+def test_offline_categorizer(tmp_path):
+    cache = CategorizationCache(tmp_path / "cache.sqlite")
+    cache.put("https://shop.example/", "iabv1", response(SHOES))
+    categorizer = CountingCategorizer(cache=cache, offline=True)
+
+    cached, missing = categorize(
+        categorizer, ["https://shop.example/", "https://other.example/"]
+    )
+    assert cached == response(SHOES)
+    assert missing["status_code"] is None
+    assert categorizer.requests == []
+
+    with pytest.raises(ValueError):
+        Categorizer(offline=True)
+
+
+def test_import_landing_page_categories(tmp_path):
+    crawl_db_path = tmp_path / "crawl-data.sqlite"
+    with sqlite3.connect(crawl_db_path) as conn:
+        with open(SCHEMA_FILE, "r") as f:
+            conn.executescript(f.read())
+        conn.executemany(
+            "INSERT INTO landing_page_categories (landing_page_id, landing_page_url, category_name, category_code, parent_category, confident) VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (1, "https://shop.example/", "Shopping", "IAB22", "Shopping", 1),
+                (2, "https://news.example/", "Uncategorized", "IAB24", "", 0),
+            ],
+        )
+
+    cache = CategorizationCache(tmp_path / "cache.sqlite")
+    assert cache.import_landing_page_categories(crawl_db_path) == 1
+    assert cache.get("https://shop.example/", "iabv1") == response(SHOES)
+    assert cache.get("https://news.example/", "iabv1") is None
@@ -0,0 +1,177 @@
+import random
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from oba.duckdb_metrics import DuckDBMetrics
+from oba.enums import A_GROUP, M_GROUP, M_MINUS_GROUP, NOTHING_GROUP, U_GROUP
+from oba.experiment_metrics import ExperimentMetrics
+from oba.parquet_export import export_experiment
+from openwpm.storage.sql_provider import SCHEMA_FILE
+
+BROWSER_IDS = [1, 2, 3, 4, 5, 6, 7]
+CATEGORIES = [
+    "Style & Fashion",
+    "Shopping",
+    "Travel",
+    "Automotive",
+    "Books & Literature",  # Tier 2
+]
+DOMAINS = [
+    *A_GROUP[:3],
+    *M_GROUP[:2],
+    *M_MINUS_GROUP[:2],
+    *U_GROUP[:2],
+    *NOTHING_GROUP[:2],
+    "unknown-advertiser.com",
+]
+
+
+def make_crawl_db(path, num_ads=1500, seed=0):
+    """Crawl database with random ads of every domain group"""
+    rng = random.Random(seed)
+    conn = sqlite3.connect(path)
+    with open(SCHEMA_FILE, "r") as f:
+        conn.executescript(f.read())
+    visits = [
+        (visit_id, rng.choice(BROWSER_IDS), f"https://site{visit_id % 7}.com/")
+        for visit_id in range(1, 301)
+    ]
+    conn.executemany(
+        "INSERT INTO site_visits (visit_id, browser_id, site_url) VALUES (?, ?, ?)",
+        visits,
+    )
+    conn.executemany(
+        "INSERT INTO landing_page_categories (landing_page_id, landing_page_url, category_code, category_name, parent_category, confident) VALUES (?, ?, '', ?, '', 1)",
+        [
+            (landing_page_id, f"https://shop{landing_page_id}.com/", category)
+            for landing_page_id in range(1, 41)
+            for category in rng.sample(CATEGORIES, rng.randint(0, 3))
+        ],
+    )
+    ads = []
+    for _ in range(num_ads):
+        visit_id, browser_id, _ = rng.choice(visits)
+        ads.append(
+            (
+                visit_id,
+                browser_id,
+                f"https://ads.{rng.choice(DOMAINS)}/click?id={rng.randint(1, 150)}",
+                rng.random() < 0.1,
+                rng.choice([None, *range(1, 46)]),
+                rng.random() < 0.9,
+                1 if rng.random() < 0.05 else None,
+            )
+        )
+    conn.executemany(
+        "INSERT INTO visit_advertisements (visit_id, browser_id, ad_url, clean_run, landing_page_id, categorized, non_ad) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        ads,
+    )
+    conn.commit()
+    return conn
+
+
+@pytest.fixture(scope="module")
+def crawl_db(tmp_path_factory):
+    path = tmp_path_factory.mktemp("experiment") / "crawl-data.sqlite"
+    make_crawl_db(path).close()
+    return path
+
+
+def experiment_metrics(crawl_db, results_dir, duckdb_metrics=None):
+    # Skips reading the experiment config of the constructor
+    metrics = ExperimentMetrics.__new__(ExperimentMetrics)
+    metrics.experiment_name = "synthetic_experiment"
+    metrics.experiment_dir = str(results_dir)
+    (results_dir / "results").mkdir(parents=True)
+    metrics.conn = sqlite3.connect(crawl_db)
+    metrics.oba_browsers = BROWSER_IDS
+    metrics.duckdb_metrics = duckdb_metrics
+    return metrics
+
+
+@pytest.fixture(scope="module", params=["sqlite", "parquet"])
+def duckdb_metrics(request, crawl_db, tmp_path_factory):
+    if request.param == "sqlite":
+        metrics = DuckDBMetrics(data_path=crawl_db)
+    else:
+        parquet_dir = tmp_path_factory.mktemp("parquet")
+        with sqlite3.connect(crawl_db) as crawl_conn:
+            export_experiment(crawl_conn, parquet_dir)
+        metrics = DuckDBMetrics(parquet_dir=parquet_dir)
+    yield metrics
+    metrics.close()
+
+
+@pytest.fixture
+def pandas_metrics(crawl_db, tmp_path):
+    metrics = experiment_metrics(crawl_db, tmp_path / "pandas")
+    yield metrics
+    metrics.close()
+
+
+@pytest.fixture
+def duckdb_experiment_metrics(crawl_db, tmp_path, duckdb_metrics):
+    metrics = experiment_metrics(crawl_db, tmp_path / "duckdb", duckdb_metrics)
+    yield metrics
+    metrics.conn.close()
+
+
+def test_ads_by_category(pandas_metrics, duckdb_metrics):
+    expected = pandas_metrics.get_ads_by_category_table_all_browsers_old()
+    ads = duckdb_metrics.ads_by_category(BROWSER_IDS[:6]).df()
+    pd.testing.assert_frame_equal(
+        ads.drop(columns="categories"),
+        expected.drop(columns="categories").reset_index(drop=True),
+    )
+    assert list(map(sorted, ads["categories"])) == list(
+        map(sorted, expected["categories"])
+    )
+
+
+@pytest.mark.parametrize("ads_source", ["dataframe", "relation"])
+def test_get_categories_total_and_unique_ads(
+    pandas_metrics, duckdb_experiment_metrics, duckdb_metrics, ads_source
+):
+    ads_df = pandas_metrics.get_ads_by_category_table_all_browsers_old()
+    ads = (
+        ads_df.copy()
+        if ads_source == "dataframe"
+        else duckdb_metrics.ads_by_category(BROWSER_IDS[:6])
+    )
+
+    expected = pandas_metrics.get_categories_total_and_unique_ads(ads_df)
+    summary = duckdb_experiment_metrics.get_categories_total_and_unique_ads(ads)
+    pd.testing.assert_frame_equal(summary, expected)
+    assert set(expected["Category"]) >= {"Style & Fashion", "Travel"}
+    with open(f"{pandas_metrics.experiment_dir}/results/ads_by_category.md") as f:
+        expected_markdown = f.read()
+    with open(
+        f"{duckdb_experiment_metrics.experiment_dir}/results/ads_by_category.md"
+    ) as f:
+        assert f.read() == expected_markdown
+
+
+@pytest.mark.parametrize("category_filter", [None, "Style & Fashion"])
+def test_count_ads_by_session_by_group(
+    pandas_metrics, duckdb_experiment_metrics, duckdb_metrics, category_filter
+):
+    ads_df = pandas_metrics.get_ads_by_category_table_all_browsers_old()
+    expected = pandas_metrics.count_ads_by_session_by_group(
+        ads_df.copy(), category_filter
+    )
+    for ads in (ads_df.copy(), duckdb_metrics.ads_by_category(BROWSER_IDS[:6])):
+        result = duckdb_experiment_metrics.count_ads_by_session_by_group(
+            ads, category_filter
+        )
+        for result_df, expected_df in zip(result, expected):
+            pd.testing.assert_frame_equal(result_df, expected_df)
+    assert set(expected[0].columns) == {"A", "M", "M-", "U", "Nothing"}
+
+
+def test_duckdb_metrics_needs_one_source(crawl_db):
+    with pytest.raises(ValueError):
+        DuckDBMetrics()
+    with pytest.raises(ValueError):
+        DuckDBMetrics(data_path=crawl_db, parquet_dir=crawl_db.parent)
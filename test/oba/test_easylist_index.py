@@ -0,0 +1,81 @@
+from pathlib import Path
+
+from oba.easylist_index import EasyListIndex, build_index
+
+EASYLIST = """[Adblock Plus 2.0]
+! Version: 202305260330
+||ads.example.net^$third-party
+###ad-top
+##.sidebar-ad > a
+##div[data-ad-slot]
+##[aria-label="Advertisement"]
+###excepted
+#@##excepted
+example.com##.example-only
+shop.example.com##.shop-only
+example.com#@##ad-top
+example.org#?#.result:-abp-has(.ad)
+##.text-ad:has-text(Sponsored)
+"""
+
+
+def build() -> EasyListIndex:
+    return EasyListIndex.from_easylist(EASYLIST.splitlines())
+
+
+def test_parse_buckets() -> None:
+    index = build()
+    assert index.version == "202305260330"
+    assert index.generic["id"] == {"ad-top": ["#ad-top"]}
+    assert index.generic["class"] == {"sidebar-ad": [".sidebar-ad > a"]}
+    assert index.generic["tag"] == {"div": ["div[data-ad-slot]"]}
+    assert index.other == ['[aria-label="Advertisement"]']
+    assert index.domains == {
+        "example.com": {
+            "example.com": [".example-only"],
+            "shop.example.com": [".shop-only"],
+        }
+    }
+    assert index.domain_exceptions == {"example.com": {"example.com": ["#ad-top"]}}
+
+
+def test_selectors_for_page_tokens() -> None:
+    index = build()
+    assert index.selectors_for(ids=["ad-top"], classes=[], tags=["span"]) == [
+        "#ad-top",
+        '[aria-label="Advertisement"]',
+    ]
+    assert len(index.selectors_for()) == 4
+
+
+def test_selectors_for_domain() -> None:
+    index = build()
+    assert set(index.selectors_for("https://shop.example.com/", ids=["ad-top"])) == {
+        '[aria-label="Advertisement"]',
+        ".example-only",
+        ".shop-only",
+    }
+    assert set(index.selectors_for("https://example.com/", ids=["ad-top"])) == {
+        '[aria-label="Advertisement"]',
+        ".example-only",
+    }
+    assert "#ad-top" in index.selectors_for("https://example.net/", ids=["ad-top"])
+
+
+def test_save_and_load(tmp_path: Path) -> None:
+    index = build()
+    index.save(tmp_path / "index.json.gz")
+    loaded = EasyListIndex.load(tmp_path / "index.json.gz")
+    assert loaded.__dict__ == index.__dict__
+
+
+def test_build_index_with_extra_rules(tmp_path: Path) -> None:
+    (tmp_path / "easylist.txt").write_text(EASYLIST)
+    (tmp_path / "extra.txt").write_text("! Extra\n###old-ad\n###ad-top\n###excepted\n")
+    index = build_index(
+        tmp_path / "easylist.txt", tmp_path / "index.json.gz", tmp_path / "extra.txt"
+    )
+    assert index.generic["id"] == {"ad-top": ["#ad-top"], "old-ad": ["#old-ad"]}
+    # The exceptions of easylist.txt apply to the extra rules
+    assert "#excepted" not in index.generic_selectors()
+    assert index.version == "202305260330"
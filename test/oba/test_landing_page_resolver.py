@@ -0,0 +1,235 @@
+import sqlite3
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Iterator, List, Set
+
+import pytest
+import requests
+
+from oba import data_processer
+from oba.categorizer import Categorizer
+from oba.data_processer import DataProcesser
+from oba.landing_page_resolver import LandingPageResolverPool
+from oba.redirect_resolver import HTTPRedirectResolver
+from openwpm.storage.sql_provider import SCHEMA_FILE
+
+from ..utilities import BASE_TEST_URL, BASE_TEST_URL_NOPATH
+
+
+def redirect_chain(*hops: str, landing_page: str) -> str:
+    """URL that goes through the local server's redirects before landing on `landing_page`"""
+    path = f"/MAGIC_REDIRECT/{hops[0]}?"
+    path += "&".join(f"dst=/MAGIC_REDIRECT/{hop}" for hop in hops[1:])
+    return f"{BASE_TEST_URL_NOPATH}{path}&dst=/test_pages/{landing_page}"
+
+
+class HTTPDriver:
+    """Stands in for a browser, following the HTTP redirects of the local server"""
+
+    visited: Counter = Counter()
+    lock = threading.Lock()
+
+    def __init__(self) -> None:
+        self.current_url = "about:blank"
+        self.threads: Set[str] = set()
+
+    def get(self, url: str) -> None:
+        with self.lock:
+            self.visited[url] += 1
+        self.threads.add(threading.current_thread().name)
+        self.current_url = requests.get(url, timeout=10).url
+
+    def quit(self) -> None:
+        pass
+
+
+@pytest.fixture
+def http_driver():
+    HTTPDriver.visited = Counter()
+    yield HTTPDriver
+
+
+def make_pool(num_workers: int) -> LandingPageResolverPool:
+    return LandingPageResolverPool(
+        HTTPDriver,
+        num_workers=num_workers,
+        check_interval=0.01,
+        stable_period=0.02,
+        max_duration=1,
+    )
+
+
+AD_URLS = [
+    redirect_chain("click", "track", landing_page="simple_a.html"),
+    redirect_chain("click", landing_page="simple_b.html"),
+    redirect_chain("click", "track", "sync", landing_page="simple_c.html"),
+    redirect_chain("click", "track", landing_page="simple_a.html"),
+    redirect_chain("other", landing_page="simple_d.html"),
+]
+
+
+def test_pool_resolves_redirect_chains(server, http_driver):
+    pool = make_pool(num_workers=3)
+    results = dict(pool.resolve(AD_URLS))
+    pool.close()
+
+    assert results == {
+        AD_URLS[0]: f"{BASE_TEST_URL}/simple_a.html",
+        AD_URLS[1]: f"{BASE_TEST_URL}/simple_b.html",
+        AD_URLS[2]: f"{BASE_TEST_URL}/simple_c.html",
+        AD_URLS[4]: f"{BASE_TEST_URL}/simple_d.html",
+    }
+    # The duplicated ad url is only dispatched once
+    assert set(http_driver.visited.values()) == {1}
+    assert sum(stats.resolved for stats in pool.stats) == 4
+    assert all(ads_per_minute >= 0 for ads_per_minute in pool.throughput().values())
+
+
+def test_pool_stops_dispatching_when_interrupted(server, http_driver):
+    pool = make_pool(num_workers=1)
+    for _ in pool.resolve(AD_URLS):
+        break
+    pool.close()
+    # The worker finishes at most the URL it had already taken
+    assert sum(http_driver.visited.values()) <= 2
+
+
+def test_pool_surfaces_broken_browsers():
+    def broken_driver():
+        raise RuntimeError("No browser")
+
+    pool = LandingPageResolverPool(broken_driver, num_workers=2)
+    with pytest.raises(RuntimeError, match="resolver workers stopped"):
+        list(pool.resolve(AD_URLS))
+
+
+class FakeCategorizer(Categorizer):
+    def __init__(self) -> None:
+        super().__init__("key", "secret")
+        self.categorized: List[str] = []
+
+    async def _request_categories(self, session, url, taxonomy):
+        self.categorized.append(url)
+        return {
+            "status_code": 200,
+            "categories_response": [
+                {"category": "Cell Phones", "taxonomy_id": "IAB19-6", "confident": True}
+            ],
+        }
+
+
+@pytest.fixture
+def processer(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> Iterator[DataProcesser]:
+    monkeypatch.setattr(data_processer, "get_firefox_binary_path", lambda: "firefox")
+    monkeypatch.setattr(DataProcesser, "_setup_driver", lambda self: HTTPDriver())
+    processer = DataProcesser(
+        "test_experiment",
+        webshrinker_credentials=None,
+        num_resolver_workers=2,
+        http_resolver=False,
+    )
+    processer.resolver_pool = make_pool(num_workers=2)
+    processer.categorizer = FakeCategorizer()
+    yield processer
+    processer.close_browser()
+
+
+@pytest.fixture
+def crawl_conn() -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    with open(SCHEMA_FILE, "r") as f:
+        conn.executescript(f.read())
+    conn.executemany(
+        "INSERT INTO visit_advertisements (visit_id, browser_id, ad_url) VALUES (?, 1, ?)",
+        [(visit_id, ad_url) for visit_id, ad_url in enumerate(AD_URLS + AD_URLS[:2])],
+    )
+    conn.commit()
+    return conn
+
+
+def ad_landing_pages(conn: sqlite3.Connection) -> list:
+    return conn.execute(
+        "SELECT ad_url, landing_page_url, categorized FROM visit_advertisements ORDER BY ad_id"
+    ).fetchall()
+
+
+def test_process_browsers_new_ads(server, http_driver, processer, crawl_conn):
+    processer.process_browsers_new_ads(
+        crawl_conn.cursor(), crawl_conn, [1], request_rate=100
+    )
+
+    assert ad_landing_pages(crawl_conn) == [
+        (ad_url, f"{BASE_TEST_URL}/{page}", 1)
+        for ad_url, page in zip(
+            AD_URLS + AD_URLS[:2],
+            [
+                "simple_a.html",
+                "simple_b.html",
+                "simple_c.html",
+                "simple_a.html",
+                "simple_d.html",
+                "simple_a.html",
+                "simple_b.html",
+            ],
+        )
+    ]
+    assert sorted(processer.categorizer.categorized) == [
+        f"{BASE_TEST_URL}/simple_{page}.html" for page in "abcd"
+    ]
+    assert crawl_conn.execute(
+        "SELECT COUNT(*) FROM landing_page_categories WHERE parent_category = 'Technology & Computing'"
+    ).fetchone() == (4,)
+
+
+def test_process_browsers_new_ads_resumes(server, http_driver, processer, crawl_conn):
+    # State left by an interrupted run: one ad url resolved but not categorized yet
+    landing_page_url = f"{BASE_TEST_URL}/simple_b.html"
+    crawl_conn.execute(
+        "INSERT INTO landing_pages (landing_page_url, categorized) VALUES (?, 0)",
+        (landing_page_url,),
+    )
+    crawl_conn.execute(
+        "UPDATE visit_advertisements SET landing_page_url = ?, landing_page_id = 1 WHERE ad_url = ?",
+        (landing_page_url, AD_URLS[1]),
+    )
+    crawl_conn.commit()
+
+    processer.process_browsers_new_ads(
+        crawl_conn.cursor(), crawl_conn, [1], request_rate=100
+    )
+
+    assert AD_URLS[1] not in http_driver.visited
+    assert landing_page_url in processer.categorizer.categorized
+    assert all(categorized == 1 for _, _, categorized in ad_landing_pages(crawl_conn))
+
+
+def test_process_browsers_new_ads_over_http(server, http_driver, processer, crawl_conn):
+    interstitial_url = redirect_chain("click", landing_page="oba/js_interstitial.html")
+    crawl_conn.execute(
+        "INSERT INTO visit_advertisements (visit_id, browser_id, ad_url) VALUES (9, 1, ?)",
+        (interstitial_url,),
+    )
+    processer.redirect_resolver = HTTPRedirectResolver()
+
+    processer.process_browsers_new_ads(
+        crawl_conn.cursor(), crawl_conn, [1], request_rate=100
+    )
+
+    # Only the ad url that can't be followed over HTTP is loaded in the browsers
+    assert list(http_driver.visited) == [interstitial_url]
+    assert ad_landing_pages(crawl_conn)[:5] == [
+        (ad_url, f"{BASE_TEST_URL}/{page}", 1)
+        for ad_url, page in zip(
+            AD_URLS,
+            [
+                "simple_a.html",
+                "simple_b.html",
+                "simple_c.html",
+                "simple_a.html",
+                "simple_d.html",
+            ],
+        )
+    ]
@@ -0,0 +1,223 @@
+import random
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+from adblockparser import AdblockRules
+
+from oba.network_filter import (
+    RESOURCES_DIR,
+    NetworkFilterEngine,
+    parse_filter,
+    tokenize,
+)
+
+LISTS = {
+    "easylist": RESOURCES_DIR / "easylist.txt",
+    "easyprivacy": RESOURCES_DIR / "easyprivacy.txt",
+}
+OPTIONS = [{}, {"third-party": True}, {"third-party": False}]
+PAGE_URLS = [
+    "https://www.nytimes.com/section/world",
+    "https://cnn.com/",
+    "https://static.example.org/app.js?v=3",
+    "http://news.example.co.uk/story/12345.html",
+]
+
+
+def load_rules(path: Path) -> List[str]:
+    with open(path, encoding="utf-8") as f:
+        return f.read().splitlines()
+
+
+def comparable(rule: str) -> bool:
+    """Filters on which adblockparser's verdicts are the intended ones"""
+    network_filter = parse_filter(rule)
+    if network_filter is None or network_filter.is_regex:
+        return True
+    pattern = network_filter.pattern.strip("|")
+    # adblockparser matches the filters with options case sensitively and
+    # mangles the `|` in the middle of a pattern
+    return "|" not in pattern and not (
+        network_filter.options and pattern != pattern.lower()
+    )
+
+
+def urls_for(rule: str, rng: random.Random) -> List[str]:
+    """URLs matched, or nearly matched, by the pattern of a filter"""
+    network_filter = parse_filter(rule)
+    if network_filter is None or network_filter.is_regex:
+        return []
+    pattern = network_filter.pattern.lower()
+    body = pattern.strip("|").replace("*", "x1").replace("^", "/")
+    if pattern.startswith("||"):
+        url = f"https://{rng.choice(['', 'cdn.', 'a.b.'])}{body}"
+    elif pattern.startswith("|"):
+        url = body
+    else:
+        url = f"https://{rng.choice(['example.com', 'shop.co.uk'])}/p{body}"
+    near_miss = url[:-1] + "q" if len(body) > 1 else url + "q"
+    return [url, url + "?id=7&ref=home", near_miss]
+
+
+def url_corpus(rules: List[str], size: int, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    urls = list(PAGE_URLS)
+    for rule in rng.sample(rules, min(size, len(rules))):
+        urls.extend(urls_for(rule, rng))
+    return urls
+
+
+def adblockparser_verdicts(
+    rules: Dict[str, AdblockRules], url: str, options: dict
+) -> Dict[str, bool]:
+    return {
+        name: list_rules.should_block(url, options)
+        for name, list_rules in rules.items()
+    }
+
+
+def engine_verdicts(
+    engine: NetworkFilterEngine, url: str, options: dict
+) -> Dict[str, bool]:
+    return engine.should_block(
+        url, third_party=options.get("third-party"), domain=options.get("domain")
+    )
+
+
+def test_parse_filter():
+    assert parse_filter("! Comment") is None
+    assert parse_filter("[Adblock Plus 2.0]") is None
+    assert parse_filter("# hosts comment") is None
+    assert parse_filter("example.com##.ad-banner") is None
+    assert parse_filter("example.com#@#.ad-banner") is None
+    # Options adblockparser doesn't support
+    assert parse_filter("||ads.example.com^$popup") is None
+    assert parse_filter("||ads.example.com^$third-party,csp=script-src") is None
+
+    network_filter = parse_filter(
+        "@@||cdn.example.com/ads.js$third-party,domain=a.com|~b.a.com"
+    )
+    assert network_filter.is_exception
+    assert network_filter.pattern == "||cdn.example.com/ads.js"
+    assert network_filter.options == {
+        "third-party": True,
+        "domain": {"a.com": True, "b.a.com": False},
+    }
+
+    network_filter = parse_filter("127.0.0.1 tracker.example.net")
+    assert network_filter.pattern == "||tracker.example.net^"
+
+
+@pytest.mark.parametrize(
+    "rule,tokens",
+    [
+        ("||ads.example.com^", ["ads", "example", "com"]),
+        ("/banner/*/img", ["banner"]),
+        ("ad_script.js", ["script"]),
+        ("|https://ads.", ["https", "ads"]),
+        ("swf|", []),
+        (".swf|", ["swf"]),
+        ("*", []),
+        ("/^https?:\\/\\/ads\\./", []),
+    ],
+)
+def test_filter_tokens(rule, tokens):
+    assert parse_filter(rule).tokens() == tokens
+
+
+def test_should_block():
+    engine = NetworkFilterEngine(
+        {
+            "ads": [
+                "||ads.example.com^",
+                "@@||ads.example.com/allowed/",
+                "/banner/*/img^",
+                "tracker.js$third-party",
+                "pixel.gif$domain=news.com",
+                "/Promo.$match-case",
+            ],
+            "hosts": ["0.0.0.0 metrics.example.net", "# comment"],
+        }
+    )
+    assert engine.list_names == ["ads", "hosts"]
+    assert engine.should_block("https://ads.example.com/x.js") == {
+        "ads": True,
+        "hosts": False,
+    }
+    assert engine.should_block("https://sub.ads.example.com/x.js")["ads"]
+    assert not engine.should_block("https://badads.example.com/x.js")["ads"]
+    assert not engine.should_block("https://ads.example.com/allowed/x.js")["ads"]
+    assert engine.should_block("http://x.com/banner/1/2/img?x")["ads"]
+    assert not engine.should_block("http://x.com/banner/1/2/imgs")["ads"]
+
+    url = "https://cdn.com/tracker.js"
+    assert not engine.should_block(url)["ads"]
+    assert engine.should_block(url, third_party=True)["ads"]
+    assert not engine.should_block(url, third_party=False)["ads"]
+
+    url = "https://cdn.com/pixel.gif"
+    assert not engine.should_block(url)["ads"]
+    assert engine.should_block(url, domain="www.news.com")["ads"]
+    assert not engine.should_block(url, domain="blog.com")["ads"]
+
+    assert engine.should_block("https://x.com/Promo.png")["ads"]
+    assert not engine.should_block("https://x.com/promo.png")["ads"]
+
+    assert engine.should_block("https://metrics.example.net/collect")["hosts"]
+    assert engine.matching_filters("https://ads.example.com/allowed/x.js") == {
+        "ads": engine.lists[0].exceptions.buckets["allowed"][0],
+        "hosts": None,
+    }
+
+
+def test_tokenize():
+    assert tokenize("https://ads.example.com/a_b?x=%20") == {
+        "https",
+        "ads",
+        "example",
+        "com",
+        "a",
+        "b",
+        "x",
+        "%20",
+    }
+
+
+@pytest.fixture(scope="module")
+def sampled_rules() -> Dict[str, List[str]]:
+    rng = random.Random(42)
+    return {
+        name: [rule for rule in rng.sample(load_rules(path), 1500) if comparable(rule)]
+        for name, path in LISTS.items()
+    }
+
+
+def test_verdicts_match_adblockparser(sampled_rules):
+    engine = NetworkFilterEngine(sampled_rules)
+    reference = {name: AdblockRules(rules) for name, rules in sampled_rules.items()}
+    urls = url_corpus(sum(sampled_rules.values(), []), size=200, seed=1)
+
+    blocked = 0
+    for url in urls:
+        for options in OPTIONS + [{"third-party": True, "domain": "cnn.com"}]:
+            expected = adblockparser_verdicts(reference, url, options)
+            assert engine_verdicts(engine, url, options) == expected, (url, options)
+            blocked += sum(expected.values())
+    # The corpus exercises both verdicts
+    assert 0 < blocked < len(urls) * 4 * len(LISTS)
+
+
+@pytest.mark.slow
+def test_verdicts_match_adblockparser_full_lists():
+    lists = {
+        name: [rule for rule in load_rules(path) if comparable(rule)]
+        for name, path in LISTS.items()
+    }
+    engine = NetworkFilterEngine(lists)
+    reference = {name: AdblockRules(rules) for name, rules in lists.items()}
+    for url in url_corpus(sum(lists.values(), []), size=60, seed=2):
+        options = {"third-party": True}
+        assert engine_verdicts(engine, url, options) == adblockparser_verdicts(
+            reference, url, options
+        ), url
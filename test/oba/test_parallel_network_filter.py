@@ -0,0 +1,56 @@
+import pytest
+
+from oba.network_filter import NetworkFilterEngine
+from oba.parallel_network_filter import classify_urls
+
+LISTS = {
+    "easyprivacy": ["||metrics.tracker.com^", "/pixel.gif$third-party"],
+    "easylist": ["||ads.adnet.com^", "/banner/*/img^"],
+    "adserverlist": ["0.0.0.0 ads.adnet.com"],
+}
+URLS = [
+    f"https://{host}/{path}?n={n}"
+    for n in range(20)
+    for host, path in [
+        ("metrics.tracker.com", "collect"),
+        ("ads.adnet.com", "banner/1/img"),
+        ("www.news.com", "pixel.gif"),
+        ("www.news.com", "index.html"),
+    ]
+]
+
+
+@pytest.fixture(scope="module")
+def engine() -> NetworkFilterEngine:
+    return NetworkFilterEngine(LISTS)
+
+
+def expected_verdicts(engine, urls, third_party=True):
+    return {
+        url: tuple(engine.should_block(url, third_party=third_party).values())
+        for url in urls
+    }
+
+
+@pytest.mark.parametrize(
+    "num_workers,start_method", [(1, None), (2, "fork"), (2, "spawn")]
+)
+def test_classify_urls(engine, num_workers, start_method):
+    verdicts = classify_urls(
+        engine,
+        URLS + URLS[:10],
+        num_workers=num_workers,
+        shard_size=7,
+        start_method=start_method,
+        show_progress=False,
+    )
+    assert verdicts == expected_verdicts(engine, URLS)
+    assert verdicts[URLS[1]] == (False, True, True)
+
+
+def test_classify_urls_third_party_option(engine):
+    verdicts = classify_urls(
+        engine, URLS, num_workers=2, third_party=False, show_progress=False
+    )
+    assert verdicts == expected_verdicts(engine, URLS, third_party=False)
+    assert not verdicts[URLS[2]][0]
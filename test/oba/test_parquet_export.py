@@ -0,0 +1,131 @@
+import sqlite3
+
+import pyarrow.dataset as ds
+import pytest
+
+from oba.parquet_export import export_experiment, read_table, stale_tables, table_schema
+from openwpm.storage.sql_provider import SCHEMA_FILE
+
+
+def insert_requests(conn: sqlite3.Connection, requests: list) -> None:
+    conn.executemany(
+        "INSERT INTO http_requests (browser_id, visit_id, url, method, referrer, headers, request_id, resource_type, time_stamp) VALUES (?, ?, ?, 'GET', '', '', 0, 'script', '')",
+        requests,
+    )
+    conn.commit()
+
+
+@pytest.fixture
+def crawl_conn() -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    with open(SCHEMA_FILE, "r") as f:
+        conn.executescript(f.read())
+    conn.executemany(
+        "INSERT INTO site_visits (visit_id, browser_id, site_url) VALUES (?, ?, ?)",
+        [(1, 1, "https://www.news.com/"), (2, 2, "https://blog.org/post")],
+    )
+    insert_requests(
+        conn,
+        [
+            (1, 1, "https://www.news.com/index.html"),
+            (1, 1, "https://metrics.tracker.com/collect"),
+            (2, 2, "https://blog.org/post"),
+        ],
+    )
+    conn.executemany(
+        "INSERT INTO visit_advertisements (visit_id, browser_id, ad_url, clean_run, landing_page_id) VALUES (?, ?, ?, ?, ?)",
+        [
+            (1, 1, "https://ads.adnet.com/1", 0, 1),
+            (2, 2, "https://ads.adnet.com/2", 1, None),
+        ],
+    )
+    conn.execute(
+        "INSERT INTO landing_pages (landing_page_url, categorized) VALUES ('https://shop.com/', 1)"
+    )
+    conn.commit()
+    return conn
+
+
+def test_table_schema(crawl_conn):
+    schema = table_schema(crawl_conn, "http_requests")
+    # The SQLite only id column is added and the Parquet only instance_id dropped
+    assert schema.field("id").type == "int64"
+    assert "instance_id" not in schema.names
+    assert schema.field("is_XHR").type == "bool"
+    assert (
+        str(table_schema(crawl_conn, "visit_advertisements").field("clean_run").type)
+        == "bool"
+    )
+
+
+def test_export_experiment(crawl_conn, tmp_path):
+    exported_rows = export_experiment(crawl_conn, tmp_path, chunk_size=2)
+    assert exported_rows["http_requests"] == 3
+    assert exported_rows["visit_advertisements"] == 2
+    assert exported_rows["landing_pages"] == 1
+    assert {path.name for path in (tmp_path / "http_requests").iterdir()} == {
+        "browser_id=1",
+        "browser_id=2",
+    }
+
+    requests = read_table(
+        tmp_path,
+        "http_requests",
+        columns=["id", "url"],
+        filters=[("browser_id", "=", 1)],
+    ).sort_values("id")
+    assert list(requests.columns) == ["id", "url"]
+    assert list(requests["url"]) == [
+        "https://www.news.com/index.html",
+        "https://metrics.tracker.com/collect",
+    ]
+    ads = read_table(tmp_path, "visit_advertisements", filters=ds.field("clean_run"))
+    assert list(ads["ad_url"]) == ["https://ads.adnet.com/2"]
+    assert ads["browser_id"].tolist() == [2]
+    landing_pages = read_table(tmp_path, "landing_pages")
+    assert landing_pages.to_dict("records") == [
+        {
+            "landing_page_id": 1,
+            "landing_page_url": "https://shop.com/",
+            "categorized": True,
+        }
+    ]
+
+
+def test_export_experiment_is_incremental(crawl_conn, tmp_path):
+    export_experiment(crawl_conn, tmp_path, tables=["http_requests"], chunk_size=2)
+    insert_requests(crawl_conn, [(2, 2, "https://blog.org/style.css")])
+    # A part left by an interrupted run is written again
+    (
+        tmp_path / "http_requests" / "browser_id=2" / "part-000000000009-0.parquet"
+    ).touch()
+
+    exported_rows = export_experiment(crawl_conn, tmp_path, tables=["http_requests"])
+    assert exported_rows == {"http_requests": 1}
+    requests = read_table(tmp_path, "http_requests", columns=["id"])
+    assert sorted(requests["id"]) == [1, 2, 3, 4]
+
+    exported_rows = export_experiment(
+        crawl_conn, tmp_path, tables=["http_requests"], full=True
+    )
+    assert exported_rows == {"http_requests": 4}
+    assert len(read_table(tmp_path, "http_requests")) == 4
+
+
+def test_export_unknown_table(crawl_conn, tmp_path):
+    with pytest.raises(ValueError, match="requests"):
+        export_experiment(crawl_conn, tmp_path, tables=["requests"])
+
+
+def test_stale_tables(crawl_conn, tmp_path):
+    tables = ["http_requests", "visit_advertisements"]
+    assert stale_tables(crawl_conn, tmp_path, tables) == tables
+    export_experiment(crawl_conn, tmp_path, tables=tables)
+    assert stale_tables(crawl_conn, tmp_path, tables) == []
+
+    insert_requests(crawl_conn, [(2, 2, "https://blog.org/style.css")])
+    crawl_conn.execute("DELETE FROM visit_advertisements WHERE visit_id = 1")
+    assert stale_tables(crawl_conn, tmp_path, tables) == tables
+    export_experiment(crawl_conn, tmp_path, tables=["http_requests"])
+    export_experiment(crawl_conn, tmp_path, tables=["visit_advertisements"], full=True)
+    assert stale_tables(crawl_conn, tmp_path, tables) == []
@@ -0,0 +1,205 @@
+import threading
+from typing import List, Optional, Sequence, Tuple
+
+import pytest
+import requests
+
+from oba.persona_scheduler import Persona, PersonaScheduler
+from openwpm.command_sequence import CommandSequence
+from openwpm.commands.browser_commands import GetCommand
+
+from ..utilities import BASE_TEST_URL
+
+TRAINING_PAGES = [f"{BASE_TEST_URL}/simple_{page}.html" for page in "abc"]
+CONTROL_PAGES = [f"{BASE_TEST_URL}/simple_d.html"]
+
+
+def training_visits_sequence(training_sites, next_site_rank, cookie_banner_action=0):
+    sequences = []
+    for site_rank, site in enumerate(training_sites, next_site_rank):
+        sequence = CommandSequence(site, site_rank=site_rank)
+        sequence.append_command(GetCommand(site, sleep=0), timeout=10)
+        sequences.append(sequence)
+    return sequences
+
+
+def control_site_visit_sequence(control_site, next_site_rank, cookie_banner_action=0):
+    sequence = CommandSequence(control_site, site_rank=next_site_rank)
+    sequence.append_command(GetCommand(control_site, sleep=0), timeout=10)
+    return sequence
+
+
+class HTTPBrowser:
+    """Stands in for an OpenWPM browser, visiting the pages of the local server in a thread"""
+
+    def __init__(self) -> None:
+        self.thread: Optional[threading.Thread] = None
+        self.visits: List[Tuple[Optional[int], int]] = []
+
+    def ready(self) -> bool:
+        return self.thread is None or not self.thread.is_alive()
+
+    def visit(self, command_sequence: CommandSequence) -> None:
+        response = requests.get(command_sequence.url, timeout=10)
+        self.visits.append((command_sequence.site_rank, response.status_code))
+
+
+class HTTPTaskManager:
+    def __init__(self, num_browsers: int) -> None:
+        self.browsers = [HTTPBrowser() for _ in range(num_browsers)]
+
+    def execute_command_sequence(self, command_sequence, index=None):
+        browser = self.browsers[index]
+        assert browser.ready()
+        browser.thread = threading.Thread(
+            target=browser.visit, args=(command_sequence,)
+        )
+        browser.thread.start()
+
+    def join(self) -> None:
+        for browser in self.browsers:
+            if browser.thread:
+                browser.thread.join()
+
+
+class VirtualClock:
+    """Clock of the scheduler whose sleeps return immediately"""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.slept = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+        self.slept += seconds
+
+
+class InstantTaskManager:
+    """Browsers that take `visit_seconds` of the virtual clock for every visit"""
+
+    def __init__(
+        self, clock: VirtualClock, num_browsers: int, visit_seconds: float = 0.0
+    ) -> None:
+        self.clock = clock
+        self.visit_seconds = visit_seconds
+        self.busy_until = [0.0] * num_browsers
+        self.submitted: List[tuple] = []
+        self.browsers = [self.Browser(self, index) for index in range(num_browsers)]
+
+    class Browser:
+        def __init__(self, manager: "InstantTaskManager", index: int) -> None:
+            self.manager = manager
+            self.index = index
+
+        def ready(self) -> bool:
+            return self.manager.busy_until[self.index] <= self.manager.clock()
+
+        def __repr__(self) -> str:
+            return f"Browser({self.index})"
+
+    def execute_command_sequence(self, command_sequence, index=None):
+        assert self.browsers[index].ready()
+        self.busy_until[index] = self.clock() + self.visit_seconds
+        self.submitted.append((index, self.clock(), command_sequence.url))
+
+
+def make_scheduler(manager, personas, clock=None, expovar_mean=60):
+    kwargs = {"clock": clock, "sleep": clock.sleep} if clock else {}
+    return PersonaScheduler(
+        manager,
+        personas,
+        training_visits_sequence,
+        control_site_visit_sequence,
+        expovar_mean=expovar_mean,
+        **kwargs,
+    )
+
+
+def make_personas(
+    seeds: Sequence[Optional[int]], control_visits_rate: int = 20
+) -> List[Persona]:
+    return [
+        Persona(
+            f"persona_{index}",
+            index,
+            TRAINING_PAGES,
+            CONTROL_PAGES,
+            control_visits_rate=control_visits_rate,
+            seed=seed,
+        )
+        for index, seed in enumerate(seeds, 1)
+    ]
+
+
+def test_personas_crawl_local_pages(server):
+    manager = HTTPTaskManager(num_browsers=3)
+    scheduler = make_scheduler(manager, make_personas([1, 2]), expovar_mean=0.01)
+    next_site_rank = scheduler.run(next_site_rank=1, seconds=0.5)
+    manager.join()
+
+    visits = manager.browsers[1].visits + manager.browsers[2].visits
+    assert not manager.browsers[0].visits
+    assert all(status_code == 200 for _, status_code in visits)
+    # Every visit got its own site_rank
+    assert sorted(site_rank for site_rank, _ in visits) == list(
+        range(1, next_site_rank)
+    )
+    summary = scheduler.summary()
+    for index, name in [(1, "persona_1"), (2, "persona_2")]:
+        counters = summary[name]
+        assert counters["training_visits"] + counters["control_visits"] == len(
+            manager.browsers[index].visits
+        )
+        assert counters["visits_per_hour"] > 0
+
+
+def test_waits_are_deadlines():
+    hours = 3 * 60 * 60
+
+    # The visits of a persona are the same crawling alone and with others
+    clock = VirtualClock()
+    manager = InstantTaskManager(clock, num_browsers=2)
+    make_scheduler(manager, make_personas([7]), clock).run(1, hours)
+    alone = manager.submitted
+
+    clock = VirtualClock()
+    manager = InstantTaskManager(clock, num_browsers=4)
+    scheduler = make_scheduler(manager, make_personas([7, 8, 9]), clock)
+    scheduler.run(1, hours)
+    assert [visit for visit in manager.submitted if visit[0] == 1] == alone
+    # The waits of the personas overlap
+    assert clock.slept < 1.1 * hours
+    assert {visit[0] for visit in manager.submitted} == {1, 2, 3}
+    assert sum(
+        counters["training_visits"] + counters["control_visits"]
+        for counters in scheduler.summary().values()
+    ) == len(manager.submitted)
+
+
+def test_busy_browser_does_not_block_the_others():
+    clock = VirtualClock()
+    manager = InstantTaskManager(clock, num_browsers=3)
+    personas = make_personas([3, 4], control_visits_rate=100)
+    # The browser of the first persona is busy for the first hour
+    manager.busy_until[1] = 60 * 60
+
+    scheduler = make_scheduler(manager, personas, clock, expovar_mean=60)
+    scheduler.run(1, 60 * 60)
+    first_visits = {}
+    for index, submitted_at, url in manager.submitted:
+        assert url == CONTROL_PAGES[0]
+        first_visits.setdefault(index, submitted_at)
+    assert first_visits[1] >= 60 * 60
+    assert first_visits[2] < 60 * 60
+    summary = scheduler.summary()
+    assert summary["persona_1"]["busy_browser"] > 0
+    assert summary["persona_1"]["delay_seconds"] > 0
+    assert summary["persona_2"]["busy_browser"] == 0
+
+
+def test_personas_need_their_own_browser():
+    with pytest.raises(ValueError):
+        make_scheduler(None, make_personas([1, 2])[:1] * 2)
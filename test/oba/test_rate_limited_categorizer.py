@@ -0,0 +1,155 @@
+import asyncio
+import time
+from typing import List, Tuple
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from oba.categorization_cache import CategorizationCache
+from oba.categorizer import Categorizer
+from oba.rate_limited_categorizer import (
+    AIMDLimiter,
+    RateLimitedCategorizer,
+    TokenBucket,
+)
+
+URLS = [f"https://shop{i}.example/" for i in range(6)]
+
+
+class StubWebShrinker:
+    """Local stand-in for the WebShrinker API, answering with the given statuses first"""
+
+    def __init__(self, statuses: List[int]) -> None:
+        self.statuses = list(statuses)
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            status = self.statuses.pop(0) if self.statuses else 200
+            if status == 200:
+                return web.json_response(
+                    {
+                        "data": [
+                            {
+                                "categories": [
+                                    {
+                                        "id": "IAB22",
+                                        "label": "Shopping",
+                                        "confident": True,
+                                    }
+                                ]
+                            }
+                        ]
+                    }
+                )
+            if status >= 500:
+                return web.Response(status=status, text="<html>Bad gateway</html>")
+            return web.json_response({"error": {"message": "Slow down"}}, status=status)
+        finally:
+            self.in_flight -= 1
+
+
+@pytest_asyncio.fixture
+async def webshrinker():
+    async def start(statuses: List[int]) -> Tuple[StubWebShrinker, Categorizer]:
+        stub = StubWebShrinker(statuses)
+        app = web.Application()
+        app.router.add_get("/categories/v3/{url}", stub.handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        runners.append(runner)
+        host, port = runner.addresses[0][:2]
+        categorizer = Categorizer("key", "secret")
+        categorizer.BASE_URL = f"http://{host}:{port}"
+        return stub, categorizer
+
+    runners: List[web.AppRunner] = []
+    yield start
+    for runner in runners:
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_rate():
+    bucket = TokenBucket(rate=50, capacity=1)
+    start_time = time.monotonic()
+    await asyncio.gather(*(bucket.acquire() for _ in range(6)))
+    # The first token is available right away
+    assert time.monotonic() - start_time >= 5 / 50
+
+
+@pytest.mark.asyncio
+async def test_aimd_limiter():
+    limiter = AIMDLimiter(initial_limit=4, max_limit=5)
+    await limiter.on_throttle()
+    assert limiter.limit == 2
+    for _ in range(2):
+        await limiter.on_success()
+    assert limiter.limit == 3
+    for _ in range(10):
+        await limiter.on_throttle()
+    assert limiter.limit == 1
+
+
+@pytest.mark.asyncio
+async def test_retries_throttled_requests(webshrinker):
+    stub, categorizer = await webshrinker([429, 429, 503])
+    async with RateLimitedCategorizer(
+        categorizer, requests_per_second=100, max_concurrency=4, base_delay=0.01
+    ) as client:
+        responses = await asyncio.gather(*(client.categorize(url) for url in URLS))
+
+    assert [response["status_code"] for response in responses] == [200] * len(URLS)
+    assert responses[0]["categories_response"][0]["taxonomy_id"] == "IAB22"
+    assert stub.requests == len(URLS) + 3
+    assert client.throttled == client.retries == 3
+    assert client.failures == 0
+    assert stub.max_in_flight <= 4
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_retries(webshrinker):
+    stub, categorizer = await webshrinker([429] * 10)
+    async with RateLimitedCategorizer(
+        categorizer, requests_per_second=100, max_retries=2, base_delay=0.01
+    ) as client:
+        response = await client.categorize(URLS[0])
+
+    assert response["status_code"] == 429
+    assert stub.requests == 3
+    assert client.failures == 1
+    assert client.concurrency.limit == 1
+
+
+@pytest.mark.asyncio
+async def test_rate_limit(webshrinker):
+    stub, categorizer = await webshrinker([])
+    start_time = time.monotonic()
+    async with RateLimitedCategorizer(
+        categorizer, requests_per_second=20, burst=1, max_concurrency=8
+    ) as client:
+        await asyncio.gather(*(client.categorize(url) for url in URLS))
+
+    assert stub.requests == len(URLS)
+    assert time.monotonic() - start_time >= (len(URLS) - 1) / 20
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_are_not_rate_limited(webshrinker, tmp_path):
+    stub, categorizer = await webshrinker([])
+    categorizer.cache = CategorizationCache(tmp_path / "cache.sqlite")
+    async with RateLimitedCategorizer(categorizer, requests_per_second=100) as client:
+        first = await client.categorize(URLS[0])
+        second = await client.categorize(URLS[0])
+
+    assert first == second
+    assert stub.requests == client.requests == 1
@@ -0,0 +1,154 @@
+import sqlite3
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from oba.redirect_resolver import (
+    JAVASCRIPT,
+    LANDING,
+    LOCATION,
+    META_REFRESH,
+    NEEDS_BROWSER,
+    Hop,
+    HTTPRedirectResolver,
+    RedirectHopStore,
+    parse_hop,
+)
+
+from ..utilities import BASE_TEST_URL, BASE_TEST_URL_NOPATH
+
+AD_URL = "https://ads.example/click?id=1"
+
+
+@pytest.mark.parametrize(
+    "status_code,headers,body,expected",
+    [
+        (302, {"Location": "/next"}, None, (LOCATION, "https://ads.example/next")),
+        (
+            200,
+            {"Refresh": "0;url=https://shop.example/"},
+            "",
+            (META_REFRESH, "https://shop.example/"),
+        ),
+        (
+            200,
+            {},
+            '<meta content="3;URL=&quot;/landing&quot;" http-equiv="Refresh">',
+            (META_REFRESH, "https://ads.example/landing"),
+        ),
+        (
+            200,
+            {},
+            "<script>top.location = 'https:\\/\\/shop.example\\/p';</script>",
+            (JAVASCRIPT, "https://shop.example/p"),
+        ),
+        (
+            200,
+            {},
+            '<script>location.replace("https://shop.example/q")</script>',
+            (JAVASCRIPT, "https://shop.example/q"),
+        ),
+        (
+            200,
+            {},
+            "<script>window.location.href = atob(target);</script>",
+            (NEEDS_BROWSER, None),
+        ),
+        (
+            200,
+            {},
+            "<a onclick=\"location.href='/other'\">Shop</a><script>var x = 1;</script>",
+            (LANDING, None),
+        ),
+        (403, {}, "Forbidden", (NEEDS_BROWSER, None)),
+        (200, {}, None, (LANDING, None)),
+    ],
+)
+def test_parse_hop(status_code, headers, body, expected):
+    hop = parse_hop(AD_URL, status_code, headers, body)
+    assert (hop.hop_type, hop.next_url) == expected
+    assert hop.status_code == status_code
+
+
+def magic_redirect(dst: str) -> str:
+    return f"{BASE_TEST_URL_NOPATH}/MAGIC_REDIRECT/click?dst={dst}"
+
+
+def test_resolve_redirect_chains(server):
+    crawl_conn = sqlite3.connect(":memory:")
+    store = RedirectHopStore(crawl_conn)
+    ad_urls = [
+        magic_redirect("/test_pages/oba/meta_refresh.html"),
+        magic_redirect("/test_pages/oba/js_redirect.html"),
+        magic_redirect("/test_pages/oba/js_interstitial.html"),
+    ]
+    resolver = HTTPRedirectResolver(per_host_concurrency=1)
+    chains = resolver.resolve_all(ad_urls, store)
+
+    assert chains[ad_urls[0]].landing_page_url == f"{BASE_TEST_URL}/simple_a.html"
+    assert [hop.hop_type for hop in chains[ad_urls[0]].hops] == [
+        LOCATION,
+        META_REFRESH,
+        LANDING,
+    ]
+    assert chains[ad_urls[1]].landing_page_url == f"{BASE_TEST_URL}/simple_b.html"
+    assert not chains[ad_urls[2]].resolved
+    assert chains[ad_urls[2]].hops[-1].hop_type == NEEDS_BROWSER
+    assert resolver.requests == 8
+    assert crawl_conn.execute("SELECT COUNT(*) FROM redirect_hops").fetchone() == (8,)
+
+    # The same chains are resolved again from the stored hops
+    resolver = HTTPRedirectResolver()
+    cached_chains = resolver.resolve_all(ad_urls, store)
+    assert resolver.requests == 0
+    assert cached_chains == chains
+
+
+def test_resolve_redirect_loop():
+    store = RedirectHopStore(sqlite3.connect(":memory:"))
+    store.save(
+        [
+            Hop(AD_URL, LOCATION, "https://ads.example/sync", 302),
+            Hop("https://ads.example/sync", LOCATION, AD_URL, 302),
+        ]
+    )
+    resolver = HTTPRedirectResolver()
+    chain = resolver.resolve_all([AD_URL], store)[AD_URL]
+    assert not chain.resolved
+    assert [hop.hop_type for hop in chain.hops] == [LOCATION, LOCATION, NEEDS_BROWSER]
+    assert resolver.requests == 0
+
+
+class SlowPageHandler(BaseHTTPRequestHandler):
+    """Sends a page in parts, with its meta refresh in the last one"""
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.end_headers()
+        self.wfile.write(b"<html><head><title>Redirecting</title>" + b" " * 4096)
+        self.wfile.flush()
+        time.sleep(0.2)
+        self.wfile.write(
+            b'<meta http-equiv="refresh" content="0;url=/landing"></head></html>'
+        )
+
+    def log_message(self, *args):
+        pass
+
+
+def test_resolve_redirect_in_later_chunk():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), SlowPageHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        url = f"http://127.0.0.1:{httpd.server_port}/click"
+        chain = HTTPRedirectResolver().resolve_all([url])[url]
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+    assert chain.hops[0] == Hop(
+        url, META_REFRESH, f"http://127.0.0.1:{httpd.server_port}/landing", 200
+    )
@@ -0,0 +1,143 @@
+import logging
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import pandas as pd
+import pytest
+
+from oba.result_cache import ResultCache, cached_result
+
+
+class Analysis:
+    def __init__(self, cache: ResultCache) -> None:
+        self.result_cache = cache
+        self.calls: List[Tuple[str, Optional[str]]] = []
+
+    @cached_result
+    def ads(self, category=None):
+        self.calls.append(("ads", category))
+        return pd.DataFrame(
+            {
+                "ad_url": ["https://a.com/", "https://b.com/"],
+                "categories": [["Style & Fashion", "Shopping"], ["Travel"]],
+                "NumAds": [3, 1],
+            }
+        )
+
+    @cached_result
+    def visits(self, ads_df=None):
+        self.calls.append(("visits", None))
+        return [(1, "http://weather.com/", 2), (2, "http://weather.com/", 1)]
+
+
+class VisitCounts:
+    def __init__(self, cache: ResultCache, data_path: Path) -> None:
+        self.result_cache = cache
+        self.conn = sqlite3.connect(data_path)
+        self.calls = 0
+
+    @cached_result
+    def visit_count(self):
+        self.calls += 1
+        return self.conn.execute("SELECT COUNT(*) FROM site_visits").fetchone()[0]
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    path = tmp_path / "crawl-data.sqlite"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE site_visits (visit_id INTEGER)")
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path: Path, db_path: Path) -> ResultCache:
+    return ResultCache(tmp_path / "results" / "result_cache", [db_path])
+
+
+def test_results_are_cached(cache, caplog):
+    analysis = Analysis(cache)
+    expected_ads = analysis.ads("Shopping")
+    expected_visits = analysis.visits()
+
+    caplog.set_level(logging.INFO, logger="oba.result_cache")
+    pd.testing.assert_frame_equal(analysis.ads("Shopping"), expected_ads)
+    assert analysis.visits() == expected_visits
+    assert analysis.ads()["categories"].tolist()[0] == ["Style & Fashion", "Shopping"]
+    assert analysis.calls == [("ads", "Shopping"), ("visits", None), ("ads", None)]
+    assert "Cached result of Analysis.ads loaded" in caplog.text
+    assert sorted(path.suffix for path in cache.cache_dir.iterdir()) == [
+        ".parquet",
+        ".parquet",
+        ".pkl",
+    ]
+
+
+def test_changed_database_invalidates_the_results(cache, db_path):
+    analysis = Analysis(cache)
+    analysis.ads()
+    analysis.visits()
+
+    conn = sqlite3.connect(db_path)
+    conn.execute("INSERT INTO site_visits VALUES (1)")
+    conn.commit()
+    conn.close()
+
+    analysis.ads()
+    assert analysis.calls == [("ads", None), ("visits", None), ("ads", None)]
+    # The results of the previous database are removed
+    assert len(list(cache.cache_dir.iterdir())) == 1
+
+
+def test_bypass(cache):
+    cache.enabled = False
+    analysis = Analysis(cache)
+    analysis.ads()
+    analysis.ads()
+    # Arguments that can't be serialized aren't cached either
+    cache.enabled = True
+    analysis.visits(pd.DataFrame())
+    analysis.visits(pd.DataFrame())
+    assert len(analysis.calls) == 4
+    assert not cache.cache_dir.exists()
+
+
+def test_least_recently_used_results_are_evicted(cache):
+    analysis = Analysis(cache)
+    analysis.ads("Shopping")
+    analysis.ads("Travel")
+    # Both results were used an hour ago, and the first one again now
+    for path in cache.cache_dir.iterdir():
+        os.utime(path, (time.time() - 3600,) * 2)
+    analysis.ads("Shopping")
+    # Room for the two DataFrames, adding the list evicts the oldest one
+    cache.max_bytes = sum(path.stat().st_size for path in cache.cache_dir.iterdir())
+    analysis.visits()
+
+    analysis.calls.clear()
+    analysis.ads("Shopping")
+    analysis.ads("Travel")
+    assert analysis.calls == [("ads", "Travel")]
+
+
+def test_results_are_cached_across_runs_on_a_wal_database(tmp_path, db_path):
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("INSERT INTO site_visits VALUES (1)")
+    conn.commit()
+    conn.close()
+
+    # Every run opens the database, creating its write-ahead log, and closes it
+    calls = []
+    for _ in range(2):
+        cache = ResultCache(tmp_path / "results" / "result_cache", [db_path])
+        counts = VisitCounts(cache, db_path)
+        assert counts.visit_count() == 1
+        counts.conn.close()
+        calls.append(counts.calls)
+    assert calls == [1, 0]
@@ -0,0 +1,135 @@
+import sqlite3
+
+import pyarrow.parquet as pq
+import pytest
+
+from oba import third_party_labeling
+from oba.network_filter import NetworkFilterEngine
+from oba.third_party_labeling import ThirdPartyLabeler, fetch_filter_engine
+from openwpm.storage.sql_provider import SCHEMA_FILE
+
+LISTS = {
+    "easyprivacy": ["||metrics.tracker.com^", "/pixel.gif$third-party"],
+    "easylist": ["||ads.adnet.com^"],
+    "adserverlist": ["127.0.0.1 ads.adnet.com"],
+}
+REQUEST_URLS = [
+    (1, "https://www.news.com/index.html"),
+    (1, "https://metrics.tracker.com/collect?v=1"),
+    (1, "https://ads.adnet.com/banner.js"),
+    (1, "https://cdn.news.com/pixel.gif"),
+    (2, "https://static.news.com/pixel.gif"),
+    (2, "https://metrics.tracker.com/collect?v=1"),
+]
+# (id, easyprivacy, easylist, adserverlist, third_party)
+EXPECTED_LABELS = [
+    (1, 0, 0, 0, 0),
+    (2, 1, 0, 0, 1),
+    (3, 0, 1, 1, 1),
+    (4, 0, 0, 0, 0),
+    (5, 1, 0, 0, 1),
+    (6, 1, 0, 0, 1),
+]
+
+
+def insert_requests(conn: sqlite3.Connection, requests: list) -> None:
+    conn.executemany(
+        "INSERT INTO http_requests (browser_id, visit_id, url, method, referrer, headers, request_id, resource_type, time_stamp) VALUES (1, ?, ?, 'GET', '', '', 0, 'script', '')",
+        requests,
+    )
+    conn.commit()
+
+
+@pytest.fixture
+def crawl_conn() -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    with open(SCHEMA_FILE, "r") as f:
+        conn.executescript(f.read())
+    conn.executemany(
+        "INSERT INTO site_visits (visit_id, browser_id, site_url) VALUES (?, 1, ?)",
+        [(1, "https://www.news.com/"), (2, "https://blog.org/post")],
+    )
+    insert_requests(conn, REQUEST_URLS)
+    return conn
+
+
+def labels(conn: sqlite3.Connection) -> list:
+    return conn.execute("SELECT * FROM http_requests_labels ORDER BY id").fetchall()
+
+
+def test_label_table(crawl_conn):
+    labeler = ThirdPartyLabeler(NetworkFilterEngine(LISTS), chunk_size=4)
+    stats = labeler.label_table(crawl_conn, "http_requests")
+
+    assert labels(crawl_conn) == EXPECTED_LABELS
+    assert stats["labeled"] == 6
+    # The repeated tracker URL is only classified once
+    assert stats["classified_urls"] == 5
+
+
+def test_label_table_resumes(crawl_conn):
+    labeler = ThirdPartyLabeler(NetworkFilterEngine(LISTS), chunk_size=4)
+    labeler.label_table(crawl_conn, "http_requests")
+    insert_requests(crawl_conn, [(2, "https://ads.adnet.com/banner.js")])
+
+    stats = labeler.label_table(crawl_conn, "http_requests")
+    assert stats["labeled"] == 1
+    assert labels(crawl_conn) == EXPECTED_LABELS + [(7, 0, 1, 1, 1)]
+
+    # Updated lists label everything again
+    lists = dict(LISTS, easylist=[])
+    stats = ThirdPartyLabeler(NetworkFilterEngine(lists)).label_table(
+        crawl_conn, "http_requests"
+    )
+    assert stats["labeled"] == 7
+    assert [row[2] for row in labels(crawl_conn)] == [0] * 7
+
+
+def test_label_table_to_parquet(crawl_conn, tmp_path):
+    labeler = ThirdPartyLabeler(NetworkFilterEngine(LISTS), chunk_size=4)
+    labeler.label_table(crawl_conn, "http_requests", parquet_dir=tmp_path)
+    insert_requests(crawl_conn, [(2, "https://ads.adnet.com/banner.js")])
+    labeler.label_table(crawl_conn, "http_requests", parquet_dir=tmp_path)
+
+    parts = sorted(path.name for path in (tmp_path / "http_requests").iterdir())
+    assert parts == [
+        "part-000000000001.parquet",
+        "part-000000000005.parquet",
+        "part-000000000007.parquet",
+    ]
+    table = pq.read_table(tmp_path / "http_requests").sort_by("id")
+    assert [tuple(map(int, row.values())) for row in table.to_pylist()] == (
+        EXPECTED_LABELS + [(7, 0, 1, 1, 1)]
+    )
+    # The side table isn't written
+    assert (
+        crawl_conn.execute(
+            "SELECT name FROM sqlite_master WHERE name='http_requests_labels'"
+        ).fetchall()
+        == []
+    )
+
+
+def test_labeler_requires_the_label_lists():
+    with pytest.raises(ValueError, match="adserverlist"):
+        ThirdPartyLabeler(NetworkFilterEngine({"easylist": [], "easyprivacy": []}))
+
+
+def test_saved_filter_lists_keep_the_labels(crawl_conn, tmp_path, monkeypatch):
+    list_urls = {name: f"https://lists.example/{name}.txt" for name in LISTS}
+    upstream = {url: "\n".join(LISTS[name]) for name, url in list_urls.items()}
+    monkeypatch.setattr(third_party_labeling, "_download", upstream.__getitem__)
+    engine = fetch_filter_engine(list_urls, tmp_path / "lists")
+    ThirdPartyLabeler(engine).label_table(crawl_conn, "http_requests")
+
+    # The lists are updated upstream, the saved ones are used by the next run
+    upstream[list_urls["easylist"]] += "\n||cdn.news.com^"
+    engine = fetch_filter_engine(list_urls, tmp_path / "lists")
+    insert_requests(crawl_conn, [(2, "https://ads.adnet.com/banner.js")])
+    stats = ThirdPartyLabeler(engine).label_table(crawl_conn, "http_requests")
+    assert stats["labeled"] == 1
+    assert labels(crawl_conn) == EXPECTED_LABELS + [(7, 0, 1, 1, 1)]
+
+    engine = fetch_filter_engine(list_urls, tmp_path / "lists", refresh=True)
+    stats = ThirdPartyLabeler(engine).label_table(crawl_conn, "http_requests")
+    assert stats["labeled"] == 7
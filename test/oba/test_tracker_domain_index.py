@@ -0,0 +1,74 @@
+import pandas as pd
+import pytest
+
+from oba.tracker_domain_index import TrackerDomainIndex, normalize_host
+
+
+@pytest.fixture
+def index() -> TrackerDomainIndex:
+    return TrackerDomainIndex(
+        {
+            "easyprivacy": ["tracker.com", "stats.shop.co.uk"],
+            "easylist": ["ads.net", "tracker.com"],
+            "adserverlist": ["Ads.Net", ""],
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "value,host",
+    [
+        (".Tracker.Com", "tracker.com"),
+        ("https://cdn.tracker.com:8443/pixel.gif?id=1", "cdn.tracker.com"),
+        ("tracker.com.", "tracker.com"),
+    ],
+)
+def test_normalize_host(value, host):
+    assert normalize_host(value) == host
+
+
+def test_match(index):
+    assert len(index) == 3
+    assert index.match("tracker.com") == {"easyprivacy", "easylist"}
+    assert index.match("a.b.tracker.com") == {"easyprivacy", "easylist"}
+    assert index.match(".ads.net") == {"easylist", "adserverlist"}
+    # Only the listed subdomain and its own subdomains are matched
+    assert index.match("www.stats.shop.co.uk") == {"easyprivacy"}
+    assert index.match("shop.co.uk") == frozenset()
+    assert index.match("notatracker.com") == frozenset()
+    assert "px.tracker.com" in index
+    assert "" not in index
+
+
+def test_classify(index):
+    hosts = pd.Series(
+        [
+            ".tracker.com",
+            "www.news.com",
+            ".tracker.com",
+            "https://img.ads.net/banner.png",
+            "stats.shop.co.uk",
+        ],
+        index=[10, 11, 12, 13, 14],
+    )
+    result = index.classify(hosts)
+
+    assert list(result.index) == [10, 11, 12, 13, 14]
+    assert list(result["domain"]) == [
+        "tracker.com",
+        "news.com",
+        "tracker.com",
+        "ads.net",
+        "shop.co.uk",
+    ]
+    assert list(result["easyprivacy"]) == [True, False, True, False, True]
+    assert list(result["easylist"]) == [True, False, True, True, False]
+    assert list(result["adserverlist"]) == [False, False, False, True, False]
+    assert list(result["tracker"]) == [True, False, True, True, True]
+    assert index.classify(pd.Series([], dtype=object)).empty
+
+
+def test_from_directory():
+    index = TrackerDomainIndex.from_directory()
+    assert index.list_names == ("easyprivacy", "easylist", "adserverlist")
+    assert "adserverlist" in index.match("ad.doubleclick.net")
@@ -67,3 +67,38 @@ def test_arrow_provider(mp_logger: MPLogger, test_values: dt_test_values) -> Non
         t2 = pd.DataFrame({k: [v] for k, v in data.items()})
         # Since t2 doesn't get created schema the inferred types are different
         assert_frame_equal(t1, t2, check_dtype=False)
+
+
+def test_batched_records(mp_logger: MPLogger, test_values: dt_test_values) -> None:
+    test_table, visit_ids = test_values
+    structured = MemoryStructuredProvider()
+    controller_handle = StorageControllerHandle(structured, None)
+    controller_handle.launch()
+    assert controller_handle.listener_address is not None
+    cs = DataSocket(controller_handle.listener_address)
+    cs.store_records(
+        [(table, data["visit_id"], data) for table, data in test_table.items()]
+    )
+
+    for visit_id in visit_ids:
+        cs.finalize_visit_id(visit_id, True)
+    cs.close()
+    controller_handle.shutdown()
+
+    handle = structured.handle
+    handle.poll_queue()
+    for table, data in test_table.items():
+        if data["visit_id"] == INVALID_VISIT_ID:
+            del data["visit_id"]
+        assert handle.storage[table] == [data]
+
+
+def test_status_updates(mp_logger: MPLogger) -> None:
+    controller_handle = StorageControllerHandle(MemoryStructuredProvider(), None)
+    controller_handle.launch()
+    # Blocks until the first status, sent after STATUS_UPDATE_INTERVAL
+    assert controller_handle.get_most_recent_status() == 0
+    assert controller_handle.wait_for_capacity(limit=1) == 0
+    controller_handle.shutdown()
+    assert controller_handle._status_thread is not None
+    assert not controller_handle._status_thread.is_alive()
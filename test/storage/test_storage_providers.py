@@ -1,4 +1,5 @@
 import asyncio
+import sqlite3
 from pathlib import Path
 
 import pytest
@@ -6,6 +7,7 @@ from pandas import DataFrame
 from pyarrow.parquet import ParquetDataset
 
 from openwpm.storage.local_storage import LocalArrowProvider
+from openwpm.storage.sql_provider import SQLiteStorageProvider
 from openwpm.storage.storage_controller import INVALID_VISIT_ID
 from openwpm.storage.storage_providers import (
     StructuredStorageProvider,
@@ -64,6 +66,36 @@ async def test_basic_access(structured_provider: StructuredStorageProvider) -> N
     await structured_provider.shutdown()
 
 
+@pytest.mark.asyncio
+async def test_sqlite_batched_inserts(tmp_path: Path) -> None:
+    db_path = tmp_path / "test_db.sqlite"
+    structured_provider = SQLiteStorageProvider(db_path, batch_size=7)
+    await structured_provider.init()
+    for i in range(20):
+        # A value sqlite can't bind only drops its own record, not its batch
+        site_url = ["unsupported"] if i == 9 else b"https://example.com"
+        await structured_provider.store_record(
+            TableName("site_visits"),
+            VisitId(i),
+            {"visit_id": i, "browser_id": 1, "site_url": site_url},
+        )
+    await structured_provider.store_record(
+        TableName("site_visits"),
+        VisitId(20),
+        {"visit_id": 20, "site_url": "https://example.org", "browser_id": 1},
+    )
+    await structured_provider.finalize_visit_id(VisitId(20))
+    await structured_provider.shutdown()
+
+    with sqlite3.connect(db_path) as db:
+        rows = db.execute(
+            "SELECT visit_id, site_url FROM site_visits ORDER BY visit_id"
+        ).fetchall()
+    assert [visit_id for visit_id, _ in rows] == [i for i in range(21) if i != 9]
+    assert rows[0][1] == "https://example.com"
+    assert rows[-1][1] == "https://example.org"
+
+
 @pytest.mark.parametrize("unstructured_provider", unstructured_scenarios, indirect=True)
 @pytest.mark.asyncio
 async def test_basic_unstructured_storing(
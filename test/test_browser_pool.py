@@ -0,0 +1,103 @@
+"""Test the spare browsers that are swapped in on resets."""
+
+import json
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import pytest
+
+from openwpm.browser_manager import BrowserManagerHandle
+from openwpm.browser_pool import BrowserPool
+from openwpm.config import BrowserParamsInternal, ManagerParamsInternal
+
+
+class Spare:
+    """Stands in for a BrowserManagerHandle, launched without a browser"""
+
+    def __init__(self, profile_path: Path) -> None:
+        self.profile_path = profile_path
+        self.browser_manager = None
+        self.command_queue = None
+        self.status_queue = None
+        self.geckodriver_pid: Optional[int] = None
+        self.display_pid = None
+        self.display_port = None
+        self.current_profile_path: Optional[Path] = None
+        self.spawn_duration: Optional[float] = None
+        self.closed = False
+
+    def launch_browser_manager(self) -> bool:
+        self.profile_path.mkdir()
+        self.current_profile_path = self.profile_path
+        self.geckodriver_pid = 1000
+        self.spawn_duration = 0.25
+        return True
+
+    def close_browser_manager(self) -> None:
+        self.closed = True
+
+
+class SparePool(BrowserPool):
+    def __init__(self, handle: BrowserManagerHandle, size: int, tmp_path: Path) -> None:
+        super().__init__(handle, size)
+        self.tmp_path = tmp_path
+        self.launched: List[Spare] = []
+
+    def _new_spare(self):
+        spare = Spare(self.tmp_path / f"spare_{len(self.launched)}")
+        self.launched.append(spare)
+        return spare
+
+
+def wait_for(predicate, timeout=5):
+    deadline = time.time() + timeout
+    while not predicate():
+        assert time.time() < deadline
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def handle(tmp_path):
+    manager_params = ManagerParamsInternal(browser_pool_size=1)
+    handle = BrowserManagerHandle(manager_params, BrowserParamsInternal(browser_id=1))
+    handle.current_profile_path = tmp_path / "profile"
+    handle.current_profile_path.mkdir()
+    handle.is_fresh = False
+    return handle
+
+
+def test_pool_is_refilled(handle, tmp_path):
+    pool = SparePool(handle, 2, tmp_path)
+    pool.start()
+    wait_for(lambda: len(pool._ready) == 2)
+    spare = pool.take()
+    assert spare.geckodriver_pid == 1000
+    wait_for(lambda: len(pool._ready) == 2)
+    assert len(pool.launched) == 3
+
+    pool.close()
+    assert not spare.closed
+    assert all(spare.closed for spare in pool.launched[1:])
+    assert not pool.spares()
+
+
+def test_reset_swaps_in_a_spare(handle, tmp_path):
+    old_profile_path = handle.current_profile_path
+    handle.pool = SparePool(handle, 1, tmp_path)
+    handle.pool.start()
+    wait_for(lambda: handle.pool._ready)
+
+    assert handle.restart_browser_manager(clear_profile=True)
+    assert handle.current_profile_path == tmp_path / "spare_0"
+    assert handle.geckodriver_pid == 1000
+    assert handle.is_fresh
+    # The previous browser is closed and its profile removed in the background
+    recycled = handle.pool.launched[0]
+    wait_for(lambda: recycled.closed and not old_profile_path.exists())
+    assert recycled.current_profile_path == old_profile_path
+
+    arguments = json.loads(handle._restart_record["arguments"])
+    assert arguments == {"clear_profile": True, "pool": "hit", "spawn_duration": 250}
+    assert handle._restart_record["command"] == "RestartBrowser"
+    handle.pool.close()
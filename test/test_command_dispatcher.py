@@ -0,0 +1,118 @@
+"""Test the dispatch of the CommandSequences to the browsers."""
+
+import threading
+import time
+from typing import Dict, List, Tuple
+
+import pytest
+
+from openwpm.command_dispatcher import CommandDispatcher
+from openwpm.command_sequence import CommandSequence
+
+
+class ThreadBrowsers:
+    """Stand-ins for the browsers, each CommandSequence waits for its release"""
+
+    def __init__(self, num_browsers: int) -> None:
+        self.browsers = list(range(num_browsers))
+        self.started: List[Tuple[int, str]] = []
+        self.releases: Dict[str, threading.Event] = {}
+        self.visit_ids = iter(range(1000))
+
+    def start(self, browser, command_sequence, on_done):
+        visit_id = next(self.visit_ids)
+        release = self.releases.setdefault(command_sequence.url, threading.Event())
+        self.started.append((browser, command_sequence.url))
+
+        def execute():
+            release.wait(5)
+            on_done(visit_id)
+
+        threading.Thread(target=execute, daemon=True).start()
+
+    def release(self, url: str) -> None:
+        self.releases.setdefault(url, threading.Event()).set()
+
+
+@pytest.fixture
+def browsers():
+    return ThreadBrowsers(num_browsers=2)
+
+
+def test_first_free_browser(browsers):
+    dispatcher = CommandDispatcher(browsers.browsers, browsers.start)
+    first = dispatcher.submit(CommandSequence("http://a.com"))
+    second = dispatcher.submit(CommandSequence("http://b.com"))
+    third = dispatcher.submit(CommandSequence("http://c.com"))
+    assert first.dispatched.wait(5) and second.dispatched.wait(5)
+    assert not third.dispatched.wait(0.2)
+
+    browsers.release("http://b.com")
+    assert second.future.result(5) == 1
+    assert third.dispatched.wait(5)
+    assert browsers.started == [
+        (0, "http://a.com"),
+        (1, "http://b.com"),
+        (1, "http://c.com"),
+    ]
+    for url in ["http://a.com", "http://c.com"]:
+        browsers.release(url)
+    assert third.future.result(5) == 2
+    assert third.scheduling_latency < 1
+    dispatcher.close()
+
+
+def test_busy_browser_does_not_block_the_others(browsers):
+    dispatcher = CommandDispatcher(browsers.browsers, browsers.start)
+    dispatcher.submit(CommandSequence("http://a.com"), index=0)
+    waiting = dispatcher.submit(CommandSequence("http://b.com"), index=0)
+    other = dispatcher.submit(CommandSequence("http://c.com"))
+    assert other.dispatched.wait(5)
+    assert browsers.started[-1] == (1, "http://c.com")
+    assert not waiting.dispatched.is_set()
+
+    browsers.release("http://a.com")
+    assert waiting.dispatched.wait(5)
+    for url in ["http://b.com", "http://c.com"]:
+        browsers.release(url)
+    dispatcher.wait_for_pending()
+    dispatcher.close()
+
+
+def test_backpressure_and_close(browsers):
+    capacity = threading.Event()
+    dispatcher = CommandDispatcher(
+        browsers.browsers, browsers.start, lambda: capacity.wait(5)
+    )
+    submission = dispatcher.submit(CommandSequence("http://a.com"))
+    time.sleep(0.2)
+    assert not browsers.started
+    capacity.set()
+    assert submission.dispatched.wait(5)
+
+    browsers.release("http://a.com")
+    dispatcher.submit(CommandSequence("http://b.com"), index=1)
+    unstarted = dispatcher.submit(CommandSequence("http://c.com"), index=1)
+    dispatcher.close()
+    with pytest.raises(RuntimeError):
+        unstarted.future.result(5)
+    with pytest.raises(RuntimeError):
+        dispatcher.submit(CommandSequence("http://d.com")).future.result(5)
+    browsers.release("http://b.com")
+
+
+def test_failed_start_releases_the_browser(browsers):
+    def start(browser, command_sequence, on_done):
+        if command_sequence.url == "http://fail.com":
+            raise RuntimeError("Browser failed to start")
+        browsers.start(browser, command_sequence, on_done)
+
+    dispatcher = CommandDispatcher(browsers.browsers[:1], start)
+    failed = dispatcher.submit(CommandSequence("http://fail.com"))
+    with pytest.raises(RuntimeError, match="failed to start"):
+        failed.future.result(5)
+    started = dispatcher.submit(CommandSequence("http://a.com"))
+    assert started.dispatched.wait(5)
+    browsers.release("http://a.com")
+    assert started.future.result(5) == 0
+    dispatcher.close()
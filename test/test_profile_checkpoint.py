@@ -0,0 +1,105 @@
+"""Test the incremental checkpoints of the state of the profiles."""
+
+import json
+import os
+
+import pytest
+
+from openwpm.commands.profile_commands import load_profile
+from openwpm.commands.utils.profile_checkpoint import (
+    CHUNK_SIZE,
+    checkpoint_profile,
+    is_checkpoint,
+    list_checkpoints,
+    restore_checkpoint,
+    state_files,
+)
+from openwpm.config import BrowserParamsInternal
+
+
+def write_profile(profile_path):
+    """Writes the state files of a profile and a cache that isn't state"""
+    profile_path.mkdir(parents=True)
+    (profile_path / "cookies.sqlite").write_bytes(os.urandom(2 * CHUNK_SIZE))
+    (profile_path / "places.sqlite").write_bytes(os.urandom(3 * CHUNK_SIZE + 10))
+    (profile_path / "places.sqlite-wal").write_bytes(b"wal")
+    (profile_path / "prefs.js").write_text('user_pref("browser.startup.page", 0);')
+    storage = profile_path / "storage" / "default" / "https+++example.com"
+    storage.mkdir(parents=True)
+    (storage / "ls" / "data.sqlite").parent.mkdir()
+    (storage / "ls" / "data.sqlite").write_bytes(b"localStorage")
+    (profile_path / "cache2").mkdir()
+    (profile_path / "cache2" / "entry").write_bytes(b"\x00" * 1024)
+
+
+def read_files(profile_path):
+    return {
+        path: (profile_path / path).read_bytes() for path in state_files(profile_path)
+    }
+
+
+def test_checkpoint_round_trip(tmp_path):
+    profile = tmp_path / "profile"
+    write_profile(profile)
+    assert "cache2/entry" not in state_files(profile)
+
+    manifest = checkpoint_profile(profile, tmp_path / "checkpoints")
+    assert is_checkpoint(tmp_path / "checkpoints")
+    assert is_checkpoint(manifest)
+    assert not is_checkpoint(tmp_path / "profile.tar.gz")
+    assert list_checkpoints(tmp_path / "checkpoints") == [manifest]
+
+    restored = tmp_path / "restored"
+    assert restore_checkpoint(tmp_path / "checkpoints", restored) == manifest
+    assert read_files(restored) == read_files(profile)
+    assert not (restored / "cache2").exists()
+
+
+def test_unchanged_chunks_are_not_written_again(tmp_path):
+    profile = tmp_path / "profile"
+    write_profile(profile)
+    places = (profile / "places.sqlite").read_bytes()
+    first = checkpoint_profile(profile, tmp_path / "checkpoints", name="1")
+    # 2 chunks of cookies.sqlite, 4 of places.sqlite and 1 of each small file
+    assert json.loads(first.read_text())["written_chunks"] == 2 + 4 + 3
+
+    second = checkpoint_profile(profile, tmp_path / "checkpoints", name="2")
+    assert json.loads(second.read_text())["written_chunks"] == 0
+
+    # Only the changed page of a database is written
+    with open(profile / "places.sqlite", "r+b") as f:
+        f.seek(CHUNK_SIZE + 4096)
+        f.write(b"\x02" * 4096)
+    third = checkpoint_profile(profile, tmp_path / "checkpoints", name="3")
+    assert json.loads(third.read_text())["written_chunks"] == 1
+
+    # A specific checkpoint can still be restored
+    restored = tmp_path / "restored"
+    restore_checkpoint(first, restored)
+    assert (restored / "places.sqlite").read_bytes() == places
+    restore_checkpoint(tmp_path / "checkpoints", restored)
+    assert read_files(restored) == read_files(profile)
+
+
+def test_corrupted_chunks_are_detected(tmp_path):
+    profile = tmp_path / "profile"
+    write_profile(profile)
+    manifest = checkpoint_profile(profile, tmp_path / "checkpoints")
+    digest = json.loads(manifest.read_text())["files"]["prefs.js"]["chunks"][0]
+    chunk = tmp_path / "checkpoints" / "chunks" / digest[:2] / digest
+    # The small chunks are stored uncompressed
+    chunk.write_bytes(chunk.read_bytes()[:-1] + b"!")
+    with pytest.raises(ValueError):
+        restore_checkpoint(manifest, tmp_path / "restored")
+
+
+def test_load_profile_from_checkpoint(tmp_path):
+    profile = tmp_path / "profile"
+    write_profile(profile)
+    checkpoint_profile(profile, tmp_path / "checkpoints")
+    browser_params = BrowserParamsInternal()
+    browser_params.browser_id = 1
+    restored = tmp_path / "restored"
+    restored.mkdir()
+    load_profile(restored, browser_params, tmp_path / "checkpoints")
+    assert read_files(restored) == read_files(profile)
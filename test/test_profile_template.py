@@ -0,0 +1,70 @@
+"""Test the cache of initialized profiles that new profiles are copied from."""
+
+import os
+import time
+
+from openwpm.deploy_browsers import profile_template
+from openwpm.deploy_browsers.profile_template import (
+    ProfileTemplateCache,
+    copy_profile,
+    template_key,
+)
+
+
+def initialize(profile_path):
+    """Writes the files of a first start of Firefox"""
+    (profile_path / "user.js").write_text('user_pref("app.update.enabled", false);')
+    (profile_path / "cookies.sqlite").write_bytes(b"SQLite format 3\x00")
+    (profile_path / "startupCache").mkdir()
+    (profile_path / "startupCache" / "startupCache.8.little").write_bytes(b"\x00" * 64)
+    (profile_path / ".parentlock").touch()
+
+
+def test_template_key(tmp_path):
+    binary = tmp_path / "firefox"
+    binary.write_bytes(b"firefox")
+    extension = tmp_path / "openwpm.xpi"
+    extension.write_bytes(b"xpi")
+    prefs = {"app.update.enabled": False, "network.cookie.cookieBehavior": 0}
+    key = template_key(prefs, binary, extension)
+    assert key == template_key(dict(reversed(prefs.items())), binary, extension)
+    assert key != template_key({**prefs, "network.cookie.cookieBehavior": 1}, binary)
+    assert key != template_key(prefs, binary)
+    # A new build of the extension builds a new template
+    extension.write_bytes(b"new xpi")
+    assert key != template_key(prefs, binary, extension)
+
+
+def test_profiles_are_copied_from_the_template(tmp_path):
+    cache = ProfileTemplateCache(tmp_path / "templates")
+    assert cache.get("key") is None
+    template = cache.build("key", initialize)
+    assert cache.get("key") == template
+    assert not (template / ".parentlock").exists()
+
+    profile = tmp_path / "firefox_profile"
+    profile.mkdir()
+    copy_profile(template, profile)
+    assert (profile / "user.js").read_text() == (template / "user.js").read_text()
+    assert (profile / "startupCache" / "startupCache.8.little").stat().st_size == 64
+    # Firefox writing to the profile doesn't change the template
+    with open(profile / "cookies.sqlite", "r+b") as f:
+        f.write(b"changed")
+    assert (template / "cookies.sqlite").read_bytes() == b"SQLite format 3\x00"
+
+
+def test_concurrent_builds_and_eviction(tmp_path, monkeypatch):
+    cache = ProfileTemplateCache(tmp_path / "templates")
+    template = cache.build("key", initialize)
+    # A browser that built the same template in the meantime uses the first one
+    assert cache.build("key", lambda path: (path / "user.js").touch()) == template
+    assert (template / "cookies.sqlite").exists()
+    assert [path.name for path in cache.cache_dir.iterdir()] == ["key"]
+
+    monkeypatch.setattr(profile_template, "MAX_TEMPLATES", 2)
+    os.utime(template, (time.time() - 3600,) * 2)
+    cache.build("other", initialize)
+    os.utime(cache.cache_dir / "other", (time.time() - 1800,) * 2)
+    cache.get("key")
+    cache.build("new", initialize)
+    assert sorted(path.name for path in cache.cache_dir.iterdir()) == ["key", "new"]